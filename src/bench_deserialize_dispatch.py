@@ -0,0 +1,21 @@
+import json
+import timeit
+
+from bench_json_deserialize import codec_client, esi_orders
+from eve_client.api_client import ApiClient
+from eve_client.configuration import Configuration
+
+# Antworten, die über ApiClient.deserialize laufen: Typ-IDs wie bei GET /universe/types/ und eine Seite Marktorders
+SCENARIOS = [
+    ("List[int], 10000 type ids", "List[int]", list(range(10000))),
+    ("List[str], 10000 names", "List[str]", [f"Item {i}" for i in range(10000)]),
+    ("List[Order], 1000 orders", "List[MarketsRegionIdOrdersGetInner]", esi_orders(1000)),
+]
+
+if __name__ == '__main__':
+    client = codec_client(ApiClient, Configuration)
+    for name, response_type, payload in SCENARIOS:
+        text = json.dumps(payload)
+        client.deserialize(text, response_type, "application/json")
+        seconds = min(timeit.repeat(lambda: client.deserialize(text, response_type, "application/json"), number=20, repeat=5)) / 20
+        print(f"{name:28}: {seconds * 1e3:7.2f} ms, {seconds / len(payload) * 1e6:5.2f} µs per element")
@@ -0,0 +1,201 @@
+import asyncio
+import datetime
+import importlib.util
+import ipaddress
+import json
+import os
+import ssl
+import subprocess
+import sys
+import tempfile
+import time
+
+import h11
+import httpx
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from github_client.configuration import Configuration
+from github_client.rest import RESTClientObject
+
+REQUESTS = 2000
+CONCURRENCY = 50
+# Antwortzeit des simulierten Upstreams
+LATENCY = 0.02
+PAYLOAD = json.dumps([{"id": i, "title": f"Issue {i}", "body": "x" * 300} for i in range(30)]).encode()
+
+
+def create_certificate(directory: str):
+    """Selbstsigniertes Zertifikat für localhost, das zugleich als CA dient"""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (x509.CertificateBuilder().subject_name(name).issuer_name(name).public_key(key.public_key())
+                   .serial_number(x509.random_serial_number()).not_valid_before(now).not_valid_after(now + datetime.timedelta(days=1))
+                   .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost"), x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]), critical=False)
+                   .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+                   .sign(key, hashes.SHA256()))
+    cert_file, key_file = os.path.join(directory, "cert.pem"), os.path.join(directory, "key.pem")
+    with open(cert_file, "wb") as file:
+        file.write(certificate.public_bytes(serialization.Encoding.PEM))
+    with open(key_file, "wb") as file:
+        file.write(key.private_bytes(serialization.Encoding.PEM, serialization.PrivateFormat.PKCS8, serialization.NoEncryption()))
+    return cert_file, key_file
+
+
+class StubServer:
+    """TLS-Server, der auf jede Anfrage nach LATENCY mit PAYLOAD antwortet, per ALPN über HTTP/1.1 oder HTTP/2"""
+
+    def __init__(self):
+        self.connections = 0
+
+    def body(self, target: bytes) -> bytes:
+        if target.startswith(b"/stats"):
+            return json.dumps({"connections": self.connections}).encode()
+        return PAYLOAD
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.connections += 1
+        try:
+            if writer.get_extra_info("ssl_object").selected_alpn_protocol() == "h2":
+                await self.serve_h2(reader, writer)
+            else:
+                await self.serve_h11(reader, writer)
+        except (ConnectionError, h11.ProtocolError):
+            pass
+        finally:
+            writer.close()
+
+    async def serve_h11(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        connection = h11.Connection(h11.SERVER)
+        target = b"/"
+        while True:
+            event = connection.next_event()
+            if event is h11.NEED_DATA:
+                connection.receive_data(await reader.read(65536))
+            elif isinstance(event, h11.Request):
+                target = event.target
+            elif isinstance(event, h11.EndOfMessage):
+                await asyncio.sleep(LATENCY)
+                body = self.body(target)
+                writer.write(connection.send(h11.Response(status_code=200, headers=[("content-type", "application/json"), ("content-length", str(len(body)))])))
+                writer.write(connection.send(h11.Data(data=body)))
+                writer.write(connection.send(h11.EndOfMessage()))
+                await writer.drain()
+                connection.start_next_cycle()
+            elif isinstance(event, h11.ConnectionClosed) or event is h11.PAUSED:
+                return
+
+    async def serve_h2(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        from h2.config import H2Configuration
+        from h2.connection import H2Connection
+        from h2.events import ConnectionTerminated, RequestReceived, StreamEnded, WindowUpdated
+
+        connection = H2Connection(H2Configuration(client_side=False))
+        connection.initiate_connection()
+        writer.write(connection.data_to_send())
+        window_updated = asyncio.Event()
+        targets = {}
+
+        async def respond(stream_id: int):
+            await asyncio.sleep(LATENCY)
+            body = self.body(targets.pop(stream_id))
+            connection.send_headers(stream_id, [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(body)))])
+            while body:
+                # Flusskontrolle: nur so viel senden, wie der Client gerade annimmt
+                size = min(connection.local_flow_control_window(stream_id), connection.max_outbound_frame_size, len(body))
+                if size == 0:
+                    window_updated.clear()
+                    await window_updated.wait()
+                    continue
+                connection.send_data(stream_id, body[:size])
+                body = body[size:]
+                writer.write(connection.data_to_send())
+            connection.end_stream(stream_id)
+            writer.write(connection.data_to_send())
+
+        while True:
+            data = await reader.read(65536)
+            if not data:
+                return
+            for event in connection.receive_data(data):
+                if isinstance(event, RequestReceived):
+                    targets[event.stream_id] = dict(event.headers)[b":path"]
+                elif isinstance(event, StreamEnded):
+                    asyncio.get_running_loop().create_task(respond(event.stream_id))
+                elif isinstance(event, WindowUpdated):
+                    window_updated.set()
+                elif isinstance(event, ConnectionTerminated):
+                    return
+            writer.write(connection.data_to_send())
+            await writer.drain()
+
+
+async def serve(cert_file: str, key_file: str):
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    context.load_cert_chain(cert_file, key_file)
+    context.set_alpn_protocols(["h2", "http/1.1"] if importlib.util.find_spec("h2") else ["http/1.1"])
+    stub = StubServer()
+    server = await asyncio.start_server(stub.handle, "127.0.0.1", 0, ssl=context, backlog=1024)
+    print(server.sockets[0].getsockname()[1], flush=True)
+    await server.serve_forever()
+
+
+async def count_connections(url: str, cert_file: str) -> int:
+    # Eigener Client mit eigener Verbindung, damit der Pool unter Test unberührt bleibt
+    async with httpx.AsyncClient(verify=ssl.create_default_context(cafile=cert_file)) as client:
+        return (await client.get(url + "/stats")).json()["connections"]
+
+
+async def run(url: str, cert_file: str, **options):
+    config = Configuration(ssl_ca_cert=cert_file)
+    for name, value in options.items():
+        setattr(config, name, value)
+    client = RESTClientObject(config)
+    latencies = []
+    versions = set()
+    queue = iter(range(REQUESTS))
+
+    async def worker():
+        for _ in queue:
+            start = time.perf_counter()
+            response = await client.request("GET", url + "/repos/octocat/hello-world/issues")
+            await response.read()
+            latencies.append(time.perf_counter() - start)
+            versions.add(response.response.http_version)
+
+    before = await count_connections(url, cert_file)
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    elapsed = time.perf_counter() - start
+    opened = await count_connections(url, cert_file) - before - 1
+    await client.close()
+    latencies.sort()
+    return REQUESTS / elapsed, latencies[int(len(latencies) * 0.99)], opened, ", ".join(sorted(versions))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ["serve"]:
+        asyncio.run(serve(*sys.argv[2:4]))
+        sys.exit()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert_file, key_file = create_certificate(directory)
+        server = subprocess.Popen([sys.executable, __file__, "serve", cert_file, key_file], stdout=subprocess.PIPE, text=True)
+        try:
+            url = f"https://localhost:{server.stdout.readline().strip()}"
+            scenarios = {
+                "HTTP/1.1": {},
+                "HTTP/1.1, 10 keep-alive": {"max_keepalive_connections": 10},
+                "HTTP/1.1, 8 per host": {"max_connections_per_host": 8},
+                "HTTP/2": {"http2": True},
+            }
+            if not importlib.util.find_spec("h2"):
+                print("h2 is not installed (pip install httpx[http2]), HTTP/2 falls back to HTTP/1.1")
+            for name, options in scenarios.items():
+                rate, p99, connections, protocol = asyncio.run(run(url, cert_file, **options))
+                print(f"{name:24}: {rate:7.1f} requests/s, p99 {p99 * 1e3:7.1f} ms, {connections:4d} TLS connections ({protocol})")
+        finally:
+            server.terminate()
@@ -0,0 +1,42 @@
+import os
+import subprocess
+import sys
+
+# Dieselben Imports wie src/stage1b/discord_tools.py
+IMPORTS = """
+from src.discord_client.api.default_api import DefaultApi
+from src.discord_client.api_client import ApiClient
+from src.discord_client.configuration import Configuration
+from src.discord_client.models import CreateThreadRequest, CreateForumThreadRequest, CreateTextThreadWithoutMessageRequest
+"""
+
+# Die Operationen, die die Tools aufrufen, einmal auflösen
+FIRST_USE = """
+api = DefaultApi(ApiClient(Configuration(host="https://discord.com/api/v10")))
+for name in ("list_my_guilds", "list_guild_channels", "list_messages", "create_thread", "list_guild_invites"):
+    getattr(api, name)
+"""
+
+MEASURE = """
+import resource, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+imported = time.perf_counter()
+exec(sys.argv[2])
+done = time.perf_counter()
+print(imported - start, done - imported, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, len(sys.modules))
+"""
+
+
+def measure(repeat: int = 3):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(["src", "."]))
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-W", "ignore", "-c", MEASURE, IMPORTS, FIRST_USE], env=env, stdout=subprocess.PIPE, text=True, check=True).stdout
+        runs.append(tuple(map(float, output.split())))
+    return min(runs)
+
+
+if __name__ == '__main__':
+    import_time, first_use, rss, modules = measure()
+    print(f"import {import_time * 1e3:8.1f} ms, first use of the tool operations {first_use * 1e3:8.1f} ms, max RSS {rss:6.1f} MB, {modules:.0f} modules")
@@ -0,0 +1,52 @@
+import os
+import subprocess
+import sys
+
+# Dieselben Imports wie src/stage1b/github_tools.py, danach eine Liste Issues deserialisieren wie bei einer Antwort
+IMPORTS = """
+from src.github_client.api.activity_api import ActivityApi
+from src.github_client.api.issues_api import IssuesApi
+from src.github_client.api.repos_api import ReposApi
+from src.github_client.api_client import ApiClient
+from src.github_client.configuration import Configuration
+"""
+
+FIRST_CALL = """
+import httpx
+from src.github_client.rest import RESTResponse
+
+issue = {"id": 1, "node_id": "I_1", "url": "u", "repository_url": "u", "labels_url": "u", "comments_url": "u", "events_url": "u",
+         "html_url": "u", "number": 1, "state": "open", "title": "Bug", "user": None, "labels": [], "assignee": None, "assignees": [],
+         "milestone": None, "locked": False, "comments": 0, "closed_at": None, "created_at": "2011-04-22T13:33:48Z",
+         "updated_at": "2011-04-22T13:33:48Z", "author_association": "OWNER", "body": "text", "active_lock_reason": None,
+         "reactions": {"url": "u", "total_count": 0, "+1": 0, "-1": 0, "laugh": 0, "confused": 0, "heart": 0, "hooray": 0, "eyes": 0, "rocket": 0}}
+response = RESTResponse(httpx.Response(200, json=[issue]))
+response.data = response.response.content
+issues = ApiClient().response_deserialize(response, {"200": "List[Issue]"}).data
+assert issues[0].title == "Bug"
+"""
+
+MEASURE = """
+import resource, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+imported = time.perf_counter()
+exec(sys.argv[2])
+done = time.perf_counter()
+print(imported - start, done - imported, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, len(sys.modules))
+"""
+
+
+def measure(repeat: int = 3):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(["src", "."]))
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-W", "ignore", "-c", MEASURE, IMPORTS, FIRST_CALL], env=env, stdout=subprocess.PIPE, text=True, check=True).stdout
+        runs.append(tuple(map(float, output.split())))
+    return min(runs)
+
+
+if __name__ == '__main__':
+    import_time, first_call, rss, modules = measure()
+    print(f"import {import_time * 1e3:8.1f} ms, first List[Issue] deserialize {first_call * 1e3:8.1f} ms, max RSS {rss:6.1f} MB, {modules:.0f} modules")
+    print(f"details: {sys.executable} -X importtime -c '{IMPORTS.strip().splitlines()[0]}'")
@@ -0,0 +1,98 @@
+import json
+import timeit
+
+import httpx
+
+from eve_client.api_client import ApiClient as EveApiClient
+from eve_client.configuration import Configuration as EveConfiguration
+from eve_client.rest import RESTResponse
+from github_client.api_client import ApiClient as GitHubApiClient
+from github_client.configuration import Configuration as GitHubConfiguration
+from src.model_codec import ModelCodec
+
+
+def github_user(login: str, user_id: int) -> dict:
+    base = f"https://api.github.com/users/{login}"
+    return {"login": login, "id": user_id, "node_id": "MDQ6VXNlcjE=", "avatar_url": "https://github.com/images/error/octocat_happy.gif",
+            "gravatar_id": "", "url": base, "html_url": f"https://github.com/{login}", "followers_url": f"{base}/followers",
+            "following_url": f"{base}/following{{/other_user}}", "gists_url": f"{base}/gists{{/gist_id}}",
+            "starred_url": f"{base}/starred{{/owner}}{{/repo}}", "subscriptions_url": f"{base}/subscriptions",
+            "organizations_url": f"{base}/orgs", "repos_url": f"{base}/repos", "events_url": f"{base}/events{{/privacy}}",
+            "received_events_url": f"{base}/received_events", "type": "User", "site_admin": False}
+
+
+def github_issues(count: int) -> list:
+    # Aufgebaut wie die Antwort von GET /repos/{owner}/{repo}/issues
+    repo = "https://api.github.com/repos/octocat/Hello-World"
+    body = ("Steps to reproduce:\n1. Open the settings page\n2. Click on save\n\n"
+            "Expected: the form is stored. Actual: nothing happens, see the log below.\n") * 6
+    return [
+        {
+            "url": f"{repo}/issues/{i}", "repository_url": repo, "labels_url": f"{repo}/issues/{i}/labels{{/name}}",
+            "comments_url": f"{repo}/issues/{i}/comments", "events_url": f"{repo}/issues/{i}/events",
+            "html_url": f"https://github.com/octocat/Hello-World/issues/{i}", "id": 1_000_000 + i, "node_id": "MDU6SXNzdWUx",
+            "number": i, "title": f"Found a bug in module {i}", "user": github_user("octocat", 1),
+            "labels": [{"id": 208045946, "node_id": "MDU6TGFiZWwyMDgwNDU5NDY=", "url": f"{repo}/labels/bug", "name": "bug",
+                        "description": "Something isn't working", "color": "f29513", "default": True}],
+            "state": "open", "locked": False, "assignee": github_user("hubot", 2), "assignees": [github_user("hubot", 2)],
+            "milestone": None, "comments": i % 7, "created_at": "2011-04-22T13:33:48Z", "updated_at": "2011-04-22T13:33:48Z",
+            "closed_at": None, "author_association": "COLLABORATOR", "active_lock_reason": None, "body": body,
+            "reactions": {"url": f"{repo}/issues/{i}/reactions", "total_count": 3, "+1": 2, "-1": 0, "laugh": 0, "hooray": 1,
+                          "confused": 0, "heart": 0, "rocket": 0, "eyes": 0},
+            # Issue-Felder (anyOf-Wrapper für den Wert) haben nur wenige Issues
+            "issue_field_values": [{"issue_field_id": 1, "node_id": "IFV_1", "data_type": "text", "value": f"Team {i % 3}"}] if i % 10 == 0 else [],
+            "timeline_url": f"{repo}/issues/{i}/timeline",
+        }
+        for i in range(count)
+    ]
+
+
+def esi_orders(count: int) -> list:
+    # Eine Seite von GET /markets/{region_id}/orders/ hat bis zu 1000 Einträge
+    return [
+        {"duration": 90, "is_buy_order": i % 2 == 0, "issued": "2025-11-01T12:30:00Z", "location_id": 60003760, "min_volume": 1,
+         "order_id": 6_500_000_000 + i, "price": 4.99 + i, "range": "region", "system_id": 30000142, "type_id": 34,
+         "volume_remain": 1000 - i % 1000, "volume_total": 1000}
+        for i in range(count)
+    ]
+
+
+def codec_client(client_class, configuration_class):
+    """Client mit ModelCodec, wie ihn die Tools bauen"""
+    config = configuration_class()
+    config.codec = ModelCodec.for_client(client_class)
+    return client_class(config)
+
+
+def response(payload) -> RESTResponse:
+    rest_response = RESTResponse(httpx.Response(200, json=payload))
+    rest_response.data = rest_response.response.content
+    return rest_response
+
+
+def from_dict_path(client, rest_response: RESTResponse, response_type: str):
+    """Der bisherige Weg: Text dekodieren, json.loads, from_dict je Modell"""
+    return client.deserialize(rest_response.data.decode("utf-8"), response_type, "application/json")
+
+
+def fast_path(client, rest_response: RESTResponse, response_type: str):
+    return client.response_deserialize(rest_response, {"200": response_type}).data
+
+
+if __name__ == '__main__':
+    scenarios = [
+        ("GitHub issues", codec_client(GitHubApiClient, GitHubConfiguration), "List[Issue]", github_issues, (30, 100)),
+        ("ESI market orders", codec_client(EveApiClient, EveConfiguration), "List[MarketsRegionIdOrdersGetInner]", esi_orders, (1000, 10000)),
+    ]
+    for name, client, response_type, payload, counts in scenarios:
+        for count in counts:
+            rest_response = response(payload(count))
+            # Gleiches Ergebnis auf beiden Wegen, der erste Aufruf baut den TypeAdapter
+            expected = [item.model_dump() for item in from_dict_path(client, rest_response, response_type)]
+            assert [item.model_dump() for item in fast_path(client, rest_response, response_type)] == expected
+            number = max(1, 3000 // count)
+            timings = []
+            for deserialize in (from_dict_path, fast_path):
+                timings.append(min(timeit.repeat(lambda: deserialize(client, rest_response, response_type), number=number, repeat=5)) / number)
+            print(f"{name:18} {count:6d} items, {len(rest_response.data) / 1024:8.1f} KiB: "
+                  f"from_dict {timings[0] * 1e3:8.2f} ms, validate_json {timings[1] * 1e3:8.2f} ms ({timings[0] / timings[1]:4.1f}x)")
@@ -0,0 +1,67 @@
+import asyncio
+import json
+import time
+from datetime import date
+
+import httpx
+
+from bench_json_deserialize import codec_client, esi_orders, github_issues
+from eve_client.api.market_api import MarketApi
+from eve_client.api_client import ApiClient as EveApiClient
+from eve_client.configuration import Configuration as EveConfiguration
+from github_client.api.issues_api import IssuesApi
+from github_client.api_client import ApiClient as GitHubApiClient
+from github_client.configuration import Configuration as GitHubConfiguration
+from src.passthrough import passthrough
+from src.sanitize_output import sanitize_output
+
+ROUNDS = 7
+CALLS = 10
+
+
+def mocked(client, payload):
+    """Client, dessen Requests ein lokaler Mock mit der fertigen Antwort beantwortet"""
+    body = json.dumps(payload).encode()
+    client.rest_client.pool_manager = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, content=body, headers={"content-type": "application/json; charset=utf-8"})))
+    return client, len(body)
+
+
+def tool(call, raw: bool):
+    """Wie die Tools: Upstream aufrufen, Ergebnis bereinigen und je Element als TextContent serialisieren"""
+    @sanitize_output(stream=True)
+    async def run():
+        if not raw:
+            return await call()
+        with passthrough():
+            return await call()
+    return run
+
+
+async def throughput(run) -> tuple:
+    content = await run()
+    # Bester von mehreren Durchläufen, damit andere Last auf der Maschine das Ergebnis nicht verzerrt
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        for _ in range(CALLS):
+            await run()
+        best = min(best, time.perf_counter() - start)
+    return CALLS / best, sum(len(block.text) for block in content)
+
+
+if __name__ == '__main__':
+    github, github_size = mocked(codec_client(GitHubApiClient, GitHubConfiguration), github_issues(100))
+    eve, eve_size = mocked(codec_client(EveApiClient, EveConfiguration), esi_orders(1000))
+    issues_api, market_api = IssuesApi(github), MarketApi(eve)
+    scenarios = [
+        (f"GitHub issues, 100 ({github_size / 1024:.0f} KiB)", lambda: issues_api.issues_list_for_repo(owner="octocat", repo="Hello-World", per_page=100)),
+        (f"ESI orders, 1000 ({eve_size / 1024:.0f} KiB)", lambda: market_api.get_markets_region_id_orders(order_type="all", region_id=10000002, x_compatibility_date=date(2025, 11, 6))),
+    ]
+
+    async def main():
+        for name, call in scenarios:
+            (model_rate, model_bytes), (raw_rate, raw_bytes) = [await throughput(tool(call, raw)) for raw in (False, True)]
+            print(f"{name:30}: models {model_rate:6.1f} calls/s ({model_bytes / 1024:5.0f} KiB out), "
+                  f"passthrough {raw_rate:6.1f} calls/s ({raw_bytes / 1024:5.0f} KiB out), {raw_rate / model_rate:4.1f}x")
+    asyncio.run(main())
@@ -0,0 +1,94 @@
+import asyncio
+import logging
+import time
+
+from bench_json_deserialize import codec_client, github_issues, github_user
+from bench_passthrough import mocked
+from github_client.api.activity_api import ActivityApi
+from github_client.api.issues_api import IssuesApi
+from github_client.api_client import ApiClient
+from github_client.configuration import Configuration
+from src.passthrough import passthrough, projection
+from src.sanitize_output import sanitize_output
+from src.stage1b.github_tools import ISSUE_FIELDS, REPOSITORY_FIELDS
+
+ROUNDS = 7
+CALLS = 10
+
+REPOSITORY_URLS = ["archive", "assignees", "blobs", "branches", "collaborators", "comments", "commits", "compare", "contents",
+                   "contributors", "deployments", "downloads", "events", "forks", "git_commits", "git_refs", "git_tags", "hooks",
+                   "issue_comment", "issue_events", "issues", "keys", "labels", "languages", "merges", "milestones",
+                   "notifications", "pulls", "releases", "stargazers", "statuses", "subscribers", "subscription", "tags",
+                   "teams", "trees"]
+
+
+def github_repositories(count: int) -> list:
+    """Antwort von GET /user/starred wie von api.github.com"""
+    repositories = []
+    for number in range(count):
+        url = f"https://api.github.com/repos/octocat/project-{number}"
+        repository = {f"{name}_url": f"{url}/{name.replace('_', '/')}{{/sha}}" for name in REPOSITORY_URLS}
+        repository.update({
+            "id": 1296269 + number, "node_id": "MDEwOlJlcG9zaXRvcnkxMjk2MjY5", "name": f"project-{number}",
+            "full_name": f"octocat/project-{number}", "owner": github_user("octocat", 1), "private": False,
+            "html_url": f"https://github.com/octocat/project-{number}", "description": "This your first repo!", "fork": False,
+            "url": url, "git_url": f"git:github.com/octocat/project-{number}.git", "ssh_url": f"git@github.com:octocat/project-{number}.git",
+            "clone_url": f"https://github.com/octocat/project-{number}.git", "svn_url": f"https://svn.github.com/octocat/project-{number}",
+            "mirror_url": None, "homepage": "https://github.com", "language": "Python", "forks": 9, "forks_count": 9,
+            "stargazers_count": 80, "watchers": 80, "watchers_count": 80, "size": 108, "default_branch": "master",
+            "open_issues": 0, "open_issues_count": 0, "is_template": False, "topics": ["octocat", "atom", "electron", "api"],
+            "has_issues": True, "has_projects": True, "has_wiki": True, "has_pages": False, "has_downloads": True,
+            "has_discussions": False, "archived": False, "disabled": False, "visibility": "public",
+            "pushed_at": "2011-01-26T19:06:43Z", "created_at": "2011-01-26T19:01:12Z", "updated_at": "2011-01-26T19:14:43Z",
+            "permissions": {"admin": False, "push": False, "pull": True}, "allow_forking": True,
+            "license": {"key": "mit", "name": "MIT License", "url": "https://api.github.com/licenses/mit", "spdx_id": "MIT", "node_id": "MDc6TGljZW5zZW1pdA=="},
+        })
+        repositories.append(repository)
+    return repositories
+
+
+def tool(call, fields, raw: bool):
+    """Wie die Tools: Upstream aufrufen, Ergebnis bereinigen und je Element als TextContent serialisieren"""
+    @sanitize_output(stream=True)
+    async def run():
+        if raw:
+            with passthrough(), projection(fields):
+                return await call()
+        with projection(fields):
+            return await call()
+    return run
+
+
+async def measure(run) -> tuple:
+    content = await run()
+    # Bester von mehreren Durchläufen, damit andere Last auf der Maschine das Ergebnis nicht verzerrt
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.process_time()
+        for _ in range(CALLS):
+            await run()
+        best = min(best, time.process_time() - start)
+    return best / CALLS, sum(len(block.text.encode()) for block in content)
+
+
+if __name__ == '__main__':
+    # Das Tool-Modul bringt das Logging des Servers mit, das sonst jeden Request protokolliert
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    github, issues_size = mocked(codec_client(ApiClient, Configuration), github_issues(100))
+    starred, starred_size = mocked(codec_client(ApiClient, Configuration), github_repositories(100))
+    issues_api, activity_api = IssuesApi(github), ActivityApi(starred)
+    scenarios = [
+        # Die Issues liefen bisher per passthrough, die Repositories über Modelle
+        (f"issues_list_for_repo, 100 ({issues_size / 1024:.0f} KiB)", True, ISSUE_FIELDS,
+         lambda: issues_api.issues_list_for_repo(owner="octocat", repo="Hello-World", per_page=100)),
+        (f"starred repositories, 100 ({starred_size / 1024:.0f} KiB)", False, REPOSITORY_FIELDS,
+         lambda: activity_api.activity_list_repos_starred_by_authenticated_user(per_page=100)),
+    ]
+
+    async def main():
+        for name, raw, fields, call in scenarios:
+            (full_cpu, full_bytes), (projected_cpu, projected_bytes) = [await measure(tool(call, selected, raw)) for selected in (None, fields)]
+            print(f"{name:38}: all fields {full_cpu * 1e3:6.1f} ms CPU/call, {full_bytes / 1024:5.0f} KiB out; "
+                  f"default projection {projected_cpu * 1e3:6.1f} ms CPU/call, {projected_bytes / 1024:5.0f} KiB out "
+                  f"({full_bytes / projected_bytes:4.1f}x fewer bytes, {full_cpu / projected_cpu:4.1f}x less CPU)")
+    asyncio.run(main())
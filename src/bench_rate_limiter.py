@@ -0,0 +1,31 @@
+import os
+import tempfile
+import timeit
+
+from src.rate_limit_backends import SharedMemoryBackend
+from src.rate_limiter import RateLimiter
+
+
+def bench_is_allowed(max_calls: int, calls: int = 200_000, backend=None) -> float:
+    limiter = RateLimiter(backend)
+    # Zeitfenster so wählen, dass das Limit nie erreicht wird und nur der Buchhaltungsaufwand zählt
+    time_window = max_calls / 10_000_000
+    keys = [f"tool_{i}" for i in range(16)]
+
+    def run():
+        for i in range(calls):
+            limiter.is_allowed(keys[i & 15], max_calls, time_window)
+
+    seconds = min(timeit.repeat(run, number=1, repeat=3))
+    return seconds / calls * 1e9
+
+
+if __name__ == '__main__':
+    for max_calls in (3, 100, 10_000, 1_000_000):
+        print(f"in-process     max_calls={max_calls:>9}: {bench_is_allowed(max_calls):7.1f} ns/call")
+
+    with tempfile.TemporaryDirectory() as directory:
+        backend = SharedMemoryBackend(os.path.join(directory, "rate_limit.state"))
+        for max_calls in (3, 1_000_000):
+            print(f"shared memory  max_calls={max_calls:>9}: {bench_is_allowed(max_calls, backend=backend):7.1f} ns/call")
+        backend.close()
@@ -0,0 +1,57 @@
+import asyncio
+import math
+from time import perf_counter
+
+import src.sanitize_output as sanitize_module
+from src.bench_sanitize_output import github_issues
+from src.sanitize_output import sanitize_output
+
+
+@sanitize_output()
+async def tiny_tool():
+    return {"login": "octocat", "id": 1}
+
+
+async def latencies_during(payload, interval: float = 0.001) -> list:
+    """Misst die Dauer kleiner Tool-Aufrufe, während ein großes Ergebnis bereinigt wird"""
+
+    @sanitize_output(stream=True)
+    async def big_tool():
+        return payload
+
+    big = asyncio.create_task(big_tool())
+    latencies = []
+    while not big.done():
+        start = perf_counter()
+        await tiny_tool()
+        # Die Wartezeit bis der Loop den Aufruf wieder aufnimmt, zählt mit
+        await asyncio.sleep(0)
+        latencies.append(perf_counter() - start)
+        await asyncio.sleep(interval)
+    await big
+    return latencies
+
+
+def p99(values: list) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, math.ceil(len(values) * 0.99) - 1)]
+
+
+async def main():
+    payload = github_issues(20_000)
+    variants = {
+        "event loop": (math.inf, math.inf),
+        "thread": (sanitize_module.THREAD_THRESHOLD, math.inf),
+        "process pool": (sanitize_module.THREAD_THRESHOLD, sanitize_module.PROCESS_THRESHOLD),
+    }
+    for name, (thread_threshold, process_threshold) in variants.items():
+        sanitize_module.THREAD_THRESHOLD = thread_threshold
+        sanitize_module.PROCESS_THRESHOLD = process_threshold
+        start = perf_counter()
+        latencies = await latencies_during(payload)
+        total = perf_counter() - start
+        print(f"{name:>12}: sanitize {total * 1e3:7.1f} ms, tiny call p99 {p99(latencies) * 1e3:7.2f} ms, max {max(latencies) * 1e3:7.2f} ms")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -0,0 +1,93 @@
+import json
+import timeit
+import tracemalloc
+
+from mcp.server.fastmcp.utilities.func_metadata import _convert_to_content
+
+from src.discord_client.models.user_response import UserResponse
+from src.invman_client.models.invoice import Invoice
+from src.sanitize_output import _sanitize_to_content, _sanitize_value
+
+
+def github_issues(count: int) -> list:
+    # Aufgebaut wie die Antwort von GET /repos/{owner}/{repo}/issues
+    body = ("Steps to reproduce:\n1. Open the settings page\n2. Click on save\n\n"
+            "Expected: the form is stored. Actual: nothing happens, see the log below.\n") * 6
+    return [
+        {
+            "url": f"https://api.github.com/repos/octocat/Hello-World/issues/{i}",
+            "html_url": f"https://github.com/octocat/Hello-World/issues/{i}",
+            "id": 1_000_000 + i,
+            "node_id": "MDU6SXNzdWUx",
+            "number": i,
+            "title": f"Found a bug in module {i}",
+            "state": "open",
+            "locked": False,
+            "user": {"login": "octocat", "id": 1, "avatar_url": "https://github.com/images/error/octocat_happy.gif", "type": "User", "site_admin": False},
+            "labels": [{"id": 208045946, "name": "bug", "color": "f29513", "default": True, "description": "Something isn't working"}],
+            "assignees": [],
+            "comments": i % 7,
+            "created_at": "2011-04-22T13:33:48Z",
+            "updated_at": "2011-04-22T13:33:48Z",
+            "author_association": "COLLABORATOR",
+            "body": body,
+        }
+        for i in range(count)
+    ]
+
+
+def invoices(count: int) -> list:
+    return [
+        Invoice(id=i, description=f"Wartung Server {i}", viaMail=True, preText="Sehr geehrte Damen und Herren,\nwir berechnen:",
+                postText="Zahlbar innerhalb von 14 Tagen.", serviceFrom="2024-01-01", serviceTo="2024-01-31", orderNumber=f"PO-{i}",
+                customerNumber=1000 + i, paid=False, positions=[1, 2, 3], receiver=7, salesTax=1, invoiceTemplate=2, file=None)
+        for i in range(count)
+    ]
+
+
+def discord_users(count: int) -> list:
+    # IDs sind Snowflakes, die das Schema per Pattern auf Ziffern einschränkt
+    return [
+        UserResponse(id=str(1191354485679857837 + i), username=f"user{i}", avatar="a_1269e74af4df7417b13759eae50c83dc", discriminator="0",
+                     public_flags=64, flags=64, bot=False, banner=None, accent_color=None, global_name=f"User {i}")
+        for i in range(count)
+    ]
+
+
+def bench(payload, repeat: int = 5) -> float:
+    return min(timeit.repeat(lambda: _sanitize_value(payload), number=1, repeat=repeat))
+
+
+def peak_memory(payload, sanitize) -> tuple:
+    # Spitzenspeicher über den Payload hinaus, bis FastMCP die Content-Blöcke fertig hat,
+    # und der Speicher der Content-Blöcke selbst, den jede Variante mindestens braucht
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    content = _convert_to_content(sanitize(payload))
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del content
+    return peak, current
+
+
+if __name__ == '__main__':
+    for count in (100, 1000, 10_000):
+        payload = github_issues(count)
+        size = len(json.dumps(payload))
+        seconds = bench(payload)
+        print(f"issues={count:>6} ({size / 1e6:6.2f} MB): {seconds * 1e3:8.2f} ms, {size / seconds / 1e6:6.1f} MB/s")
+
+    for count in (1000, 10_000):
+        payload = invoices(count)
+        native = bench(payload)
+        dumped = min(timeit.repeat(lambda: _sanitize_value([invoice.model_dump(by_alias=True) for invoice in payload]), number=1, repeat=5))
+        print(f"invoices={count:>6}: plan {native * 1e3:8.2f} ms, model_dump + dict {dumped * 1e3:8.2f} ms")
+
+    for count in (1000, 10_000):
+        print(f"discord users={count:>6}: {bench(discord_users(count)) * 1e3:8.2f} ms")
+
+    for count in (1000, 10_000):
+        payload = github_issues(count)
+        copied, content = peak_memory(payload, _sanitize_value)
+        streamed, _ = peak_memory(payload, _sanitize_to_content)
+        print(f"peak memory issues={count:>6}: copy {copied / 1e6:7.1f} MB, stream {streamed / 1e6:7.1f} MB, content blocks {content / 1e6:7.1f} MB")
@@ -0,0 +1,100 @@
+import datetime
+import decimal
+import timeit
+import uuid
+from enum import Enum
+
+from pydantic import SecretStr
+
+from src.discord_client.api_client import ApiClient as DiscordApiClient
+from src.discord_client.configuration import Configuration as DiscordConfiguration
+from src.discord_client.models import BaseCreateMessageCreateRequestComponentsInner, CreateForumThreadRequest, CreateThreadRequest, \
+    TextDisplayComponentForMessageRequest
+from src.github_client.api_client import ApiClient as GitHubApiClient
+from src.github_client.configuration import Configuration as GitHubConfiguration
+from src.github_client.models import IssuesCreateRequest
+from src.invman_client.api_client import ApiClient as InvmanApiClient
+from src.invman_client.configuration import Configuration as InvmanConfiguration
+from src.invman_client.models import InvoicePosition
+from src.model_codec import ModelCodec
+
+
+def isinstance_chain(client, obj):
+    """sanitize_for_serialization, wie es vor der Tabelle je Klasse war: isinstance-Kette, to_dict und erneutes Durchlaufen"""
+    if obj is None:
+        return None
+    elif isinstance(obj, Enum):
+        return obj.value
+    elif isinstance(obj, SecretStr):
+        return obj.get_secret_value()
+    elif isinstance(obj, client.PRIMITIVE_TYPES):
+        return obj
+    elif isinstance(obj, uuid.UUID):
+        return str(obj)
+    elif isinstance(obj, list):
+        return [isinstance_chain(client, sub_obj) for sub_obj in obj]
+    elif isinstance(obj, tuple):
+        return tuple(isinstance_chain(client, sub_obj) for sub_obj in obj)
+    elif isinstance(obj, (datetime.datetime, datetime.date)):
+        return obj.isoformat()
+    elif isinstance(obj, decimal.Decimal):
+        return str(obj)
+    elif isinstance(obj, dict):
+        obj_dict = obj
+    elif hasattr(obj, 'to_dict') and callable(getattr(obj, 'to_dict')):
+        obj_dict = obj.to_dict()
+    else:
+        obj_dict = obj.__dict__
+    if isinstance(obj_dict, list):
+        return isinstance_chain(client, obj_dict)
+    return {key: isinstance_chain(client, val) for key, val in obj_dict.items()}
+
+
+def codec_client(client_class, configuration_class):
+    """Client mit ModelCodec, wie ihn die Tools bauen"""
+    config = configuration_class()
+    config.codec = ModelCodec.for_client(client_class)
+    return client_class(config)
+
+
+def forum_thread(number: int) -> CreateThreadRequest:
+    """Body von create_thread: Forum-Thread mit Embed, Umfrage, Anhang und Komponente"""
+    request = CreateForumThreadRequest.model_validate({
+        "name": f"Release notes {number}", "auto_archive_duration": 1440, "applied_tags": ["1234567890", "1234567891"],
+        "message": {"content": "Changes in this release", "flags": 4,
+                    "embeds": [{"title": f"v{number}", "description": "Bug fixes and improvements", "color": 5814783,
+                                "fields": [{"name": "Fixed", "value": "Crash on start", "inline": True},
+                                           {"name": "Added", "value": "Dark mode", "inline": True}],
+                                "footer": {"text": "Release bot"}}],
+                    "allowed_mentions": {"parse": ["users"], "replied_user": False},
+                    "attachments": [{"id": "0", "filename": "changelog.md", "description": None}],
+                    "poll": {"question": {"text": "Upgrade now?"}, "answers": [{"poll_media": {"text": "Yes"}}, {"poll_media": {"text": "Later"}}]}}})
+    request.message.components = [BaseCreateMessageCreateRequestComponentsInner(actual_instance=TextDisplayComponentForMessageRequest(type=10, content="Thanks!"))]
+    return CreateThreadRequest(actual_instance=request)
+
+
+def issue(number: int) -> IssuesCreateRequest:
+    """Body von issues_create, validiert wie in IssuesApi.issues_create"""
+    return IssuesCreateRequest.model_validate({"title": {"actual_instance": f"Found a bug {number}"}, "body": "I'm having a problem with this.",
+                                               "milestone": None, "labels": [{"actual_instance": "bug"}], "assignees": ["octocat"], "type": None})
+
+
+def position(number: int) -> InvoicePosition:
+    return InvoicePosition(description=f"Consulting {number}", pricePerUnitInCents=12000, quantity=8, unit="hour", invoice=17)
+
+
+SCENARIOS = [
+    ("create_thread, CreateForumThreadRequest", codec_client(DiscordApiClient, DiscordConfiguration), forum_thread),
+    ("issues_create, IssuesCreateRequest", codec_client(GitHubApiClient, GitHubConfiguration), issue),
+    ("create_position, InvoicePosition", codec_client(InvmanApiClient, InvmanConfiguration), position),
+]
+
+if __name__ == '__main__':
+    # Bulk: 1000 Bodies hintereinander, wie bei vielen create_position- oder issues_create-Aufrufen
+    for name, client, build in SCENARIOS:
+        bodies = [build(number) for number in range(1000)]
+        assert [client.sanitize_for_serialization(body) for body in bodies] == [isinstance_chain(client, body) for body in bodies]
+        before, after = [min(timeit.repeat(lambda: [serialize(body) for body in bodies], number=1, repeat=7)) / len(bodies)
+                         for serialize in (lambda body: isinstance_chain(client, body), client.sanitize_for_serialization)]
+        print(f"{name:42}: isinstance chain + to_dict {before * 1e6:6.1f} µs, per-class dispatch {after * 1e6:6.1f} µs per body, "
+              f"{before / after:4.1f}x")
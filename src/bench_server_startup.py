@@ -0,0 +1,66 @@
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+
+# Startet den Server mit den angegebenen Integrationen bis zum gebundenen Socket, ohne Requests anzunehmen
+STARTUP = """
+import asyncio, resource, socket, sys, time
+start = time.perf_counter()
+
+import src.tool_schema_cache as cache_module
+cached_tool = cache_module.cached_tool
+registration = 0.0
+
+def timed_tool(*args, **kwargs):
+    global registration
+    begin = time.perf_counter()
+    try:
+        return cached_tool(*args, **kwargs)
+    finally:
+        registration += time.perf_counter() - begin
+
+cache_module.cached_tool = timed_tool
+
+from server import mcp
+from src.tool_registry import register_tool_modules
+groups = register_tool_modules(mcp, sys.argv[1].split(","), lazy=sys.argv[2] == "lazy")
+imported = time.perf_counter()
+
+tools = asyncio.run(mcp.list_tools())
+app = mcp.streamable_http_app()
+listener = socket.create_server((mcp.settings.host, 0))
+bound = time.perf_counter()
+listener.close()
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+# Beim ersten Aufruf eines Tools der ersten Gruppe wird deren Modul nachgeladen
+asyncio.run(groups[0].load())
+first_call = time.perf_counter() - bound
+print(imported - start, registration, bound - imported, len(tools), rss, first_call)
+"""
+
+
+def measure(cache_dir: str, names: str, mode: str, repeat: int = 3):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(["src", "."]), TOOL_SCHEMA_CACHE=cache_dir)
+    env.setdefault("GITHUB_PAT", "bench")
+    env.setdefault("DISCORD_BOT", "bench")
+    runs = []
+    for _ in range(repeat):
+        if mode == "cold":
+            shutil.rmtree(cache_dir, ignore_errors=True)
+        output = subprocess.run([sys.executable, "-W", "ignore", "-c", STARTUP, names, mode], env=env, stdout=subprocess.PIPE, text=True, check=True).stdout
+        runs.append(tuple(map(float, output.split()[-6:])))
+    return min(runs)
+
+
+if __name__ == '__main__':
+    all_modules = "github,discord,eve,invman"
+    with tempfile.TemporaryDirectory() as cache_dir:
+        # cold: leerer Cache, eager: alle Module beim Start importieren, lazy: Module erst beim ersten Aufruf
+        for names, mode in ((all_modules, "cold"), (all_modules, "eager"), (all_modules, "lazy"), ("invman", "lazy")):
+            import_time, registration, serve, tools, rss, first_call = measure(cache_dir, names, mode)
+            print(f"{mode:5} {names:26}: startup {import_time * 1e3:8.1f} ms, of which tool registration {registration * 1e3:7.1f} ms "
+                  f"({tools:.0f} tools), list_tools + app + bind {serve * 1e3:6.1f} ms, max RSS {rss:6.1f} MB, "
+                  f"first call loads {names.split(',')[0]} in {first_call * 1e3:7.1f} ms")
@@ -0,0 +1,83 @@
+import asyncio
+import importlib
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench_http_pool import count_connections, create_certificate
+from src.shared_transport import SharedTransport
+
+# discord_client wird wie in den Tool-Modulen über src importiert
+CLIENTS = ("github_client", "src.discord_client", "eve_client", "invman_client")
+ROUNDS = 50
+# Für die Speichermessung so viele Sätze von Clients gleichzeitig halten
+SETS = 10
+
+
+def rss() -> int:
+    with open("/proc/self/statm") as file:
+        return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def create_clients(transport=None, cert_file=None):
+    """Je ein RESTClientObject der vier generierten Clients, mit eigenem Pool oder am gemeinsamen Transport"""
+    clients = []
+    for package in CLIENTS:
+        configuration = importlib.import_module(f"{package}.configuration").Configuration(ssl_ca_cert=cert_file)
+        configuration.transport = transport
+        client = importlib.import_module(f"{package}.rest").RESTClientObject(configuration)
+        client.get_pool_manager()
+        clients.append(client)
+    return clients
+
+
+def construction(shared: bool, repeat: int = 5):
+    """Anlegen der Clients samt Pool wie in den Tool-Modulen, d.h. mit den CA-Zertifikaten des Systems"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        create_clients(SharedTransport() if shared else None)
+        timings.append(time.perf_counter() - start)
+    # Die SSL-Kontexte liegen im Speicher von OpenSSL, daher RSS statt tracemalloc
+    before = rss()
+    clients = [create_clients(SharedTransport() if shared else None) for _ in range(SETS)]
+    memory = (rss() - before) / SETS
+    del clients
+    return min(timings), memory
+
+
+async def connections(url: str, cert_file: str, shared: bool) -> int:
+    transport = SharedTransport() if shared else None
+    clients = create_clients(transport, cert_file)
+    # Alle Clients sprechen nacheinander denselben Host an (z.B. mehrere Upstreams hinter einem Gateway),
+    # bei verschiedenen Hosts kann auch der gemeinsame Pool keine Verbindung wiederverwenden
+    before = await count_connections(url, cert_file)
+    for _ in range(ROUNDS):
+        for client in clients:
+            await (await client.request("GET", url + "/status")).read()
+    opened = await count_connections(url, cert_file) - before - 1
+    for client in clients:
+        await client.close()
+    if transport is not None:
+        await transport.close()
+    return opened
+
+
+if __name__ == '__main__':
+    # Die Clients werden vorab importiert und einmal angelegt, gemessen wird nur das Anlegen von Client und Pool
+    create_clients()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert_file, key_file = create_certificate(directory)
+        server = subprocess.Popen([sys.executable, "bench_http_pool.py", "serve", cert_file, key_file], stdout=subprocess.PIPE, text=True)
+        try:
+            url = f"https://localhost:{server.stdout.readline().strip()}"
+            for name, shared in (("own pool per client", False), ("shared transport", True)):
+                seconds, memory = construction(shared)
+                opened = asyncio.run(connections(url, cert_file, shared))
+                print(f"{name:20}: 4 clients in {seconds * 1e3:6.1f} ms, {memory / 1024:7.1f} KiB RSS, "
+                      f"{opened:3d} TLS connections for {ROUNDS * len(CLIENTS)} requests")
+        finally:
+            server.terminate()
@@ -0,0 +1,41 @@
+import importlib
+import os
+import time
+
+from src import ssl_contexts
+
+# discord_client wird wie in den Tool-Modulen über src importiert
+CLIENTS = ("github_client", "src.discord_client", "eve_client", "invman_client")
+# z.B. Clients pro Mandant oder pro Test
+INSTANCES = 25
+
+
+def rss() -> int:
+    with open("/proc/self/statm") as file:
+        return int(file.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+
+
+def construct(cached: bool):
+    """Legt INSTANCES RESTClientObjects je generiertem Client an, ohne Cache baut jeder Client seinen Kontext selbst"""
+    clients = []
+    start = time.perf_counter()
+    for _ in range(INSTANCES):
+        for package in CLIENTS:
+            configuration = importlib.import_module(f"{package}.configuration").Configuration()
+            if cached:
+                configuration.ssl_context = ssl_contexts.for_configuration(configuration)
+            clients.append(importlib.import_module(f"{package}.rest").RESTClientObject(configuration))
+    return time.perf_counter() - start, clients
+
+
+if __name__ == '__main__':
+    for package in CLIENTS:
+        importlib.import_module(f"{package}.rest")
+    count = INSTANCES * len(CLIENTS)
+    # Der gecachte Lauf zuerst, damit er die Kosten des ersten Kontexts mitträgt
+    for name, cached in (("cached", True), ("uncached", False)):
+        before = rss()
+        seconds, clients = construct(cached)
+        print(f"{name:8}: {count} clients in {seconds * 1e3:7.1f} ms ({seconds / count * 1e3:5.2f} ms per client), "
+              f"RSS +{(rss() - before) / 2 ** 20:6.1f} MB while holding them")
+        del clients
@@ -0,0 +1,67 @@
+import os
+import subprocess
+import sys
+
+# Dieselben Imports wie src/stage1b/github_tools.py
+IMPORTS = """
+from src.github_client.api.activity_api import ActivityApi
+from src.github_client.api.issues_api import IssuesApi
+from src.github_client.api.repos_api import ReposApi
+from src.github_client.api_client import ApiClient
+from src.github_client.configuration import Configuration
+"""
+
+# Erster und zweiter Aufruf von issues_list_for_repo gegen einen lokalen Mock statt api.github.com
+CALLS = """
+import asyncio, time
+import httpx
+
+issue = {"id": 1, "node_id": "I_1", "url": "u", "repository_url": "u", "labels_url": "u", "comments_url": "u", "events_url": "u",
+         "html_url": "u", "number": 1, "state": "open", "title": "Bug", "user": None, "labels": [], "assignee": None, "assignees": [],
+         "milestone": None, "locked": False, "comments": 0, "closed_at": None, "created_at": "2011-04-22T13:33:48Z",
+         "updated_at": "2011-04-22T13:33:48Z", "author_association": "OWNER", "body": "text", "active_lock_reason": None,
+         "reactions": {"url": "u", "total_count": 0, "+1": 0, "-1": 0, "laugh": 0, "confused": 0, "heart": 0, "hooray": 0, "eyes": 0, "rocket": 0}}
+
+config = Configuration(host="https://api.github.com")
+config.client_side_validation = VALIDATE
+api_client = ApiClient(config)
+api_client.rest_client.pool_manager = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json=[issue])))
+issues_api = IssuesApi(api_client)
+
+async def call():
+    start = time.perf_counter()
+    issues = await issues_api.issues_list_for_repo(owner="octocat", repo="hello-world", state="open", sort="created", direction="desc", per_page=30, page=1)
+    assert issues[0].title == "Bug"
+    return time.perf_counter() - start
+
+async def calls():
+    return await call(), await call()
+
+first_call, second_call = asyncio.run(calls())
+"""
+
+MEASURE = """
+import resource, sys, time
+start = time.perf_counter()
+exec(sys.argv[1])
+imported = time.perf_counter()
+exec(sys.argv[2])
+print(imported - start, first_call, second_call, resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024)
+"""
+
+
+def measure(validate: bool, repeat: int = 3):
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(["src", "."]))
+    calls = CALLS.replace("VALIDATE", str(validate))
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-W", "ignore", "-c", MEASURE, IMPORTS, calls], env=env, stdout=subprocess.PIPE, text=True, check=True).stdout
+        runs.append(tuple(map(float, output.split())))
+    return min(runs)
+
+
+if __name__ == '__main__':
+    for validate in (True, False):
+        import_time, first_call, second_call, rss = measure(validate)
+        print(f"client_side_validation={validate!s:5}: import {import_time * 1e3:8.1f} ms, first call {first_call * 1e3:7.2f} ms, "
+              f"second call {second_call * 1e3:7.2f} ms, max RSS {rss:6.1f} MB")
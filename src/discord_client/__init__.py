@@ -13,12 +13,31 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import importlib
+from typing import TYPE_CHECKING
+
 
 __version__ = "1.0.0"
 
 # Define package exports
 __all__ = [
+    "ApplicationsApi",
+    "ChannelsApi",
     "DefaultApi",
+    "GatewayApi",
+    "GuildsApi",
+    "InteractionsApi",
+    "InvitesApi",
+    "LobbiesApi",
+    "Oauth2Api",
+    "PartnerSdkApi",
+    "SoundboardDefaultSoundsApi",
+    "StageInstancesApi",
+    "StickerPacksApi",
+    "StickersApi",
+    "UsersApi",
+    "VoiceApi",
+    "WebhooksApi",
     "ApiResponse",
     "ApiClient",
     "Configuration",
@@ -505,7 +524,24 @@ __all__ = [
 ]
 
 # import apis into sdk package
-from discord_client.api.default_api import DefaultApi as DefaultApi
+if TYPE_CHECKING:
+    from discord_client.api.applications_api import ApplicationsApi as ApplicationsApi
+    from discord_client.api.channels_api import ChannelsApi as ChannelsApi
+    from discord_client.api.default_api import DefaultApi as DefaultApi
+    from discord_client.api.gateway_api import GatewayApi as GatewayApi
+    from discord_client.api.guilds_api import GuildsApi as GuildsApi
+    from discord_client.api.interactions_api import InteractionsApi as InteractionsApi
+    from discord_client.api.invites_api import InvitesApi as InvitesApi
+    from discord_client.api.lobbies_api import LobbiesApi as LobbiesApi
+    from discord_client.api.oauth2_api import Oauth2Api as Oauth2Api
+    from discord_client.api.partner_sdk_api import PartnerSdkApi as PartnerSdkApi
+    from discord_client.api.soundboard_default_sounds_api import SoundboardDefaultSoundsApi as SoundboardDefaultSoundsApi
+    from discord_client.api.stage_instances_api import StageInstancesApi as StageInstancesApi
+    from discord_client.api.sticker_packs_api import StickerPacksApi as StickerPacksApi
+    from discord_client.api.stickers_api import StickersApi as StickersApi
+    from discord_client.api.users_api import UsersApi as UsersApi
+    from discord_client.api.voice_api import VoiceApi as VoiceApi
+    from discord_client.api.webhooks_api import WebhooksApi as WebhooksApi
 
 # import ApiClient
 from discord_client.api_response import ApiResponse as ApiResponse
@@ -519,478 +555,993 @@ from discord_client.exceptions import ApiAttributeError as ApiAttributeError
 from discord_client.exceptions import ApiException as ApiException
 
 # import models into sdk package
-from discord_client.models.account_response import AccountResponse as AccountResponse
-from discord_client.models.action_row_component_for_message_request import ActionRowComponentForMessageRequest as ActionRowComponentForMessageRequest
-from discord_client.models.action_row_component_for_message_request_components_inner import ActionRowComponentForMessageRequestComponentsInner as ActionRowComponentForMessageRequestComponentsInner
-from discord_client.models.action_row_component_for_modal_request import ActionRowComponentForModalRequest as ActionRowComponentForModalRequest
-from discord_client.models.action_row_component_response import ActionRowComponentResponse as ActionRowComponentResponse
-from discord_client.models.action_row_component_response_components_inner import ActionRowComponentResponseComponentsInner as ActionRowComponentResponseComponentsInner
-from discord_client.models.activities_attachment_response import ActivitiesAttachmentResponse as ActivitiesAttachmentResponse
-from discord_client.models.add_group_dm_user201_response import AddGroupDmUser201Response as AddGroupDmUser201Response
-from discord_client.models.add_group_dm_user_request import AddGroupDmUserRequest as AddGroupDmUserRequest
-from discord_client.models.add_lobby_member_request import AddLobbyMemberRequest as AddLobbyMemberRequest
-from discord_client.models.application_command_attachment_option import ApplicationCommandAttachmentOption as ApplicationCommandAttachmentOption
-from discord_client.models.application_command_attachment_option_response import ApplicationCommandAttachmentOptionResponse as ApplicationCommandAttachmentOptionResponse
-from discord_client.models.application_command_autocomplete_callback_request import ApplicationCommandAutocompleteCallbackRequest as ApplicationCommandAutocompleteCallbackRequest
-from discord_client.models.application_command_autocomplete_callback_request_data import ApplicationCommandAutocompleteCallbackRequestData as ApplicationCommandAutocompleteCallbackRequestData
-from discord_client.models.application_command_boolean_option import ApplicationCommandBooleanOption as ApplicationCommandBooleanOption
-from discord_client.models.application_command_boolean_option_response import ApplicationCommandBooleanOptionResponse as ApplicationCommandBooleanOptionResponse
-from discord_client.models.application_command_channel_option import ApplicationCommandChannelOption as ApplicationCommandChannelOption
-from discord_client.models.application_command_channel_option_response import ApplicationCommandChannelOptionResponse as ApplicationCommandChannelOptionResponse
-from discord_client.models.application_command_create_request import ApplicationCommandCreateRequest as ApplicationCommandCreateRequest
-from discord_client.models.application_command_create_request_options_inner import ApplicationCommandCreateRequestOptionsInner as ApplicationCommandCreateRequestOptionsInner
-from discord_client.models.application_command_integer_option import ApplicationCommandIntegerOption as ApplicationCommandIntegerOption
-from discord_client.models.application_command_integer_option_response import ApplicationCommandIntegerOptionResponse as ApplicationCommandIntegerOptionResponse
-from discord_client.models.application_command_interaction_metadata_response import ApplicationCommandInteractionMetadataResponse as ApplicationCommandInteractionMetadataResponse
-from discord_client.models.application_command_mentionable_option import ApplicationCommandMentionableOption as ApplicationCommandMentionableOption
-from discord_client.models.application_command_mentionable_option_response import ApplicationCommandMentionableOptionResponse as ApplicationCommandMentionableOptionResponse
-from discord_client.models.application_command_number_option import ApplicationCommandNumberOption as ApplicationCommandNumberOption
-from discord_client.models.application_command_number_option_response import ApplicationCommandNumberOptionResponse as ApplicationCommandNumberOptionResponse
-from discord_client.models.application_command_option_integer_choice import ApplicationCommandOptionIntegerChoice as ApplicationCommandOptionIntegerChoice
-from discord_client.models.application_command_option_integer_choice_response import ApplicationCommandOptionIntegerChoiceResponse as ApplicationCommandOptionIntegerChoiceResponse
-from discord_client.models.application_command_option_number_choice import ApplicationCommandOptionNumberChoice as ApplicationCommandOptionNumberChoice
-from discord_client.models.application_command_option_number_choice_response import ApplicationCommandOptionNumberChoiceResponse as ApplicationCommandOptionNumberChoiceResponse
-from discord_client.models.application_command_option_string_choice import ApplicationCommandOptionStringChoice as ApplicationCommandOptionStringChoice
-from discord_client.models.application_command_option_string_choice_response import ApplicationCommandOptionStringChoiceResponse as ApplicationCommandOptionStringChoiceResponse
-from discord_client.models.application_command_patch_request_partial import ApplicationCommandPatchRequestPartial as ApplicationCommandPatchRequestPartial
-from discord_client.models.application_command_permission import ApplicationCommandPermission as ApplicationCommandPermission
-from discord_client.models.application_command_response import ApplicationCommandResponse as ApplicationCommandResponse
-from discord_client.models.application_command_response_options_inner import ApplicationCommandResponseOptionsInner as ApplicationCommandResponseOptionsInner
-from discord_client.models.application_command_role_option import ApplicationCommandRoleOption as ApplicationCommandRoleOption
-from discord_client.models.application_command_role_option_response import ApplicationCommandRoleOptionResponse as ApplicationCommandRoleOptionResponse
-from discord_client.models.application_command_string_option import ApplicationCommandStringOption as ApplicationCommandStringOption
-from discord_client.models.application_command_string_option_response import ApplicationCommandStringOptionResponse as ApplicationCommandStringOptionResponse
-from discord_client.models.application_command_subcommand_group_option import ApplicationCommandSubcommandGroupOption as ApplicationCommandSubcommandGroupOption
-from discord_client.models.application_command_subcommand_group_option_response import ApplicationCommandSubcommandGroupOptionResponse as ApplicationCommandSubcommandGroupOptionResponse
-from discord_client.models.application_command_subcommand_option import ApplicationCommandSubcommandOption as ApplicationCommandSubcommandOption
-from discord_client.models.application_command_subcommand_option_options_inner import ApplicationCommandSubcommandOptionOptionsInner as ApplicationCommandSubcommandOptionOptionsInner
-from discord_client.models.application_command_subcommand_option_response import ApplicationCommandSubcommandOptionResponse as ApplicationCommandSubcommandOptionResponse
-from discord_client.models.application_command_subcommand_option_response_options_inner import ApplicationCommandSubcommandOptionResponseOptionsInner as ApplicationCommandSubcommandOptionResponseOptionsInner
-from discord_client.models.application_command_update_request import ApplicationCommandUpdateRequest as ApplicationCommandUpdateRequest
-from discord_client.models.application_command_user_option import ApplicationCommandUserOption as ApplicationCommandUserOption
-from discord_client.models.application_command_user_option_response import ApplicationCommandUserOptionResponse as ApplicationCommandUserOptionResponse
-from discord_client.models.application_form_partial import ApplicationFormPartial as ApplicationFormPartial
-from discord_client.models.application_form_partial_description import ApplicationFormPartialDescription as ApplicationFormPartialDescription
-from discord_client.models.application_form_partial_integration_types_config_value import ApplicationFormPartialIntegrationTypesConfigValue as ApplicationFormPartialIntegrationTypesConfigValue
-from discord_client.models.application_incoming_webhook_response import ApplicationIncomingWebhookResponse as ApplicationIncomingWebhookResponse
-from discord_client.models.application_integration_type_configuration import ApplicationIntegrationTypeConfiguration as ApplicationIntegrationTypeConfiguration
-from discord_client.models.application_integration_type_configuration_response import ApplicationIntegrationTypeConfigurationResponse as ApplicationIntegrationTypeConfigurationResponse
-from discord_client.models.application_o_auth2_install_params import ApplicationOAuth2InstallParams as ApplicationOAuth2InstallParams
-from discord_client.models.application_o_auth2_install_params_response import ApplicationOAuth2InstallParamsResponse as ApplicationOAuth2InstallParamsResponse
-from discord_client.models.application_response import ApplicationResponse as ApplicationResponse
-from discord_client.models.application_role_connections_metadata_item_request import ApplicationRoleConnectionsMetadataItemRequest as ApplicationRoleConnectionsMetadataItemRequest
-from discord_client.models.application_role_connections_metadata_item_response import ApplicationRoleConnectionsMetadataItemResponse as ApplicationRoleConnectionsMetadataItemResponse
-from discord_client.models.application_user_role_connection_response import ApplicationUserRoleConnectionResponse as ApplicationUserRoleConnectionResponse
-from discord_client.models.attachment_response import AttachmentResponse as AttachmentResponse
-from discord_client.models.audit_log_entry_response import AuditLogEntryResponse as AuditLogEntryResponse
-from discord_client.models.audit_log_object_change_response import AuditLogObjectChangeResponse as AuditLogObjectChangeResponse
-from discord_client.models.ban_user_from_guild_request import BanUserFromGuildRequest as BanUserFromGuildRequest
-from discord_client.models.base_create_message_create_request import BaseCreateMessageCreateRequest as BaseCreateMessageCreateRequest
-from discord_client.models.base_create_message_create_request_components_inner import BaseCreateMessageCreateRequestComponentsInner as BaseCreateMessageCreateRequestComponentsInner
-from discord_client.models.basic_application_response import BasicApplicationResponse as BasicApplicationResponse
-from discord_client.models.basic_guild_member_response import BasicGuildMemberResponse as BasicGuildMemberResponse
-from discord_client.models.basic_message_response import BasicMessageResponse as BasicMessageResponse
-from discord_client.models.basic_message_response_components_inner import BasicMessageResponseComponentsInner as BasicMessageResponseComponentsInner
-from discord_client.models.basic_message_response_interaction_metadata import BasicMessageResponseInteractionMetadata as BasicMessageResponseInteractionMetadata
-from discord_client.models.basic_message_response_nonce import BasicMessageResponseNonce as BasicMessageResponseNonce
-from discord_client.models.block_message_action import BlockMessageAction as BlockMessageAction
-from discord_client.models.block_message_action_metadata import BlockMessageActionMetadata as BlockMessageActionMetadata
-from discord_client.models.block_message_action_metadata_response import BlockMessageActionMetadataResponse as BlockMessageActionMetadataResponse
-from discord_client.models.block_message_action_response import BlockMessageActionResponse as BlockMessageActionResponse
-from discord_client.models.bot_account_patch_request import BotAccountPatchRequest as BotAccountPatchRequest
-from discord_client.models.bot_add_guild_member_request import BotAddGuildMemberRequest as BotAddGuildMemberRequest
-from discord_client.models.bot_partner_sdk_token_request import BotPartnerSdkTokenRequest as BotPartnerSdkTokenRequest
-from discord_client.models.bot_partner_sdk_unmerge_provisional_account_request import BotPartnerSdkUnmergeProvisionalAccountRequest as BotPartnerSdkUnmergeProvisionalAccountRequest
-from discord_client.models.bulk_ban_users_request import BulkBanUsersRequest as BulkBanUsersRequest
-from discord_client.models.bulk_ban_users_response import BulkBanUsersResponse as BulkBanUsersResponse
-from discord_client.models.bulk_delete_messages_request import BulkDeleteMessagesRequest as BulkDeleteMessagesRequest
-from discord_client.models.bulk_lobby_member_request import BulkLobbyMemberRequest as BulkLobbyMemberRequest
-from discord_client.models.bulk_update_guild_channels_request_inner import BulkUpdateGuildChannelsRequestInner as BulkUpdateGuildChannelsRequestInner
-from discord_client.models.button_component_for_message_request import ButtonComponentForMessageRequest as ButtonComponentForMessageRequest
-from discord_client.models.button_component_response import ButtonComponentResponse as ButtonComponentResponse
-from discord_client.models.channel_follower_response import ChannelFollowerResponse as ChannelFollowerResponse
-from discord_client.models.channel_follower_webhook_response import ChannelFollowerWebhookResponse as ChannelFollowerWebhookResponse
-from discord_client.models.channel_permission_overwrite_request import ChannelPermissionOverwriteRequest as ChannelPermissionOverwriteRequest
-from discord_client.models.channel_permission_overwrite_response import ChannelPermissionOverwriteResponse as ChannelPermissionOverwriteResponse
-from discord_client.models.channel_select_component_for_message_request import ChannelSelectComponentForMessageRequest as ChannelSelectComponentForMessageRequest
-from discord_client.models.channel_select_component_for_modal_request import ChannelSelectComponentForModalRequest as ChannelSelectComponentForModalRequest
-from discord_client.models.channel_select_component_response import ChannelSelectComponentResponse as ChannelSelectComponentResponse
-from discord_client.models.channel_select_default_value import ChannelSelectDefaultValue as ChannelSelectDefaultValue
-from discord_client.models.channel_select_default_value_response import ChannelSelectDefaultValueResponse as ChannelSelectDefaultValueResponse
-from discord_client.models.command_permission_response import CommandPermissionResponse as CommandPermissionResponse
-from discord_client.models.command_permissions_response import CommandPermissionsResponse as CommandPermissionsResponse
-from discord_client.models.component_emoji_for_request import ComponentEmojiForRequest as ComponentEmojiForRequest
-from discord_client.models.component_emoji_response import ComponentEmojiResponse as ComponentEmojiResponse
-from discord_client.models.connected_account_guild_response import ConnectedAccountGuildResponse as ConnectedAccountGuildResponse
-from discord_client.models.connected_account_integration_response import ConnectedAccountIntegrationResponse as ConnectedAccountIntegrationResponse
-from discord_client.models.connected_account_response import ConnectedAccountResponse as ConnectedAccountResponse
-from discord_client.models.container_component_for_message_request import ContainerComponentForMessageRequest as ContainerComponentForMessageRequest
-from discord_client.models.container_component_for_message_request_components_inner import ContainerComponentForMessageRequestComponentsInner as ContainerComponentForMessageRequestComponentsInner
-from discord_client.models.container_component_response import ContainerComponentResponse as ContainerComponentResponse
-from discord_client.models.container_component_response_components_inner import ContainerComponentResponseComponentsInner as ContainerComponentResponseComponentsInner
-from discord_client.models.create_application_emoji_request import CreateApplicationEmojiRequest as CreateApplicationEmojiRequest
-from discord_client.models.create_auto_moderation_rule200_response import CreateAutoModerationRule200Response as CreateAutoModerationRule200Response
-from discord_client.models.create_auto_moderation_rule_request import CreateAutoModerationRuleRequest as CreateAutoModerationRuleRequest
-from discord_client.models.create_channel_invite200_response import CreateChannelInvite200Response as CreateChannelInvite200Response
-from discord_client.models.create_channel_invite_request import CreateChannelInviteRequest as CreateChannelInviteRequest
-from discord_client.models.create_entitlement_request_data import CreateEntitlementRequestData as CreateEntitlementRequestData
-from discord_client.models.create_forum_thread_request import CreateForumThreadRequest as CreateForumThreadRequest
-from discord_client.models.create_group_dm_invite_request import CreateGroupDMInviteRequest as CreateGroupDMInviteRequest
-from discord_client.models.create_guild_channel_request import CreateGuildChannelRequest as CreateGuildChannelRequest
-from discord_client.models.create_guild_emoji_request import CreateGuildEmojiRequest as CreateGuildEmojiRequest
-from discord_client.models.create_guild_invite_request import CreateGuildInviteRequest as CreateGuildInviteRequest
-from discord_client.models.create_guild_scheduled_event_request import CreateGuildScheduledEventRequest as CreateGuildScheduledEventRequest
-from discord_client.models.create_guild_template_request import CreateGuildTemplateRequest as CreateGuildTemplateRequest
-from discord_client.models.create_interaction_response_request import CreateInteractionResponseRequest as CreateInteractionResponseRequest
-from discord_client.models.create_lobby_request import CreateLobbyRequest as CreateLobbyRequest
-from discord_client.models.create_message_interaction_callback_request import CreateMessageInteractionCallbackRequest as CreateMessageInteractionCallbackRequest
-from discord_client.models.create_message_interaction_callback_response import CreateMessageInteractionCallbackResponse as CreateMessageInteractionCallbackResponse
-from discord_client.models.create_or_join_lobby_request import CreateOrJoinLobbyRequest as CreateOrJoinLobbyRequest
-from discord_client.models.create_or_update_thread_tag_request import CreateOrUpdateThreadTagRequest as CreateOrUpdateThreadTagRequest
-from discord_client.models.create_private_channel_request import CreatePrivateChannelRequest as CreatePrivateChannelRequest
-from discord_client.models.create_role_request import CreateRoleRequest as CreateRoleRequest
-from discord_client.models.create_stage_instance_request import CreateStageInstanceRequest as CreateStageInstanceRequest
-from discord_client.models.create_text_thread_with_message_request import CreateTextThreadWithMessageRequest as CreateTextThreadWithMessageRequest
-from discord_client.models.create_text_thread_without_message_request import CreateTextThreadWithoutMessageRequest as CreateTextThreadWithoutMessageRequest
-from discord_client.models.create_thread_request import CreateThreadRequest as CreateThreadRequest
-from discord_client.models.create_webhook_request import CreateWebhookRequest as CreateWebhookRequest
-from discord_client.models.created_thread_response import CreatedThreadResponse as CreatedThreadResponse
-from discord_client.models.custom_client_theme_response import CustomClientThemeResponse as CustomClientThemeResponse
-from discord_client.models.custom_client_theme_share_request import CustomClientThemeShareRequest as CustomClientThemeShareRequest
-from discord_client.models.default_keyword_list_trigger_metadata import DefaultKeywordListTriggerMetadata as DefaultKeywordListTriggerMetadata
-from discord_client.models.default_keyword_list_trigger_metadata_response import DefaultKeywordListTriggerMetadataResponse as DefaultKeywordListTriggerMetadataResponse
-from discord_client.models.default_keyword_list_upsert_request import DefaultKeywordListUpsertRequest as DefaultKeywordListUpsertRequest
-from discord_client.models.default_keyword_list_upsert_request_actions_inner import DefaultKeywordListUpsertRequestActionsInner as DefaultKeywordListUpsertRequestActionsInner
-from discord_client.models.default_keyword_list_upsert_request_partial import DefaultKeywordListUpsertRequestPartial as DefaultKeywordListUpsertRequestPartial
-from discord_client.models.default_keyword_rule_response import DefaultKeywordRuleResponse as DefaultKeywordRuleResponse
-from discord_client.models.default_keyword_rule_response_actions_inner import DefaultKeywordRuleResponseActionsInner as DefaultKeywordRuleResponseActionsInner
-from discord_client.models.default_reaction_emoji_response import DefaultReactionEmojiResponse as DefaultReactionEmojiResponse
-from discord_client.models.discord_integration_response import DiscordIntegrationResponse as DiscordIntegrationResponse
-from discord_client.models.edit_lobby_channel_link_request import EditLobbyChannelLinkRequest as EditLobbyChannelLinkRequest
-from discord_client.models.embedded_activity_instance import EmbeddedActivityInstance as EmbeddedActivityInstance
-from discord_client.models.embedded_activity_instance_location import EmbeddedActivityInstanceLocation as EmbeddedActivityInstanceLocation
-from discord_client.models.emoji_response import EmojiResponse as EmojiResponse
-from discord_client.models.entitlement_response import EntitlementResponse as EntitlementResponse
-from discord_client.models.entity_metadata_external import EntityMetadataExternal as EntityMetadataExternal
-from discord_client.models.entity_metadata_external_response import EntityMetadataExternalResponse as EntityMetadataExternalResponse
-from discord_client.models.error import Error as Error
-from discord_client.models.error_details import ErrorDetails as ErrorDetails
-from discord_client.models.error_response import ErrorResponse as ErrorResponse
-from discord_client.models.execute_webhook_request import ExecuteWebhookRequest as ExecuteWebhookRequest
-from discord_client.models.external_connection_integration_response import ExternalConnectionIntegrationResponse as ExternalConnectionIntegrationResponse
-from discord_client.models.external_scheduled_event_create_request import ExternalScheduledEventCreateRequest as ExternalScheduledEventCreateRequest
-from discord_client.models.external_scheduled_event_patch_request_partial import ExternalScheduledEventPatchRequestPartial as ExternalScheduledEventPatchRequestPartial
-from discord_client.models.external_scheduled_event_response import ExternalScheduledEventResponse as ExternalScheduledEventResponse
-from discord_client.models.file_component_for_message_request import FileComponentForMessageRequest as FileComponentForMessageRequest
-from discord_client.models.file_component_response import FileComponentResponse as FileComponentResponse
-from discord_client.models.file_upload_component_for_modal_request import FileUploadComponentForModalRequest as FileUploadComponentForModalRequest
-from discord_client.models.flag_to_channel_action import FlagToChannelAction as FlagToChannelAction
-from discord_client.models.flag_to_channel_action_metadata import FlagToChannelActionMetadata as FlagToChannelActionMetadata
-from discord_client.models.flag_to_channel_action_metadata_response import FlagToChannelActionMetadataResponse as FlagToChannelActionMetadataResponse
-from discord_client.models.flag_to_channel_action_response import FlagToChannelActionResponse as FlagToChannelActionResponse
-from discord_client.models.follow_channel_request import FollowChannelRequest as FollowChannelRequest
-from discord_client.models.forum_tag_response import ForumTagResponse as ForumTagResponse
-from discord_client.models.friend_invite_response import FriendInviteResponse as FriendInviteResponse
-from discord_client.models.gateway_bot_response import GatewayBotResponse as GatewayBotResponse
-from discord_client.models.gateway_bot_session_start_limit_response import GatewayBotSessionStartLimitResponse as GatewayBotSessionStartLimitResponse
-from discord_client.models.gateway_response import GatewayResponse as GatewayResponse
-from discord_client.models.get_channel200_response import GetChannel200Response as GetChannel200Response
-from discord_client.models.get_entitlements_sku_ids_parameter import GetEntitlementsSkuIdsParameter as GetEntitlementsSkuIdsParameter
-from discord_client.models.get_sticker200_response import GetSticker200Response as GetSticker200Response
-from discord_client.models.github_author import GithubAuthor as GithubAuthor
-from discord_client.models.github_check_app import GithubCheckApp as GithubCheckApp
-from discord_client.models.github_check_pull_request import GithubCheckPullRequest as GithubCheckPullRequest
-from discord_client.models.github_check_run import GithubCheckRun as GithubCheckRun
-from discord_client.models.github_check_run_output import GithubCheckRunOutput as GithubCheckRunOutput
-from discord_client.models.github_check_suite import GithubCheckSuite as GithubCheckSuite
-from discord_client.models.github_comment import GithubComment as GithubComment
-from discord_client.models.github_commit import GithubCommit as GithubCommit
-from discord_client.models.github_discussion import GithubDiscussion as GithubDiscussion
-from discord_client.models.github_issue import GithubIssue as GithubIssue
-from discord_client.models.github_release import GithubRelease as GithubRelease
-from discord_client.models.github_repository import GithubRepository as GithubRepository
-from discord_client.models.github_review import GithubReview as GithubReview
-from discord_client.models.github_user import GithubUser as GithubUser
-from discord_client.models.github_webhook import GithubWebhook as GithubWebhook
-from discord_client.models.group_dm_invite_response import GroupDMInviteResponse as GroupDMInviteResponse
-from discord_client.models.guild_audit_log_response import GuildAuditLogResponse as GuildAuditLogResponse
-from discord_client.models.guild_audit_log_response_integrations_inner import GuildAuditLogResponseIntegrationsInner as GuildAuditLogResponseIntegrationsInner
-from discord_client.models.guild_ban_response import GuildBanResponse as GuildBanResponse
-from discord_client.models.guild_channel_location import GuildChannelLocation as GuildChannelLocation
-from discord_client.models.guild_channel_response import GuildChannelResponse as GuildChannelResponse
-from discord_client.models.guild_home_settings_response import GuildHomeSettingsResponse as GuildHomeSettingsResponse
-from discord_client.models.guild_incoming_webhook_response import GuildIncomingWebhookResponse as GuildIncomingWebhookResponse
-from discord_client.models.guild_invite_response import GuildInviteResponse as GuildInviteResponse
-from discord_client.models.guild_member_response import GuildMemberResponse as GuildMemberResponse
-from discord_client.models.guild_onboarding_response import GuildOnboardingResponse as GuildOnboardingResponse
-from discord_client.models.guild_patch_request_partial import GuildPatchRequestPartial as GuildPatchRequestPartial
-from discord_client.models.guild_preview_response import GuildPreviewResponse as GuildPreviewResponse
-from discord_client.models.guild_product_purchase_response import GuildProductPurchaseResponse as GuildProductPurchaseResponse
-from discord_client.models.guild_prune_response import GuildPruneResponse as GuildPruneResponse
-from discord_client.models.guild_response import GuildResponse as GuildResponse
-from discord_client.models.guild_role_colors_response import GuildRoleColorsResponse as GuildRoleColorsResponse
-from discord_client.models.guild_role_response import GuildRoleResponse as GuildRoleResponse
-from discord_client.models.guild_role_tags_response import GuildRoleTagsResponse as GuildRoleTagsResponse
-from discord_client.models.guild_sticker_response import GuildStickerResponse as GuildStickerResponse
-from discord_client.models.guild_subscription_integration_response import GuildSubscriptionIntegrationResponse as GuildSubscriptionIntegrationResponse
-from discord_client.models.guild_template_channel_response import GuildTemplateChannelResponse as GuildTemplateChannelResponse
-from discord_client.models.guild_template_channel_tags import GuildTemplateChannelTags as GuildTemplateChannelTags
-from discord_client.models.guild_template_response import GuildTemplateResponse as GuildTemplateResponse
-from discord_client.models.guild_template_role_colors_response import GuildTemplateRoleColorsResponse as GuildTemplateRoleColorsResponse
-from discord_client.models.guild_template_role_response import GuildTemplateRoleResponse as GuildTemplateRoleResponse
-from discord_client.models.guild_template_snapshot_response import GuildTemplateSnapshotResponse as GuildTemplateSnapshotResponse
-from discord_client.models.guild_welcome_channel import GuildWelcomeChannel as GuildWelcomeChannel
-from discord_client.models.guild_welcome_screen_channel_response import GuildWelcomeScreenChannelResponse as GuildWelcomeScreenChannelResponse
-from discord_client.models.guild_welcome_screen_response import GuildWelcomeScreenResponse as GuildWelcomeScreenResponse
-from discord_client.models.guild_with_counts_response import GuildWithCountsResponse as GuildWithCountsResponse
-from discord_client.models.incoming_webhook_interaction_request import IncomingWebhookInteractionRequest as IncomingWebhookInteractionRequest
-from discord_client.models.incoming_webhook_request_partial import IncomingWebhookRequestPartial as IncomingWebhookRequestPartial
-from discord_client.models.incoming_webhook_update_for_interaction_callback_request_partial import IncomingWebhookUpdateForInteractionCallbackRequestPartial as IncomingWebhookUpdateForInteractionCallbackRequestPartial
-from discord_client.models.incoming_webhook_update_request_partial import IncomingWebhookUpdateRequestPartial as IncomingWebhookUpdateRequestPartial
-from discord_client.models.inner_errors import InnerErrors as InnerErrors
-from discord_client.models.integration_application_response import IntegrationApplicationResponse as IntegrationApplicationResponse
-from discord_client.models.interaction_application_command_autocomplete_callback_integer_data import InteractionApplicationCommandAutocompleteCallbackIntegerData as InteractionApplicationCommandAutocompleteCallbackIntegerData
-from discord_client.models.interaction_application_command_autocomplete_callback_number_data import InteractionApplicationCommandAutocompleteCallbackNumberData as InteractionApplicationCommandAutocompleteCallbackNumberData
-from discord_client.models.interaction_application_command_autocomplete_callback_string_data import InteractionApplicationCommandAutocompleteCallbackStringData as InteractionApplicationCommandAutocompleteCallbackStringData
-from discord_client.models.interaction_callback_response import InteractionCallbackResponse as InteractionCallbackResponse
-from discord_client.models.interaction_callback_response_resource import InteractionCallbackResponseResource as InteractionCallbackResponseResource
-from discord_client.models.interaction_response import InteractionResponse as InteractionResponse
-from discord_client.models.invite_application_response import InviteApplicationResponse as InviteApplicationResponse
-from discord_client.models.invite_channel_recipient_response import InviteChannelRecipientResponse as InviteChannelRecipientResponse
-from discord_client.models.invite_channel_response import InviteChannelResponse as InviteChannelResponse
-from discord_client.models.invite_guild_response import InviteGuildResponse as InviteGuildResponse
-from discord_client.models.keyword_rule_response import KeywordRuleResponse as KeywordRuleResponse
-from discord_client.models.keyword_trigger_metadata import KeywordTriggerMetadata as KeywordTriggerMetadata
-from discord_client.models.keyword_trigger_metadata_response import KeywordTriggerMetadataResponse as KeywordTriggerMetadataResponse
-from discord_client.models.keyword_upsert_request import KeywordUpsertRequest as KeywordUpsertRequest
-from discord_client.models.keyword_upsert_request_partial import KeywordUpsertRequestPartial as KeywordUpsertRequestPartial
-from discord_client.models.label_component_for_modal_request import LabelComponentForModalRequest as LabelComponentForModalRequest
-from discord_client.models.label_component_for_modal_request_component import LabelComponentForModalRequestComponent as LabelComponentForModalRequestComponent
-from discord_client.models.launch_activity_interaction_callback_request import LaunchActivityInteractionCallbackRequest as LaunchActivityInteractionCallbackRequest
-from discord_client.models.launch_activity_interaction_callback_response import LaunchActivityInteractionCallbackResponse as LaunchActivityInteractionCallbackResponse
-from discord_client.models.list_application_emojis_response import ListApplicationEmojisResponse as ListApplicationEmojisResponse
-from discord_client.models.list_auto_moderation_rules200_response_inner import ListAutoModerationRules200ResponseInner as ListAutoModerationRules200ResponseInner
-from discord_client.models.list_channel_invites200_response_inner import ListChannelInvites200ResponseInner as ListChannelInvites200ResponseInner
-from discord_client.models.list_channel_webhooks200_response_inner import ListChannelWebhooks200ResponseInner as ListChannelWebhooks200ResponseInner
-from discord_client.models.list_guild_integrations200_response_inner import ListGuildIntegrations200ResponseInner as ListGuildIntegrations200ResponseInner
-from discord_client.models.list_guild_scheduled_events200_response_inner import ListGuildScheduledEvents200ResponseInner as ListGuildScheduledEvents200ResponseInner
-from discord_client.models.list_guild_soundboard_sounds_response import ListGuildSoundboardSoundsResponse as ListGuildSoundboardSoundsResponse
-from discord_client.models.lobby_guild_invite_response import LobbyGuildInviteResponse as LobbyGuildInviteResponse
-from discord_client.models.lobby_member_request import LobbyMemberRequest as LobbyMemberRequest
-from discord_client.models.lobby_member_response import LobbyMemberResponse as LobbyMemberResponse
-from discord_client.models.lobby_message_response import LobbyMessageResponse as LobbyMessageResponse
-from discord_client.models.lobby_response import LobbyResponse as LobbyResponse
-from discord_client.models.ml_spam_rule_response import MLSpamRuleResponse as MLSpamRuleResponse
-from discord_client.models.ml_spam_upsert_request import MLSpamUpsertRequest as MLSpamUpsertRequest
-from discord_client.models.ml_spam_upsert_request_partial import MLSpamUpsertRequestPartial as MLSpamUpsertRequestPartial
-from discord_client.models.media_gallery_component_for_message_request import MediaGalleryComponentForMessageRequest as MediaGalleryComponentForMessageRequest
-from discord_client.models.media_gallery_component_response import MediaGalleryComponentResponse as MediaGalleryComponentResponse
-from discord_client.models.media_gallery_item_request import MediaGalleryItemRequest as MediaGalleryItemRequest
-from discord_client.models.media_gallery_item_response import MediaGalleryItemResponse as MediaGalleryItemResponse
-from discord_client.models.mention_spam_rule_response import MentionSpamRuleResponse as MentionSpamRuleResponse
-from discord_client.models.mention_spam_trigger_metadata import MentionSpamTriggerMetadata as MentionSpamTriggerMetadata
-from discord_client.models.mention_spam_trigger_metadata_response import MentionSpamTriggerMetadataResponse as MentionSpamTriggerMetadataResponse
-from discord_client.models.mention_spam_upsert_request import MentionSpamUpsertRequest as MentionSpamUpsertRequest
-from discord_client.models.mention_spam_upsert_request_partial import MentionSpamUpsertRequestPartial as MentionSpamUpsertRequestPartial
-from discord_client.models.mentionable_select_component_for_message_request import MentionableSelectComponentForMessageRequest as MentionableSelectComponentForMessageRequest
-from discord_client.models.mentionable_select_component_for_message_request_default_values_inner import MentionableSelectComponentForMessageRequestDefaultValuesInner as MentionableSelectComponentForMessageRequestDefaultValuesInner
-from discord_client.models.mentionable_select_component_for_modal_request import MentionableSelectComponentForModalRequest as MentionableSelectComponentForModalRequest
-from discord_client.models.mentionable_select_component_response import MentionableSelectComponentResponse as MentionableSelectComponentResponse
-from discord_client.models.mentionable_select_component_response_default_values_inner import MentionableSelectComponentResponseDefaultValuesInner as MentionableSelectComponentResponseDefaultValuesInner
-from discord_client.models.message_allowed_mentions_request import MessageAllowedMentionsRequest as MessageAllowedMentionsRequest
-from discord_client.models.message_attachment_request import MessageAttachmentRequest as MessageAttachmentRequest
-from discord_client.models.message_attachment_response import MessageAttachmentResponse as MessageAttachmentResponse
-from discord_client.models.message_call_response import MessageCallResponse as MessageCallResponse
-from discord_client.models.message_component_interaction_metadata_response import MessageComponentInteractionMetadataResponse as MessageComponentInteractionMetadataResponse
-from discord_client.models.message_create_request import MessageCreateRequest as MessageCreateRequest
-from discord_client.models.message_edit_request_partial import MessageEditRequestPartial as MessageEditRequestPartial
-from discord_client.models.message_embed_author_response import MessageEmbedAuthorResponse as MessageEmbedAuthorResponse
-from discord_client.models.message_embed_field_response import MessageEmbedFieldResponse as MessageEmbedFieldResponse
-from discord_client.models.message_embed_footer_response import MessageEmbedFooterResponse as MessageEmbedFooterResponse
-from discord_client.models.message_embed_image_response import MessageEmbedImageResponse as MessageEmbedImageResponse
-from discord_client.models.message_embed_provider_response import MessageEmbedProviderResponse as MessageEmbedProviderResponse
-from discord_client.models.message_embed_response import MessageEmbedResponse as MessageEmbedResponse
-from discord_client.models.message_embed_video_response import MessageEmbedVideoResponse as MessageEmbedVideoResponse
-from discord_client.models.message_interaction_response import MessageInteractionResponse as MessageInteractionResponse
-from discord_client.models.message_mention_channel_response import MessageMentionChannelResponse as MessageMentionChannelResponse
-from discord_client.models.message_reaction_count_details_response import MessageReactionCountDetailsResponse as MessageReactionCountDetailsResponse
-from discord_client.models.message_reaction_emoji_response import MessageReactionEmojiResponse as MessageReactionEmojiResponse
-from discord_client.models.message_reaction_response import MessageReactionResponse as MessageReactionResponse
-from discord_client.models.message_reference_request import MessageReferenceRequest as MessageReferenceRequest
-from discord_client.models.message_reference_response import MessageReferenceResponse as MessageReferenceResponse
-from discord_client.models.message_response import MessageResponse as MessageResponse
-from discord_client.models.message_role_subscription_data_response import MessageRoleSubscriptionDataResponse as MessageRoleSubscriptionDataResponse
-from discord_client.models.message_snapshot_response import MessageSnapshotResponse as MessageSnapshotResponse
-from discord_client.models.message_sticker_item_response import MessageStickerItemResponse as MessageStickerItemResponse
-from discord_client.models.minimal_content_message_response import MinimalContentMessageResponse as MinimalContentMessageResponse
-from discord_client.models.modal_interaction_callback_request import ModalInteractionCallbackRequest as ModalInteractionCallbackRequest
-from discord_client.models.modal_interaction_callback_request_data import ModalInteractionCallbackRequestData as ModalInteractionCallbackRequestData
-from discord_client.models.modal_interaction_callback_request_data_components_inner import ModalInteractionCallbackRequestDataComponentsInner as ModalInteractionCallbackRequestDataComponentsInner
-from discord_client.models.modal_submit_interaction_metadata_response import ModalSubmitInteractionMetadataResponse as ModalSubmitInteractionMetadataResponse
-from discord_client.models.modal_submit_interaction_metadata_response_triggering_interaction_metadata import ModalSubmitInteractionMetadataResponseTriggeringInteractionMetadata as ModalSubmitInteractionMetadataResponseTriggeringInteractionMetadata
-from discord_client.models.my_guild_response import MyGuildResponse as MyGuildResponse
-from discord_client.models.new_member_action_response import NewMemberActionResponse as NewMemberActionResponse
-from discord_client.models.o_auth2_get_authorization_response import OAuth2GetAuthorizationResponse as OAuth2GetAuthorizationResponse
-from discord_client.models.o_auth2_get_keys import OAuth2GetKeys as OAuth2GetKeys
-from discord_client.models.o_auth2_get_open_id_connect_user_info_response import OAuth2GetOpenIDConnectUserInfoResponse as OAuth2GetOpenIDConnectUserInfoResponse
-from discord_client.models.o_auth2_key import OAuth2Key as OAuth2Key
-from discord_client.models.onboarding_prompt_option_request import OnboardingPromptOptionRequest as OnboardingPromptOptionRequest
-from discord_client.models.onboarding_prompt_option_response import OnboardingPromptOptionResponse as OnboardingPromptOptionResponse
-from discord_client.models.onboarding_prompt_response import OnboardingPromptResponse as OnboardingPromptResponse
-from discord_client.models.partial_discord_integration_response import PartialDiscordIntegrationResponse as PartialDiscordIntegrationResponse
-from discord_client.models.partial_external_connection_integration_response import PartialExternalConnectionIntegrationResponse as PartialExternalConnectionIntegrationResponse
-from discord_client.models.partial_guild_subscription_integration_response import PartialGuildSubscriptionIntegrationResponse as PartialGuildSubscriptionIntegrationResponse
-from discord_client.models.partner_sdk_unmerge_provisional_account_request import PartnerSdkUnmergeProvisionalAccountRequest as PartnerSdkUnmergeProvisionalAccountRequest
-from discord_client.models.pinned_message_response import PinnedMessageResponse as PinnedMessageResponse
-from discord_client.models.pinned_messages_response import PinnedMessagesResponse as PinnedMessagesResponse
-from discord_client.models.poll_answer_create_request import PollAnswerCreateRequest as PollAnswerCreateRequest
-from discord_client.models.poll_answer_details_response import PollAnswerDetailsResponse as PollAnswerDetailsResponse
-from discord_client.models.poll_answer_response import PollAnswerResponse as PollAnswerResponse
-from discord_client.models.poll_create_request import PollCreateRequest as PollCreateRequest
-from discord_client.models.poll_emoji import PollEmoji as PollEmoji
-from discord_client.models.poll_emoji_create_request import PollEmojiCreateRequest as PollEmojiCreateRequest
-from discord_client.models.poll_media import PollMedia as PollMedia
-from discord_client.models.poll_media_create_request import PollMediaCreateRequest as PollMediaCreateRequest
-from discord_client.models.poll_media_response import PollMediaResponse as PollMediaResponse
-from discord_client.models.poll_response import PollResponse as PollResponse
-from discord_client.models.poll_results_entry_response import PollResultsEntryResponse as PollResultsEntryResponse
-from discord_client.models.poll_results_response import PollResultsResponse as PollResultsResponse
-from discord_client.models.pong_interaction_callback_request import PongInteractionCallbackRequest as PongInteractionCallbackRequest
-from discord_client.models.private_application_response import PrivateApplicationResponse as PrivateApplicationResponse
-from discord_client.models.private_channel_location import PrivateChannelLocation as PrivateChannelLocation
-from discord_client.models.private_channel_response import PrivateChannelResponse as PrivateChannelResponse
-from discord_client.models.private_group_channel_response import PrivateGroupChannelResponse as PrivateGroupChannelResponse
-from discord_client.models.private_guild_member_response import PrivateGuildMemberResponse as PrivateGuildMemberResponse
-from discord_client.models.provisional_token_response import ProvisionalTokenResponse as ProvisionalTokenResponse
-from discord_client.models.prune_guild_request import PruneGuildRequest as PruneGuildRequest
-from discord_client.models.prune_guild_request_include_roles import PruneGuildRequestIncludeRoles as PruneGuildRequestIncludeRoles
-from discord_client.models.purchase_notification_response import PurchaseNotificationResponse as PurchaseNotificationResponse
-from discord_client.models.quarantine_user_action import QuarantineUserAction as QuarantineUserAction
-from discord_client.models.quarantine_user_action_response import QuarantineUserActionResponse as QuarantineUserActionResponse
-from discord_client.models.ratelimited_response import RatelimitedResponse as RatelimitedResponse
-from discord_client.models.resolved_objects_response import ResolvedObjectsResponse as ResolvedObjectsResponse
-from discord_client.models.resource_channel_response import ResourceChannelResponse as ResourceChannelResponse
-from discord_client.models.rich_embed import RichEmbed as RichEmbed
-from discord_client.models.rich_embed_author import RichEmbedAuthor as RichEmbedAuthor
-from discord_client.models.rich_embed_field import RichEmbedField as RichEmbedField
-from discord_client.models.rich_embed_footer import RichEmbedFooter as RichEmbedFooter
-from discord_client.models.rich_embed_image import RichEmbedImage as RichEmbedImage
-from discord_client.models.rich_embed_provider import RichEmbedProvider as RichEmbedProvider
-from discord_client.models.rich_embed_thumbnail import RichEmbedThumbnail as RichEmbedThumbnail
-from discord_client.models.rich_embed_video import RichEmbedVideo as RichEmbedVideo
-from discord_client.models.role_select_component_for_message_request import RoleSelectComponentForMessageRequest as RoleSelectComponentForMessageRequest
-from discord_client.models.role_select_component_for_modal_request import RoleSelectComponentForModalRequest as RoleSelectComponentForModalRequest
-from discord_client.models.role_select_component_response import RoleSelectComponentResponse as RoleSelectComponentResponse
-from discord_client.models.role_select_default_value import RoleSelectDefaultValue as RoleSelectDefaultValue
-from discord_client.models.role_select_default_value_response import RoleSelectDefaultValueResponse as RoleSelectDefaultValueResponse
-from discord_client.models.sdk_message_request import SDKMessageRequest as SDKMessageRequest
-from discord_client.models.scheduled_event_response import ScheduledEventResponse as ScheduledEventResponse
-from discord_client.models.scheduled_event_user_response import ScheduledEventUserResponse as ScheduledEventUserResponse
-from discord_client.models.section_component_for_message_request import SectionComponentForMessageRequest as SectionComponentForMessageRequest
-from discord_client.models.section_component_for_message_request_accessory import SectionComponentForMessageRequestAccessory as SectionComponentForMessageRequestAccessory
-from discord_client.models.section_component_response import SectionComponentResponse as SectionComponentResponse
-from discord_client.models.section_component_response_accessory import SectionComponentResponseAccessory as SectionComponentResponseAccessory
-from discord_client.models.separator_component_for_message_request import SeparatorComponentForMessageRequest as SeparatorComponentForMessageRequest
-from discord_client.models.separator_component_response import SeparatorComponentResponse as SeparatorComponentResponse
-from discord_client.models.set_channel_permission_overwrite_request import SetChannelPermissionOverwriteRequest as SetChannelPermissionOverwriteRequest
-from discord_client.models.set_guild_application_command_permissions_request import SetGuildApplicationCommandPermissionsRequest as SetGuildApplicationCommandPermissionsRequest
-from discord_client.models.settings_emoji_response import SettingsEmojiResponse as SettingsEmojiResponse
-from discord_client.models.slack_webhook import SlackWebhook as SlackWebhook
-from discord_client.models.soundboard_create_request import SoundboardCreateRequest as SoundboardCreateRequest
-from discord_client.models.soundboard_patch_request_partial import SoundboardPatchRequestPartial as SoundboardPatchRequestPartial
-from discord_client.models.soundboard_sound_response import SoundboardSoundResponse as SoundboardSoundResponse
-from discord_client.models.soundboard_sound_send_request import SoundboardSoundSendRequest as SoundboardSoundSendRequest
-from discord_client.models.spam_link_rule_response import SpamLinkRuleResponse as SpamLinkRuleResponse
-from discord_client.models.stage_instance_response import StageInstanceResponse as StageInstanceResponse
-from discord_client.models.stage_scheduled_event_create_request import StageScheduledEventCreateRequest as StageScheduledEventCreateRequest
-from discord_client.models.stage_scheduled_event_patch_request_partial import StageScheduledEventPatchRequestPartial as StageScheduledEventPatchRequestPartial
-from discord_client.models.stage_scheduled_event_response import StageScheduledEventResponse as StageScheduledEventResponse
-from discord_client.models.standard_sticker_response import StandardStickerResponse as StandardStickerResponse
-from discord_client.models.sticker_pack_collection_response import StickerPackCollectionResponse as StickerPackCollectionResponse
-from discord_client.models.sticker_pack_response import StickerPackResponse as StickerPackResponse
-from discord_client.models.string_select_component_for_message_request import StringSelectComponentForMessageRequest as StringSelectComponentForMessageRequest
-from discord_client.models.string_select_component_for_modal_request import StringSelectComponentForModalRequest as StringSelectComponentForModalRequest
-from discord_client.models.string_select_component_response import StringSelectComponentResponse as StringSelectComponentResponse
-from discord_client.models.string_select_option_for_request import StringSelectOptionForRequest as StringSelectOptionForRequest
-from discord_client.models.string_select_option_response import StringSelectOptionResponse as StringSelectOptionResponse
-from discord_client.models.team_member_response import TeamMemberResponse as TeamMemberResponse
-from discord_client.models.team_response import TeamResponse as TeamResponse
-from discord_client.models.text_display_component_for_message_request import TextDisplayComponentForMessageRequest as TextDisplayComponentForMessageRequest
-from discord_client.models.text_display_component_for_modal_request import TextDisplayComponentForModalRequest as TextDisplayComponentForModalRequest
-from discord_client.models.text_display_component_response import TextDisplayComponentResponse as TextDisplayComponentResponse
-from discord_client.models.text_input_component_for_modal_request import TextInputComponentForModalRequest as TextInputComponentForModalRequest
-from discord_client.models.text_input_component_response import TextInputComponentResponse as TextInputComponentResponse
-from discord_client.models.thread_member_response import ThreadMemberResponse as ThreadMemberResponse
-from discord_client.models.thread_metadata_response import ThreadMetadataResponse as ThreadMetadataResponse
-from discord_client.models.thread_response import ThreadResponse as ThreadResponse
-from discord_client.models.thread_search_response import ThreadSearchResponse as ThreadSearchResponse
-from discord_client.models.thread_search_tag_parameter import ThreadSearchTagParameter as ThreadSearchTagParameter
-from discord_client.models.threads_response import ThreadsResponse as ThreadsResponse
-from discord_client.models.thumbnail_component_for_message_request import ThumbnailComponentForMessageRequest as ThumbnailComponentForMessageRequest
-from discord_client.models.thumbnail_component_response import ThumbnailComponentResponse as ThumbnailComponentResponse
-from discord_client.models.unfurled_media_request import UnfurledMediaRequest as UnfurledMediaRequest
-from discord_client.models.unfurled_media_request_with_attachment_reference_required import UnfurledMediaRequestWithAttachmentReferenceRequired as UnfurledMediaRequestWithAttachmentReferenceRequired
-from discord_client.models.unfurled_media_response import UnfurledMediaResponse as UnfurledMediaResponse
-from discord_client.models.update_application_emoji_request import UpdateApplicationEmojiRequest as UpdateApplicationEmojiRequest
-from discord_client.models.update_application_user_role_connection_request import UpdateApplicationUserRoleConnectionRequest as UpdateApplicationUserRoleConnectionRequest
-from discord_client.models.update_auto_moderation_rule_request import UpdateAutoModerationRuleRequest as UpdateAutoModerationRuleRequest
-from discord_client.models.update_channel_request import UpdateChannelRequest as UpdateChannelRequest
-from discord_client.models.update_dm_request_partial import UpdateDMRequestPartial as UpdateDMRequestPartial
-from discord_client.models.update_default_reaction_emoji_request import UpdateDefaultReactionEmojiRequest as UpdateDefaultReactionEmojiRequest
-from discord_client.models.update_group_dm_request_partial import UpdateGroupDMRequestPartial as UpdateGroupDMRequestPartial
-from discord_client.models.update_guild_channel_request_partial import UpdateGuildChannelRequestPartial as UpdateGuildChannelRequestPartial
-from discord_client.models.update_guild_emoji_request import UpdateGuildEmojiRequest as UpdateGuildEmojiRequest
-from discord_client.models.update_guild_member_request import UpdateGuildMemberRequest as UpdateGuildMemberRequest
-from discord_client.models.update_guild_onboarding_request import UpdateGuildOnboardingRequest as UpdateGuildOnboardingRequest
-from discord_client.models.update_guild_scheduled_event_request import UpdateGuildScheduledEventRequest as UpdateGuildScheduledEventRequest
-from discord_client.models.update_guild_sticker_request import UpdateGuildStickerRequest as UpdateGuildStickerRequest
-from discord_client.models.update_guild_template_request import UpdateGuildTemplateRequest as UpdateGuildTemplateRequest
-from discord_client.models.update_guild_widget_settings_request import UpdateGuildWidgetSettingsRequest as UpdateGuildWidgetSettingsRequest
-from discord_client.models.update_message_interaction_callback_request import UpdateMessageInteractionCallbackRequest as UpdateMessageInteractionCallbackRequest
-from discord_client.models.update_message_interaction_callback_response import UpdateMessageInteractionCallbackResponse as UpdateMessageInteractionCallbackResponse
-from discord_client.models.update_my_guild_member_request import UpdateMyGuildMemberRequest as UpdateMyGuildMemberRequest
-from discord_client.models.update_onboarding_prompt_request import UpdateOnboardingPromptRequest as UpdateOnboardingPromptRequest
-from discord_client.models.update_role_positions_request import UpdateRolePositionsRequest as UpdateRolePositionsRequest
-from discord_client.models.update_role_request_partial import UpdateRoleRequestPartial as UpdateRoleRequestPartial
-from discord_client.models.update_self_voice_state_request_partial import UpdateSelfVoiceStateRequestPartial as UpdateSelfVoiceStateRequestPartial
-from discord_client.models.update_stage_instance_request import UpdateStageInstanceRequest as UpdateStageInstanceRequest
-from discord_client.models.update_thread_request_partial import UpdateThreadRequestPartial as UpdateThreadRequestPartial
-from discord_client.models.update_thread_tag_request import UpdateThreadTagRequest as UpdateThreadTagRequest
-from discord_client.models.update_voice_state_request_partial import UpdateVoiceStateRequestPartial as UpdateVoiceStateRequestPartial
-from discord_client.models.update_webhook_by_token_request import UpdateWebhookByTokenRequest as UpdateWebhookByTokenRequest
-from discord_client.models.update_webhook_request import UpdateWebhookRequest as UpdateWebhookRequest
-from discord_client.models.user_avatar_decoration_response import UserAvatarDecorationResponse as UserAvatarDecorationResponse
-from discord_client.models.user_collectibles_response import UserCollectiblesResponse as UserCollectiblesResponse
-from discord_client.models.user_communication_disabled_action import UserCommunicationDisabledAction as UserCommunicationDisabledAction
-from discord_client.models.user_communication_disabled_action_metadata import UserCommunicationDisabledActionMetadata as UserCommunicationDisabledActionMetadata
-from discord_client.models.user_communication_disabled_action_metadata_response import UserCommunicationDisabledActionMetadataResponse as UserCommunicationDisabledActionMetadataResponse
-from discord_client.models.user_communication_disabled_action_response import UserCommunicationDisabledActionResponse as UserCommunicationDisabledActionResponse
-from discord_client.models.user_guild_onboarding_response import UserGuildOnboardingResponse as UserGuildOnboardingResponse
-from discord_client.models.user_nameplate_response import UserNameplateResponse as UserNameplateResponse
-from discord_client.models.user_pii_response import UserPIIResponse as UserPIIResponse
-from discord_client.models.user_primary_guild_response import UserPrimaryGuildResponse as UserPrimaryGuildResponse
-from discord_client.models.user_response import UserResponse as UserResponse
-from discord_client.models.user_select_component_for_message_request import UserSelectComponentForMessageRequest as UserSelectComponentForMessageRequest
-from discord_client.models.user_select_component_for_modal_request import UserSelectComponentForModalRequest as UserSelectComponentForModalRequest
-from discord_client.models.user_select_component_response import UserSelectComponentResponse as UserSelectComponentResponse
-from discord_client.models.user_select_default_value import UserSelectDefaultValue as UserSelectDefaultValue
-from discord_client.models.user_select_default_value_response import UserSelectDefaultValueResponse as UserSelectDefaultValueResponse
-from discord_client.models.vanity_url_error_response import VanityURLErrorResponse as VanityURLErrorResponse
-from discord_client.models.vanity_url_response import VanityURLResponse as VanityURLResponse
-from discord_client.models.voice_region_response import VoiceRegionResponse as VoiceRegionResponse
-from discord_client.models.voice_scheduled_event_create_request import VoiceScheduledEventCreateRequest as VoiceScheduledEventCreateRequest
-from discord_client.models.voice_scheduled_event_patch_request_partial import VoiceScheduledEventPatchRequestPartial as VoiceScheduledEventPatchRequestPartial
-from discord_client.models.voice_scheduled_event_response import VoiceScheduledEventResponse as VoiceScheduledEventResponse
-from discord_client.models.voice_state_response import VoiceStateResponse as VoiceStateResponse
-from discord_client.models.webhook_slack_embed import WebhookSlackEmbed as WebhookSlackEmbed
-from discord_client.models.webhook_slack_embed_field import WebhookSlackEmbedField as WebhookSlackEmbedField
-from discord_client.models.webhook_source_channel_response import WebhookSourceChannelResponse as WebhookSourceChannelResponse
-from discord_client.models.webhook_source_guild_response import WebhookSourceGuildResponse as WebhookSourceGuildResponse
-from discord_client.models.welcome_message_response import WelcomeMessageResponse as WelcomeMessageResponse
-from discord_client.models.welcome_screen_patch_request_partial import WelcomeScreenPatchRequestPartial as WelcomeScreenPatchRequestPartial
-from discord_client.models.widget_activity import WidgetActivity as WidgetActivity
-from discord_client.models.widget_channel import WidgetChannel as WidgetChannel
-from discord_client.models.widget_member import WidgetMember as WidgetMember
-from discord_client.models.widget_response import WidgetResponse as WidgetResponse
-from discord_client.models.widget_settings_response import WidgetSettingsResponse as WidgetSettingsResponse
+if TYPE_CHECKING:
+    from discord_client.models.account_response import AccountResponse as AccountResponse
+    from discord_client.models.action_row_component_for_message_request import ActionRowComponentForMessageRequest as ActionRowComponentForMessageRequest
+    from discord_client.models.action_row_component_for_message_request_components_inner import ActionRowComponentForMessageRequestComponentsInner as ActionRowComponentForMessageRequestComponentsInner
+    from discord_client.models.action_row_component_for_modal_request import ActionRowComponentForModalRequest as ActionRowComponentForModalRequest
+    from discord_client.models.action_row_component_response import ActionRowComponentResponse as ActionRowComponentResponse
+    from discord_client.models.action_row_component_response_components_inner import ActionRowComponentResponseComponentsInner as ActionRowComponentResponseComponentsInner
+    from discord_client.models.activities_attachment_response import ActivitiesAttachmentResponse as ActivitiesAttachmentResponse
+    from discord_client.models.add_group_dm_user201_response import AddGroupDmUser201Response as AddGroupDmUser201Response
+    from discord_client.models.add_group_dm_user_request import AddGroupDmUserRequest as AddGroupDmUserRequest
+    from discord_client.models.add_lobby_member_request import AddLobbyMemberRequest as AddLobbyMemberRequest
+    from discord_client.models.application_command_attachment_option import ApplicationCommandAttachmentOption as ApplicationCommandAttachmentOption
+    from discord_client.models.application_command_attachment_option_response import ApplicationCommandAttachmentOptionResponse as ApplicationCommandAttachmentOptionResponse
+    from discord_client.models.application_command_autocomplete_callback_request import ApplicationCommandAutocompleteCallbackRequest as ApplicationCommandAutocompleteCallbackRequest
+    from discord_client.models.application_command_autocomplete_callback_request_data import ApplicationCommandAutocompleteCallbackRequestData as ApplicationCommandAutocompleteCallbackRequestData
+    from discord_client.models.application_command_boolean_option import ApplicationCommandBooleanOption as ApplicationCommandBooleanOption
+    from discord_client.models.application_command_boolean_option_response import ApplicationCommandBooleanOptionResponse as ApplicationCommandBooleanOptionResponse
+    from discord_client.models.application_command_channel_option import ApplicationCommandChannelOption as ApplicationCommandChannelOption
+    from discord_client.models.application_command_channel_option_response import ApplicationCommandChannelOptionResponse as ApplicationCommandChannelOptionResponse
+    from discord_client.models.application_command_create_request import ApplicationCommandCreateRequest as ApplicationCommandCreateRequest
+    from discord_client.models.application_command_create_request_options_inner import ApplicationCommandCreateRequestOptionsInner as ApplicationCommandCreateRequestOptionsInner
+    from discord_client.models.application_command_integer_option import ApplicationCommandIntegerOption as ApplicationCommandIntegerOption
+    from discord_client.models.application_command_integer_option_response import ApplicationCommandIntegerOptionResponse as ApplicationCommandIntegerOptionResponse
+    from discord_client.models.application_command_interaction_metadata_response import ApplicationCommandInteractionMetadataResponse as ApplicationCommandInteractionMetadataResponse
+    from discord_client.models.application_command_mentionable_option import ApplicationCommandMentionableOption as ApplicationCommandMentionableOption
+    from discord_client.models.application_command_mentionable_option_response import ApplicationCommandMentionableOptionResponse as ApplicationCommandMentionableOptionResponse
+    from discord_client.models.application_command_number_option import ApplicationCommandNumberOption as ApplicationCommandNumberOption
+    from discord_client.models.application_command_number_option_response import ApplicationCommandNumberOptionResponse as ApplicationCommandNumberOptionResponse
+    from discord_client.models.application_command_option_integer_choice import ApplicationCommandOptionIntegerChoice as ApplicationCommandOptionIntegerChoice
+    from discord_client.models.application_command_option_integer_choice_response import ApplicationCommandOptionIntegerChoiceResponse as ApplicationCommandOptionIntegerChoiceResponse
+    from discord_client.models.application_command_option_number_choice import ApplicationCommandOptionNumberChoice as ApplicationCommandOptionNumberChoice
+    from discord_client.models.application_command_option_number_choice_response import ApplicationCommandOptionNumberChoiceResponse as ApplicationCommandOptionNumberChoiceResponse
+    from discord_client.models.application_command_option_string_choice import ApplicationCommandOptionStringChoice as ApplicationCommandOptionStringChoice
+    from discord_client.models.application_command_option_string_choice_response import ApplicationCommandOptionStringChoiceResponse as ApplicationCommandOptionStringChoiceResponse
+    from discord_client.models.application_command_patch_request_partial import ApplicationCommandPatchRequestPartial as ApplicationCommandPatchRequestPartial
+    from discord_client.models.application_command_permission import ApplicationCommandPermission as ApplicationCommandPermission
+    from discord_client.models.application_command_response import ApplicationCommandResponse as ApplicationCommandResponse
+    from discord_client.models.application_command_response_options_inner import ApplicationCommandResponseOptionsInner as ApplicationCommandResponseOptionsInner
+    from discord_client.models.application_command_role_option import ApplicationCommandRoleOption as ApplicationCommandRoleOption
+    from discord_client.models.application_command_role_option_response import ApplicationCommandRoleOptionResponse as ApplicationCommandRoleOptionResponse
+    from discord_client.models.application_command_string_option import ApplicationCommandStringOption as ApplicationCommandStringOption
+    from discord_client.models.application_command_string_option_response import ApplicationCommandStringOptionResponse as ApplicationCommandStringOptionResponse
+    from discord_client.models.application_command_subcommand_group_option import ApplicationCommandSubcommandGroupOption as ApplicationCommandSubcommandGroupOption
+    from discord_client.models.application_command_subcommand_group_option_response import ApplicationCommandSubcommandGroupOptionResponse as ApplicationCommandSubcommandGroupOptionResponse
+    from discord_client.models.application_command_subcommand_option import ApplicationCommandSubcommandOption as ApplicationCommandSubcommandOption
+    from discord_client.models.application_command_subcommand_option_options_inner import ApplicationCommandSubcommandOptionOptionsInner as ApplicationCommandSubcommandOptionOptionsInner
+    from discord_client.models.application_command_subcommand_option_response import ApplicationCommandSubcommandOptionResponse as ApplicationCommandSubcommandOptionResponse
+    from discord_client.models.application_command_subcommand_option_response_options_inner import ApplicationCommandSubcommandOptionResponseOptionsInner as ApplicationCommandSubcommandOptionResponseOptionsInner
+    from discord_client.models.application_command_update_request import ApplicationCommandUpdateRequest as ApplicationCommandUpdateRequest
+    from discord_client.models.application_command_user_option import ApplicationCommandUserOption as ApplicationCommandUserOption
+    from discord_client.models.application_command_user_option_response import ApplicationCommandUserOptionResponse as ApplicationCommandUserOptionResponse
+    from discord_client.models.application_form_partial import ApplicationFormPartial as ApplicationFormPartial
+    from discord_client.models.application_form_partial_description import ApplicationFormPartialDescription as ApplicationFormPartialDescription
+    from discord_client.models.application_form_partial_integration_types_config_value import ApplicationFormPartialIntegrationTypesConfigValue as ApplicationFormPartialIntegrationTypesConfigValue
+    from discord_client.models.application_incoming_webhook_response import ApplicationIncomingWebhookResponse as ApplicationIncomingWebhookResponse
+    from discord_client.models.application_integration_type_configuration import ApplicationIntegrationTypeConfiguration as ApplicationIntegrationTypeConfiguration
+    from discord_client.models.application_integration_type_configuration_response import ApplicationIntegrationTypeConfigurationResponse as ApplicationIntegrationTypeConfigurationResponse
+    from discord_client.models.application_o_auth2_install_params import ApplicationOAuth2InstallParams as ApplicationOAuth2InstallParams
+    from discord_client.models.application_o_auth2_install_params_response import ApplicationOAuth2InstallParamsResponse as ApplicationOAuth2InstallParamsResponse
+    from discord_client.models.application_response import ApplicationResponse as ApplicationResponse
+    from discord_client.models.application_role_connections_metadata_item_request import ApplicationRoleConnectionsMetadataItemRequest as ApplicationRoleConnectionsMetadataItemRequest
+    from discord_client.models.application_role_connections_metadata_item_response import ApplicationRoleConnectionsMetadataItemResponse as ApplicationRoleConnectionsMetadataItemResponse
+    from discord_client.models.application_user_role_connection_response import ApplicationUserRoleConnectionResponse as ApplicationUserRoleConnectionResponse
+    from discord_client.models.attachment_response import AttachmentResponse as AttachmentResponse
+    from discord_client.models.audit_log_entry_response import AuditLogEntryResponse as AuditLogEntryResponse
+    from discord_client.models.audit_log_object_change_response import AuditLogObjectChangeResponse as AuditLogObjectChangeResponse
+    from discord_client.models.ban_user_from_guild_request import BanUserFromGuildRequest as BanUserFromGuildRequest
+    from discord_client.models.base_create_message_create_request import BaseCreateMessageCreateRequest as BaseCreateMessageCreateRequest
+    from discord_client.models.base_create_message_create_request_components_inner import BaseCreateMessageCreateRequestComponentsInner as BaseCreateMessageCreateRequestComponentsInner
+    from discord_client.models.basic_application_response import BasicApplicationResponse as BasicApplicationResponse
+    from discord_client.models.basic_guild_member_response import BasicGuildMemberResponse as BasicGuildMemberResponse
+    from discord_client.models.basic_message_response import BasicMessageResponse as BasicMessageResponse
+    from discord_client.models.basic_message_response_components_inner import BasicMessageResponseComponentsInner as BasicMessageResponseComponentsInner
+    from discord_client.models.basic_message_response_interaction_metadata import BasicMessageResponseInteractionMetadata as BasicMessageResponseInteractionMetadata
+    from discord_client.models.basic_message_response_nonce import BasicMessageResponseNonce as BasicMessageResponseNonce
+    from discord_client.models.block_message_action import BlockMessageAction as BlockMessageAction
+    from discord_client.models.block_message_action_metadata import BlockMessageActionMetadata as BlockMessageActionMetadata
+    from discord_client.models.block_message_action_metadata_response import BlockMessageActionMetadataResponse as BlockMessageActionMetadataResponse
+    from discord_client.models.block_message_action_response import BlockMessageActionResponse as BlockMessageActionResponse
+    from discord_client.models.bot_account_patch_request import BotAccountPatchRequest as BotAccountPatchRequest
+    from discord_client.models.bot_add_guild_member_request import BotAddGuildMemberRequest as BotAddGuildMemberRequest
+    from discord_client.models.bot_partner_sdk_token_request import BotPartnerSdkTokenRequest as BotPartnerSdkTokenRequest
+    from discord_client.models.bot_partner_sdk_unmerge_provisional_account_request import BotPartnerSdkUnmergeProvisionalAccountRequest as BotPartnerSdkUnmergeProvisionalAccountRequest
+    from discord_client.models.bulk_ban_users_request import BulkBanUsersRequest as BulkBanUsersRequest
+    from discord_client.models.bulk_ban_users_response import BulkBanUsersResponse as BulkBanUsersResponse
+    from discord_client.models.bulk_delete_messages_request import BulkDeleteMessagesRequest as BulkDeleteMessagesRequest
+    from discord_client.models.bulk_lobby_member_request import BulkLobbyMemberRequest as BulkLobbyMemberRequest
+    from discord_client.models.bulk_update_guild_channels_request_inner import BulkUpdateGuildChannelsRequestInner as BulkUpdateGuildChannelsRequestInner
+    from discord_client.models.button_component_for_message_request import ButtonComponentForMessageRequest as ButtonComponentForMessageRequest
+    from discord_client.models.button_component_response import ButtonComponentResponse as ButtonComponentResponse
+    from discord_client.models.channel_follower_response import ChannelFollowerResponse as ChannelFollowerResponse
+    from discord_client.models.channel_follower_webhook_response import ChannelFollowerWebhookResponse as ChannelFollowerWebhookResponse
+    from discord_client.models.channel_permission_overwrite_request import ChannelPermissionOverwriteRequest as ChannelPermissionOverwriteRequest
+    from discord_client.models.channel_permission_overwrite_response import ChannelPermissionOverwriteResponse as ChannelPermissionOverwriteResponse
+    from discord_client.models.channel_select_component_for_message_request import ChannelSelectComponentForMessageRequest as ChannelSelectComponentForMessageRequest
+    from discord_client.models.channel_select_component_for_modal_request import ChannelSelectComponentForModalRequest as ChannelSelectComponentForModalRequest
+    from discord_client.models.channel_select_component_response import ChannelSelectComponentResponse as ChannelSelectComponentResponse
+    from discord_client.models.channel_select_default_value import ChannelSelectDefaultValue as ChannelSelectDefaultValue
+    from discord_client.models.channel_select_default_value_response import ChannelSelectDefaultValueResponse as ChannelSelectDefaultValueResponse
+    from discord_client.models.command_permission_response import CommandPermissionResponse as CommandPermissionResponse
+    from discord_client.models.command_permissions_response import CommandPermissionsResponse as CommandPermissionsResponse
+    from discord_client.models.component_emoji_for_request import ComponentEmojiForRequest as ComponentEmojiForRequest
+    from discord_client.models.component_emoji_response import ComponentEmojiResponse as ComponentEmojiResponse
+    from discord_client.models.connected_account_guild_response import ConnectedAccountGuildResponse as ConnectedAccountGuildResponse
+    from discord_client.models.connected_account_integration_response import ConnectedAccountIntegrationResponse as ConnectedAccountIntegrationResponse
+    from discord_client.models.connected_account_response import ConnectedAccountResponse as ConnectedAccountResponse
+    from discord_client.models.container_component_for_message_request import ContainerComponentForMessageRequest as ContainerComponentForMessageRequest
+    from discord_client.models.container_component_for_message_request_components_inner import ContainerComponentForMessageRequestComponentsInner as ContainerComponentForMessageRequestComponentsInner
+    from discord_client.models.container_component_response import ContainerComponentResponse as ContainerComponentResponse
+    from discord_client.models.container_component_response_components_inner import ContainerComponentResponseComponentsInner as ContainerComponentResponseComponentsInner
+    from discord_client.models.create_application_emoji_request import CreateApplicationEmojiRequest as CreateApplicationEmojiRequest
+    from discord_client.models.create_auto_moderation_rule200_response import CreateAutoModerationRule200Response as CreateAutoModerationRule200Response
+    from discord_client.models.create_auto_moderation_rule_request import CreateAutoModerationRuleRequest as CreateAutoModerationRuleRequest
+    from discord_client.models.create_channel_invite200_response import CreateChannelInvite200Response as CreateChannelInvite200Response
+    from discord_client.models.create_channel_invite_request import CreateChannelInviteRequest as CreateChannelInviteRequest
+    from discord_client.models.create_entitlement_request_data import CreateEntitlementRequestData as CreateEntitlementRequestData
+    from discord_client.models.create_forum_thread_request import CreateForumThreadRequest as CreateForumThreadRequest
+    from discord_client.models.create_group_dm_invite_request import CreateGroupDMInviteRequest as CreateGroupDMInviteRequest
+    from discord_client.models.create_guild_channel_request import CreateGuildChannelRequest as CreateGuildChannelRequest
+    from discord_client.models.create_guild_emoji_request import CreateGuildEmojiRequest as CreateGuildEmojiRequest
+    from discord_client.models.create_guild_invite_request import CreateGuildInviteRequest as CreateGuildInviteRequest
+    from discord_client.models.create_guild_scheduled_event_request import CreateGuildScheduledEventRequest as CreateGuildScheduledEventRequest
+    from discord_client.models.create_guild_template_request import CreateGuildTemplateRequest as CreateGuildTemplateRequest
+    from discord_client.models.create_interaction_response_request import CreateInteractionResponseRequest as CreateInteractionResponseRequest
+    from discord_client.models.create_lobby_request import CreateLobbyRequest as CreateLobbyRequest
+    from discord_client.models.create_message_interaction_callback_request import CreateMessageInteractionCallbackRequest as CreateMessageInteractionCallbackRequest
+    from discord_client.models.create_message_interaction_callback_response import CreateMessageInteractionCallbackResponse as CreateMessageInteractionCallbackResponse
+    from discord_client.models.create_or_join_lobby_request import CreateOrJoinLobbyRequest as CreateOrJoinLobbyRequest
+    from discord_client.models.create_or_update_thread_tag_request import CreateOrUpdateThreadTagRequest as CreateOrUpdateThreadTagRequest
+    from discord_client.models.create_private_channel_request import CreatePrivateChannelRequest as CreatePrivateChannelRequest
+    from discord_client.models.create_role_request import CreateRoleRequest as CreateRoleRequest
+    from discord_client.models.create_stage_instance_request import CreateStageInstanceRequest as CreateStageInstanceRequest
+    from discord_client.models.create_text_thread_with_message_request import CreateTextThreadWithMessageRequest as CreateTextThreadWithMessageRequest
+    from discord_client.models.create_text_thread_without_message_request import CreateTextThreadWithoutMessageRequest as CreateTextThreadWithoutMessageRequest
+    from discord_client.models.create_thread_request import CreateThreadRequest as CreateThreadRequest
+    from discord_client.models.create_webhook_request import CreateWebhookRequest as CreateWebhookRequest
+    from discord_client.models.created_thread_response import CreatedThreadResponse as CreatedThreadResponse
+    from discord_client.models.custom_client_theme_response import CustomClientThemeResponse as CustomClientThemeResponse
+    from discord_client.models.custom_client_theme_share_request import CustomClientThemeShareRequest as CustomClientThemeShareRequest
+    from discord_client.models.default_keyword_list_trigger_metadata import DefaultKeywordListTriggerMetadata as DefaultKeywordListTriggerMetadata
+    from discord_client.models.default_keyword_list_trigger_metadata_response import DefaultKeywordListTriggerMetadataResponse as DefaultKeywordListTriggerMetadataResponse
+    from discord_client.models.default_keyword_list_upsert_request import DefaultKeywordListUpsertRequest as DefaultKeywordListUpsertRequest
+    from discord_client.models.default_keyword_list_upsert_request_actions_inner import DefaultKeywordListUpsertRequestActionsInner as DefaultKeywordListUpsertRequestActionsInner
+    from discord_client.models.default_keyword_list_upsert_request_partial import DefaultKeywordListUpsertRequestPartial as DefaultKeywordListUpsertRequestPartial
+    from discord_client.models.default_keyword_rule_response import DefaultKeywordRuleResponse as DefaultKeywordRuleResponse
+    from discord_client.models.default_keyword_rule_response_actions_inner import DefaultKeywordRuleResponseActionsInner as DefaultKeywordRuleResponseActionsInner
+    from discord_client.models.default_reaction_emoji_response import DefaultReactionEmojiResponse as DefaultReactionEmojiResponse
+    from discord_client.models.discord_integration_response import DiscordIntegrationResponse as DiscordIntegrationResponse
+    from discord_client.models.edit_lobby_channel_link_request import EditLobbyChannelLinkRequest as EditLobbyChannelLinkRequest
+    from discord_client.models.embedded_activity_instance import EmbeddedActivityInstance as EmbeddedActivityInstance
+    from discord_client.models.embedded_activity_instance_location import EmbeddedActivityInstanceLocation as EmbeddedActivityInstanceLocation
+    from discord_client.models.emoji_response import EmojiResponse as EmojiResponse
+    from discord_client.models.entitlement_response import EntitlementResponse as EntitlementResponse
+    from discord_client.models.entity_metadata_external import EntityMetadataExternal as EntityMetadataExternal
+    from discord_client.models.entity_metadata_external_response import EntityMetadataExternalResponse as EntityMetadataExternalResponse
+    from discord_client.models.error import Error as Error
+    from discord_client.models.error_details import ErrorDetails as ErrorDetails
+    from discord_client.models.error_response import ErrorResponse as ErrorResponse
+    from discord_client.models.execute_webhook_request import ExecuteWebhookRequest as ExecuteWebhookRequest
+    from discord_client.models.external_connection_integration_response import ExternalConnectionIntegrationResponse as ExternalConnectionIntegrationResponse
+    from discord_client.models.external_scheduled_event_create_request import ExternalScheduledEventCreateRequest as ExternalScheduledEventCreateRequest
+    from discord_client.models.external_scheduled_event_patch_request_partial import ExternalScheduledEventPatchRequestPartial as ExternalScheduledEventPatchRequestPartial
+    from discord_client.models.external_scheduled_event_response import ExternalScheduledEventResponse as ExternalScheduledEventResponse
+    from discord_client.models.file_component_for_message_request import FileComponentForMessageRequest as FileComponentForMessageRequest
+    from discord_client.models.file_component_response import FileComponentResponse as FileComponentResponse
+    from discord_client.models.file_upload_component_for_modal_request import FileUploadComponentForModalRequest as FileUploadComponentForModalRequest
+    from discord_client.models.flag_to_channel_action import FlagToChannelAction as FlagToChannelAction
+    from discord_client.models.flag_to_channel_action_metadata import FlagToChannelActionMetadata as FlagToChannelActionMetadata
+    from discord_client.models.flag_to_channel_action_metadata_response import FlagToChannelActionMetadataResponse as FlagToChannelActionMetadataResponse
+    from discord_client.models.flag_to_channel_action_response import FlagToChannelActionResponse as FlagToChannelActionResponse
+    from discord_client.models.follow_channel_request import FollowChannelRequest as FollowChannelRequest
+    from discord_client.models.forum_tag_response import ForumTagResponse as ForumTagResponse
+    from discord_client.models.friend_invite_response import FriendInviteResponse as FriendInviteResponse
+    from discord_client.models.gateway_bot_response import GatewayBotResponse as GatewayBotResponse
+    from discord_client.models.gateway_bot_session_start_limit_response import GatewayBotSessionStartLimitResponse as GatewayBotSessionStartLimitResponse
+    from discord_client.models.gateway_response import GatewayResponse as GatewayResponse
+    from discord_client.models.get_channel200_response import GetChannel200Response as GetChannel200Response
+    from discord_client.models.get_entitlements_sku_ids_parameter import GetEntitlementsSkuIdsParameter as GetEntitlementsSkuIdsParameter
+    from discord_client.models.get_sticker200_response import GetSticker200Response as GetSticker200Response
+    from discord_client.models.github_author import GithubAuthor as GithubAuthor
+    from discord_client.models.github_check_app import GithubCheckApp as GithubCheckApp
+    from discord_client.models.github_check_pull_request import GithubCheckPullRequest as GithubCheckPullRequest
+    from discord_client.models.github_check_run import GithubCheckRun as GithubCheckRun
+    from discord_client.models.github_check_run_output import GithubCheckRunOutput as GithubCheckRunOutput
+    from discord_client.models.github_check_suite import GithubCheckSuite as GithubCheckSuite
+    from discord_client.models.github_comment import GithubComment as GithubComment
+    from discord_client.models.github_commit import GithubCommit as GithubCommit
+    from discord_client.models.github_discussion import GithubDiscussion as GithubDiscussion
+    from discord_client.models.github_issue import GithubIssue as GithubIssue
+    from discord_client.models.github_release import GithubRelease as GithubRelease
+    from discord_client.models.github_repository import GithubRepository as GithubRepository
+    from discord_client.models.github_review import GithubReview as GithubReview
+    from discord_client.models.github_user import GithubUser as GithubUser
+    from discord_client.models.github_webhook import GithubWebhook as GithubWebhook
+    from discord_client.models.group_dm_invite_response import GroupDMInviteResponse as GroupDMInviteResponse
+    from discord_client.models.guild_audit_log_response import GuildAuditLogResponse as GuildAuditLogResponse
+    from discord_client.models.guild_audit_log_response_integrations_inner import GuildAuditLogResponseIntegrationsInner as GuildAuditLogResponseIntegrationsInner
+    from discord_client.models.guild_ban_response import GuildBanResponse as GuildBanResponse
+    from discord_client.models.guild_channel_location import GuildChannelLocation as GuildChannelLocation
+    from discord_client.models.guild_channel_response import GuildChannelResponse as GuildChannelResponse
+    from discord_client.models.guild_home_settings_response import GuildHomeSettingsResponse as GuildHomeSettingsResponse
+    from discord_client.models.guild_incoming_webhook_response import GuildIncomingWebhookResponse as GuildIncomingWebhookResponse
+    from discord_client.models.guild_invite_response import GuildInviteResponse as GuildInviteResponse
+    from discord_client.models.guild_member_response import GuildMemberResponse as GuildMemberResponse
+    from discord_client.models.guild_onboarding_response import GuildOnboardingResponse as GuildOnboardingResponse
+    from discord_client.models.guild_patch_request_partial import GuildPatchRequestPartial as GuildPatchRequestPartial
+    from discord_client.models.guild_preview_response import GuildPreviewResponse as GuildPreviewResponse
+    from discord_client.models.guild_product_purchase_response import GuildProductPurchaseResponse as GuildProductPurchaseResponse
+    from discord_client.models.guild_prune_response import GuildPruneResponse as GuildPruneResponse
+    from discord_client.models.guild_response import GuildResponse as GuildResponse
+    from discord_client.models.guild_role_colors_response import GuildRoleColorsResponse as GuildRoleColorsResponse
+    from discord_client.models.guild_role_response import GuildRoleResponse as GuildRoleResponse
+    from discord_client.models.guild_role_tags_response import GuildRoleTagsResponse as GuildRoleTagsResponse
+    from discord_client.models.guild_sticker_response import GuildStickerResponse as GuildStickerResponse
+    from discord_client.models.guild_subscription_integration_response import GuildSubscriptionIntegrationResponse as GuildSubscriptionIntegrationResponse
+    from discord_client.models.guild_template_channel_response import GuildTemplateChannelResponse as GuildTemplateChannelResponse
+    from discord_client.models.guild_template_channel_tags import GuildTemplateChannelTags as GuildTemplateChannelTags
+    from discord_client.models.guild_template_response import GuildTemplateResponse as GuildTemplateResponse
+    from discord_client.models.guild_template_role_colors_response import GuildTemplateRoleColorsResponse as GuildTemplateRoleColorsResponse
+    from discord_client.models.guild_template_role_response import GuildTemplateRoleResponse as GuildTemplateRoleResponse
+    from discord_client.models.guild_template_snapshot_response import GuildTemplateSnapshotResponse as GuildTemplateSnapshotResponse
+    from discord_client.models.guild_welcome_channel import GuildWelcomeChannel as GuildWelcomeChannel
+    from discord_client.models.guild_welcome_screen_channel_response import GuildWelcomeScreenChannelResponse as GuildWelcomeScreenChannelResponse
+    from discord_client.models.guild_welcome_screen_response import GuildWelcomeScreenResponse as GuildWelcomeScreenResponse
+    from discord_client.models.guild_with_counts_response import GuildWithCountsResponse as GuildWithCountsResponse
+    from discord_client.models.incoming_webhook_interaction_request import IncomingWebhookInteractionRequest as IncomingWebhookInteractionRequest
+    from discord_client.models.incoming_webhook_request_partial import IncomingWebhookRequestPartial as IncomingWebhookRequestPartial
+    from discord_client.models.incoming_webhook_update_for_interaction_callback_request_partial import IncomingWebhookUpdateForInteractionCallbackRequestPartial as IncomingWebhookUpdateForInteractionCallbackRequestPartial
+    from discord_client.models.incoming_webhook_update_request_partial import IncomingWebhookUpdateRequestPartial as IncomingWebhookUpdateRequestPartial
+    from discord_client.models.inner_errors import InnerErrors as InnerErrors
+    from discord_client.models.integration_application_response import IntegrationApplicationResponse as IntegrationApplicationResponse
+    from discord_client.models.interaction_application_command_autocomplete_callback_integer_data import InteractionApplicationCommandAutocompleteCallbackIntegerData as InteractionApplicationCommandAutocompleteCallbackIntegerData
+    from discord_client.models.interaction_application_command_autocomplete_callback_number_data import InteractionApplicationCommandAutocompleteCallbackNumberData as InteractionApplicationCommandAutocompleteCallbackNumberData
+    from discord_client.models.interaction_application_command_autocomplete_callback_string_data import InteractionApplicationCommandAutocompleteCallbackStringData as InteractionApplicationCommandAutocompleteCallbackStringData
+    from discord_client.models.interaction_callback_response import InteractionCallbackResponse as InteractionCallbackResponse
+    from discord_client.models.interaction_callback_response_resource import InteractionCallbackResponseResource as InteractionCallbackResponseResource
+    from discord_client.models.interaction_response import InteractionResponse as InteractionResponse
+    from discord_client.models.invite_application_response import InviteApplicationResponse as InviteApplicationResponse
+    from discord_client.models.invite_channel_recipient_response import InviteChannelRecipientResponse as InviteChannelRecipientResponse
+    from discord_client.models.invite_channel_response import InviteChannelResponse as InviteChannelResponse
+    from discord_client.models.invite_guild_response import InviteGuildResponse as InviteGuildResponse
+    from discord_client.models.keyword_rule_response import KeywordRuleResponse as KeywordRuleResponse
+    from discord_client.models.keyword_trigger_metadata import KeywordTriggerMetadata as KeywordTriggerMetadata
+    from discord_client.models.keyword_trigger_metadata_response import KeywordTriggerMetadataResponse as KeywordTriggerMetadataResponse
+    from discord_client.models.keyword_upsert_request import KeywordUpsertRequest as KeywordUpsertRequest
+    from discord_client.models.keyword_upsert_request_partial import KeywordUpsertRequestPartial as KeywordUpsertRequestPartial
+    from discord_client.models.label_component_for_modal_request import LabelComponentForModalRequest as LabelComponentForModalRequest
+    from discord_client.models.label_component_for_modal_request_component import LabelComponentForModalRequestComponent as LabelComponentForModalRequestComponent
+    from discord_client.models.launch_activity_interaction_callback_request import LaunchActivityInteractionCallbackRequest as LaunchActivityInteractionCallbackRequest
+    from discord_client.models.launch_activity_interaction_callback_response import LaunchActivityInteractionCallbackResponse as LaunchActivityInteractionCallbackResponse
+    from discord_client.models.list_application_emojis_response import ListApplicationEmojisResponse as ListApplicationEmojisResponse
+    from discord_client.models.list_auto_moderation_rules200_response_inner import ListAutoModerationRules200ResponseInner as ListAutoModerationRules200ResponseInner
+    from discord_client.models.list_channel_invites200_response_inner import ListChannelInvites200ResponseInner as ListChannelInvites200ResponseInner
+    from discord_client.models.list_channel_webhooks200_response_inner import ListChannelWebhooks200ResponseInner as ListChannelWebhooks200ResponseInner
+    from discord_client.models.list_guild_integrations200_response_inner import ListGuildIntegrations200ResponseInner as ListGuildIntegrations200ResponseInner
+    from discord_client.models.list_guild_scheduled_events200_response_inner import ListGuildScheduledEvents200ResponseInner as ListGuildScheduledEvents200ResponseInner
+    from discord_client.models.list_guild_soundboard_sounds_response import ListGuildSoundboardSoundsResponse as ListGuildSoundboardSoundsResponse
+    from discord_client.models.lobby_guild_invite_response import LobbyGuildInviteResponse as LobbyGuildInviteResponse
+    from discord_client.models.lobby_member_request import LobbyMemberRequest as LobbyMemberRequest
+    from discord_client.models.lobby_member_response import LobbyMemberResponse as LobbyMemberResponse
+    from discord_client.models.lobby_message_response import LobbyMessageResponse as LobbyMessageResponse
+    from discord_client.models.lobby_response import LobbyResponse as LobbyResponse
+    from discord_client.models.ml_spam_rule_response import MLSpamRuleResponse as MLSpamRuleResponse
+    from discord_client.models.ml_spam_upsert_request import MLSpamUpsertRequest as MLSpamUpsertRequest
+    from discord_client.models.ml_spam_upsert_request_partial import MLSpamUpsertRequestPartial as MLSpamUpsertRequestPartial
+    from discord_client.models.media_gallery_component_for_message_request import MediaGalleryComponentForMessageRequest as MediaGalleryComponentForMessageRequest
+    from discord_client.models.media_gallery_component_response import MediaGalleryComponentResponse as MediaGalleryComponentResponse
+    from discord_client.models.media_gallery_item_request import MediaGalleryItemRequest as MediaGalleryItemRequest
+    from discord_client.models.media_gallery_item_response import MediaGalleryItemResponse as MediaGalleryItemResponse
+    from discord_client.models.mention_spam_rule_response import MentionSpamRuleResponse as MentionSpamRuleResponse
+    from discord_client.models.mention_spam_trigger_metadata import MentionSpamTriggerMetadata as MentionSpamTriggerMetadata
+    from discord_client.models.mention_spam_trigger_metadata_response import MentionSpamTriggerMetadataResponse as MentionSpamTriggerMetadataResponse
+    from discord_client.models.mention_spam_upsert_request import MentionSpamUpsertRequest as MentionSpamUpsertRequest
+    from discord_client.models.mention_spam_upsert_request_partial import MentionSpamUpsertRequestPartial as MentionSpamUpsertRequestPartial
+    from discord_client.models.mentionable_select_component_for_message_request import MentionableSelectComponentForMessageRequest as MentionableSelectComponentForMessageRequest
+    from discord_client.models.mentionable_select_component_for_message_request_default_values_inner import MentionableSelectComponentForMessageRequestDefaultValuesInner as MentionableSelectComponentForMessageRequestDefaultValuesInner
+    from discord_client.models.mentionable_select_component_for_modal_request import MentionableSelectComponentForModalRequest as MentionableSelectComponentForModalRequest
+    from discord_client.models.mentionable_select_component_response import MentionableSelectComponentResponse as MentionableSelectComponentResponse
+    from discord_client.models.mentionable_select_component_response_default_values_inner import MentionableSelectComponentResponseDefaultValuesInner as MentionableSelectComponentResponseDefaultValuesInner
+    from discord_client.models.message_allowed_mentions_request import MessageAllowedMentionsRequest as MessageAllowedMentionsRequest
+    from discord_client.models.message_attachment_request import MessageAttachmentRequest as MessageAttachmentRequest
+    from discord_client.models.message_attachment_response import MessageAttachmentResponse as MessageAttachmentResponse
+    from discord_client.models.message_call_response import MessageCallResponse as MessageCallResponse
+    from discord_client.models.message_component_interaction_metadata_response import MessageComponentInteractionMetadataResponse as MessageComponentInteractionMetadataResponse
+    from discord_client.models.message_create_request import MessageCreateRequest as MessageCreateRequest
+    from discord_client.models.message_edit_request_partial import MessageEditRequestPartial as MessageEditRequestPartial
+    from discord_client.models.message_embed_author_response import MessageEmbedAuthorResponse as MessageEmbedAuthorResponse
+    from discord_client.models.message_embed_field_response import MessageEmbedFieldResponse as MessageEmbedFieldResponse
+    from discord_client.models.message_embed_footer_response import MessageEmbedFooterResponse as MessageEmbedFooterResponse
+    from discord_client.models.message_embed_image_response import MessageEmbedImageResponse as MessageEmbedImageResponse
+    from discord_client.models.message_embed_provider_response import MessageEmbedProviderResponse as MessageEmbedProviderResponse
+    from discord_client.models.message_embed_response import MessageEmbedResponse as MessageEmbedResponse
+    from discord_client.models.message_embed_video_response import MessageEmbedVideoResponse as MessageEmbedVideoResponse
+    from discord_client.models.message_interaction_response import MessageInteractionResponse as MessageInteractionResponse
+    from discord_client.models.message_mention_channel_response import MessageMentionChannelResponse as MessageMentionChannelResponse
+    from discord_client.models.message_reaction_count_details_response import MessageReactionCountDetailsResponse as MessageReactionCountDetailsResponse
+    from discord_client.models.message_reaction_emoji_response import MessageReactionEmojiResponse as MessageReactionEmojiResponse
+    from discord_client.models.message_reaction_response import MessageReactionResponse as MessageReactionResponse
+    from discord_client.models.message_reference_request import MessageReferenceRequest as MessageReferenceRequest
+    from discord_client.models.message_reference_response import MessageReferenceResponse as MessageReferenceResponse
+    from discord_client.models.message_response import MessageResponse as MessageResponse
+    from discord_client.models.message_role_subscription_data_response import MessageRoleSubscriptionDataResponse as MessageRoleSubscriptionDataResponse
+    from discord_client.models.message_snapshot_response import MessageSnapshotResponse as MessageSnapshotResponse
+    from discord_client.models.message_sticker_item_response import MessageStickerItemResponse as MessageStickerItemResponse
+    from discord_client.models.minimal_content_message_response import MinimalContentMessageResponse as MinimalContentMessageResponse
+    from discord_client.models.modal_interaction_callback_request import ModalInteractionCallbackRequest as ModalInteractionCallbackRequest
+    from discord_client.models.modal_interaction_callback_request_data import ModalInteractionCallbackRequestData as ModalInteractionCallbackRequestData
+    from discord_client.models.modal_interaction_callback_request_data_components_inner import ModalInteractionCallbackRequestDataComponentsInner as ModalInteractionCallbackRequestDataComponentsInner
+    from discord_client.models.modal_submit_interaction_metadata_response import ModalSubmitInteractionMetadataResponse as ModalSubmitInteractionMetadataResponse
+    from discord_client.models.modal_submit_interaction_metadata_response_triggering_interaction_metadata import ModalSubmitInteractionMetadataResponseTriggeringInteractionMetadata as ModalSubmitInteractionMetadataResponseTriggeringInteractionMetadata
+    from discord_client.models.my_guild_response import MyGuildResponse as MyGuildResponse
+    from discord_client.models.new_member_action_response import NewMemberActionResponse as NewMemberActionResponse
+    from discord_client.models.o_auth2_get_authorization_response import OAuth2GetAuthorizationResponse as OAuth2GetAuthorizationResponse
+    from discord_client.models.o_auth2_get_keys import OAuth2GetKeys as OAuth2GetKeys
+    from discord_client.models.o_auth2_get_open_id_connect_user_info_response import OAuth2GetOpenIDConnectUserInfoResponse as OAuth2GetOpenIDConnectUserInfoResponse
+    from discord_client.models.o_auth2_key import OAuth2Key as OAuth2Key
+    from discord_client.models.onboarding_prompt_option_request import OnboardingPromptOptionRequest as OnboardingPromptOptionRequest
+    from discord_client.models.onboarding_prompt_option_response import OnboardingPromptOptionResponse as OnboardingPromptOptionResponse
+    from discord_client.models.onboarding_prompt_response import OnboardingPromptResponse as OnboardingPromptResponse
+    from discord_client.models.partial_discord_integration_response import PartialDiscordIntegrationResponse as PartialDiscordIntegrationResponse
+    from discord_client.models.partial_external_connection_integration_response import PartialExternalConnectionIntegrationResponse as PartialExternalConnectionIntegrationResponse
+    from discord_client.models.partial_guild_subscription_integration_response import PartialGuildSubscriptionIntegrationResponse as PartialGuildSubscriptionIntegrationResponse
+    from discord_client.models.partner_sdk_unmerge_provisional_account_request import PartnerSdkUnmergeProvisionalAccountRequest as PartnerSdkUnmergeProvisionalAccountRequest
+    from discord_client.models.pinned_message_response import PinnedMessageResponse as PinnedMessageResponse
+    from discord_client.models.pinned_messages_response import PinnedMessagesResponse as PinnedMessagesResponse
+    from discord_client.models.poll_answer_create_request import PollAnswerCreateRequest as PollAnswerCreateRequest
+    from discord_client.models.poll_answer_details_response import PollAnswerDetailsResponse as PollAnswerDetailsResponse
+    from discord_client.models.poll_answer_response import PollAnswerResponse as PollAnswerResponse
+    from discord_client.models.poll_create_request import PollCreateRequest as PollCreateRequest
+    from discord_client.models.poll_emoji import PollEmoji as PollEmoji
+    from discord_client.models.poll_emoji_create_request import PollEmojiCreateRequest as PollEmojiCreateRequest
+    from discord_client.models.poll_media import PollMedia as PollMedia
+    from discord_client.models.poll_media_create_request import PollMediaCreateRequest as PollMediaCreateRequest
+    from discord_client.models.poll_media_response import PollMediaResponse as PollMediaResponse
+    from discord_client.models.poll_response import PollResponse as PollResponse
+    from discord_client.models.poll_results_entry_response import PollResultsEntryResponse as PollResultsEntryResponse
+    from discord_client.models.poll_results_response import PollResultsResponse as PollResultsResponse
+    from discord_client.models.pong_interaction_callback_request import PongInteractionCallbackRequest as PongInteractionCallbackRequest
+    from discord_client.models.private_application_response import PrivateApplicationResponse as PrivateApplicationResponse
+    from discord_client.models.private_channel_location import PrivateChannelLocation as PrivateChannelLocation
+    from discord_client.models.private_channel_response import PrivateChannelResponse as PrivateChannelResponse
+    from discord_client.models.private_group_channel_response import PrivateGroupChannelResponse as PrivateGroupChannelResponse
+    from discord_client.models.private_guild_member_response import PrivateGuildMemberResponse as PrivateGuildMemberResponse
+    from discord_client.models.provisional_token_response import ProvisionalTokenResponse as ProvisionalTokenResponse
+    from discord_client.models.prune_guild_request import PruneGuildRequest as PruneGuildRequest
+    from discord_client.models.prune_guild_request_include_roles import PruneGuildRequestIncludeRoles as PruneGuildRequestIncludeRoles
+    from discord_client.models.purchase_notification_response import PurchaseNotificationResponse as PurchaseNotificationResponse
+    from discord_client.models.quarantine_user_action import QuarantineUserAction as QuarantineUserAction
+    from discord_client.models.quarantine_user_action_response import QuarantineUserActionResponse as QuarantineUserActionResponse
+    from discord_client.models.ratelimited_response import RatelimitedResponse as RatelimitedResponse
+    from discord_client.models.resolved_objects_response import ResolvedObjectsResponse as ResolvedObjectsResponse
+    from discord_client.models.resource_channel_response import ResourceChannelResponse as ResourceChannelResponse
+    from discord_client.models.rich_embed import RichEmbed as RichEmbed
+    from discord_client.models.rich_embed_author import RichEmbedAuthor as RichEmbedAuthor
+    from discord_client.models.rich_embed_field import RichEmbedField as RichEmbedField
+    from discord_client.models.rich_embed_footer import RichEmbedFooter as RichEmbedFooter
+    from discord_client.models.rich_embed_image import RichEmbedImage as RichEmbedImage
+    from discord_client.models.rich_embed_provider import RichEmbedProvider as RichEmbedProvider
+    from discord_client.models.rich_embed_thumbnail import RichEmbedThumbnail as RichEmbedThumbnail
+    from discord_client.models.rich_embed_video import RichEmbedVideo as RichEmbedVideo
+    from discord_client.models.role_select_component_for_message_request import RoleSelectComponentForMessageRequest as RoleSelectComponentForMessageRequest
+    from discord_client.models.role_select_component_for_modal_request import RoleSelectComponentForModalRequest as RoleSelectComponentForModalRequest
+    from discord_client.models.role_select_component_response import RoleSelectComponentResponse as RoleSelectComponentResponse
+    from discord_client.models.role_select_default_value import RoleSelectDefaultValue as RoleSelectDefaultValue
+    from discord_client.models.role_select_default_value_response import RoleSelectDefaultValueResponse as RoleSelectDefaultValueResponse
+    from discord_client.models.sdk_message_request import SDKMessageRequest as SDKMessageRequest
+    from discord_client.models.scheduled_event_response import ScheduledEventResponse as ScheduledEventResponse
+    from discord_client.models.scheduled_event_user_response import ScheduledEventUserResponse as ScheduledEventUserResponse
+    from discord_client.models.section_component_for_message_request import SectionComponentForMessageRequest as SectionComponentForMessageRequest
+    from discord_client.models.section_component_for_message_request_accessory import SectionComponentForMessageRequestAccessory as SectionComponentForMessageRequestAccessory
+    from discord_client.models.section_component_response import SectionComponentResponse as SectionComponentResponse
+    from discord_client.models.section_component_response_accessory import SectionComponentResponseAccessory as SectionComponentResponseAccessory
+    from discord_client.models.separator_component_for_message_request import SeparatorComponentForMessageRequest as SeparatorComponentForMessageRequest
+    from discord_client.models.separator_component_response import SeparatorComponentResponse as SeparatorComponentResponse
+    from discord_client.models.set_channel_permission_overwrite_request import SetChannelPermissionOverwriteRequest as SetChannelPermissionOverwriteRequest
+    from discord_client.models.set_guild_application_command_permissions_request import SetGuildApplicationCommandPermissionsRequest as SetGuildApplicationCommandPermissionsRequest
+    from discord_client.models.settings_emoji_response import SettingsEmojiResponse as SettingsEmojiResponse
+    from discord_client.models.slack_webhook import SlackWebhook as SlackWebhook
+    from discord_client.models.soundboard_create_request import SoundboardCreateRequest as SoundboardCreateRequest
+    from discord_client.models.soundboard_patch_request_partial import SoundboardPatchRequestPartial as SoundboardPatchRequestPartial
+    from discord_client.models.soundboard_sound_response import SoundboardSoundResponse as SoundboardSoundResponse
+    from discord_client.models.soundboard_sound_send_request import SoundboardSoundSendRequest as SoundboardSoundSendRequest
+    from discord_client.models.spam_link_rule_response import SpamLinkRuleResponse as SpamLinkRuleResponse
+    from discord_client.models.stage_instance_response import StageInstanceResponse as StageInstanceResponse
+    from discord_client.models.stage_scheduled_event_create_request import StageScheduledEventCreateRequest as StageScheduledEventCreateRequest
+    from discord_client.models.stage_scheduled_event_patch_request_partial import StageScheduledEventPatchRequestPartial as StageScheduledEventPatchRequestPartial
+    from discord_client.models.stage_scheduled_event_response import StageScheduledEventResponse as StageScheduledEventResponse
+    from discord_client.models.standard_sticker_response import StandardStickerResponse as StandardStickerResponse
+    from discord_client.models.sticker_pack_collection_response import StickerPackCollectionResponse as StickerPackCollectionResponse
+    from discord_client.models.sticker_pack_response import StickerPackResponse as StickerPackResponse
+    from discord_client.models.string_select_component_for_message_request import StringSelectComponentForMessageRequest as StringSelectComponentForMessageRequest
+    from discord_client.models.string_select_component_for_modal_request import StringSelectComponentForModalRequest as StringSelectComponentForModalRequest
+    from discord_client.models.string_select_component_response import StringSelectComponentResponse as StringSelectComponentResponse
+    from discord_client.models.string_select_option_for_request import StringSelectOptionForRequest as StringSelectOptionForRequest
+    from discord_client.models.string_select_option_response import StringSelectOptionResponse as StringSelectOptionResponse
+    from discord_client.models.team_member_response import TeamMemberResponse as TeamMemberResponse
+    from discord_client.models.team_response import TeamResponse as TeamResponse
+    from discord_client.models.text_display_component_for_message_request import TextDisplayComponentForMessageRequest as TextDisplayComponentForMessageRequest
+    from discord_client.models.text_display_component_for_modal_request import TextDisplayComponentForModalRequest as TextDisplayComponentForModalRequest
+    from discord_client.models.text_display_component_response import TextDisplayComponentResponse as TextDisplayComponentResponse
+    from discord_client.models.text_input_component_for_modal_request import TextInputComponentForModalRequest as TextInputComponentForModalRequest
+    from discord_client.models.text_input_component_response import TextInputComponentResponse as TextInputComponentResponse
+    from discord_client.models.thread_member_response import ThreadMemberResponse as ThreadMemberResponse
+    from discord_client.models.thread_metadata_response import ThreadMetadataResponse as ThreadMetadataResponse
+    from discord_client.models.thread_response import ThreadResponse as ThreadResponse
+    from discord_client.models.thread_search_response import ThreadSearchResponse as ThreadSearchResponse
+    from discord_client.models.thread_search_tag_parameter import ThreadSearchTagParameter as ThreadSearchTagParameter
+    from discord_client.models.threads_response import ThreadsResponse as ThreadsResponse
+    from discord_client.models.thumbnail_component_for_message_request import ThumbnailComponentForMessageRequest as ThumbnailComponentForMessageRequest
+    from discord_client.models.thumbnail_component_response import ThumbnailComponentResponse as ThumbnailComponentResponse
+    from discord_client.models.unfurled_media_request import UnfurledMediaRequest as UnfurledMediaRequest
+    from discord_client.models.unfurled_media_request_with_attachment_reference_required import UnfurledMediaRequestWithAttachmentReferenceRequired as UnfurledMediaRequestWithAttachmentReferenceRequired
+    from discord_client.models.unfurled_media_response import UnfurledMediaResponse as UnfurledMediaResponse
+    from discord_client.models.update_application_emoji_request import UpdateApplicationEmojiRequest as UpdateApplicationEmojiRequest
+    from discord_client.models.update_application_user_role_connection_request import UpdateApplicationUserRoleConnectionRequest as UpdateApplicationUserRoleConnectionRequest
+    from discord_client.models.update_auto_moderation_rule_request import UpdateAutoModerationRuleRequest as UpdateAutoModerationRuleRequest
+    from discord_client.models.update_channel_request import UpdateChannelRequest as UpdateChannelRequest
+    from discord_client.models.update_dm_request_partial import UpdateDMRequestPartial as UpdateDMRequestPartial
+    from discord_client.models.update_default_reaction_emoji_request import UpdateDefaultReactionEmojiRequest as UpdateDefaultReactionEmojiRequest
+    from discord_client.models.update_group_dm_request_partial import UpdateGroupDMRequestPartial as UpdateGroupDMRequestPartial
+    from discord_client.models.update_guild_channel_request_partial import UpdateGuildChannelRequestPartial as UpdateGuildChannelRequestPartial
+    from discord_client.models.update_guild_emoji_request import UpdateGuildEmojiRequest as UpdateGuildEmojiRequest
+    from discord_client.models.update_guild_member_request import UpdateGuildMemberRequest as UpdateGuildMemberRequest
+    from discord_client.models.update_guild_onboarding_request import UpdateGuildOnboardingRequest as UpdateGuildOnboardingRequest
+    from discord_client.models.update_guild_scheduled_event_request import UpdateGuildScheduledEventRequest as UpdateGuildScheduledEventRequest
+    from discord_client.models.update_guild_sticker_request import UpdateGuildStickerRequest as UpdateGuildStickerRequest
+    from discord_client.models.update_guild_template_request import UpdateGuildTemplateRequest as UpdateGuildTemplateRequest
+    from discord_client.models.update_guild_widget_settings_request import UpdateGuildWidgetSettingsRequest as UpdateGuildWidgetSettingsRequest
+    from discord_client.models.update_message_interaction_callback_request import UpdateMessageInteractionCallbackRequest as UpdateMessageInteractionCallbackRequest
+    from discord_client.models.update_message_interaction_callback_response import UpdateMessageInteractionCallbackResponse as UpdateMessageInteractionCallbackResponse
+    from discord_client.models.update_my_guild_member_request import UpdateMyGuildMemberRequest as UpdateMyGuildMemberRequest
+    from discord_client.models.update_onboarding_prompt_request import UpdateOnboardingPromptRequest as UpdateOnboardingPromptRequest
+    from discord_client.models.update_role_positions_request import UpdateRolePositionsRequest as UpdateRolePositionsRequest
+    from discord_client.models.update_role_request_partial import UpdateRoleRequestPartial as UpdateRoleRequestPartial
+    from discord_client.models.update_self_voice_state_request_partial import UpdateSelfVoiceStateRequestPartial as UpdateSelfVoiceStateRequestPartial
+    from discord_client.models.update_stage_instance_request import UpdateStageInstanceRequest as UpdateStageInstanceRequest
+    from discord_client.models.update_thread_request_partial import UpdateThreadRequestPartial as UpdateThreadRequestPartial
+    from discord_client.models.update_thread_tag_request import UpdateThreadTagRequest as UpdateThreadTagRequest
+    from discord_client.models.update_voice_state_request_partial import UpdateVoiceStateRequestPartial as UpdateVoiceStateRequestPartial
+    from discord_client.models.update_webhook_by_token_request import UpdateWebhookByTokenRequest as UpdateWebhookByTokenRequest
+    from discord_client.models.update_webhook_request import UpdateWebhookRequest as UpdateWebhookRequest
+    from discord_client.models.user_avatar_decoration_response import UserAvatarDecorationResponse as UserAvatarDecorationResponse
+    from discord_client.models.user_collectibles_response import UserCollectiblesResponse as UserCollectiblesResponse
+    from discord_client.models.user_communication_disabled_action import UserCommunicationDisabledAction as UserCommunicationDisabledAction
+    from discord_client.models.user_communication_disabled_action_metadata import UserCommunicationDisabledActionMetadata as UserCommunicationDisabledActionMetadata
+    from discord_client.models.user_communication_disabled_action_metadata_response import UserCommunicationDisabledActionMetadataResponse as UserCommunicationDisabledActionMetadataResponse
+    from discord_client.models.user_communication_disabled_action_response import UserCommunicationDisabledActionResponse as UserCommunicationDisabledActionResponse
+    from discord_client.models.user_guild_onboarding_response import UserGuildOnboardingResponse as UserGuildOnboardingResponse
+    from discord_client.models.user_nameplate_response import UserNameplateResponse as UserNameplateResponse
+    from discord_client.models.user_pii_response import UserPIIResponse as UserPIIResponse
+    from discord_client.models.user_primary_guild_response import UserPrimaryGuildResponse as UserPrimaryGuildResponse
+    from discord_client.models.user_response import UserResponse as UserResponse
+    from discord_client.models.user_select_component_for_message_request import UserSelectComponentForMessageRequest as UserSelectComponentForMessageRequest
+    from discord_client.models.user_select_component_for_modal_request import UserSelectComponentForModalRequest as UserSelectComponentForModalRequest
+    from discord_client.models.user_select_component_response import UserSelectComponentResponse as UserSelectComponentResponse
+    from discord_client.models.user_select_default_value import UserSelectDefaultValue as UserSelectDefaultValue
+    from discord_client.models.user_select_default_value_response import UserSelectDefaultValueResponse as UserSelectDefaultValueResponse
+    from discord_client.models.vanity_url_error_response import VanityURLErrorResponse as VanityURLErrorResponse
+    from discord_client.models.vanity_url_response import VanityURLResponse as VanityURLResponse
+    from discord_client.models.voice_region_response import VoiceRegionResponse as VoiceRegionResponse
+    from discord_client.models.voice_scheduled_event_create_request import VoiceScheduledEventCreateRequest as VoiceScheduledEventCreateRequest
+    from discord_client.models.voice_scheduled_event_patch_request_partial import VoiceScheduledEventPatchRequestPartial as VoiceScheduledEventPatchRequestPartial
+    from discord_client.models.voice_scheduled_event_response import VoiceScheduledEventResponse as VoiceScheduledEventResponse
+    from discord_client.models.voice_state_response import VoiceStateResponse as VoiceStateResponse
+    from discord_client.models.webhook_slack_embed import WebhookSlackEmbed as WebhookSlackEmbed
+    from discord_client.models.webhook_slack_embed_field import WebhookSlackEmbedField as WebhookSlackEmbedField
+    from discord_client.models.webhook_source_channel_response import WebhookSourceChannelResponse as WebhookSourceChannelResponse
+    from discord_client.models.webhook_source_guild_response import WebhookSourceGuildResponse as WebhookSourceGuildResponse
+    from discord_client.models.welcome_message_response import WelcomeMessageResponse as WelcomeMessageResponse
+    from discord_client.models.welcome_screen_patch_request_partial import WelcomeScreenPatchRequestPartial as WelcomeScreenPatchRequestPartial
+    from discord_client.models.widget_activity import WidgetActivity as WidgetActivity
+    from discord_client.models.widget_channel import WidgetChannel as WidgetChannel
+    from discord_client.models.widget_member import WidgetMember as WidgetMember
+    from discord_client.models.widget_response import WidgetResponse as WidgetResponse
+    from discord_client.models.widget_settings_response import WidgetSettingsResponse as WidgetSettingsResponse
+
+# APIs und Modelle werden erst beim ersten Zugriff importiert, statt beim Start alle Modelle zu laden
+_lazy_imports = {
+    "ApplicationsApi": "discord_client.api.applications_api",
+    "ChannelsApi": "discord_client.api.channels_api",
+    "DefaultApi": "discord_client.api.default_api",
+    "GatewayApi": "discord_client.api.gateway_api",
+    "GuildsApi": "discord_client.api.guilds_api",
+    "InteractionsApi": "discord_client.api.interactions_api",
+    "InvitesApi": "discord_client.api.invites_api",
+    "LobbiesApi": "discord_client.api.lobbies_api",
+    "Oauth2Api": "discord_client.api.oauth2_api",
+    "PartnerSdkApi": "discord_client.api.partner_sdk_api",
+    "SoundboardDefaultSoundsApi": "discord_client.api.soundboard_default_sounds_api",
+    "StageInstancesApi": "discord_client.api.stage_instances_api",
+    "StickerPacksApi": "discord_client.api.sticker_packs_api",
+    "StickersApi": "discord_client.api.stickers_api",
+    "UsersApi": "discord_client.api.users_api",
+    "VoiceApi": "discord_client.api.voice_api",
+    "WebhooksApi": "discord_client.api.webhooks_api",
+    "AccountResponse": "discord_client.models.account_response",
+    "ActionRowComponentForMessageRequest": "discord_client.models.action_row_component_for_message_request",
+    "ActionRowComponentForMessageRequestComponentsInner": "discord_client.models.action_row_component_for_message_request_components_inner",
+    "ActionRowComponentForModalRequest": "discord_client.models.action_row_component_for_modal_request",
+    "ActionRowComponentResponse": "discord_client.models.action_row_component_response",
+    "ActionRowComponentResponseComponentsInner": "discord_client.models.action_row_component_response_components_inner",
+    "ActivitiesAttachmentResponse": "discord_client.models.activities_attachment_response",
+    "AddGroupDmUser201Response": "discord_client.models.add_group_dm_user201_response",
+    "AddGroupDmUserRequest": "discord_client.models.add_group_dm_user_request",
+    "AddLobbyMemberRequest": "discord_client.models.add_lobby_member_request",
+    "ApplicationCommandAttachmentOption": "discord_client.models.application_command_attachment_option",
+    "ApplicationCommandAttachmentOptionResponse": "discord_client.models.application_command_attachment_option_response",
+    "ApplicationCommandAutocompleteCallbackRequest": "discord_client.models.application_command_autocomplete_callback_request",
+    "ApplicationCommandAutocompleteCallbackRequestData": "discord_client.models.application_command_autocomplete_callback_request_data",
+    "ApplicationCommandBooleanOption": "discord_client.models.application_command_boolean_option",
+    "ApplicationCommandBooleanOptionResponse": "discord_client.models.application_command_boolean_option_response",
+    "ApplicationCommandChannelOption": "discord_client.models.application_command_channel_option",
+    "ApplicationCommandChannelOptionResponse": "discord_client.models.application_command_channel_option_response",
+    "ApplicationCommandCreateRequest": "discord_client.models.application_command_create_request",
+    "ApplicationCommandCreateRequestOptionsInner": "discord_client.models.application_command_create_request_options_inner",
+    "ApplicationCommandIntegerOption": "discord_client.models.application_command_integer_option",
+    "ApplicationCommandIntegerOptionResponse": "discord_client.models.application_command_integer_option_response",
+    "ApplicationCommandInteractionMetadataResponse": "discord_client.models.application_command_interaction_metadata_response",
+    "ApplicationCommandMentionableOption": "discord_client.models.application_command_mentionable_option",
+    "ApplicationCommandMentionableOptionResponse": "discord_client.models.application_command_mentionable_option_response",
+    "ApplicationCommandNumberOption": "discord_client.models.application_command_number_option",
+    "ApplicationCommandNumberOptionResponse": "discord_client.models.application_command_number_option_response",
+    "ApplicationCommandOptionIntegerChoice": "discord_client.models.application_command_option_integer_choice",
+    "ApplicationCommandOptionIntegerChoiceResponse": "discord_client.models.application_command_option_integer_choice_response",
+    "ApplicationCommandOptionNumberChoice": "discord_client.models.application_command_option_number_choice",
+    "ApplicationCommandOptionNumberChoiceResponse": "discord_client.models.application_command_option_number_choice_response",
+    "ApplicationCommandOptionStringChoice": "discord_client.models.application_command_option_string_choice",
+    "ApplicationCommandOptionStringChoiceResponse": "discord_client.models.application_command_option_string_choice_response",
+    "ApplicationCommandPatchRequestPartial": "discord_client.models.application_command_patch_request_partial",
+    "ApplicationCommandPermission": "discord_client.models.application_command_permission",
+    "ApplicationCommandResponse": "discord_client.models.application_command_response",
+    "ApplicationCommandResponseOptionsInner": "discord_client.models.application_command_response_options_inner",
+    "ApplicationCommandRoleOption": "discord_client.models.application_command_role_option",
+    "ApplicationCommandRoleOptionResponse": "discord_client.models.application_command_role_option_response",
+    "ApplicationCommandStringOption": "discord_client.models.application_command_string_option",
+    "ApplicationCommandStringOptionResponse": "discord_client.models.application_command_string_option_response",
+    "ApplicationCommandSubcommandGroupOption": "discord_client.models.application_command_subcommand_group_option",
+    "ApplicationCommandSubcommandGroupOptionResponse": "discord_client.models.application_command_subcommand_group_option_response",
+    "ApplicationCommandSubcommandOption": "discord_client.models.application_command_subcommand_option",
+    "ApplicationCommandSubcommandOptionOptionsInner": "discord_client.models.application_command_subcommand_option_options_inner",
+    "ApplicationCommandSubcommandOptionResponse": "discord_client.models.application_command_subcommand_option_response",
+    "ApplicationCommandSubcommandOptionResponseOptionsInner": "discord_client.models.application_command_subcommand_option_response_options_inner",
+    "ApplicationCommandUpdateRequest": "discord_client.models.application_command_update_request",
+    "ApplicationCommandUserOption": "discord_client.models.application_command_user_option",
+    "ApplicationCommandUserOptionResponse": "discord_client.models.application_command_user_option_response",
+    "ApplicationFormPartial": "discord_client.models.application_form_partial",
+    "ApplicationFormPartialDescription": "discord_client.models.application_form_partial_description",
+    "ApplicationFormPartialIntegrationTypesConfigValue": "discord_client.models.application_form_partial_integration_types_config_value",
+    "ApplicationIncomingWebhookResponse": "discord_client.models.application_incoming_webhook_response",
+    "ApplicationIntegrationTypeConfiguration": "discord_client.models.application_integration_type_configuration",
+    "ApplicationIntegrationTypeConfigurationResponse": "discord_client.models.application_integration_type_configuration_response",
+    "ApplicationOAuth2InstallParams": "discord_client.models.application_o_auth2_install_params",
+    "ApplicationOAuth2InstallParamsResponse": "discord_client.models.application_o_auth2_install_params_response",
+    "ApplicationResponse": "discord_client.models.application_response",
+    "ApplicationRoleConnectionsMetadataItemRequest": "discord_client.models.application_role_connections_metadata_item_request",
+    "ApplicationRoleConnectionsMetadataItemResponse": "discord_client.models.application_role_connections_metadata_item_response",
+    "ApplicationUserRoleConnectionResponse": "discord_client.models.application_user_role_connection_response",
+    "AttachmentResponse": "discord_client.models.attachment_response",
+    "AuditLogEntryResponse": "discord_client.models.audit_log_entry_response",
+    "AuditLogObjectChangeResponse": "discord_client.models.audit_log_object_change_response",
+    "BanUserFromGuildRequest": "discord_client.models.ban_user_from_guild_request",
+    "BaseCreateMessageCreateRequest": "discord_client.models.base_create_message_create_request",
+    "BaseCreateMessageCreateRequestComponentsInner": "discord_client.models.base_create_message_create_request_components_inner",
+    "BasicApplicationResponse": "discord_client.models.basic_application_response",
+    "BasicGuildMemberResponse": "discord_client.models.basic_guild_member_response",
+    "BasicMessageResponse": "discord_client.models.basic_message_response",
+    "BasicMessageResponseComponentsInner": "discord_client.models.basic_message_response_components_inner",
+    "BasicMessageResponseInteractionMetadata": "discord_client.models.basic_message_response_interaction_metadata",
+    "BasicMessageResponseNonce": "discord_client.models.basic_message_response_nonce",
+    "BlockMessageAction": "discord_client.models.block_message_action",
+    "BlockMessageActionMetadata": "discord_client.models.block_message_action_metadata",
+    "BlockMessageActionMetadataResponse": "discord_client.models.block_message_action_metadata_response",
+    "BlockMessageActionResponse": "discord_client.models.block_message_action_response",
+    "BotAccountPatchRequest": "discord_client.models.bot_account_patch_request",
+    "BotAddGuildMemberRequest": "discord_client.models.bot_add_guild_member_request",
+    "BotPartnerSdkTokenRequest": "discord_client.models.bot_partner_sdk_token_request",
+    "BotPartnerSdkUnmergeProvisionalAccountRequest": "discord_client.models.bot_partner_sdk_unmerge_provisional_account_request",
+    "BulkBanUsersRequest": "discord_client.models.bulk_ban_users_request",
+    "BulkBanUsersResponse": "discord_client.models.bulk_ban_users_response",
+    "BulkDeleteMessagesRequest": "discord_client.models.bulk_delete_messages_request",
+    "BulkLobbyMemberRequest": "discord_client.models.bulk_lobby_member_request",
+    "BulkUpdateGuildChannelsRequestInner": "discord_client.models.bulk_update_guild_channels_request_inner",
+    "ButtonComponentForMessageRequest": "discord_client.models.button_component_for_message_request",
+    "ButtonComponentResponse": "discord_client.models.button_component_response",
+    "ChannelFollowerResponse": "discord_client.models.channel_follower_response",
+    "ChannelFollowerWebhookResponse": "discord_client.models.channel_follower_webhook_response",
+    "ChannelPermissionOverwriteRequest": "discord_client.models.channel_permission_overwrite_request",
+    "ChannelPermissionOverwriteResponse": "discord_client.models.channel_permission_overwrite_response",
+    "ChannelSelectComponentForMessageRequest": "discord_client.models.channel_select_component_for_message_request",
+    "ChannelSelectComponentForModalRequest": "discord_client.models.channel_select_component_for_modal_request",
+    "ChannelSelectComponentResponse": "discord_client.models.channel_select_component_response",
+    "ChannelSelectDefaultValue": "discord_client.models.channel_select_default_value",
+    "ChannelSelectDefaultValueResponse": "discord_client.models.channel_select_default_value_response",
+    "CommandPermissionResponse": "discord_client.models.command_permission_response",
+    "CommandPermissionsResponse": "discord_client.models.command_permissions_response",
+    "ComponentEmojiForRequest": "discord_client.models.component_emoji_for_request",
+    "ComponentEmojiResponse": "discord_client.models.component_emoji_response",
+    "ConnectedAccountGuildResponse": "discord_client.models.connected_account_guild_response",
+    "ConnectedAccountIntegrationResponse": "discord_client.models.connected_account_integration_response",
+    "ConnectedAccountResponse": "discord_client.models.connected_account_response",
+    "ContainerComponentForMessageRequest": "discord_client.models.container_component_for_message_request",
+    "ContainerComponentForMessageRequestComponentsInner": "discord_client.models.container_component_for_message_request_components_inner",
+    "ContainerComponentResponse": "discord_client.models.container_component_response",
+    "ContainerComponentResponseComponentsInner": "discord_client.models.container_component_response_components_inner",
+    "CreateApplicationEmojiRequest": "discord_client.models.create_application_emoji_request",
+    "CreateAutoModerationRule200Response": "discord_client.models.create_auto_moderation_rule200_response",
+    "CreateAutoModerationRuleRequest": "discord_client.models.create_auto_moderation_rule_request",
+    "CreateChannelInvite200Response": "discord_client.models.create_channel_invite200_response",
+    "CreateChannelInviteRequest": "discord_client.models.create_channel_invite_request",
+    "CreateEntitlementRequestData": "discord_client.models.create_entitlement_request_data",
+    "CreateForumThreadRequest": "discord_client.models.create_forum_thread_request",
+    "CreateGroupDMInviteRequest": "discord_client.models.create_group_dm_invite_request",
+    "CreateGuildChannelRequest": "discord_client.models.create_guild_channel_request",
+    "CreateGuildEmojiRequest": "discord_client.models.create_guild_emoji_request",
+    "CreateGuildInviteRequest": "discord_client.models.create_guild_invite_request",
+    "CreateGuildScheduledEventRequest": "discord_client.models.create_guild_scheduled_event_request",
+    "CreateGuildTemplateRequest": "discord_client.models.create_guild_template_request",
+    "CreateInteractionResponseRequest": "discord_client.models.create_interaction_response_request",
+    "CreateLobbyRequest": "discord_client.models.create_lobby_request",
+    "CreateMessageInteractionCallbackRequest": "discord_client.models.create_message_interaction_callback_request",
+    "CreateMessageInteractionCallbackResponse": "discord_client.models.create_message_interaction_callback_response",
+    "CreateOrJoinLobbyRequest": "discord_client.models.create_or_join_lobby_request",
+    "CreateOrUpdateThreadTagRequest": "discord_client.models.create_or_update_thread_tag_request",
+    "CreatePrivateChannelRequest": "discord_client.models.create_private_channel_request",
+    "CreateRoleRequest": "discord_client.models.create_role_request",
+    "CreateStageInstanceRequest": "discord_client.models.create_stage_instance_request",
+    "CreateTextThreadWithMessageRequest": "discord_client.models.create_text_thread_with_message_request",
+    "CreateTextThreadWithoutMessageRequest": "discord_client.models.create_text_thread_without_message_request",
+    "CreateThreadRequest": "discord_client.models.create_thread_request",
+    "CreateWebhookRequest": "discord_client.models.create_webhook_request",
+    "CreatedThreadResponse": "discord_client.models.created_thread_response",
+    "CustomClientThemeResponse": "discord_client.models.custom_client_theme_response",
+    "CustomClientThemeShareRequest": "discord_client.models.custom_client_theme_share_request",
+    "DefaultKeywordListTriggerMetadata": "discord_client.models.default_keyword_list_trigger_metadata",
+    "DefaultKeywordListTriggerMetadataResponse": "discord_client.models.default_keyword_list_trigger_metadata_response",
+    "DefaultKeywordListUpsertRequest": "discord_client.models.default_keyword_list_upsert_request",
+    "DefaultKeywordListUpsertRequestActionsInner": "discord_client.models.default_keyword_list_upsert_request_actions_inner",
+    "DefaultKeywordListUpsertRequestPartial": "discord_client.models.default_keyword_list_upsert_request_partial",
+    "DefaultKeywordRuleResponse": "discord_client.models.default_keyword_rule_response",
+    "DefaultKeywordRuleResponseActionsInner": "discord_client.models.default_keyword_rule_response_actions_inner",
+    "DefaultReactionEmojiResponse": "discord_client.models.default_reaction_emoji_response",
+    "DiscordIntegrationResponse": "discord_client.models.discord_integration_response",
+    "EditLobbyChannelLinkRequest": "discord_client.models.edit_lobby_channel_link_request",
+    "EmbeddedActivityInstance": "discord_client.models.embedded_activity_instance",
+    "EmbeddedActivityInstanceLocation": "discord_client.models.embedded_activity_instance_location",
+    "EmojiResponse": "discord_client.models.emoji_response",
+    "EntitlementResponse": "discord_client.models.entitlement_response",
+    "EntityMetadataExternal": "discord_client.models.entity_metadata_external",
+    "EntityMetadataExternalResponse": "discord_client.models.entity_metadata_external_response",
+    "Error": "discord_client.models.error",
+    "ErrorDetails": "discord_client.models.error_details",
+    "ErrorResponse": "discord_client.models.error_response",
+    "ExecuteWebhookRequest": "discord_client.models.execute_webhook_request",
+    "ExternalConnectionIntegrationResponse": "discord_client.models.external_connection_integration_response",
+    "ExternalScheduledEventCreateRequest": "discord_client.models.external_scheduled_event_create_request",
+    "ExternalScheduledEventPatchRequestPartial": "discord_client.models.external_scheduled_event_patch_request_partial",
+    "ExternalScheduledEventResponse": "discord_client.models.external_scheduled_event_response",
+    "FileComponentForMessageRequest": "discord_client.models.file_component_for_message_request",
+    "FileComponentResponse": "discord_client.models.file_component_response",
+    "FileUploadComponentForModalRequest": "discord_client.models.file_upload_component_for_modal_request",
+    "FlagToChannelAction": "discord_client.models.flag_to_channel_action",
+    "FlagToChannelActionMetadata": "discord_client.models.flag_to_channel_action_metadata",
+    "FlagToChannelActionMetadataResponse": "discord_client.models.flag_to_channel_action_metadata_response",
+    "FlagToChannelActionResponse": "discord_client.models.flag_to_channel_action_response",
+    "FollowChannelRequest": "discord_client.models.follow_channel_request",
+    "ForumTagResponse": "discord_client.models.forum_tag_response",
+    "FriendInviteResponse": "discord_client.models.friend_invite_response",
+    "GatewayBotResponse": "discord_client.models.gateway_bot_response",
+    "GatewayBotSessionStartLimitResponse": "discord_client.models.gateway_bot_session_start_limit_response",
+    "GatewayResponse": "discord_client.models.gateway_response",
+    "GetChannel200Response": "discord_client.models.get_channel200_response",
+    "GetEntitlementsSkuIdsParameter": "discord_client.models.get_entitlements_sku_ids_parameter",
+    "GetSticker200Response": "discord_client.models.get_sticker200_response",
+    "GithubAuthor": "discord_client.models.github_author",
+    "GithubCheckApp": "discord_client.models.github_check_app",
+    "GithubCheckPullRequest": "discord_client.models.github_check_pull_request",
+    "GithubCheckRun": "discord_client.models.github_check_run",
+    "GithubCheckRunOutput": "discord_client.models.github_check_run_output",
+    "GithubCheckSuite": "discord_client.models.github_check_suite",
+    "GithubComment": "discord_client.models.github_comment",
+    "GithubCommit": "discord_client.models.github_commit",
+    "GithubDiscussion": "discord_client.models.github_discussion",
+    "GithubIssue": "discord_client.models.github_issue",
+    "GithubRelease": "discord_client.models.github_release",
+    "GithubRepository": "discord_client.models.github_repository",
+    "GithubReview": "discord_client.models.github_review",
+    "GithubUser": "discord_client.models.github_user",
+    "GithubWebhook": "discord_client.models.github_webhook",
+    "GroupDMInviteResponse": "discord_client.models.group_dm_invite_response",
+    "GuildAuditLogResponse": "discord_client.models.guild_audit_log_response",
+    "GuildAuditLogResponseIntegrationsInner": "discord_client.models.guild_audit_log_response_integrations_inner",
+    "GuildBanResponse": "discord_client.models.guild_ban_response",
+    "GuildChannelLocation": "discord_client.models.guild_channel_location",
+    "GuildChannelResponse": "discord_client.models.guild_channel_response",
+    "GuildHomeSettingsResponse": "discord_client.models.guild_home_settings_response",
+    "GuildIncomingWebhookResponse": "discord_client.models.guild_incoming_webhook_response",
+    "GuildInviteResponse": "discord_client.models.guild_invite_response",
+    "GuildMemberResponse": "discord_client.models.guild_member_response",
+    "GuildOnboardingResponse": "discord_client.models.guild_onboarding_response",
+    "GuildPatchRequestPartial": "discord_client.models.guild_patch_request_partial",
+    "GuildPreviewResponse": "discord_client.models.guild_preview_response",
+    "GuildProductPurchaseResponse": "discord_client.models.guild_product_purchase_response",
+    "GuildPruneResponse": "discord_client.models.guild_prune_response",
+    "GuildResponse": "discord_client.models.guild_response",
+    "GuildRoleColorsResponse": "discord_client.models.guild_role_colors_response",
+    "GuildRoleResponse": "discord_client.models.guild_role_response",
+    "GuildRoleTagsResponse": "discord_client.models.guild_role_tags_response",
+    "GuildStickerResponse": "discord_client.models.guild_sticker_response",
+    "GuildSubscriptionIntegrationResponse": "discord_client.models.guild_subscription_integration_response",
+    "GuildTemplateChannelResponse": "discord_client.models.guild_template_channel_response",
+    "GuildTemplateChannelTags": "discord_client.models.guild_template_channel_tags",
+    "GuildTemplateResponse": "discord_client.models.guild_template_response",
+    "GuildTemplateRoleColorsResponse": "discord_client.models.guild_template_role_colors_response",
+    "GuildTemplateRoleResponse": "discord_client.models.guild_template_role_response",
+    "GuildTemplateSnapshotResponse": "discord_client.models.guild_template_snapshot_response",
+    "GuildWelcomeChannel": "discord_client.models.guild_welcome_channel",
+    "GuildWelcomeScreenChannelResponse": "discord_client.models.guild_welcome_screen_channel_response",
+    "GuildWelcomeScreenResponse": "discord_client.models.guild_welcome_screen_response",
+    "GuildWithCountsResponse": "discord_client.models.guild_with_counts_response",
+    "IncomingWebhookInteractionRequest": "discord_client.models.incoming_webhook_interaction_request",
+    "IncomingWebhookRequestPartial": "discord_client.models.incoming_webhook_request_partial",
+    "IncomingWebhookUpdateForInteractionCallbackRequestPartial": "discord_client.models.incoming_webhook_update_for_interaction_callback_request_partial",
+    "IncomingWebhookUpdateRequestPartial": "discord_client.models.incoming_webhook_update_request_partial",
+    "InnerErrors": "discord_client.models.inner_errors",
+    "IntegrationApplicationResponse": "discord_client.models.integration_application_response",
+    "InteractionApplicationCommandAutocompleteCallbackIntegerData": "discord_client.models.interaction_application_command_autocomplete_callback_integer_data",
+    "InteractionApplicationCommandAutocompleteCallbackNumberData": "discord_client.models.interaction_application_command_autocomplete_callback_number_data",
+    "InteractionApplicationCommandAutocompleteCallbackStringData": "discord_client.models.interaction_application_command_autocomplete_callback_string_data",
+    "InteractionCallbackResponse": "discord_client.models.interaction_callback_response",
+    "InteractionCallbackResponseResource": "discord_client.models.interaction_callback_response_resource",
+    "InteractionResponse": "discord_client.models.interaction_response",
+    "InviteApplicationResponse": "discord_client.models.invite_application_response",
+    "InviteChannelRecipientResponse": "discord_client.models.invite_channel_recipient_response",
+    "InviteChannelResponse": "discord_client.models.invite_channel_response",
+    "InviteGuildResponse": "discord_client.models.invite_guild_response",
+    "KeywordRuleResponse": "discord_client.models.keyword_rule_response",
+    "KeywordTriggerMetadata": "discord_client.models.keyword_trigger_metadata",
+    "KeywordTriggerMetadataResponse": "discord_client.models.keyword_trigger_metadata_response",
+    "KeywordUpsertRequest": "discord_client.models.keyword_upsert_request",
+    "KeywordUpsertRequestPartial": "discord_client.models.keyword_upsert_request_partial",
+    "LabelComponentForModalRequest": "discord_client.models.label_component_for_modal_request",
+    "LabelComponentForModalRequestComponent": "discord_client.models.label_component_for_modal_request_component",
+    "LaunchActivityInteractionCallbackRequest": "discord_client.models.launch_activity_interaction_callback_request",
+    "LaunchActivityInteractionCallbackResponse": "discord_client.models.launch_activity_interaction_callback_response",
+    "ListApplicationEmojisResponse": "discord_client.models.list_application_emojis_response",
+    "ListAutoModerationRules200ResponseInner": "discord_client.models.list_auto_moderation_rules200_response_inner",
+    "ListChannelInvites200ResponseInner": "discord_client.models.list_channel_invites200_response_inner",
+    "ListChannelWebhooks200ResponseInner": "discord_client.models.list_channel_webhooks200_response_inner",
+    "ListGuildIntegrations200ResponseInner": "discord_client.models.list_guild_integrations200_response_inner",
+    "ListGuildScheduledEvents200ResponseInner": "discord_client.models.list_guild_scheduled_events200_response_inner",
+    "ListGuildSoundboardSoundsResponse": "discord_client.models.list_guild_soundboard_sounds_response",
+    "LobbyGuildInviteResponse": "discord_client.models.lobby_guild_invite_response",
+    "LobbyMemberRequest": "discord_client.models.lobby_member_request",
+    "LobbyMemberResponse": "discord_client.models.lobby_member_response",
+    "LobbyMessageResponse": "discord_client.models.lobby_message_response",
+    "LobbyResponse": "discord_client.models.lobby_response",
+    "MLSpamRuleResponse": "discord_client.models.ml_spam_rule_response",
+    "MLSpamUpsertRequest": "discord_client.models.ml_spam_upsert_request",
+    "MLSpamUpsertRequestPartial": "discord_client.models.ml_spam_upsert_request_partial",
+    "MediaGalleryComponentForMessageRequest": "discord_client.models.media_gallery_component_for_message_request",
+    "MediaGalleryComponentResponse": "discord_client.models.media_gallery_component_response",
+    "MediaGalleryItemRequest": "discord_client.models.media_gallery_item_request",
+    "MediaGalleryItemResponse": "discord_client.models.media_gallery_item_response",
+    "MentionSpamRuleResponse": "discord_client.models.mention_spam_rule_response",
+    "MentionSpamTriggerMetadata": "discord_client.models.mention_spam_trigger_metadata",
+    "MentionSpamTriggerMetadataResponse": "discord_client.models.mention_spam_trigger_metadata_response",
+    "MentionSpamUpsertRequest": "discord_client.models.mention_spam_upsert_request",
+    "MentionSpamUpsertRequestPartial": "discord_client.models.mention_spam_upsert_request_partial",
+    "MentionableSelectComponentForMessageRequest": "discord_client.models.mentionable_select_component_for_message_request",
+    "MentionableSelectComponentForMessageRequestDefaultValuesInner": "discord_client.models.mentionable_select_component_for_message_request_default_values_inner",
+    "MentionableSelectComponentForModalRequest": "discord_client.models.mentionable_select_component_for_modal_request",
+    "MentionableSelectComponentResponse": "discord_client.models.mentionable_select_component_response",
+    "MentionableSelectComponentResponseDefaultValuesInner": "discord_client.models.mentionable_select_component_response_default_values_inner",
+    "MessageAllowedMentionsRequest": "discord_client.models.message_allowed_mentions_request",
+    "MessageAttachmentRequest": "discord_client.models.message_attachment_request",
+    "MessageAttachmentResponse": "discord_client.models.message_attachment_response",
+    "MessageCallResponse": "discord_client.models.message_call_response",
+    "MessageComponentInteractionMetadataResponse": "discord_client.models.message_component_interaction_metadata_response",
+    "MessageCreateRequest": "discord_client.models.message_create_request",
+    "MessageEditRequestPartial": "discord_client.models.message_edit_request_partial",
+    "MessageEmbedAuthorResponse": "discord_client.models.message_embed_author_response",
+    "MessageEmbedFieldResponse": "discord_client.models.message_embed_field_response",
+    "MessageEmbedFooterResponse": "discord_client.models.message_embed_footer_response",
+    "MessageEmbedImageResponse": "discord_client.models.message_embed_image_response",
+    "MessageEmbedProviderResponse": "discord_client.models.message_embed_provider_response",
+    "MessageEmbedResponse": "discord_client.models.message_embed_response",
+    "MessageEmbedVideoResponse": "discord_client.models.message_embed_video_response",
+    "MessageInteractionResponse": "discord_client.models.message_interaction_response",
+    "MessageMentionChannelResponse": "discord_client.models.message_mention_channel_response",
+    "MessageReactionCountDetailsResponse": "discord_client.models.message_reaction_count_details_response",
+    "MessageReactionEmojiResponse": "discord_client.models.message_reaction_emoji_response",
+    "MessageReactionResponse": "discord_client.models.message_reaction_response",
+    "MessageReferenceRequest": "discord_client.models.message_reference_request",
+    "MessageReferenceResponse": "discord_client.models.message_reference_response",
+    "MessageResponse": "discord_client.models.message_response",
+    "MessageRoleSubscriptionDataResponse": "discord_client.models.message_role_subscription_data_response",
+    "MessageSnapshotResponse": "discord_client.models.message_snapshot_response",
+    "MessageStickerItemResponse": "discord_client.models.message_sticker_item_response",
+    "MinimalContentMessageResponse": "discord_client.models.minimal_content_message_response",
+    "ModalInteractionCallbackRequest": "discord_client.models.modal_interaction_callback_request",
+    "ModalInteractionCallbackRequestData": "discord_client.models.modal_interaction_callback_request_data",
+    "ModalInteractionCallbackRequestDataComponentsInner": "discord_client.models.modal_interaction_callback_request_data_components_inner",
+    "ModalSubmitInteractionMetadataResponse": "discord_client.models.modal_submit_interaction_metadata_response",
+    "ModalSubmitInteractionMetadataResponseTriggeringInteractionMetadata": "discord_client.models.modal_submit_interaction_metadata_response_triggering_interaction_metadata",
+    "MyGuildResponse": "discord_client.models.my_guild_response",
+    "NewMemberActionResponse": "discord_client.models.new_member_action_response",
+    "OAuth2GetAuthorizationResponse": "discord_client.models.o_auth2_get_authorization_response",
+    "OAuth2GetKeys": "discord_client.models.o_auth2_get_keys",
+    "OAuth2GetOpenIDConnectUserInfoResponse": "discord_client.models.o_auth2_get_open_id_connect_user_info_response",
+    "OAuth2Key": "discord_client.models.o_auth2_key",
+    "OnboardingPromptOptionRequest": "discord_client.models.onboarding_prompt_option_request",
+    "OnboardingPromptOptionResponse": "discord_client.models.onboarding_prompt_option_response",
+    "OnboardingPromptResponse": "discord_client.models.onboarding_prompt_response",
+    "PartialDiscordIntegrationResponse": "discord_client.models.partial_discord_integration_response",
+    "PartialExternalConnectionIntegrationResponse": "discord_client.models.partial_external_connection_integration_response",
+    "PartialGuildSubscriptionIntegrationResponse": "discord_client.models.partial_guild_subscription_integration_response",
+    "PartnerSdkUnmergeProvisionalAccountRequest": "discord_client.models.partner_sdk_unmerge_provisional_account_request",
+    "PinnedMessageResponse": "discord_client.models.pinned_message_response",
+    "PinnedMessagesResponse": "discord_client.models.pinned_messages_response",
+    "PollAnswerCreateRequest": "discord_client.models.poll_answer_create_request",
+    "PollAnswerDetailsResponse": "discord_client.models.poll_answer_details_response",
+    "PollAnswerResponse": "discord_client.models.poll_answer_response",
+    "PollCreateRequest": "discord_client.models.poll_create_request",
+    "PollEmoji": "discord_client.models.poll_emoji",
+    "PollEmojiCreateRequest": "discord_client.models.poll_emoji_create_request",
+    "PollMedia": "discord_client.models.poll_media",
+    "PollMediaCreateRequest": "discord_client.models.poll_media_create_request",
+    "PollMediaResponse": "discord_client.models.poll_media_response",
+    "PollResponse": "discord_client.models.poll_response",
+    "PollResultsEntryResponse": "discord_client.models.poll_results_entry_response",
+    "PollResultsResponse": "discord_client.models.poll_results_response",
+    "PongInteractionCallbackRequest": "discord_client.models.pong_interaction_callback_request",
+    "PrivateApplicationResponse": "discord_client.models.private_application_response",
+    "PrivateChannelLocation": "discord_client.models.private_channel_location",
+    "PrivateChannelResponse": "discord_client.models.private_channel_response",
+    "PrivateGroupChannelResponse": "discord_client.models.private_group_channel_response",
+    "PrivateGuildMemberResponse": "discord_client.models.private_guild_member_response",
+    "ProvisionalTokenResponse": "discord_client.models.provisional_token_response",
+    "PruneGuildRequest": "discord_client.models.prune_guild_request",
+    "PruneGuildRequestIncludeRoles": "discord_client.models.prune_guild_request_include_roles",
+    "PurchaseNotificationResponse": "discord_client.models.purchase_notification_response",
+    "QuarantineUserAction": "discord_client.models.quarantine_user_action",
+    "QuarantineUserActionResponse": "discord_client.models.quarantine_user_action_response",
+    "RatelimitedResponse": "discord_client.models.ratelimited_response",
+    "ResolvedObjectsResponse": "discord_client.models.resolved_objects_response",
+    "ResourceChannelResponse": "discord_client.models.resource_channel_response",
+    "RichEmbed": "discord_client.models.rich_embed",
+    "RichEmbedAuthor": "discord_client.models.rich_embed_author",
+    "RichEmbedField": "discord_client.models.rich_embed_field",
+    "RichEmbedFooter": "discord_client.models.rich_embed_footer",
+    "RichEmbedImage": "discord_client.models.rich_embed_image",
+    "RichEmbedProvider": "discord_client.models.rich_embed_provider",
+    "RichEmbedThumbnail": "discord_client.models.rich_embed_thumbnail",
+    "RichEmbedVideo": "discord_client.models.rich_embed_video",
+    "RoleSelectComponentForMessageRequest": "discord_client.models.role_select_component_for_message_request",
+    "RoleSelectComponentForModalRequest": "discord_client.models.role_select_component_for_modal_request",
+    "RoleSelectComponentResponse": "discord_client.models.role_select_component_response",
+    "RoleSelectDefaultValue": "discord_client.models.role_select_default_value",
+    "RoleSelectDefaultValueResponse": "discord_client.models.role_select_default_value_response",
+    "SDKMessageRequest": "discord_client.models.sdk_message_request",
+    "ScheduledEventResponse": "discord_client.models.scheduled_event_response",
+    "ScheduledEventUserResponse": "discord_client.models.scheduled_event_user_response",
+    "SectionComponentForMessageRequest": "discord_client.models.section_component_for_message_request",
+    "SectionComponentForMessageRequestAccessory": "discord_client.models.section_component_for_message_request_accessory",
+    "SectionComponentResponse": "discord_client.models.section_component_response",
+    "SectionComponentResponseAccessory": "discord_client.models.section_component_response_accessory",
+    "SeparatorComponentForMessageRequest": "discord_client.models.separator_component_for_message_request",
+    "SeparatorComponentResponse": "discord_client.models.separator_component_response",
+    "SetChannelPermissionOverwriteRequest": "discord_client.models.set_channel_permission_overwrite_request",
+    "SetGuildApplicationCommandPermissionsRequest": "discord_client.models.set_guild_application_command_permissions_request",
+    "SettingsEmojiResponse": "discord_client.models.settings_emoji_response",
+    "SlackWebhook": "discord_client.models.slack_webhook",
+    "SoundboardCreateRequest": "discord_client.models.soundboard_create_request",
+    "SoundboardPatchRequestPartial": "discord_client.models.soundboard_patch_request_partial",
+    "SoundboardSoundResponse": "discord_client.models.soundboard_sound_response",
+    "SoundboardSoundSendRequest": "discord_client.models.soundboard_sound_send_request",
+    "SpamLinkRuleResponse": "discord_client.models.spam_link_rule_response",
+    "StageInstanceResponse": "discord_client.models.stage_instance_response",
+    "StageScheduledEventCreateRequest": "discord_client.models.stage_scheduled_event_create_request",
+    "StageScheduledEventPatchRequestPartial": "discord_client.models.stage_scheduled_event_patch_request_partial",
+    "StageScheduledEventResponse": "discord_client.models.stage_scheduled_event_response",
+    "StandardStickerResponse": "discord_client.models.standard_sticker_response",
+    "StickerPackCollectionResponse": "discord_client.models.sticker_pack_collection_response",
+    "StickerPackResponse": "discord_client.models.sticker_pack_response",
+    "StringSelectComponentForMessageRequest": "discord_client.models.string_select_component_for_message_request",
+    "StringSelectComponentForModalRequest": "discord_client.models.string_select_component_for_modal_request",
+    "StringSelectComponentResponse": "discord_client.models.string_select_component_response",
+    "StringSelectOptionForRequest": "discord_client.models.string_select_option_for_request",
+    "StringSelectOptionResponse": "discord_client.models.string_select_option_response",
+    "TeamMemberResponse": "discord_client.models.team_member_response",
+    "TeamResponse": "discord_client.models.team_response",
+    "TextDisplayComponentForMessageRequest": "discord_client.models.text_display_component_for_message_request",
+    "TextDisplayComponentForModalRequest": "discord_client.models.text_display_component_for_modal_request",
+    "TextDisplayComponentResponse": "discord_client.models.text_display_component_response",
+    "TextInputComponentForModalRequest": "discord_client.models.text_input_component_for_modal_request",
+    "TextInputComponentResponse": "discord_client.models.text_input_component_response",
+    "ThreadMemberResponse": "discord_client.models.thread_member_response",
+    "ThreadMetadataResponse": "discord_client.models.thread_metadata_response",
+    "ThreadResponse": "discord_client.models.thread_response",
+    "ThreadSearchResponse": "discord_client.models.thread_search_response",
+    "ThreadSearchTagParameter": "discord_client.models.thread_search_tag_parameter",
+    "ThreadsResponse": "discord_client.models.threads_response",
+    "ThumbnailComponentForMessageRequest": "discord_client.models.thumbnail_component_for_message_request",
+    "ThumbnailComponentResponse": "discord_client.models.thumbnail_component_response",
+    "UnfurledMediaRequest": "discord_client.models.unfurled_media_request",
+    "UnfurledMediaRequestWithAttachmentReferenceRequired": "discord_client.models.unfurled_media_request_with_attachment_reference_required",
+    "UnfurledMediaResponse": "discord_client.models.unfurled_media_response",
+    "UpdateApplicationEmojiRequest": "discord_client.models.update_application_emoji_request",
+    "UpdateApplicationUserRoleConnectionRequest": "discord_client.models.update_application_user_role_connection_request",
+    "UpdateAutoModerationRuleRequest": "discord_client.models.update_auto_moderation_rule_request",
+    "UpdateChannelRequest": "discord_client.models.update_channel_request",
+    "UpdateDMRequestPartial": "discord_client.models.update_dm_request_partial",
+    "UpdateDefaultReactionEmojiRequest": "discord_client.models.update_default_reaction_emoji_request",
+    "UpdateGroupDMRequestPartial": "discord_client.models.update_group_dm_request_partial",
+    "UpdateGuildChannelRequestPartial": "discord_client.models.update_guild_channel_request_partial",
+    "UpdateGuildEmojiRequest": "discord_client.models.update_guild_emoji_request",
+    "UpdateGuildMemberRequest": "discord_client.models.update_guild_member_request",
+    "UpdateGuildOnboardingRequest": "discord_client.models.update_guild_onboarding_request",
+    "UpdateGuildScheduledEventRequest": "discord_client.models.update_guild_scheduled_event_request",
+    "UpdateGuildStickerRequest": "discord_client.models.update_guild_sticker_request",
+    "UpdateGuildTemplateRequest": "discord_client.models.update_guild_template_request",
+    "UpdateGuildWidgetSettingsRequest": "discord_client.models.update_guild_widget_settings_request",
+    "UpdateMessageInteractionCallbackRequest": "discord_client.models.update_message_interaction_callback_request",
+    "UpdateMessageInteractionCallbackResponse": "discord_client.models.update_message_interaction_callback_response",
+    "UpdateMyGuildMemberRequest": "discord_client.models.update_my_guild_member_request",
+    "UpdateOnboardingPromptRequest": "discord_client.models.update_onboarding_prompt_request",
+    "UpdateRolePositionsRequest": "discord_client.models.update_role_positions_request",
+    "UpdateRoleRequestPartial": "discord_client.models.update_role_request_partial",
+    "UpdateSelfVoiceStateRequestPartial": "discord_client.models.update_self_voice_state_request_partial",
+    "UpdateStageInstanceRequest": "discord_client.models.update_stage_instance_request",
+    "UpdateThreadRequestPartial": "discord_client.models.update_thread_request_partial",
+    "UpdateThreadTagRequest": "discord_client.models.update_thread_tag_request",
+    "UpdateVoiceStateRequestPartial": "discord_client.models.update_voice_state_request_partial",
+    "UpdateWebhookByTokenRequest": "discord_client.models.update_webhook_by_token_request",
+    "UpdateWebhookRequest": "discord_client.models.update_webhook_request",
+    "UserAvatarDecorationResponse": "discord_client.models.user_avatar_decoration_response",
+    "UserCollectiblesResponse": "discord_client.models.user_collectibles_response",
+    "UserCommunicationDisabledAction": "discord_client.models.user_communication_disabled_action",
+    "UserCommunicationDisabledActionMetadata": "discord_client.models.user_communication_disabled_action_metadata",
+    "UserCommunicationDisabledActionMetadataResponse": "discord_client.models.user_communication_disabled_action_metadata_response",
+    "UserCommunicationDisabledActionResponse": "discord_client.models.user_communication_disabled_action_response",
+    "UserGuildOnboardingResponse": "discord_client.models.user_guild_onboarding_response",
+    "UserNameplateResponse": "discord_client.models.user_nameplate_response",
+    "UserPIIResponse": "discord_client.models.user_pii_response",
+    "UserPrimaryGuildResponse": "discord_client.models.user_primary_guild_response",
+    "UserResponse": "discord_client.models.user_response",
+    "UserSelectComponentForMessageRequest": "discord_client.models.user_select_component_for_message_request",
+    "UserSelectComponentForModalRequest": "discord_client.models.user_select_component_for_modal_request",
+    "UserSelectComponentResponse": "discord_client.models.user_select_component_response",
+    "UserSelectDefaultValue": "discord_client.models.user_select_default_value",
+    "UserSelectDefaultValueResponse": "discord_client.models.user_select_default_value_response",
+    "VanityURLErrorResponse": "discord_client.models.vanity_url_error_response",
+    "VanityURLResponse": "discord_client.models.vanity_url_response",
+    "VoiceRegionResponse": "discord_client.models.voice_region_response",
+    "VoiceScheduledEventCreateRequest": "discord_client.models.voice_scheduled_event_create_request",
+    "VoiceScheduledEventPatchRequestPartial": "discord_client.models.voice_scheduled_event_patch_request_partial",
+    "VoiceScheduledEventResponse": "discord_client.models.voice_scheduled_event_response",
+    "VoiceStateResponse": "discord_client.models.voice_state_response",
+    "WebhookSlackEmbed": "discord_client.models.webhook_slack_embed",
+    "WebhookSlackEmbedField": "discord_client.models.webhook_slack_embed_field",
+    "WebhookSourceChannelResponse": "discord_client.models.webhook_source_channel_response",
+    "WebhookSourceGuildResponse": "discord_client.models.webhook_source_guild_response",
+    "WelcomeMessageResponse": "discord_client.models.welcome_message_response",
+    "WelcomeScreenPatchRequestPartial": "discord_client.models.welcome_screen_patch_request_partial",
+    "WidgetActivity": "discord_client.models.widget_activity",
+    "WidgetChannel": "discord_client.models.widget_channel",
+    "WidgetMember": "discord_client.models.widget_member",
+    "WidgetResponse": "discord_client.models.widget_response",
+    "WidgetSettingsResponse": "discord_client.models.widget_settings_response",
+}
+
+
+def __getattr__(name: str):
+    # Das Modul wird erst beim ersten Zugriff importiert und das Ergebnis im Paket zwischengespeichert
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        # Untermodule (z.B. models.issue) bleiben wie bisher als Attribut erreichbar
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
@@ -1,5 +1,65 @@
 # flake8: noqa
 
+import importlib
+from typing import TYPE_CHECKING
+
 # import apis into api package
-from discord_client.api.default_api import DefaultApi
+if TYPE_CHECKING:
+    from discord_client.api.applications_api import ApplicationsApi
+    from discord_client.api.channels_api import ChannelsApi
+    from discord_client.api.default_api import DefaultApi
+    from discord_client.api.gateway_api import GatewayApi
+    from discord_client.api.guilds_api import GuildsApi
+    from discord_client.api.interactions_api import InteractionsApi
+    from discord_client.api.invites_api import InvitesApi
+    from discord_client.api.lobbies_api import LobbiesApi
+    from discord_client.api.oauth2_api import Oauth2Api
+    from discord_client.api.partner_sdk_api import PartnerSdkApi
+    from discord_client.api.soundboard_default_sounds_api import SoundboardDefaultSoundsApi
+    from discord_client.api.stage_instances_api import StageInstancesApi
+    from discord_client.api.sticker_packs_api import StickerPacksApi
+    from discord_client.api.stickers_api import StickersApi
+    from discord_client.api.users_api import UsersApi
+    from discord_client.api.voice_api import VoiceApi
+    from discord_client.api.webhooks_api import WebhooksApi
+
+# APIs werden erst beim ersten Zugriff importiert
+_lazy_imports = {
+    "ApplicationsApi": "discord_client.api.applications_api",
+    "ChannelsApi": "discord_client.api.channels_api",
+    "DefaultApi": "discord_client.api.default_api",
+    "GatewayApi": "discord_client.api.gateway_api",
+    "GuildsApi": "discord_client.api.guilds_api",
+    "InteractionsApi": "discord_client.api.interactions_api",
+    "InvitesApi": "discord_client.api.invites_api",
+    "LobbiesApi": "discord_client.api.lobbies_api",
+    "Oauth2Api": "discord_client.api.oauth2_api",
+    "PartnerSdkApi": "discord_client.api.partner_sdk_api",
+    "SoundboardDefaultSoundsApi": "discord_client.api.soundboard_default_sounds_api",
+    "StageInstancesApi": "discord_client.api.stage_instances_api",
+    "StickerPacksApi": "discord_client.api.sticker_packs_api",
+    "StickersApi": "discord_client.api.stickers_api",
+    "UsersApi": "discord_client.api.users_api",
+    "VoiceApi": "discord_client.api.voice_api",
+    "WebhooksApi": "discord_client.api.webhooks_api",
+}
+
+
+def __getattr__(name: str):
+    # Das Modul wird erst beim ersten Zugriff importiert und das Ergebnis im Paket zwischengespeichert
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        # Untermodule (z.B. models.issue) bleiben wie bisher als Attribut erreichbar
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
@@ -12,479 +12,980 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import importlib
+from typing import TYPE_CHECKING
+
 # import models into model package
-from src.discord_client.models.account_response import AccountResponse
-from src.discord_client.models.action_row_component_for_message_request import ActionRowComponentForMessageRequest
-from src.discord_client.models.action_row_component_for_message_request_components_inner import ActionRowComponentForMessageRequestComponentsInner
-from src.discord_client.models.action_row_component_for_modal_request import ActionRowComponentForModalRequest
-from src.discord_client.models.action_row_component_response import ActionRowComponentResponse
-from src.discord_client.models.action_row_component_response_components_inner import ActionRowComponentResponseComponentsInner
-from src.discord_client.models.activities_attachment_response import ActivitiesAttachmentResponse
-from src.discord_client.models.add_group_dm_user201_response import AddGroupDmUser201Response
-from src.discord_client.models.add_group_dm_user_request import AddGroupDmUserRequest
-from src.discord_client.models.add_lobby_member_request import AddLobbyMemberRequest
-from src.discord_client.models.application_command_attachment_option import ApplicationCommandAttachmentOption
-from src.discord_client.models.application_command_attachment_option_response import ApplicationCommandAttachmentOptionResponse
-from src.discord_client.models.application_command_autocomplete_callback_request import ApplicationCommandAutocompleteCallbackRequest
-from src.discord_client.models.application_command_autocomplete_callback_request_data import ApplicationCommandAutocompleteCallbackRequestData
-from src.discord_client.models.application_command_boolean_option import ApplicationCommandBooleanOption
-from src.discord_client.models.application_command_boolean_option_response import ApplicationCommandBooleanOptionResponse
-from src.discord_client.models.application_command_channel_option import ApplicationCommandChannelOption
-from src.discord_client.models.application_command_channel_option_response import ApplicationCommandChannelOptionResponse
-from src.discord_client.models.application_command_create_request import ApplicationCommandCreateRequest
-from src.discord_client.models.application_command_create_request_options_inner import ApplicationCommandCreateRequestOptionsInner
-from src.discord_client.models.application_command_integer_option import ApplicationCommandIntegerOption
-from src.discord_client.models.application_command_integer_option_response import ApplicationCommandIntegerOptionResponse
-from src.discord_client.models.application_command_interaction_metadata_response import ApplicationCommandInteractionMetadataResponse
-from src.discord_client.models.application_command_mentionable_option import ApplicationCommandMentionableOption
-from src.discord_client.models.application_command_mentionable_option_response import ApplicationCommandMentionableOptionResponse
-from src.discord_client.models.application_command_number_option import ApplicationCommandNumberOption
-from src.discord_client.models.application_command_number_option_response import ApplicationCommandNumberOptionResponse
-from src.discord_client.models.application_command_option_integer_choice import ApplicationCommandOptionIntegerChoice
-from src.discord_client.models.application_command_option_integer_choice_response import ApplicationCommandOptionIntegerChoiceResponse
-from src.discord_client.models.application_command_option_number_choice import ApplicationCommandOptionNumberChoice
-from src.discord_client.models.application_command_option_number_choice_response import ApplicationCommandOptionNumberChoiceResponse
-from src.discord_client.models.application_command_option_string_choice import ApplicationCommandOptionStringChoice
-from src.discord_client.models.application_command_option_string_choice_response import ApplicationCommandOptionStringChoiceResponse
-from src.discord_client.models.application_command_patch_request_partial import ApplicationCommandPatchRequestPartial
-from src.discord_client.models.application_command_permission import ApplicationCommandPermission
-from src.discord_client.models.application_command_response import ApplicationCommandResponse
-from src.discord_client.models.application_command_response_options_inner import ApplicationCommandResponseOptionsInner
-from src.discord_client.models.application_command_role_option import ApplicationCommandRoleOption
-from src.discord_client.models.application_command_role_option_response import ApplicationCommandRoleOptionResponse
-from src.discord_client.models.application_command_string_option import ApplicationCommandStringOption
-from src.discord_client.models.application_command_string_option_response import ApplicationCommandStringOptionResponse
-from src.discord_client.models.application_command_subcommand_group_option import ApplicationCommandSubcommandGroupOption
-from src.discord_client.models.application_command_subcommand_group_option_response import ApplicationCommandSubcommandGroupOptionResponse
-from src.discord_client.models.application_command_subcommand_option import ApplicationCommandSubcommandOption
-from src.discord_client.models.application_command_subcommand_option_options_inner import ApplicationCommandSubcommandOptionOptionsInner
-from src.discord_client.models.application_command_subcommand_option_response import ApplicationCommandSubcommandOptionResponse
-from src.discord_client.models.application_command_subcommand_option_response_options_inner import ApplicationCommandSubcommandOptionResponseOptionsInner
-from src.discord_client.models.application_command_update_request import ApplicationCommandUpdateRequest
-from src.discord_client.models.application_command_user_option import ApplicationCommandUserOption
-from src.discord_client.models.application_command_user_option_response import ApplicationCommandUserOptionResponse
-from src.discord_client.models.application_form_partial import ApplicationFormPartial
-from src.discord_client.models.application_form_partial_description import ApplicationFormPartialDescription
-from src.discord_client.models.application_form_partial_integration_types_config_value import ApplicationFormPartialIntegrationTypesConfigValue
-from src.discord_client.models.application_incoming_webhook_response import ApplicationIncomingWebhookResponse
-from src.discord_client.models.application_integration_type_configuration import ApplicationIntegrationTypeConfiguration
-from src.discord_client.models.application_integration_type_configuration_response import ApplicationIntegrationTypeConfigurationResponse
-from src.discord_client.models.application_o_auth2_install_params import ApplicationOAuth2InstallParams
-from src.discord_client.models.application_o_auth2_install_params_response import ApplicationOAuth2InstallParamsResponse
-from src.discord_client.models.application_response import ApplicationResponse
-from src.discord_client.models.application_role_connections_metadata_item_request import ApplicationRoleConnectionsMetadataItemRequest
-from src.discord_client.models.application_role_connections_metadata_item_response import ApplicationRoleConnectionsMetadataItemResponse
-from src.discord_client.models.application_user_role_connection_response import ApplicationUserRoleConnectionResponse
-from src.discord_client.models.attachment_response import AttachmentResponse
-from src.discord_client.models.audit_log_entry_response import AuditLogEntryResponse
-from src.discord_client.models.audit_log_object_change_response import AuditLogObjectChangeResponse
-from src.discord_client.models.ban_user_from_guild_request import BanUserFromGuildRequest
-from src.discord_client.models.base_create_message_create_request import BaseCreateMessageCreateRequest
-from src.discord_client.models.base_create_message_create_request_components_inner import BaseCreateMessageCreateRequestComponentsInner
-from src.discord_client.models.basic_application_response import BasicApplicationResponse
-from src.discord_client.models.basic_guild_member_response import BasicGuildMemberResponse
-from src.discord_client.models.basic_message_response import BasicMessageResponse
-from src.discord_client.models.basic_message_response_components_inner import BasicMessageResponseComponentsInner
-from src.discord_client.models.basic_message_response_interaction_metadata import BasicMessageResponseInteractionMetadata
-from src.discord_client.models.basic_message_response_nonce import BasicMessageResponseNonce
-from src.discord_client.models.block_message_action import BlockMessageAction
-from src.discord_client.models.block_message_action_metadata import BlockMessageActionMetadata
-from src.discord_client.models.block_message_action_metadata_response import BlockMessageActionMetadataResponse
-from src.discord_client.models.block_message_action_response import BlockMessageActionResponse
-from src.discord_client.models.bot_account_patch_request import BotAccountPatchRequest
-from src.discord_client.models.bot_add_guild_member_request import BotAddGuildMemberRequest
-from src.discord_client.models.bot_partner_sdk_token_request import BotPartnerSdkTokenRequest
-from src.discord_client.models.bot_partner_sdk_unmerge_provisional_account_request import BotPartnerSdkUnmergeProvisionalAccountRequest
-from src.discord_client.models.bulk_ban_users_request import BulkBanUsersRequest
-from src.discord_client.models.bulk_ban_users_response import BulkBanUsersResponse
-from src.discord_client.models.bulk_delete_messages_request import BulkDeleteMessagesRequest
-from src.discord_client.models.bulk_lobby_member_request import BulkLobbyMemberRequest
-from src.discord_client.models.bulk_update_guild_channels_request_inner import BulkUpdateGuildChannelsRequestInner
-from src.discord_client.models.button_component_for_message_request import ButtonComponentForMessageRequest
-from src.discord_client.models.button_component_response import ButtonComponentResponse
-from src.discord_client.models.channel_follower_response import ChannelFollowerResponse
-from src.discord_client.models.channel_follower_webhook_response import ChannelFollowerWebhookResponse
-from src.discord_client.models.channel_permission_overwrite_request import ChannelPermissionOverwriteRequest
-from src.discord_client.models.channel_permission_overwrite_response import ChannelPermissionOverwriteResponse
-from src.discord_client.models.channel_select_component_for_message_request import ChannelSelectComponentForMessageRequest
-from src.discord_client.models.channel_select_component_for_modal_request import ChannelSelectComponentForModalRequest
-from src.discord_client.models.channel_select_component_response import ChannelSelectComponentResponse
-from src.discord_client.models.channel_select_default_value import ChannelSelectDefaultValue
-from src.discord_client.models.channel_select_default_value_response import ChannelSelectDefaultValueResponse
-from src.discord_client.models.command_permission_response import CommandPermissionResponse
-from src.discord_client.models.command_permissions_response import CommandPermissionsResponse
-from src.discord_client.models.component_emoji_for_request import ComponentEmojiForRequest
-from src.discord_client.models.component_emoji_response import ComponentEmojiResponse
-from src.discord_client.models.connected_account_guild_response import ConnectedAccountGuildResponse
-from src.discord_client.models.connected_account_integration_response import ConnectedAccountIntegrationResponse
-from src.discord_client.models.connected_account_response import ConnectedAccountResponse
-from src.discord_client.models.container_component_for_message_request import ContainerComponentForMessageRequest
-from src.discord_client.models.container_component_for_message_request_components_inner import ContainerComponentForMessageRequestComponentsInner
-from src.discord_client.models.container_component_response import ContainerComponentResponse
-from src.discord_client.models.container_component_response_components_inner import ContainerComponentResponseComponentsInner
-from src.discord_client.models.create_application_emoji_request import CreateApplicationEmojiRequest
-from src.discord_client.models.create_auto_moderation_rule200_response import CreateAutoModerationRule200Response
-from src.discord_client.models.create_auto_moderation_rule_request import CreateAutoModerationRuleRequest
-from src.discord_client.models.create_channel_invite200_response import CreateChannelInvite200Response
-from src.discord_client.models.create_channel_invite_request import CreateChannelInviteRequest
-from src.discord_client.models.create_entitlement_request_data import CreateEntitlementRequestData
-from src.discord_client.models.create_forum_thread_request import CreateForumThreadRequest
-from src.discord_client.models.create_group_dm_invite_request import CreateGroupDMInviteRequest
-from src.discord_client.models.create_guild_channel_request import CreateGuildChannelRequest
-from src.discord_client.models.create_guild_emoji_request import CreateGuildEmojiRequest
-from src.discord_client.models.create_guild_invite_request import CreateGuildInviteRequest
-from src.discord_client.models.create_guild_scheduled_event_request import CreateGuildScheduledEventRequest
-from src.discord_client.models.create_guild_template_request import CreateGuildTemplateRequest
-from src.discord_client.models.create_interaction_response_request import CreateInteractionResponseRequest
-from src.discord_client.models.create_lobby_request import CreateLobbyRequest
-from src.discord_client.models.create_message_interaction_callback_request import CreateMessageInteractionCallbackRequest
-from src.discord_client.models.create_message_interaction_callback_response import CreateMessageInteractionCallbackResponse
-from src.discord_client.models.create_or_join_lobby_request import CreateOrJoinLobbyRequest
-from src.discord_client.models.create_or_update_thread_tag_request import CreateOrUpdateThreadTagRequest
-from src.discord_client.models.create_private_channel_request import CreatePrivateChannelRequest
-from src.discord_client.models.create_role_request import CreateRoleRequest
-from src.discord_client.models.create_stage_instance_request import CreateStageInstanceRequest
-from src.discord_client.models.create_text_thread_with_message_request import CreateTextThreadWithMessageRequest
-from src.discord_client.models.create_text_thread_without_message_request import CreateTextThreadWithoutMessageRequest
-from src.discord_client.models.create_thread_request import CreateThreadRequest
-from src.discord_client.models.create_webhook_request import CreateWebhookRequest
-from src.discord_client.models.created_thread_response import CreatedThreadResponse
-from src.discord_client.models.custom_client_theme_response import CustomClientThemeResponse
-from src.discord_client.models.custom_client_theme_share_request import CustomClientThemeShareRequest
-from src.discord_client.models.default_keyword_list_trigger_metadata import DefaultKeywordListTriggerMetadata
-from src.discord_client.models.default_keyword_list_trigger_metadata_response import DefaultKeywordListTriggerMetadataResponse
-from src.discord_client.models.default_keyword_list_upsert_request import DefaultKeywordListUpsertRequest
-from src.discord_client.models.default_keyword_list_upsert_request_actions_inner import DefaultKeywordListUpsertRequestActionsInner
-from src.discord_client.models.default_keyword_list_upsert_request_partial import DefaultKeywordListUpsertRequestPartial
-from src.discord_client.models.default_keyword_rule_response import DefaultKeywordRuleResponse
-from src.discord_client.models.default_keyword_rule_response_actions_inner import DefaultKeywordRuleResponseActionsInner
-from src.discord_client.models.default_reaction_emoji_response import DefaultReactionEmojiResponse
-from src.discord_client.models.discord_integration_response import DiscordIntegrationResponse
-from src.discord_client.models.edit_lobby_channel_link_request import EditLobbyChannelLinkRequest
-from src.discord_client.models.embedded_activity_instance import EmbeddedActivityInstance
-from src.discord_client.models.embedded_activity_instance_location import EmbeddedActivityInstanceLocation
-from src.discord_client.models.emoji_response import EmojiResponse
-from src.discord_client.models.entitlement_response import EntitlementResponse
-from src.discord_client.models.entity_metadata_external import EntityMetadataExternal
-from src.discord_client.models.entity_metadata_external_response import EntityMetadataExternalResponse
-from src.discord_client.models.error import Error
-from src.discord_client.models.error_details import ErrorDetails
-from src.discord_client.models.error_response import ErrorResponse
-from src.discord_client.models.execute_webhook_request import ExecuteWebhookRequest
-from src.discord_client.models.external_connection_integration_response import ExternalConnectionIntegrationResponse
-from src.discord_client.models.external_scheduled_event_create_request import ExternalScheduledEventCreateRequest
-from src.discord_client.models.external_scheduled_event_patch_request_partial import ExternalScheduledEventPatchRequestPartial
-from src.discord_client.models.external_scheduled_event_response import ExternalScheduledEventResponse
-from src.discord_client.models.file_component_for_message_request import FileComponentForMessageRequest
-from src.discord_client.models.file_component_response import FileComponentResponse
-from src.discord_client.models.file_upload_component_for_modal_request import FileUploadComponentForModalRequest
-from src.discord_client.models.flag_to_channel_action import FlagToChannelAction
-from src.discord_client.models.flag_to_channel_action_metadata import FlagToChannelActionMetadata
-from src.discord_client.models.flag_to_channel_action_metadata_response import FlagToChannelActionMetadataResponse
-from src.discord_client.models.flag_to_channel_action_response import FlagToChannelActionResponse
-from src.discord_client.models.follow_channel_request import FollowChannelRequest
-from src.discord_client.models.forum_tag_response import ForumTagResponse
-from src.discord_client.models.friend_invite_response import FriendInviteResponse
-from src.discord_client.models.gateway_bot_response import GatewayBotResponse
-from src.discord_client.models.gateway_bot_session_start_limit_response import GatewayBotSessionStartLimitResponse
-from src.discord_client.models.gateway_response import GatewayResponse
-from src.discord_client.models.get_channel200_response import GetChannel200Response
-from src.discord_client.models.get_entitlements_sku_ids_parameter import GetEntitlementsSkuIdsParameter
-from src.discord_client.models.get_sticker200_response import GetSticker200Response
-from src.discord_client.models.github_author import GithubAuthor
-from src.discord_client.models.github_check_app import GithubCheckApp
-from src.discord_client.models.github_check_pull_request import GithubCheckPullRequest
-from src.discord_client.models.github_check_run import GithubCheckRun
-from src.discord_client.models.github_check_run_output import GithubCheckRunOutput
-from src.discord_client.models.github_check_suite import GithubCheckSuite
-from src.discord_client.models.github_comment import GithubComment
-from src.discord_client.models.github_commit import GithubCommit
-from src.discord_client.models.github_discussion import GithubDiscussion
-from src.discord_client.models.github_issue import GithubIssue
-from src.discord_client.models.github_release import GithubRelease
-from src.discord_client.models.github_repository import GithubRepository
-from src.discord_client.models.github_review import GithubReview
-from src.discord_client.models.github_user import GithubUser
-from src.discord_client.models.github_webhook import GithubWebhook
-from src.discord_client.models.group_dm_invite_response import GroupDMInviteResponse
-from src.discord_client.models.guild_audit_log_response import GuildAuditLogResponse
-from src.discord_client.models.guild_audit_log_response_integrations_inner import GuildAuditLogResponseIntegrationsInner
-from src.discord_client.models.guild_ban_response import GuildBanResponse
-from src.discord_client.models.guild_channel_location import GuildChannelLocation
-from src.discord_client.models.guild_channel_response import GuildChannelResponse
-from src.discord_client.models.guild_home_settings_response import GuildHomeSettingsResponse
-from src.discord_client.models.guild_incoming_webhook_response import GuildIncomingWebhookResponse
-from src.discord_client.models.guild_invite_response import GuildInviteResponse
-from src.discord_client.models.guild_member_response import GuildMemberResponse
-from src.discord_client.models.guild_onboarding_response import GuildOnboardingResponse
-from src.discord_client.models.guild_patch_request_partial import GuildPatchRequestPartial
-from src.discord_client.models.guild_preview_response import GuildPreviewResponse
-from src.discord_client.models.guild_product_purchase_response import GuildProductPurchaseResponse
-from src.discord_client.models.guild_prune_response import GuildPruneResponse
-from src.discord_client.models.guild_response import GuildResponse
-from src.discord_client.models.guild_role_colors_response import GuildRoleColorsResponse
-from src.discord_client.models.guild_role_response import GuildRoleResponse
-from src.discord_client.models.guild_role_tags_response import GuildRoleTagsResponse
-from src.discord_client.models.guild_sticker_response import GuildStickerResponse
-from src.discord_client.models.guild_subscription_integration_response import GuildSubscriptionIntegrationResponse
-from src.discord_client.models.guild_template_channel_response import GuildTemplateChannelResponse
-from src.discord_client.models.guild_template_channel_tags import GuildTemplateChannelTags
-from src.discord_client.models.guild_template_response import GuildTemplateResponse
-from src.discord_client.models.guild_template_role_colors_response import GuildTemplateRoleColorsResponse
-from src.discord_client.models.guild_template_role_response import GuildTemplateRoleResponse
-from src.discord_client.models.guild_template_snapshot_response import GuildTemplateSnapshotResponse
-from src.discord_client.models.guild_welcome_channel import GuildWelcomeChannel
-from src.discord_client.models.guild_welcome_screen_channel_response import GuildWelcomeScreenChannelResponse
-from src.discord_client.models.guild_welcome_screen_response import GuildWelcomeScreenResponse
-from src.discord_client.models.guild_with_counts_response import GuildWithCountsResponse
-from src.discord_client.models.incoming_webhook_interaction_request import IncomingWebhookInteractionRequest
-from src.discord_client.models.incoming_webhook_request_partial import IncomingWebhookRequestPartial
-from src.discord_client.models.incoming_webhook_update_for_interaction_callback_request_partial import IncomingWebhookUpdateForInteractionCallbackRequestPartial
-from src.discord_client.models.incoming_webhook_update_request_partial import IncomingWebhookUpdateRequestPartial
-from src.discord_client.models.inner_errors import InnerErrors
-from src.discord_client.models.integration_application_response import IntegrationApplicationResponse
-from src.discord_client.models.interaction_application_command_autocomplete_callback_integer_data import InteractionApplicationCommandAutocompleteCallbackIntegerData
-from src.discord_client.models.interaction_application_command_autocomplete_callback_number_data import InteractionApplicationCommandAutocompleteCallbackNumberData
-from src.discord_client.models.interaction_application_command_autocomplete_callback_string_data import InteractionApplicationCommandAutocompleteCallbackStringData
-from src.discord_client.models.interaction_callback_response import InteractionCallbackResponse
-from src.discord_client.models.interaction_callback_response_resource import InteractionCallbackResponseResource
-from src.discord_client.models.interaction_response import InteractionResponse
-from src.discord_client.models.invite_application_response import InviteApplicationResponse
-from src.discord_client.models.invite_channel_recipient_response import InviteChannelRecipientResponse
-from src.discord_client.models.invite_channel_response import InviteChannelResponse
-from src.discord_client.models.invite_guild_response import InviteGuildResponse
-from src.discord_client.models.keyword_rule_response import KeywordRuleResponse
-from src.discord_client.models.keyword_trigger_metadata import KeywordTriggerMetadata
-from src.discord_client.models.keyword_trigger_metadata_response import KeywordTriggerMetadataResponse
-from src.discord_client.models.keyword_upsert_request import KeywordUpsertRequest
-from src.discord_client.models.keyword_upsert_request_partial import KeywordUpsertRequestPartial
-from src.discord_client.models.label_component_for_modal_request import LabelComponentForModalRequest
-from src.discord_client.models.label_component_for_modal_request_component import LabelComponentForModalRequestComponent
-from src.discord_client.models.launch_activity_interaction_callback_request import LaunchActivityInteractionCallbackRequest
-from src.discord_client.models.launch_activity_interaction_callback_response import LaunchActivityInteractionCallbackResponse
-from src.discord_client.models.list_application_emojis_response import ListApplicationEmojisResponse
-from src.discord_client.models.list_auto_moderation_rules200_response_inner import ListAutoModerationRules200ResponseInner
-from src.discord_client.models.list_channel_invites200_response_inner import ListChannelInvites200ResponseInner
-from src.discord_client.models.list_channel_webhooks200_response_inner import ListChannelWebhooks200ResponseInner
-from src.discord_client.models.list_guild_integrations200_response_inner import ListGuildIntegrations200ResponseInner
-from src.discord_client.models.list_guild_scheduled_events200_response_inner import ListGuildScheduledEvents200ResponseInner
-from src.discord_client.models.list_guild_soundboard_sounds_response import ListGuildSoundboardSoundsResponse
-from src.discord_client.models.lobby_guild_invite_response import LobbyGuildInviteResponse
-from src.discord_client.models.lobby_member_request import LobbyMemberRequest
-from src.discord_client.models.lobby_member_response import LobbyMemberResponse
-from src.discord_client.models.lobby_message_response import LobbyMessageResponse
-from src.discord_client.models.lobby_response import LobbyResponse
-from src.discord_client.models.ml_spam_rule_response import MLSpamRuleResponse
-from src.discord_client.models.ml_spam_upsert_request import MLSpamUpsertRequest
-from src.discord_client.models.ml_spam_upsert_request_partial import MLSpamUpsertRequestPartial
-from src.discord_client.models.media_gallery_component_for_message_request import MediaGalleryComponentForMessageRequest
-from src.discord_client.models.media_gallery_component_response import MediaGalleryComponentResponse
-from src.discord_client.models.media_gallery_item_request import MediaGalleryItemRequest
-from src.discord_client.models.media_gallery_item_response import MediaGalleryItemResponse
-from src.discord_client.models.mention_spam_rule_response import MentionSpamRuleResponse
-from src.discord_client.models.mention_spam_trigger_metadata import MentionSpamTriggerMetadata
-from src.discord_client.models.mention_spam_trigger_metadata_response import MentionSpamTriggerMetadataResponse
-from src.discord_client.models.mention_spam_upsert_request import MentionSpamUpsertRequest
-from src.discord_client.models.mention_spam_upsert_request_partial import MentionSpamUpsertRequestPartial
-from src.discord_client.models.mentionable_select_component_for_message_request import MentionableSelectComponentForMessageRequest
-from src.discord_client.models.mentionable_select_component_for_message_request_default_values_inner import MentionableSelectComponentForMessageRequestDefaultValuesInner
-from src.discord_client.models.mentionable_select_component_for_modal_request import MentionableSelectComponentForModalRequest
-from src.discord_client.models.mentionable_select_component_response import MentionableSelectComponentResponse
-from src.discord_client.models.mentionable_select_component_response_default_values_inner import MentionableSelectComponentResponseDefaultValuesInner
-from src.discord_client.models.message_allowed_mentions_request import MessageAllowedMentionsRequest
-from src.discord_client.models.message_attachment_request import MessageAttachmentRequest
-from src.discord_client.models.message_attachment_response import MessageAttachmentResponse
-from src.discord_client.models.message_call_response import MessageCallResponse
-from src.discord_client.models.message_component_interaction_metadata_response import MessageComponentInteractionMetadataResponse
-from src.discord_client.models.message_create_request import MessageCreateRequest
-from src.discord_client.models.message_edit_request_partial import MessageEditRequestPartial
-from src.discord_client.models.message_embed_author_response import MessageEmbedAuthorResponse
-from src.discord_client.models.message_embed_field_response import MessageEmbedFieldResponse
-from src.discord_client.models.message_embed_footer_response import MessageEmbedFooterResponse
-from src.discord_client.models.message_embed_image_response import MessageEmbedImageResponse
-from src.discord_client.models.message_embed_provider_response import MessageEmbedProviderResponse
-from src.discord_client.models.message_embed_response import MessageEmbedResponse
-from src.discord_client.models.message_embed_video_response import MessageEmbedVideoResponse
-from src.discord_client.models.message_interaction_response import MessageInteractionResponse
-from src.discord_client.models.message_mention_channel_response import MessageMentionChannelResponse
-from src.discord_client.models.message_reaction_count_details_response import MessageReactionCountDetailsResponse
-from src.discord_client.models.message_reaction_emoji_response import MessageReactionEmojiResponse
-from src.discord_client.models.message_reaction_response import MessageReactionResponse
-from src.discord_client.models.message_reference_request import MessageReferenceRequest
-from src.discord_client.models.message_reference_response import MessageReferenceResponse
-from src.discord_client.models.message_response import MessageResponse
-from src.discord_client.models.message_role_subscription_data_response import MessageRoleSubscriptionDataResponse
-from src.discord_client.models.message_snapshot_response import MessageSnapshotResponse
-from src.discord_client.models.message_sticker_item_response import MessageStickerItemResponse
-from src.discord_client.models.minimal_content_message_response import MinimalContentMessageResponse
-from src.discord_client.models.modal_interaction_callback_request import ModalInteractionCallbackRequest
-from src.discord_client.models.modal_interaction_callback_request_data import ModalInteractionCallbackRequestData
-from src.discord_client.models.modal_interaction_callback_request_data_components_inner import ModalInteractionCallbackRequestDataComponentsInner
-from src.discord_client.models.modal_submit_interaction_metadata_response import ModalSubmitInteractionMetadataResponse
-from src.discord_client.models.modal_submit_interaction_metadata_response_triggering_interaction_metadata import ModalSubmitInteractionMetadataResponseTriggeringInteractionMetadata
-from src.discord_client.models.my_guild_response import MyGuildResponse
-from src.discord_client.models.new_member_action_response import NewMemberActionResponse
-from src.discord_client.models.o_auth2_get_authorization_response import OAuth2GetAuthorizationResponse
-from src.discord_client.models.o_auth2_get_keys import OAuth2GetKeys
-from src.discord_client.models.o_auth2_get_open_id_connect_user_info_response import OAuth2GetOpenIDConnectUserInfoResponse
-from src.discord_client.models.o_auth2_key import OAuth2Key
-from src.discord_client.models.onboarding_prompt_option_request import OnboardingPromptOptionRequest
-from src.discord_client.models.onboarding_prompt_option_response import OnboardingPromptOptionResponse
-from src.discord_client.models.onboarding_prompt_response import OnboardingPromptResponse
-from src.discord_client.models.partial_discord_integration_response import PartialDiscordIntegrationResponse
-from src.discord_client.models.partial_external_connection_integration_response import PartialExternalConnectionIntegrationResponse
-from src.discord_client.models.partial_guild_subscription_integration_response import PartialGuildSubscriptionIntegrationResponse
-from src.discord_client.models.partner_sdk_unmerge_provisional_account_request import PartnerSdkUnmergeProvisionalAccountRequest
-from src.discord_client.models.pinned_message_response import PinnedMessageResponse
-from src.discord_client.models.pinned_messages_response import PinnedMessagesResponse
-from src.discord_client.models.poll_answer_create_request import PollAnswerCreateRequest
-from src.discord_client.models.poll_answer_details_response import PollAnswerDetailsResponse
-from src.discord_client.models.poll_answer_response import PollAnswerResponse
-from src.discord_client.models.poll_create_request import PollCreateRequest
-from src.discord_client.models.poll_emoji import PollEmoji
-from src.discord_client.models.poll_emoji_create_request import PollEmojiCreateRequest
-from src.discord_client.models.poll_media import PollMedia
-from src.discord_client.models.poll_media_create_request import PollMediaCreateRequest
-from src.discord_client.models.poll_media_response import PollMediaResponse
-from src.discord_client.models.poll_response import PollResponse
-from src.discord_client.models.poll_results_entry_response import PollResultsEntryResponse
-from src.discord_client.models.poll_results_response import PollResultsResponse
-from src.discord_client.models.pong_interaction_callback_request import PongInteractionCallbackRequest
-from src.discord_client.models.private_application_response import PrivateApplicationResponse
-from src.discord_client.models.private_channel_location import PrivateChannelLocation
-from src.discord_client.models.private_channel_response import PrivateChannelResponse
-from src.discord_client.models.private_group_channel_response import PrivateGroupChannelResponse
-from src.discord_client.models.private_guild_member_response import PrivateGuildMemberResponse
-from src.discord_client.models.provisional_token_response import ProvisionalTokenResponse
-from src.discord_client.models.prune_guild_request import PruneGuildRequest
-from src.discord_client.models.prune_guild_request_include_roles import PruneGuildRequestIncludeRoles
-from src.discord_client.models.purchase_notification_response import PurchaseNotificationResponse
-from src.discord_client.models.quarantine_user_action import QuarantineUserAction
-from src.discord_client.models.quarantine_user_action_response import QuarantineUserActionResponse
-from src.discord_client.models.ratelimited_response import RatelimitedResponse
-from src.discord_client.models.resolved_objects_response import ResolvedObjectsResponse
-from src.discord_client.models.resource_channel_response import ResourceChannelResponse
-from src.discord_client.models.rich_embed import RichEmbed
-from src.discord_client.models.rich_embed_author import RichEmbedAuthor
-from src.discord_client.models.rich_embed_field import RichEmbedField
-from src.discord_client.models.rich_embed_footer import RichEmbedFooter
-from src.discord_client.models.rich_embed_image import RichEmbedImage
-from src.discord_client.models.rich_embed_provider import RichEmbedProvider
-from src.discord_client.models.rich_embed_thumbnail import RichEmbedThumbnail
-from src.discord_client.models.rich_embed_video import RichEmbedVideo
-from src.discord_client.models.role_select_component_for_message_request import RoleSelectComponentForMessageRequest
-from src.discord_client.models.role_select_component_for_modal_request import RoleSelectComponentForModalRequest
-from src.discord_client.models.role_select_component_response import RoleSelectComponentResponse
-from src.discord_client.models.role_select_default_value import RoleSelectDefaultValue
-from src.discord_client.models.role_select_default_value_response import RoleSelectDefaultValueResponse
-from src.discord_client.models.sdk_message_request import SDKMessageRequest
-from src.discord_client.models.scheduled_event_response import ScheduledEventResponse
-from src.discord_client.models.scheduled_event_user_response import ScheduledEventUserResponse
-from src.discord_client.models.section_component_for_message_request import SectionComponentForMessageRequest
-from src.discord_client.models.section_component_for_message_request_accessory import SectionComponentForMessageRequestAccessory
-from src.discord_client.models.section_component_response import SectionComponentResponse
-from src.discord_client.models.section_component_response_accessory import SectionComponentResponseAccessory
-from src.discord_client.models.separator_component_for_message_request import SeparatorComponentForMessageRequest
-from src.discord_client.models.separator_component_response import SeparatorComponentResponse
-from src.discord_client.models.set_channel_permission_overwrite_request import SetChannelPermissionOverwriteRequest
-from src.discord_client.models.set_guild_application_command_permissions_request import SetGuildApplicationCommandPermissionsRequest
-from src.discord_client.models.settings_emoji_response import SettingsEmojiResponse
-from src.discord_client.models.slack_webhook import SlackWebhook
-from src.discord_client.models.soundboard_create_request import SoundboardCreateRequest
-from src.discord_client.models.soundboard_patch_request_partial import SoundboardPatchRequestPartial
-from src.discord_client.models.soundboard_sound_response import SoundboardSoundResponse
-from src.discord_client.models.soundboard_sound_send_request import SoundboardSoundSendRequest
-from src.discord_client.models.spam_link_rule_response import SpamLinkRuleResponse
-from src.discord_client.models.stage_instance_response import StageInstanceResponse
-from src.discord_client.models.stage_scheduled_event_create_request import StageScheduledEventCreateRequest
-from src.discord_client.models.stage_scheduled_event_patch_request_partial import StageScheduledEventPatchRequestPartial
-from src.discord_client.models.stage_scheduled_event_response import StageScheduledEventResponse
-from src.discord_client.models.standard_sticker_response import StandardStickerResponse
-from src.discord_client.models.sticker_pack_collection_response import StickerPackCollectionResponse
-from src.discord_client.models.sticker_pack_response import StickerPackResponse
-from src.discord_client.models.string_select_component_for_message_request import StringSelectComponentForMessageRequest
-from src.discord_client.models.string_select_component_for_modal_request import StringSelectComponentForModalRequest
-from src.discord_client.models.string_select_component_response import StringSelectComponentResponse
-from src.discord_client.models.string_select_option_for_request import StringSelectOptionForRequest
-from src.discord_client.models.string_select_option_response import StringSelectOptionResponse
-from src.discord_client.models.team_member_response import TeamMemberResponse
-from src.discord_client.models.team_response import TeamResponse
-from src.discord_client.models.text_display_component_for_message_request import TextDisplayComponentForMessageRequest
-from src.discord_client.models.text_display_component_for_modal_request import TextDisplayComponentForModalRequest
-from src.discord_client.models.text_display_component_response import TextDisplayComponentResponse
-from src.discord_client.models.text_input_component_for_modal_request import TextInputComponentForModalRequest
-from src.discord_client.models.text_input_component_response import TextInputComponentResponse
-from src.discord_client.models.thread_member_response import ThreadMemberResponse
-from src.discord_client.models.thread_metadata_response import ThreadMetadataResponse
-from src.discord_client.models.thread_response import ThreadResponse
-from src.discord_client.models.thread_search_response import ThreadSearchResponse
-from src.discord_client.models.thread_search_tag_parameter import ThreadSearchTagParameter
-from src.discord_client.models.threads_response import ThreadsResponse
-from src.discord_client.models.thumbnail_component_for_message_request import ThumbnailComponentForMessageRequest
-from src.discord_client.models.thumbnail_component_response import ThumbnailComponentResponse
-from src.discord_client.models.unfurled_media_request import UnfurledMediaRequest
-from src.discord_client.models.unfurled_media_request_with_attachment_reference_required import UnfurledMediaRequestWithAttachmentReferenceRequired
-from src.discord_client.models.unfurled_media_response import UnfurledMediaResponse
-from src.discord_client.models.update_application_emoji_request import UpdateApplicationEmojiRequest
-from src.discord_client.models.update_application_user_role_connection_request import UpdateApplicationUserRoleConnectionRequest
-from src.discord_client.models.update_auto_moderation_rule_request import UpdateAutoModerationRuleRequest
-from src.discord_client.models.update_channel_request import UpdateChannelRequest
-from src.discord_client.models.update_dm_request_partial import UpdateDMRequestPartial
-from src.discord_client.models.update_default_reaction_emoji_request import UpdateDefaultReactionEmojiRequest
-from src.discord_client.models.update_group_dm_request_partial import UpdateGroupDMRequestPartial
-from src.discord_client.models.update_guild_channel_request_partial import UpdateGuildChannelRequestPartial
-from src.discord_client.models.update_guild_emoji_request import UpdateGuildEmojiRequest
-from src.discord_client.models.update_guild_member_request import UpdateGuildMemberRequest
-from src.discord_client.models.update_guild_onboarding_request import UpdateGuildOnboardingRequest
-from src.discord_client.models.update_guild_scheduled_event_request import UpdateGuildScheduledEventRequest
-from src.discord_client.models.update_guild_sticker_request import UpdateGuildStickerRequest
-from src.discord_client.models.update_guild_template_request import UpdateGuildTemplateRequest
-from src.discord_client.models.update_guild_widget_settings_request import UpdateGuildWidgetSettingsRequest
-from src.discord_client.models.update_message_interaction_callback_request import UpdateMessageInteractionCallbackRequest
-from src.discord_client.models.update_message_interaction_callback_response import UpdateMessageInteractionCallbackResponse
-from src.discord_client.models.update_my_guild_member_request import UpdateMyGuildMemberRequest
-from src.discord_client.models.update_onboarding_prompt_request import UpdateOnboardingPromptRequest
-from src.discord_client.models.update_role_positions_request import UpdateRolePositionsRequest
-from src.discord_client.models.update_role_request_partial import UpdateRoleRequestPartial
-from src.discord_client.models.update_self_voice_state_request_partial import UpdateSelfVoiceStateRequestPartial
-from src.discord_client.models.update_stage_instance_request import UpdateStageInstanceRequest
-from src.discord_client.models.update_thread_request_partial import UpdateThreadRequestPartial
-from src.discord_client.models.update_thread_tag_request import UpdateThreadTagRequest
-from src.discord_client.models.update_voice_state_request_partial import UpdateVoiceStateRequestPartial
-from src.discord_client.models.update_webhook_by_token_request import UpdateWebhookByTokenRequest
-from src.discord_client.models.update_webhook_request import UpdateWebhookRequest
-from src.discord_client.models.user_avatar_decoration_response import UserAvatarDecorationResponse
-from src.discord_client.models.user_collectibles_response import UserCollectiblesResponse
-from src.discord_client.models.user_communication_disabled_action import UserCommunicationDisabledAction
-from src.discord_client.models.user_communication_disabled_action_metadata import UserCommunicationDisabledActionMetadata
-from src.discord_client.models.user_communication_disabled_action_metadata_response import UserCommunicationDisabledActionMetadataResponse
-from src.discord_client.models.user_communication_disabled_action_response import UserCommunicationDisabledActionResponse
-from src.discord_client.models.user_guild_onboarding_response import UserGuildOnboardingResponse
-from src.discord_client.models.user_nameplate_response import UserNameplateResponse
-from src.discord_client.models.user_pii_response import UserPIIResponse
-from src.discord_client.models.user_primary_guild_response import UserPrimaryGuildResponse
-from src.discord_client.models.user_response import UserResponse
-from src.discord_client.models.user_select_component_for_message_request import UserSelectComponentForMessageRequest
-from src.discord_client.models.user_select_component_for_modal_request import UserSelectComponentForModalRequest
-from src.discord_client.models.user_select_component_response import UserSelectComponentResponse
-from src.discord_client.models.user_select_default_value import UserSelectDefaultValue
-from src.discord_client.models.user_select_default_value_response import UserSelectDefaultValueResponse
-from src.discord_client.models.vanity_url_error_response import VanityURLErrorResponse
-from src.discord_client.models.vanity_url_response import VanityURLResponse
-from src.discord_client.models.voice_region_response import VoiceRegionResponse
-from src.discord_client.models.voice_scheduled_event_create_request import VoiceScheduledEventCreateRequest
-from src.discord_client.models.voice_scheduled_event_patch_request_partial import VoiceScheduledEventPatchRequestPartial
-from src.discord_client.models.voice_scheduled_event_response import VoiceScheduledEventResponse
-from src.discord_client.models.voice_state_response import VoiceStateResponse
-from src.discord_client.models.webhook_slack_embed import WebhookSlackEmbed
-from src.discord_client.models.webhook_slack_embed_field import WebhookSlackEmbedField
-from src.discord_client.models.webhook_source_channel_response import WebhookSourceChannelResponse
-from src.discord_client.models.webhook_source_guild_response import WebhookSourceGuildResponse
-from src.discord_client.models.welcome_message_response import WelcomeMessageResponse
-from src.discord_client.models.welcome_screen_patch_request_partial import WelcomeScreenPatchRequestPartial
-from src.discord_client.models.widget_activity import WidgetActivity
-from src.discord_client.models.widget_channel import WidgetChannel
-from src.discord_client.models.widget_member import WidgetMember
-from src.discord_client.models.widget_response import WidgetResponse
-from src.discord_client.models.widget_settings_response import WidgetSettingsResponse
+if TYPE_CHECKING:
+    from src.discord_client.models.account_response import AccountResponse
+    from src.discord_client.models.action_row_component_for_message_request import ActionRowComponentForMessageRequest
+    from src.discord_client.models.action_row_component_for_message_request_components_inner import ActionRowComponentForMessageRequestComponentsInner
+    from src.discord_client.models.action_row_component_for_modal_request import ActionRowComponentForModalRequest
+    from src.discord_client.models.action_row_component_response import ActionRowComponentResponse
+    from src.discord_client.models.action_row_component_response_components_inner import ActionRowComponentResponseComponentsInner
+    from src.discord_client.models.activities_attachment_response import ActivitiesAttachmentResponse
+    from src.discord_client.models.add_group_dm_user201_response import AddGroupDmUser201Response
+    from src.discord_client.models.add_group_dm_user_request import AddGroupDmUserRequest
+    from src.discord_client.models.add_lobby_member_request import AddLobbyMemberRequest
+    from src.discord_client.models.application_command_attachment_option import ApplicationCommandAttachmentOption
+    from src.discord_client.models.application_command_attachment_option_response import ApplicationCommandAttachmentOptionResponse
+    from src.discord_client.models.application_command_autocomplete_callback_request import ApplicationCommandAutocompleteCallbackRequest
+    from src.discord_client.models.application_command_autocomplete_callback_request_data import ApplicationCommandAutocompleteCallbackRequestData
+    from src.discord_client.models.application_command_boolean_option import ApplicationCommandBooleanOption
+    from src.discord_client.models.application_command_boolean_option_response import ApplicationCommandBooleanOptionResponse
+    from src.discord_client.models.application_command_channel_option import ApplicationCommandChannelOption
+    from src.discord_client.models.application_command_channel_option_response import ApplicationCommandChannelOptionResponse
+    from src.discord_client.models.application_command_create_request import ApplicationCommandCreateRequest
+    from src.discord_client.models.application_command_create_request_options_inner import ApplicationCommandCreateRequestOptionsInner
+    from src.discord_client.models.application_command_integer_option import ApplicationCommandIntegerOption
+    from src.discord_client.models.application_command_integer_option_response import ApplicationCommandIntegerOptionResponse
+    from src.discord_client.models.application_command_interaction_metadata_response import ApplicationCommandInteractionMetadataResponse
+    from src.discord_client.models.application_command_mentionable_option import ApplicationCommandMentionableOption
+    from src.discord_client.models.application_command_mentionable_option_response import ApplicationCommandMentionableOptionResponse
+    from src.discord_client.models.application_command_number_option import ApplicationCommandNumberOption
+    from src.discord_client.models.application_command_number_option_response import ApplicationCommandNumberOptionResponse
+    from src.discord_client.models.application_command_option_integer_choice import ApplicationCommandOptionIntegerChoice
+    from src.discord_client.models.application_command_option_integer_choice_response import ApplicationCommandOptionIntegerChoiceResponse
+    from src.discord_client.models.application_command_option_number_choice import ApplicationCommandOptionNumberChoice
+    from src.discord_client.models.application_command_option_number_choice_response import ApplicationCommandOptionNumberChoiceResponse
+    from src.discord_client.models.application_command_option_string_choice import ApplicationCommandOptionStringChoice
+    from src.discord_client.models.application_command_option_string_choice_response import ApplicationCommandOptionStringChoiceResponse
+    from src.discord_client.models.application_command_patch_request_partial import ApplicationCommandPatchRequestPartial
+    from src.discord_client.models.application_command_permission import ApplicationCommandPermission
+    from src.discord_client.models.application_command_response import ApplicationCommandResponse
+    from src.discord_client.models.application_command_response_options_inner import ApplicationCommandResponseOptionsInner
+    from src.discord_client.models.application_command_role_option import ApplicationCommandRoleOption
+    from src.discord_client.models.application_command_role_option_response import ApplicationCommandRoleOptionResponse
+    from src.discord_client.models.application_command_string_option import ApplicationCommandStringOption
+    from src.discord_client.models.application_command_string_option_response import ApplicationCommandStringOptionResponse
+    from src.discord_client.models.application_command_subcommand_group_option import ApplicationCommandSubcommandGroupOption
+    from src.discord_client.models.application_command_subcommand_group_option_response import ApplicationCommandSubcommandGroupOptionResponse
+    from src.discord_client.models.application_command_subcommand_option import ApplicationCommandSubcommandOption
+    from src.discord_client.models.application_command_subcommand_option_options_inner import ApplicationCommandSubcommandOptionOptionsInner
+    from src.discord_client.models.application_command_subcommand_option_response import ApplicationCommandSubcommandOptionResponse
+    from src.discord_client.models.application_command_subcommand_option_response_options_inner import ApplicationCommandSubcommandOptionResponseOptionsInner
+    from src.discord_client.models.application_command_update_request import ApplicationCommandUpdateRequest
+    from src.discord_client.models.application_command_user_option import ApplicationCommandUserOption
+    from src.discord_client.models.application_command_user_option_response import ApplicationCommandUserOptionResponse
+    from src.discord_client.models.application_form_partial import ApplicationFormPartial
+    from src.discord_client.models.application_form_partial_description import ApplicationFormPartialDescription
+    from src.discord_client.models.application_form_partial_integration_types_config_value import ApplicationFormPartialIntegrationTypesConfigValue
+    from src.discord_client.models.application_incoming_webhook_response import ApplicationIncomingWebhookResponse
+    from src.discord_client.models.application_integration_type_configuration import ApplicationIntegrationTypeConfiguration
+    from src.discord_client.models.application_integration_type_configuration_response import ApplicationIntegrationTypeConfigurationResponse
+    from src.discord_client.models.application_o_auth2_install_params import ApplicationOAuth2InstallParams
+    from src.discord_client.models.application_o_auth2_install_params_response import ApplicationOAuth2InstallParamsResponse
+    from src.discord_client.models.application_response import ApplicationResponse
+    from src.discord_client.models.application_role_connections_metadata_item_request import ApplicationRoleConnectionsMetadataItemRequest
+    from src.discord_client.models.application_role_connections_metadata_item_response import ApplicationRoleConnectionsMetadataItemResponse
+    from src.discord_client.models.application_user_role_connection_response import ApplicationUserRoleConnectionResponse
+    from src.discord_client.models.attachment_response import AttachmentResponse
+    from src.discord_client.models.audit_log_entry_response import AuditLogEntryResponse
+    from src.discord_client.models.audit_log_object_change_response import AuditLogObjectChangeResponse
+    from src.discord_client.models.ban_user_from_guild_request import BanUserFromGuildRequest
+    from src.discord_client.models.base_create_message_create_request import BaseCreateMessageCreateRequest
+    from src.discord_client.models.base_create_message_create_request_components_inner import BaseCreateMessageCreateRequestComponentsInner
+    from src.discord_client.models.basic_application_response import BasicApplicationResponse
+    from src.discord_client.models.basic_guild_member_response import BasicGuildMemberResponse
+    from src.discord_client.models.basic_message_response import BasicMessageResponse
+    from src.discord_client.models.basic_message_response_components_inner import BasicMessageResponseComponentsInner
+    from src.discord_client.models.basic_message_response_interaction_metadata import BasicMessageResponseInteractionMetadata
+    from src.discord_client.models.basic_message_response_nonce import BasicMessageResponseNonce
+    from src.discord_client.models.block_message_action import BlockMessageAction
+    from src.discord_client.models.block_message_action_metadata import BlockMessageActionMetadata
+    from src.discord_client.models.block_message_action_metadata_response import BlockMessageActionMetadataResponse
+    from src.discord_client.models.block_message_action_response import BlockMessageActionResponse
+    from src.discord_client.models.bot_account_patch_request import BotAccountPatchRequest
+    from src.discord_client.models.bot_add_guild_member_request import BotAddGuildMemberRequest
+    from src.discord_client.models.bot_partner_sdk_token_request import BotPartnerSdkTokenRequest
+    from src.discord_client.models.bot_partner_sdk_unmerge_provisional_account_request import BotPartnerSdkUnmergeProvisionalAccountRequest
+    from src.discord_client.models.bulk_ban_users_request import BulkBanUsersRequest
+    from src.discord_client.models.bulk_ban_users_response import BulkBanUsersResponse
+    from src.discord_client.models.bulk_delete_messages_request import BulkDeleteMessagesRequest
+    from src.discord_client.models.bulk_lobby_member_request import BulkLobbyMemberRequest
+    from src.discord_client.models.bulk_update_guild_channels_request_inner import BulkUpdateGuildChannelsRequestInner
+    from src.discord_client.models.button_component_for_message_request import ButtonComponentForMessageRequest
+    from src.discord_client.models.button_component_response import ButtonComponentResponse
+    from src.discord_client.models.channel_follower_response import ChannelFollowerResponse
+    from src.discord_client.models.channel_follower_webhook_response import ChannelFollowerWebhookResponse
+    from src.discord_client.models.channel_permission_overwrite_request import ChannelPermissionOverwriteRequest
+    from src.discord_client.models.channel_permission_overwrite_response import ChannelPermissionOverwriteResponse
+    from src.discord_client.models.channel_select_component_for_message_request import ChannelSelectComponentForMessageRequest
+    from src.discord_client.models.channel_select_component_for_modal_request import ChannelSelectComponentForModalRequest
+    from src.discord_client.models.channel_select_component_response import ChannelSelectComponentResponse
+    from src.discord_client.models.channel_select_default_value import ChannelSelectDefaultValue
+    from src.discord_client.models.channel_select_default_value_response import ChannelSelectDefaultValueResponse
+    from src.discord_client.models.command_permission_response import CommandPermissionResponse
+    from src.discord_client.models.command_permissions_response import CommandPermissionsResponse
+    from src.discord_client.models.component_emoji_for_request import ComponentEmojiForRequest
+    from src.discord_client.models.component_emoji_response import ComponentEmojiResponse
+    from src.discord_client.models.connected_account_guild_response import ConnectedAccountGuildResponse
+    from src.discord_client.models.connected_account_integration_response import ConnectedAccountIntegrationResponse
+    from src.discord_client.models.connected_account_response import ConnectedAccountResponse
+    from src.discord_client.models.container_component_for_message_request import ContainerComponentForMessageRequest
+    from src.discord_client.models.container_component_for_message_request_components_inner import ContainerComponentForMessageRequestComponentsInner
+    from src.discord_client.models.container_component_response import ContainerComponentResponse
+    from src.discord_client.models.container_component_response_components_inner import ContainerComponentResponseComponentsInner
+    from src.discord_client.models.create_application_emoji_request import CreateApplicationEmojiRequest
+    from src.discord_client.models.create_auto_moderation_rule200_response import CreateAutoModerationRule200Response
+    from src.discord_client.models.create_auto_moderation_rule_request import CreateAutoModerationRuleRequest
+    from src.discord_client.models.create_channel_invite200_response import CreateChannelInvite200Response
+    from src.discord_client.models.create_channel_invite_request import CreateChannelInviteRequest
+    from src.discord_client.models.create_entitlement_request_data import CreateEntitlementRequestData
+    from src.discord_client.models.create_forum_thread_request import CreateForumThreadRequest
+    from src.discord_client.models.create_group_dm_invite_request import CreateGroupDMInviteRequest
+    from src.discord_client.models.create_guild_channel_request import CreateGuildChannelRequest
+    from src.discord_client.models.create_guild_emoji_request import CreateGuildEmojiRequest
+    from src.discord_client.models.create_guild_invite_request import CreateGuildInviteRequest
+    from src.discord_client.models.create_guild_scheduled_event_request import CreateGuildScheduledEventRequest
+    from src.discord_client.models.create_guild_template_request import CreateGuildTemplateRequest
+    from src.discord_client.models.create_interaction_response_request import CreateInteractionResponseRequest
+    from src.discord_client.models.create_lobby_request import CreateLobbyRequest
+    from src.discord_client.models.create_message_interaction_callback_request import CreateMessageInteractionCallbackRequest
+    from src.discord_client.models.create_message_interaction_callback_response import CreateMessageInteractionCallbackResponse
+    from src.discord_client.models.create_or_join_lobby_request import CreateOrJoinLobbyRequest
+    from src.discord_client.models.create_or_update_thread_tag_request import CreateOrUpdateThreadTagRequest
+    from src.discord_client.models.create_private_channel_request import CreatePrivateChannelRequest
+    from src.discord_client.models.create_role_request import CreateRoleRequest
+    from src.discord_client.models.create_stage_instance_request import CreateStageInstanceRequest
+    from src.discord_client.models.create_text_thread_with_message_request import CreateTextThreadWithMessageRequest
+    from src.discord_client.models.create_text_thread_without_message_request import CreateTextThreadWithoutMessageRequest
+    from src.discord_client.models.create_thread_request import CreateThreadRequest
+    from src.discord_client.models.create_webhook_request import CreateWebhookRequest
+    from src.discord_client.models.created_thread_response import CreatedThreadResponse
+    from src.discord_client.models.custom_client_theme_response import CustomClientThemeResponse
+    from src.discord_client.models.custom_client_theme_share_request import CustomClientThemeShareRequest
+    from src.discord_client.models.default_keyword_list_trigger_metadata import DefaultKeywordListTriggerMetadata
+    from src.discord_client.models.default_keyword_list_trigger_metadata_response import DefaultKeywordListTriggerMetadataResponse
+    from src.discord_client.models.default_keyword_list_upsert_request import DefaultKeywordListUpsertRequest
+    from src.discord_client.models.default_keyword_list_upsert_request_actions_inner import DefaultKeywordListUpsertRequestActionsInner
+    from src.discord_client.models.default_keyword_list_upsert_request_partial import DefaultKeywordListUpsertRequestPartial
+    from src.discord_client.models.default_keyword_rule_response import DefaultKeywordRuleResponse
+    from src.discord_client.models.default_keyword_rule_response_actions_inner import DefaultKeywordRuleResponseActionsInner
+    from src.discord_client.models.default_reaction_emoji_response import DefaultReactionEmojiResponse
+    from src.discord_client.models.discord_integration_response import DiscordIntegrationResponse
+    from src.discord_client.models.edit_lobby_channel_link_request import EditLobbyChannelLinkRequest
+    from src.discord_client.models.embedded_activity_instance import EmbeddedActivityInstance
+    from src.discord_client.models.embedded_activity_instance_location import EmbeddedActivityInstanceLocation
+    from src.discord_client.models.emoji_response import EmojiResponse
+    from src.discord_client.models.entitlement_response import EntitlementResponse
+    from src.discord_client.models.entity_metadata_external import EntityMetadataExternal
+    from src.discord_client.models.entity_metadata_external_response import EntityMetadataExternalResponse
+    from src.discord_client.models.error import Error
+    from src.discord_client.models.error_details import ErrorDetails
+    from src.discord_client.models.error_response import ErrorResponse
+    from src.discord_client.models.execute_webhook_request import ExecuteWebhookRequest
+    from src.discord_client.models.external_connection_integration_response import ExternalConnectionIntegrationResponse
+    from src.discord_client.models.external_scheduled_event_create_request import ExternalScheduledEventCreateRequest
+    from src.discord_client.models.external_scheduled_event_patch_request_partial import ExternalScheduledEventPatchRequestPartial
+    from src.discord_client.models.external_scheduled_event_response import ExternalScheduledEventResponse
+    from src.discord_client.models.file_component_for_message_request import FileComponentForMessageRequest
+    from src.discord_client.models.file_component_response import FileComponentResponse
+    from src.discord_client.models.file_upload_component_for_modal_request import FileUploadComponentForModalRequest
+    from src.discord_client.models.flag_to_channel_action import FlagToChannelAction
+    from src.discord_client.models.flag_to_channel_action_metadata import FlagToChannelActionMetadata
+    from src.discord_client.models.flag_to_channel_action_metadata_response import FlagToChannelActionMetadataResponse
+    from src.discord_client.models.flag_to_channel_action_response import FlagToChannelActionResponse
+    from src.discord_client.models.follow_channel_request import FollowChannelRequest
+    from src.discord_client.models.forum_tag_response import ForumTagResponse
+    from src.discord_client.models.friend_invite_response import FriendInviteResponse
+    from src.discord_client.models.gateway_bot_response import GatewayBotResponse
+    from src.discord_client.models.gateway_bot_session_start_limit_response import GatewayBotSessionStartLimitResponse
+    from src.discord_client.models.gateway_response import GatewayResponse
+    from src.discord_client.models.get_channel200_response import GetChannel200Response
+    from src.discord_client.models.get_entitlements_sku_ids_parameter import GetEntitlementsSkuIdsParameter
+    from src.discord_client.models.get_sticker200_response import GetSticker200Response
+    from src.discord_client.models.github_author import GithubAuthor
+    from src.discord_client.models.github_check_app import GithubCheckApp
+    from src.discord_client.models.github_check_pull_request import GithubCheckPullRequest
+    from src.discord_client.models.github_check_run import GithubCheckRun
+    from src.discord_client.models.github_check_run_output import GithubCheckRunOutput
+    from src.discord_client.models.github_check_suite import GithubCheckSuite
+    from src.discord_client.models.github_comment import GithubComment
+    from src.discord_client.models.github_commit import GithubCommit
+    from src.discord_client.models.github_discussion import GithubDiscussion
+    from src.discord_client.models.github_issue import GithubIssue
+    from src.discord_client.models.github_release import GithubRelease
+    from src.discord_client.models.github_repository import GithubRepository
+    from src.discord_client.models.github_review import GithubReview
+    from src.discord_client.models.github_user import GithubUser
+    from src.discord_client.models.github_webhook import GithubWebhook
+    from src.discord_client.models.group_dm_invite_response import GroupDMInviteResponse
+    from src.discord_client.models.guild_audit_log_response import GuildAuditLogResponse
+    from src.discord_client.models.guild_audit_log_response_integrations_inner import GuildAuditLogResponseIntegrationsInner
+    from src.discord_client.models.guild_ban_response import GuildBanResponse
+    from src.discord_client.models.guild_channel_location import GuildChannelLocation
+    from src.discord_client.models.guild_channel_response import GuildChannelResponse
+    from src.discord_client.models.guild_home_settings_response import GuildHomeSettingsResponse
+    from src.discord_client.models.guild_incoming_webhook_response import GuildIncomingWebhookResponse
+    from src.discord_client.models.guild_invite_response import GuildInviteResponse
+    from src.discord_client.models.guild_member_response import GuildMemberResponse
+    from src.discord_client.models.guild_onboarding_response import GuildOnboardingResponse
+    from src.discord_client.models.guild_patch_request_partial import GuildPatchRequestPartial
+    from src.discord_client.models.guild_preview_response import GuildPreviewResponse
+    from src.discord_client.models.guild_product_purchase_response import GuildProductPurchaseResponse
+    from src.discord_client.models.guild_prune_response import GuildPruneResponse
+    from src.discord_client.models.guild_response import GuildResponse
+    from src.discord_client.models.guild_role_colors_response import GuildRoleColorsResponse
+    from src.discord_client.models.guild_role_response import GuildRoleResponse
+    from src.discord_client.models.guild_role_tags_response import GuildRoleTagsResponse
+    from src.discord_client.models.guild_sticker_response import GuildStickerResponse
+    from src.discord_client.models.guild_subscription_integration_response import GuildSubscriptionIntegrationResponse
+    from src.discord_client.models.guild_template_channel_response import GuildTemplateChannelResponse
+    from src.discord_client.models.guild_template_channel_tags import GuildTemplateChannelTags
+    from src.discord_client.models.guild_template_response import GuildTemplateResponse
+    from src.discord_client.models.guild_template_role_colors_response import GuildTemplateRoleColorsResponse
+    from src.discord_client.models.guild_template_role_response import GuildTemplateRoleResponse
+    from src.discord_client.models.guild_template_snapshot_response import GuildTemplateSnapshotResponse
+    from src.discord_client.models.guild_welcome_channel import GuildWelcomeChannel
+    from src.discord_client.models.guild_welcome_screen_channel_response import GuildWelcomeScreenChannelResponse
+    from src.discord_client.models.guild_welcome_screen_response import GuildWelcomeScreenResponse
+    from src.discord_client.models.guild_with_counts_response import GuildWithCountsResponse
+    from src.discord_client.models.incoming_webhook_interaction_request import IncomingWebhookInteractionRequest
+    from src.discord_client.models.incoming_webhook_request_partial import IncomingWebhookRequestPartial
+    from src.discord_client.models.incoming_webhook_update_for_interaction_callback_request_partial import IncomingWebhookUpdateForInteractionCallbackRequestPartial
+    from src.discord_client.models.incoming_webhook_update_request_partial import IncomingWebhookUpdateRequestPartial
+    from src.discord_client.models.inner_errors import InnerErrors
+    from src.discord_client.models.integration_application_response import IntegrationApplicationResponse
+    from src.discord_client.models.interaction_application_command_autocomplete_callback_integer_data import InteractionApplicationCommandAutocompleteCallbackIntegerData
+    from src.discord_client.models.interaction_application_command_autocomplete_callback_number_data import InteractionApplicationCommandAutocompleteCallbackNumberData
+    from src.discord_client.models.interaction_application_command_autocomplete_callback_string_data import InteractionApplicationCommandAutocompleteCallbackStringData
+    from src.discord_client.models.interaction_callback_response import InteractionCallbackResponse
+    from src.discord_client.models.interaction_callback_response_resource import InteractionCallbackResponseResource
+    from src.discord_client.models.interaction_response import InteractionResponse
+    from src.discord_client.models.invite_application_response import InviteApplicationResponse
+    from src.discord_client.models.invite_channel_recipient_response import InviteChannelRecipientResponse
+    from src.discord_client.models.invite_channel_response import InviteChannelResponse
+    from src.discord_client.models.invite_guild_response import InviteGuildResponse
+    from src.discord_client.models.keyword_rule_response import KeywordRuleResponse
+    from src.discord_client.models.keyword_trigger_metadata import KeywordTriggerMetadata
+    from src.discord_client.models.keyword_trigger_metadata_response import KeywordTriggerMetadataResponse
+    from src.discord_client.models.keyword_upsert_request import KeywordUpsertRequest
+    from src.discord_client.models.keyword_upsert_request_partial import KeywordUpsertRequestPartial
+    from src.discord_client.models.label_component_for_modal_request import LabelComponentForModalRequest
+    from src.discord_client.models.label_component_for_modal_request_component import LabelComponentForModalRequestComponent
+    from src.discord_client.models.launch_activity_interaction_callback_request import LaunchActivityInteractionCallbackRequest
+    from src.discord_client.models.launch_activity_interaction_callback_response import LaunchActivityInteractionCallbackResponse
+    from src.discord_client.models.list_application_emojis_response import ListApplicationEmojisResponse
+    from src.discord_client.models.list_auto_moderation_rules200_response_inner import ListAutoModerationRules200ResponseInner
+    from src.discord_client.models.list_channel_invites200_response_inner import ListChannelInvites200ResponseInner
+    from src.discord_client.models.list_channel_webhooks200_response_inner import ListChannelWebhooks200ResponseInner
+    from src.discord_client.models.list_guild_integrations200_response_inner import ListGuildIntegrations200ResponseInner
+    from src.discord_client.models.list_guild_scheduled_events200_response_inner import ListGuildScheduledEvents200ResponseInner
+    from src.discord_client.models.list_guild_soundboard_sounds_response import ListGuildSoundboardSoundsResponse
+    from src.discord_client.models.lobby_guild_invite_response import LobbyGuildInviteResponse
+    from src.discord_client.models.lobby_member_request import LobbyMemberRequest
+    from src.discord_client.models.lobby_member_response import LobbyMemberResponse
+    from src.discord_client.models.lobby_message_response import LobbyMessageResponse
+    from src.discord_client.models.lobby_response import LobbyResponse
+    from src.discord_client.models.ml_spam_rule_response import MLSpamRuleResponse
+    from src.discord_client.models.ml_spam_upsert_request import MLSpamUpsertRequest
+    from src.discord_client.models.ml_spam_upsert_request_partial import MLSpamUpsertRequestPartial
+    from src.discord_client.models.media_gallery_component_for_message_request import MediaGalleryComponentForMessageRequest
+    from src.discord_client.models.media_gallery_component_response import MediaGalleryComponentResponse
+    from src.discord_client.models.media_gallery_item_request import MediaGalleryItemRequest
+    from src.discord_client.models.media_gallery_item_response import MediaGalleryItemResponse
+    from src.discord_client.models.mention_spam_rule_response import MentionSpamRuleResponse
+    from src.discord_client.models.mention_spam_trigger_metadata import MentionSpamTriggerMetadata
+    from src.discord_client.models.mention_spam_trigger_metadata_response import MentionSpamTriggerMetadataResponse
+    from src.discord_client.models.mention_spam_upsert_request import MentionSpamUpsertRequest
+    from src.discord_client.models.mention_spam_upsert_request_partial import MentionSpamUpsertRequestPartial
+    from src.discord_client.models.mentionable_select_component_for_message_request import MentionableSelectComponentForMessageRequest
+    from src.discord_client.models.mentionable_select_component_for_message_request_default_values_inner import MentionableSelectComponentForMessageRequestDefaultValuesInner
+    from src.discord_client.models.mentionable_select_component_for_modal_request import MentionableSelectComponentForModalRequest
+    from src.discord_client.models.mentionable_select_component_response import MentionableSelectComponentResponse
+    from src.discord_client.models.mentionable_select_component_response_default_values_inner import MentionableSelectComponentResponseDefaultValuesInner
+    from src.discord_client.models.message_allowed_mentions_request import MessageAllowedMentionsRequest
+    from src.discord_client.models.message_attachment_request import MessageAttachmentRequest
+    from src.discord_client.models.message_attachment_response import MessageAttachmentResponse
+    from src.discord_client.models.message_call_response import MessageCallResponse
+    from src.discord_client.models.message_component_interaction_metadata_response import MessageComponentInteractionMetadataResponse
+    from src.discord_client.models.message_create_request import MessageCreateRequest
+    from src.discord_client.models.message_edit_request_partial import MessageEditRequestPartial
+    from src.discord_client.models.message_embed_author_response import MessageEmbedAuthorResponse
+    from src.discord_client.models.message_embed_field_response import MessageEmbedFieldResponse
+    from src.discord_client.models.message_embed_footer_response import MessageEmbedFooterResponse
+    from src.discord_client.models.message_embed_image_response import MessageEmbedImageResponse
+    from src.discord_client.models.message_embed_provider_response import MessageEmbedProviderResponse
+    from src.discord_client.models.message_embed_response import MessageEmbedResponse
+    from src.discord_client.models.message_embed_video_response import MessageEmbedVideoResponse
+    from src.discord_client.models.message_interaction_response import MessageInteractionResponse
+    from src.discord_client.models.message_mention_channel_response import MessageMentionChannelResponse
+    from src.discord_client.models.message_reaction_count_details_response import MessageReactionCountDetailsResponse
+    from src.discord_client.models.message_reaction_emoji_response import MessageReactionEmojiResponse
+    from src.discord_client.models.message_reaction_response import MessageReactionResponse
+    from src.discord_client.models.message_reference_request import MessageReferenceRequest
+    from src.discord_client.models.message_reference_response import MessageReferenceResponse
+    from src.discord_client.models.message_response import MessageResponse
+    from src.discord_client.models.message_role_subscription_data_response import MessageRoleSubscriptionDataResponse
+    from src.discord_client.models.message_snapshot_response import MessageSnapshotResponse
+    from src.discord_client.models.message_sticker_item_response import MessageStickerItemResponse
+    from src.discord_client.models.minimal_content_message_response import MinimalContentMessageResponse
+    from src.discord_client.models.modal_interaction_callback_request import ModalInteractionCallbackRequest
+    from src.discord_client.models.modal_interaction_callback_request_data import ModalInteractionCallbackRequestData
+    from src.discord_client.models.modal_interaction_callback_request_data_components_inner import ModalInteractionCallbackRequestDataComponentsInner
+    from src.discord_client.models.modal_submit_interaction_metadata_response import ModalSubmitInteractionMetadataResponse
+    from src.discord_client.models.modal_submit_interaction_metadata_response_triggering_interaction_metadata import ModalSubmitInteractionMetadataResponseTriggeringInteractionMetadata
+    from src.discord_client.models.my_guild_response import MyGuildResponse
+    from src.discord_client.models.new_member_action_response import NewMemberActionResponse
+    from src.discord_client.models.o_auth2_get_authorization_response import OAuth2GetAuthorizationResponse
+    from src.discord_client.models.o_auth2_get_keys import OAuth2GetKeys
+    from src.discord_client.models.o_auth2_get_open_id_connect_user_info_response import OAuth2GetOpenIDConnectUserInfoResponse
+    from src.discord_client.models.o_auth2_key import OAuth2Key
+    from src.discord_client.models.onboarding_prompt_option_request import OnboardingPromptOptionRequest
+    from src.discord_client.models.onboarding_prompt_option_response import OnboardingPromptOptionResponse
+    from src.discord_client.models.onboarding_prompt_response import OnboardingPromptResponse
+    from src.discord_client.models.partial_discord_integration_response import PartialDiscordIntegrationResponse
+    from src.discord_client.models.partial_external_connection_integration_response import PartialExternalConnectionIntegrationResponse
+    from src.discord_client.models.partial_guild_subscription_integration_response import PartialGuildSubscriptionIntegrationResponse
+    from src.discord_client.models.partner_sdk_unmerge_provisional_account_request import PartnerSdkUnmergeProvisionalAccountRequest
+    from src.discord_client.models.pinned_message_response import PinnedMessageResponse
+    from src.discord_client.models.pinned_messages_response import PinnedMessagesResponse
+    from src.discord_client.models.poll_answer_create_request import PollAnswerCreateRequest
+    from src.discord_client.models.poll_answer_details_response import PollAnswerDetailsResponse
+    from src.discord_client.models.poll_answer_response import PollAnswerResponse
+    from src.discord_client.models.poll_create_request import PollCreateRequest
+    from src.discord_client.models.poll_emoji import PollEmoji
+    from src.discord_client.models.poll_emoji_create_request import PollEmojiCreateRequest
+    from src.discord_client.models.poll_media import PollMedia
+    from src.discord_client.models.poll_media_create_request import PollMediaCreateRequest
+    from src.discord_client.models.poll_media_response import PollMediaResponse
+    from src.discord_client.models.poll_response import PollResponse
+    from src.discord_client.models.poll_results_entry_response import PollResultsEntryResponse
+    from src.discord_client.models.poll_results_response import PollResultsResponse
+    from src.discord_client.models.pong_interaction_callback_request import PongInteractionCallbackRequest
+    from src.discord_client.models.private_application_response import PrivateApplicationResponse
+    from src.discord_client.models.private_channel_location import PrivateChannelLocation
+    from src.discord_client.models.private_channel_response import PrivateChannelResponse
+    from src.discord_client.models.private_group_channel_response import PrivateGroupChannelResponse
+    from src.discord_client.models.private_guild_member_response import PrivateGuildMemberResponse
+    from src.discord_client.models.provisional_token_response import ProvisionalTokenResponse
+    from src.discord_client.models.prune_guild_request import PruneGuildRequest
+    from src.discord_client.models.prune_guild_request_include_roles import PruneGuildRequestIncludeRoles
+    from src.discord_client.models.purchase_notification_response import PurchaseNotificationResponse
+    from src.discord_client.models.quarantine_user_action import QuarantineUserAction
+    from src.discord_client.models.quarantine_user_action_response import QuarantineUserActionResponse
+    from src.discord_client.models.ratelimited_response import RatelimitedResponse
+    from src.discord_client.models.resolved_objects_response import ResolvedObjectsResponse
+    from src.discord_client.models.resource_channel_response import ResourceChannelResponse
+    from src.discord_client.models.rich_embed import RichEmbed
+    from src.discord_client.models.rich_embed_author import RichEmbedAuthor
+    from src.discord_client.models.rich_embed_field import RichEmbedField
+    from src.discord_client.models.rich_embed_footer import RichEmbedFooter
+    from src.discord_client.models.rich_embed_image import RichEmbedImage
+    from src.discord_client.models.rich_embed_provider import RichEmbedProvider
+    from src.discord_client.models.rich_embed_thumbnail import RichEmbedThumbnail
+    from src.discord_client.models.rich_embed_video import RichEmbedVideo
+    from src.discord_client.models.role_select_component_for_message_request import RoleSelectComponentForMessageRequest
+    from src.discord_client.models.role_select_component_for_modal_request import RoleSelectComponentForModalRequest
+    from src.discord_client.models.role_select_component_response import RoleSelectComponentResponse
+    from src.discord_client.models.role_select_default_value import RoleSelectDefaultValue
+    from src.discord_client.models.role_select_default_value_response import RoleSelectDefaultValueResponse
+    from src.discord_client.models.sdk_message_request import SDKMessageRequest
+    from src.discord_client.models.scheduled_event_response import ScheduledEventResponse
+    from src.discord_client.models.scheduled_event_user_response import ScheduledEventUserResponse
+    from src.discord_client.models.section_component_for_message_request import SectionComponentForMessageRequest
+    from src.discord_client.models.section_component_for_message_request_accessory import SectionComponentForMessageRequestAccessory
+    from src.discord_client.models.section_component_response import SectionComponentResponse
+    from src.discord_client.models.section_component_response_accessory import SectionComponentResponseAccessory
+    from src.discord_client.models.separator_component_for_message_request import SeparatorComponentForMessageRequest
+    from src.discord_client.models.separator_component_response import SeparatorComponentResponse
+    from src.discord_client.models.set_channel_permission_overwrite_request import SetChannelPermissionOverwriteRequest
+    from src.discord_client.models.set_guild_application_command_permissions_request import SetGuildApplicationCommandPermissionsRequest
+    from src.discord_client.models.settings_emoji_response import SettingsEmojiResponse
+    from src.discord_client.models.slack_webhook import SlackWebhook
+    from src.discord_client.models.soundboard_create_request import SoundboardCreateRequest
+    from src.discord_client.models.soundboard_patch_request_partial import SoundboardPatchRequestPartial
+    from src.discord_client.models.soundboard_sound_response import SoundboardSoundResponse
+    from src.discord_client.models.soundboard_sound_send_request import SoundboardSoundSendRequest
+    from src.discord_client.models.spam_link_rule_response import SpamLinkRuleResponse
+    from src.discord_client.models.stage_instance_response import StageInstanceResponse
+    from src.discord_client.models.stage_scheduled_event_create_request import StageScheduledEventCreateRequest
+    from src.discord_client.models.stage_scheduled_event_patch_request_partial import StageScheduledEventPatchRequestPartial
+    from src.discord_client.models.stage_scheduled_event_response import StageScheduledEventResponse
+    from src.discord_client.models.standard_sticker_response import StandardStickerResponse
+    from src.discord_client.models.sticker_pack_collection_response import StickerPackCollectionResponse
+    from src.discord_client.models.sticker_pack_response import StickerPackResponse
+    from src.discord_client.models.string_select_component_for_message_request import StringSelectComponentForMessageRequest
+    from src.discord_client.models.string_select_component_for_modal_request import StringSelectComponentForModalRequest
+    from src.discord_client.models.string_select_component_response import StringSelectComponentResponse
+    from src.discord_client.models.string_select_option_for_request import StringSelectOptionForRequest
+    from src.discord_client.models.string_select_option_response import StringSelectOptionResponse
+    from src.discord_client.models.team_member_response import TeamMemberResponse
+    from src.discord_client.models.team_response import TeamResponse
+    from src.discord_client.models.text_display_component_for_message_request import TextDisplayComponentForMessageRequest
+    from src.discord_client.models.text_display_component_for_modal_request import TextDisplayComponentForModalRequest
+    from src.discord_client.models.text_display_component_response import TextDisplayComponentResponse
+    from src.discord_client.models.text_input_component_for_modal_request import TextInputComponentForModalRequest
+    from src.discord_client.models.text_input_component_response import TextInputComponentResponse
+    from src.discord_client.models.thread_member_response import ThreadMemberResponse
+    from src.discord_client.models.thread_metadata_response import ThreadMetadataResponse
+    from src.discord_client.models.thread_response import ThreadResponse
+    from src.discord_client.models.thread_search_response import ThreadSearchResponse
+    from src.discord_client.models.thread_search_tag_parameter import ThreadSearchTagParameter
+    from src.discord_client.models.threads_response import ThreadsResponse
+    from src.discord_client.models.thumbnail_component_for_message_request import ThumbnailComponentForMessageRequest
+    from src.discord_client.models.thumbnail_component_response import ThumbnailComponentResponse
+    from src.discord_client.models.unfurled_media_request import UnfurledMediaRequest
+    from src.discord_client.models.unfurled_media_request_with_attachment_reference_required import UnfurledMediaRequestWithAttachmentReferenceRequired
+    from src.discord_client.models.unfurled_media_response import UnfurledMediaResponse
+    from src.discord_client.models.update_application_emoji_request import UpdateApplicationEmojiRequest
+    from src.discord_client.models.update_application_user_role_connection_request import UpdateApplicationUserRoleConnectionRequest
+    from src.discord_client.models.update_auto_moderation_rule_request import UpdateAutoModerationRuleRequest
+    from src.discord_client.models.update_channel_request import UpdateChannelRequest
+    from src.discord_client.models.update_dm_request_partial import UpdateDMRequestPartial
+    from src.discord_client.models.update_default_reaction_emoji_request import UpdateDefaultReactionEmojiRequest
+    from src.discord_client.models.update_group_dm_request_partial import UpdateGroupDMRequestPartial
+    from src.discord_client.models.update_guild_channel_request_partial import UpdateGuildChannelRequestPartial
+    from src.discord_client.models.update_guild_emoji_request import UpdateGuildEmojiRequest
+    from src.discord_client.models.update_guild_member_request import UpdateGuildMemberRequest
+    from src.discord_client.models.update_guild_onboarding_request import UpdateGuildOnboardingRequest
+    from src.discord_client.models.update_guild_scheduled_event_request import UpdateGuildScheduledEventRequest
+    from src.discord_client.models.update_guild_sticker_request import UpdateGuildStickerRequest
+    from src.discord_client.models.update_guild_template_request import UpdateGuildTemplateRequest
+    from src.discord_client.models.update_guild_widget_settings_request import UpdateGuildWidgetSettingsRequest
+    from src.discord_client.models.update_message_interaction_callback_request import UpdateMessageInteractionCallbackRequest
+    from src.discord_client.models.update_message_interaction_callback_response import UpdateMessageInteractionCallbackResponse
+    from src.discord_client.models.update_my_guild_member_request import UpdateMyGuildMemberRequest
+    from src.discord_client.models.update_onboarding_prompt_request import UpdateOnboardingPromptRequest
+    from src.discord_client.models.update_role_positions_request import UpdateRolePositionsRequest
+    from src.discord_client.models.update_role_request_partial import UpdateRoleRequestPartial
+    from src.discord_client.models.update_self_voice_state_request_partial import UpdateSelfVoiceStateRequestPartial
+    from src.discord_client.models.update_stage_instance_request import UpdateStageInstanceRequest
+    from src.discord_client.models.update_thread_request_partial import UpdateThreadRequestPartial
+    from src.discord_client.models.update_thread_tag_request import UpdateThreadTagRequest
+    from src.discord_client.models.update_voice_state_request_partial import UpdateVoiceStateRequestPartial
+    from src.discord_client.models.update_webhook_by_token_request import UpdateWebhookByTokenRequest
+    from src.discord_client.models.update_webhook_request import UpdateWebhookRequest
+    from src.discord_client.models.user_avatar_decoration_response import UserAvatarDecorationResponse
+    from src.discord_client.models.user_collectibles_response import UserCollectiblesResponse
+    from src.discord_client.models.user_communication_disabled_action import UserCommunicationDisabledAction
+    from src.discord_client.models.user_communication_disabled_action_metadata import UserCommunicationDisabledActionMetadata
+    from src.discord_client.models.user_communication_disabled_action_metadata_response import UserCommunicationDisabledActionMetadataResponse
+    from src.discord_client.models.user_communication_disabled_action_response import UserCommunicationDisabledActionResponse
+    from src.discord_client.models.user_guild_onboarding_response import UserGuildOnboardingResponse
+    from src.discord_client.models.user_nameplate_response import UserNameplateResponse
+    from src.discord_client.models.user_pii_response import UserPIIResponse
+    from src.discord_client.models.user_primary_guild_response import UserPrimaryGuildResponse
+    from src.discord_client.models.user_response import UserResponse
+    from src.discord_client.models.user_select_component_for_message_request import UserSelectComponentForMessageRequest
+    from src.discord_client.models.user_select_component_for_modal_request import UserSelectComponentForModalRequest
+    from src.discord_client.models.user_select_component_response import UserSelectComponentResponse
+    from src.discord_client.models.user_select_default_value import UserSelectDefaultValue
+    from src.discord_client.models.user_select_default_value_response import UserSelectDefaultValueResponse
+    from src.discord_client.models.vanity_url_error_response import VanityURLErrorResponse
+    from src.discord_client.models.vanity_url_response import VanityURLResponse
+    from src.discord_client.models.voice_region_response import VoiceRegionResponse
+    from src.discord_client.models.voice_scheduled_event_create_request import VoiceScheduledEventCreateRequest
+    from src.discord_client.models.voice_scheduled_event_patch_request_partial import VoiceScheduledEventPatchRequestPartial
+    from src.discord_client.models.voice_scheduled_event_response import VoiceScheduledEventResponse
+    from src.discord_client.models.voice_state_response import VoiceStateResponse
+    from src.discord_client.models.webhook_slack_embed import WebhookSlackEmbed
+    from src.discord_client.models.webhook_slack_embed_field import WebhookSlackEmbedField
+    from src.discord_client.models.webhook_source_channel_response import WebhookSourceChannelResponse
+    from src.discord_client.models.webhook_source_guild_response import WebhookSourceGuildResponse
+    from src.discord_client.models.welcome_message_response import WelcomeMessageResponse
+    from src.discord_client.models.welcome_screen_patch_request_partial import WelcomeScreenPatchRequestPartial
+    from src.discord_client.models.widget_activity import WidgetActivity
+    from src.discord_client.models.widget_channel import WidgetChannel
+    from src.discord_client.models.widget_member import WidgetMember
+    from src.discord_client.models.widget_response import WidgetResponse
+    from src.discord_client.models.widget_settings_response import WidgetSettingsResponse
+
+# Modelle werden erst beim ersten Zugriff importiert, z.B. wenn ApiClient einen Antworttyp auflöst
+_lazy_imports = {
+    "AccountResponse": "src.discord_client.models.account_response",
+    "ActionRowComponentForMessageRequest": "src.discord_client.models.action_row_component_for_message_request",
+    "ActionRowComponentForMessageRequestComponentsInner": "src.discord_client.models.action_row_component_for_message_request_components_inner",
+    "ActionRowComponentForModalRequest": "src.discord_client.models.action_row_component_for_modal_request",
+    "ActionRowComponentResponse": "src.discord_client.models.action_row_component_response",
+    "ActionRowComponentResponseComponentsInner": "src.discord_client.models.action_row_component_response_components_inner",
+    "ActivitiesAttachmentResponse": "src.discord_client.models.activities_attachment_response",
+    "AddGroupDmUser201Response": "src.discord_client.models.add_group_dm_user201_response",
+    "AddGroupDmUserRequest": "src.discord_client.models.add_group_dm_user_request",
+    "AddLobbyMemberRequest": "src.discord_client.models.add_lobby_member_request",
+    "ApplicationCommandAttachmentOption": "src.discord_client.models.application_command_attachment_option",
+    "ApplicationCommandAttachmentOptionResponse": "src.discord_client.models.application_command_attachment_option_response",
+    "ApplicationCommandAutocompleteCallbackRequest": "src.discord_client.models.application_command_autocomplete_callback_request",
+    "ApplicationCommandAutocompleteCallbackRequestData": "src.discord_client.models.application_command_autocomplete_callback_request_data",
+    "ApplicationCommandBooleanOption": "src.discord_client.models.application_command_boolean_option",
+    "ApplicationCommandBooleanOptionResponse": "src.discord_client.models.application_command_boolean_option_response",
+    "ApplicationCommandChannelOption": "src.discord_client.models.application_command_channel_option",
+    "ApplicationCommandChannelOptionResponse": "src.discord_client.models.application_command_channel_option_response",
+    "ApplicationCommandCreateRequest": "src.discord_client.models.application_command_create_request",
+    "ApplicationCommandCreateRequestOptionsInner": "src.discord_client.models.application_command_create_request_options_inner",
+    "ApplicationCommandIntegerOption": "src.discord_client.models.application_command_integer_option",
+    "ApplicationCommandIntegerOptionResponse": "src.discord_client.models.application_command_integer_option_response",
+    "ApplicationCommandInteractionMetadataResponse": "src.discord_client.models.application_command_interaction_metadata_response",
+    "ApplicationCommandMentionableOption": "src.discord_client.models.application_command_mentionable_option",
+    "ApplicationCommandMentionableOptionResponse": "src.discord_client.models.application_command_mentionable_option_response",
+    "ApplicationCommandNumberOption": "src.discord_client.models.application_command_number_option",
+    "ApplicationCommandNumberOptionResponse": "src.discord_client.models.application_command_number_option_response",
+    "ApplicationCommandOptionIntegerChoice": "src.discord_client.models.application_command_option_integer_choice",
+    "ApplicationCommandOptionIntegerChoiceResponse": "src.discord_client.models.application_command_option_integer_choice_response",
+    "ApplicationCommandOptionNumberChoice": "src.discord_client.models.application_command_option_number_choice",
+    "ApplicationCommandOptionNumberChoiceResponse": "src.discord_client.models.application_command_option_number_choice_response",
+    "ApplicationCommandOptionStringChoice": "src.discord_client.models.application_command_option_string_choice",
+    "ApplicationCommandOptionStringChoiceResponse": "src.discord_client.models.application_command_option_string_choice_response",
+    "ApplicationCommandPatchRequestPartial": "src.discord_client.models.application_command_patch_request_partial",
+    "ApplicationCommandPermission": "src.discord_client.models.application_command_permission",
+    "ApplicationCommandResponse": "src.discord_client.models.application_command_response",
+    "ApplicationCommandResponseOptionsInner": "src.discord_client.models.application_command_response_options_inner",
+    "ApplicationCommandRoleOption": "src.discord_client.models.application_command_role_option",
+    "ApplicationCommandRoleOptionResponse": "src.discord_client.models.application_command_role_option_response",
+    "ApplicationCommandStringOption": "src.discord_client.models.application_command_string_option",
+    "ApplicationCommandStringOptionResponse": "src.discord_client.models.application_command_string_option_response",
+    "ApplicationCommandSubcommandGroupOption": "src.discord_client.models.application_command_subcommand_group_option",
+    "ApplicationCommandSubcommandGroupOptionResponse": "src.discord_client.models.application_command_subcommand_group_option_response",
+    "ApplicationCommandSubcommandOption": "src.discord_client.models.application_command_subcommand_option",
+    "ApplicationCommandSubcommandOptionOptionsInner": "src.discord_client.models.application_command_subcommand_option_options_inner",
+    "ApplicationCommandSubcommandOptionResponse": "src.discord_client.models.application_command_subcommand_option_response",
+    "ApplicationCommandSubcommandOptionResponseOptionsInner": "src.discord_client.models.application_command_subcommand_option_response_options_inner",
+    "ApplicationCommandUpdateRequest": "src.discord_client.models.application_command_update_request",
+    "ApplicationCommandUserOption": "src.discord_client.models.application_command_user_option",
+    "ApplicationCommandUserOptionResponse": "src.discord_client.models.application_command_user_option_response",
+    "ApplicationFormPartial": "src.discord_client.models.application_form_partial",
+    "ApplicationFormPartialDescription": "src.discord_client.models.application_form_partial_description",
+    "ApplicationFormPartialIntegrationTypesConfigValue": "src.discord_client.models.application_form_partial_integration_types_config_value",
+    "ApplicationIncomingWebhookResponse": "src.discord_client.models.application_incoming_webhook_response",
+    "ApplicationIntegrationTypeConfiguration": "src.discord_client.models.application_integration_type_configuration",
+    "ApplicationIntegrationTypeConfigurationResponse": "src.discord_client.models.application_integration_type_configuration_response",
+    "ApplicationOAuth2InstallParams": "src.discord_client.models.application_o_auth2_install_params",
+    "ApplicationOAuth2InstallParamsResponse": "src.discord_client.models.application_o_auth2_install_params_response",
+    "ApplicationResponse": "src.discord_client.models.application_response",
+    "ApplicationRoleConnectionsMetadataItemRequest": "src.discord_client.models.application_role_connections_metadata_item_request",
+    "ApplicationRoleConnectionsMetadataItemResponse": "src.discord_client.models.application_role_connections_metadata_item_response",
+    "ApplicationUserRoleConnectionResponse": "src.discord_client.models.application_user_role_connection_response",
+    "AttachmentResponse": "src.discord_client.models.attachment_response",
+    "AuditLogEntryResponse": "src.discord_client.models.audit_log_entry_response",
+    "AuditLogObjectChangeResponse": "src.discord_client.models.audit_log_object_change_response",
+    "BanUserFromGuildRequest": "src.discord_client.models.ban_user_from_guild_request",
+    "BaseCreateMessageCreateRequest": "src.discord_client.models.base_create_message_create_request",
+    "BaseCreateMessageCreateRequestComponentsInner": "src.discord_client.models.base_create_message_create_request_components_inner",
+    "BasicApplicationResponse": "src.discord_client.models.basic_application_response",
+    "BasicGuildMemberResponse": "src.discord_client.models.basic_guild_member_response",
+    "BasicMessageResponse": "src.discord_client.models.basic_message_response",
+    "BasicMessageResponseComponentsInner": "src.discord_client.models.basic_message_response_components_inner",
+    "BasicMessageResponseInteractionMetadata": "src.discord_client.models.basic_message_response_interaction_metadata",
+    "BasicMessageResponseNonce": "src.discord_client.models.basic_message_response_nonce",
+    "BlockMessageAction": "src.discord_client.models.block_message_action",
+    "BlockMessageActionMetadata": "src.discord_client.models.block_message_action_metadata",
+    "BlockMessageActionMetadataResponse": "src.discord_client.models.block_message_action_metadata_response",
+    "BlockMessageActionResponse": "src.discord_client.models.block_message_action_response",
+    "BotAccountPatchRequest": "src.discord_client.models.bot_account_patch_request",
+    "BotAddGuildMemberRequest": "src.discord_client.models.bot_add_guild_member_request",
+    "BotPartnerSdkTokenRequest": "src.discord_client.models.bot_partner_sdk_token_request",
+    "BotPartnerSdkUnmergeProvisionalAccountRequest": "src.discord_client.models.bot_partner_sdk_unmerge_provisional_account_request",
+    "BulkBanUsersRequest": "src.discord_client.models.bulk_ban_users_request",
+    "BulkBanUsersResponse": "src.discord_client.models.bulk_ban_users_response",
+    "BulkDeleteMessagesRequest": "src.discord_client.models.bulk_delete_messages_request",
+    "BulkLobbyMemberRequest": "src.discord_client.models.bulk_lobby_member_request",
+    "BulkUpdateGuildChannelsRequestInner": "src.discord_client.models.bulk_update_guild_channels_request_inner",
+    "ButtonComponentForMessageRequest": "src.discord_client.models.button_component_for_message_request",
+    "ButtonComponentResponse": "src.discord_client.models.button_component_response",
+    "ChannelFollowerResponse": "src.discord_client.models.channel_follower_response",
+    "ChannelFollowerWebhookResponse": "src.discord_client.models.channel_follower_webhook_response",
+    "ChannelPermissionOverwriteRequest": "src.discord_client.models.channel_permission_overwrite_request",
+    "ChannelPermissionOverwriteResponse": "src.discord_client.models.channel_permission_overwrite_response",
+    "ChannelSelectComponentForMessageRequest": "src.discord_client.models.channel_select_component_for_message_request",
+    "ChannelSelectComponentForModalRequest": "src.discord_client.models.channel_select_component_for_modal_request",
+    "ChannelSelectComponentResponse": "src.discord_client.models.channel_select_component_response",
+    "ChannelSelectDefaultValue": "src.discord_client.models.channel_select_default_value",
+    "ChannelSelectDefaultValueResponse": "src.discord_client.models.channel_select_default_value_response",
+    "CommandPermissionResponse": "src.discord_client.models.command_permission_response",
+    "CommandPermissionsResponse": "src.discord_client.models.command_permissions_response",
+    "ComponentEmojiForRequest": "src.discord_client.models.component_emoji_for_request",
+    "ComponentEmojiResponse": "src.discord_client.models.component_emoji_response",
+    "ConnectedAccountGuildResponse": "src.discord_client.models.connected_account_guild_response",
+    "ConnectedAccountIntegrationResponse": "src.discord_client.models.connected_account_integration_response",
+    "ConnectedAccountResponse": "src.discord_client.models.connected_account_response",
+    "ContainerComponentForMessageRequest": "src.discord_client.models.container_component_for_message_request",
+    "ContainerComponentForMessageRequestComponentsInner": "src.discord_client.models.container_component_for_message_request_components_inner",
+    "ContainerComponentResponse": "src.discord_client.models.container_component_response",
+    "ContainerComponentResponseComponentsInner": "src.discord_client.models.container_component_response_components_inner",
+    "CreateApplicationEmojiRequest": "src.discord_client.models.create_application_emoji_request",
+    "CreateAutoModerationRule200Response": "src.discord_client.models.create_auto_moderation_rule200_response",
+    "CreateAutoModerationRuleRequest": "src.discord_client.models.create_auto_moderation_rule_request",
+    "CreateChannelInvite200Response": "src.discord_client.models.create_channel_invite200_response",
+    "CreateChannelInviteRequest": "src.discord_client.models.create_channel_invite_request",
+    "CreateEntitlementRequestData": "src.discord_client.models.create_entitlement_request_data",
+    "CreateForumThreadRequest": "src.discord_client.models.create_forum_thread_request",
+    "CreateGroupDMInviteRequest": "src.discord_client.models.create_group_dm_invite_request",
+    "CreateGuildChannelRequest": "src.discord_client.models.create_guild_channel_request",
+    "CreateGuildEmojiRequest": "src.discord_client.models.create_guild_emoji_request",
+    "CreateGuildInviteRequest": "src.discord_client.models.create_guild_invite_request",
+    "CreateGuildScheduledEventRequest": "src.discord_client.models.create_guild_scheduled_event_request",
+    "CreateGuildTemplateRequest": "src.discord_client.models.create_guild_template_request",
+    "CreateInteractionResponseRequest": "src.discord_client.models.create_interaction_response_request",
+    "CreateLobbyRequest": "src.discord_client.models.create_lobby_request",
+    "CreateMessageInteractionCallbackRequest": "src.discord_client.models.create_message_interaction_callback_request",
+    "CreateMessageInteractionCallbackResponse": "src.discord_client.models.create_message_interaction_callback_response",
+    "CreateOrJoinLobbyRequest": "src.discord_client.models.create_or_join_lobby_request",
+    "CreateOrUpdateThreadTagRequest": "src.discord_client.models.create_or_update_thread_tag_request",
+    "CreatePrivateChannelRequest": "src.discord_client.models.create_private_channel_request",
+    "CreateRoleRequest": "src.discord_client.models.create_role_request",
+    "CreateStageInstanceRequest": "src.discord_client.models.create_stage_instance_request",
+    "CreateTextThreadWithMessageRequest": "src.discord_client.models.create_text_thread_with_message_request",
+    "CreateTextThreadWithoutMessageRequest": "src.discord_client.models.create_text_thread_without_message_request",
+    "CreateThreadRequest": "src.discord_client.models.create_thread_request",
+    "CreateWebhookRequest": "src.discord_client.models.create_webhook_request",
+    "CreatedThreadResponse": "src.discord_client.models.created_thread_response",
+    "CustomClientThemeResponse": "src.discord_client.models.custom_client_theme_response",
+    "CustomClientThemeShareRequest": "src.discord_client.models.custom_client_theme_share_request",
+    "DefaultKeywordListTriggerMetadata": "src.discord_client.models.default_keyword_list_trigger_metadata",
+    "DefaultKeywordListTriggerMetadataResponse": "src.discord_client.models.default_keyword_list_trigger_metadata_response",
+    "DefaultKeywordListUpsertRequest": "src.discord_client.models.default_keyword_list_upsert_request",
+    "DefaultKeywordListUpsertRequestActionsInner": "src.discord_client.models.default_keyword_list_upsert_request_actions_inner",
+    "DefaultKeywordListUpsertRequestPartial": "src.discord_client.models.default_keyword_list_upsert_request_partial",
+    "DefaultKeywordRuleResponse": "src.discord_client.models.default_keyword_rule_response",
+    "DefaultKeywordRuleResponseActionsInner": "src.discord_client.models.default_keyword_rule_response_actions_inner",
+    "DefaultReactionEmojiResponse": "src.discord_client.models.default_reaction_emoji_response",
+    "DiscordIntegrationResponse": "src.discord_client.models.discord_integration_response",
+    "EditLobbyChannelLinkRequest": "src.discord_client.models.edit_lobby_channel_link_request",
+    "EmbeddedActivityInstance": "src.discord_client.models.embedded_activity_instance",
+    "EmbeddedActivityInstanceLocation": "src.discord_client.models.embedded_activity_instance_location",
+    "EmojiResponse": "src.discord_client.models.emoji_response",
+    "EntitlementResponse": "src.discord_client.models.entitlement_response",
+    "EntityMetadataExternal": "src.discord_client.models.entity_metadata_external",
+    "EntityMetadataExternalResponse": "src.discord_client.models.entity_metadata_external_response",
+    "Error": "src.discord_client.models.error",
+    "ErrorDetails": "src.discord_client.models.error_details",
+    "ErrorResponse": "src.discord_client.models.error_response",
+    "ExecuteWebhookRequest": "src.discord_client.models.execute_webhook_request",
+    "ExternalConnectionIntegrationResponse": "src.discord_client.models.external_connection_integration_response",
+    "ExternalScheduledEventCreateRequest": "src.discord_client.models.external_scheduled_event_create_request",
+    "ExternalScheduledEventPatchRequestPartial": "src.discord_client.models.external_scheduled_event_patch_request_partial",
+    "ExternalScheduledEventResponse": "src.discord_client.models.external_scheduled_event_response",
+    "FileComponentForMessageRequest": "src.discord_client.models.file_component_for_message_request",
+    "FileComponentResponse": "src.discord_client.models.file_component_response",
+    "FileUploadComponentForModalRequest": "src.discord_client.models.file_upload_component_for_modal_request",
+    "FlagToChannelAction": "src.discord_client.models.flag_to_channel_action",
+    "FlagToChannelActionMetadata": "src.discord_client.models.flag_to_channel_action_metadata",
+    "FlagToChannelActionMetadataResponse": "src.discord_client.models.flag_to_channel_action_metadata_response",
+    "FlagToChannelActionResponse": "src.discord_client.models.flag_to_channel_action_response",
+    "FollowChannelRequest": "src.discord_client.models.follow_channel_request",
+    "ForumTagResponse": "src.discord_client.models.forum_tag_response",
+    "FriendInviteResponse": "src.discord_client.models.friend_invite_response",
+    "GatewayBotResponse": "src.discord_client.models.gateway_bot_response",
+    "GatewayBotSessionStartLimitResponse": "src.discord_client.models.gateway_bot_session_start_limit_response",
+    "GatewayResponse": "src.discord_client.models.gateway_response",
+    "GetChannel200Response": "src.discord_client.models.get_channel200_response",
+    "GetEntitlementsSkuIdsParameter": "src.discord_client.models.get_entitlements_sku_ids_parameter",
+    "GetSticker200Response": "src.discord_client.models.get_sticker200_response",
+    "GithubAuthor": "src.discord_client.models.github_author",
+    "GithubCheckApp": "src.discord_client.models.github_check_app",
+    "GithubCheckPullRequest": "src.discord_client.models.github_check_pull_request",
+    "GithubCheckRun": "src.discord_client.models.github_check_run",
+    "GithubCheckRunOutput": "src.discord_client.models.github_check_run_output",
+    "GithubCheckSuite": "src.discord_client.models.github_check_suite",
+    "GithubComment": "src.discord_client.models.github_comment",
+    "GithubCommit": "src.discord_client.models.github_commit",
+    "GithubDiscussion": "src.discord_client.models.github_discussion",
+    "GithubIssue": "src.discord_client.models.github_issue",
+    "GithubRelease": "src.discord_client.models.github_release",
+    "GithubRepository": "src.discord_client.models.github_repository",
+    "GithubReview": "src.discord_client.models.github_review",
+    "GithubUser": "src.discord_client.models.github_user",
+    "GithubWebhook": "src.discord_client.models.github_webhook",
+    "GroupDMInviteResponse": "src.discord_client.models.group_dm_invite_response",
+    "GuildAuditLogResponse": "src.discord_client.models.guild_audit_log_response",
+    "GuildAuditLogResponseIntegrationsInner": "src.discord_client.models.guild_audit_log_response_integrations_inner",
+    "GuildBanResponse": "src.discord_client.models.guild_ban_response",
+    "GuildChannelLocation": "src.discord_client.models.guild_channel_location",
+    "GuildChannelResponse": "src.discord_client.models.guild_channel_response",
+    "GuildHomeSettingsResponse": "src.discord_client.models.guild_home_settings_response",
+    "GuildIncomingWebhookResponse": "src.discord_client.models.guild_incoming_webhook_response",
+    "GuildInviteResponse": "src.discord_client.models.guild_invite_response",
+    "GuildMemberResponse": "src.discord_client.models.guild_member_response",
+    "GuildOnboardingResponse": "src.discord_client.models.guild_onboarding_response",
+    "GuildPatchRequestPartial": "src.discord_client.models.guild_patch_request_partial",
+    "GuildPreviewResponse": "src.discord_client.models.guild_preview_response",
+    "GuildProductPurchaseResponse": "src.discord_client.models.guild_product_purchase_response",
+    "GuildPruneResponse": "src.discord_client.models.guild_prune_response",
+    "GuildResponse": "src.discord_client.models.guild_response",
+    "GuildRoleColorsResponse": "src.discord_client.models.guild_role_colors_response",
+    "GuildRoleResponse": "src.discord_client.models.guild_role_response",
+    "GuildRoleTagsResponse": "src.discord_client.models.guild_role_tags_response",
+    "GuildStickerResponse": "src.discord_client.models.guild_sticker_response",
+    "GuildSubscriptionIntegrationResponse": "src.discord_client.models.guild_subscription_integration_response",
+    "GuildTemplateChannelResponse": "src.discord_client.models.guild_template_channel_response",
+    "GuildTemplateChannelTags": "src.discord_client.models.guild_template_channel_tags",
+    "GuildTemplateResponse": "src.discord_client.models.guild_template_response",
+    "GuildTemplateRoleColorsResponse": "src.discord_client.models.guild_template_role_colors_response",
+    "GuildTemplateRoleResponse": "src.discord_client.models.guild_template_role_response",
+    "GuildTemplateSnapshotResponse": "src.discord_client.models.guild_template_snapshot_response",
+    "GuildWelcomeChannel": "src.discord_client.models.guild_welcome_channel",
+    "GuildWelcomeScreenChannelResponse": "src.discord_client.models.guild_welcome_screen_channel_response",
+    "GuildWelcomeScreenResponse": "src.discord_client.models.guild_welcome_screen_response",
+    "GuildWithCountsResponse": "src.discord_client.models.guild_with_counts_response",
+    "IncomingWebhookInteractionRequest": "src.discord_client.models.incoming_webhook_interaction_request",
+    "IncomingWebhookRequestPartial": "src.discord_client.models.incoming_webhook_request_partial",
+    "IncomingWebhookUpdateForInteractionCallbackRequestPartial": "src.discord_client.models.incoming_webhook_update_for_interaction_callback_request_partial",
+    "IncomingWebhookUpdateRequestPartial": "src.discord_client.models.incoming_webhook_update_request_partial",
+    "InnerErrors": "src.discord_client.models.inner_errors",
+    "IntegrationApplicationResponse": "src.discord_client.models.integration_application_response",
+    "InteractionApplicationCommandAutocompleteCallbackIntegerData": "src.discord_client.models.interaction_application_command_autocomplete_callback_integer_data",
+    "InteractionApplicationCommandAutocompleteCallbackNumberData": "src.discord_client.models.interaction_application_command_autocomplete_callback_number_data",
+    "InteractionApplicationCommandAutocompleteCallbackStringData": "src.discord_client.models.interaction_application_command_autocomplete_callback_string_data",
+    "InteractionCallbackResponse": "src.discord_client.models.interaction_callback_response",
+    "InteractionCallbackResponseResource": "src.discord_client.models.interaction_callback_response_resource",
+    "InteractionResponse": "src.discord_client.models.interaction_response",
+    "InviteApplicationResponse": "src.discord_client.models.invite_application_response",
+    "InviteChannelRecipientResponse": "src.discord_client.models.invite_channel_recipient_response",
+    "InviteChannelResponse": "src.discord_client.models.invite_channel_response",
+    "InviteGuildResponse": "src.discord_client.models.invite_guild_response",
+    "KeywordRuleResponse": "src.discord_client.models.keyword_rule_response",
+    "KeywordTriggerMetadata": "src.discord_client.models.keyword_trigger_metadata",
+    "KeywordTriggerMetadataResponse": "src.discord_client.models.keyword_trigger_metadata_response",
+    "KeywordUpsertRequest": "src.discord_client.models.keyword_upsert_request",
+    "KeywordUpsertRequestPartial": "src.discord_client.models.keyword_upsert_request_partial",
+    "LabelComponentForModalRequest": "src.discord_client.models.label_component_for_modal_request",
+    "LabelComponentForModalRequestComponent": "src.discord_client.models.label_component_for_modal_request_component",
+    "LaunchActivityInteractionCallbackRequest": "src.discord_client.models.launch_activity_interaction_callback_request",
+    "LaunchActivityInteractionCallbackResponse": "src.discord_client.models.launch_activity_interaction_callback_response",
+    "ListApplicationEmojisResponse": "src.discord_client.models.list_application_emojis_response",
+    "ListAutoModerationRules200ResponseInner": "src.discord_client.models.list_auto_moderation_rules200_response_inner",
+    "ListChannelInvites200ResponseInner": "src.discord_client.models.list_channel_invites200_response_inner",
+    "ListChannelWebhooks200ResponseInner": "src.discord_client.models.list_channel_webhooks200_response_inner",
+    "ListGuildIntegrations200ResponseInner": "src.discord_client.models.list_guild_integrations200_response_inner",
+    "ListGuildScheduledEvents200ResponseInner": "src.discord_client.models.list_guild_scheduled_events200_response_inner",
+    "ListGuildSoundboardSoundsResponse": "src.discord_client.models.list_guild_soundboard_sounds_response",
+    "LobbyGuildInviteResponse": "src.discord_client.models.lobby_guild_invite_response",
+    "LobbyMemberRequest": "src.discord_client.models.lobby_member_request",
+    "LobbyMemberResponse": "src.discord_client.models.lobby_member_response",
+    "LobbyMessageResponse": "src.discord_client.models.lobby_message_response",
+    "LobbyResponse": "src.discord_client.models.lobby_response",
+    "MLSpamRuleResponse": "src.discord_client.models.ml_spam_rule_response",
+    "MLSpamUpsertRequest": "src.discord_client.models.ml_spam_upsert_request",
+    "MLSpamUpsertRequestPartial": "src.discord_client.models.ml_spam_upsert_request_partial",
+    "MediaGalleryComponentForMessageRequest": "src.discord_client.models.media_gallery_component_for_message_request",
+    "MediaGalleryComponentResponse": "src.discord_client.models.media_gallery_component_response",
+    "MediaGalleryItemRequest": "src.discord_client.models.media_gallery_item_request",
+    "MediaGalleryItemResponse": "src.discord_client.models.media_gallery_item_response",
+    "MentionSpamRuleResponse": "src.discord_client.models.mention_spam_rule_response",
+    "MentionSpamTriggerMetadata": "src.discord_client.models.mention_spam_trigger_metadata",
+    "MentionSpamTriggerMetadataResponse": "src.discord_client.models.mention_spam_trigger_metadata_response",
+    "MentionSpamUpsertRequest": "src.discord_client.models.mention_spam_upsert_request",
+    "MentionSpamUpsertRequestPartial": "src.discord_client.models.mention_spam_upsert_request_partial",
+    "MentionableSelectComponentForMessageRequest": "src.discord_client.models.mentionable_select_component_for_message_request",
+    "MentionableSelectComponentForMessageRequestDefaultValuesInner": "src.discord_client.models.mentionable_select_component_for_message_request_default_values_inner",
+    "MentionableSelectComponentForModalRequest": "src.discord_client.models.mentionable_select_component_for_modal_request",
+    "MentionableSelectComponentResponse": "src.discord_client.models.mentionable_select_component_response",
+    "MentionableSelectComponentResponseDefaultValuesInner": "src.discord_client.models.mentionable_select_component_response_default_values_inner",
+    "MessageAllowedMentionsRequest": "src.discord_client.models.message_allowed_mentions_request",
+    "MessageAttachmentRequest": "src.discord_client.models.message_attachment_request",
+    "MessageAttachmentResponse": "src.discord_client.models.message_attachment_response",
+    "MessageCallResponse": "src.discord_client.models.message_call_response",
+    "MessageComponentInteractionMetadataResponse": "src.discord_client.models.message_component_interaction_metadata_response",
+    "MessageCreateRequest": "src.discord_client.models.message_create_request",
+    "MessageEditRequestPartial": "src.discord_client.models.message_edit_request_partial",
+    "MessageEmbedAuthorResponse": "src.discord_client.models.message_embed_author_response",
+    "MessageEmbedFieldResponse": "src.discord_client.models.message_embed_field_response",
+    "MessageEmbedFooterResponse": "src.discord_client.models.message_embed_footer_response",
+    "MessageEmbedImageResponse": "src.discord_client.models.message_embed_image_response",
+    "MessageEmbedProviderResponse": "src.discord_client.models.message_embed_provider_response",
+    "MessageEmbedResponse": "src.discord_client.models.message_embed_response",
+    "MessageEmbedVideoResponse": "src.discord_client.models.message_embed_video_response",
+    "MessageInteractionResponse": "src.discord_client.models.message_interaction_response",
+    "MessageMentionChannelResponse": "src.discord_client.models.message_mention_channel_response",
+    "MessageReactionCountDetailsResponse": "src.discord_client.models.message_reaction_count_details_response",
+    "MessageReactionEmojiResponse": "src.discord_client.models.message_reaction_emoji_response",
+    "MessageReactionResponse": "src.discord_client.models.message_reaction_response",
+    "MessageReferenceRequest": "src.discord_client.models.message_reference_request",
+    "MessageReferenceResponse": "src.discord_client.models.message_reference_response",
+    "MessageResponse": "src.discord_client.models.message_response",
+    "MessageRoleSubscriptionDataResponse": "src.discord_client.models.message_role_subscription_data_response",
+    "MessageSnapshotResponse": "src.discord_client.models.message_snapshot_response",
+    "MessageStickerItemResponse": "src.discord_client.models.message_sticker_item_response",
+    "MinimalContentMessageResponse": "src.discord_client.models.minimal_content_message_response",
+    "ModalInteractionCallbackRequest": "src.discord_client.models.modal_interaction_callback_request",
+    "ModalInteractionCallbackRequestData": "src.discord_client.models.modal_interaction_callback_request_data",
+    "ModalInteractionCallbackRequestDataComponentsInner": "src.discord_client.models.modal_interaction_callback_request_data_components_inner",
+    "ModalSubmitInteractionMetadataResponse": "src.discord_client.models.modal_submit_interaction_metadata_response",
+    "ModalSubmitInteractionMetadataResponseTriggeringInteractionMetadata": "src.discord_client.models.modal_submit_interaction_metadata_response_triggering_interaction_metadata",
+    "MyGuildResponse": "src.discord_client.models.my_guild_response",
+    "NewMemberActionResponse": "src.discord_client.models.new_member_action_response",
+    "OAuth2GetAuthorizationResponse": "src.discord_client.models.o_auth2_get_authorization_response",
+    "OAuth2GetKeys": "src.discord_client.models.o_auth2_get_keys",
+    "OAuth2GetOpenIDConnectUserInfoResponse": "src.discord_client.models.o_auth2_get_open_id_connect_user_info_response",
+    "OAuth2Key": "src.discord_client.models.o_auth2_key",
+    "OnboardingPromptOptionRequest": "src.discord_client.models.onboarding_prompt_option_request",
+    "OnboardingPromptOptionResponse": "src.discord_client.models.onboarding_prompt_option_response",
+    "OnboardingPromptResponse": "src.discord_client.models.onboarding_prompt_response",
+    "PartialDiscordIntegrationResponse": "src.discord_client.models.partial_discord_integration_response",
+    "PartialExternalConnectionIntegrationResponse": "src.discord_client.models.partial_external_connection_integration_response",
+    "PartialGuildSubscriptionIntegrationResponse": "src.discord_client.models.partial_guild_subscription_integration_response",
+    "PartnerSdkUnmergeProvisionalAccountRequest": "src.discord_client.models.partner_sdk_unmerge_provisional_account_request",
+    "PinnedMessageResponse": "src.discord_client.models.pinned_message_response",
+    "PinnedMessagesResponse": "src.discord_client.models.pinned_messages_response",
+    "PollAnswerCreateRequest": "src.discord_client.models.poll_answer_create_request",
+    "PollAnswerDetailsResponse": "src.discord_client.models.poll_answer_details_response",
+    "PollAnswerResponse": "src.discord_client.models.poll_answer_response",
+    "PollCreateRequest": "src.discord_client.models.poll_create_request",
+    "PollEmoji": "src.discord_client.models.poll_emoji",
+    "PollEmojiCreateRequest": "src.discord_client.models.poll_emoji_create_request",
+    "PollMedia": "src.discord_client.models.poll_media",
+    "PollMediaCreateRequest": "src.discord_client.models.poll_media_create_request",
+    "PollMediaResponse": "src.discord_client.models.poll_media_response",
+    "PollResponse": "src.discord_client.models.poll_response",
+    "PollResultsEntryResponse": "src.discord_client.models.poll_results_entry_response",
+    "PollResultsResponse": "src.discord_client.models.poll_results_response",
+    "PongInteractionCallbackRequest": "src.discord_client.models.pong_interaction_callback_request",
+    "PrivateApplicationResponse": "src.discord_client.models.private_application_response",
+    "PrivateChannelLocation": "src.discord_client.models.private_channel_location",
+    "PrivateChannelResponse": "src.discord_client.models.private_channel_response",
+    "PrivateGroupChannelResponse": "src.discord_client.models.private_group_channel_response",
+    "PrivateGuildMemberResponse": "src.discord_client.models.private_guild_member_response",
+    "ProvisionalTokenResponse": "src.discord_client.models.provisional_token_response",
+    "PruneGuildRequest": "src.discord_client.models.prune_guild_request",
+    "PruneGuildRequestIncludeRoles": "src.discord_client.models.prune_guild_request_include_roles",
+    "PurchaseNotificationResponse": "src.discord_client.models.purchase_notification_response",
+    "QuarantineUserAction": "src.discord_client.models.quarantine_user_action",
+    "QuarantineUserActionResponse": "src.discord_client.models.quarantine_user_action_response",
+    "RatelimitedResponse": "src.discord_client.models.ratelimited_response",
+    "ResolvedObjectsResponse": "src.discord_client.models.resolved_objects_response",
+    "ResourceChannelResponse": "src.discord_client.models.resource_channel_response",
+    "RichEmbed": "src.discord_client.models.rich_embed",
+    "RichEmbedAuthor": "src.discord_client.models.rich_embed_author",
+    "RichEmbedField": "src.discord_client.models.rich_embed_field",
+    "RichEmbedFooter": "src.discord_client.models.rich_embed_footer",
+    "RichEmbedImage": "src.discord_client.models.rich_embed_image",
+    "RichEmbedProvider": "src.discord_client.models.rich_embed_provider",
+    "RichEmbedThumbnail": "src.discord_client.models.rich_embed_thumbnail",
+    "RichEmbedVideo": "src.discord_client.models.rich_embed_video",
+    "RoleSelectComponentForMessageRequest": "src.discord_client.models.role_select_component_for_message_request",
+    "RoleSelectComponentForModalRequest": "src.discord_client.models.role_select_component_for_modal_request",
+    "RoleSelectComponentResponse": "src.discord_client.models.role_select_component_response",
+    "RoleSelectDefaultValue": "src.discord_client.models.role_select_default_value",
+    "RoleSelectDefaultValueResponse": "src.discord_client.models.role_select_default_value_response",
+    "SDKMessageRequest": "src.discord_client.models.sdk_message_request",
+    "ScheduledEventResponse": "src.discord_client.models.scheduled_event_response",
+    "ScheduledEventUserResponse": "src.discord_client.models.scheduled_event_user_response",
+    "SectionComponentForMessageRequest": "src.discord_client.models.section_component_for_message_request",
+    "SectionComponentForMessageRequestAccessory": "src.discord_client.models.section_component_for_message_request_accessory",
+    "SectionComponentResponse": "src.discord_client.models.section_component_response",
+    "SectionComponentResponseAccessory": "src.discord_client.models.section_component_response_accessory",
+    "SeparatorComponentForMessageRequest": "src.discord_client.models.separator_component_for_message_request",
+    "SeparatorComponentResponse": "src.discord_client.models.separator_component_response",
+    "SetChannelPermissionOverwriteRequest": "src.discord_client.models.set_channel_permission_overwrite_request",
+    "SetGuildApplicationCommandPermissionsRequest": "src.discord_client.models.set_guild_application_command_permissions_request",
+    "SettingsEmojiResponse": "src.discord_client.models.settings_emoji_response",
+    "SlackWebhook": "src.discord_client.models.slack_webhook",
+    "SoundboardCreateRequest": "src.discord_client.models.soundboard_create_request",
+    "SoundboardPatchRequestPartial": "src.discord_client.models.soundboard_patch_request_partial",
+    "SoundboardSoundResponse": "src.discord_client.models.soundboard_sound_response",
+    "SoundboardSoundSendRequest": "src.discord_client.models.soundboard_sound_send_request",
+    "SpamLinkRuleResponse": "src.discord_client.models.spam_link_rule_response",
+    "StageInstanceResponse": "src.discord_client.models.stage_instance_response",
+    "StageScheduledEventCreateRequest": "src.discord_client.models.stage_scheduled_event_create_request",
+    "StageScheduledEventPatchRequestPartial": "src.discord_client.models.stage_scheduled_event_patch_request_partial",
+    "StageScheduledEventResponse": "src.discord_client.models.stage_scheduled_event_response",
+    "StandardStickerResponse": "src.discord_client.models.standard_sticker_response",
+    "StickerPackCollectionResponse": "src.discord_client.models.sticker_pack_collection_response",
+    "StickerPackResponse": "src.discord_client.models.sticker_pack_response",
+    "StringSelectComponentForMessageRequest": "src.discord_client.models.string_select_component_for_message_request",
+    "StringSelectComponentForModalRequest": "src.discord_client.models.string_select_component_for_modal_request",
+    "StringSelectComponentResponse": "src.discord_client.models.string_select_component_response",
+    "StringSelectOptionForRequest": "src.discord_client.models.string_select_option_for_request",
+    "StringSelectOptionResponse": "src.discord_client.models.string_select_option_response",
+    "TeamMemberResponse": "src.discord_client.models.team_member_response",
+    "TeamResponse": "src.discord_client.models.team_response",
+    "TextDisplayComponentForMessageRequest": "src.discord_client.models.text_display_component_for_message_request",
+    "TextDisplayComponentForModalRequest": "src.discord_client.models.text_display_component_for_modal_request",
+    "TextDisplayComponentResponse": "src.discord_client.models.text_display_component_response",
+    "TextInputComponentForModalRequest": "src.discord_client.models.text_input_component_for_modal_request",
+    "TextInputComponentResponse": "src.discord_client.models.text_input_component_response",
+    "ThreadMemberResponse": "src.discord_client.models.thread_member_response",
+    "ThreadMetadataResponse": "src.discord_client.models.thread_metadata_response",
+    "ThreadResponse": "src.discord_client.models.thread_response",
+    "ThreadSearchResponse": "src.discord_client.models.thread_search_response",
+    "ThreadSearchTagParameter": "src.discord_client.models.thread_search_tag_parameter",
+    "ThreadsResponse": "src.discord_client.models.threads_response",
+    "ThumbnailComponentForMessageRequest": "src.discord_client.models.thumbnail_component_for_message_request",
+    "ThumbnailComponentResponse": "src.discord_client.models.thumbnail_component_response",
+    "UnfurledMediaRequest": "src.discord_client.models.unfurled_media_request",
+    "UnfurledMediaRequestWithAttachmentReferenceRequired": "src.discord_client.models.unfurled_media_request_with_attachment_reference_required",
+    "UnfurledMediaResponse": "src.discord_client.models.unfurled_media_response",
+    "UpdateApplicationEmojiRequest": "src.discord_client.models.update_application_emoji_request",
+    "UpdateApplicationUserRoleConnectionRequest": "src.discord_client.models.update_application_user_role_connection_request",
+    "UpdateAutoModerationRuleRequest": "src.discord_client.models.update_auto_moderation_rule_request",
+    "UpdateChannelRequest": "src.discord_client.models.update_channel_request",
+    "UpdateDMRequestPartial": "src.discord_client.models.update_dm_request_partial",
+    "UpdateDefaultReactionEmojiRequest": "src.discord_client.models.update_default_reaction_emoji_request",
+    "UpdateGroupDMRequestPartial": "src.discord_client.models.update_group_dm_request_partial",
+    "UpdateGuildChannelRequestPartial": "src.discord_client.models.update_guild_channel_request_partial",
+    "UpdateGuildEmojiRequest": "src.discord_client.models.update_guild_emoji_request",
+    "UpdateGuildMemberRequest": "src.discord_client.models.update_guild_member_request",
+    "UpdateGuildOnboardingRequest": "src.discord_client.models.update_guild_onboarding_request",
+    "UpdateGuildScheduledEventRequest": "src.discord_client.models.update_guild_scheduled_event_request",
+    "UpdateGuildStickerRequest": "src.discord_client.models.update_guild_sticker_request",
+    "UpdateGuildTemplateRequest": "src.discord_client.models.update_guild_template_request",
+    "UpdateGuildWidgetSettingsRequest": "src.discord_client.models.update_guild_widget_settings_request",
+    "UpdateMessageInteractionCallbackRequest": "src.discord_client.models.update_message_interaction_callback_request",
+    "UpdateMessageInteractionCallbackResponse": "src.discord_client.models.update_message_interaction_callback_response",
+    "UpdateMyGuildMemberRequest": "src.discord_client.models.update_my_guild_member_request",
+    "UpdateOnboardingPromptRequest": "src.discord_client.models.update_onboarding_prompt_request",
+    "UpdateRolePositionsRequest": "src.discord_client.models.update_role_positions_request",
+    "UpdateRoleRequestPartial": "src.discord_client.models.update_role_request_partial",
+    "UpdateSelfVoiceStateRequestPartial": "src.discord_client.models.update_self_voice_state_request_partial",
+    "UpdateStageInstanceRequest": "src.discord_client.models.update_stage_instance_request",
+    "UpdateThreadRequestPartial": "src.discord_client.models.update_thread_request_partial",
+    "UpdateThreadTagRequest": "src.discord_client.models.update_thread_tag_request",
+    "UpdateVoiceStateRequestPartial": "src.discord_client.models.update_voice_state_request_partial",
+    "UpdateWebhookByTokenRequest": "src.discord_client.models.update_webhook_by_token_request",
+    "UpdateWebhookRequest": "src.discord_client.models.update_webhook_request",
+    "UserAvatarDecorationResponse": "src.discord_client.models.user_avatar_decoration_response",
+    "UserCollectiblesResponse": "src.discord_client.models.user_collectibles_response",
+    "UserCommunicationDisabledAction": "src.discord_client.models.user_communication_disabled_action",
+    "UserCommunicationDisabledActionMetadata": "src.discord_client.models.user_communication_disabled_action_metadata",
+    "UserCommunicationDisabledActionMetadataResponse": "src.discord_client.models.user_communication_disabled_action_metadata_response",
+    "UserCommunicationDisabledActionResponse": "src.discord_client.models.user_communication_disabled_action_response",
+    "UserGuildOnboardingResponse": "src.discord_client.models.user_guild_onboarding_response",
+    "UserNameplateResponse": "src.discord_client.models.user_nameplate_response",
+    "UserPIIResponse": "src.discord_client.models.user_pii_response",
+    "UserPrimaryGuildResponse": "src.discord_client.models.user_primary_guild_response",
+    "UserResponse": "src.discord_client.models.user_response",
+    "UserSelectComponentForMessageRequest": "src.discord_client.models.user_select_component_for_message_request",
+    "UserSelectComponentForModalRequest": "src.discord_client.models.user_select_component_for_modal_request",
+    "UserSelectComponentResponse": "src.discord_client.models.user_select_component_response",
+    "UserSelectDefaultValue": "src.discord_client.models.user_select_default_value",
+    "UserSelectDefaultValueResponse": "src.discord_client.models.user_select_default_value_response",
+    "VanityURLErrorResponse": "src.discord_client.models.vanity_url_error_response",
+    "VanityURLResponse": "src.discord_client.models.vanity_url_response",
+    "VoiceRegionResponse": "src.discord_client.models.voice_region_response",
+    "VoiceScheduledEventCreateRequest": "src.discord_client.models.voice_scheduled_event_create_request",
+    "VoiceScheduledEventPatchRequestPartial": "src.discord_client.models.voice_scheduled_event_patch_request_partial",
+    "VoiceScheduledEventResponse": "src.discord_client.models.voice_scheduled_event_response",
+    "VoiceStateResponse": "src.discord_client.models.voice_state_response",
+    "WebhookSlackEmbed": "src.discord_client.models.webhook_slack_embed",
+    "WebhookSlackEmbedField": "src.discord_client.models.webhook_slack_embed_field",
+    "WebhookSourceChannelResponse": "src.discord_client.models.webhook_source_channel_response",
+    "WebhookSourceGuildResponse": "src.discord_client.models.webhook_source_guild_response",
+    "WelcomeMessageResponse": "src.discord_client.models.welcome_message_response",
+    "WelcomeScreenPatchRequestPartial": "src.discord_client.models.welcome_screen_patch_request_partial",
+    "WidgetActivity": "src.discord_client.models.widget_activity",
+    "WidgetChannel": "src.discord_client.models.widget_channel",
+    "WidgetMember": "src.discord_client.models.widget_member",
+    "WidgetResponse": "src.discord_client.models.widget_response",
+    "WidgetSettingsResponse": "src.discord_client.models.widget_settings_response",
+}
+
+
+def __getattr__(name: str):
+    # Das Modul wird erst beim ersten Zugriff importiert und das Ergebnis im Paket zwischengespeichert
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        # Untermodule (z.B. models.issue) bleiben wie bisher als Attribut erreichbar
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
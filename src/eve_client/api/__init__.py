@@ -1,36 +1,95 @@
 # flake8: noqa
 
+import importlib
+from typing import TYPE_CHECKING
+
 # import apis into api package
-from eve_client.api.alliance_api import AllianceApi
-from eve_client.api.assets_api import AssetsApi
-from eve_client.api.calendar_api import CalendarApi
-from eve_client.api.character_api import CharacterApi
-from eve_client.api.clones_api import ClonesApi
-from eve_client.api.contacts_api import ContactsApi
-from eve_client.api.contracts_api import ContractsApi
-from eve_client.api.corporation_api import CorporationApi
-from eve_client.api.corporation_projects_api import CorporationProjectsApi
-from eve_client.api.dogma_api import DogmaApi
-from eve_client.api.faction_warfare_api import FactionWarfareApi
-from eve_client.api.fittings_api import FittingsApi
-from eve_client.api.fleets_api import FleetsApi
-from eve_client.api.incursions_api import IncursionsApi
-from eve_client.api.industry_api import IndustryApi
-from eve_client.api.insurance_api import InsuranceApi
-from eve_client.api.killmails_api import KillmailsApi
-from eve_client.api.location_api import LocationApi
-from eve_client.api.loyalty_api import LoyaltyApi
-from eve_client.api.mail_api import MailApi
-from eve_client.api.market_api import MarketApi
-from eve_client.api.meta_api import MetaApi
-from eve_client.api.planetary_interaction_api import PlanetaryInteractionApi
-from eve_client.api.routes_api import RoutesApi
-from eve_client.api.search_api import SearchApi
-from eve_client.api.skills_api import SkillsApi
-from eve_client.api.sovereignty_api import SovereigntyApi
-from eve_client.api.status_api import StatusApi
-from eve_client.api.universe_api import UniverseApi
-from eve_client.api.user_interface_api import UserInterfaceApi
-from eve_client.api.wallet_api import WalletApi
-from eve_client.api.wars_api import WarsApi
+if TYPE_CHECKING:
+    from eve_client.api.alliance_api import AllianceApi
+    from eve_client.api.assets_api import AssetsApi
+    from eve_client.api.calendar_api import CalendarApi
+    from eve_client.api.character_api import CharacterApi
+    from eve_client.api.clones_api import ClonesApi
+    from eve_client.api.contacts_api import ContactsApi
+    from eve_client.api.contracts_api import ContractsApi
+    from eve_client.api.corporation_api import CorporationApi
+    from eve_client.api.corporation_projects_api import CorporationProjectsApi
+    from eve_client.api.dogma_api import DogmaApi
+    from eve_client.api.faction_warfare_api import FactionWarfareApi
+    from eve_client.api.fittings_api import FittingsApi
+    from eve_client.api.fleets_api import FleetsApi
+    from eve_client.api.incursions_api import IncursionsApi
+    from eve_client.api.industry_api import IndustryApi
+    from eve_client.api.insurance_api import InsuranceApi
+    from eve_client.api.killmails_api import KillmailsApi
+    from eve_client.api.location_api import LocationApi
+    from eve_client.api.loyalty_api import LoyaltyApi
+    from eve_client.api.mail_api import MailApi
+    from eve_client.api.market_api import MarketApi
+    from eve_client.api.meta_api import MetaApi
+    from eve_client.api.planetary_interaction_api import PlanetaryInteractionApi
+    from eve_client.api.routes_api import RoutesApi
+    from eve_client.api.search_api import SearchApi
+    from eve_client.api.skills_api import SkillsApi
+    from eve_client.api.sovereignty_api import SovereigntyApi
+    from eve_client.api.status_api import StatusApi
+    from eve_client.api.universe_api import UniverseApi
+    from eve_client.api.user_interface_api import UserInterfaceApi
+    from eve_client.api.wallet_api import WalletApi
+    from eve_client.api.wars_api import WarsApi
+
+# APIs werden erst beim ersten Zugriff importiert
+_lazy_imports = {
+    "AllianceApi": "eve_client.api.alliance_api",
+    "AssetsApi": "eve_client.api.assets_api",
+    "CalendarApi": "eve_client.api.calendar_api",
+    "CharacterApi": "eve_client.api.character_api",
+    "ClonesApi": "eve_client.api.clones_api",
+    "ContactsApi": "eve_client.api.contacts_api",
+    "ContractsApi": "eve_client.api.contracts_api",
+    "CorporationApi": "eve_client.api.corporation_api",
+    "CorporationProjectsApi": "eve_client.api.corporation_projects_api",
+    "DogmaApi": "eve_client.api.dogma_api",
+    "FactionWarfareApi": "eve_client.api.faction_warfare_api",
+    "FittingsApi": "eve_client.api.fittings_api",
+    "FleetsApi": "eve_client.api.fleets_api",
+    "IncursionsApi": "eve_client.api.incursions_api",
+    "IndustryApi": "eve_client.api.industry_api",
+    "InsuranceApi": "eve_client.api.insurance_api",
+    "KillmailsApi": "eve_client.api.killmails_api",
+    "LocationApi": "eve_client.api.location_api",
+    "LoyaltyApi": "eve_client.api.loyalty_api",
+    "MailApi": "eve_client.api.mail_api",
+    "MarketApi": "eve_client.api.market_api",
+    "MetaApi": "eve_client.api.meta_api",
+    "PlanetaryInteractionApi": "eve_client.api.planetary_interaction_api",
+    "RoutesApi": "eve_client.api.routes_api",
+    "SearchApi": "eve_client.api.search_api",
+    "SkillsApi": "eve_client.api.skills_api",
+    "SovereigntyApi": "eve_client.api.sovereignty_api",
+    "StatusApi": "eve_client.api.status_api",
+    "UniverseApi": "eve_client.api.universe_api",
+    "UserInterfaceApi": "eve_client.api.user_interface_api",
+    "WalletApi": "eve_client.api.wallet_api",
+    "WarsApi": "eve_client.api.wars_api",
+}
+
+
+def __getattr__(name: str):
+    # Das Modul wird erst beim ersten Zugriff importiert und das Ergebnis im Paket zwischengespeichert
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        # Untermodule (z.B. models.issue) bleiben wie bisher als Attribut erreichbar
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
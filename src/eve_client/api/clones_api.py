@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -22,7 +22,7 @@ from typing import List, Optional
 from typing_extensions import Annotated
 from eve_client.models.characters_character_id_clones_get import CharactersCharacterIdClonesGet
 
-from eve_client.api_client import ApiClient, RequestSerialized
+from eve_client.api_client import ApiClient, RequestSerialized, validate_call
 from eve_client.api_response import ApiResponse
 from eve_client.rest import RESTResponseType
 
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -25,7 +25,7 @@ from eve_client.models.alliances_alliance_id_contacts_labels_get_inner import Al
 from eve_client.models.characters_character_id_contacts_get_inner import CharactersCharacterIdContactsGetInner
 from eve_client.models.corporations_corporation_id_contacts_get_inner import CorporationsCorporationIdContactsGetInner
 
-from eve_client.api_client import ApiClient, RequestSerialized
+from eve_client.api_client import ApiClient, RequestSerialized, validate_call
 from eve_client.api_response import ApiResponse
 from eve_client.rest import RESTResponseType
 
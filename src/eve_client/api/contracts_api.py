@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -28,7 +28,7 @@ from eve_client.models.contracts_public_items_contract_id_get_inner import Contr
 from eve_client.models.contracts_public_region_id_get_inner import ContractsPublicRegionIdGetInner
 from eve_client.models.corporations_corporation_id_contracts_get_inner import CorporationsCorporationIdContractsGetInner
 
-from eve_client.api_client import ApiClient, RequestSerialized
+from eve_client.api_client import ApiClient, RequestSerialized, validate_call
 from eve_client.api_response import ApiResponse
 from eve_client.rest import RESTResponseType
 
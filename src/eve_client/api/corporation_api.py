@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -40,7 +40,7 @@ from eve_client.models.corporations_corporation_id_starbases_starbase_id_get imp
 from eve_client.models.corporations_corporation_id_structures_get_inner import CorporationsCorporationIdStructuresGetInner
 from eve_client.models.corporations_corporation_id_titles_get_inner import CorporationsCorporationIdTitlesGetInner
 
-from eve_client.api_client import ApiClient, RequestSerialized
+from eve_client.api_client import ApiClient, RequestSerialized, validate_call
 from eve_client.api_response import ApiResponse
 from eve_client.rest import RESTResponseType
 
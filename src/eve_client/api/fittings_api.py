@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -24,7 +24,7 @@ from eve_client.models.characters_character_id_fittings_get_inner import Charact
 from eve_client.models.characters_character_id_fittings_post import CharactersCharacterIdFittingsPost
 from eve_client.models.post_characters_character_id_fittings_request import PostCharactersCharacterIdFittingsRequest
 
-from eve_client.api_client import ApiClient, RequestSerialized
+from eve_client.api_client import ApiClient, RequestSerialized, validate_call
 from eve_client.api_response import ApiResponse
 from eve_client.rest import RESTResponseType
 
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -29,7 +29,7 @@ from eve_client.models.corporations_corporation_id_industry_jobs_get_inner impor
 from eve_client.models.industry_facilities_get_inner import IndustryFacilitiesGetInner
 from eve_client.models.industry_systems_get_inner import IndustrySystemsGetInner
 
-from eve_client.api_client import ApiClient, RequestSerialized
+from eve_client.api_client import ApiClient, RequestSerialized, validate_call
 from eve_client.api_response import ApiResponse
 from eve_client.rest import RESTResponseType
 
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -43,7 +43,7 @@ from eve_client.models.universe_system_kills_get_inner import UniverseSystemKill
 from eve_client.models.universe_systems_system_id_get import UniverseSystemsSystemIdGet
 from eve_client.models.universe_types_type_id_get import UniverseTypesTypeIdGet
 
-from eve_client.api_client import ApiClient, RequestSerialized
+from eve_client.api_client import ApiClient, RequestSerialized, validate_call
 from eve_client.api_response import ApiResponse
 from eve_client.rest import RESTResponseType
 
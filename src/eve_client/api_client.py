@@ -13,6 +13,8 @@
 
 
 import datetime
+import functools
+import importlib
 from dateutil.parser import parse
 from enum import Enum
 import decimal
@@ -25,6 +27,7 @@ import uuid
 
 from urllib.parse import quote
 from typing import Tuple, Optional, List, Dict, Union
+import pydantic
 from pydantic import SecretStr
 
 from eve_client.configuration import Configuration
@@ -43,6 +46,45 @@ from eve_client.exceptions import (
 
 RequestSerialized = Tuple[str, str, Dict[str, str], Optional[str], List[str]]
 
+# Aufgelöste Modellklassen je Typname aus den Antworttypen (z.B. "Issue" aus "List[Issue]")
+_model_classes: Dict[str, type] = {}
+
+
+def _resolve_model(klass: str) -> type:
+    """Liefert die Modellklasse zu einem Typnamen.
+
+    Über die Tabelle des models-Pakets wird nur das Modul dieses einen Modells importiert
+    (samt der Modelle, die es selbst referenziert), nicht das ganze Paket.
+    """
+    model_class = _model_classes.get(klass)
+    if model_class is None:
+        module_name = eve_client.models._lazy_imports.get(klass)
+        if module_name is None:
+            raise AttributeError(f"module 'eve_client.models' has no attribute {klass!r}")
+        model_class = _model_classes[klass] = getattr(importlib.import_module(module_name), klass)
+    return model_class
+
+
+def validate_call(func):
+    """Wie pydantic.validate_call für die async-Methoden der API-Klassen, aber ohne Kosten beim Import.
+
+    Der Validator wird erst beim ersten Aufruf gebaut. Ist client_side_validation in der Configuration
+    abgeschaltet (z.B. weil das MCP-Tool seine Argumente schon validiert hat), wird die Methode direkt aufgerufen.
+    """
+    validated = None
+
+    @functools.wraps(func)
+    async def wrapper(self, *args, **kwargs):
+        nonlocal validated
+        if not self.api_client.client_side_validation:
+            return await func(self, *args, **kwargs)
+        if validated is None:
+            validated = pydantic.validate_call(func)
+        return await validated(self, *args, **kwargs)
+
+    return wrapper
+
+
 class ApiClient:
     """Generic API client for OpenAPI client library builds.
 
@@ -319,8 +361,15 @@ class ApiClient:
                 if content_type is not None:
                     match = re.search(r"charset=([a-zA-Z\-\d]+)[\s;]?", content_type)
                 encoding = match.group(1) if match else "utf-8"
-                response_text = response_data.data.decode(encoding)
-                return_data = self.deserialize(response_text, response_type, content_type)
+                decoded = NotImplemented
+                if self.configuration.codec is not None and 200 <= response_data.status <= 299:
+                    # Schnellerer Weg für JSON-Bodies (siehe Configuration.codec)
+                    decoded = self.configuration.codec.decode(response_data.data, response_type, content_type, encoding)
+                if decoded is NotImplemented:
+                    response_text = response_data.data.decode(encoding)
+                    return_data = self.deserialize(response_text, response_type, content_type)
+                else:
+                    return_data = decoded
         finally:
             if not 200 <= response_data.status <= 299:
                 raise ApiException.from_response(
@@ -352,6 +401,9 @@ class ApiClient:
         :param obj: The data to serialize.
         :return: The serialized form of data.
         """
+        if self.configuration.codec is not None:
+            # Funktion je Klasse statt der isinstance-Kette (siehe Configuration.codec)
+            return self.configuration.codec.serialize(obj)
         if obj is None:
             return None
         elif isinstance(obj, Enum):
@@ -441,6 +493,10 @@ class ApiClient:
             return None
 
         if isinstance(klass, str):
+            if self.configuration.codec is not None:
+                # Typname einmal übersetzt statt je Element (siehe Configuration.codec)
+                return self.configuration.codec.deserialize(data, klass, self.__deserialize)
+
             if klass.startswith('List['):
                 m = re.match(r'List\[(.*)]', klass)
                 assert m is not None, "Malformed List type definition"
@@ -459,7 +515,7 @@ class ApiClient:
             if klass in self.NATIVE_TYPES_MAPPING:
                 klass = self.NATIVE_TYPES_MAPPING[klass]
             else:
-                klass = getattr(eve_client.models, klass)
+                klass = _resolve_model(klass)
 
         if klass in self.PRIMITIVE_TYPES:
             return self.__deserialize_primitive(data, klass)
@@ -281,11 +281,55 @@ class Configuration:
         """SSL/TLS Server Name Indication (SNI)
            Set this to the SNI value expected by the server.
         """
+        self.ssl_context = None
+        """SSL context to use instead of one built from the options above
+           (see ssl_contexts). It may be shared between clients and must
+           not be modified afterwards.
+        """
 
         self.connection_pool_maxsize = 100
         """This value is passed to the aiohttp to limit simultaneous connections.
            Default values is 100, None means no-limit.
         """
+        self.max_keepalive_connections: Optional[int] = None
+        """Idle connections kept open for reuse, None means no limit.
+        """
+        self.keepalive_expiry: Optional[float] = 5.0
+        """Seconds an idle connection is kept open, None means no expiry.
+        """
+        self.max_connections_per_host: Optional[int] = None
+        """Simultaneous requests per host, None means no limit.
+        """
+        self.http2 = False
+        """Negotiate HTTP/2 with the server, which multiplexes concurrent
+           requests over one connection. Requires the h2 package
+           (httpx[http2]), without it HTTP/1.1 is used.
+        """
+        self.timeout: Optional[float] = 5 * 60
+        """Default timeout in seconds for connect, read, write and waiting
+           for a pooled connection, None means no timeout.
+        """
+        self.connect_timeout: Optional[float] = None
+        self.read_timeout: Optional[float] = None
+        self.write_timeout: Optional[float] = None
+        self.pool_timeout: Optional[float] = None
+        """Per-phase timeouts in seconds, None falls back to timeout.
+        """
+
+        self.transport = None
+        """Shared transport (see shared_transport). If set, requests go
+           through a connection pool shared with all clients that have the
+           same pool, TLS and proxy options instead of a pool of this client.
+        """
+        self.rate_limiter = None
+        """Upstream rate limiter, awaited before every request and updated
+           with every response (see upstream_rate_limiter).
+        """
+        self.codec = None
+        """Codec for JSON bodies (see model_codec). If set, responses are
+           validated straight from the JSON bytes and request bodies are
+           serialized per class; None keeps the generated code path.
+        """
 
         self.proxy: Optional[str] = None
         """Proxy URL
@@ -12,312 +12,646 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import importlib
+from typing import TYPE_CHECKING
+
 # import models into model package
-from eve_client.models.alliance_id import AllianceId
-from eve_client.models.alliances_alliance_id_contacts_get_inner import AlliancesAllianceIdContactsGetInner
-from eve_client.models.alliances_alliance_id_contacts_labels_get_inner import AlliancesAllianceIdContactsLabelsGetInner
-from eve_client.models.alliances_alliance_id_get import AlliancesAllianceIdGet
-from eve_client.models.alliances_alliance_id_icons_get import AlliancesAllianceIdIconsGet
-from eve_client.models.capture_fw_complex import CaptureFwComplex
-from eve_client.models.character_id import CharacterId
-from eve_client.models.characters_affiliation_post_inner import CharactersAffiliationPostInner
-from eve_client.models.characters_character_id_agents_research_get_inner import CharactersCharacterIdAgentsResearchGetInner
-from eve_client.models.characters_character_id_assets_get_inner import CharactersCharacterIdAssetsGetInner
-from eve_client.models.characters_character_id_assets_locations_post_inner import CharactersCharacterIdAssetsLocationsPostInner
-from eve_client.models.characters_character_id_assets_locations_post_inner_position import CharactersCharacterIdAssetsLocationsPostInnerPosition
-from eve_client.models.characters_character_id_assets_names_post_inner import CharactersCharacterIdAssetsNamesPostInner
-from eve_client.models.characters_character_id_attributes_get import CharactersCharacterIdAttributesGet
-from eve_client.models.characters_character_id_blueprints_get_inner import CharactersCharacterIdBlueprintsGetInner
-from eve_client.models.characters_character_id_calendar_event_id_attendees_get_inner import CharactersCharacterIdCalendarEventIdAttendeesGetInner
-from eve_client.models.characters_character_id_calendar_event_id_get import CharactersCharacterIdCalendarEventIdGet
-from eve_client.models.characters_character_id_calendar_get_inner import CharactersCharacterIdCalendarGetInner
-from eve_client.models.characters_character_id_clones_get import CharactersCharacterIdClonesGet
-from eve_client.models.characters_character_id_clones_get_home_location import CharactersCharacterIdClonesGetHomeLocation
-from eve_client.models.characters_character_id_clones_get_jump_clones_inner import CharactersCharacterIdClonesGetJumpClonesInner
-from eve_client.models.characters_character_id_contacts_get_inner import CharactersCharacterIdContactsGetInner
-from eve_client.models.characters_character_id_contracts_contract_id_bids_get_inner import CharactersCharacterIdContractsContractIdBidsGetInner
-from eve_client.models.characters_character_id_contracts_contract_id_items_get_inner import CharactersCharacterIdContractsContractIdItemsGetInner
-from eve_client.models.characters_character_id_contracts_get_inner import CharactersCharacterIdContractsGetInner
-from eve_client.models.characters_character_id_corporationhistory_get_inner import CharactersCharacterIdCorporationhistoryGetInner
-from eve_client.models.characters_character_id_fatigue_get import CharactersCharacterIdFatigueGet
-from eve_client.models.characters_character_id_fittings_get_inner import CharactersCharacterIdFittingsGetInner
-from eve_client.models.characters_character_id_fittings_get_inner_items_inner import CharactersCharacterIdFittingsGetInnerItemsInner
-from eve_client.models.characters_character_id_fittings_post import CharactersCharacterIdFittingsPost
-from eve_client.models.characters_character_id_fleet_get import CharactersCharacterIdFleetGet
-from eve_client.models.characters_character_id_fw_stats_get import CharactersCharacterIdFwStatsGet
-from eve_client.models.characters_character_id_fw_stats_get_kills import CharactersCharacterIdFwStatsGetKills
-from eve_client.models.characters_character_id_fw_stats_get_victory_points import CharactersCharacterIdFwStatsGetVictoryPoints
-from eve_client.models.characters_character_id_get import CharactersCharacterIdGet
-from eve_client.models.characters_character_id_industry_jobs_get_inner import CharactersCharacterIdIndustryJobsGetInner
-from eve_client.models.characters_character_id_killmails_recent_get_inner import CharactersCharacterIdKillmailsRecentGetInner
-from eve_client.models.characters_character_id_location_get import CharactersCharacterIdLocationGet
-from eve_client.models.characters_character_id_loyalty_points_get_inner import CharactersCharacterIdLoyaltyPointsGetInner
-from eve_client.models.characters_character_id_mail_get_inner import CharactersCharacterIdMailGetInner
-from eve_client.models.characters_character_id_mail_labels_get import CharactersCharacterIdMailLabelsGet
-from eve_client.models.characters_character_id_mail_labels_get_labels_inner import CharactersCharacterIdMailLabelsGetLabelsInner
-from eve_client.models.characters_character_id_mail_lists_get_inner import CharactersCharacterIdMailListsGetInner
-from eve_client.models.characters_character_id_mail_mail_id_get import CharactersCharacterIdMailMailIdGet
-from eve_client.models.characters_character_id_medals_get_inner import CharactersCharacterIdMedalsGetInner
-from eve_client.models.characters_character_id_medals_get_inner_graphics_inner import CharactersCharacterIdMedalsGetInnerGraphicsInner
-from eve_client.models.characters_character_id_mining_get_inner import CharactersCharacterIdMiningGetInner
-from eve_client.models.characters_character_id_notifications_contacts_get_inner import CharactersCharacterIdNotificationsContactsGetInner
-from eve_client.models.characters_character_id_notifications_get_inner import CharactersCharacterIdNotificationsGetInner
-from eve_client.models.characters_character_id_online_get import CharactersCharacterIdOnlineGet
-from eve_client.models.characters_character_id_orders_get_inner import CharactersCharacterIdOrdersGetInner
-from eve_client.models.characters_character_id_orders_history_get_inner import CharactersCharacterIdOrdersHistoryGetInner
-from eve_client.models.characters_character_id_planets_get_inner import CharactersCharacterIdPlanetsGetInner
-from eve_client.models.characters_character_id_planets_planet_id_get import CharactersCharacterIdPlanetsPlanetIdGet
-from eve_client.models.characters_character_id_planets_planet_id_get_links_inner import CharactersCharacterIdPlanetsPlanetIdGetLinksInner
-from eve_client.models.characters_character_id_planets_planet_id_get_pins_inner import CharactersCharacterIdPlanetsPlanetIdGetPinsInner
-from eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_contents_inner import CharactersCharacterIdPlanetsPlanetIdGetPinsInnerContentsInner
-from eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_extractor_details import CharactersCharacterIdPlanetsPlanetIdGetPinsInnerExtractorDetails
-from eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_extractor_details_heads_inner import CharactersCharacterIdPlanetsPlanetIdGetPinsInnerExtractorDetailsHeadsInner
-from eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_factory_details import CharactersCharacterIdPlanetsPlanetIdGetPinsInnerFactoryDetails
-from eve_client.models.characters_character_id_planets_planet_id_get_routes_inner import CharactersCharacterIdPlanetsPlanetIdGetRoutesInner
-from eve_client.models.characters_character_id_portrait_get import CharactersCharacterIdPortraitGet
-from eve_client.models.characters_character_id_roles_get import CharactersCharacterIdRolesGet
-from eve_client.models.characters_character_id_search_get import CharactersCharacterIdSearchGet
-from eve_client.models.characters_character_id_ship_get import CharactersCharacterIdShipGet
-from eve_client.models.characters_character_id_skillqueue_get_inner import CharactersCharacterIdSkillqueueGetInner
-from eve_client.models.characters_character_id_skills_get import CharactersCharacterIdSkillsGet
-from eve_client.models.characters_character_id_skills_get_skills_inner import CharactersCharacterIdSkillsGetSkillsInner
-from eve_client.models.characters_character_id_standings_get_inner import CharactersCharacterIdStandingsGetInner
-from eve_client.models.characters_character_id_titles_get_inner import CharactersCharacterIdTitlesGetInner
-from eve_client.models.characters_character_id_wallet_journal_get_inner import CharactersCharacterIdWalletJournalGetInner
-from eve_client.models.characters_character_id_wallet_transactions_get_inner import CharactersCharacterIdWalletTransactionsGetInner
-from eve_client.models.constellation_id import ConstellationId
-from eve_client.models.contracts_public_bids_contract_id_get_inner import ContractsPublicBidsContractIdGetInner
-from eve_client.models.contracts_public_items_contract_id_get_inner import ContractsPublicItemsContractIdGetInner
-from eve_client.models.contracts_public_region_id_get_inner import ContractsPublicRegionIdGetInner
-from eve_client.models.corporation_corporation_id_mining_extractions_get_inner import CorporationCorporationIdMiningExtractionsGetInner
-from eve_client.models.corporation_corporation_id_mining_observers_get_inner import CorporationCorporationIdMiningObserversGetInner
-from eve_client.models.corporation_corporation_id_mining_observers_observer_id_get_inner import CorporationCorporationIdMiningObserversObserverIdGetInner
-from eve_client.models.corporation_id import CorporationId
-from eve_client.models.corporations_corporation_id_alliancehistory_get_inner import CorporationsCorporationIdAlliancehistoryGetInner
-from eve_client.models.corporations_corporation_id_assets_get_inner import CorporationsCorporationIdAssetsGetInner
-from eve_client.models.corporations_corporation_id_blueprints_get_inner import CorporationsCorporationIdBlueprintsGetInner
-from eve_client.models.corporations_corporation_id_contacts_get_inner import CorporationsCorporationIdContactsGetInner
-from eve_client.models.corporations_corporation_id_containers_logs_get_inner import CorporationsCorporationIdContainersLogsGetInner
-from eve_client.models.corporations_corporation_id_contracts_get_inner import CorporationsCorporationIdContractsGetInner
-from eve_client.models.corporations_corporation_id_customs_offices_get_inner import CorporationsCorporationIdCustomsOfficesGetInner
-from eve_client.models.corporations_corporation_id_divisions_get import CorporationsCorporationIdDivisionsGet
-from eve_client.models.corporations_corporation_id_divisions_get_hangar_inner import CorporationsCorporationIdDivisionsGetHangarInner
-from eve_client.models.corporations_corporation_id_divisions_get_wallet_inner import CorporationsCorporationIdDivisionsGetWalletInner
-from eve_client.models.corporations_corporation_id_facilities_get_inner import CorporationsCorporationIdFacilitiesGetInner
-from eve_client.models.corporations_corporation_id_fw_stats_get import CorporationsCorporationIdFwStatsGet
-from eve_client.models.corporations_corporation_id_fw_stats_get_kills import CorporationsCorporationIdFwStatsGetKills
-from eve_client.models.corporations_corporation_id_fw_stats_get_victory_points import CorporationsCorporationIdFwStatsGetVictoryPoints
-from eve_client.models.corporations_corporation_id_get import CorporationsCorporationIdGet
-from eve_client.models.corporations_corporation_id_icons_get import CorporationsCorporationIdIconsGet
-from eve_client.models.corporations_corporation_id_industry_jobs_get_inner import CorporationsCorporationIdIndustryJobsGetInner
-from eve_client.models.corporations_corporation_id_medals_get_inner import CorporationsCorporationIdMedalsGetInner
-from eve_client.models.corporations_corporation_id_medals_issued_get_inner import CorporationsCorporationIdMedalsIssuedGetInner
-from eve_client.models.corporations_corporation_id_members_titles_get_inner import CorporationsCorporationIdMembersTitlesGetInner
-from eve_client.models.corporations_corporation_id_membertracking_get_inner import CorporationsCorporationIdMembertrackingGetInner
-from eve_client.models.corporations_corporation_id_orders_get_inner import CorporationsCorporationIdOrdersGetInner
-from eve_client.models.corporations_corporation_id_orders_history_get_inner import CorporationsCorporationIdOrdersHistoryGetInner
-from eve_client.models.corporations_corporation_id_roles_get_inner import CorporationsCorporationIdRolesGetInner
-from eve_client.models.corporations_corporation_id_roles_history_get_inner import CorporationsCorporationIdRolesHistoryGetInner
-from eve_client.models.corporations_corporation_id_shareholders_get_inner import CorporationsCorporationIdShareholdersGetInner
-from eve_client.models.corporations_corporation_id_starbases_get_inner import CorporationsCorporationIdStarbasesGetInner
-from eve_client.models.corporations_corporation_id_starbases_starbase_id_get import CorporationsCorporationIdStarbasesStarbaseIdGet
-from eve_client.models.corporations_corporation_id_starbases_starbase_id_get_fuels_inner import CorporationsCorporationIdStarbasesStarbaseIdGetFuelsInner
-from eve_client.models.corporations_corporation_id_structures_get_inner import CorporationsCorporationIdStructuresGetInner
-from eve_client.models.corporations_corporation_id_structures_get_inner_services_inner import CorporationsCorporationIdStructuresGetInnerServicesInner
-from eve_client.models.corporations_corporation_id_titles_get_inner import CorporationsCorporationIdTitlesGetInner
-from eve_client.models.corporations_corporation_id_wallets_division_journal_get_inner import CorporationsCorporationIdWalletsDivisionJournalGetInner
-from eve_client.models.corporations_corporation_id_wallets_division_transactions_get_inner import CorporationsCorporationIdWalletsDivisionTransactionsGetInner
-from eve_client.models.corporations_corporation_id_wallets_get_inner import CorporationsCorporationIdWalletsGetInner
-from eve_client.models.corporations_projects_contribution import CorporationsProjectsContribution
-from eve_client.models.corporations_projects_contributors import CorporationsProjectsContributors
-from eve_client.models.corporations_projects_contributors_contributor import CorporationsProjectsContributorsContributor
-from eve_client.models.corporations_projects_detail import CorporationsProjectsDetail
-from eve_client.models.corporations_projects_detail_configuration import CorporationsProjectsDetailConfiguration
-from eve_client.models.corporations_projects_detail_configurationcapturefwcomplex import CorporationsProjectsDetailConfigurationcapturefwcomplex
-from eve_client.models.corporations_projects_detail_configurationcapturefwcomplex_locations_inner import CorporationsProjectsDetailConfigurationcapturefwcomplexLocationsInner
-from eve_client.models.corporations_projects_detail_configurationdamageship import CorporationsProjectsDetailConfigurationdamageship
-from eve_client.models.corporations_projects_detail_configurationdamageship_identities_inner import CorporationsProjectsDetailConfigurationdamageshipIdentitiesInner
-from eve_client.models.corporations_projects_detail_configurationdamageship_ships_inner import CorporationsProjectsDetailConfigurationdamageshipShipsInner
-from eve_client.models.corporations_projects_detail_configurationdefendfwcomplex import CorporationsProjectsDetailConfigurationdefendfwcomplex
-from eve_client.models.corporations_projects_detail_configurationdeliveritem import CorporationsProjectsDetailConfigurationdeliveritem
-from eve_client.models.corporations_projects_detail_configurationdeliveritem_docking_locations_inner import CorporationsProjectsDetailConfigurationdeliveritemDockingLocationsInner
-from eve_client.models.corporations_projects_detail_configurationdeliveritem_items_inner import CorporationsProjectsDetailConfigurationdeliveritemItemsInner
-from eve_client.models.corporations_projects_detail_configurationdestroynpc import CorporationsProjectsDetailConfigurationdestroynpc
-from eve_client.models.corporations_projects_detail_configurationdestroyship import CorporationsProjectsDetailConfigurationdestroyship
-from eve_client.models.corporations_projects_detail_configurationearnloyaltypoints import CorporationsProjectsDetailConfigurationearnloyaltypoints
-from eve_client.models.corporations_projects_detail_configurationlostship import CorporationsProjectsDetailConfigurationlostship
-from eve_client.models.corporations_projects_detail_configurationmanufactureitem import CorporationsProjectsDetailConfigurationmanufactureitem
-from eve_client.models.corporations_projects_detail_configurationmatcherarchetype import CorporationsProjectsDetailConfigurationmatcherarchetype
-from eve_client.models.corporations_projects_detail_configurationmatchercorporation import CorporationsProjectsDetailConfigurationmatchercorporation
-from eve_client.models.corporations_projects_detail_configurationmatcherfaction import CorporationsProjectsDetailConfigurationmatcherfaction
-from eve_client.models.corporations_projects_detail_configurationmatchersignature import CorporationsProjectsDetailConfigurationmatchersignature
-from eve_client.models.corporations_projects_detail_configurationminematerial import CorporationsProjectsDetailConfigurationminematerial
-from eve_client.models.corporations_projects_detail_configurationremoteboostshield import CorporationsProjectsDetailConfigurationremoteboostshield
-from eve_client.models.corporations_projects_detail_configurationremoterepairarmor import CorporationsProjectsDetailConfigurationremoterepairarmor
-from eve_client.models.corporations_projects_detail_configurationsalvagewreck import CorporationsProjectsDetailConfigurationsalvagewreck
-from eve_client.models.corporations_projects_detail_configurationscansignature import CorporationsProjectsDetailConfigurationscansignature
-from eve_client.models.corporations_projects_detail_configurationshipinsurance import CorporationsProjectsDetailConfigurationshipinsurance
-from eve_client.models.corporations_projects_detail_configurationunknown import CorporationsProjectsDetailConfigurationunknown
-from eve_client.models.corporations_projects_detail_contribution import CorporationsProjectsDetailContribution
-from eve_client.models.corporations_projects_detail_creator import CorporationsProjectsDetailCreator
-from eve_client.models.corporations_projects_detail_details import CorporationsProjectsDetailDetails
-from eve_client.models.corporations_projects_detail_progress import CorporationsProjectsDetailProgress
-from eve_client.models.corporations_projects_detail_project import CorporationsProjectsDetailProject
-from eve_client.models.corporations_projects_detail_reward import CorporationsProjectsDetailReward
-from eve_client.models.corporations_projects_listing import CorporationsProjectsListing
-from eve_client.models.cursor import Cursor
-from eve_client.models.damage_ship import DamageShip
-from eve_client.models.defend_fw_complex import DefendFwComplex
-from eve_client.models.deliver_item import DeliverItem
-from eve_client.models.destroy_npc import DestroyNpc
-from eve_client.models.destroy_ship import DestroyShip
-from eve_client.models.dogma_attributes_attribute_id_get import DogmaAttributesAttributeIdGet
-from eve_client.models.dogma_dynamic_items_type_id_item_id_get import DogmaDynamicItemsTypeIdItemIdGet
-from eve_client.models.dogma_dynamic_items_type_id_item_id_get_dogma_attributes_inner import DogmaDynamicItemsTypeIdItemIdGetDogmaAttributesInner
-from eve_client.models.dogma_dynamic_items_type_id_item_id_get_dogma_effects_inner import DogmaDynamicItemsTypeIdItemIdGetDogmaEffectsInner
-from eve_client.models.dogma_effects_effect_id_get import DogmaEffectsEffectIdGet
-from eve_client.models.dogma_effects_effect_id_get_modifiers_inner import DogmaEffectsEffectIdGetModifiersInner
-from eve_client.models.earn_loyalty_point import EarnLoyaltyPoint
-from eve_client.models.error import Error
-from eve_client.models.error_detail import ErrorDetail
-from eve_client.models.faction_id import FactionId
-from eve_client.models.fleets_fleet_id_get import FleetsFleetIdGet
-from eve_client.models.fleets_fleet_id_members_get_inner import FleetsFleetIdMembersGetInner
-from eve_client.models.fleets_fleet_id_wings_get_inner import FleetsFleetIdWingsGetInner
-from eve_client.models.fleets_fleet_id_wings_get_inner_squads_inner import FleetsFleetIdWingsGetInnerSquadsInner
-from eve_client.models.fleets_fleet_id_wings_post import FleetsFleetIdWingsPost
-from eve_client.models.fleets_fleet_id_wings_wing_id_squads_post import FleetsFleetIdWingsWingIdSquadsPost
-from eve_client.models.fw_leaderboards_characters_get import FwLeaderboardsCharactersGet
-from eve_client.models.fw_leaderboards_characters_get_kills import FwLeaderboardsCharactersGetKills
-from eve_client.models.fw_leaderboards_characters_get_kills_active_total_inner import FwLeaderboardsCharactersGetKillsActiveTotalInner
-from eve_client.models.fw_leaderboards_characters_get_kills_last_week_inner import FwLeaderboardsCharactersGetKillsLastWeekInner
-from eve_client.models.fw_leaderboards_characters_get_kills_yesterday_inner import FwLeaderboardsCharactersGetKillsYesterdayInner
-from eve_client.models.fw_leaderboards_characters_get_victory_points import FwLeaderboardsCharactersGetVictoryPoints
-from eve_client.models.fw_leaderboards_characters_get_victory_points_active_total_inner import FwLeaderboardsCharactersGetVictoryPointsActiveTotalInner
-from eve_client.models.fw_leaderboards_characters_get_victory_points_last_week_inner import FwLeaderboardsCharactersGetVictoryPointsLastWeekInner
-from eve_client.models.fw_leaderboards_characters_get_victory_points_yesterday_inner import FwLeaderboardsCharactersGetVictoryPointsYesterdayInner
-from eve_client.models.fw_leaderboards_corporations_get import FwLeaderboardsCorporationsGet
-from eve_client.models.fw_leaderboards_corporations_get_kills import FwLeaderboardsCorporationsGetKills
-from eve_client.models.fw_leaderboards_corporations_get_kills_active_total_inner import FwLeaderboardsCorporationsGetKillsActiveTotalInner
-from eve_client.models.fw_leaderboards_corporations_get_kills_last_week_inner import FwLeaderboardsCorporationsGetKillsLastWeekInner
-from eve_client.models.fw_leaderboards_corporations_get_kills_yesterday_inner import FwLeaderboardsCorporationsGetKillsYesterdayInner
-from eve_client.models.fw_leaderboards_corporations_get_victory_points import FwLeaderboardsCorporationsGetVictoryPoints
-from eve_client.models.fw_leaderboards_corporations_get_victory_points_active_total_inner import FwLeaderboardsCorporationsGetVictoryPointsActiveTotalInner
-from eve_client.models.fw_leaderboards_corporations_get_victory_points_last_week_inner import FwLeaderboardsCorporationsGetVictoryPointsLastWeekInner
-from eve_client.models.fw_leaderboards_corporations_get_victory_points_yesterday_inner import FwLeaderboardsCorporationsGetVictoryPointsYesterdayInner
-from eve_client.models.fw_leaderboards_get import FwLeaderboardsGet
-from eve_client.models.fw_leaderboards_get_kills import FwLeaderboardsGetKills
-from eve_client.models.fw_leaderboards_get_kills_active_total_inner import FwLeaderboardsGetKillsActiveTotalInner
-from eve_client.models.fw_leaderboards_get_kills_last_week_inner import FwLeaderboardsGetKillsLastWeekInner
-from eve_client.models.fw_leaderboards_get_kills_yesterday_inner import FwLeaderboardsGetKillsYesterdayInner
-from eve_client.models.fw_leaderboards_get_victory_points import FwLeaderboardsGetVictoryPoints
-from eve_client.models.fw_leaderboards_get_victory_points_active_total_inner import FwLeaderboardsGetVictoryPointsActiveTotalInner
-from eve_client.models.fw_leaderboards_get_victory_points_last_week_inner import FwLeaderboardsGetVictoryPointsLastWeekInner
-from eve_client.models.fw_leaderboards_get_victory_points_yesterday_inner import FwLeaderboardsGetVictoryPointsYesterdayInner
-from eve_client.models.fw_stats_get_inner import FwStatsGetInner
-from eve_client.models.fw_stats_get_inner_kills import FwStatsGetInnerKills
-from eve_client.models.fw_stats_get_inner_victory_points import FwStatsGetInnerVictoryPoints
-from eve_client.models.fw_systems_get_inner import FwSystemsGetInner
-from eve_client.models.fw_wars_get_inner import FwWarsGetInner
-from eve_client.models.group_id import GroupId
-from eve_client.models.group_id1 import GroupId1
-from eve_client.models.incursions_get_inner import IncursionsGetInner
-from eve_client.models.industry_facilities_get_inner import IndustryFacilitiesGetInner
-from eve_client.models.industry_systems_get_inner import IndustrySystemsGetInner
-from eve_client.models.industry_systems_get_inner_cost_indices_inner import IndustrySystemsGetInnerCostIndicesInner
-from eve_client.models.insurance_prices_get_inner import InsurancePricesGetInner
-from eve_client.models.insurance_prices_get_inner_levels_inner import InsurancePricesGetInnerLevelsInner
-from eve_client.models.killmails_killmail_id_killmail_hash_get import KillmailsKillmailIdKillmailHashGet
-from eve_client.models.killmails_killmail_id_killmail_hash_get_attackers_inner import KillmailsKillmailIdKillmailHashGetAttackersInner
-from eve_client.models.killmails_killmail_id_killmail_hash_get_victim import KillmailsKillmailIdKillmailHashGetVictim
-from eve_client.models.killmails_killmail_id_killmail_hash_get_victim_items_inner import KillmailsKillmailIdKillmailHashGetVictimItemsInner
-from eve_client.models.killmails_killmail_id_killmail_hash_get_victim_items_inner_items_inner import KillmailsKillmailIdKillmailHashGetVictimItemsInnerItemsInner
-from eve_client.models.killmails_killmail_id_killmail_hash_get_victim_position import KillmailsKillmailIdKillmailHashGetVictimPosition
-from eve_client.models.lost_ship import LostShip
-from eve_client.models.loyalty_stores_corporation_id_offers_get_inner import LoyaltyStoresCorporationIdOffersGetInner
-from eve_client.models.loyalty_stores_corporation_id_offers_get_inner_required_items_inner import LoyaltyStoresCorporationIdOffersGetInnerRequiredItemsInner
-from eve_client.models.manual import Manual
-from eve_client.models.manufacture_item import ManufactureItem
-from eve_client.models.markets_groups_market_group_id_get import MarketsGroupsMarketGroupIdGet
-from eve_client.models.markets_prices_get_inner import MarketsPricesGetInner
-from eve_client.models.markets_region_id_history_get_inner import MarketsRegionIdHistoryGetInner
-from eve_client.models.markets_region_id_orders_get_inner import MarketsRegionIdOrdersGetInner
-from eve_client.models.markets_structures_structure_id_get_inner import MarketsStructuresStructureIdGetInner
-from eve_client.models.meta_changelog import MetaChangelog
-from eve_client.models.meta_changelog_entry import MetaChangelogEntry
-from eve_client.models.meta_compatibility_dates import MetaCompatibilityDates
-from eve_client.models.meta_status import MetaStatus
-from eve_client.models.meta_status_routestatus import MetaStatusRoutestatus
-from eve_client.models.mine_material import MineMaterial
-from eve_client.models.post_characters_character_id_fittings_request import PostCharactersCharacterIdFittingsRequest
-from eve_client.models.post_characters_character_id_fittings_request_items_inner import PostCharactersCharacterIdFittingsRequestItemsInner
-from eve_client.models.post_characters_character_id_mail_labels_request import PostCharactersCharacterIdMailLabelsRequest
-from eve_client.models.post_characters_character_id_mail_request import PostCharactersCharacterIdMailRequest
-from eve_client.models.post_characters_character_id_mail_request_recipients_inner import PostCharactersCharacterIdMailRequestRecipientsInner
-from eve_client.models.post_fleets_fleet_id_members_request import PostFleetsFleetIdMembersRequest
-from eve_client.models.post_ui_openwindow_newmail_request import PostUiOpenwindowNewmailRequest
-from eve_client.models.put_characters_character_id_calendar_event_id_request import PutCharactersCharacterIdCalendarEventIdRequest
-from eve_client.models.put_characters_character_id_mail_mail_id_request import PutCharactersCharacterIdMailMailIdRequest
-from eve_client.models.put_fleets_fleet_id_members_member_id_request import PutFleetsFleetIdMembersMemberIdRequest
-from eve_client.models.put_fleets_fleet_id_request import PutFleetsFleetIdRequest
-from eve_client.models.put_fleets_fleet_id_squads_squad_id_request import PutFleetsFleetIdSquadsSquadIdRequest
-from eve_client.models.region_id import RegionId
-from eve_client.models.remote_boost_shield import RemoteBoostShield
-from eve_client.models.remote_repair_armor import RemoteRepairArmor
-from eve_client.models.route import Route
-from eve_client.models.route_connection import RouteConnection
-from eve_client.models.route_request_body import RouteRequestBody
-from eve_client.models.salvage_wreck import SalvageWreck
-from eve_client.models.scan_signature import ScanSignature
-from eve_client.models.ship_insurance import ShipInsurance
-from eve_client.models.solar_system_id import SolarSystemId
-from eve_client.models.sovereignty_campaigns_get_inner import SovereigntyCampaignsGetInner
-from eve_client.models.sovereignty_campaigns_get_inner_participants_inner import SovereigntyCampaignsGetInnerParticipantsInner
-from eve_client.models.sovereignty_map_get_inner import SovereigntyMapGetInner
-from eve_client.models.sovereignty_structures_get_inner import SovereigntyStructuresGetInner
-from eve_client.models.station_id import StationId
-from eve_client.models.status_get import StatusGet
-from eve_client.models.structure_id import StructureId
-from eve_client.models.type_id import TypeId
-from eve_client.models.universe_ancestries_get_inner import UniverseAncestriesGetInner
-from eve_client.models.universe_asteroid_belts_asteroid_belt_id_get import UniverseAsteroidBeltsAsteroidBeltIdGet
-from eve_client.models.universe_bloodlines_get_inner import UniverseBloodlinesGetInner
-from eve_client.models.universe_categories_category_id_get import UniverseCategoriesCategoryIdGet
-from eve_client.models.universe_constellations_constellation_id_get import UniverseConstellationsConstellationIdGet
-from eve_client.models.universe_factions_get_inner import UniverseFactionsGetInner
-from eve_client.models.universe_graphics_graphic_id_get import UniverseGraphicsGraphicIdGet
-from eve_client.models.universe_groups_group_id_get import UniverseGroupsGroupIdGet
-from eve_client.models.universe_ids_post import UniverseIdsPost
-from eve_client.models.universe_ids_post_agents_inner import UniverseIdsPostAgentsInner
-from eve_client.models.universe_ids_post_alliances_inner import UniverseIdsPostAlliancesInner
-from eve_client.models.universe_ids_post_characters_inner import UniverseIdsPostCharactersInner
-from eve_client.models.universe_ids_post_constellations_inner import UniverseIdsPostConstellationsInner
-from eve_client.models.universe_ids_post_corporations_inner import UniverseIdsPostCorporationsInner
-from eve_client.models.universe_ids_post_factions_inner import UniverseIdsPostFactionsInner
-from eve_client.models.universe_ids_post_inventory_types_inner import UniverseIdsPostInventoryTypesInner
-from eve_client.models.universe_ids_post_regions_inner import UniverseIdsPostRegionsInner
-from eve_client.models.universe_ids_post_stations_inner import UniverseIdsPostStationsInner
-from eve_client.models.universe_ids_post_systems_inner import UniverseIdsPostSystemsInner
-from eve_client.models.universe_moons_moon_id_get import UniverseMoonsMoonIdGet
-from eve_client.models.universe_names_post_inner import UniverseNamesPostInner
-from eve_client.models.universe_planets_planet_id_get import UniversePlanetsPlanetIdGet
-from eve_client.models.universe_races_get_inner import UniverseRacesGetInner
-from eve_client.models.universe_regions_region_id_get import UniverseRegionsRegionIdGet
-from eve_client.models.universe_schematics_schematic_id_get import UniverseSchematicsSchematicIdGet
-from eve_client.models.universe_stargates_stargate_id_get import UniverseStargatesStargateIdGet
-from eve_client.models.universe_stargates_stargate_id_get_destination import UniverseStargatesStargateIdGetDestination
-from eve_client.models.universe_stars_star_id_get import UniverseStarsStarIdGet
-from eve_client.models.universe_stations_station_id_get import UniverseStationsStationIdGet
-from eve_client.models.universe_structures_structure_id_get import UniverseStructuresStructureIdGet
-from eve_client.models.universe_structures_structure_id_get_position import UniverseStructuresStructureIdGetPosition
-from eve_client.models.universe_system_jumps_get_inner import UniverseSystemJumpsGetInner
-from eve_client.models.universe_system_kills_get_inner import UniverseSystemKillsGetInner
-from eve_client.models.universe_systems_system_id_get import UniverseSystemsSystemIdGet
-from eve_client.models.universe_systems_system_id_get_planets_inner import UniverseSystemsSystemIdGetPlanetsInner
-from eve_client.models.universe_types_type_id_get import UniverseTypesTypeIdGet
-from eve_client.models.unknown import Unknown
-from eve_client.models.wars_war_id_get import WarsWarIdGet
-from eve_client.models.wars_war_id_get_aggressor import WarsWarIdGetAggressor
-from eve_client.models.wars_war_id_get_allies_inner import WarsWarIdGetAlliesInner
-from eve_client.models.wars_war_id_get_defender import WarsWarIdGetDefender
+if TYPE_CHECKING:
+    from eve_client.models.alliance_id import AllianceId
+    from eve_client.models.alliances_alliance_id_contacts_get_inner import AlliancesAllianceIdContactsGetInner
+    from eve_client.models.alliances_alliance_id_contacts_labels_get_inner import AlliancesAllianceIdContactsLabelsGetInner
+    from eve_client.models.alliances_alliance_id_get import AlliancesAllianceIdGet
+    from eve_client.models.alliances_alliance_id_icons_get import AlliancesAllianceIdIconsGet
+    from eve_client.models.capture_fw_complex import CaptureFwComplex
+    from eve_client.models.character_id import CharacterId
+    from eve_client.models.characters_affiliation_post_inner import CharactersAffiliationPostInner
+    from eve_client.models.characters_character_id_agents_research_get_inner import CharactersCharacterIdAgentsResearchGetInner
+    from eve_client.models.characters_character_id_assets_get_inner import CharactersCharacterIdAssetsGetInner
+    from eve_client.models.characters_character_id_assets_locations_post_inner import CharactersCharacterIdAssetsLocationsPostInner
+    from eve_client.models.characters_character_id_assets_locations_post_inner_position import CharactersCharacterIdAssetsLocationsPostInnerPosition
+    from eve_client.models.characters_character_id_assets_names_post_inner import CharactersCharacterIdAssetsNamesPostInner
+    from eve_client.models.characters_character_id_attributes_get import CharactersCharacterIdAttributesGet
+    from eve_client.models.characters_character_id_blueprints_get_inner import CharactersCharacterIdBlueprintsGetInner
+    from eve_client.models.characters_character_id_calendar_event_id_attendees_get_inner import CharactersCharacterIdCalendarEventIdAttendeesGetInner
+    from eve_client.models.characters_character_id_calendar_event_id_get import CharactersCharacterIdCalendarEventIdGet
+    from eve_client.models.characters_character_id_calendar_get_inner import CharactersCharacterIdCalendarGetInner
+    from eve_client.models.characters_character_id_clones_get import CharactersCharacterIdClonesGet
+    from eve_client.models.characters_character_id_clones_get_home_location import CharactersCharacterIdClonesGetHomeLocation
+    from eve_client.models.characters_character_id_clones_get_jump_clones_inner import CharactersCharacterIdClonesGetJumpClonesInner
+    from eve_client.models.characters_character_id_contacts_get_inner import CharactersCharacterIdContactsGetInner
+    from eve_client.models.characters_character_id_contracts_contract_id_bids_get_inner import CharactersCharacterIdContractsContractIdBidsGetInner
+    from eve_client.models.characters_character_id_contracts_contract_id_items_get_inner import CharactersCharacterIdContractsContractIdItemsGetInner
+    from eve_client.models.characters_character_id_contracts_get_inner import CharactersCharacterIdContractsGetInner
+    from eve_client.models.characters_character_id_corporationhistory_get_inner import CharactersCharacterIdCorporationhistoryGetInner
+    from eve_client.models.characters_character_id_fatigue_get import CharactersCharacterIdFatigueGet
+    from eve_client.models.characters_character_id_fittings_get_inner import CharactersCharacterIdFittingsGetInner
+    from eve_client.models.characters_character_id_fittings_get_inner_items_inner import CharactersCharacterIdFittingsGetInnerItemsInner
+    from eve_client.models.characters_character_id_fittings_post import CharactersCharacterIdFittingsPost
+    from eve_client.models.characters_character_id_fleet_get import CharactersCharacterIdFleetGet
+    from eve_client.models.characters_character_id_fw_stats_get import CharactersCharacterIdFwStatsGet
+    from eve_client.models.characters_character_id_fw_stats_get_kills import CharactersCharacterIdFwStatsGetKills
+    from eve_client.models.characters_character_id_fw_stats_get_victory_points import CharactersCharacterIdFwStatsGetVictoryPoints
+    from eve_client.models.characters_character_id_get import CharactersCharacterIdGet
+    from eve_client.models.characters_character_id_industry_jobs_get_inner import CharactersCharacterIdIndustryJobsGetInner
+    from eve_client.models.characters_character_id_killmails_recent_get_inner import CharactersCharacterIdKillmailsRecentGetInner
+    from eve_client.models.characters_character_id_location_get import CharactersCharacterIdLocationGet
+    from eve_client.models.characters_character_id_loyalty_points_get_inner import CharactersCharacterIdLoyaltyPointsGetInner
+    from eve_client.models.characters_character_id_mail_get_inner import CharactersCharacterIdMailGetInner
+    from eve_client.models.characters_character_id_mail_labels_get import CharactersCharacterIdMailLabelsGet
+    from eve_client.models.characters_character_id_mail_labels_get_labels_inner import CharactersCharacterIdMailLabelsGetLabelsInner
+    from eve_client.models.characters_character_id_mail_lists_get_inner import CharactersCharacterIdMailListsGetInner
+    from eve_client.models.characters_character_id_mail_mail_id_get import CharactersCharacterIdMailMailIdGet
+    from eve_client.models.characters_character_id_medals_get_inner import CharactersCharacterIdMedalsGetInner
+    from eve_client.models.characters_character_id_medals_get_inner_graphics_inner import CharactersCharacterIdMedalsGetInnerGraphicsInner
+    from eve_client.models.characters_character_id_mining_get_inner import CharactersCharacterIdMiningGetInner
+    from eve_client.models.characters_character_id_notifications_contacts_get_inner import CharactersCharacterIdNotificationsContactsGetInner
+    from eve_client.models.characters_character_id_notifications_get_inner import CharactersCharacterIdNotificationsGetInner
+    from eve_client.models.characters_character_id_online_get import CharactersCharacterIdOnlineGet
+    from eve_client.models.characters_character_id_orders_get_inner import CharactersCharacterIdOrdersGetInner
+    from eve_client.models.characters_character_id_orders_history_get_inner import CharactersCharacterIdOrdersHistoryGetInner
+    from eve_client.models.characters_character_id_planets_get_inner import CharactersCharacterIdPlanetsGetInner
+    from eve_client.models.characters_character_id_planets_planet_id_get import CharactersCharacterIdPlanetsPlanetIdGet
+    from eve_client.models.characters_character_id_planets_planet_id_get_links_inner import CharactersCharacterIdPlanetsPlanetIdGetLinksInner
+    from eve_client.models.characters_character_id_planets_planet_id_get_pins_inner import CharactersCharacterIdPlanetsPlanetIdGetPinsInner
+    from eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_contents_inner import CharactersCharacterIdPlanetsPlanetIdGetPinsInnerContentsInner
+    from eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_extractor_details import CharactersCharacterIdPlanetsPlanetIdGetPinsInnerExtractorDetails
+    from eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_extractor_details_heads_inner import CharactersCharacterIdPlanetsPlanetIdGetPinsInnerExtractorDetailsHeadsInner
+    from eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_factory_details import CharactersCharacterIdPlanetsPlanetIdGetPinsInnerFactoryDetails
+    from eve_client.models.characters_character_id_planets_planet_id_get_routes_inner import CharactersCharacterIdPlanetsPlanetIdGetRoutesInner
+    from eve_client.models.characters_character_id_portrait_get import CharactersCharacterIdPortraitGet
+    from eve_client.models.characters_character_id_roles_get import CharactersCharacterIdRolesGet
+    from eve_client.models.characters_character_id_search_get import CharactersCharacterIdSearchGet
+    from eve_client.models.characters_character_id_ship_get import CharactersCharacterIdShipGet
+    from eve_client.models.characters_character_id_skillqueue_get_inner import CharactersCharacterIdSkillqueueGetInner
+    from eve_client.models.characters_character_id_skills_get import CharactersCharacterIdSkillsGet
+    from eve_client.models.characters_character_id_skills_get_skills_inner import CharactersCharacterIdSkillsGetSkillsInner
+    from eve_client.models.characters_character_id_standings_get_inner import CharactersCharacterIdStandingsGetInner
+    from eve_client.models.characters_character_id_titles_get_inner import CharactersCharacterIdTitlesGetInner
+    from eve_client.models.characters_character_id_wallet_journal_get_inner import CharactersCharacterIdWalletJournalGetInner
+    from eve_client.models.characters_character_id_wallet_transactions_get_inner import CharactersCharacterIdWalletTransactionsGetInner
+    from eve_client.models.constellation_id import ConstellationId
+    from eve_client.models.contracts_public_bids_contract_id_get_inner import ContractsPublicBidsContractIdGetInner
+    from eve_client.models.contracts_public_items_contract_id_get_inner import ContractsPublicItemsContractIdGetInner
+    from eve_client.models.contracts_public_region_id_get_inner import ContractsPublicRegionIdGetInner
+    from eve_client.models.corporation_corporation_id_mining_extractions_get_inner import CorporationCorporationIdMiningExtractionsGetInner
+    from eve_client.models.corporation_corporation_id_mining_observers_get_inner import CorporationCorporationIdMiningObserversGetInner
+    from eve_client.models.corporation_corporation_id_mining_observers_observer_id_get_inner import CorporationCorporationIdMiningObserversObserverIdGetInner
+    from eve_client.models.corporation_id import CorporationId
+    from eve_client.models.corporations_corporation_id_alliancehistory_get_inner import CorporationsCorporationIdAlliancehistoryGetInner
+    from eve_client.models.corporations_corporation_id_assets_get_inner import CorporationsCorporationIdAssetsGetInner
+    from eve_client.models.corporations_corporation_id_blueprints_get_inner import CorporationsCorporationIdBlueprintsGetInner
+    from eve_client.models.corporations_corporation_id_contacts_get_inner import CorporationsCorporationIdContactsGetInner
+    from eve_client.models.corporations_corporation_id_containers_logs_get_inner import CorporationsCorporationIdContainersLogsGetInner
+    from eve_client.models.corporations_corporation_id_contracts_get_inner import CorporationsCorporationIdContractsGetInner
+    from eve_client.models.corporations_corporation_id_customs_offices_get_inner import CorporationsCorporationIdCustomsOfficesGetInner
+    from eve_client.models.corporations_corporation_id_divisions_get import CorporationsCorporationIdDivisionsGet
+    from eve_client.models.corporations_corporation_id_divisions_get_hangar_inner import CorporationsCorporationIdDivisionsGetHangarInner
+    from eve_client.models.corporations_corporation_id_divisions_get_wallet_inner import CorporationsCorporationIdDivisionsGetWalletInner
+    from eve_client.models.corporations_corporation_id_facilities_get_inner import CorporationsCorporationIdFacilitiesGetInner
+    from eve_client.models.corporations_corporation_id_fw_stats_get import CorporationsCorporationIdFwStatsGet
+    from eve_client.models.corporations_corporation_id_fw_stats_get_kills import CorporationsCorporationIdFwStatsGetKills
+    from eve_client.models.corporations_corporation_id_fw_stats_get_victory_points import CorporationsCorporationIdFwStatsGetVictoryPoints
+    from eve_client.models.corporations_corporation_id_get import CorporationsCorporationIdGet
+    from eve_client.models.corporations_corporation_id_icons_get import CorporationsCorporationIdIconsGet
+    from eve_client.models.corporations_corporation_id_industry_jobs_get_inner import CorporationsCorporationIdIndustryJobsGetInner
+    from eve_client.models.corporations_corporation_id_medals_get_inner import CorporationsCorporationIdMedalsGetInner
+    from eve_client.models.corporations_corporation_id_medals_issued_get_inner import CorporationsCorporationIdMedalsIssuedGetInner
+    from eve_client.models.corporations_corporation_id_members_titles_get_inner import CorporationsCorporationIdMembersTitlesGetInner
+    from eve_client.models.corporations_corporation_id_membertracking_get_inner import CorporationsCorporationIdMembertrackingGetInner
+    from eve_client.models.corporations_corporation_id_orders_get_inner import CorporationsCorporationIdOrdersGetInner
+    from eve_client.models.corporations_corporation_id_orders_history_get_inner import CorporationsCorporationIdOrdersHistoryGetInner
+    from eve_client.models.corporations_corporation_id_roles_get_inner import CorporationsCorporationIdRolesGetInner
+    from eve_client.models.corporations_corporation_id_roles_history_get_inner import CorporationsCorporationIdRolesHistoryGetInner
+    from eve_client.models.corporations_corporation_id_shareholders_get_inner import CorporationsCorporationIdShareholdersGetInner
+    from eve_client.models.corporations_corporation_id_starbases_get_inner import CorporationsCorporationIdStarbasesGetInner
+    from eve_client.models.corporations_corporation_id_starbases_starbase_id_get import CorporationsCorporationIdStarbasesStarbaseIdGet
+    from eve_client.models.corporations_corporation_id_starbases_starbase_id_get_fuels_inner import CorporationsCorporationIdStarbasesStarbaseIdGetFuelsInner
+    from eve_client.models.corporations_corporation_id_structures_get_inner import CorporationsCorporationIdStructuresGetInner
+    from eve_client.models.corporations_corporation_id_structures_get_inner_services_inner import CorporationsCorporationIdStructuresGetInnerServicesInner
+    from eve_client.models.corporations_corporation_id_titles_get_inner import CorporationsCorporationIdTitlesGetInner
+    from eve_client.models.corporations_corporation_id_wallets_division_journal_get_inner import CorporationsCorporationIdWalletsDivisionJournalGetInner
+    from eve_client.models.corporations_corporation_id_wallets_division_transactions_get_inner import CorporationsCorporationIdWalletsDivisionTransactionsGetInner
+    from eve_client.models.corporations_corporation_id_wallets_get_inner import CorporationsCorporationIdWalletsGetInner
+    from eve_client.models.corporations_projects_contribution import CorporationsProjectsContribution
+    from eve_client.models.corporations_projects_contributors import CorporationsProjectsContributors
+    from eve_client.models.corporations_projects_contributors_contributor import CorporationsProjectsContributorsContributor
+    from eve_client.models.corporations_projects_detail import CorporationsProjectsDetail
+    from eve_client.models.corporations_projects_detail_configuration import CorporationsProjectsDetailConfiguration
+    from eve_client.models.corporations_projects_detail_configurationcapturefwcomplex import CorporationsProjectsDetailConfigurationcapturefwcomplex
+    from eve_client.models.corporations_projects_detail_configurationcapturefwcomplex_locations_inner import CorporationsProjectsDetailConfigurationcapturefwcomplexLocationsInner
+    from eve_client.models.corporations_projects_detail_configurationdamageship import CorporationsProjectsDetailConfigurationdamageship
+    from eve_client.models.corporations_projects_detail_configurationdamageship_identities_inner import CorporationsProjectsDetailConfigurationdamageshipIdentitiesInner
+    from eve_client.models.corporations_projects_detail_configurationdamageship_ships_inner import CorporationsProjectsDetailConfigurationdamageshipShipsInner
+    from eve_client.models.corporations_projects_detail_configurationdefendfwcomplex import CorporationsProjectsDetailConfigurationdefendfwcomplex
+    from eve_client.models.corporations_projects_detail_configurationdeliveritem import CorporationsProjectsDetailConfigurationdeliveritem
+    from eve_client.models.corporations_projects_detail_configurationdeliveritem_docking_locations_inner import CorporationsProjectsDetailConfigurationdeliveritemDockingLocationsInner
+    from eve_client.models.corporations_projects_detail_configurationdeliveritem_items_inner import CorporationsProjectsDetailConfigurationdeliveritemItemsInner
+    from eve_client.models.corporations_projects_detail_configurationdestroynpc import CorporationsProjectsDetailConfigurationdestroynpc
+    from eve_client.models.corporations_projects_detail_configurationdestroyship import CorporationsProjectsDetailConfigurationdestroyship
+    from eve_client.models.corporations_projects_detail_configurationearnloyaltypoints import CorporationsProjectsDetailConfigurationearnloyaltypoints
+    from eve_client.models.corporations_projects_detail_configurationlostship import CorporationsProjectsDetailConfigurationlostship
+    from eve_client.models.corporations_projects_detail_configurationmanufactureitem import CorporationsProjectsDetailConfigurationmanufactureitem
+    from eve_client.models.corporations_projects_detail_configurationmatcherarchetype import CorporationsProjectsDetailConfigurationmatcherarchetype
+    from eve_client.models.corporations_projects_detail_configurationmatchercorporation import CorporationsProjectsDetailConfigurationmatchercorporation
+    from eve_client.models.corporations_projects_detail_configurationmatcherfaction import CorporationsProjectsDetailConfigurationmatcherfaction
+    from eve_client.models.corporations_projects_detail_configurationmatchersignature import CorporationsProjectsDetailConfigurationmatchersignature
+    from eve_client.models.corporations_projects_detail_configurationminematerial import CorporationsProjectsDetailConfigurationminematerial
+    from eve_client.models.corporations_projects_detail_configurationremoteboostshield import CorporationsProjectsDetailConfigurationremoteboostshield
+    from eve_client.models.corporations_projects_detail_configurationremoterepairarmor import CorporationsProjectsDetailConfigurationremoterepairarmor
+    from eve_client.models.corporations_projects_detail_configurationsalvagewreck import CorporationsProjectsDetailConfigurationsalvagewreck
+    from eve_client.models.corporations_projects_detail_configurationscansignature import CorporationsProjectsDetailConfigurationscansignature
+    from eve_client.models.corporations_projects_detail_configurationshipinsurance import CorporationsProjectsDetailConfigurationshipinsurance
+    from eve_client.models.corporations_projects_detail_configurationunknown import CorporationsProjectsDetailConfigurationunknown
+    from eve_client.models.corporations_projects_detail_contribution import CorporationsProjectsDetailContribution
+    from eve_client.models.corporations_projects_detail_creator import CorporationsProjectsDetailCreator
+    from eve_client.models.corporations_projects_detail_details import CorporationsProjectsDetailDetails
+    from eve_client.models.corporations_projects_detail_progress import CorporationsProjectsDetailProgress
+    from eve_client.models.corporations_projects_detail_project import CorporationsProjectsDetailProject
+    from eve_client.models.corporations_projects_detail_reward import CorporationsProjectsDetailReward
+    from eve_client.models.corporations_projects_listing import CorporationsProjectsListing
+    from eve_client.models.cursor import Cursor
+    from eve_client.models.damage_ship import DamageShip
+    from eve_client.models.defend_fw_complex import DefendFwComplex
+    from eve_client.models.deliver_item import DeliverItem
+    from eve_client.models.destroy_npc import DestroyNpc
+    from eve_client.models.destroy_ship import DestroyShip
+    from eve_client.models.dogma_attributes_attribute_id_get import DogmaAttributesAttributeIdGet
+    from eve_client.models.dogma_dynamic_items_type_id_item_id_get import DogmaDynamicItemsTypeIdItemIdGet
+    from eve_client.models.dogma_dynamic_items_type_id_item_id_get_dogma_attributes_inner import DogmaDynamicItemsTypeIdItemIdGetDogmaAttributesInner
+    from eve_client.models.dogma_dynamic_items_type_id_item_id_get_dogma_effects_inner import DogmaDynamicItemsTypeIdItemIdGetDogmaEffectsInner
+    from eve_client.models.dogma_effects_effect_id_get import DogmaEffectsEffectIdGet
+    from eve_client.models.dogma_effects_effect_id_get_modifiers_inner import DogmaEffectsEffectIdGetModifiersInner
+    from eve_client.models.earn_loyalty_point import EarnLoyaltyPoint
+    from eve_client.models.error import Error
+    from eve_client.models.error_detail import ErrorDetail
+    from eve_client.models.faction_id import FactionId
+    from eve_client.models.fleets_fleet_id_get import FleetsFleetIdGet
+    from eve_client.models.fleets_fleet_id_members_get_inner import FleetsFleetIdMembersGetInner
+    from eve_client.models.fleets_fleet_id_wings_get_inner import FleetsFleetIdWingsGetInner
+    from eve_client.models.fleets_fleet_id_wings_get_inner_squads_inner import FleetsFleetIdWingsGetInnerSquadsInner
+    from eve_client.models.fleets_fleet_id_wings_post import FleetsFleetIdWingsPost
+    from eve_client.models.fleets_fleet_id_wings_wing_id_squads_post import FleetsFleetIdWingsWingIdSquadsPost
+    from eve_client.models.fw_leaderboards_characters_get import FwLeaderboardsCharactersGet
+    from eve_client.models.fw_leaderboards_characters_get_kills import FwLeaderboardsCharactersGetKills
+    from eve_client.models.fw_leaderboards_characters_get_kills_active_total_inner import FwLeaderboardsCharactersGetKillsActiveTotalInner
+    from eve_client.models.fw_leaderboards_characters_get_kills_last_week_inner import FwLeaderboardsCharactersGetKillsLastWeekInner
+    from eve_client.models.fw_leaderboards_characters_get_kills_yesterday_inner import FwLeaderboardsCharactersGetKillsYesterdayInner
+    from eve_client.models.fw_leaderboards_characters_get_victory_points import FwLeaderboardsCharactersGetVictoryPoints
+    from eve_client.models.fw_leaderboards_characters_get_victory_points_active_total_inner import FwLeaderboardsCharactersGetVictoryPointsActiveTotalInner
+    from eve_client.models.fw_leaderboards_characters_get_victory_points_last_week_inner import FwLeaderboardsCharactersGetVictoryPointsLastWeekInner
+    from eve_client.models.fw_leaderboards_characters_get_victory_points_yesterday_inner import FwLeaderboardsCharactersGetVictoryPointsYesterdayInner
+    from eve_client.models.fw_leaderboards_corporations_get import FwLeaderboardsCorporationsGet
+    from eve_client.models.fw_leaderboards_corporations_get_kills import FwLeaderboardsCorporationsGetKills
+    from eve_client.models.fw_leaderboards_corporations_get_kills_active_total_inner import FwLeaderboardsCorporationsGetKillsActiveTotalInner
+    from eve_client.models.fw_leaderboards_corporations_get_kills_last_week_inner import FwLeaderboardsCorporationsGetKillsLastWeekInner
+    from eve_client.models.fw_leaderboards_corporations_get_kills_yesterday_inner import FwLeaderboardsCorporationsGetKillsYesterdayInner
+    from eve_client.models.fw_leaderboards_corporations_get_victory_points import FwLeaderboardsCorporationsGetVictoryPoints
+    from eve_client.models.fw_leaderboards_corporations_get_victory_points_active_total_inner import FwLeaderboardsCorporationsGetVictoryPointsActiveTotalInner
+    from eve_client.models.fw_leaderboards_corporations_get_victory_points_last_week_inner import FwLeaderboardsCorporationsGetVictoryPointsLastWeekInner
+    from eve_client.models.fw_leaderboards_corporations_get_victory_points_yesterday_inner import FwLeaderboardsCorporationsGetVictoryPointsYesterdayInner
+    from eve_client.models.fw_leaderboards_get import FwLeaderboardsGet
+    from eve_client.models.fw_leaderboards_get_kills import FwLeaderboardsGetKills
+    from eve_client.models.fw_leaderboards_get_kills_active_total_inner import FwLeaderboardsGetKillsActiveTotalInner
+    from eve_client.models.fw_leaderboards_get_kills_last_week_inner import FwLeaderboardsGetKillsLastWeekInner
+    from eve_client.models.fw_leaderboards_get_kills_yesterday_inner import FwLeaderboardsGetKillsYesterdayInner
+    from eve_client.models.fw_leaderboards_get_victory_points import FwLeaderboardsGetVictoryPoints
+    from eve_client.models.fw_leaderboards_get_victory_points_active_total_inner import FwLeaderboardsGetVictoryPointsActiveTotalInner
+    from eve_client.models.fw_leaderboards_get_victory_points_last_week_inner import FwLeaderboardsGetVictoryPointsLastWeekInner
+    from eve_client.models.fw_leaderboards_get_victory_points_yesterday_inner import FwLeaderboardsGetVictoryPointsYesterdayInner
+    from eve_client.models.fw_stats_get_inner import FwStatsGetInner
+    from eve_client.models.fw_stats_get_inner_kills import FwStatsGetInnerKills
+    from eve_client.models.fw_stats_get_inner_victory_points import FwStatsGetInnerVictoryPoints
+    from eve_client.models.fw_systems_get_inner import FwSystemsGetInner
+    from eve_client.models.fw_wars_get_inner import FwWarsGetInner
+    from eve_client.models.group_id import GroupId
+    from eve_client.models.group_id1 import GroupId1
+    from eve_client.models.incursions_get_inner import IncursionsGetInner
+    from eve_client.models.industry_facilities_get_inner import IndustryFacilitiesGetInner
+    from eve_client.models.industry_systems_get_inner import IndustrySystemsGetInner
+    from eve_client.models.industry_systems_get_inner_cost_indices_inner import IndustrySystemsGetInnerCostIndicesInner
+    from eve_client.models.insurance_prices_get_inner import InsurancePricesGetInner
+    from eve_client.models.insurance_prices_get_inner_levels_inner import InsurancePricesGetInnerLevelsInner
+    from eve_client.models.killmails_killmail_id_killmail_hash_get import KillmailsKillmailIdKillmailHashGet
+    from eve_client.models.killmails_killmail_id_killmail_hash_get_attackers_inner import KillmailsKillmailIdKillmailHashGetAttackersInner
+    from eve_client.models.killmails_killmail_id_killmail_hash_get_victim import KillmailsKillmailIdKillmailHashGetVictim
+    from eve_client.models.killmails_killmail_id_killmail_hash_get_victim_items_inner import KillmailsKillmailIdKillmailHashGetVictimItemsInner
+    from eve_client.models.killmails_killmail_id_killmail_hash_get_victim_items_inner_items_inner import KillmailsKillmailIdKillmailHashGetVictimItemsInnerItemsInner
+    from eve_client.models.killmails_killmail_id_killmail_hash_get_victim_position import KillmailsKillmailIdKillmailHashGetVictimPosition
+    from eve_client.models.lost_ship import LostShip
+    from eve_client.models.loyalty_stores_corporation_id_offers_get_inner import LoyaltyStoresCorporationIdOffersGetInner
+    from eve_client.models.loyalty_stores_corporation_id_offers_get_inner_required_items_inner import LoyaltyStoresCorporationIdOffersGetInnerRequiredItemsInner
+    from eve_client.models.manual import Manual
+    from eve_client.models.manufacture_item import ManufactureItem
+    from eve_client.models.markets_groups_market_group_id_get import MarketsGroupsMarketGroupIdGet
+    from eve_client.models.markets_prices_get_inner import MarketsPricesGetInner
+    from eve_client.models.markets_region_id_history_get_inner import MarketsRegionIdHistoryGetInner
+    from eve_client.models.markets_region_id_orders_get_inner import MarketsRegionIdOrdersGetInner
+    from eve_client.models.markets_structures_structure_id_get_inner import MarketsStructuresStructureIdGetInner
+    from eve_client.models.meta_changelog import MetaChangelog
+    from eve_client.models.meta_changelog_entry import MetaChangelogEntry
+    from eve_client.models.meta_compatibility_dates import MetaCompatibilityDates
+    from eve_client.models.meta_status import MetaStatus
+    from eve_client.models.meta_status_routestatus import MetaStatusRoutestatus
+    from eve_client.models.mine_material import MineMaterial
+    from eve_client.models.post_characters_character_id_fittings_request import PostCharactersCharacterIdFittingsRequest
+    from eve_client.models.post_characters_character_id_fittings_request_items_inner import PostCharactersCharacterIdFittingsRequestItemsInner
+    from eve_client.models.post_characters_character_id_mail_labels_request import PostCharactersCharacterIdMailLabelsRequest
+    from eve_client.models.post_characters_character_id_mail_request import PostCharactersCharacterIdMailRequest
+    from eve_client.models.post_characters_character_id_mail_request_recipients_inner import PostCharactersCharacterIdMailRequestRecipientsInner
+    from eve_client.models.post_fleets_fleet_id_members_request import PostFleetsFleetIdMembersRequest
+    from eve_client.models.post_ui_openwindow_newmail_request import PostUiOpenwindowNewmailRequest
+    from eve_client.models.put_characters_character_id_calendar_event_id_request import PutCharactersCharacterIdCalendarEventIdRequest
+    from eve_client.models.put_characters_character_id_mail_mail_id_request import PutCharactersCharacterIdMailMailIdRequest
+    from eve_client.models.put_fleets_fleet_id_members_member_id_request import PutFleetsFleetIdMembersMemberIdRequest
+    from eve_client.models.put_fleets_fleet_id_request import PutFleetsFleetIdRequest
+    from eve_client.models.put_fleets_fleet_id_squads_squad_id_request import PutFleetsFleetIdSquadsSquadIdRequest
+    from eve_client.models.region_id import RegionId
+    from eve_client.models.remote_boost_shield import RemoteBoostShield
+    from eve_client.models.remote_repair_armor import RemoteRepairArmor
+    from eve_client.models.route import Route
+    from eve_client.models.route_connection import RouteConnection
+    from eve_client.models.route_request_body import RouteRequestBody
+    from eve_client.models.salvage_wreck import SalvageWreck
+    from eve_client.models.scan_signature import ScanSignature
+    from eve_client.models.ship_insurance import ShipInsurance
+    from eve_client.models.solar_system_id import SolarSystemId
+    from eve_client.models.sovereignty_campaigns_get_inner import SovereigntyCampaignsGetInner
+    from eve_client.models.sovereignty_campaigns_get_inner_participants_inner import SovereigntyCampaignsGetInnerParticipantsInner
+    from eve_client.models.sovereignty_map_get_inner import SovereigntyMapGetInner
+    from eve_client.models.sovereignty_structures_get_inner import SovereigntyStructuresGetInner
+    from eve_client.models.station_id import StationId
+    from eve_client.models.status_get import StatusGet
+    from eve_client.models.structure_id import StructureId
+    from eve_client.models.type_id import TypeId
+    from eve_client.models.universe_ancestries_get_inner import UniverseAncestriesGetInner
+    from eve_client.models.universe_asteroid_belts_asteroid_belt_id_get import UniverseAsteroidBeltsAsteroidBeltIdGet
+    from eve_client.models.universe_bloodlines_get_inner import UniverseBloodlinesGetInner
+    from eve_client.models.universe_categories_category_id_get import UniverseCategoriesCategoryIdGet
+    from eve_client.models.universe_constellations_constellation_id_get import UniverseConstellationsConstellationIdGet
+    from eve_client.models.universe_factions_get_inner import UniverseFactionsGetInner
+    from eve_client.models.universe_graphics_graphic_id_get import UniverseGraphicsGraphicIdGet
+    from eve_client.models.universe_groups_group_id_get import UniverseGroupsGroupIdGet
+    from eve_client.models.universe_ids_post import UniverseIdsPost
+    from eve_client.models.universe_ids_post_agents_inner import UniverseIdsPostAgentsInner
+    from eve_client.models.universe_ids_post_alliances_inner import UniverseIdsPostAlliancesInner
+    from eve_client.models.universe_ids_post_characters_inner import UniverseIdsPostCharactersInner
+    from eve_client.models.universe_ids_post_constellations_inner import UniverseIdsPostConstellationsInner
+    from eve_client.models.universe_ids_post_corporations_inner import UniverseIdsPostCorporationsInner
+    from eve_client.models.universe_ids_post_factions_inner import UniverseIdsPostFactionsInner
+    from eve_client.models.universe_ids_post_inventory_types_inner import UniverseIdsPostInventoryTypesInner
+    from eve_client.models.universe_ids_post_regions_inner import UniverseIdsPostRegionsInner
+    from eve_client.models.universe_ids_post_stations_inner import UniverseIdsPostStationsInner
+    from eve_client.models.universe_ids_post_systems_inner import UniverseIdsPostSystemsInner
+    from eve_client.models.universe_moons_moon_id_get import UniverseMoonsMoonIdGet
+    from eve_client.models.universe_names_post_inner import UniverseNamesPostInner
+    from eve_client.models.universe_planets_planet_id_get import UniversePlanetsPlanetIdGet
+    from eve_client.models.universe_races_get_inner import UniverseRacesGetInner
+    from eve_client.models.universe_regions_region_id_get import UniverseRegionsRegionIdGet
+    from eve_client.models.universe_schematics_schematic_id_get import UniverseSchematicsSchematicIdGet
+    from eve_client.models.universe_stargates_stargate_id_get import UniverseStargatesStargateIdGet
+    from eve_client.models.universe_stargates_stargate_id_get_destination import UniverseStargatesStargateIdGetDestination
+    from eve_client.models.universe_stars_star_id_get import UniverseStarsStarIdGet
+    from eve_client.models.universe_stations_station_id_get import UniverseStationsStationIdGet
+    from eve_client.models.universe_structures_structure_id_get import UniverseStructuresStructureIdGet
+    from eve_client.models.universe_structures_structure_id_get_position import UniverseStructuresStructureIdGetPosition
+    from eve_client.models.universe_system_jumps_get_inner import UniverseSystemJumpsGetInner
+    from eve_client.models.universe_system_kills_get_inner import UniverseSystemKillsGetInner
+    from eve_client.models.universe_systems_system_id_get import UniverseSystemsSystemIdGet
+    from eve_client.models.universe_systems_system_id_get_planets_inner import UniverseSystemsSystemIdGetPlanetsInner
+    from eve_client.models.universe_types_type_id_get import UniverseTypesTypeIdGet
+    from eve_client.models.unknown import Unknown
+    from eve_client.models.wars_war_id_get import WarsWarIdGet
+    from eve_client.models.wars_war_id_get_aggressor import WarsWarIdGetAggressor
+    from eve_client.models.wars_war_id_get_allies_inner import WarsWarIdGetAlliesInner
+    from eve_client.models.wars_war_id_get_defender import WarsWarIdGetDefender
+
+# Modelle werden erst beim ersten Zugriff importiert, z.B. wenn ApiClient einen Antworttyp auflöst
+_lazy_imports = {
+    "AllianceId": "eve_client.models.alliance_id",
+    "AlliancesAllianceIdContactsGetInner": "eve_client.models.alliances_alliance_id_contacts_get_inner",
+    "AlliancesAllianceIdContactsLabelsGetInner": "eve_client.models.alliances_alliance_id_contacts_labels_get_inner",
+    "AlliancesAllianceIdGet": "eve_client.models.alliances_alliance_id_get",
+    "AlliancesAllianceIdIconsGet": "eve_client.models.alliances_alliance_id_icons_get",
+    "CaptureFwComplex": "eve_client.models.capture_fw_complex",
+    "CharacterId": "eve_client.models.character_id",
+    "CharactersAffiliationPostInner": "eve_client.models.characters_affiliation_post_inner",
+    "CharactersCharacterIdAgentsResearchGetInner": "eve_client.models.characters_character_id_agents_research_get_inner",
+    "CharactersCharacterIdAssetsGetInner": "eve_client.models.characters_character_id_assets_get_inner",
+    "CharactersCharacterIdAssetsLocationsPostInner": "eve_client.models.characters_character_id_assets_locations_post_inner",
+    "CharactersCharacterIdAssetsLocationsPostInnerPosition": "eve_client.models.characters_character_id_assets_locations_post_inner_position",
+    "CharactersCharacterIdAssetsNamesPostInner": "eve_client.models.characters_character_id_assets_names_post_inner",
+    "CharactersCharacterIdAttributesGet": "eve_client.models.characters_character_id_attributes_get",
+    "CharactersCharacterIdBlueprintsGetInner": "eve_client.models.characters_character_id_blueprints_get_inner",
+    "CharactersCharacterIdCalendarEventIdAttendeesGetInner": "eve_client.models.characters_character_id_calendar_event_id_attendees_get_inner",
+    "CharactersCharacterIdCalendarEventIdGet": "eve_client.models.characters_character_id_calendar_event_id_get",
+    "CharactersCharacterIdCalendarGetInner": "eve_client.models.characters_character_id_calendar_get_inner",
+    "CharactersCharacterIdClonesGet": "eve_client.models.characters_character_id_clones_get",
+    "CharactersCharacterIdClonesGetHomeLocation": "eve_client.models.characters_character_id_clones_get_home_location",
+    "CharactersCharacterIdClonesGetJumpClonesInner": "eve_client.models.characters_character_id_clones_get_jump_clones_inner",
+    "CharactersCharacterIdContactsGetInner": "eve_client.models.characters_character_id_contacts_get_inner",
+    "CharactersCharacterIdContractsContractIdBidsGetInner": "eve_client.models.characters_character_id_contracts_contract_id_bids_get_inner",
+    "CharactersCharacterIdContractsContractIdItemsGetInner": "eve_client.models.characters_character_id_contracts_contract_id_items_get_inner",
+    "CharactersCharacterIdContractsGetInner": "eve_client.models.characters_character_id_contracts_get_inner",
+    "CharactersCharacterIdCorporationhistoryGetInner": "eve_client.models.characters_character_id_corporationhistory_get_inner",
+    "CharactersCharacterIdFatigueGet": "eve_client.models.characters_character_id_fatigue_get",
+    "CharactersCharacterIdFittingsGetInner": "eve_client.models.characters_character_id_fittings_get_inner",
+    "CharactersCharacterIdFittingsGetInnerItemsInner": "eve_client.models.characters_character_id_fittings_get_inner_items_inner",
+    "CharactersCharacterIdFittingsPost": "eve_client.models.characters_character_id_fittings_post",
+    "CharactersCharacterIdFleetGet": "eve_client.models.characters_character_id_fleet_get",
+    "CharactersCharacterIdFwStatsGet": "eve_client.models.characters_character_id_fw_stats_get",
+    "CharactersCharacterIdFwStatsGetKills": "eve_client.models.characters_character_id_fw_stats_get_kills",
+    "CharactersCharacterIdFwStatsGetVictoryPoints": "eve_client.models.characters_character_id_fw_stats_get_victory_points",
+    "CharactersCharacterIdGet": "eve_client.models.characters_character_id_get",
+    "CharactersCharacterIdIndustryJobsGetInner": "eve_client.models.characters_character_id_industry_jobs_get_inner",
+    "CharactersCharacterIdKillmailsRecentGetInner": "eve_client.models.characters_character_id_killmails_recent_get_inner",
+    "CharactersCharacterIdLocationGet": "eve_client.models.characters_character_id_location_get",
+    "CharactersCharacterIdLoyaltyPointsGetInner": "eve_client.models.characters_character_id_loyalty_points_get_inner",
+    "CharactersCharacterIdMailGetInner": "eve_client.models.characters_character_id_mail_get_inner",
+    "CharactersCharacterIdMailLabelsGet": "eve_client.models.characters_character_id_mail_labels_get",
+    "CharactersCharacterIdMailLabelsGetLabelsInner": "eve_client.models.characters_character_id_mail_labels_get_labels_inner",
+    "CharactersCharacterIdMailListsGetInner": "eve_client.models.characters_character_id_mail_lists_get_inner",
+    "CharactersCharacterIdMailMailIdGet": "eve_client.models.characters_character_id_mail_mail_id_get",
+    "CharactersCharacterIdMedalsGetInner": "eve_client.models.characters_character_id_medals_get_inner",
+    "CharactersCharacterIdMedalsGetInnerGraphicsInner": "eve_client.models.characters_character_id_medals_get_inner_graphics_inner",
+    "CharactersCharacterIdMiningGetInner": "eve_client.models.characters_character_id_mining_get_inner",
+    "CharactersCharacterIdNotificationsContactsGetInner": "eve_client.models.characters_character_id_notifications_contacts_get_inner",
+    "CharactersCharacterIdNotificationsGetInner": "eve_client.models.characters_character_id_notifications_get_inner",
+    "CharactersCharacterIdOnlineGet": "eve_client.models.characters_character_id_online_get",
+    "CharactersCharacterIdOrdersGetInner": "eve_client.models.characters_character_id_orders_get_inner",
+    "CharactersCharacterIdOrdersHistoryGetInner": "eve_client.models.characters_character_id_orders_history_get_inner",
+    "CharactersCharacterIdPlanetsGetInner": "eve_client.models.characters_character_id_planets_get_inner",
+    "CharactersCharacterIdPlanetsPlanetIdGet": "eve_client.models.characters_character_id_planets_planet_id_get",
+    "CharactersCharacterIdPlanetsPlanetIdGetLinksInner": "eve_client.models.characters_character_id_planets_planet_id_get_links_inner",
+    "CharactersCharacterIdPlanetsPlanetIdGetPinsInner": "eve_client.models.characters_character_id_planets_planet_id_get_pins_inner",
+    "CharactersCharacterIdPlanetsPlanetIdGetPinsInnerContentsInner": "eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_contents_inner",
+    "CharactersCharacterIdPlanetsPlanetIdGetPinsInnerExtractorDetails": "eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_extractor_details",
+    "CharactersCharacterIdPlanetsPlanetIdGetPinsInnerExtractorDetailsHeadsInner": "eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_extractor_details_heads_inner",
+    "CharactersCharacterIdPlanetsPlanetIdGetPinsInnerFactoryDetails": "eve_client.models.characters_character_id_planets_planet_id_get_pins_inner_factory_details",
+    "CharactersCharacterIdPlanetsPlanetIdGetRoutesInner": "eve_client.models.characters_character_id_planets_planet_id_get_routes_inner",
+    "CharactersCharacterIdPortraitGet": "eve_client.models.characters_character_id_portrait_get",
+    "CharactersCharacterIdRolesGet": "eve_client.models.characters_character_id_roles_get",
+    "CharactersCharacterIdSearchGet": "eve_client.models.characters_character_id_search_get",
+    "CharactersCharacterIdShipGet": "eve_client.models.characters_character_id_ship_get",
+    "CharactersCharacterIdSkillqueueGetInner": "eve_client.models.characters_character_id_skillqueue_get_inner",
+    "CharactersCharacterIdSkillsGet": "eve_client.models.characters_character_id_skills_get",
+    "CharactersCharacterIdSkillsGetSkillsInner": "eve_client.models.characters_character_id_skills_get_skills_inner",
+    "CharactersCharacterIdStandingsGetInner": "eve_client.models.characters_character_id_standings_get_inner",
+    "CharactersCharacterIdTitlesGetInner": "eve_client.models.characters_character_id_titles_get_inner",
+    "CharactersCharacterIdWalletJournalGetInner": "eve_client.models.characters_character_id_wallet_journal_get_inner",
+    "CharactersCharacterIdWalletTransactionsGetInner": "eve_client.models.characters_character_id_wallet_transactions_get_inner",
+    "ConstellationId": "eve_client.models.constellation_id",
+    "ContractsPublicBidsContractIdGetInner": "eve_client.models.contracts_public_bids_contract_id_get_inner",
+    "ContractsPublicItemsContractIdGetInner": "eve_client.models.contracts_public_items_contract_id_get_inner",
+    "ContractsPublicRegionIdGetInner": "eve_client.models.contracts_public_region_id_get_inner",
+    "CorporationCorporationIdMiningExtractionsGetInner": "eve_client.models.corporation_corporation_id_mining_extractions_get_inner",
+    "CorporationCorporationIdMiningObserversGetInner": "eve_client.models.corporation_corporation_id_mining_observers_get_inner",
+    "CorporationCorporationIdMiningObserversObserverIdGetInner": "eve_client.models.corporation_corporation_id_mining_observers_observer_id_get_inner",
+    "CorporationId": "eve_client.models.corporation_id",
+    "CorporationsCorporationIdAlliancehistoryGetInner": "eve_client.models.corporations_corporation_id_alliancehistory_get_inner",
+    "CorporationsCorporationIdAssetsGetInner": "eve_client.models.corporations_corporation_id_assets_get_inner",
+    "CorporationsCorporationIdBlueprintsGetInner": "eve_client.models.corporations_corporation_id_blueprints_get_inner",
+    "CorporationsCorporationIdContactsGetInner": "eve_client.models.corporations_corporation_id_contacts_get_inner",
+    "CorporationsCorporationIdContainersLogsGetInner": "eve_client.models.corporations_corporation_id_containers_logs_get_inner",
+    "CorporationsCorporationIdContractsGetInner": "eve_client.models.corporations_corporation_id_contracts_get_inner",
+    "CorporationsCorporationIdCustomsOfficesGetInner": "eve_client.models.corporations_corporation_id_customs_offices_get_inner",
+    "CorporationsCorporationIdDivisionsGet": "eve_client.models.corporations_corporation_id_divisions_get",
+    "CorporationsCorporationIdDivisionsGetHangarInner": "eve_client.models.corporations_corporation_id_divisions_get_hangar_inner",
+    "CorporationsCorporationIdDivisionsGetWalletInner": "eve_client.models.corporations_corporation_id_divisions_get_wallet_inner",
+    "CorporationsCorporationIdFacilitiesGetInner": "eve_client.models.corporations_corporation_id_facilities_get_inner",
+    "CorporationsCorporationIdFwStatsGet": "eve_client.models.corporations_corporation_id_fw_stats_get",
+    "CorporationsCorporationIdFwStatsGetKills": "eve_client.models.corporations_corporation_id_fw_stats_get_kills",
+    "CorporationsCorporationIdFwStatsGetVictoryPoints": "eve_client.models.corporations_corporation_id_fw_stats_get_victory_points",
+    "CorporationsCorporationIdGet": "eve_client.models.corporations_corporation_id_get",
+    "CorporationsCorporationIdIconsGet": "eve_client.models.corporations_corporation_id_icons_get",
+    "CorporationsCorporationIdIndustryJobsGetInner": "eve_client.models.corporations_corporation_id_industry_jobs_get_inner",
+    "CorporationsCorporationIdMedalsGetInner": "eve_client.models.corporations_corporation_id_medals_get_inner",
+    "CorporationsCorporationIdMedalsIssuedGetInner": "eve_client.models.corporations_corporation_id_medals_issued_get_inner",
+    "CorporationsCorporationIdMembersTitlesGetInner": "eve_client.models.corporations_corporation_id_members_titles_get_inner",
+    "CorporationsCorporationIdMembertrackingGetInner": "eve_client.models.corporations_corporation_id_membertracking_get_inner",
+    "CorporationsCorporationIdOrdersGetInner": "eve_client.models.corporations_corporation_id_orders_get_inner",
+    "CorporationsCorporationIdOrdersHistoryGetInner": "eve_client.models.corporations_corporation_id_orders_history_get_inner",
+    "CorporationsCorporationIdRolesGetInner": "eve_client.models.corporations_corporation_id_roles_get_inner",
+    "CorporationsCorporationIdRolesHistoryGetInner": "eve_client.models.corporations_corporation_id_roles_history_get_inner",
+    "CorporationsCorporationIdShareholdersGetInner": "eve_client.models.corporations_corporation_id_shareholders_get_inner",
+    "CorporationsCorporationIdStarbasesGetInner": "eve_client.models.corporations_corporation_id_starbases_get_inner",
+    "CorporationsCorporationIdStarbasesStarbaseIdGet": "eve_client.models.corporations_corporation_id_starbases_starbase_id_get",
+    "CorporationsCorporationIdStarbasesStarbaseIdGetFuelsInner": "eve_client.models.corporations_corporation_id_starbases_starbase_id_get_fuels_inner",
+    "CorporationsCorporationIdStructuresGetInner": "eve_client.models.corporations_corporation_id_structures_get_inner",
+    "CorporationsCorporationIdStructuresGetInnerServicesInner": "eve_client.models.corporations_corporation_id_structures_get_inner_services_inner",
+    "CorporationsCorporationIdTitlesGetInner": "eve_client.models.corporations_corporation_id_titles_get_inner",
+    "CorporationsCorporationIdWalletsDivisionJournalGetInner": "eve_client.models.corporations_corporation_id_wallets_division_journal_get_inner",
+    "CorporationsCorporationIdWalletsDivisionTransactionsGetInner": "eve_client.models.corporations_corporation_id_wallets_division_transactions_get_inner",
+    "CorporationsCorporationIdWalletsGetInner": "eve_client.models.corporations_corporation_id_wallets_get_inner",
+    "CorporationsProjectsContribution": "eve_client.models.corporations_projects_contribution",
+    "CorporationsProjectsContributors": "eve_client.models.corporations_projects_contributors",
+    "CorporationsProjectsContributorsContributor": "eve_client.models.corporations_projects_contributors_contributor",
+    "CorporationsProjectsDetail": "eve_client.models.corporations_projects_detail",
+    "CorporationsProjectsDetailConfiguration": "eve_client.models.corporations_projects_detail_configuration",
+    "CorporationsProjectsDetailConfigurationcapturefwcomplex": "eve_client.models.corporations_projects_detail_configurationcapturefwcomplex",
+    "CorporationsProjectsDetailConfigurationcapturefwcomplexLocationsInner": "eve_client.models.corporations_projects_detail_configurationcapturefwcomplex_locations_inner",
+    "CorporationsProjectsDetailConfigurationdamageship": "eve_client.models.corporations_projects_detail_configurationdamageship",
+    "CorporationsProjectsDetailConfigurationdamageshipIdentitiesInner": "eve_client.models.corporations_projects_detail_configurationdamageship_identities_inner",
+    "CorporationsProjectsDetailConfigurationdamageshipShipsInner": "eve_client.models.corporations_projects_detail_configurationdamageship_ships_inner",
+    "CorporationsProjectsDetailConfigurationdefendfwcomplex": "eve_client.models.corporations_projects_detail_configurationdefendfwcomplex",
+    "CorporationsProjectsDetailConfigurationdeliveritem": "eve_client.models.corporations_projects_detail_configurationdeliveritem",
+    "CorporationsProjectsDetailConfigurationdeliveritemDockingLocationsInner": "eve_client.models.corporations_projects_detail_configurationdeliveritem_docking_locations_inner",
+    "CorporationsProjectsDetailConfigurationdeliveritemItemsInner": "eve_client.models.corporations_projects_detail_configurationdeliveritem_items_inner",
+    "CorporationsProjectsDetailConfigurationdestroynpc": "eve_client.models.corporations_projects_detail_configurationdestroynpc",
+    "CorporationsProjectsDetailConfigurationdestroyship": "eve_client.models.corporations_projects_detail_configurationdestroyship",
+    "CorporationsProjectsDetailConfigurationearnloyaltypoints": "eve_client.models.corporations_projects_detail_configurationearnloyaltypoints",
+    "CorporationsProjectsDetailConfigurationlostship": "eve_client.models.corporations_projects_detail_configurationlostship",
+    "CorporationsProjectsDetailConfigurationmanufactureitem": "eve_client.models.corporations_projects_detail_configurationmanufactureitem",
+    "CorporationsProjectsDetailConfigurationmatcherarchetype": "eve_client.models.corporations_projects_detail_configurationmatcherarchetype",
+    "CorporationsProjectsDetailConfigurationmatchercorporation": "eve_client.models.corporations_projects_detail_configurationmatchercorporation",
+    "CorporationsProjectsDetailConfigurationmatcherfaction": "eve_client.models.corporations_projects_detail_configurationmatcherfaction",
+    "CorporationsProjectsDetailConfigurationmatchersignature": "eve_client.models.corporations_projects_detail_configurationmatchersignature",
+    "CorporationsProjectsDetailConfigurationminematerial": "eve_client.models.corporations_projects_detail_configurationminematerial",
+    "CorporationsProjectsDetailConfigurationremoteboostshield": "eve_client.models.corporations_projects_detail_configurationremoteboostshield",
+    "CorporationsProjectsDetailConfigurationremoterepairarmor": "eve_client.models.corporations_projects_detail_configurationremoterepairarmor",
+    "CorporationsProjectsDetailConfigurationsalvagewreck": "eve_client.models.corporations_projects_detail_configurationsalvagewreck",
+    "CorporationsProjectsDetailConfigurationscansignature": "eve_client.models.corporations_projects_detail_configurationscansignature",
+    "CorporationsProjectsDetailConfigurationshipinsurance": "eve_client.models.corporations_projects_detail_configurationshipinsurance",
+    "CorporationsProjectsDetailConfigurationunknown": "eve_client.models.corporations_projects_detail_configurationunknown",
+    "CorporationsProjectsDetailContribution": "eve_client.models.corporations_projects_detail_contribution",
+    "CorporationsProjectsDetailCreator": "eve_client.models.corporations_projects_detail_creator",
+    "CorporationsProjectsDetailDetails": "eve_client.models.corporations_projects_detail_details",
+    "CorporationsProjectsDetailProgress": "eve_client.models.corporations_projects_detail_progress",
+    "CorporationsProjectsDetailProject": "eve_client.models.corporations_projects_detail_project",
+    "CorporationsProjectsDetailReward": "eve_client.models.corporations_projects_detail_reward",
+    "CorporationsProjectsListing": "eve_client.models.corporations_projects_listing",
+    "Cursor": "eve_client.models.cursor",
+    "DamageShip": "eve_client.models.damage_ship",
+    "DefendFwComplex": "eve_client.models.defend_fw_complex",
+    "DeliverItem": "eve_client.models.deliver_item",
+    "DestroyNpc": "eve_client.models.destroy_npc",
+    "DestroyShip": "eve_client.models.destroy_ship",
+    "DogmaAttributesAttributeIdGet": "eve_client.models.dogma_attributes_attribute_id_get",
+    "DogmaDynamicItemsTypeIdItemIdGet": "eve_client.models.dogma_dynamic_items_type_id_item_id_get",
+    "DogmaDynamicItemsTypeIdItemIdGetDogmaAttributesInner": "eve_client.models.dogma_dynamic_items_type_id_item_id_get_dogma_attributes_inner",
+    "DogmaDynamicItemsTypeIdItemIdGetDogmaEffectsInner": "eve_client.models.dogma_dynamic_items_type_id_item_id_get_dogma_effects_inner",
+    "DogmaEffectsEffectIdGet": "eve_client.models.dogma_effects_effect_id_get",
+    "DogmaEffectsEffectIdGetModifiersInner": "eve_client.models.dogma_effects_effect_id_get_modifiers_inner",
+    "EarnLoyaltyPoint": "eve_client.models.earn_loyalty_point",
+    "Error": "eve_client.models.error",
+    "ErrorDetail": "eve_client.models.error_detail",
+    "FactionId": "eve_client.models.faction_id",
+    "FleetsFleetIdGet": "eve_client.models.fleets_fleet_id_get",
+    "FleetsFleetIdMembersGetInner": "eve_client.models.fleets_fleet_id_members_get_inner",
+    "FleetsFleetIdWingsGetInner": "eve_client.models.fleets_fleet_id_wings_get_inner",
+    "FleetsFleetIdWingsGetInnerSquadsInner": "eve_client.models.fleets_fleet_id_wings_get_inner_squads_inner",
+    "FleetsFleetIdWingsPost": "eve_client.models.fleets_fleet_id_wings_post",
+    "FleetsFleetIdWingsWingIdSquadsPost": "eve_client.models.fleets_fleet_id_wings_wing_id_squads_post",
+    "FwLeaderboardsCharactersGet": "eve_client.models.fw_leaderboards_characters_get",
+    "FwLeaderboardsCharactersGetKills": "eve_client.models.fw_leaderboards_characters_get_kills",
+    "FwLeaderboardsCharactersGetKillsActiveTotalInner": "eve_client.models.fw_leaderboards_characters_get_kills_active_total_inner",
+    "FwLeaderboardsCharactersGetKillsLastWeekInner": "eve_client.models.fw_leaderboards_characters_get_kills_last_week_inner",
+    "FwLeaderboardsCharactersGetKillsYesterdayInner": "eve_client.models.fw_leaderboards_characters_get_kills_yesterday_inner",
+    "FwLeaderboardsCharactersGetVictoryPoints": "eve_client.models.fw_leaderboards_characters_get_victory_points",
+    "FwLeaderboardsCharactersGetVictoryPointsActiveTotalInner": "eve_client.models.fw_leaderboards_characters_get_victory_points_active_total_inner",
+    "FwLeaderboardsCharactersGetVictoryPointsLastWeekInner": "eve_client.models.fw_leaderboards_characters_get_victory_points_last_week_inner",
+    "FwLeaderboardsCharactersGetVictoryPointsYesterdayInner": "eve_client.models.fw_leaderboards_characters_get_victory_points_yesterday_inner",
+    "FwLeaderboardsCorporationsGet": "eve_client.models.fw_leaderboards_corporations_get",
+    "FwLeaderboardsCorporationsGetKills": "eve_client.models.fw_leaderboards_corporations_get_kills",
+    "FwLeaderboardsCorporationsGetKillsActiveTotalInner": "eve_client.models.fw_leaderboards_corporations_get_kills_active_total_inner",
+    "FwLeaderboardsCorporationsGetKillsLastWeekInner": "eve_client.models.fw_leaderboards_corporations_get_kills_last_week_inner",
+    "FwLeaderboardsCorporationsGetKillsYesterdayInner": "eve_client.models.fw_leaderboards_corporations_get_kills_yesterday_inner",
+    "FwLeaderboardsCorporationsGetVictoryPoints": "eve_client.models.fw_leaderboards_corporations_get_victory_points",
+    "FwLeaderboardsCorporationsGetVictoryPointsActiveTotalInner": "eve_client.models.fw_leaderboards_corporations_get_victory_points_active_total_inner",
+    "FwLeaderboardsCorporationsGetVictoryPointsLastWeekInner": "eve_client.models.fw_leaderboards_corporations_get_victory_points_last_week_inner",
+    "FwLeaderboardsCorporationsGetVictoryPointsYesterdayInner": "eve_client.models.fw_leaderboards_corporations_get_victory_points_yesterday_inner",
+    "FwLeaderboardsGet": "eve_client.models.fw_leaderboards_get",
+    "FwLeaderboardsGetKills": "eve_client.models.fw_leaderboards_get_kills",
+    "FwLeaderboardsGetKillsActiveTotalInner": "eve_client.models.fw_leaderboards_get_kills_active_total_inner",
+    "FwLeaderboardsGetKillsLastWeekInner": "eve_client.models.fw_leaderboards_get_kills_last_week_inner",
+    "FwLeaderboardsGetKillsYesterdayInner": "eve_client.models.fw_leaderboards_get_kills_yesterday_inner",
+    "FwLeaderboardsGetVictoryPoints": "eve_client.models.fw_leaderboards_get_victory_points",
+    "FwLeaderboardsGetVictoryPointsActiveTotalInner": "eve_client.models.fw_leaderboards_get_victory_points_active_total_inner",
+    "FwLeaderboardsGetVictoryPointsLastWeekInner": "eve_client.models.fw_leaderboards_get_victory_points_last_week_inner",
+    "FwLeaderboardsGetVictoryPointsYesterdayInner": "eve_client.models.fw_leaderboards_get_victory_points_yesterday_inner",
+    "FwStatsGetInner": "eve_client.models.fw_stats_get_inner",
+    "FwStatsGetInnerKills": "eve_client.models.fw_stats_get_inner_kills",
+    "FwStatsGetInnerVictoryPoints": "eve_client.models.fw_stats_get_inner_victory_points",
+    "FwSystemsGetInner": "eve_client.models.fw_systems_get_inner",
+    "FwWarsGetInner": "eve_client.models.fw_wars_get_inner",
+    "GroupId": "eve_client.models.group_id",
+    "GroupId1": "eve_client.models.group_id1",
+    "IncursionsGetInner": "eve_client.models.incursions_get_inner",
+    "IndustryFacilitiesGetInner": "eve_client.models.industry_facilities_get_inner",
+    "IndustrySystemsGetInner": "eve_client.models.industry_systems_get_inner",
+    "IndustrySystemsGetInnerCostIndicesInner": "eve_client.models.industry_systems_get_inner_cost_indices_inner",
+    "InsurancePricesGetInner": "eve_client.models.insurance_prices_get_inner",
+    "InsurancePricesGetInnerLevelsInner": "eve_client.models.insurance_prices_get_inner_levels_inner",
+    "KillmailsKillmailIdKillmailHashGet": "eve_client.models.killmails_killmail_id_killmail_hash_get",
+    "KillmailsKillmailIdKillmailHashGetAttackersInner": "eve_client.models.killmails_killmail_id_killmail_hash_get_attackers_inner",
+    "KillmailsKillmailIdKillmailHashGetVictim": "eve_client.models.killmails_killmail_id_killmail_hash_get_victim",
+    "KillmailsKillmailIdKillmailHashGetVictimItemsInner": "eve_client.models.killmails_killmail_id_killmail_hash_get_victim_items_inner",
+    "KillmailsKillmailIdKillmailHashGetVictimItemsInnerItemsInner": "eve_client.models.killmails_killmail_id_killmail_hash_get_victim_items_inner_items_inner",
+    "KillmailsKillmailIdKillmailHashGetVictimPosition": "eve_client.models.killmails_killmail_id_killmail_hash_get_victim_position",
+    "LostShip": "eve_client.models.lost_ship",
+    "LoyaltyStoresCorporationIdOffersGetInner": "eve_client.models.loyalty_stores_corporation_id_offers_get_inner",
+    "LoyaltyStoresCorporationIdOffersGetInnerRequiredItemsInner": "eve_client.models.loyalty_stores_corporation_id_offers_get_inner_required_items_inner",
+    "Manual": "eve_client.models.manual",
+    "ManufactureItem": "eve_client.models.manufacture_item",
+    "MarketsGroupsMarketGroupIdGet": "eve_client.models.markets_groups_market_group_id_get",
+    "MarketsPricesGetInner": "eve_client.models.markets_prices_get_inner",
+    "MarketsRegionIdHistoryGetInner": "eve_client.models.markets_region_id_history_get_inner",
+    "MarketsRegionIdOrdersGetInner": "eve_client.models.markets_region_id_orders_get_inner",
+    "MarketsStructuresStructureIdGetInner": "eve_client.models.markets_structures_structure_id_get_inner",
+    "MetaChangelog": "eve_client.models.meta_changelog",
+    "MetaChangelogEntry": "eve_client.models.meta_changelog_entry",
+    "MetaCompatibilityDates": "eve_client.models.meta_compatibility_dates",
+    "MetaStatus": "eve_client.models.meta_status",
+    "MetaStatusRoutestatus": "eve_client.models.meta_status_routestatus",
+    "MineMaterial": "eve_client.models.mine_material",
+    "PostCharactersCharacterIdFittingsRequest": "eve_client.models.post_characters_character_id_fittings_request",
+    "PostCharactersCharacterIdFittingsRequestItemsInner": "eve_client.models.post_characters_character_id_fittings_request_items_inner",
+    "PostCharactersCharacterIdMailLabelsRequest": "eve_client.models.post_characters_character_id_mail_labels_request",
+    "PostCharactersCharacterIdMailRequest": "eve_client.models.post_characters_character_id_mail_request",
+    "PostCharactersCharacterIdMailRequestRecipientsInner": "eve_client.models.post_characters_character_id_mail_request_recipients_inner",
+    "PostFleetsFleetIdMembersRequest": "eve_client.models.post_fleets_fleet_id_members_request",
+    "PostUiOpenwindowNewmailRequest": "eve_client.models.post_ui_openwindow_newmail_request",
+    "PutCharactersCharacterIdCalendarEventIdRequest": "eve_client.models.put_characters_character_id_calendar_event_id_request",
+    "PutCharactersCharacterIdMailMailIdRequest": "eve_client.models.put_characters_character_id_mail_mail_id_request",
+    "PutFleetsFleetIdMembersMemberIdRequest": "eve_client.models.put_fleets_fleet_id_members_member_id_request",
+    "PutFleetsFleetIdRequest": "eve_client.models.put_fleets_fleet_id_request",
+    "PutFleetsFleetIdSquadsSquadIdRequest": "eve_client.models.put_fleets_fleet_id_squads_squad_id_request",
+    "RegionId": "eve_client.models.region_id",
+    "RemoteBoostShield": "eve_client.models.remote_boost_shield",
+    "RemoteRepairArmor": "eve_client.models.remote_repair_armor",
+    "Route": "eve_client.models.route",
+    "RouteConnection": "eve_client.models.route_connection",
+    "RouteRequestBody": "eve_client.models.route_request_body",
+    "SalvageWreck": "eve_client.models.salvage_wreck",
+    "ScanSignature": "eve_client.models.scan_signature",
+    "ShipInsurance": "eve_client.models.ship_insurance",
+    "SolarSystemId": "eve_client.models.solar_system_id",
+    "SovereigntyCampaignsGetInner": "eve_client.models.sovereignty_campaigns_get_inner",
+    "SovereigntyCampaignsGetInnerParticipantsInner": "eve_client.models.sovereignty_campaigns_get_inner_participants_inner",
+    "SovereigntyMapGetInner": "eve_client.models.sovereignty_map_get_inner",
+    "SovereigntyStructuresGetInner": "eve_client.models.sovereignty_structures_get_inner",
+    "StationId": "eve_client.models.station_id",
+    "StatusGet": "eve_client.models.status_get",
+    "StructureId": "eve_client.models.structure_id",
+    "TypeId": "eve_client.models.type_id",
+    "UniverseAncestriesGetInner": "eve_client.models.universe_ancestries_get_inner",
+    "UniverseAsteroidBeltsAsteroidBeltIdGet": "eve_client.models.universe_asteroid_belts_asteroid_belt_id_get",
+    "UniverseBloodlinesGetInner": "eve_client.models.universe_bloodlines_get_inner",
+    "UniverseCategoriesCategoryIdGet": "eve_client.models.universe_categories_category_id_get",
+    "UniverseConstellationsConstellationIdGet": "eve_client.models.universe_constellations_constellation_id_get",
+    "UniverseFactionsGetInner": "eve_client.models.universe_factions_get_inner",
+    "UniverseGraphicsGraphicIdGet": "eve_client.models.universe_graphics_graphic_id_get",
+    "UniverseGroupsGroupIdGet": "eve_client.models.universe_groups_group_id_get",
+    "UniverseIdsPost": "eve_client.models.universe_ids_post",
+    "UniverseIdsPostAgentsInner": "eve_client.models.universe_ids_post_agents_inner",
+    "UniverseIdsPostAlliancesInner": "eve_client.models.universe_ids_post_alliances_inner",
+    "UniverseIdsPostCharactersInner": "eve_client.models.universe_ids_post_characters_inner",
+    "UniverseIdsPostConstellationsInner": "eve_client.models.universe_ids_post_constellations_inner",
+    "UniverseIdsPostCorporationsInner": "eve_client.models.universe_ids_post_corporations_inner",
+    "UniverseIdsPostFactionsInner": "eve_client.models.universe_ids_post_factions_inner",
+    "UniverseIdsPostInventoryTypesInner": "eve_client.models.universe_ids_post_inventory_types_inner",
+    "UniverseIdsPostRegionsInner": "eve_client.models.universe_ids_post_regions_inner",
+    "UniverseIdsPostStationsInner": "eve_client.models.universe_ids_post_stations_inner",
+    "UniverseIdsPostSystemsInner": "eve_client.models.universe_ids_post_systems_inner",
+    "UniverseMoonsMoonIdGet": "eve_client.models.universe_moons_moon_id_get",
+    "UniverseNamesPostInner": "eve_client.models.universe_names_post_inner",
+    "UniversePlanetsPlanetIdGet": "eve_client.models.universe_planets_planet_id_get",
+    "UniverseRacesGetInner": "eve_client.models.universe_races_get_inner",
+    "UniverseRegionsRegionIdGet": "eve_client.models.universe_regions_region_id_get",
+    "UniverseSchematicsSchematicIdGet": "eve_client.models.universe_schematics_schematic_id_get",
+    "UniverseStargatesStargateIdGet": "eve_client.models.universe_stargates_stargate_id_get",
+    "UniverseStargatesStargateIdGetDestination": "eve_client.models.universe_stargates_stargate_id_get_destination",
+    "UniverseStarsStarIdGet": "eve_client.models.universe_stars_star_id_get",
+    "UniverseStationsStationIdGet": "eve_client.models.universe_stations_station_id_get",
+    "UniverseStructuresStructureIdGet": "eve_client.models.universe_structures_structure_id_get",
+    "UniverseStructuresStructureIdGetPosition": "eve_client.models.universe_structures_structure_id_get_position",
+    "UniverseSystemJumpsGetInner": "eve_client.models.universe_system_jumps_get_inner",
+    "UniverseSystemKillsGetInner": "eve_client.models.universe_system_kills_get_inner",
+    "UniverseSystemsSystemIdGet": "eve_client.models.universe_systems_system_id_get",
+    "UniverseSystemsSystemIdGetPlanetsInner": "eve_client.models.universe_systems_system_id_get_planets_inner",
+    "UniverseTypesTypeIdGet": "eve_client.models.universe_types_type_id_get",
+    "Unknown": "eve_client.models.unknown",
+    "WarsWarIdGet": "eve_client.models.wars_war_id_get",
+    "WarsWarIdGetAggressor": "eve_client.models.wars_war_id_get_aggressor",
+    "WarsWarIdGetAlliesInner": "eve_client.models.wars_war_id_get_allies_inner",
+    "WarsWarIdGetDefender": "eve_client.models.wars_war_id_get_defender",
+}
+
+
+def __getattr__(name: str):
+    # Das Modul wird erst beim ersten Zugriff importiert und das Ergebnis im Paket zwischengespeichert
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        # Untermodule (z.B. models.issue) bleiben wie bisher als Attribut erreichbar
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
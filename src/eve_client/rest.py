@@ -12,16 +12,23 @@
 """  # noqa: E501
 
 
+import asyncio
+import importlib.util
 import io
 import json
+import logging
 import re
 import ssl
-from typing import Optional, Union
+import threading
+from typing import Dict, Optional, Union
+from urllib.parse import urlsplit
 
 import httpx
 
 from eve_client.exceptions import ApiException, ApiValueError
 
+logger = logging.getLogger(__name__)
+
 RESTResponseType = httpx.Response
 
 class RESTResponse(io.IOBase):
@@ -57,28 +64,58 @@ class RESTClientObject:
 
         # maxsize is number of requests to host that are allowed in parallel
         self.maxsize = configuration.connection_pool_maxsize
-
-        self.ssl_context = ssl.create_default_context(
-            cafile=configuration.ssl_ca_cert,
-            cadata=configuration.ca_cert_data,
+        self.limits = httpx.Limits(
+            max_connections=self.maxsize,
+            max_keepalive_connections=configuration.max_keepalive_connections,
+            keepalive_expiry=configuration.keepalive_expiry
+        )
+        phases = {
+            "connect": configuration.connect_timeout,
+            "read": configuration.read_timeout,
+            "write": configuration.write_timeout,
+            "pool": configuration.pool_timeout,
+        }
+        self.timeout = httpx.Timeout(
+            configuration.timeout,
+            **{phase: value for phase, value in phases.items() if value is not None}
         )
-        if configuration.cert_file:
-            self.ssl_context.load_cert_chain(
-                configuration.cert_file, keyfile=configuration.key_file
+        self.http2 = configuration.http2
+        self.max_connections_per_host = configuration.max_connections_per_host
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+
+        # Mit einem gemeinsamen Transport teilt der Client den Pool mit allen Clients mit denselben Einstellungen
+        self.transport = configuration.transport
+        # Ein vorgegebener Kontext kann mit anderen Clients geteilt sein, siehe ssl_contexts
+        self.ssl_context = configuration.ssl_context
+        if self.ssl_context is None and self.transport is not None:
+            self.ssl_context = self.transport.ssl_context(configuration)
+        if self.ssl_context is None:
+            self.ssl_context = ssl.create_default_context(
+                cafile=configuration.ssl_ca_cert,
+                cadata=configuration.ca_cert_data,
             )
+            if configuration.cert_file:
+                self.ssl_context.load_cert_chain(
+                    configuration.cert_file, keyfile=configuration.key_file
+                )
 
-        if not configuration.verify_ssl:
-            self.ssl_context.check_hostname = False
-            self.ssl_context.verify_mode = ssl.CERT_NONE
+            if not configuration.verify_ssl:
+                self.ssl_context.check_hostname = False
+                self.ssl_context.verify_mode = ssl.CERT_NONE
 
         self.proxy = configuration.proxy
         self.proxy_headers = configuration.proxy_headers
 
+        self.rate_limiter = configuration.rate_limiter
+
         self.pool_manager: Optional[httpx.AsyncClient] = None
+        # Genau ein Pool je Client, auch wenn die ersten Requests aus mehreren Threads kommen
+        self._pool_lock = threading.Lock()
 
     async def close(self):
-        if self.pool_manager is not None:
-            await self.pool_manager.aclose()
+        pool_manager, self.pool_manager = self.pool_manager, None
+        if pool_manager is not None:
+            await pool_manager.aclose()
 
     async def request(
             self,
@@ -120,7 +157,13 @@ class RESTClientObject:
 
         post_params = post_params or {}
         headers = headers or {}
-        timeout = _request_timeout or 5 * 60
+        if _request_timeout is None:
+            timeout = self.timeout
+        elif isinstance(_request_timeout, tuple):
+            connect, read = _request_timeout
+            timeout = httpx.Timeout(connect=connect, read=read, write=self.timeout.write, pool=self.timeout.pool)
+        else:
+            timeout = _request_timeout
 
         if 'Content-Type' not in headers:
             headers['Content-Type'] = 'application/json'
@@ -175,14 +218,49 @@ class RESTClientObject:
                          declared content type."""
                 raise ApiException(status=0, reason=msg)
 
-        if self.pool_manager is None:
-            self.pool_manager = self._create_pool_manager()
+        pool_manager = self.get_pool_manager()
+
+        if self.rate_limiter is None:
+            r = await self._send(pool_manager, url, args)
+            return RESTResponse(r)
 
-        r = await self.pool_manager.request(**args)
+        permit = await self.rate_limiter.acquire(method, url, headers)
+        r = None
+        try:
+            r = await self._send(pool_manager, url, args)
+        finally:
+            await self.rate_limiter.update(permit, r)
         return RESTResponse(r)
 
+    async def _send(self, pool_manager: httpx.AsyncClient, url: str, args: dict) -> httpx.Response:
+        if self.transport is not None:
+            return await self.transport.send(self, url, args)
+        if self.max_connections_per_host is None:
+            return await pool_manager.request(**args)
+        host = urlsplit(url).netloc
+        slots = self._host_slots.get(host)
+        if slots is None:
+            slots = self._host_slots[host] = asyncio.Semaphore(self.max_connections_per_host)
+        async with slots:
+            return await pool_manager.request(**args)
+
+    def get_pool_manager(self) -> httpx.AsyncClient:
+        """Liefert den Verbindungspool, beim ersten Aufruf wird er angelegt"""
+        if self.transport is not None:
+            return self.transport.get_pool_manager(self)
+        pool_manager = self.pool_manager
+        if pool_manager is None:
+            with self._pool_lock:
+                if self.pool_manager is None:
+                    self.pool_manager = self._create_pool_manager()
+                pool_manager = self.pool_manager
+        return pool_manager
+
     def _create_pool_manager(self) -> httpx.AsyncClient:
-        limits = httpx.Limits(max_connections=self.maxsize)
+        http2 = self.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requires the h2 package (pip install httpx[http2]), using HTTP/1.1")
+            http2 = False
 
         proxy = None
         if self.proxy:
@@ -192,7 +270,9 @@ class RESTClientObject:
             )
 
         return httpx.AsyncClient(
-            limits=limits,
+            limits=self.limits,
+            timeout=self.timeout,
+            http2=http2,
             proxy=proxy,
             verify=self.ssl_context,
             trust_env=True
@@ -1,48 +1,119 @@
 # flake8: noqa
 
+import importlib
+from typing import TYPE_CHECKING
+
 # import apis into api package
-from github_client.api.actions_api import ActionsApi
-from github_client.api.activity_api import ActivityApi
-from github_client.api.apps_api import AppsApi
-from github_client.api.billing_api import BillingApi
-from github_client.api.campaigns_api import CampaignsApi
-from github_client.api.checks_api import ChecksApi
-from github_client.api.classroom_api import ClassroomApi
-from github_client.api.code_scanning_api import CodeScanningApi
-from github_client.api.code_security_api import CodeSecurityApi
-from github_client.api.codes_of_conduct_api import CodesOfConductApi
-from github_client.api.codespaces_api import CodespacesApi
-from github_client.api.copilot_api import CopilotApi
-from github_client.api.credentials_api import CredentialsApi
-from github_client.api.dependabot_api import DependabotApi
-from github_client.api.dependency_graph_api import DependencyGraphApi
-from github_client.api.emojis_api import EmojisApi
-from github_client.api.enterprise_team_memberships_api import EnterpriseTeamMembershipsApi
-from github_client.api.enterprise_team_organizations_api import EnterpriseTeamOrganizationsApi
-from github_client.api.enterprise_teams_api import EnterpriseTeamsApi
-from github_client.api.gists_api import GistsApi
-from github_client.api.git_api import GitApi
-from github_client.api.gitignore_api import GitignoreApi
-from github_client.api.hosted_compute_api import HostedComputeApi
-from github_client.api.interactions_api import InteractionsApi
-from github_client.api.issues_api import IssuesApi
-from github_client.api.licenses_api import LicensesApi
-from github_client.api.markdown_api import MarkdownApi
-from github_client.api.meta_api import MetaApi
-from github_client.api.migrations_api import MigrationsApi
-from github_client.api.oidc_api import OidcApi
-from github_client.api.orgs_api import OrgsApi
-from github_client.api.packages_api import PackagesApi
-from github_client.api.private_registries_api import PrivateRegistriesApi
-from github_client.api.projects_api import ProjectsApi
-from github_client.api.projects_classic_api import ProjectsClassicApi
-from github_client.api.pulls_api import PullsApi
-from github_client.api.rate_limit_api import RateLimitApi
-from github_client.api.reactions_api import ReactionsApi
-from github_client.api.repos_api import ReposApi
-from github_client.api.search_api import SearchApi
-from github_client.api.secret_scanning_api import SecretScanningApi
-from github_client.api.security_advisories_api import SecurityAdvisoriesApi
-from github_client.api.teams_api import TeamsApi
-from github_client.api.users_api import UsersApi
+if TYPE_CHECKING:
+    from github_client.api.actions_api import ActionsApi
+    from github_client.api.activity_api import ActivityApi
+    from github_client.api.apps_api import AppsApi
+    from github_client.api.billing_api import BillingApi
+    from github_client.api.campaigns_api import CampaignsApi
+    from github_client.api.checks_api import ChecksApi
+    from github_client.api.classroom_api import ClassroomApi
+    from github_client.api.code_scanning_api import CodeScanningApi
+    from github_client.api.code_security_api import CodeSecurityApi
+    from github_client.api.codes_of_conduct_api import CodesOfConductApi
+    from github_client.api.codespaces_api import CodespacesApi
+    from github_client.api.copilot_api import CopilotApi
+    from github_client.api.credentials_api import CredentialsApi
+    from github_client.api.dependabot_api import DependabotApi
+    from github_client.api.dependency_graph_api import DependencyGraphApi
+    from github_client.api.emojis_api import EmojisApi
+    from github_client.api.enterprise_team_memberships_api import EnterpriseTeamMembershipsApi
+    from github_client.api.enterprise_team_organizations_api import EnterpriseTeamOrganizationsApi
+    from github_client.api.enterprise_teams_api import EnterpriseTeamsApi
+    from github_client.api.gists_api import GistsApi
+    from github_client.api.git_api import GitApi
+    from github_client.api.gitignore_api import GitignoreApi
+    from github_client.api.hosted_compute_api import HostedComputeApi
+    from github_client.api.interactions_api import InteractionsApi
+    from github_client.api.issues_api import IssuesApi
+    from github_client.api.licenses_api import LicensesApi
+    from github_client.api.markdown_api import MarkdownApi
+    from github_client.api.meta_api import MetaApi
+    from github_client.api.migrations_api import MigrationsApi
+    from github_client.api.oidc_api import OidcApi
+    from github_client.api.orgs_api import OrgsApi
+    from github_client.api.packages_api import PackagesApi
+    from github_client.api.private_registries_api import PrivateRegistriesApi
+    from github_client.api.projects_api import ProjectsApi
+    from github_client.api.projects_classic_api import ProjectsClassicApi
+    from github_client.api.pulls_api import PullsApi
+    from github_client.api.rate_limit_api import RateLimitApi
+    from github_client.api.reactions_api import ReactionsApi
+    from github_client.api.repos_api import ReposApi
+    from github_client.api.search_api import SearchApi
+    from github_client.api.secret_scanning_api import SecretScanningApi
+    from github_client.api.security_advisories_api import SecurityAdvisoriesApi
+    from github_client.api.teams_api import TeamsApi
+    from github_client.api.users_api import UsersApi
+
+# APIs werden erst beim ersten Zugriff importiert
+_lazy_imports = {
+    "ActionsApi": "github_client.api.actions_api",
+    "ActivityApi": "github_client.api.activity_api",
+    "AppsApi": "github_client.api.apps_api",
+    "BillingApi": "github_client.api.billing_api",
+    "CampaignsApi": "github_client.api.campaigns_api",
+    "ChecksApi": "github_client.api.checks_api",
+    "ClassroomApi": "github_client.api.classroom_api",
+    "CodeScanningApi": "github_client.api.code_scanning_api",
+    "CodeSecurityApi": "github_client.api.code_security_api",
+    "CodesOfConductApi": "github_client.api.codes_of_conduct_api",
+    "CodespacesApi": "github_client.api.codespaces_api",
+    "CopilotApi": "github_client.api.copilot_api",
+    "CredentialsApi": "github_client.api.credentials_api",
+    "DependabotApi": "github_client.api.dependabot_api",
+    "DependencyGraphApi": "github_client.api.dependency_graph_api",
+    "EmojisApi": "github_client.api.emojis_api",
+    "EnterpriseTeamMembershipsApi": "github_client.api.enterprise_team_memberships_api",
+    "EnterpriseTeamOrganizationsApi": "github_client.api.enterprise_team_organizations_api",
+    "EnterpriseTeamsApi": "github_client.api.enterprise_teams_api",
+    "GistsApi": "github_client.api.gists_api",
+    "GitApi": "github_client.api.git_api",
+    "GitignoreApi": "github_client.api.gitignore_api",
+    "HostedComputeApi": "github_client.api.hosted_compute_api",
+    "InteractionsApi": "github_client.api.interactions_api",
+    "IssuesApi": "github_client.api.issues_api",
+    "LicensesApi": "github_client.api.licenses_api",
+    "MarkdownApi": "github_client.api.markdown_api",
+    "MetaApi": "github_client.api.meta_api",
+    "MigrationsApi": "github_client.api.migrations_api",
+    "OidcApi": "github_client.api.oidc_api",
+    "OrgsApi": "github_client.api.orgs_api",
+    "PackagesApi": "github_client.api.packages_api",
+    "PrivateRegistriesApi": "github_client.api.private_registries_api",
+    "ProjectsApi": "github_client.api.projects_api",
+    "ProjectsClassicApi": "github_client.api.projects_classic_api",
+    "PullsApi": "github_client.api.pulls_api",
+    "RateLimitApi": "github_client.api.rate_limit_api",
+    "ReactionsApi": "github_client.api.reactions_api",
+    "ReposApi": "github_client.api.repos_api",
+    "SearchApi": "github_client.api.search_api",
+    "SecretScanningApi": "github_client.api.secret_scanning_api",
+    "SecurityAdvisoriesApi": "github_client.api.security_advisories_api",
+    "TeamsApi": "github_client.api.teams_api",
+    "UsersApi": "github_client.api.users_api",
+}
+
+
+def __getattr__(name: str):
+    # Das Modul wird erst beim ersten Zugriff importiert und das Ergebnis im Paket zwischengespeichert
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        # Untermodule (z.B. models.issue) bleiben wie bisher als Attribut erreichbar
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -41,7 +41,7 @@ from github_client.models.orgs_list_app_installations200_response import OrgsLis
 from github_client.models.user_marketplace_purchase import UserMarketplacePurchase
 from github_client.models.webhook_config import WebhookConfig
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
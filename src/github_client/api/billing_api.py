@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -34,7 +34,7 @@ from github_client.models.get_all_budgets import GetAllBudgets
 from github_client.models.get_budget import GetBudget
 from github_client.models.packages_billing_usage import PackagesBillingUsage
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -24,7 +24,7 @@ from github_client.models.campaign_summary import CampaignSummary
 from github_client.models.campaigns_create_campaign_request import CampaignsCreateCampaignRequest
 from github_client.models.campaigns_update_campaign_request import CampaignsUpdateCampaignRequest
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -41,7 +41,7 @@ from github_client.models.code_scanning_upload_sarif_request import CodeScanning
 from github_client.models.code_scanning_variant_analysis import CodeScanningVariantAnalysis
 from github_client.models.code_scanning_variant_analysis_repo_task import CodeScanningVariantAnalysisRepoTask
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
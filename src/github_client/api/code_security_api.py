@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -33,7 +33,7 @@ from github_client.models.code_security_set_configuration_as_default_for_enterpr
 from github_client.models.code_security_update_configuration_request import CodeSecurityUpdateConfigurationRequest
 from github_client.models.code_security_update_enterprise_configuration_request import CodeSecurityUpdateEnterpriseConfigurationRequest
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -35,7 +35,7 @@ from github_client.models.dependabot_update_alert_request import DependabotUpdat
 from github_client.models.dependabot_update_repository_access_for_org_request import DependabotUpdateRepositoryAccessForOrgRequest
 from github_client.models.organization_dependabot_secret import OrganizationDependabotSecret
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -26,7 +26,7 @@ from github_client.models.private_registries_get_org_public_key200_response impo
 from github_client.models.private_registries_list_org_private_registries200_response import PrivateRegistriesListOrgPrivateRegistries200Response
 from github_client.models.private_registries_update_org_private_registry_request import PrivateRegistriesUpdateOrgPrivateRegistryRequest
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
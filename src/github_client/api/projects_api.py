@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -27,7 +27,7 @@ from github_client.models.projects_v2_field import ProjectsV2Field
 from github_client.models.projects_v2_item_simple import ProjectsV2ItemSimple
 from github_client.models.projects_v2_item_with_content import ProjectsV2ItemWithContent
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
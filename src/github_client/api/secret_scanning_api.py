@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -30,7 +30,7 @@ from github_client.models.secret_scanning_update_alert_request import SecretScan
 from github_client.models.secret_scanning_update_org_pattern_configs200_response import SecretScanningUpdateOrgPatternConfigs200Response
 from github_client.models.secret_scanning_update_org_pattern_configs_request import SecretScanningUpdateOrgPatternConfigsRequest
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -41,7 +41,7 @@ from github_client.models.teams_update_discussion_in_org_request import TeamsUpd
 from github_client.models.teams_update_in_org_request import TeamsUpdateInOrgRequest
 from github_client.models.teams_update_legacy_request import TeamsUpdateLegacyRequest
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
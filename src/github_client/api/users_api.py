@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -43,7 +43,7 @@ from github_client.models.users_get_authenticated200_response import UsersGetAut
 from github_client.models.users_set_primary_email_visibility_for_authenticated_user_request import UsersSetPrimaryEmailVisibilityForAuthenticatedUserRequest
 from github_client.models.users_update_authenticated_request import UsersUpdateAuthenticatedRequest
 
-from github_client.api_client import ApiClient, RequestSerialized
+from github_client.api_client import ApiClient, RequestSerialized, validate_call
 from github_client.api_response import ApiResponse
 from github_client.rest import RESTResponseType
 
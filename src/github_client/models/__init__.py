@@ -12,1860 +12,3742 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import importlib
+from typing import TYPE_CHECKING
+
 # import models into model package
-from github_client.models.actions_add_custom_labels_to_self_hosted_runner_for_org_request import ActionsAddCustomLabelsToSelfHostedRunnerForOrgRequest
-from github_client.models.actions_artifact_and_log_retention import ActionsArtifactAndLogRetention
-from github_client.models.actions_artifact_and_log_retention_response import ActionsArtifactAndLogRetentionResponse
-from github_client.models.actions_billing_usage import ActionsBillingUsage
-from github_client.models.actions_billing_usage_minutes_used_breakdown import ActionsBillingUsageMinutesUsedBreakdown
-from github_client.models.actions_cache_list import ActionsCacheList
-from github_client.models.actions_cache_list_actions_caches_inner import ActionsCacheListActionsCachesInner
-from github_client.models.actions_cache_usage_by_repository import ActionsCacheUsageByRepository
-from github_client.models.actions_cache_usage_org_enterprise import ActionsCacheUsageOrgEnterprise
-from github_client.models.actions_create_hosted_runner_for_org_request import ActionsCreateHostedRunnerForOrgRequest
-from github_client.models.actions_create_hosted_runner_for_org_request_image import ActionsCreateHostedRunnerForOrgRequestImage
-from github_client.models.actions_create_or_update_environment_secret_request import ActionsCreateOrUpdateEnvironmentSecretRequest
-from github_client.models.actions_create_or_update_org_secret_request import ActionsCreateOrUpdateOrgSecretRequest
-from github_client.models.actions_create_or_update_repo_secret_request import ActionsCreateOrUpdateRepoSecretRequest
-from github_client.models.actions_create_org_variable_request import ActionsCreateOrgVariableRequest
-from github_client.models.actions_create_repo_variable_request import ActionsCreateRepoVariableRequest
-from github_client.models.actions_create_self_hosted_runner_group_for_org_request import ActionsCreateSelfHostedRunnerGroupForOrgRequest
-from github_client.models.actions_create_workflow_dispatch_request import ActionsCreateWorkflowDispatchRequest
-from github_client.models.actions_default_workflow_permissions import ActionsDefaultWorkflowPermissions
-from github_client.models.actions_fork_pr_contributor_approval import ActionsForkPrContributorApproval
-from github_client.models.actions_fork_pr_workflows_private_repos import ActionsForkPrWorkflowsPrivateRepos
-from github_client.models.actions_fork_pr_workflows_private_repos_request import ActionsForkPrWorkflowsPrivateReposRequest
-from github_client.models.actions_generate_runner_jitconfig_for_org201_response import ActionsGenerateRunnerJitconfigForOrg201Response
-from github_client.models.actions_generate_runner_jitconfig_for_org_request import ActionsGenerateRunnerJitconfigForOrgRequest
-from github_client.models.actions_get_actions_cache_usage_by_repo_for_org200_response import ActionsGetActionsCacheUsageByRepoForOrg200Response
-from github_client.models.actions_get_default_workflow_permissions import ActionsGetDefaultWorkflowPermissions
-from github_client.models.actions_get_hosted_runners_github_owned_images_for_org200_response import ActionsGetHostedRunnersGithubOwnedImagesForOrg200Response
-from github_client.models.actions_get_hosted_runners_machine_specs_for_org200_response import ActionsGetHostedRunnersMachineSpecsForOrg200Response
-from github_client.models.actions_get_hosted_runners_platforms_for_org200_response import ActionsGetHostedRunnersPlatformsForOrg200Response
-from github_client.models.actions_get_workflow_workflow_id_parameter import ActionsGetWorkflowWorkflowIdParameter
-from github_client.models.actions_hosted_runner import ActionsHostedRunner
-from github_client.models.actions_hosted_runner_curated_image import ActionsHostedRunnerCuratedImage
-from github_client.models.actions_hosted_runner_custom_image import ActionsHostedRunnerCustomImage
-from github_client.models.actions_hosted_runner_custom_image_version import ActionsHostedRunnerCustomImageVersion
-from github_client.models.actions_hosted_runner_limits import ActionsHostedRunnerLimits
-from github_client.models.actions_hosted_runner_machine_spec import ActionsHostedRunnerMachineSpec
-from github_client.models.actions_list_artifacts_for_repo200_response import ActionsListArtifactsForRepo200Response
-from github_client.models.actions_list_custom_image_versions_for_org200_response import ActionsListCustomImageVersionsForOrg200Response
-from github_client.models.actions_list_custom_images_for_org200_response import ActionsListCustomImagesForOrg200Response
-from github_client.models.actions_list_github_hosted_runners_in_group_for_org200_response import ActionsListGithubHostedRunnersInGroupForOrg200Response
-from github_client.models.actions_list_hosted_runners_for_org200_response import ActionsListHostedRunnersForOrg200Response
-from github_client.models.actions_list_jobs_for_workflow_run_attempt200_response import ActionsListJobsForWorkflowRunAttempt200Response
-from github_client.models.actions_list_labels_for_self_hosted_runner_for_org200_response import ActionsListLabelsForSelfHostedRunnerForOrg200Response
-from github_client.models.actions_list_org_secrets200_response import ActionsListOrgSecrets200Response
-from github_client.models.actions_list_org_variables200_response import ActionsListOrgVariables200Response
-from github_client.models.actions_list_repo_access_to_self_hosted_runner_group_in_org200_response import ActionsListRepoAccessToSelfHostedRunnerGroupInOrg200Response
-from github_client.models.actions_list_repo_organization_secrets200_response import ActionsListRepoOrganizationSecrets200Response
-from github_client.models.actions_list_repo_organization_variables200_response import ActionsListRepoOrganizationVariables200Response
-from github_client.models.actions_list_repo_workflows200_response import ActionsListRepoWorkflows200Response
-from github_client.models.actions_list_selected_repos_for_org_secret200_response import ActionsListSelectedReposForOrgSecret200Response
-from github_client.models.actions_list_selected_repositories_enabled_github_actions_organization200_response import ActionsListSelectedRepositoriesEnabledGithubActionsOrganization200Response
-from github_client.models.actions_list_selected_repositories_self_hosted_runners_organization200_response import ActionsListSelectedRepositoriesSelfHostedRunnersOrganization200Response
-from github_client.models.actions_list_self_hosted_runner_groups_for_org200_response import ActionsListSelfHostedRunnerGroupsForOrg200Response
-from github_client.models.actions_list_self_hosted_runners_for_org200_response import ActionsListSelfHostedRunnersForOrg200Response
-from github_client.models.actions_list_self_hosted_runners_in_group_for_org200_response import ActionsListSelfHostedRunnersInGroupForOrg200Response
-from github_client.models.actions_list_workflow_runs_for_repo200_response import ActionsListWorkflowRunsForRepo200Response
-from github_client.models.actions_oidc_subject_customization_for_a_repository import ActionsOIDCSubjectCustomizationForARepository
-from github_client.models.actions_organization_permissions import ActionsOrganizationPermissions
-from github_client.models.actions_public_key import ActionsPublicKey
-from github_client.models.actions_re_run_job_for_workflow_run_request import ActionsReRunJobForWorkflowRunRequest
-from github_client.models.actions_repository_permissions import ActionsRepositoryPermissions
-from github_client.models.actions_review_custom_gates_for_run_request import ActionsReviewCustomGatesForRunRequest
-from github_client.models.actions_review_pending_deployments_for_run_request import ActionsReviewPendingDeploymentsForRunRequest
-from github_client.models.actions_secret import ActionsSecret
-from github_client.models.actions_set_custom_labels_for_self_hosted_runner_for_org_request import ActionsSetCustomLabelsForSelfHostedRunnerForOrgRequest
-from github_client.models.actions_set_default_workflow_permissions import ActionsSetDefaultWorkflowPermissions
-from github_client.models.actions_set_github_actions_permissions_organization_request import ActionsSetGithubActionsPermissionsOrganizationRequest
-from github_client.models.actions_set_github_actions_permissions_repository_request import ActionsSetGithubActionsPermissionsRepositoryRequest
-from github_client.models.actions_set_repo_access_to_self_hosted_runner_group_in_org_request import ActionsSetRepoAccessToSelfHostedRunnerGroupInOrgRequest
-from github_client.models.actions_set_selected_repos_for_org_secret_request import ActionsSetSelectedReposForOrgSecretRequest
-from github_client.models.actions_set_selected_repos_for_org_variable_request import ActionsSetSelectedReposForOrgVariableRequest
-from github_client.models.actions_set_selected_repositories_enabled_github_actions_organization_request import ActionsSetSelectedRepositoriesEnabledGithubActionsOrganizationRequest
-from github_client.models.actions_set_selected_repositories_self_hosted_runners_organization_request import ActionsSetSelectedRepositoriesSelfHostedRunnersOrganizationRequest
-from github_client.models.actions_set_self_hosted_runners_in_group_for_org_request import ActionsSetSelfHostedRunnersInGroupForOrgRequest
-from github_client.models.actions_set_self_hosted_runners_permissions_organization_request import ActionsSetSelfHostedRunnersPermissionsOrganizationRequest
-from github_client.models.actions_update_hosted_runner_for_org_request import ActionsUpdateHostedRunnerForOrgRequest
-from github_client.models.actions_update_org_variable_request import ActionsUpdateOrgVariableRequest
-from github_client.models.actions_update_repo_variable_request import ActionsUpdateRepoVariableRequest
-from github_client.models.actions_update_self_hosted_runner_group_for_org_request import ActionsUpdateSelfHostedRunnerGroupForOrgRequest
-from github_client.models.actions_variable import ActionsVariable
-from github_client.models.actions_workflow_access_to_repository import ActionsWorkflowAccessToRepository
-from github_client.models.activity import Activity
-from github_client.models.activity_list_public_events503_response import ActivityListPublicEvents503Response
-from github_client.models.activity_list_repos_starred_by_user200_response import ActivityListReposStarredByUser200Response
-from github_client.models.activity_list_stargazers_for_repo200_response import ActivityListStargazersForRepo200Response
-from github_client.models.activity_mark_notifications_as_read202_response import ActivityMarkNotificationsAsRead202Response
-from github_client.models.activity_mark_notifications_as_read_request import ActivityMarkNotificationsAsReadRequest
-from github_client.models.activity_mark_repo_notifications_as_read202_response import ActivityMarkRepoNotificationsAsRead202Response
-from github_client.models.activity_mark_repo_notifications_as_read_request import ActivityMarkRepoNotificationsAsReadRequest
-from github_client.models.activity_set_repo_subscription_request import ActivitySetRepoSubscriptionRequest
-from github_client.models.activity_set_thread_subscription_request import ActivitySetThreadSubscriptionRequest
-from github_client.models.actor import Actor
-from github_client.models.added_to_project_issue_event import AddedToProjectIssueEvent
-from github_client.models.added_to_project_issue_event_project_card import AddedToProjectIssueEventProjectCard
-from github_client.models.alert_instance import AlertInstance
-from github_client.models.alert_instance_location import AlertInstanceLocation
-from github_client.models.allowed_actions import AllowedActions
-from github_client.models.api_insights_route_stats_inner import ApiInsightsRouteStatsInner
-from github_client.models.api_insights_subject_stats_inner import ApiInsightsSubjectStatsInner
-from github_client.models.api_insights_summary_stats import ApiInsightsSummaryStats
-from github_client.models.api_insights_time_stats_inner import ApiInsightsTimeStatsInner
-from github_client.models.api_insights_user_stats_inner import ApiInsightsUserStatsInner
-from github_client.models.api_overview import ApiOverview
-from github_client.models.api_overview_domains import ApiOverviewDomains
-from github_client.models.api_overview_domains_actions_inbound import ApiOverviewDomainsActionsInbound
-from github_client.models.api_overview_domains_artifact_attestations import ApiOverviewDomainsArtifactAttestations
-from github_client.models.api_overview_ssh_key_fingerprints import ApiOverviewSshKeyFingerprints
-from github_client.models.app import App
-from github_client.models.app1 import App1
-from github_client.models.app10 import App10
-from github_client.models.app11 import App11
-from github_client.models.app12 import App12
-from github_client.models.app13 import App13
-from github_client.models.app14 import App14
-from github_client.models.app15 import App15
-from github_client.models.app16 import App16
-from github_client.models.app1_permissions import App1Permissions
-from github_client.models.app2 import App2
-from github_client.models.app2_permissions import App2Permissions
-from github_client.models.app3 import App3
-from github_client.models.app3_permissions import App3Permissions
-from github_client.models.app4 import App4
-from github_client.models.app5 import App5
-from github_client.models.app6 import App6
-from github_client.models.app7 import App7
-from github_client.models.app8 import App8
-from github_client.models.app9 import App9
-from github_client.models.app_permissions import AppPermissions
-from github_client.models.apps_check_token_request import AppsCheckTokenRequest
-from github_client.models.apps_create_from_manifest201_response import AppsCreateFromManifest201Response
-from github_client.models.apps_create_installation_access_token_request import AppsCreateInstallationAccessTokenRequest
-from github_client.models.apps_delete_authorization_request import AppsDeleteAuthorizationRequest
-from github_client.models.apps_list_installation_repos_for_authenticated_user200_response import AppsListInstallationReposForAuthenticatedUser200Response
-from github_client.models.apps_list_repos_accessible_to_installation200_response import AppsListReposAccessibleToInstallation200Response
-from github_client.models.apps_scope_token_request import AppsScopeTokenRequest
-from github_client.models.apps_update_webhook_config_for_app_request import AppsUpdateWebhookConfigForAppRequest
-from github_client.models.artifact import Artifact
-from github_client.models.artifact_workflow_run import ArtifactWorkflowRun
-from github_client.models.assigned_issue_event import AssignedIssueEvent
-from github_client.models.authentication_token import AuthenticationToken
-from github_client.models.author_association import AuthorAssociation
-from github_client.models.authorization import Authorization
-from github_client.models.authorization_app import AuthorizationApp
-from github_client.models.auto_merge import AutoMerge
-from github_client.models.autolink import Autolink
-from github_client.models.base_gist import BaseGist
-from github_client.models.base_gist_files_value import BaseGistFilesValue
-from github_client.models.basic_error import BasicError
-from github_client.models.billing_premium_request_usage_report_org import BillingPremiumRequestUsageReportOrg
-from github_client.models.billing_premium_request_usage_report_org_time_period import BillingPremiumRequestUsageReportOrgTimePeriod
-from github_client.models.billing_premium_request_usage_report_org_usage_items_inner import BillingPremiumRequestUsageReportOrgUsageItemsInner
-from github_client.models.billing_premium_request_usage_report_user import BillingPremiumRequestUsageReportUser
-from github_client.models.billing_update_budget_org200_response import BillingUpdateBudgetOrg200Response
-from github_client.models.billing_update_budget_org200_response_budget import BillingUpdateBudgetOrg200ResponseBudget
-from github_client.models.billing_update_budget_org200_response_budget_budget_alerting import BillingUpdateBudgetOrg200ResponseBudgetBudgetAlerting
-from github_client.models.billing_update_budget_org_request import BillingUpdateBudgetOrgRequest
-from github_client.models.billing_update_budget_org_request_budget_alerting import BillingUpdateBudgetOrgRequestBudgetAlerting
-from github_client.models.billing_usage_report import BillingUsageReport
-from github_client.models.billing_usage_report_usage_items_inner import BillingUsageReportUsageItemsInner
-from github_client.models.billing_usage_report_user import BillingUsageReportUser
-from github_client.models.billing_usage_report_user_usage_items_inner import BillingUsageReportUserUsageItemsInner
-from github_client.models.billing_usage_summary_report_org import BillingUsageSummaryReportOrg
-from github_client.models.billing_usage_summary_report_org_usage_items_inner import BillingUsageSummaryReportOrgUsageItemsInner
-from github_client.models.billing_usage_summary_report_user import BillingUsageSummaryReportUser
-from github_client.models.blob import Blob
-from github_client.models.branch_protection import BranchProtection
-from github_client.models.branch_protection_allow_fork_syncing import BranchProtectionAllowForkSyncing
-from github_client.models.branch_protection_lock_branch import BranchProtectionLockBranch
-from github_client.models.branch_protection_required_linear_history import BranchProtectionRequiredLinearHistory
-from github_client.models.branch_protection_required_signatures import BranchProtectionRequiredSignatures
-from github_client.models.branch_restriction_policy import BranchRestrictionPolicy
-from github_client.models.branch_restriction_policy_apps_inner import BranchRestrictionPolicyAppsInner
-from github_client.models.branch_restriction_policy_apps_inner_owner import BranchRestrictionPolicyAppsInnerOwner
-from github_client.models.branch_restriction_policy_apps_inner_permissions import BranchRestrictionPolicyAppsInnerPermissions
-from github_client.models.branch_restriction_policy_users_inner import BranchRestrictionPolicyUsersInner
-from github_client.models.branch_short import BranchShort
-from github_client.models.branch_short_commit import BranchShortCommit
-from github_client.models.branch_with_protection import BranchWithProtection
-from github_client.models.branch_with_protection_links import BranchWithProtectionLinks
-from github_client.models.budget import Budget
-from github_client.models.budget_budget_alerting import BudgetBudgetAlerting
-from github_client.models.campaign_alert_type import CampaignAlertType
-from github_client.models.campaign_state import CampaignState
-from github_client.models.campaign_summary import CampaignSummary
-from github_client.models.campaign_summary_alert_stats import CampaignSummaryAlertStats
-from github_client.models.campaigns_create_campaign_request import CampaignsCreateCampaignRequest
-from github_client.models.campaigns_create_campaign_request_code_scanning_alerts_inner import CampaignsCreateCampaignRequestCodeScanningAlertsInner
-from github_client.models.campaigns_update_campaign_request import CampaignsUpdateCampaignRequest
-from github_client.models.check_annotation import CheckAnnotation
-from github_client.models.check_automated_security_fixes import CheckAutomatedSecurityFixes
-from github_client.models.check_immutable_releases import CheckImmutableReleases
-from github_client.models.check_run import CheckRun
-from github_client.models.check_run_check_suite import CheckRunCheckSuite
-from github_client.models.check_run_output import CheckRunOutput
-from github_client.models.check_run_pull_request import CheckRunPullRequest
-from github_client.models.check_run_pull_request_base import CheckRunPullRequestBase
-from github_client.models.check_run_with_simple_check_suite import CheckRunWithSimpleCheckSuite
-from github_client.models.check_run_with_simple_check_suite_output import CheckRunWithSimpleCheckSuiteOutput
-from github_client.models.check_suite import CheckSuite
-from github_client.models.check_suite_preference import CheckSuitePreference
-from github_client.models.check_suite_preference_preferences import CheckSuitePreferencePreferences
-from github_client.models.check_suite_preference_preferences_auto_trigger_checks_inner import CheckSuitePreferencePreferencesAutoTriggerChecksInner
-from github_client.models.checks_create_request import ChecksCreateRequest
-from github_client.models.checks_create_request_actions_inner import ChecksCreateRequestActionsInner
-from github_client.models.checks_create_request_one_of import ChecksCreateRequestOneOf
-from github_client.models.checks_create_request_one_of1 import ChecksCreateRequestOneOf1
-from github_client.models.checks_create_request_output import ChecksCreateRequestOutput
-from github_client.models.checks_create_request_output_annotations_inner import ChecksCreateRequestOutputAnnotationsInner
-from github_client.models.checks_create_request_output_images_inner import ChecksCreateRequestOutputImagesInner
-from github_client.models.checks_create_suite_request import ChecksCreateSuiteRequest
-from github_client.models.checks_list_for_suite200_response import ChecksListForSuite200Response
-from github_client.models.checks_list_suites_for_ref200_response import ChecksListSuitesForRef200Response
-from github_client.models.checks_set_suites_preferences_request import ChecksSetSuitesPreferencesRequest
-from github_client.models.checks_set_suites_preferences_request_auto_trigger_checks_inner import ChecksSetSuitesPreferencesRequestAutoTriggerChecksInner
-from github_client.models.checks_update_request import ChecksUpdateRequest
-from github_client.models.checks_update_request_any_of import ChecksUpdateRequestAnyOf
-from github_client.models.checks_update_request_output import ChecksUpdateRequestOutput
-from github_client.models.classroom import Classroom
-from github_client.models.classroom_accepted_assignment import ClassroomAcceptedAssignment
-from github_client.models.classroom_assignment import ClassroomAssignment
-from github_client.models.classroom_assignment_grade import ClassroomAssignmentGrade
-from github_client.models.clone_traffic import CloneTraffic
-from github_client.models.code_of_conduct import CodeOfConduct
-from github_client.models.code_of_conduct_simple import CodeOfConductSimple
-from github_client.models.code_scanning_alert import CodeScanningAlert
-from github_client.models.code_scanning_alert_classification import CodeScanningAlertClassification
-from github_client.models.code_scanning_alert_dismissed_reason import CodeScanningAlertDismissedReason
-from github_client.models.code_scanning_alert_instance import CodeScanningAlertInstance
-from github_client.models.code_scanning_alert_instance_message import CodeScanningAlertInstanceMessage
-from github_client.models.code_scanning_alert_items import CodeScanningAlertItems
-from github_client.models.code_scanning_alert_location import CodeScanningAlertLocation
-from github_client.models.code_scanning_alert_rule import CodeScanningAlertRule
-from github_client.models.code_scanning_alert_rule_summary import CodeScanningAlertRuleSummary
-from github_client.models.code_scanning_alert_set_state import CodeScanningAlertSetState
-from github_client.models.code_scanning_alert_severity import CodeScanningAlertSeverity
-from github_client.models.code_scanning_alert_state import CodeScanningAlertState
-from github_client.models.code_scanning_alert_state_query import CodeScanningAlertStateQuery
-from github_client.models.code_scanning_analysis import CodeScanningAnalysis
-from github_client.models.code_scanning_analysis_deletion import CodeScanningAnalysisDeletion
-from github_client.models.code_scanning_analysis_tool import CodeScanningAnalysisTool
-from github_client.models.code_scanning_autofix import CodeScanningAutofix
-from github_client.models.code_scanning_autofix_commits import CodeScanningAutofixCommits
-from github_client.models.code_scanning_autofix_commits_response import CodeScanningAutofixCommitsResponse
-from github_client.models.code_scanning_autofix_status import CodeScanningAutofixStatus
-from github_client.models.code_scanning_codeql_database import CodeScanningCodeqlDatabase
-from github_client.models.code_scanning_create_variant_analysis_request import CodeScanningCreateVariantAnalysisRequest
-from github_client.models.code_scanning_default_setup import CodeScanningDefaultSetup
-from github_client.models.code_scanning_default_setup_options import CodeScanningDefaultSetupOptions
-from github_client.models.code_scanning_default_setup_update import CodeScanningDefaultSetupUpdate
-from github_client.models.code_scanning_default_setup_update_response import CodeScanningDefaultSetupUpdateResponse
-from github_client.models.code_scanning_options import CodeScanningOptions
-from github_client.models.code_scanning_organization_alert_items import CodeScanningOrganizationAlertItems
-from github_client.models.code_scanning_sarifs_receipt import CodeScanningSarifsReceipt
-from github_client.models.code_scanning_sarifs_status import CodeScanningSarifsStatus
-from github_client.models.code_scanning_update_alert_request import CodeScanningUpdateAlertRequest
-from github_client.models.code_scanning_upload_sarif_request import CodeScanningUploadSarifRequest
-from github_client.models.code_scanning_variant_analysis import CodeScanningVariantAnalysis
-from github_client.models.code_scanning_variant_analysis_language import CodeScanningVariantAnalysisLanguage
-from github_client.models.code_scanning_variant_analysis_repo_task import CodeScanningVariantAnalysisRepoTask
-from github_client.models.code_scanning_variant_analysis_repository import CodeScanningVariantAnalysisRepository
-from github_client.models.code_scanning_variant_analysis_scanned_repositories_inner import CodeScanningVariantAnalysisScannedRepositoriesInner
-from github_client.models.code_scanning_variant_analysis_skipped_repo_group import CodeScanningVariantAnalysisSkippedRepoGroup
-from github_client.models.code_scanning_variant_analysis_skipped_repositories import CodeScanningVariantAnalysisSkippedRepositories
-from github_client.models.code_scanning_variant_analysis_skipped_repositories_not_found_repos import CodeScanningVariantAnalysisSkippedRepositoriesNotFoundRepos
-from github_client.models.code_scanning_variant_analysis_status import CodeScanningVariantAnalysisStatus
-from github_client.models.code_search_result_item import CodeSearchResultItem
-from github_client.models.code_security_attach_configuration_request import CodeSecurityAttachConfigurationRequest
-from github_client.models.code_security_attach_enterprise_configuration_request import CodeSecurityAttachEnterpriseConfigurationRequest
-from github_client.models.code_security_configuration import CodeSecurityConfiguration
-from github_client.models.code_security_configuration_code_scanning_default_setup_options import CodeSecurityConfigurationCodeScanningDefaultSetupOptions
-from github_client.models.code_security_configuration_code_scanning_options import CodeSecurityConfigurationCodeScanningOptions
-from github_client.models.code_security_configuration_for_repository import CodeSecurityConfigurationForRepository
-from github_client.models.code_security_configuration_repositories import CodeSecurityConfigurationRepositories
-from github_client.models.code_security_create_configuration_for_enterprise_request import CodeSecurityCreateConfigurationForEnterpriseRequest
-from github_client.models.code_security_create_configuration_for_enterprise_request_dependency_graph_autosubmit_action_options import CodeSecurityCreateConfigurationForEnterpriseRequestDependencyGraphAutosubmitActionOptions
-from github_client.models.code_security_create_configuration_request import CodeSecurityCreateConfigurationRequest
-from github_client.models.code_security_create_configuration_request_secret_scanning_delegated_bypass_options import CodeSecurityCreateConfigurationRequestSecretScanningDelegatedBypassOptions
-from github_client.models.code_security_create_configuration_request_secret_scanning_delegated_bypass_options_reviewers_inner import CodeSecurityCreateConfigurationRequestSecretScanningDelegatedBypassOptionsReviewersInner
-from github_client.models.code_security_default_configurations_inner import CodeSecurityDefaultConfigurationsInner
-from github_client.models.code_security_detach_configuration_request import CodeSecurityDetachConfigurationRequest
-from github_client.models.code_security_set_configuration_as_default_for_enterprise200_response import CodeSecuritySetConfigurationAsDefaultForEnterprise200Response
-from github_client.models.code_security_set_configuration_as_default_for_enterprise_request import CodeSecuritySetConfigurationAsDefaultForEnterpriseRequest
-from github_client.models.code_security_update_configuration_request import CodeSecurityUpdateConfigurationRequest
-from github_client.models.code_security_update_enterprise_configuration_request import CodeSecurityUpdateEnterpriseConfigurationRequest
-from github_client.models.code_security_update_enterprise_configuration_request_dependency_graph_autosubmit_action_options import CodeSecurityUpdateEnterpriseConfigurationRequestDependencyGraphAutosubmitActionOptions
-from github_client.models.codeowners_errors import CodeownersErrors
-from github_client.models.codeowners_errors_errors_inner import CodeownersErrorsErrorsInner
-from github_client.models.codespace import Codespace
-from github_client.models.codespace_export_details import CodespaceExportDetails
-from github_client.models.codespace_git_status import CodespaceGitStatus
-from github_client.models.codespace_machine import CodespaceMachine
-from github_client.models.codespace_runtime_constraints import CodespaceRuntimeConstraints
-from github_client.models.codespace_with_full_repository import CodespaceWithFullRepository
-from github_client.models.codespaces_create_for_authenticated_user_request import CodespacesCreateForAuthenticatedUserRequest
-from github_client.models.codespaces_create_for_authenticated_user_request_one_of import CodespacesCreateForAuthenticatedUserRequestOneOf
-from github_client.models.codespaces_create_for_authenticated_user_request_one_of1 import CodespacesCreateForAuthenticatedUserRequestOneOf1
-from github_client.models.codespaces_create_for_authenticated_user_request_one_of1_pull_request import CodespacesCreateForAuthenticatedUserRequestOneOf1PullRequest
-from github_client.models.codespaces_create_or_update_org_secret_request import CodespacesCreateOrUpdateOrgSecretRequest
-from github_client.models.codespaces_create_or_update_repo_secret_request import CodespacesCreateOrUpdateRepoSecretRequest
-from github_client.models.codespaces_create_or_update_secret_for_authenticated_user_request import CodespacesCreateOrUpdateSecretForAuthenticatedUserRequest
-from github_client.models.codespaces_create_with_pr_for_authenticated_user_request import CodespacesCreateWithPrForAuthenticatedUserRequest
-from github_client.models.codespaces_create_with_repo_for_authenticated_user_request import CodespacesCreateWithRepoForAuthenticatedUserRequest
-from github_client.models.codespaces_delete_codespaces_access_users_request import CodespacesDeleteCodespacesAccessUsersRequest
-from github_client.models.codespaces_list_devcontainers_in_repository_for_authenticated_user200_response import CodespacesListDevcontainersInRepositoryForAuthenticatedUser200Response
-from github_client.models.codespaces_list_devcontainers_in_repository_for_authenticated_user200_response_devcontainers_inner import CodespacesListDevcontainersInRepositoryForAuthenticatedUser200ResponseDevcontainersInner
-from github_client.models.codespaces_list_in_organization200_response import CodespacesListInOrganization200Response
-from github_client.models.codespaces_list_org_secrets200_response import CodespacesListOrgSecrets200Response
-from github_client.models.codespaces_list_repo_secrets200_response import CodespacesListRepoSecrets200Response
-from github_client.models.codespaces_list_secrets_for_authenticated_user200_response import CodespacesListSecretsForAuthenticatedUser200Response
-from github_client.models.codespaces_org_secret import CodespacesOrgSecret
-from github_client.models.codespaces_permissions_check_for_devcontainer import CodespacesPermissionsCheckForDevcontainer
-from github_client.models.codespaces_pre_flight_with_repo_for_authenticated_user200_response import CodespacesPreFlightWithRepoForAuthenticatedUser200Response
-from github_client.models.codespaces_pre_flight_with_repo_for_authenticated_user200_response_defaults import CodespacesPreFlightWithRepoForAuthenticatedUser200ResponseDefaults
-from github_client.models.codespaces_public_key import CodespacesPublicKey
-from github_client.models.codespaces_publish_for_authenticated_user_request import CodespacesPublishForAuthenticatedUserRequest
-from github_client.models.codespaces_repo_machines_for_authenticated_user200_response import CodespacesRepoMachinesForAuthenticatedUser200Response
-from github_client.models.codespaces_secret import CodespacesSecret
-from github_client.models.codespaces_set_codespaces_access_request import CodespacesSetCodespacesAccessRequest
-from github_client.models.codespaces_set_codespaces_access_users_request import CodespacesSetCodespacesAccessUsersRequest
-from github_client.models.codespaces_set_repositories_for_secret_for_authenticated_user_request import CodespacesSetRepositoriesForSecretForAuthenticatedUserRequest
-from github_client.models.codespaces_set_selected_repos_for_org_secret_request import CodespacesSetSelectedReposForOrgSecretRequest
-from github_client.models.codespaces_update_for_authenticated_user_request import CodespacesUpdateForAuthenticatedUserRequest
-from github_client.models.codespaces_user_public_key import CodespacesUserPublicKey
-from github_client.models.collaborator import Collaborator
-from github_client.models.collaborator_permissions import CollaboratorPermissions
-from github_client.models.combined_billing_usage import CombinedBillingUsage
-from github_client.models.combined_commit_status import CombinedCommitStatus
-from github_client.models.commit import Commit
-from github_client.models.commit1 import Commit1
-from github_client.models.commit_activity import CommitActivity
-from github_client.models.commit_author import CommitAuthor
-from github_client.models.commit_comment import CommitComment
-from github_client.models.commit_commit import CommitCommit
-from github_client.models.commit_commit_tree import CommitCommitTree
-from github_client.models.commit_comparison import CommitComparison
-from github_client.models.commit_parents_inner import CommitParentsInner
-from github_client.models.commit_search_result_item import CommitSearchResultItem
-from github_client.models.commit_search_result_item_commit import CommitSearchResultItemCommit
-from github_client.models.commit_search_result_item_commit_author import CommitSearchResultItemCommitAuthor
-from github_client.models.commit_stats import CommitStats
-from github_client.models.committer import Committer
-from github_client.models.committer1 import Committer1
-from github_client.models.community_profile import CommunityProfile
-from github_client.models.community_profile_files import CommunityProfileFiles
-from github_client.models.container_metadata import ContainerMetadata
-from github_client.models.content_directory_inner import ContentDirectoryInner
-from github_client.models.content_file import ContentFile
-from github_client.models.content_submodule import ContentSubmodule
-from github_client.models.content_symlink import ContentSymlink
-from github_client.models.content_traffic import ContentTraffic
-from github_client.models.content_tree import ContentTree
-from github_client.models.content_tree_entries_inner import ContentTreeEntriesInner
-from github_client.models.content_tree_entries_inner_links import ContentTreeEntriesInnerLinks
-from github_client.models.contributor import Contributor
-from github_client.models.contributor_activity import ContributorActivity
-from github_client.models.contributor_activity_weeks_inner import ContributorActivityWeeksInner
-from github_client.models.converted_note_to_issue_issue_event import ConvertedNoteToIssueIssueEvent
-from github_client.models.copilot_add_copilot_seats_for_teams201_response import CopilotAddCopilotSeatsForTeams201Response
-from github_client.models.copilot_add_copilot_seats_for_teams_request import CopilotAddCopilotSeatsForTeamsRequest
-from github_client.models.copilot_add_copilot_seats_for_users201_response import CopilotAddCopilotSeatsForUsers201Response
-from github_client.models.copilot_add_copilot_seats_for_users_request import CopilotAddCopilotSeatsForUsersRequest
-from github_client.models.copilot_cancel_copilot_seat_assignment_for_teams200_response import CopilotCancelCopilotSeatAssignmentForTeams200Response
-from github_client.models.copilot_cancel_copilot_seat_assignment_for_teams_request import CopilotCancelCopilotSeatAssignmentForTeamsRequest
-from github_client.models.copilot_cancel_copilot_seat_assignment_for_users200_response import CopilotCancelCopilotSeatAssignmentForUsers200Response
-from github_client.models.copilot_cancel_copilot_seat_assignment_for_users_request import CopilotCancelCopilotSeatAssignmentForUsersRequest
-from github_client.models.copilot_dotcom_chat import CopilotDotcomChat
-from github_client.models.copilot_dotcom_chat_models_inner import CopilotDotcomChatModelsInner
-from github_client.models.copilot_dotcom_pull_requests import CopilotDotcomPullRequests
-from github_client.models.copilot_dotcom_pull_requests_repositories_inner import CopilotDotcomPullRequestsRepositoriesInner
-from github_client.models.copilot_dotcom_pull_requests_repositories_inner_models_inner import CopilotDotcomPullRequestsRepositoriesInnerModelsInner
-from github_client.models.copilot_ide_chat import CopilotIdeChat
-from github_client.models.copilot_ide_chat_editors_inner import CopilotIdeChatEditorsInner
-from github_client.models.copilot_ide_chat_editors_inner_models_inner import CopilotIdeChatEditorsInnerModelsInner
-from github_client.models.copilot_ide_code_completions import CopilotIdeCodeCompletions
-from github_client.models.copilot_ide_code_completions_editors_inner import CopilotIdeCodeCompletionsEditorsInner
-from github_client.models.copilot_ide_code_completions_editors_inner_models_inner import CopilotIdeCodeCompletionsEditorsInnerModelsInner
-from github_client.models.copilot_ide_code_completions_editors_inner_models_inner_languages_inner import CopilotIdeCodeCompletionsEditorsInnerModelsInnerLanguagesInner
-from github_client.models.copilot_ide_code_completions_languages_inner import CopilotIdeCodeCompletionsLanguagesInner
-from github_client.models.copilot_list_copilot_seats200_response import CopilotListCopilotSeats200Response
-from github_client.models.copilot_organization_details import CopilotOrganizationDetails
-from github_client.models.copilot_organization_seat_breakdown import CopilotOrganizationSeatBreakdown
-from github_client.models.copilot_seat_details import CopilotSeatDetails
-from github_client.models.copilot_seat_details_assigning_team import CopilotSeatDetailsAssigningTeam
-from github_client.models.copilot_usage_metrics_day import CopilotUsageMetricsDay
-from github_client.models.credentials_revoke_request import CredentialsRevokeRequest
-from github_client.models.custom_deployment_rule_app import CustomDeploymentRuleApp
-from github_client.models.custom_property import CustomProperty
-from github_client.models.custom_property_default_value import CustomPropertyDefaultValue
-from github_client.models.custom_property_set_payload import CustomPropertySetPayload
-from github_client.models.custom_property_value import CustomPropertyValue
-from github_client.models.custom_property_value_value import CustomPropertyValueValue
-from github_client.models.cvss_severities import CvssSeverities
-from github_client.models.cvss_severities_cvss_v3 import CvssSeveritiesCvssV3
-from github_client.models.cvss_severities_cvss_v4 import CvssSeveritiesCvssV4
-from github_client.models.delete_budget import DeleteBudget
-from github_client.models.demilestoned_issue_event import DemilestonedIssueEvent
-from github_client.models.dependabot_alert import DependabotAlert
-from github_client.models.dependabot_alert_package import DependabotAlertPackage
-from github_client.models.dependabot_alert_security_advisory import DependabotAlertSecurityAdvisory
-from github_client.models.dependabot_alert_security_advisory_cvss import DependabotAlertSecurityAdvisoryCvss
-from github_client.models.dependabot_alert_security_advisory_cwes_inner import DependabotAlertSecurityAdvisoryCwesInner
-from github_client.models.dependabot_alert_security_advisory_identifiers_inner import DependabotAlertSecurityAdvisoryIdentifiersInner
-from github_client.models.dependabot_alert_security_advisory_references_inner import DependabotAlertSecurityAdvisoryReferencesInner
-from github_client.models.dependabot_alert_security_vulnerability import DependabotAlertSecurityVulnerability
-from github_client.models.dependabot_alert_security_vulnerability_first_patched_version import DependabotAlertSecurityVulnerabilityFirstPatchedVersion
-from github_client.models.dependabot_alert_with_repository import DependabotAlertWithRepository
-from github_client.models.dependabot_alert_with_repository_dependency import DependabotAlertWithRepositoryDependency
-from github_client.models.dependabot_create_or_update_org_secret_request import DependabotCreateOrUpdateOrgSecretRequest
-from github_client.models.dependabot_create_or_update_org_secret_request_selected_repository_ids_inner import DependabotCreateOrUpdateOrgSecretRequestSelectedRepositoryIdsInner
-from github_client.models.dependabot_create_or_update_repo_secret_request import DependabotCreateOrUpdateRepoSecretRequest
-from github_client.models.dependabot_list_alerts_for_enterprise_has_parameter import DependabotListAlertsForEnterpriseHasParameter
-from github_client.models.dependabot_list_alerts_for_org_has_parameter import DependabotListAlertsForOrgHasParameter
-from github_client.models.dependabot_list_org_secrets200_response import DependabotListOrgSecrets200Response
-from github_client.models.dependabot_list_repo_secrets200_response import DependabotListRepoSecrets200Response
-from github_client.models.dependabot_public_key import DependabotPublicKey
-from github_client.models.dependabot_repository_access_details import DependabotRepositoryAccessDetails
-from github_client.models.dependabot_secret import DependabotSecret
-from github_client.models.dependabot_set_repository_access_default_level_request import DependabotSetRepositoryAccessDefaultLevelRequest
-from github_client.models.dependabot_set_selected_repos_for_org_secret_request import DependabotSetSelectedReposForOrgSecretRequest
-from github_client.models.dependabot_update_alert_request import DependabotUpdateAlertRequest
-from github_client.models.dependabot_update_repository_access_for_org_request import DependabotUpdateRepositoryAccessForOrgRequest
-from github_client.models.dependency import Dependency
-from github_client.models.dependency_graph_create_repository_snapshot201_response import DependencyGraphCreateRepositorySnapshot201Response
-from github_client.models.dependency_graph_diff_inner import DependencyGraphDiffInner
-from github_client.models.dependency_graph_diff_inner_vulnerabilities_inner import DependencyGraphDiffInnerVulnerabilitiesInner
-from github_client.models.dependency_graph_spdx_sbom import DependencyGraphSpdxSbom
-from github_client.models.dependency_graph_spdx_sbom_sbom import DependencyGraphSpdxSbomSbom
-from github_client.models.dependency_graph_spdx_sbom_sbom_creation_info import DependencyGraphSpdxSbomSbomCreationInfo
-from github_client.models.dependency_graph_spdx_sbom_sbom_packages_inner import DependencyGraphSpdxSbomSbomPackagesInner
-from github_client.models.dependency_graph_spdx_sbom_sbom_packages_inner_external_refs_inner import DependencyGraphSpdxSbomSbomPackagesInnerExternalRefsInner
-from github_client.models.dependency_graph_spdx_sbom_sbom_relationships_inner import DependencyGraphSpdxSbomSbomRelationshipsInner
-from github_client.models.deploy_key import DeployKey
-from github_client.models.deployment import Deployment
-from github_client.models.deployment1 import Deployment1
-from github_client.models.deployment1_payload import Deployment1Payload
-from github_client.models.deployment_branch_policy import DeploymentBranchPolicy
-from github_client.models.deployment_branch_policy_name_pattern import DeploymentBranchPolicyNamePattern
-from github_client.models.deployment_branch_policy_name_pattern_with_type import DeploymentBranchPolicyNamePatternWithType
-from github_client.models.deployment_branch_policy_settings import DeploymentBranchPolicySettings
-from github_client.models.deployment_payload import DeploymentPayload
-from github_client.models.deployment_protection_rule import DeploymentProtectionRule
-from github_client.models.deployment_reviewer_type import DeploymentReviewerType
-from github_client.models.deployment_simple import DeploymentSimple
-from github_client.models.deployment_status import DeploymentStatus
-from github_client.models.deployment_workflow_run import DeploymentWorkflowRun
-from github_client.models.deployment_workflow_run1 import DeploymentWorkflowRun1
-from github_client.models.deployment_workflow_run1_head_repository import DeploymentWorkflowRun1HeadRepository
-from github_client.models.deployment_workflow_run2 import DeploymentWorkflowRun2
-from github_client.models.deployment_workflow_run3 import DeploymentWorkflowRun3
-from github_client.models.deployment_workflow_run4 import DeploymentWorkflowRun4
-from github_client.models.deployment_workflow_run_head_repository import DeploymentWorkflowRunHeadRepository
-from github_client.models.deployment_workflow_run_head_repository_owner import DeploymentWorkflowRunHeadRepositoryOwner
-from github_client.models.deployment_workflow_run_referenced_workflows_inner import DeploymentWorkflowRunReferencedWorkflowsInner
-from github_client.models.diff_entry import DiffEntry
-from github_client.models.discussion import Discussion
-from github_client.models.discussion_category import DiscussionCategory
-from github_client.models.docker_metadata import DockerMetadata
-from github_client.models.email import Email
-from github_client.models.enabled_repositories import EnabledRepositories
-from github_client.models.enterprise import Enterprise
-from github_client.models.enterprise_team import EnterpriseTeam
-from github_client.models.enterprise_team_memberships_bulk_add_request import EnterpriseTeamMembershipsBulkAddRequest
-from github_client.models.enterprise_team_memberships_bulk_remove_request import EnterpriseTeamMembershipsBulkRemoveRequest
-from github_client.models.enterprise_team_organizations_bulk_add_request import EnterpriseTeamOrganizationsBulkAddRequest
-from github_client.models.enterprise_team_organizations_bulk_remove_request import EnterpriseTeamOrganizationsBulkRemoveRequest
-from github_client.models.enterprise_teams_create_request import EnterpriseTeamsCreateRequest
-from github_client.models.enterprise_teams_update_request import EnterpriseTeamsUpdateRequest
-from github_client.models.enterprise_webhooks import EnterpriseWebhooks
-from github_client.models.environment import Environment
-from github_client.models.environment_approvals import EnvironmentApprovals
-from github_client.models.environment_approvals_environments_inner import EnvironmentApprovalsEnvironmentsInner
-from github_client.models.environment_protection_rules_inner import EnvironmentProtectionRulesInner
-from github_client.models.environment_protection_rules_inner_any_of import EnvironmentProtectionRulesInnerAnyOf
-from github_client.models.environment_protection_rules_inner_any_of1 import EnvironmentProtectionRulesInnerAnyOf1
-from github_client.models.environment_protection_rules_inner_any_of2 import EnvironmentProtectionRulesInnerAnyOf2
-from github_client.models.event import Event
-from github_client.models.event_payload import EventPayload
-from github_client.models.event_payload_pages_inner import EventPayloadPagesInner
-from github_client.models.event_repo import EventRepo
-from github_client.models.feed import Feed
-from github_client.models.feed_links import FeedLinks
-from github_client.models.file_commit import FileCommit
-from github_client.models.file_commit_commit import FileCommitCommit
-from github_client.models.file_commit_commit_author import FileCommitCommitAuthor
-from github_client.models.file_commit_commit_parents_inner import FileCommitCommitParentsInner
-from github_client.models.file_commit_commit_tree import FileCommitCommitTree
-from github_client.models.file_commit_commit_verification import FileCommitCommitVerification
-from github_client.models.file_commit_content import FileCommitContent
-from github_client.models.file_commit_content_links import FileCommitContentLinks
-from github_client.models.full_repository import FullRepository
-from github_client.models.full_repository_permissions import FullRepositoryPermissions
-from github_client.models.get_all_budgets import GetAllBudgets
-from github_client.models.get_budget import GetBudget
-from github_client.models.get_budget_budget_alerting import GetBudgetBudgetAlerting
-from github_client.models.gist import Gist
-from github_client.models.gist_comment import GistComment
-from github_client.models.gist_commit import GistCommit
-from github_client.models.gist_files_value import GistFilesValue
-from github_client.models.gist_history import GistHistory
-from github_client.models.gist_history_change_status import GistHistoryChangeStatus
-from github_client.models.gist_simple import GistSimple
-from github_client.models.gist_simple_files_value import GistSimpleFilesValue
-from github_client.models.gist_simple_forks_inner import GistSimpleForksInner
-from github_client.models.gists_create_comment_request import GistsCreateCommentRequest
-from github_client.models.gists_create_request import GistsCreateRequest
-from github_client.models.gists_create_request_files_value import GistsCreateRequestFilesValue
-from github_client.models.gists_create_request_public import GistsCreateRequestPublic
-from github_client.models.gists_get403_response import GistsGet403Response
-from github_client.models.gists_get403_response_block import GistsGet403ResponseBlock
-from github_client.models.gists_update_request import GistsUpdateRequest
-from github_client.models.gists_update_request_files_value import GistsUpdateRequestFilesValue
-from github_client.models.git_commit import GitCommit
-from github_client.models.git_commit_author import GitCommitAuthor
-from github_client.models.git_commit_parents_inner import GitCommitParentsInner
-from github_client.models.git_commit_tree import GitCommitTree
-from github_client.models.git_commit_verification import GitCommitVerification
-from github_client.models.git_create_blob422_response import GitCreateBlob422Response
-from github_client.models.git_create_blob_request import GitCreateBlobRequest
-from github_client.models.git_create_commit_request import GitCreateCommitRequest
-from github_client.models.git_create_commit_request_author import GitCreateCommitRequestAuthor
-from github_client.models.git_create_commit_request_committer import GitCreateCommitRequestCommitter
-from github_client.models.git_create_ref_request import GitCreateRefRequest
-from github_client.models.git_create_tag_request import GitCreateTagRequest
-from github_client.models.git_create_tag_request_tagger import GitCreateTagRequestTagger
-from github_client.models.git_create_tree_request import GitCreateTreeRequest
-from github_client.models.git_create_tree_request_tree_inner import GitCreateTreeRequestTreeInner
-from github_client.models.git_ref import GitRef
-from github_client.models.git_ref_object import GitRefObject
-from github_client.models.git_tag import GitTag
-from github_client.models.git_tag_object import GitTagObject
-from github_client.models.git_tag_tagger import GitTagTagger
-from github_client.models.git_tree import GitTree
-from github_client.models.git_tree_tree_inner import GitTreeTreeInner
-from github_client.models.git_update_ref_request import GitUpdateRefRequest
-from github_client.models.gitignore_template import GitignoreTemplate
-from github_client.models.global_advisory import GlobalAdvisory
-from github_client.models.global_advisory_credits_inner import GlobalAdvisoryCreditsInner
-from github_client.models.global_advisory_cvss import GlobalAdvisoryCvss
-from github_client.models.global_advisory_cwes_inner import GlobalAdvisoryCwesInner
-from github_client.models.global_advisory_identifiers_inner import GlobalAdvisoryIdentifiersInner
-from github_client.models.gpg_key import GpgKey
-from github_client.models.gpg_key_emails_inner import GpgKeyEmailsInner
-from github_client.models.gpg_key_subkeys_inner import GpgKeySubkeysInner
-from github_client.models.hook import Hook
-from github_client.models.hook_delivery import HookDelivery
-from github_client.models.hook_delivery_item import HookDeliveryItem
-from github_client.models.hook_delivery_request import HookDeliveryRequest
-from github_client.models.hook_delivery_response import HookDeliveryResponse
-from github_client.models.hook_response import HookResponse
-from github_client.models.hosted_compute_create_network_configuration_for_org_request import HostedComputeCreateNetworkConfigurationForOrgRequest
-from github_client.models.hosted_compute_list_network_configurations_for_org200_response import HostedComputeListNetworkConfigurationsForOrg200Response
-from github_client.models.hosted_compute_update_network_configuration_for_org_request import HostedComputeUpdateNetworkConfigurationForOrgRequest
-from github_client.models.hovercard import Hovercard
-from github_client.models.hovercard_contexts_inner import HovercardContextsInner
-from github_client.models.immutable_releases_organization_settings import ImmutableReleasesOrganizationSettings
-from github_client.models.import_project_choices_inner import ImportProjectChoicesInner
-from github_client.models.installation import Installation
-from github_client.models.installation_account import InstallationAccount
-from github_client.models.installation_token import InstallationToken
-from github_client.models.integration import Integration
-from github_client.models.integration_installation_request import IntegrationInstallationRequest
-from github_client.models.integration_installation_request_account import IntegrationInstallationRequestAccount
-from github_client.models.integration_owner import IntegrationOwner
-from github_client.models.integration_permissions import IntegrationPermissions
-from github_client.models.interaction_expiry import InteractionExpiry
-from github_client.models.interaction_group import InteractionGroup
-from github_client.models.interaction_limit import InteractionLimit
-from github_client.models.interaction_limit_response import InteractionLimitResponse
-from github_client.models.interactions_get_restrictions_for_org200_response import InteractionsGetRestrictionsForOrg200Response
-from github_client.models.issue import Issue
-from github_client.models.issue1 import Issue1
-from github_client.models.issue10 import Issue10
-from github_client.models.issue2 import Issue2
-from github_client.models.issue3 import Issue3
-from github_client.models.issue4 import Issue4
-from github_client.models.issue5 import Issue5
-from github_client.models.issue6 import Issue6
-from github_client.models.issue7 import Issue7
-from github_client.models.issue8 import Issue8
-from github_client.models.issue9 import Issue9
-from github_client.models.issue_comment import IssueComment
-from github_client.models.issue_dependencies_summary import IssueDependenciesSummary
-from github_client.models.issue_event import IssueEvent
-from github_client.models.issue_event_dismissed_review import IssueEventDismissedReview
-from github_client.models.issue_event_for_issue import IssueEventForIssue
-from github_client.models.issue_event_label import IssueEventLabel
-from github_client.models.issue_event_milestone import IssueEventMilestone
-from github_client.models.issue_event_project_card import IssueEventProjectCard
-from github_client.models.issue_event_rename import IssueEventRename
-from github_client.models.issue_field_value import IssueFieldValue
-from github_client.models.issue_field_value_single_select_option import IssueFieldValueSingleSelectOption
-from github_client.models.issue_field_value_value import IssueFieldValueValue
-from github_client.models.issue_labels_inner import IssueLabelsInner
-from github_client.models.issue_labels_inner_one_of import IssueLabelsInnerOneOf
-from github_client.models.issue_pull_request import IssuePullRequest
-from github_client.models.issue_search_result_item import IssueSearchResultItem
-from github_client.models.issue_search_result_item_labels_inner import IssueSearchResultItemLabelsInner
-from github_client.models.issue_type import IssueType
-from github_client.models.issues_add_assignees_request import IssuesAddAssigneesRequest
-from github_client.models.issues_add_blocked_by_dependency_request import IssuesAddBlockedByDependencyRequest
-from github_client.models.issues_add_labels_request import IssuesAddLabelsRequest
-from github_client.models.issues_add_labels_request_one_of import IssuesAddLabelsRequestOneOf
-from github_client.models.issues_add_sub_issue_request import IssuesAddSubIssueRequest
-from github_client.models.issues_create_label_request import IssuesCreateLabelRequest
-from github_client.models.issues_create_milestone_request import IssuesCreateMilestoneRequest
-from github_client.models.issues_create_request import IssuesCreateRequest
-from github_client.models.issues_create_request_labels_inner import IssuesCreateRequestLabelsInner
-from github_client.models.issues_create_request_labels_inner_one_of import IssuesCreateRequestLabelsInnerOneOf
-from github_client.models.issues_create_request_milestone import IssuesCreateRequestMilestone
-from github_client.models.issues_create_request_title import IssuesCreateRequestTitle
-from github_client.models.issues_lock_request import IssuesLockRequest
-from github_client.models.issues_remove_assignees_request import IssuesRemoveAssigneesRequest
-from github_client.models.issues_remove_sub_issue_request import IssuesRemoveSubIssueRequest
-from github_client.models.issues_reprioritize_sub_issue_request import IssuesReprioritizeSubIssueRequest
-from github_client.models.issues_set_labels_request import IssuesSetLabelsRequest
-from github_client.models.issues_set_labels_request_one_of import IssuesSetLabelsRequestOneOf
-from github_client.models.issues_set_labels_request_one_of1 import IssuesSetLabelsRequestOneOf1
-from github_client.models.issues_set_labels_request_one_of1_labels_inner import IssuesSetLabelsRequestOneOf1LabelsInner
-from github_client.models.issues_update_comment_request import IssuesUpdateCommentRequest
-from github_client.models.issues_update_label_request import IssuesUpdateLabelRequest
-from github_client.models.issues_update_milestone_request import IssuesUpdateMilestoneRequest
-from github_client.models.issues_update_request import IssuesUpdateRequest
-from github_client.models.issues_update_request_milestone import IssuesUpdateRequestMilestone
-from github_client.models.issues_update_request_title import IssuesUpdateRequestTitle
-from github_client.models.job import Job
-from github_client.models.job_steps_inner import JobStepsInner
-from github_client.models.key import Key
-from github_client.models.key_simple import KeySimple
-from github_client.models.label import Label
-from github_client.models.label1 import Label1
-from github_client.models.label_search_result_item import LabelSearchResultItem
-from github_client.models.labeled_issue_event import LabeledIssueEvent
-from github_client.models.labeled_issue_event_label import LabeledIssueEventLabel
-from github_client.models.license import License
-from github_client.models.license_content import LicenseContent
-from github_client.models.license_simple import LicenseSimple
-from github_client.models.link import Link
-from github_client.models.link_with_type import LinkWithType
-from github_client.models.locked_issue_event import LockedIssueEvent
-from github_client.models.manifest import Manifest
-from github_client.models.manifest_file import ManifestFile
-from github_client.models.markdown_render_request import MarkdownRenderRequest
-from github_client.models.marketplace_account import MarketplaceAccount
-from github_client.models.marketplace_listing_plan import MarketplaceListingPlan
-from github_client.models.marketplace_purchase import MarketplacePurchase
-from github_client.models.marketplace_purchase1 import MarketplacePurchase1
-from github_client.models.marketplace_purchase2 import MarketplacePurchase2
-from github_client.models.marketplace_purchase_marketplace_pending_change import MarketplacePurchaseMarketplacePendingChange
-from github_client.models.marketplace_purchase_marketplace_purchase import MarketplacePurchaseMarketplacePurchase
-from github_client.models.merge_group import MergeGroup
-from github_client.models.merged_upstream import MergedUpstream
-from github_client.models.metadata_value import MetadataValue
-from github_client.models.migration import Migration
-from github_client.models.migrations_map_commit_author_request import MigrationsMapCommitAuthorRequest
-from github_client.models.migrations_set_lfs_preference_request import MigrationsSetLfsPreferenceRequest
-from github_client.models.migrations_start_for_authenticated_user_request import MigrationsStartForAuthenticatedUserRequest
-from github_client.models.migrations_start_for_org_request import MigrationsStartForOrgRequest
-from github_client.models.migrations_start_import_request import MigrationsStartImportRequest
-from github_client.models.migrations_update_import_request import MigrationsUpdateImportRequest
-from github_client.models.milestone import Milestone
-from github_client.models.milestone1 import Milestone1
-from github_client.models.milestoned_issue_event import MilestonedIssueEvent
-from github_client.models.milestoned_issue_event_milestone import MilestonedIssueEventMilestone
-from github_client.models.minimal_repository import MinimalRepository
-from github_client.models.minimal_repository_license import MinimalRepositoryLicense
-from github_client.models.minimal_repository_permissions import MinimalRepositoryPermissions
-from github_client.models.model_import import ModelImport
-from github_client.models.moved_column_in_project_issue_event import MovedColumnInProjectIssueEvent
-from github_client.models.network_configuration import NetworkConfiguration
-from github_client.models.network_settings import NetworkSettings
-from github_client.models.nullable_actions_hosted_runner_pool_image import NullableActionsHostedRunnerPoolImage
-from github_client.models.nullable_code_of_conduct_simple import NullableCodeOfConductSimple
-from github_client.models.nullable_codespace_machine import NullableCodespaceMachine
-from github_client.models.nullable_collaborator import NullableCollaborator
-from github_client.models.nullable_community_health_file import NullableCommunityHealthFile
-from github_client.models.nullable_git_user import NullableGitUser
-from github_client.models.nullable_integration import NullableIntegration
-from github_client.models.nullable_issue import NullableIssue
-from github_client.models.nullable_license_simple import NullableLicenseSimple
-from github_client.models.nullable_milestone import NullableMilestone
-from github_client.models.nullable_minimal_repository import NullableMinimalRepository
-from github_client.models.nullable_organization_simple import NullableOrganizationSimple
-from github_client.models.nullable_projects_v2_status_update import NullableProjectsV2StatusUpdate
-from github_client.models.nullable_repository import NullableRepository
-from github_client.models.nullable_repository_webhooks import NullableRepositoryWebhooks
-from github_client.models.nullable_scoped_installation import NullableScopedInstallation
-from github_client.models.nullable_secret_scanning_first_detected_location import NullableSecretScanningFirstDetectedLocation
-from github_client.models.nullable_simple_commit import NullableSimpleCommit
-from github_client.models.nullable_simple_commit_author import NullableSimpleCommitAuthor
-from github_client.models.nullable_simple_commit_committer import NullableSimpleCommitCommitter
-from github_client.models.nullable_simple_repository import NullableSimpleRepository
-from github_client.models.nullable_simple_user import NullableSimpleUser
-from github_client.models.nullable_team_simple import NullableTeamSimple
-from github_client.models.oidc_custom_sub import OidcCustomSub
-from github_client.models.oidc_custom_sub_repo import OidcCustomSubRepo
-from github_client.models.org_hook import OrgHook
-from github_client.models.org_hook_config import OrgHookConfig
-from github_client.models.org_membership import OrgMembership
-from github_client.models.org_membership_permissions import OrgMembershipPermissions
-from github_client.models.org_private_registry_configuration import OrgPrivateRegistryConfiguration
-from github_client.models.org_private_registry_configuration_with_selected_repositories import OrgPrivateRegistryConfigurationWithSelectedRepositories
-from github_client.models.org_repo_custom_property_values import OrgRepoCustomPropertyValues
-from github_client.models.org_rules import OrgRules
-from github_client.models.org_ruleset_conditions import OrgRulesetConditions
-from github_client.models.organization import Organization
-from github_client.models.organization_actions_secret import OrganizationActionsSecret
-from github_client.models.organization_actions_variable import OrganizationActionsVariable
-from github_client.models.organization_create_issue_type import OrganizationCreateIssueType
-from github_client.models.organization_dependabot_secret import OrganizationDependabotSecret
-from github_client.models.organization_full import OrganizationFull
-from github_client.models.organization_full_plan import OrganizationFullPlan
-from github_client.models.organization_invitation import OrganizationInvitation
-from github_client.models.organization_programmatic_access_grant import OrganizationProgrammaticAccessGrant
-from github_client.models.organization_programmatic_access_grant_request import OrganizationProgrammaticAccessGrantRequest
-from github_client.models.organization_programmatic_access_grant_request_permissions import OrganizationProgrammaticAccessGrantRequestPermissions
-from github_client.models.organization_role import OrganizationRole
-from github_client.models.organization_secret_scanning_alert import OrganizationSecretScanningAlert
-from github_client.models.organization_simple import OrganizationSimple
-from github_client.models.organization_simple_webhooks import OrganizationSimpleWebhooks
-from github_client.models.organization_update_issue_type import OrganizationUpdateIssueType
-from github_client.models.orgs_convert_member_to_outside_collaborator_request import OrgsConvertMemberToOutsideCollaboratorRequest
-from github_client.models.orgs_create_artifact_storage_record200_response import OrgsCreateArtifactStorageRecord200Response
-from github_client.models.orgs_create_artifact_storage_record200_response_storage_records_inner import OrgsCreateArtifactStorageRecord200ResponseStorageRecordsInner
-from github_client.models.orgs_create_artifact_storage_record_request import OrgsCreateArtifactStorageRecordRequest
-from github_client.models.orgs_create_invitation_request import OrgsCreateInvitationRequest
-from github_client.models.orgs_create_webhook_request import OrgsCreateWebhookRequest
-from github_client.models.orgs_create_webhook_request_config import OrgsCreateWebhookRequestConfig
-from github_client.models.orgs_custom_properties_for_orgs_create_or_update_organization_values_request import OrgsCustomPropertiesForOrgsCreateOrUpdateOrganizationValuesRequest
-from github_client.models.orgs_custom_properties_for_repos_create_or_update_organization_definitions_request import OrgsCustomPropertiesForReposCreateOrUpdateOrganizationDefinitionsRequest
-from github_client.models.orgs_custom_properties_for_repos_create_or_update_organization_values_request import OrgsCustomPropertiesForReposCreateOrUpdateOrganizationValuesRequest
-from github_client.models.orgs_delete_attestations_bulk_request import OrgsDeleteAttestationsBulkRequest
-from github_client.models.orgs_delete_attestations_bulk_request_one_of import OrgsDeleteAttestationsBulkRequestOneOf
-from github_client.models.orgs_delete_attestations_bulk_request_one_of1 import OrgsDeleteAttestationsBulkRequestOneOf1
-from github_client.models.orgs_enable_or_disable_security_product_on_all_org_repos_request import OrgsEnableOrDisableSecurityProductOnAllOrgReposRequest
-from github_client.models.orgs_list_app_installations200_response import OrgsListAppInstallations200Response
-from github_client.models.orgs_list_artifact_storage_records200_response import OrgsListArtifactStorageRecords200Response
-from github_client.models.orgs_list_artifact_storage_records200_response_storage_records_inner import OrgsListArtifactStorageRecords200ResponseStorageRecordsInner
-from github_client.models.orgs_list_attestation_repositories200_response_inner import OrgsListAttestationRepositories200ResponseInner
-from github_client.models.orgs_list_attestations200_response import OrgsListAttestations200Response
-from github_client.models.orgs_list_attestations200_response_attestations_inner import OrgsListAttestations200ResponseAttestationsInner
-from github_client.models.orgs_list_attestations200_response_attestations_inner_bundle import OrgsListAttestations200ResponseAttestationsInnerBundle
-from github_client.models.orgs_list_attestations_bulk200_response import OrgsListAttestationsBulk200Response
-from github_client.models.orgs_list_attestations_bulk200_response_attestations_subject_digests_value_inner import OrgsListAttestationsBulk200ResponseAttestationsSubjectDigestsValueInner
-from github_client.models.orgs_list_attestations_bulk200_response_attestations_subject_digests_value_inner_bundle import OrgsListAttestationsBulk200ResponseAttestationsSubjectDigestsValueInnerBundle
-from github_client.models.orgs_list_attestations_bulk200_response_page_info import OrgsListAttestationsBulk200ResponsePageInfo
-from github_client.models.orgs_list_attestations_bulk_request import OrgsListAttestationsBulkRequest
-from github_client.models.orgs_list_org_roles200_response import OrgsListOrgRoles200Response
-from github_client.models.orgs_remove_outside_collaborator422_response import OrgsRemoveOutsideCollaborator422Response
-from github_client.models.orgs_review_pat_grant_request_request import OrgsReviewPatGrantRequestRequest
-from github_client.models.orgs_review_pat_grant_requests_in_bulk_request import OrgsReviewPatGrantRequestsInBulkRequest
-from github_client.models.orgs_set_immutable_releases_settings_repositories_request import OrgsSetImmutableReleasesSettingsRepositoriesRequest
-from github_client.models.orgs_set_immutable_releases_settings_request import OrgsSetImmutableReleasesSettingsRequest
-from github_client.models.orgs_set_membership_for_user_request import OrgsSetMembershipForUserRequest
-from github_client.models.orgs_update422_response import OrgsUpdate422Response
-from github_client.models.orgs_update_membership_for_authenticated_user_request import OrgsUpdateMembershipForAuthenticatedUserRequest
-from github_client.models.orgs_update_pat_access_request import OrgsUpdatePatAccessRequest
-from github_client.models.orgs_update_pat_accesses_request import OrgsUpdatePatAccessesRequest
-from github_client.models.orgs_update_request import OrgsUpdateRequest
-from github_client.models.orgs_update_webhook_request import OrgsUpdateWebhookRequest
-from github_client.models.orgs_update_webhook_request_config import OrgsUpdateWebhookRequestConfig
-from github_client.models.package import Package
-from github_client.models.package_version import PackageVersion
-from github_client.models.package_version_metadata import PackageVersionMetadata
-from github_client.models.packages_billing_usage import PackagesBillingUsage
-from github_client.models.page import Page
-from github_client.models.page_build import PageBuild
-from github_client.models.page_build_error import PageBuildError
-from github_client.models.page_build_status import PageBuildStatus
-from github_client.models.page_deployment import PageDeployment
-from github_client.models.page_deployment_id import PageDeploymentId
-from github_client.models.pages_deployment_status import PagesDeploymentStatus
-from github_client.models.pages_health_check import PagesHealthCheck
-from github_client.models.pages_health_check_alt_domain import PagesHealthCheckAltDomain
-from github_client.models.pages_health_check_domain import PagesHealthCheckDomain
-from github_client.models.pages_https_certificate import PagesHttpsCertificate
-from github_client.models.pages_source_hash import PagesSourceHash
-from github_client.models.participation_stats import ParticipationStats
-from github_client.models.pending_deployment import PendingDeployment
-from github_client.models.pending_deployment_environment import PendingDeploymentEnvironment
-from github_client.models.pending_deployment_reviewers_inner import PendingDeploymentReviewersInner
-from github_client.models.pending_deployment_reviewers_inner_reviewer import PendingDeploymentReviewersInnerReviewer
-from github_client.models.personal_access_token_request import PersonalAccessTokenRequest
-from github_client.models.personal_access_token_request_permissions_added import PersonalAccessTokenRequestPermissionsAdded
-from github_client.models.personal_access_token_request_permissions_result import PersonalAccessTokenRequestPermissionsResult
-from github_client.models.personal_access_token_request_permissions_upgraded import PersonalAccessTokenRequestPermissionsUpgraded
-from github_client.models.porter_author import PorterAuthor
-from github_client.models.porter_large_file import PorterLargeFile
-from github_client.models.private_registries_create_org_private_registry_request import PrivateRegistriesCreateOrgPrivateRegistryRequest
-from github_client.models.private_registries_get_org_public_key200_response import PrivateRegistriesGetOrgPublicKey200Response
-from github_client.models.private_registries_list_org_private_registries200_response import PrivateRegistriesListOrgPrivateRegistries200Response
-from github_client.models.private_registries_update_org_private_registry_request import PrivateRegistriesUpdateOrgPrivateRegistryRequest
-from github_client.models.private_user import PrivateUser
-from github_client.models.private_vulnerability_report_create import PrivateVulnerabilityReportCreate
-from github_client.models.project_card import ProjectCard
-from github_client.models.project_collaborator_permission import ProjectCollaboratorPermission
-from github_client.models.project_column import ProjectColumn
-from github_client.models.projects_add_item_for_org_request import ProjectsAddItemForOrgRequest
-from github_client.models.projects_classic_add_collaborator_request import ProjectsClassicAddCollaboratorRequest
-from github_client.models.projects_classic_move_column_request import ProjectsClassicMoveColumnRequest
-from github_client.models.projects_classic_update_column_request import ProjectsClassicUpdateColumnRequest
-from github_client.models.projects_create_draft_item_for_org_request import ProjectsCreateDraftItemForOrgRequest
-from github_client.models.projects_list_items_for_org_fields_parameter import ProjectsListItemsForOrgFieldsParameter
-from github_client.models.projects_update_item_for_org_request import ProjectsUpdateItemForOrgRequest
-from github_client.models.projects_update_item_for_org_request_fields_inner import ProjectsUpdateItemForOrgRequestFieldsInner
-from github_client.models.projects_update_item_for_org_request_fields_inner_value import ProjectsUpdateItemForOrgRequestFieldsInnerValue
-from github_client.models.projects_v2 import ProjectsV2
-from github_client.models.projects_v2_draft_issue import ProjectsV2DraftIssue
-from github_client.models.projects_v2_field import ProjectsV2Field
-from github_client.models.projects_v2_field_configuration import ProjectsV2FieldConfiguration
-from github_client.models.projects_v2_item import ProjectsV2Item
-from github_client.models.projects_v2_item_content_type import ProjectsV2ItemContentType
-from github_client.models.projects_v2_item_simple import ProjectsV2ItemSimple
-from github_client.models.projects_v2_item_simple_content import ProjectsV2ItemSimpleContent
-from github_client.models.projects_v2_item_with_content import ProjectsV2ItemWithContent
-from github_client.models.projects_v2_iteration_setting import ProjectsV2IterationSetting
-from github_client.models.projects_v2_iteration_settings import ProjectsV2IterationSettings
-from github_client.models.projects_v2_iteration_settings_title import ProjectsV2IterationSettingsTitle
-from github_client.models.projects_v2_single_select_option import ProjectsV2SingleSelectOption
-from github_client.models.projects_v2_single_select_options import ProjectsV2SingleSelectOptions
-from github_client.models.projects_v2_single_select_options_description import ProjectsV2SingleSelectOptionsDescription
-from github_client.models.projects_v2_single_select_options_name import ProjectsV2SingleSelectOptionsName
-from github_client.models.projects_v2_status_update import ProjectsV2StatusUpdate
-from github_client.models.protected_branch import ProtectedBranch
-from github_client.models.protected_branch_admin_enforced import ProtectedBranchAdminEnforced
-from github_client.models.protected_branch_allow_fork_syncing import ProtectedBranchAllowForkSyncing
-from github_client.models.protected_branch_enforce_admins import ProtectedBranchEnforceAdmins
-from github_client.models.protected_branch_lock_branch import ProtectedBranchLockBranch
-from github_client.models.protected_branch_pull_request_review import ProtectedBranchPullRequestReview
-from github_client.models.protected_branch_pull_request_review_bypass_pull_request_allowances import ProtectedBranchPullRequestReviewBypassPullRequestAllowances
-from github_client.models.protected_branch_pull_request_review_dismissal_restrictions import ProtectedBranchPullRequestReviewDismissalRestrictions
-from github_client.models.protected_branch_required_conversation_resolution import ProtectedBranchRequiredConversationResolution
-from github_client.models.protected_branch_required_linear_history import ProtectedBranchRequiredLinearHistory
-from github_client.models.protected_branch_required_pull_request_reviews import ProtectedBranchRequiredPullRequestReviews
-from github_client.models.protected_branch_required_pull_request_reviews_bypass_pull_request_allowances import ProtectedBranchRequiredPullRequestReviewsBypassPullRequestAllowances
-from github_client.models.protected_branch_required_pull_request_reviews_dismissal_restrictions import ProtectedBranchRequiredPullRequestReviewsDismissalRestrictions
-from github_client.models.protected_branch_required_status_check import ProtectedBranchRequiredStatusCheck
-from github_client.models.protected_branch_required_status_check_checks_inner import ProtectedBranchRequiredStatusCheckChecksInner
-from github_client.models.public_ip import PublicIp
-from github_client.models.public_user import PublicUser
-from github_client.models.public_user_plan import PublicUserPlan
-from github_client.models.pull_request import PullRequest
-from github_client.models.pull_request1 import PullRequest1
-from github_client.models.pull_request10 import PullRequest10
-from github_client.models.pull_request10_head import PullRequest10Head
-from github_client.models.pull_request11 import PullRequest11
-from github_client.models.pull_request11_base import PullRequest11Base
-from github_client.models.pull_request12 import PullRequest12
-from github_client.models.pull_request12_head import PullRequest12Head
-from github_client.models.pull_request13 import PullRequest13
-from github_client.models.pull_request1_base import PullRequest1Base
-from github_client.models.pull_request2 import PullRequest2
-from github_client.models.pull_request2_head import PullRequest2Head
-from github_client.models.pull_request3 import PullRequest3
-from github_client.models.pull_request3_requested_reviewers_inner import PullRequest3RequestedReviewersInner
-from github_client.models.pull_request4 import PullRequest4
-from github_client.models.pull_request5 import PullRequest5
-from github_client.models.pull_request6 import PullRequest6
-from github_client.models.pull_request6_base import PullRequest6Base
-from github_client.models.pull_request6_requested_reviewers_inner import PullRequest6RequestedReviewersInner
-from github_client.models.pull_request7 import PullRequest7
-from github_client.models.pull_request8 import PullRequest8
-from github_client.models.pull_request9 import PullRequest9
-from github_client.models.pull_request_auto_merge import PullRequestAutoMerge
-from github_client.models.pull_request_auto_merge1 import PullRequestAutoMerge1
-from github_client.models.pull_request_base import PullRequestBase
-from github_client.models.pull_request_head import PullRequestHead
-from github_client.models.pull_request_labels_inner import PullRequestLabelsInner
-from github_client.models.pull_request_merge_result import PullRequestMergeResult
-from github_client.models.pull_request_minimal import PullRequestMinimal
-from github_client.models.pull_request_minimal_head import PullRequestMinimalHead
-from github_client.models.pull_request_minimal_head_repo import PullRequestMinimalHeadRepo
-from github_client.models.pull_request_requested_reviewers_inner import PullRequestRequestedReviewersInner
-from github_client.models.pull_request_review import PullRequestReview
-from github_client.models.pull_request_review_comment import PullRequestReviewComment
-from github_client.models.pull_request_review_comment1 import PullRequestReviewComment1
-from github_client.models.pull_request_review_comment2 import PullRequestReviewComment2
-from github_client.models.pull_request_review_comment_links import PullRequestReviewCommentLinks
-from github_client.models.pull_request_review_comment_links_html import PullRequestReviewCommentLinksHtml
-from github_client.models.pull_request_review_comment_links_pull_request import PullRequestReviewCommentLinksPullRequest
-from github_client.models.pull_request_review_comment_links_self import PullRequestReviewCommentLinksSelf
-from github_client.models.pull_request_review_request import PullRequestReviewRequest
-from github_client.models.pull_request_simple import PullRequestSimple
-from github_client.models.pull_request_simple_head import PullRequestSimpleHead
-from github_client.models.pull_request_simple_labels_inner import PullRequestSimpleLabelsInner
-from github_client.models.pull_request_simple_links import PullRequestSimpleLinks
-from github_client.models.pull_request_webhook import PullRequestWebhook
-from github_client.models.pulls_create_reply_for_review_comment_request import PullsCreateReplyForReviewCommentRequest
-from github_client.models.pulls_create_request import PullsCreateRequest
-from github_client.models.pulls_create_review_comment_request import PullsCreateReviewCommentRequest
-from github_client.models.pulls_create_review_request import PullsCreateReviewRequest
-from github_client.models.pulls_create_review_request_comments_inner import PullsCreateReviewRequestCommentsInner
-from github_client.models.pulls_dismiss_review_request import PullsDismissReviewRequest
-from github_client.models.pulls_merge_request import PullsMergeRequest
-from github_client.models.pulls_remove_requested_reviewers_request import PullsRemoveRequestedReviewersRequest
-from github_client.models.pulls_request_reviewers_request import PullsRequestReviewersRequest
-from github_client.models.pulls_submit_review_request import PullsSubmitReviewRequest
-from github_client.models.pulls_update_branch_request import PullsUpdateBranchRequest
-from github_client.models.pulls_update_request import PullsUpdateRequest
-from github_client.models.pulls_update_review_comment_request import PullsUpdateReviewCommentRequest
-from github_client.models.pulls_update_review_request import PullsUpdateReviewRequest
-from github_client.models.rate_limit import RateLimit
-from github_client.models.rate_limit_overview import RateLimitOverview
-from github_client.models.rate_limit_overview_resources import RateLimitOverviewResources
-from github_client.models.reaction import Reaction
-from github_client.models.reaction_rollup import ReactionRollup
-from github_client.models.reactions import Reactions
-from github_client.models.reactions_create_for_commit_comment_request import ReactionsCreateForCommitCommentRequest
-from github_client.models.reactions_create_for_issue_comment_request import ReactionsCreateForIssueCommentRequest
-from github_client.models.reactions_create_for_issue_request import ReactionsCreateForIssueRequest
-from github_client.models.reactions_create_for_pull_request_review_comment_request import ReactionsCreateForPullRequestReviewCommentRequest
-from github_client.models.reactions_create_for_release_request import ReactionsCreateForReleaseRequest
-from github_client.models.reactions_create_for_team_discussion_comment_in_org_request import ReactionsCreateForTeamDiscussionCommentInOrgRequest
-from github_client.models.reactions_create_for_team_discussion_in_org_request import ReactionsCreateForTeamDiscussionInOrgRequest
-from github_client.models.referenced_workflow import ReferencedWorkflow
-from github_client.models.referrer_traffic import ReferrerTraffic
-from github_client.models.release import Release
-from github_client.models.release_asset import ReleaseAsset
-from github_client.models.release_asset1 import ReleaseAsset1
-from github_client.models.release_notes_content import ReleaseNotesContent
-from github_client.models.removed_from_project_issue_event import RemovedFromProjectIssueEvent
-from github_client.models.renamed_issue_event import RenamedIssueEvent
-from github_client.models.renamed_issue_event_rename import RenamedIssueEventRename
-from github_client.models.repo_codespaces_secret import RepoCodespacesSecret
-from github_client.models.repo_ref import RepoRef
-from github_client.models.repo_search_result_item import RepoSearchResultItem
-from github_client.models.repos_add_collaborator_request import ReposAddCollaboratorRequest
-from github_client.models.repos_add_team_access_restrictions_request import ReposAddTeamAccessRestrictionsRequest
-from github_client.models.repos_add_team_access_restrictions_request_one_of import ReposAddTeamAccessRestrictionsRequestOneOf
-from github_client.models.repos_check_private_vulnerability_reporting200_response import ReposCheckPrivateVulnerabilityReporting200Response
-from github_client.models.repos_create_attestation201_response import ReposCreateAttestation201Response
-from github_client.models.repos_create_attestation_request import ReposCreateAttestationRequest
-from github_client.models.repos_create_autolink_request import ReposCreateAutolinkRequest
-from github_client.models.repos_create_commit_comment_request import ReposCreateCommitCommentRequest
-from github_client.models.repos_create_commit_status_request import ReposCreateCommitStatusRequest
-from github_client.models.repos_create_deploy_key_request import ReposCreateDeployKeyRequest
-from github_client.models.repos_create_deployment_protection_rule_request import ReposCreateDeploymentProtectionRuleRequest
-from github_client.models.repos_create_deployment_request import ReposCreateDeploymentRequest
-from github_client.models.repos_create_deployment_request_payload import ReposCreateDeploymentRequestPayload
-from github_client.models.repos_create_deployment_status_request import ReposCreateDeploymentStatusRequest
-from github_client.models.repos_create_dispatch_event_request import ReposCreateDispatchEventRequest
-from github_client.models.repos_create_for_authenticated_user_request import ReposCreateForAuthenticatedUserRequest
-from github_client.models.repos_create_fork_request import ReposCreateForkRequest
-from github_client.models.repos_create_in_org_request import ReposCreateInOrgRequest
-from github_client.models.repos_create_or_update_environment_request import ReposCreateOrUpdateEnvironmentRequest
-from github_client.models.repos_create_or_update_environment_request_reviewers_inner import ReposCreateOrUpdateEnvironmentRequestReviewersInner
-from github_client.models.repos_create_or_update_file_contents409_response import ReposCreateOrUpdateFileContents409Response
-from github_client.models.repos_create_or_update_file_contents_request import ReposCreateOrUpdateFileContentsRequest
-from github_client.models.repos_create_or_update_file_contents_request_author import ReposCreateOrUpdateFileContentsRequestAuthor
-from github_client.models.repos_create_or_update_file_contents_request_committer import ReposCreateOrUpdateFileContentsRequestCommitter
-from github_client.models.repos_create_org_ruleset_request import ReposCreateOrgRulesetRequest
-from github_client.models.repos_create_pages_deployment_request import ReposCreatePagesDeploymentRequest
-from github_client.models.repos_create_pages_site_request import ReposCreatePagesSiteRequest
-from github_client.models.repos_create_pages_site_request_source import ReposCreatePagesSiteRequestSource
-from github_client.models.repos_create_release_request import ReposCreateReleaseRequest
-from github_client.models.repos_create_repo_ruleset_request import ReposCreateRepoRulesetRequest
-from github_client.models.repos_create_tag_protection_request import ReposCreateTagProtectionRequest
-from github_client.models.repos_create_using_template_request import ReposCreateUsingTemplateRequest
-from github_client.models.repos_create_webhook_request import ReposCreateWebhookRequest
-from github_client.models.repos_create_webhook_request_config import ReposCreateWebhookRequestConfig
-from github_client.models.repos_custom_properties_for_repos_create_or_update_repository_values_request import ReposCustomPropertiesForReposCreateOrUpdateRepositoryValuesRequest
-from github_client.models.repos_delete_file_request import ReposDeleteFileRequest
-from github_client.models.repos_delete_file_request_author import ReposDeleteFileRequestAuthor
-from github_client.models.repos_delete_file_request_committer import ReposDeleteFileRequestCommitter
-from github_client.models.repos_generate_release_notes_request import ReposGenerateReleaseNotesRequest
-from github_client.models.repos_get_all_deployment_protection_rules200_response import ReposGetAllDeploymentProtectionRules200Response
-from github_client.models.repos_get_all_environments200_response import ReposGetAllEnvironments200Response
-from github_client.models.repos_get_content200_response import ReposGetContent200Response
-from github_client.models.repos_list_custom_deployment_rule_integrations200_response import ReposListCustomDeploymentRuleIntegrations200Response
-from github_client.models.repos_list_deployment_branch_policies200_response import ReposListDeploymentBranchPolicies200Response
-from github_client.models.repos_merge_request import ReposMergeRequest
-from github_client.models.repos_merge_upstream_request import ReposMergeUpstreamRequest
-from github_client.models.repos_rename_branch_request import ReposRenameBranchRequest
-from github_client.models.repos_replace_all_topics_request import ReposReplaceAllTopicsRequest
-from github_client.models.repos_set_app_access_restrictions_request import ReposSetAppAccessRestrictionsRequest
-from github_client.models.repos_set_status_check_contexts_request import ReposSetStatusCheckContextsRequest
-from github_client.models.repos_set_status_check_contexts_request_one_of import ReposSetStatusCheckContextsRequestOneOf
-from github_client.models.repos_set_team_access_restrictions_request import ReposSetTeamAccessRestrictionsRequest
-from github_client.models.repos_set_team_access_restrictions_request_one_of import ReposSetTeamAccessRestrictionsRequestOneOf
-from github_client.models.repos_set_user_access_restrictions_request import ReposSetUserAccessRestrictionsRequest
-from github_client.models.repos_transfer_request import ReposTransferRequest
-from github_client.models.repos_update_branch_protection_request import ReposUpdateBranchProtectionRequest
-from github_client.models.repos_update_branch_protection_request_required_pull_request_reviews import ReposUpdateBranchProtectionRequestRequiredPullRequestReviews
-from github_client.models.repos_update_branch_protection_request_required_pull_request_reviews_bypass_pull_request_allowances import ReposUpdateBranchProtectionRequestRequiredPullRequestReviewsBypassPullRequestAllowances
-from github_client.models.repos_update_branch_protection_request_required_pull_request_reviews_dismissal_restrictions import ReposUpdateBranchProtectionRequestRequiredPullRequestReviewsDismissalRestrictions
-from github_client.models.repos_update_branch_protection_request_required_status_checks import ReposUpdateBranchProtectionRequestRequiredStatusChecks
-from github_client.models.repos_update_branch_protection_request_required_status_checks_checks_inner import ReposUpdateBranchProtectionRequestRequiredStatusChecksChecksInner
-from github_client.models.repos_update_branch_protection_request_restrictions import ReposUpdateBranchProtectionRequestRestrictions
-from github_client.models.repos_update_commit_comment_request import ReposUpdateCommitCommentRequest
-from github_client.models.repos_update_information_about_pages_site_request import ReposUpdateInformationAboutPagesSiteRequest
-from github_client.models.repos_update_information_about_pages_site_request_source import ReposUpdateInformationAboutPagesSiteRequestSource
-from github_client.models.repos_update_information_about_pages_site_request_source_any_of import ReposUpdateInformationAboutPagesSiteRequestSourceAnyOf
-from github_client.models.repos_update_invitation_request import ReposUpdateInvitationRequest
-from github_client.models.repos_update_org_ruleset_request import ReposUpdateOrgRulesetRequest
-from github_client.models.repos_update_pull_request_review_protection_request import ReposUpdatePullRequestReviewProtectionRequest
-from github_client.models.repos_update_release_asset_request import ReposUpdateReleaseAssetRequest
-from github_client.models.repos_update_release_request import ReposUpdateReleaseRequest
-from github_client.models.repos_update_repo_ruleset_request import ReposUpdateRepoRulesetRequest
-from github_client.models.repos_update_request import ReposUpdateRequest
-from github_client.models.repos_update_request_security_and_analysis import ReposUpdateRequestSecurityAndAnalysis
-from github_client.models.repos_update_request_security_and_analysis_advanced_security import ReposUpdateRequestSecurityAndAnalysisAdvancedSecurity
-from github_client.models.repos_update_request_security_and_analysis_code_security import ReposUpdateRequestSecurityAndAnalysisCodeSecurity
-from github_client.models.repos_update_request_security_and_analysis_secret_scanning import ReposUpdateRequestSecurityAndAnalysisSecretScanning
-from github_client.models.repos_update_request_security_and_analysis_secret_scanning_ai_detection import ReposUpdateRequestSecurityAndAnalysisSecretScanningAiDetection
-from github_client.models.repos_update_request_security_and_analysis_secret_scanning_non_provider_patterns import ReposUpdateRequestSecurityAndAnalysisSecretScanningNonProviderPatterns
-from github_client.models.repos_update_request_security_and_analysis_secret_scanning_push_protection import ReposUpdateRequestSecurityAndAnalysisSecretScanningPushProtection
-from github_client.models.repos_update_status_check_protection_request import ReposUpdateStatusCheckProtectionRequest
-from github_client.models.repos_update_webhook_config_for_repo_request import ReposUpdateWebhookConfigForRepoRequest
-from github_client.models.repos_update_webhook_request import ReposUpdateWebhookRequest
-from github_client.models.repository import Repository
-from github_client.models.repository1 import Repository1
-from github_client.models.repository10 import Repository10
-from github_client.models.repository11 import Repository11
-from github_client.models.repository12 import Repository12
-from github_client.models.repository13 import Repository13
-from github_client.models.repository14 import Repository14
-from github_client.models.repository15 import Repository15
-from github_client.models.repository2 import Repository2
-from github_client.models.repository3 import Repository3
-from github_client.models.repository4 import Repository4
-from github_client.models.repository5 import Repository5
-from github_client.models.repository6 import Repository6
-from github_client.models.repository7 import Repository7
-from github_client.models.repository8 import Repository8
-from github_client.models.repository9 import Repository9
-from github_client.models.repository_advisory import RepositoryAdvisory
-from github_client.models.repository_advisory_create import RepositoryAdvisoryCreate
-from github_client.models.repository_advisory_create_credits_inner import RepositoryAdvisoryCreateCreditsInner
-from github_client.models.repository_advisory_create_vulnerabilities_inner import RepositoryAdvisoryCreateVulnerabilitiesInner
-from github_client.models.repository_advisory_create_vulnerabilities_inner_package import RepositoryAdvisoryCreateVulnerabilitiesInnerPackage
-from github_client.models.repository_advisory_credit import RepositoryAdvisoryCredit
-from github_client.models.repository_advisory_credits_inner import RepositoryAdvisoryCreditsInner
-from github_client.models.repository_advisory_submission import RepositoryAdvisorySubmission
-from github_client.models.repository_advisory_update import RepositoryAdvisoryUpdate
-from github_client.models.repository_advisory_vulnerability import RepositoryAdvisoryVulnerability
-from github_client.models.repository_code_search_index_status import RepositoryCodeSearchIndexStatus
-from github_client.models.repository_collaborator_permission import RepositoryCollaboratorPermission
-from github_client.models.repository_created_at import RepositoryCreatedAt
-from github_client.models.repository_id_and_ref_name import RepositoryIdAndRefName
-from github_client.models.repository_invitation import RepositoryInvitation
-from github_client.models.repository_lite import RepositoryLite
-from github_client.models.repository_lite1 import RepositoryLite1
-from github_client.models.repository_lite2 import RepositoryLite2
-from github_client.models.repository_name_and_ref_name import RepositoryNameAndRefName
-from github_client.models.repository_permissions import RepositoryPermissions
-from github_client.models.repository_property_and_ref_name import RepositoryPropertyAndRefName
-from github_client.models.repository_pushed_at import RepositoryPushedAt
-from github_client.models.repository_rule import RepositoryRule
-from github_client.models.repository_rule_branch_name_pattern import RepositoryRuleBranchNamePattern
-from github_client.models.repository_rule_code_scanning import RepositoryRuleCodeScanning
-from github_client.models.repository_rule_code_scanning_parameters import RepositoryRuleCodeScanningParameters
-from github_client.models.repository_rule_commit_author_email_pattern import RepositoryRuleCommitAuthorEmailPattern
-from github_client.models.repository_rule_commit_message_pattern import RepositoryRuleCommitMessagePattern
-from github_client.models.repository_rule_commit_message_pattern_parameters import RepositoryRuleCommitMessagePatternParameters
-from github_client.models.repository_rule_committer_email_pattern import RepositoryRuleCommitterEmailPattern
-from github_client.models.repository_rule_copilot_code_review import RepositoryRuleCopilotCodeReview
-from github_client.models.repository_rule_copilot_code_review_parameters import RepositoryRuleCopilotCodeReviewParameters
-from github_client.models.repository_rule_creation import RepositoryRuleCreation
-from github_client.models.repository_rule_deletion import RepositoryRuleDeletion
-from github_client.models.repository_rule_detailed import RepositoryRuleDetailed
-from github_client.models.repository_rule_detailed_one_of import RepositoryRuleDetailedOneOf
-from github_client.models.repository_rule_detailed_one_of1 import RepositoryRuleDetailedOneOf1
-from github_client.models.repository_rule_detailed_one_of10 import RepositoryRuleDetailedOneOf10
-from github_client.models.repository_rule_detailed_one_of11 import RepositoryRuleDetailedOneOf11
-from github_client.models.repository_rule_detailed_one_of12 import RepositoryRuleDetailedOneOf12
-from github_client.models.repository_rule_detailed_one_of13 import RepositoryRuleDetailedOneOf13
-from github_client.models.repository_rule_detailed_one_of14 import RepositoryRuleDetailedOneOf14
-from github_client.models.repository_rule_detailed_one_of15 import RepositoryRuleDetailedOneOf15
-from github_client.models.repository_rule_detailed_one_of16 import RepositoryRuleDetailedOneOf16
-from github_client.models.repository_rule_detailed_one_of17 import RepositoryRuleDetailedOneOf17
-from github_client.models.repository_rule_detailed_one_of18 import RepositoryRuleDetailedOneOf18
-from github_client.models.repository_rule_detailed_one_of19 import RepositoryRuleDetailedOneOf19
-from github_client.models.repository_rule_detailed_one_of2 import RepositoryRuleDetailedOneOf2
-from github_client.models.repository_rule_detailed_one_of20 import RepositoryRuleDetailedOneOf20
-from github_client.models.repository_rule_detailed_one_of21 import RepositoryRuleDetailedOneOf21
-from github_client.models.repository_rule_detailed_one_of3 import RepositoryRuleDetailedOneOf3
-from github_client.models.repository_rule_detailed_one_of4 import RepositoryRuleDetailedOneOf4
-from github_client.models.repository_rule_detailed_one_of5 import RepositoryRuleDetailedOneOf5
-from github_client.models.repository_rule_detailed_one_of6 import RepositoryRuleDetailedOneOf6
-from github_client.models.repository_rule_detailed_one_of7 import RepositoryRuleDetailedOneOf7
-from github_client.models.repository_rule_detailed_one_of8 import RepositoryRuleDetailedOneOf8
-from github_client.models.repository_rule_detailed_one_of9 import RepositoryRuleDetailedOneOf9
-from github_client.models.repository_rule_enforcement import RepositoryRuleEnforcement
-from github_client.models.repository_rule_file_extension_restriction import RepositoryRuleFileExtensionRestriction
-from github_client.models.repository_rule_file_extension_restriction_parameters import RepositoryRuleFileExtensionRestrictionParameters
-from github_client.models.repository_rule_file_path_restriction import RepositoryRuleFilePathRestriction
-from github_client.models.repository_rule_file_path_restriction_parameters import RepositoryRuleFilePathRestrictionParameters
-from github_client.models.repository_rule_max_file_path_length import RepositoryRuleMaxFilePathLength
-from github_client.models.repository_rule_max_file_path_length_parameters import RepositoryRuleMaxFilePathLengthParameters
-from github_client.models.repository_rule_max_file_size import RepositoryRuleMaxFileSize
-from github_client.models.repository_rule_max_file_size_parameters import RepositoryRuleMaxFileSizeParameters
-from github_client.models.repository_rule_merge_queue import RepositoryRuleMergeQueue
-from github_client.models.repository_rule_merge_queue_parameters import RepositoryRuleMergeQueueParameters
-from github_client.models.repository_rule_non_fast_forward import RepositoryRuleNonFastForward
-from github_client.models.repository_rule_params_code_scanning_tool import RepositoryRuleParamsCodeScanningTool
-from github_client.models.repository_rule_params_required_reviewer_configuration import RepositoryRuleParamsRequiredReviewerConfiguration
-from github_client.models.repository_rule_params_restricted_commits import RepositoryRuleParamsRestrictedCommits
-from github_client.models.repository_rule_params_reviewer import RepositoryRuleParamsReviewer
-from github_client.models.repository_rule_params_status_check_configuration import RepositoryRuleParamsStatusCheckConfiguration
-from github_client.models.repository_rule_params_workflow_file_reference import RepositoryRuleParamsWorkflowFileReference
-from github_client.models.repository_rule_pull_request import RepositoryRulePullRequest
-from github_client.models.repository_rule_pull_request_parameters import RepositoryRulePullRequestParameters
-from github_client.models.repository_rule_required_deployments import RepositoryRuleRequiredDeployments
-from github_client.models.repository_rule_required_deployments_parameters import RepositoryRuleRequiredDeploymentsParameters
-from github_client.models.repository_rule_required_linear_history import RepositoryRuleRequiredLinearHistory
-from github_client.models.repository_rule_required_signatures import RepositoryRuleRequiredSignatures
-from github_client.models.repository_rule_required_status_checks import RepositoryRuleRequiredStatusChecks
-from github_client.models.repository_rule_required_status_checks_parameters import RepositoryRuleRequiredStatusChecksParameters
-from github_client.models.repository_rule_ruleset_info import RepositoryRuleRulesetInfo
-from github_client.models.repository_rule_tag_name_pattern import RepositoryRuleTagNamePattern
-from github_client.models.repository_rule_update import RepositoryRuleUpdate
-from github_client.models.repository_rule_update_parameters import RepositoryRuleUpdateParameters
-from github_client.models.repository_rule_violation_error import RepositoryRuleViolationError
-from github_client.models.repository_rule_violation_error_metadata import RepositoryRuleViolationErrorMetadata
-from github_client.models.repository_rule_violation_error_metadata_secret_scanning import RepositoryRuleViolationErrorMetadataSecretScanning
-from github_client.models.repository_rule_violation_error_metadata_secret_scanning_bypass_placeholders_inner import RepositoryRuleViolationErrorMetadataSecretScanningBypassPlaceholdersInner
-from github_client.models.repository_rule_workflows import RepositoryRuleWorkflows
-from github_client.models.repository_rule_workflows_parameters import RepositoryRuleWorkflowsParameters
-from github_client.models.repository_ruleset import RepositoryRuleset
-from github_client.models.repository_ruleset_bypass_actor import RepositoryRulesetBypassActor
-from github_client.models.repository_ruleset_conditions import RepositoryRulesetConditions
-from github_client.models.repository_ruleset_conditions_ref_name import RepositoryRulesetConditionsRefName
-from github_client.models.repository_ruleset_conditions_repository_id_target import RepositoryRulesetConditionsRepositoryIdTarget
-from github_client.models.repository_ruleset_conditions_repository_id_target_repository_id import RepositoryRulesetConditionsRepositoryIdTargetRepositoryId
-from github_client.models.repository_ruleset_conditions_repository_name_target import RepositoryRulesetConditionsRepositoryNameTarget
-from github_client.models.repository_ruleset_conditions_repository_name_target_repository_name import RepositoryRulesetConditionsRepositoryNameTargetRepositoryName
-from github_client.models.repository_ruleset_conditions_repository_property_spec import RepositoryRulesetConditionsRepositoryPropertySpec
-from github_client.models.repository_ruleset_conditions_repository_property_target import RepositoryRulesetConditionsRepositoryPropertyTarget
-from github_client.models.repository_ruleset_conditions_repository_property_target_repository_property import RepositoryRulesetConditionsRepositoryPropertyTargetRepositoryProperty
-from github_client.models.repository_ruleset_links import RepositoryRulesetLinks
-from github_client.models.repository_ruleset_links_html import RepositoryRulesetLinksHtml
-from github_client.models.repository_ruleset_links_self import RepositoryRulesetLinksSelf
-from github_client.models.repository_subscription import RepositorySubscription
-from github_client.models.repository_vulnerability_alert_alert import RepositoryVulnerabilityAlertAlert
-from github_client.models.repository_vulnerability_alert_alert1 import RepositoryVulnerabilityAlertAlert1
-from github_client.models.repository_webhooks import RepositoryWebhooks
-from github_client.models.repository_webhooks_template_repository import RepositoryWebhooksTemplateRepository
-from github_client.models.repository_webhooks_template_repository_owner import RepositoryWebhooksTemplateRepositoryOwner
-from github_client.models.review_comment import ReviewComment
-from github_client.models.review_comment_links import ReviewCommentLinks
-from github_client.models.review_custom_gates_comment_required import ReviewCustomGatesCommentRequired
-from github_client.models.review_custom_gates_state_required import ReviewCustomGatesStateRequired
-from github_client.models.review_dismissed_issue_event import ReviewDismissedIssueEvent
-from github_client.models.review_dismissed_issue_event_dismissed_review import ReviewDismissedIssueEventDismissedReview
-from github_client.models.review_request_removed_issue_event import ReviewRequestRemovedIssueEvent
-from github_client.models.review_requested_issue_event import ReviewRequestedIssueEvent
-from github_client.models.root import Root
-from github_client.models.rule_suite import RuleSuite
-from github_client.models.rule_suite_rule_evaluations_inner import RuleSuiteRuleEvaluationsInner
-from github_client.models.rule_suite_rule_evaluations_inner_rule_source import RuleSuiteRuleEvaluationsInnerRuleSource
-from github_client.models.rule_suites_inner import RuleSuitesInner
-from github_client.models.ruleset_version import RulesetVersion
-from github_client.models.ruleset_version_actor import RulesetVersionActor
-from github_client.models.ruleset_version_with_state import RulesetVersionWithState
-from github_client.models.runner import Runner
-from github_client.models.runner_application import RunnerApplication
-from github_client.models.runner_groups_org import RunnerGroupsOrg
-from github_client.models.runner_label import RunnerLabel
-from github_client.models.scim_error import ScimError
-from github_client.models.search_code200_response import SearchCode200Response
-from github_client.models.search_commits200_response import SearchCommits200Response
-from github_client.models.search_issues_and_pull_requests200_response import SearchIssuesAndPullRequests200Response
-from github_client.models.search_labels200_response import SearchLabels200Response
-from github_client.models.search_repos200_response import SearchRepos200Response
-from github_client.models.search_result_text_matches_inner import SearchResultTextMatchesInner
-from github_client.models.search_result_text_matches_inner_matches_inner import SearchResultTextMatchesInnerMatchesInner
-from github_client.models.search_topics200_response import SearchTopics200Response
-from github_client.models.search_users200_response import SearchUsers200Response
-from github_client.models.secret_scanning_alert import SecretScanningAlert
-from github_client.models.secret_scanning_alert_resolution import SecretScanningAlertResolution
-from github_client.models.secret_scanning_alert_resolution_webhook import SecretScanningAlertResolutionWebhook
-from github_client.models.secret_scanning_alert_state import SecretScanningAlertState
-from github_client.models.secret_scanning_alert_webhook import SecretScanningAlertWebhook
-from github_client.models.secret_scanning_create_push_protection_bypass_request import SecretScanningCreatePushProtectionBypassRequest
-from github_client.models.secret_scanning_location import SecretScanningLocation
-from github_client.models.secret_scanning_location_commit import SecretScanningLocationCommit
-from github_client.models.secret_scanning_location_details import SecretScanningLocationDetails
-from github_client.models.secret_scanning_location_discussion_body import SecretScanningLocationDiscussionBody
-from github_client.models.secret_scanning_location_discussion_comment import SecretScanningLocationDiscussionComment
-from github_client.models.secret_scanning_location_discussion_title import SecretScanningLocationDiscussionTitle
-from github_client.models.secret_scanning_location_issue_body import SecretScanningLocationIssueBody
-from github_client.models.secret_scanning_location_issue_comment import SecretScanningLocationIssueComment
-from github_client.models.secret_scanning_location_issue_title import SecretScanningLocationIssueTitle
-from github_client.models.secret_scanning_location_pull_request_body import SecretScanningLocationPullRequestBody
-from github_client.models.secret_scanning_location_pull_request_comment import SecretScanningLocationPullRequestComment
-from github_client.models.secret_scanning_location_pull_request_review import SecretScanningLocationPullRequestReview
-from github_client.models.secret_scanning_location_pull_request_review_comment import SecretScanningLocationPullRequestReviewComment
-from github_client.models.secret_scanning_location_pull_request_title import SecretScanningLocationPullRequestTitle
-from github_client.models.secret_scanning_location_wiki_commit import SecretScanningLocationWikiCommit
-from github_client.models.secret_scanning_pattern_configuration import SecretScanningPatternConfiguration
-from github_client.models.secret_scanning_pattern_override import SecretScanningPatternOverride
-from github_client.models.secret_scanning_push_protection_bypass import SecretScanningPushProtectionBypass
-from github_client.models.secret_scanning_push_protection_bypass_reason import SecretScanningPushProtectionBypassReason
-from github_client.models.secret_scanning_scan import SecretScanningScan
-from github_client.models.secret_scanning_scan_history import SecretScanningScanHistory
-from github_client.models.secret_scanning_scan_history_custom_pattern_backfill_scans_inner import SecretScanningScanHistoryCustomPatternBackfillScansInner
-from github_client.models.secret_scanning_update_alert_request import SecretScanningUpdateAlertRequest
-from github_client.models.secret_scanning_update_org_pattern_configs200_response import SecretScanningUpdateOrgPatternConfigs200Response
-from github_client.models.secret_scanning_update_org_pattern_configs_request import SecretScanningUpdateOrgPatternConfigsRequest
-from github_client.models.secret_scanning_update_org_pattern_configs_request_custom_pattern_settings_inner import SecretScanningUpdateOrgPatternConfigsRequestCustomPatternSettingsInner
-from github_client.models.secret_scanning_update_org_pattern_configs_request_provider_pattern_settings_inner import SecretScanningUpdateOrgPatternConfigsRequestProviderPatternSettingsInner
-from github_client.models.security_advisories_list_global_advisories_affects_parameter import SecurityAdvisoriesListGlobalAdvisoriesAffectsParameter
-from github_client.models.security_advisories_list_global_advisories_cwes_parameter import SecurityAdvisoriesListGlobalAdvisoriesCwesParameter
-from github_client.models.security_advisory_credit_types import SecurityAdvisoryCreditTypes
-from github_client.models.security_advisory_ecosystems import SecurityAdvisoryEcosystems
-from github_client.models.security_advisory_epss import SecurityAdvisoryEpss
-from github_client.models.security_and_analysis import SecurityAndAnalysis
-from github_client.models.security_and_analysis_advanced_security import SecurityAndAnalysisAdvancedSecurity
-from github_client.models.security_and_analysis_code_security import SecurityAndAnalysisCodeSecurity
-from github_client.models.security_and_analysis_dependabot_security_updates import SecurityAndAnalysisDependabotSecurityUpdates
-from github_client.models.selected_actions import SelectedActions
-from github_client.models.self_hosted_runners_settings import SelfHostedRunnersSettings
-from github_client.models.short_blob import ShortBlob
-from github_client.models.short_branch import ShortBranch
-from github_client.models.short_branch_commit import ShortBranchCommit
-from github_client.models.simple_check_suite import SimpleCheckSuite
-from github_client.models.simple_classroom import SimpleClassroom
-from github_client.models.simple_classroom_assignment import SimpleClassroomAssignment
-from github_client.models.simple_classroom_organization import SimpleClassroomOrganization
-from github_client.models.simple_classroom_repository import SimpleClassroomRepository
-from github_client.models.simple_classroom_user import SimpleClassroomUser
-from github_client.models.simple_commit import SimpleCommit
-from github_client.models.simple_commit_status import SimpleCommitStatus
-from github_client.models.simple_installation import SimpleInstallation
-from github_client.models.simple_pull_request import SimplePullRequest
-from github_client.models.simple_pull_request1 import SimplePullRequest1
-from github_client.models.simple_pull_request1_base import SimplePullRequest1Base
-from github_client.models.simple_pull_request1_head import SimplePullRequest1Head
-from github_client.models.simple_pull_request2 import SimplePullRequest2
-from github_client.models.simple_pull_request3 import SimplePullRequest3
-from github_client.models.simple_pull_request3_base import SimplePullRequest3Base
-from github_client.models.simple_pull_request3_head import SimplePullRequest3Head
-from github_client.models.simple_pull_request4 import SimplePullRequest4
-from github_client.models.simple_repository import SimpleRepository
-from github_client.models.simple_user import SimpleUser
-from github_client.models.snapshot import Snapshot
-from github_client.models.snapshot_detector import SnapshotDetector
-from github_client.models.snapshot_job import SnapshotJob
-from github_client.models.social_account import SocialAccount
-from github_client.models.sponsorship_tier import SponsorshipTier
-from github_client.models.ssh_signing_key import SshSigningKey
-from github_client.models.stargazer import Stargazer
-from github_client.models.starred_repository import StarredRepository
-from github_client.models.state_change_issue_event import StateChangeIssueEvent
-from github_client.models.static_public_ip_limits_for_git_hub_hosted_hosted_runners import StaticPublicIPLimitsForGitHubHostedHostedRunners
-from github_client.models.status import Status
-from github_client.models.status_check_policy import StatusCheckPolicy
-from github_client.models.status_check_policy_checks_inner import StatusCheckPolicyChecksInner
-from github_client.models.sub_issues_summary import SubIssuesSummary
-from github_client.models.tag import Tag
-from github_client.models.tag_protection import TagProtection
-from github_client.models.team import Team
-from github_client.models.team1 import Team1
-from github_client.models.team_discussion import TeamDiscussion
-from github_client.models.team_discussion_comment import TeamDiscussionComment
-from github_client.models.team_full import TeamFull
-from github_client.models.team_membership import TeamMembership
-from github_client.models.team_organization import TeamOrganization
-from github_client.models.team_parent import TeamParent
-from github_client.models.team_permissions import TeamPermissions
-from github_client.models.team_project import TeamProject
-from github_client.models.team_project_permissions import TeamProjectPermissions
-from github_client.models.team_repository import TeamRepository
-from github_client.models.team_role_assignment import TeamRoleAssignment
-from github_client.models.team_simple import TeamSimple
-from github_client.models.teams_add_or_update_membership_for_user_in_org_request import TeamsAddOrUpdateMembershipForUserInOrgRequest
-from github_client.models.teams_add_or_update_project_permissions_in_org_request import TeamsAddOrUpdateProjectPermissionsInOrgRequest
-from github_client.models.teams_add_or_update_project_permissions_legacy_request import TeamsAddOrUpdateProjectPermissionsLegacyRequest
-from github_client.models.teams_add_or_update_repo_permissions_in_org_request import TeamsAddOrUpdateRepoPermissionsInOrgRequest
-from github_client.models.teams_add_or_update_repo_permissions_legacy_request import TeamsAddOrUpdateRepoPermissionsLegacyRequest
-from github_client.models.teams_create_discussion_comment_in_org_request import TeamsCreateDiscussionCommentInOrgRequest
-from github_client.models.teams_create_discussion_in_org_request import TeamsCreateDiscussionInOrgRequest
-from github_client.models.teams_create_request import TeamsCreateRequest
-from github_client.models.teams_update_discussion_in_org_request import TeamsUpdateDiscussionInOrgRequest
-from github_client.models.teams_update_in_org_request import TeamsUpdateInOrgRequest
-from github_client.models.teams_update_legacy_request import TeamsUpdateLegacyRequest
-from github_client.models.thread import Thread
-from github_client.models.thread_subject import ThreadSubject
-from github_client.models.thread_subscription import ThreadSubscription
-from github_client.models.timeline_assigned_issue_event import TimelineAssignedIssueEvent
-from github_client.models.timeline_comment_event import TimelineCommentEvent
-from github_client.models.timeline_commit_commented_event import TimelineCommitCommentedEvent
-from github_client.models.timeline_committed_event import TimelineCommittedEvent
-from github_client.models.timeline_cross_referenced_event import TimelineCrossReferencedEvent
-from github_client.models.timeline_cross_referenced_event_source import TimelineCrossReferencedEventSource
-from github_client.models.timeline_issue_events import TimelineIssueEvents
-from github_client.models.timeline_line_commented_event import TimelineLineCommentedEvent
-from github_client.models.timeline_reviewed_event import TimelineReviewedEvent
-from github_client.models.timeline_reviewed_event_links import TimelineReviewedEventLinks
-from github_client.models.timeline_reviewed_event_links_html import TimelineReviewedEventLinksHtml
-from github_client.models.timeline_unassigned_issue_event import TimelineUnassignedIssueEvent
-from github_client.models.topic import Topic
-from github_client.models.topic_search_result_item import TopicSearchResultItem
-from github_client.models.topic_search_result_item_related_inner import TopicSearchResultItemRelatedInner
-from github_client.models.topic_search_result_item_related_inner_topic_relation import TopicSearchResultItemRelatedInnerTopicRelation
-from github_client.models.traffic import Traffic
-from github_client.models.unassigned_issue_event import UnassignedIssueEvent
-from github_client.models.unlabeled_issue_event import UnlabeledIssueEvent
-from github_client.models.user import User
-from github_client.models.user1 import User1
-from github_client.models.user2 import User2
-from github_client.models.user3 import User3
-from github_client.models.user4 import User4
-from github_client.models.user5 import User5
-from github_client.models.user6 import User6
-from github_client.models.user7 import User7
-from github_client.models.user8 import User8
-from github_client.models.user_marketplace_purchase import UserMarketplacePurchase
-from github_client.models.user_role_assignment import UserRoleAssignment
-from github_client.models.user_search_result_item import UserSearchResultItem
-from github_client.models.users_add_email_for_authenticated_user_request import UsersAddEmailForAuthenticatedUserRequest
-from github_client.models.users_add_email_for_authenticated_user_request_one_of import UsersAddEmailForAuthenticatedUserRequestOneOf
-from github_client.models.users_add_social_account_for_authenticated_user_request import UsersAddSocialAccountForAuthenticatedUserRequest
-from github_client.models.users_create_gpg_key_for_authenticated_user_request import UsersCreateGpgKeyForAuthenticatedUserRequest
-from github_client.models.users_create_public_ssh_key_for_authenticated_user_request import UsersCreatePublicSshKeyForAuthenticatedUserRequest
-from github_client.models.users_create_ssh_signing_key_for_authenticated_user_request import UsersCreateSshSigningKeyForAuthenticatedUserRequest
-from github_client.models.users_delete_email_for_authenticated_user_request import UsersDeleteEmailForAuthenticatedUserRequest
-from github_client.models.users_delete_email_for_authenticated_user_request_one_of import UsersDeleteEmailForAuthenticatedUserRequestOneOf
-from github_client.models.users_delete_social_account_for_authenticated_user_request import UsersDeleteSocialAccountForAuthenticatedUserRequest
-from github_client.models.users_get_authenticated200_response import UsersGetAuthenticated200Response
-from github_client.models.users_set_primary_email_visibility_for_authenticated_user_request import UsersSetPrimaryEmailVisibilityForAuthenticatedUserRequest
-from github_client.models.users_update_authenticated_request import UsersUpdateAuthenticatedRequest
-from github_client.models.validation_error import ValidationError
-from github_client.models.validation_error_errors_inner import ValidationErrorErrorsInner
-from github_client.models.validation_error_errors_inner_value import ValidationErrorErrorsInnerValue
-from github_client.models.validation_error_simple import ValidationErrorSimple
-from github_client.models.verification import Verification
-from github_client.models.view_traffic import ViewTraffic
-from github_client.models.vulnerability import Vulnerability
-from github_client.models.vulnerability_package import VulnerabilityPackage
-from github_client.models.webhook import Webhook
-from github_client.models.webhook_branch_protection_configuration_disabled import WebhookBranchProtectionConfigurationDisabled
-from github_client.models.webhook_branch_protection_configuration_enabled import WebhookBranchProtectionConfigurationEnabled
-from github_client.models.webhook_branch_protection_rule_created import WebhookBranchProtectionRuleCreated
-from github_client.models.webhook_branch_protection_rule_deleted import WebhookBranchProtectionRuleDeleted
-from github_client.models.webhook_branch_protection_rule_edited import WebhookBranchProtectionRuleEdited
-from github_client.models.webhook_branch_protection_rule_edited_changes import WebhookBranchProtectionRuleEditedChanges
-from github_client.models.webhook_branch_protection_rule_edited_changes_admin_enforced import WebhookBranchProtectionRuleEditedChangesAdminEnforced
-from github_client.models.webhook_branch_protection_rule_edited_changes_authorized_actor_names import WebhookBranchProtectionRuleEditedChangesAuthorizedActorNames
-from github_client.models.webhook_branch_protection_rule_edited_changes_linear_history_requirement_enforcement_level import WebhookBranchProtectionRuleEditedChangesLinearHistoryRequirementEnforcementLevel
-from github_client.models.webhook_check_run_completed import WebhookCheckRunCompleted
-from github_client.models.webhook_check_run_completed_form_encoded import WebhookCheckRunCompletedFormEncoded
-from github_client.models.webhook_check_run_created import WebhookCheckRunCreated
-from github_client.models.webhook_check_run_created_form_encoded import WebhookCheckRunCreatedFormEncoded
-from github_client.models.webhook_check_run_requested_action import WebhookCheckRunRequestedAction
-from github_client.models.webhook_check_run_requested_action_form_encoded import WebhookCheckRunRequestedActionFormEncoded
-from github_client.models.webhook_check_run_requested_action_requested_action import WebhookCheckRunRequestedActionRequestedAction
-from github_client.models.webhook_check_run_rerequested import WebhookCheckRunRerequested
-from github_client.models.webhook_check_run_rerequested_form_encoded import WebhookCheckRunRerequestedFormEncoded
-from github_client.models.webhook_check_suite_completed import WebhookCheckSuiteCompleted
-from github_client.models.webhook_check_suite_completed_check_suite import WebhookCheckSuiteCompletedCheckSuite
-from github_client.models.webhook_check_suite_requested import WebhookCheckSuiteRequested
-from github_client.models.webhook_check_suite_requested_check_suite import WebhookCheckSuiteRequestedCheckSuite
-from github_client.models.webhook_check_suite_rerequested import WebhookCheckSuiteRerequested
-from github_client.models.webhook_check_suite_rerequested_check_suite import WebhookCheckSuiteRerequestedCheckSuite
-from github_client.models.webhook_code_scanning_alert_appeared_in_branch import WebhookCodeScanningAlertAppearedInBranch
-from github_client.models.webhook_code_scanning_alert_appeared_in_branch_alert import WebhookCodeScanningAlertAppearedInBranchAlert
-from github_client.models.webhook_code_scanning_alert_appeared_in_branch_alert_rule import WebhookCodeScanningAlertAppearedInBranchAlertRule
-from github_client.models.webhook_code_scanning_alert_appeared_in_branch_alert_tool import WebhookCodeScanningAlertAppearedInBranchAlertTool
-from github_client.models.webhook_code_scanning_alert_closed_by_user import WebhookCodeScanningAlertClosedByUser
-from github_client.models.webhook_code_scanning_alert_closed_by_user_alert import WebhookCodeScanningAlertClosedByUserAlert
-from github_client.models.webhook_code_scanning_alert_closed_by_user_alert_rule import WebhookCodeScanningAlertClosedByUserAlertRule
-from github_client.models.webhook_code_scanning_alert_closed_by_user_alert_tool import WebhookCodeScanningAlertClosedByUserAlertTool
-from github_client.models.webhook_code_scanning_alert_created import WebhookCodeScanningAlertCreated
-from github_client.models.webhook_code_scanning_alert_created_alert import WebhookCodeScanningAlertCreatedAlert
-from github_client.models.webhook_code_scanning_alert_created_alert_tool import WebhookCodeScanningAlertCreatedAlertTool
-from github_client.models.webhook_code_scanning_alert_fixed import WebhookCodeScanningAlertFixed
-from github_client.models.webhook_code_scanning_alert_fixed_alert import WebhookCodeScanningAlertFixedAlert
-from github_client.models.webhook_code_scanning_alert_reopened import WebhookCodeScanningAlertReopened
-from github_client.models.webhook_code_scanning_alert_reopened_alert import WebhookCodeScanningAlertReopenedAlert
-from github_client.models.webhook_code_scanning_alert_reopened_by_user import WebhookCodeScanningAlertReopenedByUser
-from github_client.models.webhook_code_scanning_alert_reopened_by_user_alert import WebhookCodeScanningAlertReopenedByUserAlert
-from github_client.models.webhook_commit_comment_created import WebhookCommitCommentCreated
-from github_client.models.webhook_commit_comment_created_comment import WebhookCommitCommentCreatedComment
-from github_client.models.webhook_config import WebhookConfig
-from github_client.models.webhook_config_insecure_ssl import WebhookConfigInsecureSsl
-from github_client.models.webhook_create import WebhookCreate
-from github_client.models.webhook_custom_property_created import WebhookCustomPropertyCreated
-from github_client.models.webhook_custom_property_deleted import WebhookCustomPropertyDeleted
-from github_client.models.webhook_custom_property_deleted_definition import WebhookCustomPropertyDeletedDefinition
-from github_client.models.webhook_custom_property_promoted_to_enterprise import WebhookCustomPropertyPromotedToEnterprise
-from github_client.models.webhook_custom_property_updated import WebhookCustomPropertyUpdated
-from github_client.models.webhook_custom_property_values_updated import WebhookCustomPropertyValuesUpdated
-from github_client.models.webhook_delete import WebhookDelete
-from github_client.models.webhook_dependabot_alert_auto_dismissed import WebhookDependabotAlertAutoDismissed
-from github_client.models.webhook_dependabot_alert_auto_reopened import WebhookDependabotAlertAutoReopened
-from github_client.models.webhook_dependabot_alert_created import WebhookDependabotAlertCreated
-from github_client.models.webhook_dependabot_alert_dismissed import WebhookDependabotAlertDismissed
-from github_client.models.webhook_dependabot_alert_fixed import WebhookDependabotAlertFixed
-from github_client.models.webhook_dependabot_alert_reintroduced import WebhookDependabotAlertReintroduced
-from github_client.models.webhook_dependabot_alert_reopened import WebhookDependabotAlertReopened
-from github_client.models.webhook_deploy_key_created import WebhookDeployKeyCreated
-from github_client.models.webhook_deploy_key_deleted import WebhookDeployKeyDeleted
-from github_client.models.webhook_deployment_created import WebhookDeploymentCreated
-from github_client.models.webhook_deployment_protection_rule_requested import WebhookDeploymentProtectionRuleRequested
-from github_client.models.webhook_deployment_review_approved import WebhookDeploymentReviewApproved
-from github_client.models.webhook_deployment_review_approved_workflow_job_runs_inner import WebhookDeploymentReviewApprovedWorkflowJobRunsInner
-from github_client.models.webhook_deployment_review_rejected import WebhookDeploymentReviewRejected
-from github_client.models.webhook_deployment_review_rejected_workflow_job_runs_inner import WebhookDeploymentReviewRejectedWorkflowJobRunsInner
-from github_client.models.webhook_deployment_review_requested import WebhookDeploymentReviewRequested
-from github_client.models.webhook_deployment_review_requested_reviewers_inner import WebhookDeploymentReviewRequestedReviewersInner
-from github_client.models.webhook_deployment_review_requested_workflow_job_run import WebhookDeploymentReviewRequestedWorkflowJobRun
-from github_client.models.webhook_deployment_status_created import WebhookDeploymentStatusCreated
-from github_client.models.webhook_deployment_status_created_check_run import WebhookDeploymentStatusCreatedCheckRun
-from github_client.models.webhook_deployment_status_created_deployment_status import WebhookDeploymentStatusCreatedDeploymentStatus
-from github_client.models.webhook_discussion_answered import WebhookDiscussionAnswered
-from github_client.models.webhook_discussion_category_changed import WebhookDiscussionCategoryChanged
-from github_client.models.webhook_discussion_category_changed_changes import WebhookDiscussionCategoryChangedChanges
-from github_client.models.webhook_discussion_category_changed_changes_category import WebhookDiscussionCategoryChangedChangesCategory
-from github_client.models.webhook_discussion_closed import WebhookDiscussionClosed
-from github_client.models.webhook_discussion_comment_created import WebhookDiscussionCommentCreated
-from github_client.models.webhook_discussion_comment_deleted import WebhookDiscussionCommentDeleted
-from github_client.models.webhook_discussion_comment_edited import WebhookDiscussionCommentEdited
-from github_client.models.webhook_discussion_comment_edited_changes import WebhookDiscussionCommentEditedChanges
-from github_client.models.webhook_discussion_comment_edited_changes_body import WebhookDiscussionCommentEditedChangesBody
-from github_client.models.webhook_discussion_created import WebhookDiscussionCreated
-from github_client.models.webhook_discussion_deleted import WebhookDiscussionDeleted
-from github_client.models.webhook_discussion_edited import WebhookDiscussionEdited
-from github_client.models.webhook_discussion_edited_changes import WebhookDiscussionEditedChanges
-from github_client.models.webhook_discussion_labeled import WebhookDiscussionLabeled
-from github_client.models.webhook_discussion_locked import WebhookDiscussionLocked
-from github_client.models.webhook_discussion_pinned import WebhookDiscussionPinned
-from github_client.models.webhook_discussion_reopened import WebhookDiscussionReopened
-from github_client.models.webhook_discussion_transferred import WebhookDiscussionTransferred
-from github_client.models.webhook_discussion_transferred_changes import WebhookDiscussionTransferredChanges
-from github_client.models.webhook_discussion_unanswered import WebhookDiscussionUnanswered
-from github_client.models.webhook_discussion_unlabeled import WebhookDiscussionUnlabeled
-from github_client.models.webhook_discussion_unlocked import WebhookDiscussionUnlocked
-from github_client.models.webhook_discussion_unpinned import WebhookDiscussionUnpinned
-from github_client.models.webhook_fork import WebhookFork
-from github_client.models.webhook_fork_forkee import WebhookForkForkee
-from github_client.models.webhook_github_app_authorization_revoked import WebhookGithubAppAuthorizationRevoked
-from github_client.models.webhook_gollum import WebhookGollum
-from github_client.models.webhook_gollum_pages_inner import WebhookGollumPagesInner
-from github_client.models.webhook_installation_created import WebhookInstallationCreated
-from github_client.models.webhook_installation_deleted import WebhookInstallationDeleted
-from github_client.models.webhook_installation_new_permissions_accepted import WebhookInstallationNewPermissionsAccepted
-from github_client.models.webhook_installation_repositories_added import WebhookInstallationRepositoriesAdded
-from github_client.models.webhook_installation_repositories_added_repositories_removed_inner import WebhookInstallationRepositoriesAddedRepositoriesRemovedInner
-from github_client.models.webhook_installation_repositories_removed import WebhookInstallationRepositoriesRemoved
-from github_client.models.webhook_installation_suspend import WebhookInstallationSuspend
-from github_client.models.webhook_installation_target_renamed import WebhookInstallationTargetRenamed
-from github_client.models.webhook_installation_target_renamed_account import WebhookInstallationTargetRenamedAccount
-from github_client.models.webhook_installation_target_renamed_changes import WebhookInstallationTargetRenamedChanges
-from github_client.models.webhook_installation_unsuspend import WebhookInstallationUnsuspend
-from github_client.models.webhook_issue_comment_created import WebhookIssueCommentCreated
-from github_client.models.webhook_issue_comment_created_issue import WebhookIssueCommentCreatedIssue
-from github_client.models.webhook_issue_comment_created_issue_all_of_reactions import WebhookIssueCommentCreatedIssueAllOfReactions
-from github_client.models.webhook_issue_comment_created_issue_all_of_user import WebhookIssueCommentCreatedIssueAllOfUser
-from github_client.models.webhook_issue_comment_deleted import WebhookIssueCommentDeleted
-from github_client.models.webhook_issue_comment_deleted_issue import WebhookIssueCommentDeletedIssue
-from github_client.models.webhook_issue_comment_deleted_issue_all_of_user import WebhookIssueCommentDeletedIssueAllOfUser
-from github_client.models.webhook_issue_comment_edited import WebhookIssueCommentEdited
-from github_client.models.webhook_issue_comment_edited_issue import WebhookIssueCommentEditedIssue
-from github_client.models.webhook_issue_dependencies_blocked_by_added import WebhookIssueDependenciesBlockedByAdded
-from github_client.models.webhook_issue_dependencies_blocked_by_removed import WebhookIssueDependenciesBlockedByRemoved
-from github_client.models.webhook_issue_dependencies_blocking_added import WebhookIssueDependenciesBlockingAdded
-from github_client.models.webhook_issue_dependencies_blocking_removed import WebhookIssueDependenciesBlockingRemoved
-from github_client.models.webhook_issues_assigned import WebhookIssuesAssigned
-from github_client.models.webhook_issues_closed import WebhookIssuesClosed
-from github_client.models.webhook_issues_closed_issue import WebhookIssuesClosedIssue
-from github_client.models.webhook_issues_deleted import WebhookIssuesDeleted
-from github_client.models.webhook_issues_demilestoned import WebhookIssuesDemilestoned
-from github_client.models.webhook_issues_edited import WebhookIssuesEdited
-from github_client.models.webhook_issues_edited_changes import WebhookIssuesEditedChanges
-from github_client.models.webhook_issues_edited_changes_title import WebhookIssuesEditedChangesTitle
-from github_client.models.webhook_issues_labeled import WebhookIssuesLabeled
-from github_client.models.webhook_issues_locked import WebhookIssuesLocked
-from github_client.models.webhook_issues_milestoned import WebhookIssuesMilestoned
-from github_client.models.webhook_issues_opened import WebhookIssuesOpened
-from github_client.models.webhook_issues_opened_changes import WebhookIssuesOpenedChanges
-from github_client.models.webhook_issues_pinned import WebhookIssuesPinned
-from github_client.models.webhook_issues_reopened import WebhookIssuesReopened
-from github_client.models.webhook_issues_transferred import WebhookIssuesTransferred
-from github_client.models.webhook_issues_transferred_changes import WebhookIssuesTransferredChanges
-from github_client.models.webhook_issues_typed import WebhookIssuesTyped
-from github_client.models.webhook_issues_unassigned import WebhookIssuesUnassigned
-from github_client.models.webhook_issues_unlabeled import WebhookIssuesUnlabeled
-from github_client.models.webhook_issues_unlocked import WebhookIssuesUnlocked
-from github_client.models.webhook_issues_unpinned import WebhookIssuesUnpinned
-from github_client.models.webhook_issues_untyped import WebhookIssuesUntyped
-from github_client.models.webhook_label_created import WebhookLabelCreated
-from github_client.models.webhook_label_deleted import WebhookLabelDeleted
-from github_client.models.webhook_label_edited import WebhookLabelEdited
-from github_client.models.webhook_label_edited_changes import WebhookLabelEditedChanges
-from github_client.models.webhook_label_edited_changes_color import WebhookLabelEditedChangesColor
-from github_client.models.webhook_label_edited_changes_description import WebhookLabelEditedChangesDescription
-from github_client.models.webhook_label_edited_changes_name import WebhookLabelEditedChangesName
-from github_client.models.webhook_marketplace_purchase_cancelled import WebhookMarketplacePurchaseCancelled
-from github_client.models.webhook_marketplace_purchase_changed import WebhookMarketplacePurchaseChanged
-from github_client.models.webhook_marketplace_purchase_pending_change import WebhookMarketplacePurchasePendingChange
-from github_client.models.webhook_marketplace_purchase_pending_change_cancelled import WebhookMarketplacePurchasePendingChangeCancelled
-from github_client.models.webhook_marketplace_purchase_purchased import WebhookMarketplacePurchasePurchased
-from github_client.models.webhook_member_added import WebhookMemberAdded
-from github_client.models.webhook_member_added_changes import WebhookMemberAddedChanges
-from github_client.models.webhook_member_added_changes_permission import WebhookMemberAddedChangesPermission
-from github_client.models.webhook_member_added_changes_role_name import WebhookMemberAddedChangesRoleName
-from github_client.models.webhook_member_edited import WebhookMemberEdited
-from github_client.models.webhook_member_edited_changes import WebhookMemberEditedChanges
-from github_client.models.webhook_member_edited_changes_old_permission import WebhookMemberEditedChangesOldPermission
-from github_client.models.webhook_member_edited_changes_permission import WebhookMemberEditedChangesPermission
-from github_client.models.webhook_member_removed import WebhookMemberRemoved
-from github_client.models.webhook_membership_added import WebhookMembershipAdded
-from github_client.models.webhook_membership_removed import WebhookMembershipRemoved
-from github_client.models.webhook_merge_group_checks_requested import WebhookMergeGroupChecksRequested
-from github_client.models.webhook_merge_group_destroyed import WebhookMergeGroupDestroyed
-from github_client.models.webhook_meta_deleted import WebhookMetaDeleted
-from github_client.models.webhook_meta_deleted_hook import WebhookMetaDeletedHook
-from github_client.models.webhook_meta_deleted_hook_config import WebhookMetaDeletedHookConfig
-from github_client.models.webhook_milestone_closed import WebhookMilestoneClosed
-from github_client.models.webhook_milestone_created import WebhookMilestoneCreated
-from github_client.models.webhook_milestone_deleted import WebhookMilestoneDeleted
-from github_client.models.webhook_milestone_edited import WebhookMilestoneEdited
-from github_client.models.webhook_milestone_edited_changes import WebhookMilestoneEditedChanges
-from github_client.models.webhook_milestone_edited_changes_due_on import WebhookMilestoneEditedChangesDueOn
-from github_client.models.webhook_milestone_edited_changes_title import WebhookMilestoneEditedChangesTitle
-from github_client.models.webhook_milestone_opened import WebhookMilestoneOpened
-from github_client.models.webhook_org_block_blocked import WebhookOrgBlockBlocked
-from github_client.models.webhook_org_block_unblocked import WebhookOrgBlockUnblocked
-from github_client.models.webhook_organization_deleted import WebhookOrganizationDeleted
-from github_client.models.webhook_organization_member_added import WebhookOrganizationMemberAdded
-from github_client.models.webhook_organization_member_invited import WebhookOrganizationMemberInvited
-from github_client.models.webhook_organization_member_invited_invitation import WebhookOrganizationMemberInvitedInvitation
-from github_client.models.webhook_organization_member_removed import WebhookOrganizationMemberRemoved
-from github_client.models.webhook_organization_renamed import WebhookOrganizationRenamed
-from github_client.models.webhook_organization_renamed_changes import WebhookOrganizationRenamedChanges
-from github_client.models.webhook_organization_renamed_changes_login import WebhookOrganizationRenamedChangesLogin
-from github_client.models.webhook_package_published import WebhookPackagePublished
-from github_client.models.webhook_package_published_package import WebhookPackagePublishedPackage
-from github_client.models.webhook_package_published_package_package_version import WebhookPackagePublishedPackagePackageVersion
-from github_client.models.webhook_package_published_package_package_version_body import WebhookPackagePublishedPackagePackageVersionBody
-from github_client.models.webhook_package_published_package_package_version_container_metadata import WebhookPackagePublishedPackagePackageVersionContainerMetadata
-from github_client.models.webhook_package_published_package_package_version_container_metadata_tag import WebhookPackagePublishedPackagePackageVersionContainerMetadataTag
-from github_client.models.webhook_package_published_package_package_version_docker_metadata_inner import WebhookPackagePublishedPackagePackageVersionDockerMetadataInner
-from github_client.models.webhook_package_published_package_package_version_npm_metadata import WebhookPackagePublishedPackagePackageVersionNpmMetadata
-from github_client.models.webhook_package_published_package_package_version_nuget_metadata_inner import WebhookPackagePublishedPackagePackageVersionNugetMetadataInner
-from github_client.models.webhook_package_published_package_package_version_nuget_metadata_inner_value import WebhookPackagePublishedPackagePackageVersionNugetMetadataInnerValue
-from github_client.models.webhook_package_published_package_package_version_nuget_metadata_inner_value_one_of import WebhookPackagePublishedPackagePackageVersionNugetMetadataInnerValueOneOf
-from github_client.models.webhook_package_published_package_package_version_package_files_inner import WebhookPackagePublishedPackagePackageVersionPackageFilesInner
-from github_client.models.webhook_package_published_package_package_version_release import WebhookPackagePublishedPackagePackageVersionRelease
-from github_client.models.webhook_package_published_package_registry import WebhookPackagePublishedPackageRegistry
-from github_client.models.webhook_package_updated import WebhookPackageUpdated
-from github_client.models.webhook_package_updated_package import WebhookPackageUpdatedPackage
-from github_client.models.webhook_package_updated_package_package_version import WebhookPackageUpdatedPackagePackageVersion
-from github_client.models.webhook_package_updated_package_package_version_package_files_inner import WebhookPackageUpdatedPackagePackageVersionPackageFilesInner
-from github_client.models.webhook_package_updated_package_package_version_release import WebhookPackageUpdatedPackagePackageVersionRelease
-from github_client.models.webhook_page_build import WebhookPageBuild
-from github_client.models.webhook_page_build_build import WebhookPageBuildBuild
-from github_client.models.webhook_personal_access_token_request_approved import WebhookPersonalAccessTokenRequestApproved
-from github_client.models.webhook_personal_access_token_request_cancelled import WebhookPersonalAccessTokenRequestCancelled
-from github_client.models.webhook_personal_access_token_request_created import WebhookPersonalAccessTokenRequestCreated
-from github_client.models.webhook_personal_access_token_request_denied import WebhookPersonalAccessTokenRequestDenied
-from github_client.models.webhook_ping import WebhookPing
-from github_client.models.webhook_ping_form_encoded import WebhookPingFormEncoded
-from github_client.models.webhook_project_card_converted import WebhookProjectCardConverted
-from github_client.models.webhook_project_card_converted_changes import WebhookProjectCardConvertedChanges
-from github_client.models.webhook_project_card_created import WebhookProjectCardCreated
-from github_client.models.webhook_project_card_deleted import WebhookProjectCardDeleted
-from github_client.models.webhook_project_card_edited import WebhookProjectCardEdited
-from github_client.models.webhook_project_card_edited_changes import WebhookProjectCardEditedChanges
-from github_client.models.webhook_project_card_edited_changes_note import WebhookProjectCardEditedChangesNote
-from github_client.models.webhook_project_card_moved import WebhookProjectCardMoved
-from github_client.models.webhook_project_card_moved_changes import WebhookProjectCardMovedChanges
-from github_client.models.webhook_project_card_moved_changes_column_id import WebhookProjectCardMovedChangesColumnId
-from github_client.models.webhook_project_card_moved_project_card import WebhookProjectCardMovedProjectCard
-from github_client.models.webhook_project_card_moved_project_card_all_of_creator import WebhookProjectCardMovedProjectCardAllOfCreator
-from github_client.models.webhook_project_closed import WebhookProjectClosed
-from github_client.models.webhook_project_column_created import WebhookProjectColumnCreated
-from github_client.models.webhook_project_column_deleted import WebhookProjectColumnDeleted
-from github_client.models.webhook_project_column_edited import WebhookProjectColumnEdited
-from github_client.models.webhook_project_column_edited_changes import WebhookProjectColumnEditedChanges
-from github_client.models.webhook_project_column_moved import WebhookProjectColumnMoved
-from github_client.models.webhook_project_created import WebhookProjectCreated
-from github_client.models.webhook_project_deleted import WebhookProjectDeleted
-from github_client.models.webhook_project_edited import WebhookProjectEdited
-from github_client.models.webhook_project_edited_changes import WebhookProjectEditedChanges
-from github_client.models.webhook_project_edited_changes_body import WebhookProjectEditedChangesBody
-from github_client.models.webhook_project_edited_changes_name import WebhookProjectEditedChangesName
-from github_client.models.webhook_project_reopened import WebhookProjectReopened
-from github_client.models.webhook_projects_v2_item_archived import WebhookProjectsV2ItemArchived
-from github_client.models.webhook_projects_v2_item_converted import WebhookProjectsV2ItemConverted
-from github_client.models.webhook_projects_v2_item_converted_changes import WebhookProjectsV2ItemConvertedChanges
-from github_client.models.webhook_projects_v2_item_converted_changes_content_type import WebhookProjectsV2ItemConvertedChangesContentType
-from github_client.models.webhook_projects_v2_item_created import WebhookProjectsV2ItemCreated
-from github_client.models.webhook_projects_v2_item_deleted import WebhookProjectsV2ItemDeleted
-from github_client.models.webhook_projects_v2_item_edited import WebhookProjectsV2ItemEdited
-from github_client.models.webhook_projects_v2_item_edited_changes import WebhookProjectsV2ItemEditedChanges
-from github_client.models.webhook_projects_v2_item_edited_changes_one_of import WebhookProjectsV2ItemEditedChangesOneOf
-from github_client.models.webhook_projects_v2_item_edited_changes_one_of1 import WebhookProjectsV2ItemEditedChangesOneOf1
-from github_client.models.webhook_projects_v2_item_edited_changes_one_of_field_value import WebhookProjectsV2ItemEditedChangesOneOfFieldValue
-from github_client.models.webhook_projects_v2_item_edited_changes_one_of_field_value_from import WebhookProjectsV2ItemEditedChangesOneOfFieldValueFrom
-from github_client.models.webhook_projects_v2_item_reordered import WebhookProjectsV2ItemReordered
-from github_client.models.webhook_projects_v2_item_reordered_changes import WebhookProjectsV2ItemReorderedChanges
-from github_client.models.webhook_projects_v2_item_restored import WebhookProjectsV2ItemRestored
-from github_client.models.webhook_projects_v2_project_closed import WebhookProjectsV2ProjectClosed
-from github_client.models.webhook_projects_v2_project_created import WebhookProjectsV2ProjectCreated
-from github_client.models.webhook_projects_v2_project_deleted import WebhookProjectsV2ProjectDeleted
-from github_client.models.webhook_projects_v2_project_edited import WebhookProjectsV2ProjectEdited
-from github_client.models.webhook_projects_v2_project_edited_changes import WebhookProjectsV2ProjectEditedChanges
-from github_client.models.webhook_projects_v2_project_edited_changes_public import WebhookProjectsV2ProjectEditedChangesPublic
-from github_client.models.webhook_projects_v2_project_edited_changes_title import WebhookProjectsV2ProjectEditedChangesTitle
-from github_client.models.webhook_projects_v2_project_reopened import WebhookProjectsV2ProjectReopened
-from github_client.models.webhook_projects_v2_status_update_created import WebhookProjectsV2StatusUpdateCreated
-from github_client.models.webhook_projects_v2_status_update_deleted import WebhookProjectsV2StatusUpdateDeleted
-from github_client.models.webhook_projects_v2_status_update_edited import WebhookProjectsV2StatusUpdateEdited
-from github_client.models.webhook_projects_v2_status_update_edited_changes import WebhookProjectsV2StatusUpdateEditedChanges
-from github_client.models.webhook_projects_v2_status_update_edited_changes_start_date import WebhookProjectsV2StatusUpdateEditedChangesStartDate
-from github_client.models.webhook_projects_v2_status_update_edited_changes_status import WebhookProjectsV2StatusUpdateEditedChangesStatus
-from github_client.models.webhook_public import WebhookPublic
-from github_client.models.webhook_pull_request_assigned import WebhookPullRequestAssigned
-from github_client.models.webhook_pull_request_auto_merge_disabled import WebhookPullRequestAutoMergeDisabled
-from github_client.models.webhook_pull_request_auto_merge_enabled import WebhookPullRequestAutoMergeEnabled
-from github_client.models.webhook_pull_request_closed import WebhookPullRequestClosed
-from github_client.models.webhook_pull_request_converted_to_draft import WebhookPullRequestConvertedToDraft
-from github_client.models.webhook_pull_request_demilestoned import WebhookPullRequestDemilestoned
-from github_client.models.webhook_pull_request_dequeued import WebhookPullRequestDequeued
-from github_client.models.webhook_pull_request_edited import WebhookPullRequestEdited
-from github_client.models.webhook_pull_request_edited_changes import WebhookPullRequestEditedChanges
-from github_client.models.webhook_pull_request_edited_changes_base import WebhookPullRequestEditedChangesBase
-from github_client.models.webhook_pull_request_enqueued import WebhookPullRequestEnqueued
-from github_client.models.webhook_pull_request_labeled import WebhookPullRequestLabeled
-from github_client.models.webhook_pull_request_locked import WebhookPullRequestLocked
-from github_client.models.webhook_pull_request_milestoned import WebhookPullRequestMilestoned
-from github_client.models.webhook_pull_request_opened import WebhookPullRequestOpened
-from github_client.models.webhook_pull_request_ready_for_review import WebhookPullRequestReadyForReview
-from github_client.models.webhook_pull_request_reopened import WebhookPullRequestReopened
-from github_client.models.webhook_pull_request_review_comment_created import WebhookPullRequestReviewCommentCreated
-from github_client.models.webhook_pull_request_review_comment_created_pull_request import WebhookPullRequestReviewCommentCreatedPullRequest
-from github_client.models.webhook_pull_request_review_comment_created_pull_request_head import WebhookPullRequestReviewCommentCreatedPullRequestHead
-from github_client.models.webhook_pull_request_review_comment_deleted import WebhookPullRequestReviewCommentDeleted
-from github_client.models.webhook_pull_request_review_comment_deleted_pull_request import WebhookPullRequestReviewCommentDeletedPullRequest
-from github_client.models.webhook_pull_request_review_comment_deleted_pull_request_head import WebhookPullRequestReviewCommentDeletedPullRequestHead
-from github_client.models.webhook_pull_request_review_comment_edited import WebhookPullRequestReviewCommentEdited
-from github_client.models.webhook_pull_request_review_comment_edited_pull_request import WebhookPullRequestReviewCommentEditedPullRequest
-from github_client.models.webhook_pull_request_review_dismissed import WebhookPullRequestReviewDismissed
-from github_client.models.webhook_pull_request_review_dismissed_review import WebhookPullRequestReviewDismissedReview
-from github_client.models.webhook_pull_request_review_edited import WebhookPullRequestReviewEdited
-from github_client.models.webhook_pull_request_review_edited_changes import WebhookPullRequestReviewEditedChanges
-from github_client.models.webhook_pull_request_review_request_removed import WebhookPullRequestReviewRequestRemoved
-from github_client.models.webhook_pull_request_review_request_removed_one_of import WebhookPullRequestReviewRequestRemovedOneOf
-from github_client.models.webhook_pull_request_review_request_removed_one_of1 import WebhookPullRequestReviewRequestRemovedOneOf1
-from github_client.models.webhook_pull_request_review_requested import WebhookPullRequestReviewRequested
-from github_client.models.webhook_pull_request_review_requested_one_of import WebhookPullRequestReviewRequestedOneOf
-from github_client.models.webhook_pull_request_review_requested_one_of1 import WebhookPullRequestReviewRequestedOneOf1
-from github_client.models.webhook_pull_request_review_submitted import WebhookPullRequestReviewSubmitted
-from github_client.models.webhook_pull_request_review_thread_resolved import WebhookPullRequestReviewThreadResolved
-from github_client.models.webhook_pull_request_review_thread_resolved_thread import WebhookPullRequestReviewThreadResolvedThread
-from github_client.models.webhook_pull_request_review_thread_unresolved import WebhookPullRequestReviewThreadUnresolved
-from github_client.models.webhook_pull_request_review_thread_unresolved_thread import WebhookPullRequestReviewThreadUnresolvedThread
-from github_client.models.webhook_pull_request_synchronize import WebhookPullRequestSynchronize
-from github_client.models.webhook_pull_request_unassigned import WebhookPullRequestUnassigned
-from github_client.models.webhook_pull_request_unlabeled import WebhookPullRequestUnlabeled
-from github_client.models.webhook_pull_request_unlocked import WebhookPullRequestUnlocked
-from github_client.models.webhook_push import WebhookPush
-from github_client.models.webhook_registry_package_published import WebhookRegistryPackagePublished
-from github_client.models.webhook_registry_package_published_registry_package import WebhookRegistryPackagePublishedRegistryPackage
-from github_client.models.webhook_registry_package_published_registry_package_owner import WebhookRegistryPackagePublishedRegistryPackageOwner
-from github_client.models.webhook_registry_package_published_registry_package_package_version import WebhookRegistryPackagePublishedRegistryPackagePackageVersion
-from github_client.models.webhook_registry_package_published_registry_package_package_version_container_metadata import WebhookRegistryPackagePublishedRegistryPackagePackageVersionContainerMetadata
-from github_client.models.webhook_registry_package_published_registry_package_package_version_npm_metadata import WebhookRegistryPackagePublishedRegistryPackagePackageVersionNpmMetadata
-from github_client.models.webhook_registry_package_published_registry_package_package_version_nuget_metadata_inner import WebhookRegistryPackagePublishedRegistryPackagePackageVersionNugetMetadataInner
-from github_client.models.webhook_registry_package_published_registry_package_package_version_nuget_metadata_inner_id import WebhookRegistryPackagePublishedRegistryPackagePackageVersionNugetMetadataInnerId
-from github_client.models.webhook_registry_package_published_registry_package_package_version_package_files_inner import WebhookRegistryPackagePublishedRegistryPackagePackageVersionPackageFilesInner
-from github_client.models.webhook_registry_package_published_registry_package_package_version_release import WebhookRegistryPackagePublishedRegistryPackagePackageVersionRelease
-from github_client.models.webhook_registry_package_published_registry_package_registry import WebhookRegistryPackagePublishedRegistryPackageRegistry
-from github_client.models.webhook_registry_package_updated import WebhookRegistryPackageUpdated
-from github_client.models.webhook_registry_package_updated_registry_package import WebhookRegistryPackageUpdatedRegistryPackage
-from github_client.models.webhook_registry_package_updated_registry_package_package_version import WebhookRegistryPackageUpdatedRegistryPackagePackageVersion
-from github_client.models.webhook_registry_package_updated_registry_package_package_version_docker_metadata_inner import WebhookRegistryPackageUpdatedRegistryPackagePackageVersionDockerMetadataInner
-from github_client.models.webhook_registry_package_updated_registry_package_package_version_package_files_inner import WebhookRegistryPackageUpdatedRegistryPackagePackageVersionPackageFilesInner
-from github_client.models.webhook_registry_package_updated_registry_package_package_version_release import WebhookRegistryPackageUpdatedRegistryPackagePackageVersionRelease
-from github_client.models.webhook_release_created import WebhookReleaseCreated
-from github_client.models.webhook_release_deleted import WebhookReleaseDeleted
-from github_client.models.webhook_release_edited import WebhookReleaseEdited
-from github_client.models.webhook_release_edited_changes import WebhookReleaseEditedChanges
-from github_client.models.webhook_release_edited_changes_make_latest import WebhookReleaseEditedChangesMakeLatest
-from github_client.models.webhook_release_edited_changes_tag_name import WebhookReleaseEditedChangesTagName
-from github_client.models.webhook_release_prereleased import WebhookReleasePrereleased
-from github_client.models.webhook_release_published import WebhookReleasePublished
-from github_client.models.webhook_release_released import WebhookReleaseReleased
-from github_client.models.webhook_release_unpublished import WebhookReleaseUnpublished
-from github_client.models.webhook_repository_advisory_published import WebhookRepositoryAdvisoryPublished
-from github_client.models.webhook_repository_advisory_reported import WebhookRepositoryAdvisoryReported
-from github_client.models.webhook_repository_archived import WebhookRepositoryArchived
-from github_client.models.webhook_repository_created import WebhookRepositoryCreated
-from github_client.models.webhook_repository_deleted import WebhookRepositoryDeleted
-from github_client.models.webhook_repository_dispatch_sample import WebhookRepositoryDispatchSample
-from github_client.models.webhook_repository_edited import WebhookRepositoryEdited
-from github_client.models.webhook_repository_edited_changes import WebhookRepositoryEditedChanges
-from github_client.models.webhook_repository_edited_changes_topics import WebhookRepositoryEditedChangesTopics
-from github_client.models.webhook_repository_import import WebhookRepositoryImport
-from github_client.models.webhook_repository_privatized import WebhookRepositoryPrivatized
-from github_client.models.webhook_repository_publicized import WebhookRepositoryPublicized
-from github_client.models.webhook_repository_renamed import WebhookRepositoryRenamed
-from github_client.models.webhook_repository_renamed_changes import WebhookRepositoryRenamedChanges
-from github_client.models.webhook_repository_renamed_changes_repository import WebhookRepositoryRenamedChangesRepository
-from github_client.models.webhook_repository_ruleset_created import WebhookRepositoryRulesetCreated
-from github_client.models.webhook_repository_ruleset_deleted import WebhookRepositoryRulesetDeleted
-from github_client.models.webhook_repository_ruleset_edited import WebhookRepositoryRulesetEdited
-from github_client.models.webhook_repository_ruleset_edited_changes import WebhookRepositoryRulesetEditedChanges
-from github_client.models.webhook_repository_ruleset_edited_changes_conditions import WebhookRepositoryRulesetEditedChangesConditions
-from github_client.models.webhook_repository_ruleset_edited_changes_conditions_updated_inner import WebhookRepositoryRulesetEditedChangesConditionsUpdatedInner
-from github_client.models.webhook_repository_ruleset_edited_changes_conditions_updated_inner_changes import WebhookRepositoryRulesetEditedChangesConditionsUpdatedInnerChanges
-from github_client.models.webhook_repository_ruleset_edited_changes_conditions_updated_inner_changes_include import WebhookRepositoryRulesetEditedChangesConditionsUpdatedInnerChangesInclude
-from github_client.models.webhook_repository_ruleset_edited_changes_rules import WebhookRepositoryRulesetEditedChangesRules
-from github_client.models.webhook_repository_ruleset_edited_changes_rules_updated_inner import WebhookRepositoryRulesetEditedChangesRulesUpdatedInner
-from github_client.models.webhook_repository_ruleset_edited_changes_rules_updated_inner_changes import WebhookRepositoryRulesetEditedChangesRulesUpdatedInnerChanges
-from github_client.models.webhook_repository_transferred import WebhookRepositoryTransferred
-from github_client.models.webhook_repository_transferred_changes import WebhookRepositoryTransferredChanges
-from github_client.models.webhook_repository_transferred_changes_owner import WebhookRepositoryTransferredChangesOwner
-from github_client.models.webhook_repository_transferred_changes_owner_from import WebhookRepositoryTransferredChangesOwnerFrom
-from github_client.models.webhook_repository_unarchived import WebhookRepositoryUnarchived
-from github_client.models.webhook_repository_vulnerability_alert_create import WebhookRepositoryVulnerabilityAlertCreate
-from github_client.models.webhook_repository_vulnerability_alert_dismiss import WebhookRepositoryVulnerabilityAlertDismiss
-from github_client.models.webhook_repository_vulnerability_alert_reopen import WebhookRepositoryVulnerabilityAlertReopen
-from github_client.models.webhook_repository_vulnerability_alert_resolve import WebhookRepositoryVulnerabilityAlertResolve
-from github_client.models.webhook_rubygems_metadata import WebhookRubygemsMetadata
-from github_client.models.webhook_rubygems_metadata_version_info import WebhookRubygemsMetadataVersionInfo
-from github_client.models.webhook_secret_scanning_alert_created import WebhookSecretScanningAlertCreated
-from github_client.models.webhook_secret_scanning_alert_location_created import WebhookSecretScanningAlertLocationCreated
-from github_client.models.webhook_secret_scanning_alert_location_created_form_encoded import WebhookSecretScanningAlertLocationCreatedFormEncoded
-from github_client.models.webhook_secret_scanning_alert_publicly_leaked import WebhookSecretScanningAlertPubliclyLeaked
-from github_client.models.webhook_secret_scanning_alert_reopened import WebhookSecretScanningAlertReopened
-from github_client.models.webhook_secret_scanning_alert_resolved import WebhookSecretScanningAlertResolved
-from github_client.models.webhook_secret_scanning_alert_validated import WebhookSecretScanningAlertValidated
-from github_client.models.webhook_secret_scanning_scan_completed import WebhookSecretScanningScanCompleted
-from github_client.models.webhook_security_advisory_published import WebhookSecurityAdvisoryPublished
-from github_client.models.webhook_security_advisory_updated import WebhookSecurityAdvisoryUpdated
-from github_client.models.webhook_security_advisory_withdrawn import WebhookSecurityAdvisoryWithdrawn
-from github_client.models.webhook_security_advisory_withdrawn_security_advisory import WebhookSecurityAdvisoryWithdrawnSecurityAdvisory
-from github_client.models.webhook_security_and_analysis import WebhookSecurityAndAnalysis
-from github_client.models.webhook_security_and_analysis_changes import WebhookSecurityAndAnalysisChanges
-from github_client.models.webhook_security_and_analysis_changes_from import WebhookSecurityAndAnalysisChangesFrom
-from github_client.models.webhook_sponsorship_cancelled import WebhookSponsorshipCancelled
-from github_client.models.webhook_sponsorship_created import WebhookSponsorshipCreated
-from github_client.models.webhook_sponsorship_edited import WebhookSponsorshipEdited
-from github_client.models.webhook_sponsorship_edited_changes import WebhookSponsorshipEditedChanges
-from github_client.models.webhook_sponsorship_edited_changes_privacy_level import WebhookSponsorshipEditedChangesPrivacyLevel
-from github_client.models.webhook_sponsorship_pending_cancellation import WebhookSponsorshipPendingCancellation
-from github_client.models.webhook_sponsorship_pending_tier_change import WebhookSponsorshipPendingTierChange
-from github_client.models.webhook_sponsorship_tier_changed import WebhookSponsorshipTierChanged
-from github_client.models.webhook_star_created import WebhookStarCreated
-from github_client.models.webhook_star_deleted import WebhookStarDeleted
-from github_client.models.webhook_status import WebhookStatus
-from github_client.models.webhook_status_branches_inner import WebhookStatusBranchesInner
-from github_client.models.webhook_status_branches_inner_commit import WebhookStatusBranchesInnerCommit
-from github_client.models.webhook_status_commit import WebhookStatusCommit
-from github_client.models.webhook_status_commit_commit import WebhookStatusCommitCommit
-from github_client.models.webhook_status_commit_commit_author import WebhookStatusCommitCommitAuthor
-from github_client.models.webhook_status_commit_commit_verification import WebhookStatusCommitCommitVerification
-from github_client.models.webhook_status_commit_parents_inner import WebhookStatusCommitParentsInner
-from github_client.models.webhook_sub_issues_parent_issue_added import WebhookSubIssuesParentIssueAdded
-from github_client.models.webhook_sub_issues_parent_issue_removed import WebhookSubIssuesParentIssueRemoved
-from github_client.models.webhook_sub_issues_sub_issue_added import WebhookSubIssuesSubIssueAdded
-from github_client.models.webhook_sub_issues_sub_issue_removed import WebhookSubIssuesSubIssueRemoved
-from github_client.models.webhook_team_add import WebhookTeamAdd
-from github_client.models.webhook_team_added_to_repository import WebhookTeamAddedToRepository
-from github_client.models.webhook_team_created import WebhookTeamCreated
-from github_client.models.webhook_team_deleted import WebhookTeamDeleted
-from github_client.models.webhook_team_edited import WebhookTeamEdited
-from github_client.models.webhook_team_edited_changes import WebhookTeamEditedChanges
-from github_client.models.webhook_team_edited_changes_notification_setting import WebhookTeamEditedChangesNotificationSetting
-from github_client.models.webhook_team_edited_changes_privacy import WebhookTeamEditedChangesPrivacy
-from github_client.models.webhook_team_edited_changes_repository import WebhookTeamEditedChangesRepository
-from github_client.models.webhook_team_edited_changes_repository_permissions import WebhookTeamEditedChangesRepositoryPermissions
-from github_client.models.webhook_team_edited_changes_repository_permissions_from import WebhookTeamEditedChangesRepositoryPermissionsFrom
-from github_client.models.webhook_team_removed_from_repository import WebhookTeamRemovedFromRepository
-from github_client.models.webhook_watch_started import WebhookWatchStarted
-from github_client.models.webhook_workflow_dispatch import WebhookWorkflowDispatch
-from github_client.models.webhook_workflow_job_completed import WebhookWorkflowJobCompleted
-from github_client.models.webhook_workflow_job_completed_workflow_job import WebhookWorkflowJobCompletedWorkflowJob
-from github_client.models.webhook_workflow_job_in_progress import WebhookWorkflowJobInProgress
-from github_client.models.webhook_workflow_job_in_progress_workflow_job import WebhookWorkflowJobInProgressWorkflowJob
-from github_client.models.webhook_workflow_job_queued import WebhookWorkflowJobQueued
-from github_client.models.webhook_workflow_job_queued_workflow_job import WebhookWorkflowJobQueuedWorkflowJob
-from github_client.models.webhook_workflow_job_waiting import WebhookWorkflowJobWaiting
-from github_client.models.webhook_workflow_job_waiting_workflow_job import WebhookWorkflowJobWaitingWorkflowJob
-from github_client.models.webhook_workflow_run_completed import WebhookWorkflowRunCompleted
-from github_client.models.webhook_workflow_run_in_progress import WebhookWorkflowRunInProgress
-from github_client.models.webhook_workflow_run_requested import WebhookWorkflowRunRequested
-from github_client.models.webhooks_alert import WebhooksAlert
-from github_client.models.webhooks_answer import WebhooksAnswer
-from github_client.models.webhooks_approver import WebhooksApprover
-from github_client.models.webhooks_changes import WebhooksChanges
-from github_client.models.webhooks_changes8 import WebhooksChanges8
-from github_client.models.webhooks_changes8_tier import WebhooksChanges8Tier
-from github_client.models.webhooks_changes_body import WebhooksChangesBody
-from github_client.models.webhooks_comment import WebhooksComment
-from github_client.models.webhooks_deploy_key import WebhooksDeployKey
-from github_client.models.webhooks_issue import WebhooksIssue
-from github_client.models.webhooks_issue2 import WebhooksIssue2
-from github_client.models.webhooks_issue_comment import WebhooksIssueComment
-from github_client.models.webhooks_issue_pull_request import WebhooksIssuePullRequest
-from github_client.models.webhooks_label import WebhooksLabel
-from github_client.models.webhooks_marketplace_purchase import WebhooksMarketplacePurchase
-from github_client.models.webhooks_marketplace_purchase_account import WebhooksMarketplacePurchaseAccount
-from github_client.models.webhooks_marketplace_purchase_plan import WebhooksMarketplacePurchasePlan
-from github_client.models.webhooks_membership import WebhooksMembership
-from github_client.models.webhooks_milestone import WebhooksMilestone
-from github_client.models.webhooks_milestone3 import WebhooksMilestone3
-from github_client.models.webhooks_previous_marketplace_purchase import WebhooksPreviousMarketplacePurchase
-from github_client.models.webhooks_previous_marketplace_purchase_plan import WebhooksPreviousMarketplacePurchasePlan
-from github_client.models.webhooks_project import WebhooksProject
-from github_client.models.webhooks_project_card import WebhooksProjectCard
-from github_client.models.webhooks_project_changes import WebhooksProjectChanges
-from github_client.models.webhooks_project_changes_archived_at import WebhooksProjectChangesArchivedAt
-from github_client.models.webhooks_project_column import WebhooksProjectColumn
-from github_client.models.webhooks_pull_request5 import WebhooksPullRequest5
-from github_client.models.webhooks_pull_request5_base import WebhooksPullRequest5Base
-from github_client.models.webhooks_pull_request5_links import WebhooksPullRequest5Links
-from github_client.models.webhooks_pull_request5_requested_reviewers_inner import WebhooksPullRequest5RequestedReviewersInner
-from github_client.models.webhooks_release import WebhooksRelease
-from github_client.models.webhooks_release1 import WebhooksRelease1
-from github_client.models.webhooks_repositories_inner import WebhooksRepositoriesInner
-from github_client.models.webhooks_repository_selection import WebhooksRepositorySelection
-from github_client.models.webhooks_review import WebhooksReview
-from github_client.models.webhooks_review_comment import WebhooksReviewComment
-from github_client.models.webhooks_review_comment_links import WebhooksReviewCommentLinks
-from github_client.models.webhooks_review_links import WebhooksReviewLinks
-from github_client.models.webhooks_reviewers_inner import WebhooksReviewersInner
-from github_client.models.webhooks_rule import WebhooksRule
-from github_client.models.webhooks_security_advisory import WebhooksSecurityAdvisory
-from github_client.models.webhooks_security_advisory_cvss import WebhooksSecurityAdvisoryCvss
-from github_client.models.webhooks_security_advisory_cwes_inner import WebhooksSecurityAdvisoryCwesInner
-from github_client.models.webhooks_security_advisory_identifiers_inner import WebhooksSecurityAdvisoryIdentifiersInner
-from github_client.models.webhooks_security_advisory_references_inner import WebhooksSecurityAdvisoryReferencesInner
-from github_client.models.webhooks_security_advisory_vulnerabilities_inner import WebhooksSecurityAdvisoryVulnerabilitiesInner
-from github_client.models.webhooks_security_advisory_vulnerabilities_inner_first_patched_version import WebhooksSecurityAdvisoryVulnerabilitiesInnerFirstPatchedVersion
-from github_client.models.webhooks_security_advisory_vulnerabilities_inner_package import WebhooksSecurityAdvisoryVulnerabilitiesInnerPackage
-from github_client.models.webhooks_sponsorship import WebhooksSponsorship
-from github_client.models.webhooks_sponsorship_maintainer import WebhooksSponsorshipMaintainer
-from github_client.models.webhooks_team import WebhooksTeam
-from github_client.models.webhooks_team1 import WebhooksTeam1
-from github_client.models.webhooks_team_parent import WebhooksTeamParent
-from github_client.models.webhooks_user import WebhooksUser
-from github_client.models.webhooks_user_mannequin import WebhooksUserMannequin
-from github_client.models.webhooks_workflow import WebhooksWorkflow
-from github_client.models.webhooks_workflow_job_run import WebhooksWorkflowJobRun
-from github_client.models.workflow import Workflow
-from github_client.models.workflow_run import WorkflowRun
-from github_client.models.workflow_run1 import WorkflowRun1
-from github_client.models.workflow_run2 import WorkflowRun2
-from github_client.models.workflow_run2_pull_requests_inner import WorkflowRun2PullRequestsInner
-from github_client.models.workflow_run_pull_requests_inner import WorkflowRunPullRequestsInner
-from github_client.models.workflow_run_usage import WorkflowRunUsage
-from github_client.models.workflow_run_usage_billable import WorkflowRunUsageBillable
-from github_client.models.workflow_run_usage_billable_ubuntu import WorkflowRunUsageBillableUBUNTU
-from github_client.models.workflow_run_usage_billable_ubuntu_job_runs_inner import WorkflowRunUsageBillableUBUNTUJobRunsInner
-from github_client.models.workflow_step import WorkflowStep
-from github_client.models.workflow_step1 import WorkflowStep1
-from github_client.models.workflow_step2 import WorkflowStep2
-from github_client.models.workflow_step3 import WorkflowStep3
-from github_client.models.workflow_step4 import WorkflowStep4
-from github_client.models.workflow_usage import WorkflowUsage
-from github_client.models.workflow_usage_billable import WorkflowUsageBillable
-from github_client.models.workflow_usage_billable_ubuntu import WorkflowUsageBillableUBUNTU
+if TYPE_CHECKING:
+    from github_client.models.actions_add_custom_labels_to_self_hosted_runner_for_org_request import ActionsAddCustomLabelsToSelfHostedRunnerForOrgRequest
+    from github_client.models.actions_artifact_and_log_retention import ActionsArtifactAndLogRetention
+    from github_client.models.actions_artifact_and_log_retention_response import ActionsArtifactAndLogRetentionResponse
+    from github_client.models.actions_billing_usage import ActionsBillingUsage
+    from github_client.models.actions_billing_usage_minutes_used_breakdown import ActionsBillingUsageMinutesUsedBreakdown
+    from github_client.models.actions_cache_list import ActionsCacheList
+    from github_client.models.actions_cache_list_actions_caches_inner import ActionsCacheListActionsCachesInner
+    from github_client.models.actions_cache_usage_by_repository import ActionsCacheUsageByRepository
+    from github_client.models.actions_cache_usage_org_enterprise import ActionsCacheUsageOrgEnterprise
+    from github_client.models.actions_create_hosted_runner_for_org_request import ActionsCreateHostedRunnerForOrgRequest
+    from github_client.models.actions_create_hosted_runner_for_org_request_image import ActionsCreateHostedRunnerForOrgRequestImage
+    from github_client.models.actions_create_or_update_environment_secret_request import ActionsCreateOrUpdateEnvironmentSecretRequest
+    from github_client.models.actions_create_or_update_org_secret_request import ActionsCreateOrUpdateOrgSecretRequest
+    from github_client.models.actions_create_or_update_repo_secret_request import ActionsCreateOrUpdateRepoSecretRequest
+    from github_client.models.actions_create_org_variable_request import ActionsCreateOrgVariableRequest
+    from github_client.models.actions_create_repo_variable_request import ActionsCreateRepoVariableRequest
+    from github_client.models.actions_create_self_hosted_runner_group_for_org_request import ActionsCreateSelfHostedRunnerGroupForOrgRequest
+    from github_client.models.actions_create_workflow_dispatch_request import ActionsCreateWorkflowDispatchRequest
+    from github_client.models.actions_default_workflow_permissions import ActionsDefaultWorkflowPermissions
+    from github_client.models.actions_fork_pr_contributor_approval import ActionsForkPrContributorApproval
+    from github_client.models.actions_fork_pr_workflows_private_repos import ActionsForkPrWorkflowsPrivateRepos
+    from github_client.models.actions_fork_pr_workflows_private_repos_request import ActionsForkPrWorkflowsPrivateReposRequest
+    from github_client.models.actions_generate_runner_jitconfig_for_org201_response import ActionsGenerateRunnerJitconfigForOrg201Response
+    from github_client.models.actions_generate_runner_jitconfig_for_org_request import ActionsGenerateRunnerJitconfigForOrgRequest
+    from github_client.models.actions_get_actions_cache_usage_by_repo_for_org200_response import ActionsGetActionsCacheUsageByRepoForOrg200Response
+    from github_client.models.actions_get_default_workflow_permissions import ActionsGetDefaultWorkflowPermissions
+    from github_client.models.actions_get_hosted_runners_github_owned_images_for_org200_response import ActionsGetHostedRunnersGithubOwnedImagesForOrg200Response
+    from github_client.models.actions_get_hosted_runners_machine_specs_for_org200_response import ActionsGetHostedRunnersMachineSpecsForOrg200Response
+    from github_client.models.actions_get_hosted_runners_platforms_for_org200_response import ActionsGetHostedRunnersPlatformsForOrg200Response
+    from github_client.models.actions_get_workflow_workflow_id_parameter import ActionsGetWorkflowWorkflowIdParameter
+    from github_client.models.actions_hosted_runner import ActionsHostedRunner
+    from github_client.models.actions_hosted_runner_curated_image import ActionsHostedRunnerCuratedImage
+    from github_client.models.actions_hosted_runner_custom_image import ActionsHostedRunnerCustomImage
+    from github_client.models.actions_hosted_runner_custom_image_version import ActionsHostedRunnerCustomImageVersion
+    from github_client.models.actions_hosted_runner_limits import ActionsHostedRunnerLimits
+    from github_client.models.actions_hosted_runner_machine_spec import ActionsHostedRunnerMachineSpec
+    from github_client.models.actions_list_artifacts_for_repo200_response import ActionsListArtifactsForRepo200Response
+    from github_client.models.actions_list_custom_image_versions_for_org200_response import ActionsListCustomImageVersionsForOrg200Response
+    from github_client.models.actions_list_custom_images_for_org200_response import ActionsListCustomImagesForOrg200Response
+    from github_client.models.actions_list_github_hosted_runners_in_group_for_org200_response import ActionsListGithubHostedRunnersInGroupForOrg200Response
+    from github_client.models.actions_list_hosted_runners_for_org200_response import ActionsListHostedRunnersForOrg200Response
+    from github_client.models.actions_list_jobs_for_workflow_run_attempt200_response import ActionsListJobsForWorkflowRunAttempt200Response
+    from github_client.models.actions_list_labels_for_self_hosted_runner_for_org200_response import ActionsListLabelsForSelfHostedRunnerForOrg200Response
+    from github_client.models.actions_list_org_secrets200_response import ActionsListOrgSecrets200Response
+    from github_client.models.actions_list_org_variables200_response import ActionsListOrgVariables200Response
+    from github_client.models.actions_list_repo_access_to_self_hosted_runner_group_in_org200_response import ActionsListRepoAccessToSelfHostedRunnerGroupInOrg200Response
+    from github_client.models.actions_list_repo_organization_secrets200_response import ActionsListRepoOrganizationSecrets200Response
+    from github_client.models.actions_list_repo_organization_variables200_response import ActionsListRepoOrganizationVariables200Response
+    from github_client.models.actions_list_repo_workflows200_response import ActionsListRepoWorkflows200Response
+    from github_client.models.actions_list_selected_repos_for_org_secret200_response import ActionsListSelectedReposForOrgSecret200Response
+    from github_client.models.actions_list_selected_repositories_enabled_github_actions_organization200_response import ActionsListSelectedRepositoriesEnabledGithubActionsOrganization200Response
+    from github_client.models.actions_list_selected_repositories_self_hosted_runners_organization200_response import ActionsListSelectedRepositoriesSelfHostedRunnersOrganization200Response
+    from github_client.models.actions_list_self_hosted_runner_groups_for_org200_response import ActionsListSelfHostedRunnerGroupsForOrg200Response
+    from github_client.models.actions_list_self_hosted_runners_for_org200_response import ActionsListSelfHostedRunnersForOrg200Response
+    from github_client.models.actions_list_self_hosted_runners_in_group_for_org200_response import ActionsListSelfHostedRunnersInGroupForOrg200Response
+    from github_client.models.actions_list_workflow_runs_for_repo200_response import ActionsListWorkflowRunsForRepo200Response
+    from github_client.models.actions_oidc_subject_customization_for_a_repository import ActionsOIDCSubjectCustomizationForARepository
+    from github_client.models.actions_organization_permissions import ActionsOrganizationPermissions
+    from github_client.models.actions_public_key import ActionsPublicKey
+    from github_client.models.actions_re_run_job_for_workflow_run_request import ActionsReRunJobForWorkflowRunRequest
+    from github_client.models.actions_repository_permissions import ActionsRepositoryPermissions
+    from github_client.models.actions_review_custom_gates_for_run_request import ActionsReviewCustomGatesForRunRequest
+    from github_client.models.actions_review_pending_deployments_for_run_request import ActionsReviewPendingDeploymentsForRunRequest
+    from github_client.models.actions_secret import ActionsSecret
+    from github_client.models.actions_set_custom_labels_for_self_hosted_runner_for_org_request import ActionsSetCustomLabelsForSelfHostedRunnerForOrgRequest
+    from github_client.models.actions_set_default_workflow_permissions import ActionsSetDefaultWorkflowPermissions
+    from github_client.models.actions_set_github_actions_permissions_organization_request import ActionsSetGithubActionsPermissionsOrganizationRequest
+    from github_client.models.actions_set_github_actions_permissions_repository_request import ActionsSetGithubActionsPermissionsRepositoryRequest
+    from github_client.models.actions_set_repo_access_to_self_hosted_runner_group_in_org_request import ActionsSetRepoAccessToSelfHostedRunnerGroupInOrgRequest
+    from github_client.models.actions_set_selected_repos_for_org_secret_request import ActionsSetSelectedReposForOrgSecretRequest
+    from github_client.models.actions_set_selected_repos_for_org_variable_request import ActionsSetSelectedReposForOrgVariableRequest
+    from github_client.models.actions_set_selected_repositories_enabled_github_actions_organization_request import ActionsSetSelectedRepositoriesEnabledGithubActionsOrganizationRequest
+    from github_client.models.actions_set_selected_repositories_self_hosted_runners_organization_request import ActionsSetSelectedRepositoriesSelfHostedRunnersOrganizationRequest
+    from github_client.models.actions_set_self_hosted_runners_in_group_for_org_request import ActionsSetSelfHostedRunnersInGroupForOrgRequest
+    from github_client.models.actions_set_self_hosted_runners_permissions_organization_request import ActionsSetSelfHostedRunnersPermissionsOrganizationRequest
+    from github_client.models.actions_update_hosted_runner_for_org_request import ActionsUpdateHostedRunnerForOrgRequest
+    from github_client.models.actions_update_org_variable_request import ActionsUpdateOrgVariableRequest
+    from github_client.models.actions_update_repo_variable_request import ActionsUpdateRepoVariableRequest
+    from github_client.models.actions_update_self_hosted_runner_group_for_org_request import ActionsUpdateSelfHostedRunnerGroupForOrgRequest
+    from github_client.models.actions_variable import ActionsVariable
+    from github_client.models.actions_workflow_access_to_repository import ActionsWorkflowAccessToRepository
+    from github_client.models.activity import Activity
+    from github_client.models.activity_list_public_events503_response import ActivityListPublicEvents503Response
+    from github_client.models.activity_list_repos_starred_by_user200_response import ActivityListReposStarredByUser200Response
+    from github_client.models.activity_list_stargazers_for_repo200_response import ActivityListStargazersForRepo200Response
+    from github_client.models.activity_mark_notifications_as_read202_response import ActivityMarkNotificationsAsRead202Response
+    from github_client.models.activity_mark_notifications_as_read_request import ActivityMarkNotificationsAsReadRequest
+    from github_client.models.activity_mark_repo_notifications_as_read202_response import ActivityMarkRepoNotificationsAsRead202Response
+    from github_client.models.activity_mark_repo_notifications_as_read_request import ActivityMarkRepoNotificationsAsReadRequest
+    from github_client.models.activity_set_repo_subscription_request import ActivitySetRepoSubscriptionRequest
+    from github_client.models.activity_set_thread_subscription_request import ActivitySetThreadSubscriptionRequest
+    from github_client.models.actor import Actor
+    from github_client.models.added_to_project_issue_event import AddedToProjectIssueEvent
+    from github_client.models.added_to_project_issue_event_project_card import AddedToProjectIssueEventProjectCard
+    from github_client.models.alert_instance import AlertInstance
+    from github_client.models.alert_instance_location import AlertInstanceLocation
+    from github_client.models.allowed_actions import AllowedActions
+    from github_client.models.api_insights_route_stats_inner import ApiInsightsRouteStatsInner
+    from github_client.models.api_insights_subject_stats_inner import ApiInsightsSubjectStatsInner
+    from github_client.models.api_insights_summary_stats import ApiInsightsSummaryStats
+    from github_client.models.api_insights_time_stats_inner import ApiInsightsTimeStatsInner
+    from github_client.models.api_insights_user_stats_inner import ApiInsightsUserStatsInner
+    from github_client.models.api_overview import ApiOverview
+    from github_client.models.api_overview_domains import ApiOverviewDomains
+    from github_client.models.api_overview_domains_actions_inbound import ApiOverviewDomainsActionsInbound
+    from github_client.models.api_overview_domains_artifact_attestations import ApiOverviewDomainsArtifactAttestations
+    from github_client.models.api_overview_ssh_key_fingerprints import ApiOverviewSshKeyFingerprints
+    from github_client.models.app import App
+    from github_client.models.app1 import App1
+    from github_client.models.app10 import App10
+    from github_client.models.app11 import App11
+    from github_client.models.app12 import App12
+    from github_client.models.app13 import App13
+    from github_client.models.app14 import App14
+    from github_client.models.app15 import App15
+    from github_client.models.app16 import App16
+    from github_client.models.app1_permissions import App1Permissions
+    from github_client.models.app2 import App2
+    from github_client.models.app2_permissions import App2Permissions
+    from github_client.models.app3 import App3
+    from github_client.models.app3_permissions import App3Permissions
+    from github_client.models.app4 import App4
+    from github_client.models.app5 import App5
+    from github_client.models.app6 import App6
+    from github_client.models.app7 import App7
+    from github_client.models.app8 import App8
+    from github_client.models.app9 import App9
+    from github_client.models.app_permissions import AppPermissions
+    from github_client.models.apps_check_token_request import AppsCheckTokenRequest
+    from github_client.models.apps_create_from_manifest201_response import AppsCreateFromManifest201Response
+    from github_client.models.apps_create_installation_access_token_request import AppsCreateInstallationAccessTokenRequest
+    from github_client.models.apps_delete_authorization_request import AppsDeleteAuthorizationRequest
+    from github_client.models.apps_list_installation_repos_for_authenticated_user200_response import AppsListInstallationReposForAuthenticatedUser200Response
+    from github_client.models.apps_list_repos_accessible_to_installation200_response import AppsListReposAccessibleToInstallation200Response
+    from github_client.models.apps_scope_token_request import AppsScopeTokenRequest
+    from github_client.models.apps_update_webhook_config_for_app_request import AppsUpdateWebhookConfigForAppRequest
+    from github_client.models.artifact import Artifact
+    from github_client.models.artifact_workflow_run import ArtifactWorkflowRun
+    from github_client.models.assigned_issue_event import AssignedIssueEvent
+    from github_client.models.authentication_token import AuthenticationToken
+    from github_client.models.author_association import AuthorAssociation
+    from github_client.models.authorization import Authorization
+    from github_client.models.authorization_app import AuthorizationApp
+    from github_client.models.auto_merge import AutoMerge
+    from github_client.models.autolink import Autolink
+    from github_client.models.base_gist import BaseGist
+    from github_client.models.base_gist_files_value import BaseGistFilesValue
+    from github_client.models.basic_error import BasicError
+    from github_client.models.billing_premium_request_usage_report_org import BillingPremiumRequestUsageReportOrg
+    from github_client.models.billing_premium_request_usage_report_org_time_period import BillingPremiumRequestUsageReportOrgTimePeriod
+    from github_client.models.billing_premium_request_usage_report_org_usage_items_inner import BillingPremiumRequestUsageReportOrgUsageItemsInner
+    from github_client.models.billing_premium_request_usage_report_user import BillingPremiumRequestUsageReportUser
+    from github_client.models.billing_update_budget_org200_response import BillingUpdateBudgetOrg200Response
+    from github_client.models.billing_update_budget_org200_response_budget import BillingUpdateBudgetOrg200ResponseBudget
+    from github_client.models.billing_update_budget_org200_response_budget_budget_alerting import BillingUpdateBudgetOrg200ResponseBudgetBudgetAlerting
+    from github_client.models.billing_update_budget_org_request import BillingUpdateBudgetOrgRequest
+    from github_client.models.billing_update_budget_org_request_budget_alerting import BillingUpdateBudgetOrgRequestBudgetAlerting
+    from github_client.models.billing_usage_report import BillingUsageReport
+    from github_client.models.billing_usage_report_usage_items_inner import BillingUsageReportUsageItemsInner
+    from github_client.models.billing_usage_report_user import BillingUsageReportUser
+    from github_client.models.billing_usage_report_user_usage_items_inner import BillingUsageReportUserUsageItemsInner
+    from github_client.models.billing_usage_summary_report_org import BillingUsageSummaryReportOrg
+    from github_client.models.billing_usage_summary_report_org_usage_items_inner import BillingUsageSummaryReportOrgUsageItemsInner
+    from github_client.models.billing_usage_summary_report_user import BillingUsageSummaryReportUser
+    from github_client.models.blob import Blob
+    from github_client.models.branch_protection import BranchProtection
+    from github_client.models.branch_protection_allow_fork_syncing import BranchProtectionAllowForkSyncing
+    from github_client.models.branch_protection_lock_branch import BranchProtectionLockBranch
+    from github_client.models.branch_protection_required_linear_history import BranchProtectionRequiredLinearHistory
+    from github_client.models.branch_protection_required_signatures import BranchProtectionRequiredSignatures
+    from github_client.models.branch_restriction_policy import BranchRestrictionPolicy
+    from github_client.models.branch_restriction_policy_apps_inner import BranchRestrictionPolicyAppsInner
+    from github_client.models.branch_restriction_policy_apps_inner_owner import BranchRestrictionPolicyAppsInnerOwner
+    from github_client.models.branch_restriction_policy_apps_inner_permissions import BranchRestrictionPolicyAppsInnerPermissions
+    from github_client.models.branch_restriction_policy_users_inner import BranchRestrictionPolicyUsersInner
+    from github_client.models.branch_short import BranchShort
+    from github_client.models.branch_short_commit import BranchShortCommit
+    from github_client.models.branch_with_protection import BranchWithProtection
+    from github_client.models.branch_with_protection_links import BranchWithProtectionLinks
+    from github_client.models.budget import Budget
+    from github_client.models.budget_budget_alerting import BudgetBudgetAlerting
+    from github_client.models.campaign_alert_type import CampaignAlertType
+    from github_client.models.campaign_state import CampaignState
+    from github_client.models.campaign_summary import CampaignSummary
+    from github_client.models.campaign_summary_alert_stats import CampaignSummaryAlertStats
+    from github_client.models.campaigns_create_campaign_request import CampaignsCreateCampaignRequest
+    from github_client.models.campaigns_create_campaign_request_code_scanning_alerts_inner import CampaignsCreateCampaignRequestCodeScanningAlertsInner
+    from github_client.models.campaigns_update_campaign_request import CampaignsUpdateCampaignRequest
+    from github_client.models.check_annotation import CheckAnnotation
+    from github_client.models.check_automated_security_fixes import CheckAutomatedSecurityFixes
+    from github_client.models.check_immutable_releases import CheckImmutableReleases
+    from github_client.models.check_run import CheckRun
+    from github_client.models.check_run_check_suite import CheckRunCheckSuite
+    from github_client.models.check_run_output import CheckRunOutput
+    from github_client.models.check_run_pull_request import CheckRunPullRequest
+    from github_client.models.check_run_pull_request_base import CheckRunPullRequestBase
+    from github_client.models.check_run_with_simple_check_suite import CheckRunWithSimpleCheckSuite
+    from github_client.models.check_run_with_simple_check_suite_output import CheckRunWithSimpleCheckSuiteOutput
+    from github_client.models.check_suite import CheckSuite
+    from github_client.models.check_suite_preference import CheckSuitePreference
+    from github_client.models.check_suite_preference_preferences import CheckSuitePreferencePreferences
+    from github_client.models.check_suite_preference_preferences_auto_trigger_checks_inner import CheckSuitePreferencePreferencesAutoTriggerChecksInner
+    from github_client.models.checks_create_request import ChecksCreateRequest
+    from github_client.models.checks_create_request_actions_inner import ChecksCreateRequestActionsInner
+    from github_client.models.checks_create_request_one_of import ChecksCreateRequestOneOf
+    from github_client.models.checks_create_request_one_of1 import ChecksCreateRequestOneOf1
+    from github_client.models.checks_create_request_output import ChecksCreateRequestOutput
+    from github_client.models.checks_create_request_output_annotations_inner import ChecksCreateRequestOutputAnnotationsInner
+    from github_client.models.checks_create_request_output_images_inner import ChecksCreateRequestOutputImagesInner
+    from github_client.models.checks_create_suite_request import ChecksCreateSuiteRequest
+    from github_client.models.checks_list_for_suite200_response import ChecksListForSuite200Response
+    from github_client.models.checks_list_suites_for_ref200_response import ChecksListSuitesForRef200Response
+    from github_client.models.checks_set_suites_preferences_request import ChecksSetSuitesPreferencesRequest
+    from github_client.models.checks_set_suites_preferences_request_auto_trigger_checks_inner import ChecksSetSuitesPreferencesRequestAutoTriggerChecksInner
+    from github_client.models.checks_update_request import ChecksUpdateRequest
+    from github_client.models.checks_update_request_any_of import ChecksUpdateRequestAnyOf
+    from github_client.models.checks_update_request_output import ChecksUpdateRequestOutput
+    from github_client.models.classroom import Classroom
+    from github_client.models.classroom_accepted_assignment import ClassroomAcceptedAssignment
+    from github_client.models.classroom_assignment import ClassroomAssignment
+    from github_client.models.classroom_assignment_grade import ClassroomAssignmentGrade
+    from github_client.models.clone_traffic import CloneTraffic
+    from github_client.models.code_of_conduct import CodeOfConduct
+    from github_client.models.code_of_conduct_simple import CodeOfConductSimple
+    from github_client.models.code_scanning_alert import CodeScanningAlert
+    from github_client.models.code_scanning_alert_classification import CodeScanningAlertClassification
+    from github_client.models.code_scanning_alert_dismissed_reason import CodeScanningAlertDismissedReason
+    from github_client.models.code_scanning_alert_instance import CodeScanningAlertInstance
+    from github_client.models.code_scanning_alert_instance_message import CodeScanningAlertInstanceMessage
+    from github_client.models.code_scanning_alert_items import CodeScanningAlertItems
+    from github_client.models.code_scanning_alert_location import CodeScanningAlertLocation
+    from github_client.models.code_scanning_alert_rule import CodeScanningAlertRule
+    from github_client.models.code_scanning_alert_rule_summary import CodeScanningAlertRuleSummary
+    from github_client.models.code_scanning_alert_set_state import CodeScanningAlertSetState
+    from github_client.models.code_scanning_alert_severity import CodeScanningAlertSeverity
+    from github_client.models.code_scanning_alert_state import CodeScanningAlertState
+    from github_client.models.code_scanning_alert_state_query import CodeScanningAlertStateQuery
+    from github_client.models.code_scanning_analysis import CodeScanningAnalysis
+    from github_client.models.code_scanning_analysis_deletion import CodeScanningAnalysisDeletion
+    from github_client.models.code_scanning_analysis_tool import CodeScanningAnalysisTool
+    from github_client.models.code_scanning_autofix import CodeScanningAutofix
+    from github_client.models.code_scanning_autofix_commits import CodeScanningAutofixCommits
+    from github_client.models.code_scanning_autofix_commits_response import CodeScanningAutofixCommitsResponse
+    from github_client.models.code_scanning_autofix_status import CodeScanningAutofixStatus
+    from github_client.models.code_scanning_codeql_database import CodeScanningCodeqlDatabase
+    from github_client.models.code_scanning_create_variant_analysis_request import CodeScanningCreateVariantAnalysisRequest
+    from github_client.models.code_scanning_default_setup import CodeScanningDefaultSetup
+    from github_client.models.code_scanning_default_setup_options import CodeScanningDefaultSetupOptions
+    from github_client.models.code_scanning_default_setup_update import CodeScanningDefaultSetupUpdate
+    from github_client.models.code_scanning_default_setup_update_response import CodeScanningDefaultSetupUpdateResponse
+    from github_client.models.code_scanning_options import CodeScanningOptions
+    from github_client.models.code_scanning_organization_alert_items import CodeScanningOrganizationAlertItems
+    from github_client.models.code_scanning_sarifs_receipt import CodeScanningSarifsReceipt
+    from github_client.models.code_scanning_sarifs_status import CodeScanningSarifsStatus
+    from github_client.models.code_scanning_update_alert_request import CodeScanningUpdateAlertRequest
+    from github_client.models.code_scanning_upload_sarif_request import CodeScanningUploadSarifRequest
+    from github_client.models.code_scanning_variant_analysis import CodeScanningVariantAnalysis
+    from github_client.models.code_scanning_variant_analysis_language import CodeScanningVariantAnalysisLanguage
+    from github_client.models.code_scanning_variant_analysis_repo_task import CodeScanningVariantAnalysisRepoTask
+    from github_client.models.code_scanning_variant_analysis_repository import CodeScanningVariantAnalysisRepository
+    from github_client.models.code_scanning_variant_analysis_scanned_repositories_inner import CodeScanningVariantAnalysisScannedRepositoriesInner
+    from github_client.models.code_scanning_variant_analysis_skipped_repo_group import CodeScanningVariantAnalysisSkippedRepoGroup
+    from github_client.models.code_scanning_variant_analysis_skipped_repositories import CodeScanningVariantAnalysisSkippedRepositories
+    from github_client.models.code_scanning_variant_analysis_skipped_repositories_not_found_repos import CodeScanningVariantAnalysisSkippedRepositoriesNotFoundRepos
+    from github_client.models.code_scanning_variant_analysis_status import CodeScanningVariantAnalysisStatus
+    from github_client.models.code_search_result_item import CodeSearchResultItem
+    from github_client.models.code_security_attach_configuration_request import CodeSecurityAttachConfigurationRequest
+    from github_client.models.code_security_attach_enterprise_configuration_request import CodeSecurityAttachEnterpriseConfigurationRequest
+    from github_client.models.code_security_configuration import CodeSecurityConfiguration
+    from github_client.models.code_security_configuration_code_scanning_default_setup_options import CodeSecurityConfigurationCodeScanningDefaultSetupOptions
+    from github_client.models.code_security_configuration_code_scanning_options import CodeSecurityConfigurationCodeScanningOptions
+    from github_client.models.code_security_configuration_for_repository import CodeSecurityConfigurationForRepository
+    from github_client.models.code_security_configuration_repositories import CodeSecurityConfigurationRepositories
+    from github_client.models.code_security_create_configuration_for_enterprise_request import CodeSecurityCreateConfigurationForEnterpriseRequest
+    from github_client.models.code_security_create_configuration_for_enterprise_request_dependency_graph_autosubmit_action_options import CodeSecurityCreateConfigurationForEnterpriseRequestDependencyGraphAutosubmitActionOptions
+    from github_client.models.code_security_create_configuration_request import CodeSecurityCreateConfigurationRequest
+    from github_client.models.code_security_create_configuration_request_secret_scanning_delegated_bypass_options import CodeSecurityCreateConfigurationRequestSecretScanningDelegatedBypassOptions
+    from github_client.models.code_security_create_configuration_request_secret_scanning_delegated_bypass_options_reviewers_inner import CodeSecurityCreateConfigurationRequestSecretScanningDelegatedBypassOptionsReviewersInner
+    from github_client.models.code_security_default_configurations_inner import CodeSecurityDefaultConfigurationsInner
+    from github_client.models.code_security_detach_configuration_request import CodeSecurityDetachConfigurationRequest
+    from github_client.models.code_security_set_configuration_as_default_for_enterprise200_response import CodeSecuritySetConfigurationAsDefaultForEnterprise200Response
+    from github_client.models.code_security_set_configuration_as_default_for_enterprise_request import CodeSecuritySetConfigurationAsDefaultForEnterpriseRequest
+    from github_client.models.code_security_update_configuration_request import CodeSecurityUpdateConfigurationRequest
+    from github_client.models.code_security_update_enterprise_configuration_request import CodeSecurityUpdateEnterpriseConfigurationRequest
+    from github_client.models.code_security_update_enterprise_configuration_request_dependency_graph_autosubmit_action_options import CodeSecurityUpdateEnterpriseConfigurationRequestDependencyGraphAutosubmitActionOptions
+    from github_client.models.codeowners_errors import CodeownersErrors
+    from github_client.models.codeowners_errors_errors_inner import CodeownersErrorsErrorsInner
+    from github_client.models.codespace import Codespace
+    from github_client.models.codespace_export_details import CodespaceExportDetails
+    from github_client.models.codespace_git_status import CodespaceGitStatus
+    from github_client.models.codespace_machine import CodespaceMachine
+    from github_client.models.codespace_runtime_constraints import CodespaceRuntimeConstraints
+    from github_client.models.codespace_with_full_repository import CodespaceWithFullRepository
+    from github_client.models.codespaces_create_for_authenticated_user_request import CodespacesCreateForAuthenticatedUserRequest
+    from github_client.models.codespaces_create_for_authenticated_user_request_one_of import CodespacesCreateForAuthenticatedUserRequestOneOf
+    from github_client.models.codespaces_create_for_authenticated_user_request_one_of1 import CodespacesCreateForAuthenticatedUserRequestOneOf1
+    from github_client.models.codespaces_create_for_authenticated_user_request_one_of1_pull_request import CodespacesCreateForAuthenticatedUserRequestOneOf1PullRequest
+    from github_client.models.codespaces_create_or_update_org_secret_request import CodespacesCreateOrUpdateOrgSecretRequest
+    from github_client.models.codespaces_create_or_update_repo_secret_request import CodespacesCreateOrUpdateRepoSecretRequest
+    from github_client.models.codespaces_create_or_update_secret_for_authenticated_user_request import CodespacesCreateOrUpdateSecretForAuthenticatedUserRequest
+    from github_client.models.codespaces_create_with_pr_for_authenticated_user_request import CodespacesCreateWithPrForAuthenticatedUserRequest
+    from github_client.models.codespaces_create_with_repo_for_authenticated_user_request import CodespacesCreateWithRepoForAuthenticatedUserRequest
+    from github_client.models.codespaces_delete_codespaces_access_users_request import CodespacesDeleteCodespacesAccessUsersRequest
+    from github_client.models.codespaces_list_devcontainers_in_repository_for_authenticated_user200_response import CodespacesListDevcontainersInRepositoryForAuthenticatedUser200Response
+    from github_client.models.codespaces_list_devcontainers_in_repository_for_authenticated_user200_response_devcontainers_inner import CodespacesListDevcontainersInRepositoryForAuthenticatedUser200ResponseDevcontainersInner
+    from github_client.models.codespaces_list_in_organization200_response import CodespacesListInOrganization200Response
+    from github_client.models.codespaces_list_org_secrets200_response import CodespacesListOrgSecrets200Response
+    from github_client.models.codespaces_list_repo_secrets200_response import CodespacesListRepoSecrets200Response
+    from github_client.models.codespaces_list_secrets_for_authenticated_user200_response import CodespacesListSecretsForAuthenticatedUser200Response
+    from github_client.models.codespaces_org_secret import CodespacesOrgSecret
+    from github_client.models.codespaces_permissions_check_for_devcontainer import CodespacesPermissionsCheckForDevcontainer
+    from github_client.models.codespaces_pre_flight_with_repo_for_authenticated_user200_response import CodespacesPreFlightWithRepoForAuthenticatedUser200Response
+    from github_client.models.codespaces_pre_flight_with_repo_for_authenticated_user200_response_defaults import CodespacesPreFlightWithRepoForAuthenticatedUser200ResponseDefaults
+    from github_client.models.codespaces_public_key import CodespacesPublicKey
+    from github_client.models.codespaces_publish_for_authenticated_user_request import CodespacesPublishForAuthenticatedUserRequest
+    from github_client.models.codespaces_repo_machines_for_authenticated_user200_response import CodespacesRepoMachinesForAuthenticatedUser200Response
+    from github_client.models.codespaces_secret import CodespacesSecret
+    from github_client.models.codespaces_set_codespaces_access_request import CodespacesSetCodespacesAccessRequest
+    from github_client.models.codespaces_set_codespaces_access_users_request import CodespacesSetCodespacesAccessUsersRequest
+    from github_client.models.codespaces_set_repositories_for_secret_for_authenticated_user_request import CodespacesSetRepositoriesForSecretForAuthenticatedUserRequest
+    from github_client.models.codespaces_set_selected_repos_for_org_secret_request import CodespacesSetSelectedReposForOrgSecretRequest
+    from github_client.models.codespaces_update_for_authenticated_user_request import CodespacesUpdateForAuthenticatedUserRequest
+    from github_client.models.codespaces_user_public_key import CodespacesUserPublicKey
+    from github_client.models.collaborator import Collaborator
+    from github_client.models.collaborator_permissions import CollaboratorPermissions
+    from github_client.models.combined_billing_usage import CombinedBillingUsage
+    from github_client.models.combined_commit_status import CombinedCommitStatus
+    from github_client.models.commit import Commit
+    from github_client.models.commit1 import Commit1
+    from github_client.models.commit_activity import CommitActivity
+    from github_client.models.commit_author import CommitAuthor
+    from github_client.models.commit_comment import CommitComment
+    from github_client.models.commit_commit import CommitCommit
+    from github_client.models.commit_commit_tree import CommitCommitTree
+    from github_client.models.commit_comparison import CommitComparison
+    from github_client.models.commit_parents_inner import CommitParentsInner
+    from github_client.models.commit_search_result_item import CommitSearchResultItem
+    from github_client.models.commit_search_result_item_commit import CommitSearchResultItemCommit
+    from github_client.models.commit_search_result_item_commit_author import CommitSearchResultItemCommitAuthor
+    from github_client.models.commit_stats import CommitStats
+    from github_client.models.committer import Committer
+    from github_client.models.committer1 import Committer1
+    from github_client.models.community_profile import CommunityProfile
+    from github_client.models.community_profile_files import CommunityProfileFiles
+    from github_client.models.container_metadata import ContainerMetadata
+    from github_client.models.content_directory_inner import ContentDirectoryInner
+    from github_client.models.content_file import ContentFile
+    from github_client.models.content_submodule import ContentSubmodule
+    from github_client.models.content_symlink import ContentSymlink
+    from github_client.models.content_traffic import ContentTraffic
+    from github_client.models.content_tree import ContentTree
+    from github_client.models.content_tree_entries_inner import ContentTreeEntriesInner
+    from github_client.models.content_tree_entries_inner_links import ContentTreeEntriesInnerLinks
+    from github_client.models.contributor import Contributor
+    from github_client.models.contributor_activity import ContributorActivity
+    from github_client.models.contributor_activity_weeks_inner import ContributorActivityWeeksInner
+    from github_client.models.converted_note_to_issue_issue_event import ConvertedNoteToIssueIssueEvent
+    from github_client.models.copilot_add_copilot_seats_for_teams201_response import CopilotAddCopilotSeatsForTeams201Response
+    from github_client.models.copilot_add_copilot_seats_for_teams_request import CopilotAddCopilotSeatsForTeamsRequest
+    from github_client.models.copilot_add_copilot_seats_for_users201_response import CopilotAddCopilotSeatsForUsers201Response
+    from github_client.models.copilot_add_copilot_seats_for_users_request import CopilotAddCopilotSeatsForUsersRequest
+    from github_client.models.copilot_cancel_copilot_seat_assignment_for_teams200_response import CopilotCancelCopilotSeatAssignmentForTeams200Response
+    from github_client.models.copilot_cancel_copilot_seat_assignment_for_teams_request import CopilotCancelCopilotSeatAssignmentForTeamsRequest
+    from github_client.models.copilot_cancel_copilot_seat_assignment_for_users200_response import CopilotCancelCopilotSeatAssignmentForUsers200Response
+    from github_client.models.copilot_cancel_copilot_seat_assignment_for_users_request import CopilotCancelCopilotSeatAssignmentForUsersRequest
+    from github_client.models.copilot_dotcom_chat import CopilotDotcomChat
+    from github_client.models.copilot_dotcom_chat_models_inner import CopilotDotcomChatModelsInner
+    from github_client.models.copilot_dotcom_pull_requests import CopilotDotcomPullRequests
+    from github_client.models.copilot_dotcom_pull_requests_repositories_inner import CopilotDotcomPullRequestsRepositoriesInner
+    from github_client.models.copilot_dotcom_pull_requests_repositories_inner_models_inner import CopilotDotcomPullRequestsRepositoriesInnerModelsInner
+    from github_client.models.copilot_ide_chat import CopilotIdeChat
+    from github_client.models.copilot_ide_chat_editors_inner import CopilotIdeChatEditorsInner
+    from github_client.models.copilot_ide_chat_editors_inner_models_inner import CopilotIdeChatEditorsInnerModelsInner
+    from github_client.models.copilot_ide_code_completions import CopilotIdeCodeCompletions
+    from github_client.models.copilot_ide_code_completions_editors_inner import CopilotIdeCodeCompletionsEditorsInner
+    from github_client.models.copilot_ide_code_completions_editors_inner_models_inner import CopilotIdeCodeCompletionsEditorsInnerModelsInner
+    from github_client.models.copilot_ide_code_completions_editors_inner_models_inner_languages_inner import CopilotIdeCodeCompletionsEditorsInnerModelsInnerLanguagesInner
+    from github_client.models.copilot_ide_code_completions_languages_inner import CopilotIdeCodeCompletionsLanguagesInner
+    from github_client.models.copilot_list_copilot_seats200_response import CopilotListCopilotSeats200Response
+    from github_client.models.copilot_organization_details import CopilotOrganizationDetails
+    from github_client.models.copilot_organization_seat_breakdown import CopilotOrganizationSeatBreakdown
+    from github_client.models.copilot_seat_details import CopilotSeatDetails
+    from github_client.models.copilot_seat_details_assigning_team import CopilotSeatDetailsAssigningTeam
+    from github_client.models.copilot_usage_metrics_day import CopilotUsageMetricsDay
+    from github_client.models.credentials_revoke_request import CredentialsRevokeRequest
+    from github_client.models.custom_deployment_rule_app import CustomDeploymentRuleApp
+    from github_client.models.custom_property import CustomProperty
+    from github_client.models.custom_property_default_value import CustomPropertyDefaultValue
+    from github_client.models.custom_property_set_payload import CustomPropertySetPayload
+    from github_client.models.custom_property_value import CustomPropertyValue
+    from github_client.models.custom_property_value_value import CustomPropertyValueValue
+    from github_client.models.cvss_severities import CvssSeverities
+    from github_client.models.cvss_severities_cvss_v3 import CvssSeveritiesCvssV3
+    from github_client.models.cvss_severities_cvss_v4 import CvssSeveritiesCvssV4
+    from github_client.models.delete_budget import DeleteBudget
+    from github_client.models.demilestoned_issue_event import DemilestonedIssueEvent
+    from github_client.models.dependabot_alert import DependabotAlert
+    from github_client.models.dependabot_alert_package import DependabotAlertPackage
+    from github_client.models.dependabot_alert_security_advisory import DependabotAlertSecurityAdvisory
+    from github_client.models.dependabot_alert_security_advisory_cvss import DependabotAlertSecurityAdvisoryCvss
+    from github_client.models.dependabot_alert_security_advisory_cwes_inner import DependabotAlertSecurityAdvisoryCwesInner
+    from github_client.models.dependabot_alert_security_advisory_identifiers_inner import DependabotAlertSecurityAdvisoryIdentifiersInner
+    from github_client.models.dependabot_alert_security_advisory_references_inner import DependabotAlertSecurityAdvisoryReferencesInner
+    from github_client.models.dependabot_alert_security_vulnerability import DependabotAlertSecurityVulnerability
+    from github_client.models.dependabot_alert_security_vulnerability_first_patched_version import DependabotAlertSecurityVulnerabilityFirstPatchedVersion
+    from github_client.models.dependabot_alert_with_repository import DependabotAlertWithRepository
+    from github_client.models.dependabot_alert_with_repository_dependency import DependabotAlertWithRepositoryDependency
+    from github_client.models.dependabot_create_or_update_org_secret_request import DependabotCreateOrUpdateOrgSecretRequest
+    from github_client.models.dependabot_create_or_update_org_secret_request_selected_repository_ids_inner import DependabotCreateOrUpdateOrgSecretRequestSelectedRepositoryIdsInner
+    from github_client.models.dependabot_create_or_update_repo_secret_request import DependabotCreateOrUpdateRepoSecretRequest
+    from github_client.models.dependabot_list_alerts_for_enterprise_has_parameter import DependabotListAlertsForEnterpriseHasParameter
+    from github_client.models.dependabot_list_alerts_for_org_has_parameter import DependabotListAlertsForOrgHasParameter
+    from github_client.models.dependabot_list_org_secrets200_response import DependabotListOrgSecrets200Response
+    from github_client.models.dependabot_list_repo_secrets200_response import DependabotListRepoSecrets200Response
+    from github_client.models.dependabot_public_key import DependabotPublicKey
+    from github_client.models.dependabot_repository_access_details import DependabotRepositoryAccessDetails
+    from github_client.models.dependabot_secret import DependabotSecret
+    from github_client.models.dependabot_set_repository_access_default_level_request import DependabotSetRepositoryAccessDefaultLevelRequest
+    from github_client.models.dependabot_set_selected_repos_for_org_secret_request import DependabotSetSelectedReposForOrgSecretRequest
+    from github_client.models.dependabot_update_alert_request import DependabotUpdateAlertRequest
+    from github_client.models.dependabot_update_repository_access_for_org_request import DependabotUpdateRepositoryAccessForOrgRequest
+    from github_client.models.dependency import Dependency
+    from github_client.models.dependency_graph_create_repository_snapshot201_response import DependencyGraphCreateRepositorySnapshot201Response
+    from github_client.models.dependency_graph_diff_inner import DependencyGraphDiffInner
+    from github_client.models.dependency_graph_diff_inner_vulnerabilities_inner import DependencyGraphDiffInnerVulnerabilitiesInner
+    from github_client.models.dependency_graph_spdx_sbom import DependencyGraphSpdxSbom
+    from github_client.models.dependency_graph_spdx_sbom_sbom import DependencyGraphSpdxSbomSbom
+    from github_client.models.dependency_graph_spdx_sbom_sbom_creation_info import DependencyGraphSpdxSbomSbomCreationInfo
+    from github_client.models.dependency_graph_spdx_sbom_sbom_packages_inner import DependencyGraphSpdxSbomSbomPackagesInner
+    from github_client.models.dependency_graph_spdx_sbom_sbom_packages_inner_external_refs_inner import DependencyGraphSpdxSbomSbomPackagesInnerExternalRefsInner
+    from github_client.models.dependency_graph_spdx_sbom_sbom_relationships_inner import DependencyGraphSpdxSbomSbomRelationshipsInner
+    from github_client.models.deploy_key import DeployKey
+    from github_client.models.deployment import Deployment
+    from github_client.models.deployment1 import Deployment1
+    from github_client.models.deployment1_payload import Deployment1Payload
+    from github_client.models.deployment_branch_policy import DeploymentBranchPolicy
+    from github_client.models.deployment_branch_policy_name_pattern import DeploymentBranchPolicyNamePattern
+    from github_client.models.deployment_branch_policy_name_pattern_with_type import DeploymentBranchPolicyNamePatternWithType
+    from github_client.models.deployment_branch_policy_settings import DeploymentBranchPolicySettings
+    from github_client.models.deployment_payload import DeploymentPayload
+    from github_client.models.deployment_protection_rule import DeploymentProtectionRule
+    from github_client.models.deployment_reviewer_type import DeploymentReviewerType
+    from github_client.models.deployment_simple import DeploymentSimple
+    from github_client.models.deployment_status import DeploymentStatus
+    from github_client.models.deployment_workflow_run import DeploymentWorkflowRun
+    from github_client.models.deployment_workflow_run1 import DeploymentWorkflowRun1
+    from github_client.models.deployment_workflow_run1_head_repository import DeploymentWorkflowRun1HeadRepository
+    from github_client.models.deployment_workflow_run2 import DeploymentWorkflowRun2
+    from github_client.models.deployment_workflow_run3 import DeploymentWorkflowRun3
+    from github_client.models.deployment_workflow_run4 import DeploymentWorkflowRun4
+    from github_client.models.deployment_workflow_run_head_repository import DeploymentWorkflowRunHeadRepository
+    from github_client.models.deployment_workflow_run_head_repository_owner import DeploymentWorkflowRunHeadRepositoryOwner
+    from github_client.models.deployment_workflow_run_referenced_workflows_inner import DeploymentWorkflowRunReferencedWorkflowsInner
+    from github_client.models.diff_entry import DiffEntry
+    from github_client.models.discussion import Discussion
+    from github_client.models.discussion_category import DiscussionCategory
+    from github_client.models.docker_metadata import DockerMetadata
+    from github_client.models.email import Email
+    from github_client.models.enabled_repositories import EnabledRepositories
+    from github_client.models.enterprise import Enterprise
+    from github_client.models.enterprise_team import EnterpriseTeam
+    from github_client.models.enterprise_team_memberships_bulk_add_request import EnterpriseTeamMembershipsBulkAddRequest
+    from github_client.models.enterprise_team_memberships_bulk_remove_request import EnterpriseTeamMembershipsBulkRemoveRequest
+    from github_client.models.enterprise_team_organizations_bulk_add_request import EnterpriseTeamOrganizationsBulkAddRequest
+    from github_client.models.enterprise_team_organizations_bulk_remove_request import EnterpriseTeamOrganizationsBulkRemoveRequest
+    from github_client.models.enterprise_teams_create_request import EnterpriseTeamsCreateRequest
+    from github_client.models.enterprise_teams_update_request import EnterpriseTeamsUpdateRequest
+    from github_client.models.enterprise_webhooks import EnterpriseWebhooks
+    from github_client.models.environment import Environment
+    from github_client.models.environment_approvals import EnvironmentApprovals
+    from github_client.models.environment_approvals_environments_inner import EnvironmentApprovalsEnvironmentsInner
+    from github_client.models.environment_protection_rules_inner import EnvironmentProtectionRulesInner
+    from github_client.models.environment_protection_rules_inner_any_of import EnvironmentProtectionRulesInnerAnyOf
+    from github_client.models.environment_protection_rules_inner_any_of1 import EnvironmentProtectionRulesInnerAnyOf1
+    from github_client.models.environment_protection_rules_inner_any_of2 import EnvironmentProtectionRulesInnerAnyOf2
+    from github_client.models.event import Event
+    from github_client.models.event_payload import EventPayload
+    from github_client.models.event_payload_pages_inner import EventPayloadPagesInner
+    from github_client.models.event_repo import EventRepo
+    from github_client.models.feed import Feed
+    from github_client.models.feed_links import FeedLinks
+    from github_client.models.file_commit import FileCommit
+    from github_client.models.file_commit_commit import FileCommitCommit
+    from github_client.models.file_commit_commit_author import FileCommitCommitAuthor
+    from github_client.models.file_commit_commit_parents_inner import FileCommitCommitParentsInner
+    from github_client.models.file_commit_commit_tree import FileCommitCommitTree
+    from github_client.models.file_commit_commit_verification import FileCommitCommitVerification
+    from github_client.models.file_commit_content import FileCommitContent
+    from github_client.models.file_commit_content_links import FileCommitContentLinks
+    from github_client.models.full_repository import FullRepository
+    from github_client.models.full_repository_permissions import FullRepositoryPermissions
+    from github_client.models.get_all_budgets import GetAllBudgets
+    from github_client.models.get_budget import GetBudget
+    from github_client.models.get_budget_budget_alerting import GetBudgetBudgetAlerting
+    from github_client.models.gist import Gist
+    from github_client.models.gist_comment import GistComment
+    from github_client.models.gist_commit import GistCommit
+    from github_client.models.gist_files_value import GistFilesValue
+    from github_client.models.gist_history import GistHistory
+    from github_client.models.gist_history_change_status import GistHistoryChangeStatus
+    from github_client.models.gist_simple import GistSimple
+    from github_client.models.gist_simple_files_value import GistSimpleFilesValue
+    from github_client.models.gist_simple_forks_inner import GistSimpleForksInner
+    from github_client.models.gists_create_comment_request import GistsCreateCommentRequest
+    from github_client.models.gists_create_request import GistsCreateRequest
+    from github_client.models.gists_create_request_files_value import GistsCreateRequestFilesValue
+    from github_client.models.gists_create_request_public import GistsCreateRequestPublic
+    from github_client.models.gists_get403_response import GistsGet403Response
+    from github_client.models.gists_get403_response_block import GistsGet403ResponseBlock
+    from github_client.models.gists_update_request import GistsUpdateRequest
+    from github_client.models.gists_update_request_files_value import GistsUpdateRequestFilesValue
+    from github_client.models.git_commit import GitCommit
+    from github_client.models.git_commit_author import GitCommitAuthor
+    from github_client.models.git_commit_parents_inner import GitCommitParentsInner
+    from github_client.models.git_commit_tree import GitCommitTree
+    from github_client.models.git_commit_verification import GitCommitVerification
+    from github_client.models.git_create_blob422_response import GitCreateBlob422Response
+    from github_client.models.git_create_blob_request import GitCreateBlobRequest
+    from github_client.models.git_create_commit_request import GitCreateCommitRequest
+    from github_client.models.git_create_commit_request_author import GitCreateCommitRequestAuthor
+    from github_client.models.git_create_commit_request_committer import GitCreateCommitRequestCommitter
+    from github_client.models.git_create_ref_request import GitCreateRefRequest
+    from github_client.models.git_create_tag_request import GitCreateTagRequest
+    from github_client.models.git_create_tag_request_tagger import GitCreateTagRequestTagger
+    from github_client.models.git_create_tree_request import GitCreateTreeRequest
+    from github_client.models.git_create_tree_request_tree_inner import GitCreateTreeRequestTreeInner
+    from github_client.models.git_ref import GitRef
+    from github_client.models.git_ref_object import GitRefObject
+    from github_client.models.git_tag import GitTag
+    from github_client.models.git_tag_object import GitTagObject
+    from github_client.models.git_tag_tagger import GitTagTagger
+    from github_client.models.git_tree import GitTree
+    from github_client.models.git_tree_tree_inner import GitTreeTreeInner
+    from github_client.models.git_update_ref_request import GitUpdateRefRequest
+    from github_client.models.gitignore_template import GitignoreTemplate
+    from github_client.models.global_advisory import GlobalAdvisory
+    from github_client.models.global_advisory_credits_inner import GlobalAdvisoryCreditsInner
+    from github_client.models.global_advisory_cvss import GlobalAdvisoryCvss
+    from github_client.models.global_advisory_cwes_inner import GlobalAdvisoryCwesInner
+    from github_client.models.global_advisory_identifiers_inner import GlobalAdvisoryIdentifiersInner
+    from github_client.models.gpg_key import GpgKey
+    from github_client.models.gpg_key_emails_inner import GpgKeyEmailsInner
+    from github_client.models.gpg_key_subkeys_inner import GpgKeySubkeysInner
+    from github_client.models.hook import Hook
+    from github_client.models.hook_delivery import HookDelivery
+    from github_client.models.hook_delivery_item import HookDeliveryItem
+    from github_client.models.hook_delivery_request import HookDeliveryRequest
+    from github_client.models.hook_delivery_response import HookDeliveryResponse
+    from github_client.models.hook_response import HookResponse
+    from github_client.models.hosted_compute_create_network_configuration_for_org_request import HostedComputeCreateNetworkConfigurationForOrgRequest
+    from github_client.models.hosted_compute_list_network_configurations_for_org200_response import HostedComputeListNetworkConfigurationsForOrg200Response
+    from github_client.models.hosted_compute_update_network_configuration_for_org_request import HostedComputeUpdateNetworkConfigurationForOrgRequest
+    from github_client.models.hovercard import Hovercard
+    from github_client.models.hovercard_contexts_inner import HovercardContextsInner
+    from github_client.models.immutable_releases_organization_settings import ImmutableReleasesOrganizationSettings
+    from github_client.models.import_project_choices_inner import ImportProjectChoicesInner
+    from github_client.models.installation import Installation
+    from github_client.models.installation_account import InstallationAccount
+    from github_client.models.installation_token import InstallationToken
+    from github_client.models.integration import Integration
+    from github_client.models.integration_installation_request import IntegrationInstallationRequest
+    from github_client.models.integration_installation_request_account import IntegrationInstallationRequestAccount
+    from github_client.models.integration_owner import IntegrationOwner
+    from github_client.models.integration_permissions import IntegrationPermissions
+    from github_client.models.interaction_expiry import InteractionExpiry
+    from github_client.models.interaction_group import InteractionGroup
+    from github_client.models.interaction_limit import InteractionLimit
+    from github_client.models.interaction_limit_response import InteractionLimitResponse
+    from github_client.models.interactions_get_restrictions_for_org200_response import InteractionsGetRestrictionsForOrg200Response
+    from github_client.models.issue import Issue
+    from github_client.models.issue1 import Issue1
+    from github_client.models.issue10 import Issue10
+    from github_client.models.issue2 import Issue2
+    from github_client.models.issue3 import Issue3
+    from github_client.models.issue4 import Issue4
+    from github_client.models.issue5 import Issue5
+    from github_client.models.issue6 import Issue6
+    from github_client.models.issue7 import Issue7
+    from github_client.models.issue8 import Issue8
+    from github_client.models.issue9 import Issue9
+    from github_client.models.issue_comment import IssueComment
+    from github_client.models.issue_dependencies_summary import IssueDependenciesSummary
+    from github_client.models.issue_event import IssueEvent
+    from github_client.models.issue_event_dismissed_review import IssueEventDismissedReview
+    from github_client.models.issue_event_for_issue import IssueEventForIssue
+    from github_client.models.issue_event_label import IssueEventLabel
+    from github_client.models.issue_event_milestone import IssueEventMilestone
+    from github_client.models.issue_event_project_card import IssueEventProjectCard
+    from github_client.models.issue_event_rename import IssueEventRename
+    from github_client.models.issue_field_value import IssueFieldValue
+    from github_client.models.issue_field_value_single_select_option import IssueFieldValueSingleSelectOption
+    from github_client.models.issue_field_value_value import IssueFieldValueValue
+    from github_client.models.issue_labels_inner import IssueLabelsInner
+    from github_client.models.issue_labels_inner_one_of import IssueLabelsInnerOneOf
+    from github_client.models.issue_pull_request import IssuePullRequest
+    from github_client.models.issue_search_result_item import IssueSearchResultItem
+    from github_client.models.issue_search_result_item_labels_inner import IssueSearchResultItemLabelsInner
+    from github_client.models.issue_type import IssueType
+    from github_client.models.issues_add_assignees_request import IssuesAddAssigneesRequest
+    from github_client.models.issues_add_blocked_by_dependency_request import IssuesAddBlockedByDependencyRequest
+    from github_client.models.issues_add_labels_request import IssuesAddLabelsRequest
+    from github_client.models.issues_add_labels_request_one_of import IssuesAddLabelsRequestOneOf
+    from github_client.models.issues_add_sub_issue_request import IssuesAddSubIssueRequest
+    from github_client.models.issues_create_label_request import IssuesCreateLabelRequest
+    from github_client.models.issues_create_milestone_request import IssuesCreateMilestoneRequest
+    from github_client.models.issues_create_request import IssuesCreateRequest
+    from github_client.models.issues_create_request_labels_inner import IssuesCreateRequestLabelsInner
+    from github_client.models.issues_create_request_labels_inner_one_of import IssuesCreateRequestLabelsInnerOneOf
+    from github_client.models.issues_create_request_milestone import IssuesCreateRequestMilestone
+    from github_client.models.issues_create_request_title import IssuesCreateRequestTitle
+    from github_client.models.issues_lock_request import IssuesLockRequest
+    from github_client.models.issues_remove_assignees_request import IssuesRemoveAssigneesRequest
+    from github_client.models.issues_remove_sub_issue_request import IssuesRemoveSubIssueRequest
+    from github_client.models.issues_reprioritize_sub_issue_request import IssuesReprioritizeSubIssueRequest
+    from github_client.models.issues_set_labels_request import IssuesSetLabelsRequest
+    from github_client.models.issues_set_labels_request_one_of import IssuesSetLabelsRequestOneOf
+    from github_client.models.issues_set_labels_request_one_of1 import IssuesSetLabelsRequestOneOf1
+    from github_client.models.issues_set_labels_request_one_of1_labels_inner import IssuesSetLabelsRequestOneOf1LabelsInner
+    from github_client.models.issues_update_comment_request import IssuesUpdateCommentRequest
+    from github_client.models.issues_update_label_request import IssuesUpdateLabelRequest
+    from github_client.models.issues_update_milestone_request import IssuesUpdateMilestoneRequest
+    from github_client.models.issues_update_request import IssuesUpdateRequest
+    from github_client.models.issues_update_request_milestone import IssuesUpdateRequestMilestone
+    from github_client.models.issues_update_request_title import IssuesUpdateRequestTitle
+    from github_client.models.job import Job
+    from github_client.models.job_steps_inner import JobStepsInner
+    from github_client.models.key import Key
+    from github_client.models.key_simple import KeySimple
+    from github_client.models.label import Label
+    from github_client.models.label1 import Label1
+    from github_client.models.label_search_result_item import LabelSearchResultItem
+    from github_client.models.labeled_issue_event import LabeledIssueEvent
+    from github_client.models.labeled_issue_event_label import LabeledIssueEventLabel
+    from github_client.models.license import License
+    from github_client.models.license_content import LicenseContent
+    from github_client.models.license_simple import LicenseSimple
+    from github_client.models.link import Link
+    from github_client.models.link_with_type import LinkWithType
+    from github_client.models.locked_issue_event import LockedIssueEvent
+    from github_client.models.manifest import Manifest
+    from github_client.models.manifest_file import ManifestFile
+    from github_client.models.markdown_render_request import MarkdownRenderRequest
+    from github_client.models.marketplace_account import MarketplaceAccount
+    from github_client.models.marketplace_listing_plan import MarketplaceListingPlan
+    from github_client.models.marketplace_purchase import MarketplacePurchase
+    from github_client.models.marketplace_purchase1 import MarketplacePurchase1
+    from github_client.models.marketplace_purchase2 import MarketplacePurchase2
+    from github_client.models.marketplace_purchase_marketplace_pending_change import MarketplacePurchaseMarketplacePendingChange
+    from github_client.models.marketplace_purchase_marketplace_purchase import MarketplacePurchaseMarketplacePurchase
+    from github_client.models.merge_group import MergeGroup
+    from github_client.models.merged_upstream import MergedUpstream
+    from github_client.models.metadata_value import MetadataValue
+    from github_client.models.migration import Migration
+    from github_client.models.migrations_map_commit_author_request import MigrationsMapCommitAuthorRequest
+    from github_client.models.migrations_set_lfs_preference_request import MigrationsSetLfsPreferenceRequest
+    from github_client.models.migrations_start_for_authenticated_user_request import MigrationsStartForAuthenticatedUserRequest
+    from github_client.models.migrations_start_for_org_request import MigrationsStartForOrgRequest
+    from github_client.models.migrations_start_import_request import MigrationsStartImportRequest
+    from github_client.models.migrations_update_import_request import MigrationsUpdateImportRequest
+    from github_client.models.milestone import Milestone
+    from github_client.models.milestone1 import Milestone1
+    from github_client.models.milestoned_issue_event import MilestonedIssueEvent
+    from github_client.models.milestoned_issue_event_milestone import MilestonedIssueEventMilestone
+    from github_client.models.minimal_repository import MinimalRepository
+    from github_client.models.minimal_repository_license import MinimalRepositoryLicense
+    from github_client.models.minimal_repository_permissions import MinimalRepositoryPermissions
+    from github_client.models.model_import import ModelImport
+    from github_client.models.moved_column_in_project_issue_event import MovedColumnInProjectIssueEvent
+    from github_client.models.network_configuration import NetworkConfiguration
+    from github_client.models.network_settings import NetworkSettings
+    from github_client.models.nullable_actions_hosted_runner_pool_image import NullableActionsHostedRunnerPoolImage
+    from github_client.models.nullable_code_of_conduct_simple import NullableCodeOfConductSimple
+    from github_client.models.nullable_codespace_machine import NullableCodespaceMachine
+    from github_client.models.nullable_collaborator import NullableCollaborator
+    from github_client.models.nullable_community_health_file import NullableCommunityHealthFile
+    from github_client.models.nullable_git_user import NullableGitUser
+    from github_client.models.nullable_integration import NullableIntegration
+    from github_client.models.nullable_issue import NullableIssue
+    from github_client.models.nullable_license_simple import NullableLicenseSimple
+    from github_client.models.nullable_milestone import NullableMilestone
+    from github_client.models.nullable_minimal_repository import NullableMinimalRepository
+    from github_client.models.nullable_organization_simple import NullableOrganizationSimple
+    from github_client.models.nullable_projects_v2_status_update import NullableProjectsV2StatusUpdate
+    from github_client.models.nullable_repository import NullableRepository
+    from github_client.models.nullable_repository_webhooks import NullableRepositoryWebhooks
+    from github_client.models.nullable_scoped_installation import NullableScopedInstallation
+    from github_client.models.nullable_secret_scanning_first_detected_location import NullableSecretScanningFirstDetectedLocation
+    from github_client.models.nullable_simple_commit import NullableSimpleCommit
+    from github_client.models.nullable_simple_commit_author import NullableSimpleCommitAuthor
+    from github_client.models.nullable_simple_commit_committer import NullableSimpleCommitCommitter
+    from github_client.models.nullable_simple_repository import NullableSimpleRepository
+    from github_client.models.nullable_simple_user import NullableSimpleUser
+    from github_client.models.nullable_team_simple import NullableTeamSimple
+    from github_client.models.oidc_custom_sub import OidcCustomSub
+    from github_client.models.oidc_custom_sub_repo import OidcCustomSubRepo
+    from github_client.models.org_hook import OrgHook
+    from github_client.models.org_hook_config import OrgHookConfig
+    from github_client.models.org_membership import OrgMembership
+    from github_client.models.org_membership_permissions import OrgMembershipPermissions
+    from github_client.models.org_private_registry_configuration import OrgPrivateRegistryConfiguration
+    from github_client.models.org_private_registry_configuration_with_selected_repositories import OrgPrivateRegistryConfigurationWithSelectedRepositories
+    from github_client.models.org_repo_custom_property_values import OrgRepoCustomPropertyValues
+    from github_client.models.org_rules import OrgRules
+    from github_client.models.org_ruleset_conditions import OrgRulesetConditions
+    from github_client.models.organization import Organization
+    from github_client.models.organization_actions_secret import OrganizationActionsSecret
+    from github_client.models.organization_actions_variable import OrganizationActionsVariable
+    from github_client.models.organization_create_issue_type import OrganizationCreateIssueType
+    from github_client.models.organization_dependabot_secret import OrganizationDependabotSecret
+    from github_client.models.organization_full import OrganizationFull
+    from github_client.models.organization_full_plan import OrganizationFullPlan
+    from github_client.models.organization_invitation import OrganizationInvitation
+    from github_client.models.organization_programmatic_access_grant import OrganizationProgrammaticAccessGrant
+    from github_client.models.organization_programmatic_access_grant_request import OrganizationProgrammaticAccessGrantRequest
+    from github_client.models.organization_programmatic_access_grant_request_permissions import OrganizationProgrammaticAccessGrantRequestPermissions
+    from github_client.models.organization_role import OrganizationRole
+    from github_client.models.organization_secret_scanning_alert import OrganizationSecretScanningAlert
+    from github_client.models.organization_simple import OrganizationSimple
+    from github_client.models.organization_simple_webhooks import OrganizationSimpleWebhooks
+    from github_client.models.organization_update_issue_type import OrganizationUpdateIssueType
+    from github_client.models.orgs_convert_member_to_outside_collaborator_request import OrgsConvertMemberToOutsideCollaboratorRequest
+    from github_client.models.orgs_create_artifact_storage_record200_response import OrgsCreateArtifactStorageRecord200Response
+    from github_client.models.orgs_create_artifact_storage_record200_response_storage_records_inner import OrgsCreateArtifactStorageRecord200ResponseStorageRecordsInner
+    from github_client.models.orgs_create_artifact_storage_record_request import OrgsCreateArtifactStorageRecordRequest
+    from github_client.models.orgs_create_invitation_request import OrgsCreateInvitationRequest
+    from github_client.models.orgs_create_webhook_request import OrgsCreateWebhookRequest
+    from github_client.models.orgs_create_webhook_request_config import OrgsCreateWebhookRequestConfig
+    from github_client.models.orgs_custom_properties_for_orgs_create_or_update_organization_values_request import OrgsCustomPropertiesForOrgsCreateOrUpdateOrganizationValuesRequest
+    from github_client.models.orgs_custom_properties_for_repos_create_or_update_organization_definitions_request import OrgsCustomPropertiesForReposCreateOrUpdateOrganizationDefinitionsRequest
+    from github_client.models.orgs_custom_properties_for_repos_create_or_update_organization_values_request import OrgsCustomPropertiesForReposCreateOrUpdateOrganizationValuesRequest
+    from github_client.models.orgs_delete_attestations_bulk_request import OrgsDeleteAttestationsBulkRequest
+    from github_client.models.orgs_delete_attestations_bulk_request_one_of import OrgsDeleteAttestationsBulkRequestOneOf
+    from github_client.models.orgs_delete_attestations_bulk_request_one_of1 import OrgsDeleteAttestationsBulkRequestOneOf1
+    from github_client.models.orgs_enable_or_disable_security_product_on_all_org_repos_request import OrgsEnableOrDisableSecurityProductOnAllOrgReposRequest
+    from github_client.models.orgs_list_app_installations200_response import OrgsListAppInstallations200Response
+    from github_client.models.orgs_list_artifact_storage_records200_response import OrgsListArtifactStorageRecords200Response
+    from github_client.models.orgs_list_artifact_storage_records200_response_storage_records_inner import OrgsListArtifactStorageRecords200ResponseStorageRecordsInner
+    from github_client.models.orgs_list_attestation_repositories200_response_inner import OrgsListAttestationRepositories200ResponseInner
+    from github_client.models.orgs_list_attestations200_response import OrgsListAttestations200Response
+    from github_client.models.orgs_list_attestations200_response_attestations_inner import OrgsListAttestations200ResponseAttestationsInner
+    from github_client.models.orgs_list_attestations200_response_attestations_inner_bundle import OrgsListAttestations200ResponseAttestationsInnerBundle
+    from github_client.models.orgs_list_attestations_bulk200_response import OrgsListAttestationsBulk200Response
+    from github_client.models.orgs_list_attestations_bulk200_response_attestations_subject_digests_value_inner import OrgsListAttestationsBulk200ResponseAttestationsSubjectDigestsValueInner
+    from github_client.models.orgs_list_attestations_bulk200_response_attestations_subject_digests_value_inner_bundle import OrgsListAttestationsBulk200ResponseAttestationsSubjectDigestsValueInnerBundle
+    from github_client.models.orgs_list_attestations_bulk200_response_page_info import OrgsListAttestationsBulk200ResponsePageInfo
+    from github_client.models.orgs_list_attestations_bulk_request import OrgsListAttestationsBulkRequest
+    from github_client.models.orgs_list_org_roles200_response import OrgsListOrgRoles200Response
+    from github_client.models.orgs_remove_outside_collaborator422_response import OrgsRemoveOutsideCollaborator422Response
+    from github_client.models.orgs_review_pat_grant_request_request import OrgsReviewPatGrantRequestRequest
+    from github_client.models.orgs_review_pat_grant_requests_in_bulk_request import OrgsReviewPatGrantRequestsInBulkRequest
+    from github_client.models.orgs_set_immutable_releases_settings_repositories_request import OrgsSetImmutableReleasesSettingsRepositoriesRequest
+    from github_client.models.orgs_set_immutable_releases_settings_request import OrgsSetImmutableReleasesSettingsRequest
+    from github_client.models.orgs_set_membership_for_user_request import OrgsSetMembershipForUserRequest
+    from github_client.models.orgs_update422_response import OrgsUpdate422Response
+    from github_client.models.orgs_update_membership_for_authenticated_user_request import OrgsUpdateMembershipForAuthenticatedUserRequest
+    from github_client.models.orgs_update_pat_access_request import OrgsUpdatePatAccessRequest
+    from github_client.models.orgs_update_pat_accesses_request import OrgsUpdatePatAccessesRequest
+    from github_client.models.orgs_update_request import OrgsUpdateRequest
+    from github_client.models.orgs_update_webhook_request import OrgsUpdateWebhookRequest
+    from github_client.models.orgs_update_webhook_request_config import OrgsUpdateWebhookRequestConfig
+    from github_client.models.package import Package
+    from github_client.models.package_version import PackageVersion
+    from github_client.models.package_version_metadata import PackageVersionMetadata
+    from github_client.models.packages_billing_usage import PackagesBillingUsage
+    from github_client.models.page import Page
+    from github_client.models.page_build import PageBuild
+    from github_client.models.page_build_error import PageBuildError
+    from github_client.models.page_build_status import PageBuildStatus
+    from github_client.models.page_deployment import PageDeployment
+    from github_client.models.page_deployment_id import PageDeploymentId
+    from github_client.models.pages_deployment_status import PagesDeploymentStatus
+    from github_client.models.pages_health_check import PagesHealthCheck
+    from github_client.models.pages_health_check_alt_domain import PagesHealthCheckAltDomain
+    from github_client.models.pages_health_check_domain import PagesHealthCheckDomain
+    from github_client.models.pages_https_certificate import PagesHttpsCertificate
+    from github_client.models.pages_source_hash import PagesSourceHash
+    from github_client.models.participation_stats import ParticipationStats
+    from github_client.models.pending_deployment import PendingDeployment
+    from github_client.models.pending_deployment_environment import PendingDeploymentEnvironment
+    from github_client.models.pending_deployment_reviewers_inner import PendingDeploymentReviewersInner
+    from github_client.models.pending_deployment_reviewers_inner_reviewer import PendingDeploymentReviewersInnerReviewer
+    from github_client.models.personal_access_token_request import PersonalAccessTokenRequest
+    from github_client.models.personal_access_token_request_permissions_added import PersonalAccessTokenRequestPermissionsAdded
+    from github_client.models.personal_access_token_request_permissions_result import PersonalAccessTokenRequestPermissionsResult
+    from github_client.models.personal_access_token_request_permissions_upgraded import PersonalAccessTokenRequestPermissionsUpgraded
+    from github_client.models.porter_author import PorterAuthor
+    from github_client.models.porter_large_file import PorterLargeFile
+    from github_client.models.private_registries_create_org_private_registry_request import PrivateRegistriesCreateOrgPrivateRegistryRequest
+    from github_client.models.private_registries_get_org_public_key200_response import PrivateRegistriesGetOrgPublicKey200Response
+    from github_client.models.private_registries_list_org_private_registries200_response import PrivateRegistriesListOrgPrivateRegistries200Response
+    from github_client.models.private_registries_update_org_private_registry_request import PrivateRegistriesUpdateOrgPrivateRegistryRequest
+    from github_client.models.private_user import PrivateUser
+    from github_client.models.private_vulnerability_report_create import PrivateVulnerabilityReportCreate
+    from github_client.models.project_card import ProjectCard
+    from github_client.models.project_collaborator_permission import ProjectCollaboratorPermission
+    from github_client.models.project_column import ProjectColumn
+    from github_client.models.projects_add_item_for_org_request import ProjectsAddItemForOrgRequest
+    from github_client.models.projects_classic_add_collaborator_request import ProjectsClassicAddCollaboratorRequest
+    from github_client.models.projects_classic_move_column_request import ProjectsClassicMoveColumnRequest
+    from github_client.models.projects_classic_update_column_request import ProjectsClassicUpdateColumnRequest
+    from github_client.models.projects_create_draft_item_for_org_request import ProjectsCreateDraftItemForOrgRequest
+    from github_client.models.projects_list_items_for_org_fields_parameter import ProjectsListItemsForOrgFieldsParameter
+    from github_client.models.projects_update_item_for_org_request import ProjectsUpdateItemForOrgRequest
+    from github_client.models.projects_update_item_for_org_request_fields_inner import ProjectsUpdateItemForOrgRequestFieldsInner
+    from github_client.models.projects_update_item_for_org_request_fields_inner_value import ProjectsUpdateItemForOrgRequestFieldsInnerValue
+    from github_client.models.projects_v2 import ProjectsV2
+    from github_client.models.projects_v2_draft_issue import ProjectsV2DraftIssue
+    from github_client.models.projects_v2_field import ProjectsV2Field
+    from github_client.models.projects_v2_field_configuration import ProjectsV2FieldConfiguration
+    from github_client.models.projects_v2_item import ProjectsV2Item
+    from github_client.models.projects_v2_item_content_type import ProjectsV2ItemContentType
+    from github_client.models.projects_v2_item_simple import ProjectsV2ItemSimple
+    from github_client.models.projects_v2_item_simple_content import ProjectsV2ItemSimpleContent
+    from github_client.models.projects_v2_item_with_content import ProjectsV2ItemWithContent
+    from github_client.models.projects_v2_iteration_setting import ProjectsV2IterationSetting
+    from github_client.models.projects_v2_iteration_settings import ProjectsV2IterationSettings
+    from github_client.models.projects_v2_iteration_settings_title import ProjectsV2IterationSettingsTitle
+    from github_client.models.projects_v2_single_select_option import ProjectsV2SingleSelectOption
+    from github_client.models.projects_v2_single_select_options import ProjectsV2SingleSelectOptions
+    from github_client.models.projects_v2_single_select_options_description import ProjectsV2SingleSelectOptionsDescription
+    from github_client.models.projects_v2_single_select_options_name import ProjectsV2SingleSelectOptionsName
+    from github_client.models.projects_v2_status_update import ProjectsV2StatusUpdate
+    from github_client.models.protected_branch import ProtectedBranch
+    from github_client.models.protected_branch_admin_enforced import ProtectedBranchAdminEnforced
+    from github_client.models.protected_branch_allow_fork_syncing import ProtectedBranchAllowForkSyncing
+    from github_client.models.protected_branch_enforce_admins import ProtectedBranchEnforceAdmins
+    from github_client.models.protected_branch_lock_branch import ProtectedBranchLockBranch
+    from github_client.models.protected_branch_pull_request_review import ProtectedBranchPullRequestReview
+    from github_client.models.protected_branch_pull_request_review_bypass_pull_request_allowances import ProtectedBranchPullRequestReviewBypassPullRequestAllowances
+    from github_client.models.protected_branch_pull_request_review_dismissal_restrictions import ProtectedBranchPullRequestReviewDismissalRestrictions
+    from github_client.models.protected_branch_required_conversation_resolution import ProtectedBranchRequiredConversationResolution
+    from github_client.models.protected_branch_required_linear_history import ProtectedBranchRequiredLinearHistory
+    from github_client.models.protected_branch_required_pull_request_reviews import ProtectedBranchRequiredPullRequestReviews
+    from github_client.models.protected_branch_required_pull_request_reviews_bypass_pull_request_allowances import ProtectedBranchRequiredPullRequestReviewsBypassPullRequestAllowances
+    from github_client.models.protected_branch_required_pull_request_reviews_dismissal_restrictions import ProtectedBranchRequiredPullRequestReviewsDismissalRestrictions
+    from github_client.models.protected_branch_required_status_check import ProtectedBranchRequiredStatusCheck
+    from github_client.models.protected_branch_required_status_check_checks_inner import ProtectedBranchRequiredStatusCheckChecksInner
+    from github_client.models.public_ip import PublicIp
+    from github_client.models.public_user import PublicUser
+    from github_client.models.public_user_plan import PublicUserPlan
+    from github_client.models.pull_request import PullRequest
+    from github_client.models.pull_request1 import PullRequest1
+    from github_client.models.pull_request10 import PullRequest10
+    from github_client.models.pull_request10_head import PullRequest10Head
+    from github_client.models.pull_request11 import PullRequest11
+    from github_client.models.pull_request11_base import PullRequest11Base
+    from github_client.models.pull_request12 import PullRequest12
+    from github_client.models.pull_request12_head import PullRequest12Head
+    from github_client.models.pull_request13 import PullRequest13
+    from github_client.models.pull_request1_base import PullRequest1Base
+    from github_client.models.pull_request2 import PullRequest2
+    from github_client.models.pull_request2_head import PullRequest2Head
+    from github_client.models.pull_request3 import PullRequest3
+    from github_client.models.pull_request3_requested_reviewers_inner import PullRequest3RequestedReviewersInner
+    from github_client.models.pull_request4 import PullRequest4
+    from github_client.models.pull_request5 import PullRequest5
+    from github_client.models.pull_request6 import PullRequest6
+    from github_client.models.pull_request6_base import PullRequest6Base
+    from github_client.models.pull_request6_requested_reviewers_inner import PullRequest6RequestedReviewersInner
+    from github_client.models.pull_request7 import PullRequest7
+    from github_client.models.pull_request8 import PullRequest8
+    from github_client.models.pull_request9 import PullRequest9
+    from github_client.models.pull_request_auto_merge import PullRequestAutoMerge
+    from github_client.models.pull_request_auto_merge1 import PullRequestAutoMerge1
+    from github_client.models.pull_request_base import PullRequestBase
+    from github_client.models.pull_request_head import PullRequestHead
+    from github_client.models.pull_request_labels_inner import PullRequestLabelsInner
+    from github_client.models.pull_request_merge_result import PullRequestMergeResult
+    from github_client.models.pull_request_minimal import PullRequestMinimal
+    from github_client.models.pull_request_minimal_head import PullRequestMinimalHead
+    from github_client.models.pull_request_minimal_head_repo import PullRequestMinimalHeadRepo
+    from github_client.models.pull_request_requested_reviewers_inner import PullRequestRequestedReviewersInner
+    from github_client.models.pull_request_review import PullRequestReview
+    from github_client.models.pull_request_review_comment import PullRequestReviewComment
+    from github_client.models.pull_request_review_comment1 import PullRequestReviewComment1
+    from github_client.models.pull_request_review_comment2 import PullRequestReviewComment2
+    from github_client.models.pull_request_review_comment_links import PullRequestReviewCommentLinks
+    from github_client.models.pull_request_review_comment_links_html import PullRequestReviewCommentLinksHtml
+    from github_client.models.pull_request_review_comment_links_pull_request import PullRequestReviewCommentLinksPullRequest
+    from github_client.models.pull_request_review_comment_links_self import PullRequestReviewCommentLinksSelf
+    from github_client.models.pull_request_review_request import PullRequestReviewRequest
+    from github_client.models.pull_request_simple import PullRequestSimple
+    from github_client.models.pull_request_simple_head import PullRequestSimpleHead
+    from github_client.models.pull_request_simple_labels_inner import PullRequestSimpleLabelsInner
+    from github_client.models.pull_request_simple_links import PullRequestSimpleLinks
+    from github_client.models.pull_request_webhook import PullRequestWebhook
+    from github_client.models.pulls_create_reply_for_review_comment_request import PullsCreateReplyForReviewCommentRequest
+    from github_client.models.pulls_create_request import PullsCreateRequest
+    from github_client.models.pulls_create_review_comment_request import PullsCreateReviewCommentRequest
+    from github_client.models.pulls_create_review_request import PullsCreateReviewRequest
+    from github_client.models.pulls_create_review_request_comments_inner import PullsCreateReviewRequestCommentsInner
+    from github_client.models.pulls_dismiss_review_request import PullsDismissReviewRequest
+    from github_client.models.pulls_merge_request import PullsMergeRequest
+    from github_client.models.pulls_remove_requested_reviewers_request import PullsRemoveRequestedReviewersRequest
+    from github_client.models.pulls_request_reviewers_request import PullsRequestReviewersRequest
+    from github_client.models.pulls_submit_review_request import PullsSubmitReviewRequest
+    from github_client.models.pulls_update_branch_request import PullsUpdateBranchRequest
+    from github_client.models.pulls_update_request import PullsUpdateRequest
+    from github_client.models.pulls_update_review_comment_request import PullsUpdateReviewCommentRequest
+    from github_client.models.pulls_update_review_request import PullsUpdateReviewRequest
+    from github_client.models.rate_limit import RateLimit
+    from github_client.models.rate_limit_overview import RateLimitOverview
+    from github_client.models.rate_limit_overview_resources import RateLimitOverviewResources
+    from github_client.models.reaction import Reaction
+    from github_client.models.reaction_rollup import ReactionRollup
+    from github_client.models.reactions import Reactions
+    from github_client.models.reactions_create_for_commit_comment_request import ReactionsCreateForCommitCommentRequest
+    from github_client.models.reactions_create_for_issue_comment_request import ReactionsCreateForIssueCommentRequest
+    from github_client.models.reactions_create_for_issue_request import ReactionsCreateForIssueRequest
+    from github_client.models.reactions_create_for_pull_request_review_comment_request import ReactionsCreateForPullRequestReviewCommentRequest
+    from github_client.models.reactions_create_for_release_request import ReactionsCreateForReleaseRequest
+    from github_client.models.reactions_create_for_team_discussion_comment_in_org_request import ReactionsCreateForTeamDiscussionCommentInOrgRequest
+    from github_client.models.reactions_create_for_team_discussion_in_org_request import ReactionsCreateForTeamDiscussionInOrgRequest
+    from github_client.models.referenced_workflow import ReferencedWorkflow
+    from github_client.models.referrer_traffic import ReferrerTraffic
+    from github_client.models.release import Release
+    from github_client.models.release_asset import ReleaseAsset
+    from github_client.models.release_asset1 import ReleaseAsset1
+    from github_client.models.release_notes_content import ReleaseNotesContent
+    from github_client.models.removed_from_project_issue_event import RemovedFromProjectIssueEvent
+    from github_client.models.renamed_issue_event import RenamedIssueEvent
+    from github_client.models.renamed_issue_event_rename import RenamedIssueEventRename
+    from github_client.models.repo_codespaces_secret import RepoCodespacesSecret
+    from github_client.models.repo_ref import RepoRef
+    from github_client.models.repo_search_result_item import RepoSearchResultItem
+    from github_client.models.repos_add_collaborator_request import ReposAddCollaboratorRequest
+    from github_client.models.repos_add_team_access_restrictions_request import ReposAddTeamAccessRestrictionsRequest
+    from github_client.models.repos_add_team_access_restrictions_request_one_of import ReposAddTeamAccessRestrictionsRequestOneOf
+    from github_client.models.repos_check_private_vulnerability_reporting200_response import ReposCheckPrivateVulnerabilityReporting200Response
+    from github_client.models.repos_create_attestation201_response import ReposCreateAttestation201Response
+    from github_client.models.repos_create_attestation_request import ReposCreateAttestationRequest
+    from github_client.models.repos_create_autolink_request import ReposCreateAutolinkRequest
+    from github_client.models.repos_create_commit_comment_request import ReposCreateCommitCommentRequest
+    from github_client.models.repos_create_commit_status_request import ReposCreateCommitStatusRequest
+    from github_client.models.repos_create_deploy_key_request import ReposCreateDeployKeyRequest
+    from github_client.models.repos_create_deployment_protection_rule_request import ReposCreateDeploymentProtectionRuleRequest
+    from github_client.models.repos_create_deployment_request import ReposCreateDeploymentRequest
+    from github_client.models.repos_create_deployment_request_payload import ReposCreateDeploymentRequestPayload
+    from github_client.models.repos_create_deployment_status_request import ReposCreateDeploymentStatusRequest
+    from github_client.models.repos_create_dispatch_event_request import ReposCreateDispatchEventRequest
+    from github_client.models.repos_create_for_authenticated_user_request import ReposCreateForAuthenticatedUserRequest
+    from github_client.models.repos_create_fork_request import ReposCreateForkRequest
+    from github_client.models.repos_create_in_org_request import ReposCreateInOrgRequest
+    from github_client.models.repos_create_or_update_environment_request import ReposCreateOrUpdateEnvironmentRequest
+    from github_client.models.repos_create_or_update_environment_request_reviewers_inner import ReposCreateOrUpdateEnvironmentRequestReviewersInner
+    from github_client.models.repos_create_or_update_file_contents409_response import ReposCreateOrUpdateFileContents409Response
+    from github_client.models.repos_create_or_update_file_contents_request import ReposCreateOrUpdateFileContentsRequest
+    from github_client.models.repos_create_or_update_file_contents_request_author import ReposCreateOrUpdateFileContentsRequestAuthor
+    from github_client.models.repos_create_or_update_file_contents_request_committer import ReposCreateOrUpdateFileContentsRequestCommitter
+    from github_client.models.repos_create_org_ruleset_request import ReposCreateOrgRulesetRequest
+    from github_client.models.repos_create_pages_deployment_request import ReposCreatePagesDeploymentRequest
+    from github_client.models.repos_create_pages_site_request import ReposCreatePagesSiteRequest
+    from github_client.models.repos_create_pages_site_request_source import ReposCreatePagesSiteRequestSource
+    from github_client.models.repos_create_release_request import ReposCreateReleaseRequest
+    from github_client.models.repos_create_repo_ruleset_request import ReposCreateRepoRulesetRequest
+    from github_client.models.repos_create_tag_protection_request import ReposCreateTagProtectionRequest
+    from github_client.models.repos_create_using_template_request import ReposCreateUsingTemplateRequest
+    from github_client.models.repos_create_webhook_request import ReposCreateWebhookRequest
+    from github_client.models.repos_create_webhook_request_config import ReposCreateWebhookRequestConfig
+    from github_client.models.repos_custom_properties_for_repos_create_or_update_repository_values_request import ReposCustomPropertiesForReposCreateOrUpdateRepositoryValuesRequest
+    from github_client.models.repos_delete_file_request import ReposDeleteFileRequest
+    from github_client.models.repos_delete_file_request_author import ReposDeleteFileRequestAuthor
+    from github_client.models.repos_delete_file_request_committer import ReposDeleteFileRequestCommitter
+    from github_client.models.repos_generate_release_notes_request import ReposGenerateReleaseNotesRequest
+    from github_client.models.repos_get_all_deployment_protection_rules200_response import ReposGetAllDeploymentProtectionRules200Response
+    from github_client.models.repos_get_all_environments200_response import ReposGetAllEnvironments200Response
+    from github_client.models.repos_get_content200_response import ReposGetContent200Response
+    from github_client.models.repos_list_custom_deployment_rule_integrations200_response import ReposListCustomDeploymentRuleIntegrations200Response
+    from github_client.models.repos_list_deployment_branch_policies200_response import ReposListDeploymentBranchPolicies200Response
+    from github_client.models.repos_merge_request import ReposMergeRequest
+    from github_client.models.repos_merge_upstream_request import ReposMergeUpstreamRequest
+    from github_client.models.repos_rename_branch_request import ReposRenameBranchRequest
+    from github_client.models.repos_replace_all_topics_request import ReposReplaceAllTopicsRequest
+    from github_client.models.repos_set_app_access_restrictions_request import ReposSetAppAccessRestrictionsRequest
+    from github_client.models.repos_set_status_check_contexts_request import ReposSetStatusCheckContextsRequest
+    from github_client.models.repos_set_status_check_contexts_request_one_of import ReposSetStatusCheckContextsRequestOneOf
+    from github_client.models.repos_set_team_access_restrictions_request import ReposSetTeamAccessRestrictionsRequest
+    from github_client.models.repos_set_team_access_restrictions_request_one_of import ReposSetTeamAccessRestrictionsRequestOneOf
+    from github_client.models.repos_set_user_access_restrictions_request import ReposSetUserAccessRestrictionsRequest
+    from github_client.models.repos_transfer_request import ReposTransferRequest
+    from github_client.models.repos_update_branch_protection_request import ReposUpdateBranchProtectionRequest
+    from github_client.models.repos_update_branch_protection_request_required_pull_request_reviews import ReposUpdateBranchProtectionRequestRequiredPullRequestReviews
+    from github_client.models.repos_update_branch_protection_request_required_pull_request_reviews_bypass_pull_request_allowances import ReposUpdateBranchProtectionRequestRequiredPullRequestReviewsBypassPullRequestAllowances
+    from github_client.models.repos_update_branch_protection_request_required_pull_request_reviews_dismissal_restrictions import ReposUpdateBranchProtectionRequestRequiredPullRequestReviewsDismissalRestrictions
+    from github_client.models.repos_update_branch_protection_request_required_status_checks import ReposUpdateBranchProtectionRequestRequiredStatusChecks
+    from github_client.models.repos_update_branch_protection_request_required_status_checks_checks_inner import ReposUpdateBranchProtectionRequestRequiredStatusChecksChecksInner
+    from github_client.models.repos_update_branch_protection_request_restrictions import ReposUpdateBranchProtectionRequestRestrictions
+    from github_client.models.repos_update_commit_comment_request import ReposUpdateCommitCommentRequest
+    from github_client.models.repos_update_information_about_pages_site_request import ReposUpdateInformationAboutPagesSiteRequest
+    from github_client.models.repos_update_information_about_pages_site_request_source import ReposUpdateInformationAboutPagesSiteRequestSource
+    from github_client.models.repos_update_information_about_pages_site_request_source_any_of import ReposUpdateInformationAboutPagesSiteRequestSourceAnyOf
+    from github_client.models.repos_update_invitation_request import ReposUpdateInvitationRequest
+    from github_client.models.repos_update_org_ruleset_request import ReposUpdateOrgRulesetRequest
+    from github_client.models.repos_update_pull_request_review_protection_request import ReposUpdatePullRequestReviewProtectionRequest
+    from github_client.models.repos_update_release_asset_request import ReposUpdateReleaseAssetRequest
+    from github_client.models.repos_update_release_request import ReposUpdateReleaseRequest
+    from github_client.models.repos_update_repo_ruleset_request import ReposUpdateRepoRulesetRequest
+    from github_client.models.repos_update_request import ReposUpdateRequest
+    from github_client.models.repos_update_request_security_and_analysis import ReposUpdateRequestSecurityAndAnalysis
+    from github_client.models.repos_update_request_security_and_analysis_advanced_security import ReposUpdateRequestSecurityAndAnalysisAdvancedSecurity
+    from github_client.models.repos_update_request_security_and_analysis_code_security import ReposUpdateRequestSecurityAndAnalysisCodeSecurity
+    from github_client.models.repos_update_request_security_and_analysis_secret_scanning import ReposUpdateRequestSecurityAndAnalysisSecretScanning
+    from github_client.models.repos_update_request_security_and_analysis_secret_scanning_ai_detection import ReposUpdateRequestSecurityAndAnalysisSecretScanningAiDetection
+    from github_client.models.repos_update_request_security_and_analysis_secret_scanning_non_provider_patterns import ReposUpdateRequestSecurityAndAnalysisSecretScanningNonProviderPatterns
+    from github_client.models.repos_update_request_security_and_analysis_secret_scanning_push_protection import ReposUpdateRequestSecurityAndAnalysisSecretScanningPushProtection
+    from github_client.models.repos_update_status_check_protection_request import ReposUpdateStatusCheckProtectionRequest
+    from github_client.models.repos_update_webhook_config_for_repo_request import ReposUpdateWebhookConfigForRepoRequest
+    from github_client.models.repos_update_webhook_request import ReposUpdateWebhookRequest
+    from github_client.models.repository import Repository
+    from github_client.models.repository1 import Repository1
+    from github_client.models.repository10 import Repository10
+    from github_client.models.repository11 import Repository11
+    from github_client.models.repository12 import Repository12
+    from github_client.models.repository13 import Repository13
+    from github_client.models.repository14 import Repository14
+    from github_client.models.repository15 import Repository15
+    from github_client.models.repository2 import Repository2
+    from github_client.models.repository3 import Repository3
+    from github_client.models.repository4 import Repository4
+    from github_client.models.repository5 import Repository5
+    from github_client.models.repository6 import Repository6
+    from github_client.models.repository7 import Repository7
+    from github_client.models.repository8 import Repository8
+    from github_client.models.repository9 import Repository9
+    from github_client.models.repository_advisory import RepositoryAdvisory
+    from github_client.models.repository_advisory_create import RepositoryAdvisoryCreate
+    from github_client.models.repository_advisory_create_credits_inner import RepositoryAdvisoryCreateCreditsInner
+    from github_client.models.repository_advisory_create_vulnerabilities_inner import RepositoryAdvisoryCreateVulnerabilitiesInner
+    from github_client.models.repository_advisory_create_vulnerabilities_inner_package import RepositoryAdvisoryCreateVulnerabilitiesInnerPackage
+    from github_client.models.repository_advisory_credit import RepositoryAdvisoryCredit
+    from github_client.models.repository_advisory_credits_inner import RepositoryAdvisoryCreditsInner
+    from github_client.models.repository_advisory_submission import RepositoryAdvisorySubmission
+    from github_client.models.repository_advisory_update import RepositoryAdvisoryUpdate
+    from github_client.models.repository_advisory_vulnerability import RepositoryAdvisoryVulnerability
+    from github_client.models.repository_code_search_index_status import RepositoryCodeSearchIndexStatus
+    from github_client.models.repository_collaborator_permission import RepositoryCollaboratorPermission
+    from github_client.models.repository_created_at import RepositoryCreatedAt
+    from github_client.models.repository_id_and_ref_name import RepositoryIdAndRefName
+    from github_client.models.repository_invitation import RepositoryInvitation
+    from github_client.models.repository_lite import RepositoryLite
+    from github_client.models.repository_lite1 import RepositoryLite1
+    from github_client.models.repository_lite2 import RepositoryLite2
+    from github_client.models.repository_name_and_ref_name import RepositoryNameAndRefName
+    from github_client.models.repository_permissions import RepositoryPermissions
+    from github_client.models.repository_property_and_ref_name import RepositoryPropertyAndRefName
+    from github_client.models.repository_pushed_at import RepositoryPushedAt
+    from github_client.models.repository_rule import RepositoryRule
+    from github_client.models.repository_rule_branch_name_pattern import RepositoryRuleBranchNamePattern
+    from github_client.models.repository_rule_code_scanning import RepositoryRuleCodeScanning
+    from github_client.models.repository_rule_code_scanning_parameters import RepositoryRuleCodeScanningParameters
+    from github_client.models.repository_rule_commit_author_email_pattern import RepositoryRuleCommitAuthorEmailPattern
+    from github_client.models.repository_rule_commit_message_pattern import RepositoryRuleCommitMessagePattern
+    from github_client.models.repository_rule_commit_message_pattern_parameters import RepositoryRuleCommitMessagePatternParameters
+    from github_client.models.repository_rule_committer_email_pattern import RepositoryRuleCommitterEmailPattern
+    from github_client.models.repository_rule_copilot_code_review import RepositoryRuleCopilotCodeReview
+    from github_client.models.repository_rule_copilot_code_review_parameters import RepositoryRuleCopilotCodeReviewParameters
+    from github_client.models.repository_rule_creation import RepositoryRuleCreation
+    from github_client.models.repository_rule_deletion import RepositoryRuleDeletion
+    from github_client.models.repository_rule_detailed import RepositoryRuleDetailed
+    from github_client.models.repository_rule_detailed_one_of import RepositoryRuleDetailedOneOf
+    from github_client.models.repository_rule_detailed_one_of1 import RepositoryRuleDetailedOneOf1
+    from github_client.models.repository_rule_detailed_one_of10 import RepositoryRuleDetailedOneOf10
+    from github_client.models.repository_rule_detailed_one_of11 import RepositoryRuleDetailedOneOf11
+    from github_client.models.repository_rule_detailed_one_of12 import RepositoryRuleDetailedOneOf12
+    from github_client.models.repository_rule_detailed_one_of13 import RepositoryRuleDetailedOneOf13
+    from github_client.models.repository_rule_detailed_one_of14 import RepositoryRuleDetailedOneOf14
+    from github_client.models.repository_rule_detailed_one_of15 import RepositoryRuleDetailedOneOf15
+    from github_client.models.repository_rule_detailed_one_of16 import RepositoryRuleDetailedOneOf16
+    from github_client.models.repository_rule_detailed_one_of17 import RepositoryRuleDetailedOneOf17
+    from github_client.models.repository_rule_detailed_one_of18 import RepositoryRuleDetailedOneOf18
+    from github_client.models.repository_rule_detailed_one_of19 import RepositoryRuleDetailedOneOf19
+    from github_client.models.repository_rule_detailed_one_of2 import RepositoryRuleDetailedOneOf2
+    from github_client.models.repository_rule_detailed_one_of20 import RepositoryRuleDetailedOneOf20
+    from github_client.models.repository_rule_detailed_one_of21 import RepositoryRuleDetailedOneOf21
+    from github_client.models.repository_rule_detailed_one_of3 import RepositoryRuleDetailedOneOf3
+    from github_client.models.repository_rule_detailed_one_of4 import RepositoryRuleDetailedOneOf4
+    from github_client.models.repository_rule_detailed_one_of5 import RepositoryRuleDetailedOneOf5
+    from github_client.models.repository_rule_detailed_one_of6 import RepositoryRuleDetailedOneOf6
+    from github_client.models.repository_rule_detailed_one_of7 import RepositoryRuleDetailedOneOf7
+    from github_client.models.repository_rule_detailed_one_of8 import RepositoryRuleDetailedOneOf8
+    from github_client.models.repository_rule_detailed_one_of9 import RepositoryRuleDetailedOneOf9
+    from github_client.models.repository_rule_enforcement import RepositoryRuleEnforcement
+    from github_client.models.repository_rule_file_extension_restriction import RepositoryRuleFileExtensionRestriction
+    from github_client.models.repository_rule_file_extension_restriction_parameters import RepositoryRuleFileExtensionRestrictionParameters
+    from github_client.models.repository_rule_file_path_restriction import RepositoryRuleFilePathRestriction
+    from github_client.models.repository_rule_file_path_restriction_parameters import RepositoryRuleFilePathRestrictionParameters
+    from github_client.models.repository_rule_max_file_path_length import RepositoryRuleMaxFilePathLength
+    from github_client.models.repository_rule_max_file_path_length_parameters import RepositoryRuleMaxFilePathLengthParameters
+    from github_client.models.repository_rule_max_file_size import RepositoryRuleMaxFileSize
+    from github_client.models.repository_rule_max_file_size_parameters import RepositoryRuleMaxFileSizeParameters
+    from github_client.models.repository_rule_merge_queue import RepositoryRuleMergeQueue
+    from github_client.models.repository_rule_merge_queue_parameters import RepositoryRuleMergeQueueParameters
+    from github_client.models.repository_rule_non_fast_forward import RepositoryRuleNonFastForward
+    from github_client.models.repository_rule_params_code_scanning_tool import RepositoryRuleParamsCodeScanningTool
+    from github_client.models.repository_rule_params_required_reviewer_configuration import RepositoryRuleParamsRequiredReviewerConfiguration
+    from github_client.models.repository_rule_params_restricted_commits import RepositoryRuleParamsRestrictedCommits
+    from github_client.models.repository_rule_params_reviewer import RepositoryRuleParamsReviewer
+    from github_client.models.repository_rule_params_status_check_configuration import RepositoryRuleParamsStatusCheckConfiguration
+    from github_client.models.repository_rule_params_workflow_file_reference import RepositoryRuleParamsWorkflowFileReference
+    from github_client.models.repository_rule_pull_request import RepositoryRulePullRequest
+    from github_client.models.repository_rule_pull_request_parameters import RepositoryRulePullRequestParameters
+    from github_client.models.repository_rule_required_deployments import RepositoryRuleRequiredDeployments
+    from github_client.models.repository_rule_required_deployments_parameters import RepositoryRuleRequiredDeploymentsParameters
+    from github_client.models.repository_rule_required_linear_history import RepositoryRuleRequiredLinearHistory
+    from github_client.models.repository_rule_required_signatures import RepositoryRuleRequiredSignatures
+    from github_client.models.repository_rule_required_status_checks import RepositoryRuleRequiredStatusChecks
+    from github_client.models.repository_rule_required_status_checks_parameters import RepositoryRuleRequiredStatusChecksParameters
+    from github_client.models.repository_rule_ruleset_info import RepositoryRuleRulesetInfo
+    from github_client.models.repository_rule_tag_name_pattern import RepositoryRuleTagNamePattern
+    from github_client.models.repository_rule_update import RepositoryRuleUpdate
+    from github_client.models.repository_rule_update_parameters import RepositoryRuleUpdateParameters
+    from github_client.models.repository_rule_violation_error import RepositoryRuleViolationError
+    from github_client.models.repository_rule_violation_error_metadata import RepositoryRuleViolationErrorMetadata
+    from github_client.models.repository_rule_violation_error_metadata_secret_scanning import RepositoryRuleViolationErrorMetadataSecretScanning
+    from github_client.models.repository_rule_violation_error_metadata_secret_scanning_bypass_placeholders_inner import RepositoryRuleViolationErrorMetadataSecretScanningBypassPlaceholdersInner
+    from github_client.models.repository_rule_workflows import RepositoryRuleWorkflows
+    from github_client.models.repository_rule_workflows_parameters import RepositoryRuleWorkflowsParameters
+    from github_client.models.repository_ruleset import RepositoryRuleset
+    from github_client.models.repository_ruleset_bypass_actor import RepositoryRulesetBypassActor
+    from github_client.models.repository_ruleset_conditions import RepositoryRulesetConditions
+    from github_client.models.repository_ruleset_conditions_ref_name import RepositoryRulesetConditionsRefName
+    from github_client.models.repository_ruleset_conditions_repository_id_target import RepositoryRulesetConditionsRepositoryIdTarget
+    from github_client.models.repository_ruleset_conditions_repository_id_target_repository_id import RepositoryRulesetConditionsRepositoryIdTargetRepositoryId
+    from github_client.models.repository_ruleset_conditions_repository_name_target import RepositoryRulesetConditionsRepositoryNameTarget
+    from github_client.models.repository_ruleset_conditions_repository_name_target_repository_name import RepositoryRulesetConditionsRepositoryNameTargetRepositoryName
+    from github_client.models.repository_ruleset_conditions_repository_property_spec import RepositoryRulesetConditionsRepositoryPropertySpec
+    from github_client.models.repository_ruleset_conditions_repository_property_target import RepositoryRulesetConditionsRepositoryPropertyTarget
+    from github_client.models.repository_ruleset_conditions_repository_property_target_repository_property import RepositoryRulesetConditionsRepositoryPropertyTargetRepositoryProperty
+    from github_client.models.repository_ruleset_links import RepositoryRulesetLinks
+    from github_client.models.repository_ruleset_links_html import RepositoryRulesetLinksHtml
+    from github_client.models.repository_ruleset_links_self import RepositoryRulesetLinksSelf
+    from github_client.models.repository_subscription import RepositorySubscription
+    from github_client.models.repository_vulnerability_alert_alert import RepositoryVulnerabilityAlertAlert
+    from github_client.models.repository_vulnerability_alert_alert1 import RepositoryVulnerabilityAlertAlert1
+    from github_client.models.repository_webhooks import RepositoryWebhooks
+    from github_client.models.repository_webhooks_template_repository import RepositoryWebhooksTemplateRepository
+    from github_client.models.repository_webhooks_template_repository_owner import RepositoryWebhooksTemplateRepositoryOwner
+    from github_client.models.review_comment import ReviewComment
+    from github_client.models.review_comment_links import ReviewCommentLinks
+    from github_client.models.review_custom_gates_comment_required import ReviewCustomGatesCommentRequired
+    from github_client.models.review_custom_gates_state_required import ReviewCustomGatesStateRequired
+    from github_client.models.review_dismissed_issue_event import ReviewDismissedIssueEvent
+    from github_client.models.review_dismissed_issue_event_dismissed_review import ReviewDismissedIssueEventDismissedReview
+    from github_client.models.review_request_removed_issue_event import ReviewRequestRemovedIssueEvent
+    from github_client.models.review_requested_issue_event import ReviewRequestedIssueEvent
+    from github_client.models.root import Root
+    from github_client.models.rule_suite import RuleSuite
+    from github_client.models.rule_suite_rule_evaluations_inner import RuleSuiteRuleEvaluationsInner
+    from github_client.models.rule_suite_rule_evaluations_inner_rule_source import RuleSuiteRuleEvaluationsInnerRuleSource
+    from github_client.models.rule_suites_inner import RuleSuitesInner
+    from github_client.models.ruleset_version import RulesetVersion
+    from github_client.models.ruleset_version_actor import RulesetVersionActor
+    from github_client.models.ruleset_version_with_state import RulesetVersionWithState
+    from github_client.models.runner import Runner
+    from github_client.models.runner_application import RunnerApplication
+    from github_client.models.runner_groups_org import RunnerGroupsOrg
+    from github_client.models.runner_label import RunnerLabel
+    from github_client.models.scim_error import ScimError
+    from github_client.models.search_code200_response import SearchCode200Response
+    from github_client.models.search_commits200_response import SearchCommits200Response
+    from github_client.models.search_issues_and_pull_requests200_response import SearchIssuesAndPullRequests200Response
+    from github_client.models.search_labels200_response import SearchLabels200Response
+    from github_client.models.search_repos200_response import SearchRepos200Response
+    from github_client.models.search_result_text_matches_inner import SearchResultTextMatchesInner
+    from github_client.models.search_result_text_matches_inner_matches_inner import SearchResultTextMatchesInnerMatchesInner
+    from github_client.models.search_topics200_response import SearchTopics200Response
+    from github_client.models.search_users200_response import SearchUsers200Response
+    from github_client.models.secret_scanning_alert import SecretScanningAlert
+    from github_client.models.secret_scanning_alert_resolution import SecretScanningAlertResolution
+    from github_client.models.secret_scanning_alert_resolution_webhook import SecretScanningAlertResolutionWebhook
+    from github_client.models.secret_scanning_alert_state import SecretScanningAlertState
+    from github_client.models.secret_scanning_alert_webhook import SecretScanningAlertWebhook
+    from github_client.models.secret_scanning_create_push_protection_bypass_request import SecretScanningCreatePushProtectionBypassRequest
+    from github_client.models.secret_scanning_location import SecretScanningLocation
+    from github_client.models.secret_scanning_location_commit import SecretScanningLocationCommit
+    from github_client.models.secret_scanning_location_details import SecretScanningLocationDetails
+    from github_client.models.secret_scanning_location_discussion_body import SecretScanningLocationDiscussionBody
+    from github_client.models.secret_scanning_location_discussion_comment import SecretScanningLocationDiscussionComment
+    from github_client.models.secret_scanning_location_discussion_title import SecretScanningLocationDiscussionTitle
+    from github_client.models.secret_scanning_location_issue_body import SecretScanningLocationIssueBody
+    from github_client.models.secret_scanning_location_issue_comment import SecretScanningLocationIssueComment
+    from github_client.models.secret_scanning_location_issue_title import SecretScanningLocationIssueTitle
+    from github_client.models.secret_scanning_location_pull_request_body import SecretScanningLocationPullRequestBody
+    from github_client.models.secret_scanning_location_pull_request_comment import SecretScanningLocationPullRequestComment
+    from github_client.models.secret_scanning_location_pull_request_review import SecretScanningLocationPullRequestReview
+    from github_client.models.secret_scanning_location_pull_request_review_comment import SecretScanningLocationPullRequestReviewComment
+    from github_client.models.secret_scanning_location_pull_request_title import SecretScanningLocationPullRequestTitle
+    from github_client.models.secret_scanning_location_wiki_commit import SecretScanningLocationWikiCommit
+    from github_client.models.secret_scanning_pattern_configuration import SecretScanningPatternConfiguration
+    from github_client.models.secret_scanning_pattern_override import SecretScanningPatternOverride
+    from github_client.models.secret_scanning_push_protection_bypass import SecretScanningPushProtectionBypass
+    from github_client.models.secret_scanning_push_protection_bypass_reason import SecretScanningPushProtectionBypassReason
+    from github_client.models.secret_scanning_scan import SecretScanningScan
+    from github_client.models.secret_scanning_scan_history import SecretScanningScanHistory
+    from github_client.models.secret_scanning_scan_history_custom_pattern_backfill_scans_inner import SecretScanningScanHistoryCustomPatternBackfillScansInner
+    from github_client.models.secret_scanning_update_alert_request import SecretScanningUpdateAlertRequest
+    from github_client.models.secret_scanning_update_org_pattern_configs200_response import SecretScanningUpdateOrgPatternConfigs200Response
+    from github_client.models.secret_scanning_update_org_pattern_configs_request import SecretScanningUpdateOrgPatternConfigsRequest
+    from github_client.models.secret_scanning_update_org_pattern_configs_request_custom_pattern_settings_inner import SecretScanningUpdateOrgPatternConfigsRequestCustomPatternSettingsInner
+    from github_client.models.secret_scanning_update_org_pattern_configs_request_provider_pattern_settings_inner import SecretScanningUpdateOrgPatternConfigsRequestProviderPatternSettingsInner
+    from github_client.models.security_advisories_list_global_advisories_affects_parameter import SecurityAdvisoriesListGlobalAdvisoriesAffectsParameter
+    from github_client.models.security_advisories_list_global_advisories_cwes_parameter import SecurityAdvisoriesListGlobalAdvisoriesCwesParameter
+    from github_client.models.security_advisory_credit_types import SecurityAdvisoryCreditTypes
+    from github_client.models.security_advisory_ecosystems import SecurityAdvisoryEcosystems
+    from github_client.models.security_advisory_epss import SecurityAdvisoryEpss
+    from github_client.models.security_and_analysis import SecurityAndAnalysis
+    from github_client.models.security_and_analysis_advanced_security import SecurityAndAnalysisAdvancedSecurity
+    from github_client.models.security_and_analysis_code_security import SecurityAndAnalysisCodeSecurity
+    from github_client.models.security_and_analysis_dependabot_security_updates import SecurityAndAnalysisDependabotSecurityUpdates
+    from github_client.models.selected_actions import SelectedActions
+    from github_client.models.self_hosted_runners_settings import SelfHostedRunnersSettings
+    from github_client.models.short_blob import ShortBlob
+    from github_client.models.short_branch import ShortBranch
+    from github_client.models.short_branch_commit import ShortBranchCommit
+    from github_client.models.simple_check_suite import SimpleCheckSuite
+    from github_client.models.simple_classroom import SimpleClassroom
+    from github_client.models.simple_classroom_assignment import SimpleClassroomAssignment
+    from github_client.models.simple_classroom_organization import SimpleClassroomOrganization
+    from github_client.models.simple_classroom_repository import SimpleClassroomRepository
+    from github_client.models.simple_classroom_user import SimpleClassroomUser
+    from github_client.models.simple_commit import SimpleCommit
+    from github_client.models.simple_commit_status import SimpleCommitStatus
+    from github_client.models.simple_installation import SimpleInstallation
+    from github_client.models.simple_pull_request import SimplePullRequest
+    from github_client.models.simple_pull_request1 import SimplePullRequest1
+    from github_client.models.simple_pull_request1_base import SimplePullRequest1Base
+    from github_client.models.simple_pull_request1_head import SimplePullRequest1Head
+    from github_client.models.simple_pull_request2 import SimplePullRequest2
+    from github_client.models.simple_pull_request3 import SimplePullRequest3
+    from github_client.models.simple_pull_request3_base import SimplePullRequest3Base
+    from github_client.models.simple_pull_request3_head import SimplePullRequest3Head
+    from github_client.models.simple_pull_request4 import SimplePullRequest4
+    from github_client.models.simple_repository import SimpleRepository
+    from github_client.models.simple_user import SimpleUser
+    from github_client.models.snapshot import Snapshot
+    from github_client.models.snapshot_detector import SnapshotDetector
+    from github_client.models.snapshot_job import SnapshotJob
+    from github_client.models.social_account import SocialAccount
+    from github_client.models.sponsorship_tier import SponsorshipTier
+    from github_client.models.ssh_signing_key import SshSigningKey
+    from github_client.models.stargazer import Stargazer
+    from github_client.models.starred_repository import StarredRepository
+    from github_client.models.state_change_issue_event import StateChangeIssueEvent
+    from github_client.models.static_public_ip_limits_for_git_hub_hosted_hosted_runners import StaticPublicIPLimitsForGitHubHostedHostedRunners
+    from github_client.models.status import Status
+    from github_client.models.status_check_policy import StatusCheckPolicy
+    from github_client.models.status_check_policy_checks_inner import StatusCheckPolicyChecksInner
+    from github_client.models.sub_issues_summary import SubIssuesSummary
+    from github_client.models.tag import Tag
+    from github_client.models.tag_protection import TagProtection
+    from github_client.models.team import Team
+    from github_client.models.team1 import Team1
+    from github_client.models.team_discussion import TeamDiscussion
+    from github_client.models.team_discussion_comment import TeamDiscussionComment
+    from github_client.models.team_full import TeamFull
+    from github_client.models.team_membership import TeamMembership
+    from github_client.models.team_organization import TeamOrganization
+    from github_client.models.team_parent import TeamParent
+    from github_client.models.team_permissions import TeamPermissions
+    from github_client.models.team_project import TeamProject
+    from github_client.models.team_project_permissions import TeamProjectPermissions
+    from github_client.models.team_repository import TeamRepository
+    from github_client.models.team_role_assignment import TeamRoleAssignment
+    from github_client.models.team_simple import TeamSimple
+    from github_client.models.teams_add_or_update_membership_for_user_in_org_request import TeamsAddOrUpdateMembershipForUserInOrgRequest
+    from github_client.models.teams_add_or_update_project_permissions_in_org_request import TeamsAddOrUpdateProjectPermissionsInOrgRequest
+    from github_client.models.teams_add_or_update_project_permissions_legacy_request import TeamsAddOrUpdateProjectPermissionsLegacyRequest
+    from github_client.models.teams_add_or_update_repo_permissions_in_org_request import TeamsAddOrUpdateRepoPermissionsInOrgRequest
+    from github_client.models.teams_add_or_update_repo_permissions_legacy_request import TeamsAddOrUpdateRepoPermissionsLegacyRequest
+    from github_client.models.teams_create_discussion_comment_in_org_request import TeamsCreateDiscussionCommentInOrgRequest
+    from github_client.models.teams_create_discussion_in_org_request import TeamsCreateDiscussionInOrgRequest
+    from github_client.models.teams_create_request import TeamsCreateRequest
+    from github_client.models.teams_update_discussion_in_org_request import TeamsUpdateDiscussionInOrgRequest
+    from github_client.models.teams_update_in_org_request import TeamsUpdateInOrgRequest
+    from github_client.models.teams_update_legacy_request import TeamsUpdateLegacyRequest
+    from github_client.models.thread import Thread
+    from github_client.models.thread_subject import ThreadSubject
+    from github_client.models.thread_subscription import ThreadSubscription
+    from github_client.models.timeline_assigned_issue_event import TimelineAssignedIssueEvent
+    from github_client.models.timeline_comment_event import TimelineCommentEvent
+    from github_client.models.timeline_commit_commented_event import TimelineCommitCommentedEvent
+    from github_client.models.timeline_committed_event import TimelineCommittedEvent
+    from github_client.models.timeline_cross_referenced_event import TimelineCrossReferencedEvent
+    from github_client.models.timeline_cross_referenced_event_source import TimelineCrossReferencedEventSource
+    from github_client.models.timeline_issue_events import TimelineIssueEvents
+    from github_client.models.timeline_line_commented_event import TimelineLineCommentedEvent
+    from github_client.models.timeline_reviewed_event import TimelineReviewedEvent
+    from github_client.models.timeline_reviewed_event_links import TimelineReviewedEventLinks
+    from github_client.models.timeline_reviewed_event_links_html import TimelineReviewedEventLinksHtml
+    from github_client.models.timeline_unassigned_issue_event import TimelineUnassignedIssueEvent
+    from github_client.models.topic import Topic
+    from github_client.models.topic_search_result_item import TopicSearchResultItem
+    from github_client.models.topic_search_result_item_related_inner import TopicSearchResultItemRelatedInner
+    from github_client.models.topic_search_result_item_related_inner_topic_relation import TopicSearchResultItemRelatedInnerTopicRelation
+    from github_client.models.traffic import Traffic
+    from github_client.models.unassigned_issue_event import UnassignedIssueEvent
+    from github_client.models.unlabeled_issue_event import UnlabeledIssueEvent
+    from github_client.models.user import User
+    from github_client.models.user1 import User1
+    from github_client.models.user2 import User2
+    from github_client.models.user3 import User3
+    from github_client.models.user4 import User4
+    from github_client.models.user5 import User5
+    from github_client.models.user6 import User6
+    from github_client.models.user7 import User7
+    from github_client.models.user8 import User8
+    from github_client.models.user_marketplace_purchase import UserMarketplacePurchase
+    from github_client.models.user_role_assignment import UserRoleAssignment
+    from github_client.models.user_search_result_item import UserSearchResultItem
+    from github_client.models.users_add_email_for_authenticated_user_request import UsersAddEmailForAuthenticatedUserRequest
+    from github_client.models.users_add_email_for_authenticated_user_request_one_of import UsersAddEmailForAuthenticatedUserRequestOneOf
+    from github_client.models.users_add_social_account_for_authenticated_user_request import UsersAddSocialAccountForAuthenticatedUserRequest
+    from github_client.models.users_create_gpg_key_for_authenticated_user_request import UsersCreateGpgKeyForAuthenticatedUserRequest
+    from github_client.models.users_create_public_ssh_key_for_authenticated_user_request import UsersCreatePublicSshKeyForAuthenticatedUserRequest
+    from github_client.models.users_create_ssh_signing_key_for_authenticated_user_request import UsersCreateSshSigningKeyForAuthenticatedUserRequest
+    from github_client.models.users_delete_email_for_authenticated_user_request import UsersDeleteEmailForAuthenticatedUserRequest
+    from github_client.models.users_delete_email_for_authenticated_user_request_one_of import UsersDeleteEmailForAuthenticatedUserRequestOneOf
+    from github_client.models.users_delete_social_account_for_authenticated_user_request import UsersDeleteSocialAccountForAuthenticatedUserRequest
+    from github_client.models.users_get_authenticated200_response import UsersGetAuthenticated200Response
+    from github_client.models.users_set_primary_email_visibility_for_authenticated_user_request import UsersSetPrimaryEmailVisibilityForAuthenticatedUserRequest
+    from github_client.models.users_update_authenticated_request import UsersUpdateAuthenticatedRequest
+    from github_client.models.validation_error import ValidationError
+    from github_client.models.validation_error_errors_inner import ValidationErrorErrorsInner
+    from github_client.models.validation_error_errors_inner_value import ValidationErrorErrorsInnerValue
+    from github_client.models.validation_error_simple import ValidationErrorSimple
+    from github_client.models.verification import Verification
+    from github_client.models.view_traffic import ViewTraffic
+    from github_client.models.vulnerability import Vulnerability
+    from github_client.models.vulnerability_package import VulnerabilityPackage
+    from github_client.models.webhook import Webhook
+    from github_client.models.webhook_branch_protection_configuration_disabled import WebhookBranchProtectionConfigurationDisabled
+    from github_client.models.webhook_branch_protection_configuration_enabled import WebhookBranchProtectionConfigurationEnabled
+    from github_client.models.webhook_branch_protection_rule_created import WebhookBranchProtectionRuleCreated
+    from github_client.models.webhook_branch_protection_rule_deleted import WebhookBranchProtectionRuleDeleted
+    from github_client.models.webhook_branch_protection_rule_edited import WebhookBranchProtectionRuleEdited
+    from github_client.models.webhook_branch_protection_rule_edited_changes import WebhookBranchProtectionRuleEditedChanges
+    from github_client.models.webhook_branch_protection_rule_edited_changes_admin_enforced import WebhookBranchProtectionRuleEditedChangesAdminEnforced
+    from github_client.models.webhook_branch_protection_rule_edited_changes_authorized_actor_names import WebhookBranchProtectionRuleEditedChangesAuthorizedActorNames
+    from github_client.models.webhook_branch_protection_rule_edited_changes_linear_history_requirement_enforcement_level import WebhookBranchProtectionRuleEditedChangesLinearHistoryRequirementEnforcementLevel
+    from github_client.models.webhook_check_run_completed import WebhookCheckRunCompleted
+    from github_client.models.webhook_check_run_completed_form_encoded import WebhookCheckRunCompletedFormEncoded
+    from github_client.models.webhook_check_run_created import WebhookCheckRunCreated
+    from github_client.models.webhook_check_run_created_form_encoded import WebhookCheckRunCreatedFormEncoded
+    from github_client.models.webhook_check_run_requested_action import WebhookCheckRunRequestedAction
+    from github_client.models.webhook_check_run_requested_action_form_encoded import WebhookCheckRunRequestedActionFormEncoded
+    from github_client.models.webhook_check_run_requested_action_requested_action import WebhookCheckRunRequestedActionRequestedAction
+    from github_client.models.webhook_check_run_rerequested import WebhookCheckRunRerequested
+    from github_client.models.webhook_check_run_rerequested_form_encoded import WebhookCheckRunRerequestedFormEncoded
+    from github_client.models.webhook_check_suite_completed import WebhookCheckSuiteCompleted
+    from github_client.models.webhook_check_suite_completed_check_suite import WebhookCheckSuiteCompletedCheckSuite
+    from github_client.models.webhook_check_suite_requested import WebhookCheckSuiteRequested
+    from github_client.models.webhook_check_suite_requested_check_suite import WebhookCheckSuiteRequestedCheckSuite
+    from github_client.models.webhook_check_suite_rerequested import WebhookCheckSuiteRerequested
+    from github_client.models.webhook_check_suite_rerequested_check_suite import WebhookCheckSuiteRerequestedCheckSuite
+    from github_client.models.webhook_code_scanning_alert_appeared_in_branch import WebhookCodeScanningAlertAppearedInBranch
+    from github_client.models.webhook_code_scanning_alert_appeared_in_branch_alert import WebhookCodeScanningAlertAppearedInBranchAlert
+    from github_client.models.webhook_code_scanning_alert_appeared_in_branch_alert_rule import WebhookCodeScanningAlertAppearedInBranchAlertRule
+    from github_client.models.webhook_code_scanning_alert_appeared_in_branch_alert_tool import WebhookCodeScanningAlertAppearedInBranchAlertTool
+    from github_client.models.webhook_code_scanning_alert_closed_by_user import WebhookCodeScanningAlertClosedByUser
+    from github_client.models.webhook_code_scanning_alert_closed_by_user_alert import WebhookCodeScanningAlertClosedByUserAlert
+    from github_client.models.webhook_code_scanning_alert_closed_by_user_alert_rule import WebhookCodeScanningAlertClosedByUserAlertRule
+    from github_client.models.webhook_code_scanning_alert_closed_by_user_alert_tool import WebhookCodeScanningAlertClosedByUserAlertTool
+    from github_client.models.webhook_code_scanning_alert_created import WebhookCodeScanningAlertCreated
+    from github_client.models.webhook_code_scanning_alert_created_alert import WebhookCodeScanningAlertCreatedAlert
+    from github_client.models.webhook_code_scanning_alert_created_alert_tool import WebhookCodeScanningAlertCreatedAlertTool
+    from github_client.models.webhook_code_scanning_alert_fixed import WebhookCodeScanningAlertFixed
+    from github_client.models.webhook_code_scanning_alert_fixed_alert import WebhookCodeScanningAlertFixedAlert
+    from github_client.models.webhook_code_scanning_alert_reopened import WebhookCodeScanningAlertReopened
+    from github_client.models.webhook_code_scanning_alert_reopened_alert import WebhookCodeScanningAlertReopenedAlert
+    from github_client.models.webhook_code_scanning_alert_reopened_by_user import WebhookCodeScanningAlertReopenedByUser
+    from github_client.models.webhook_code_scanning_alert_reopened_by_user_alert import WebhookCodeScanningAlertReopenedByUserAlert
+    from github_client.models.webhook_commit_comment_created import WebhookCommitCommentCreated
+    from github_client.models.webhook_commit_comment_created_comment import WebhookCommitCommentCreatedComment
+    from github_client.models.webhook_config import WebhookConfig
+    from github_client.models.webhook_config_insecure_ssl import WebhookConfigInsecureSsl
+    from github_client.models.webhook_create import WebhookCreate
+    from github_client.models.webhook_custom_property_created import WebhookCustomPropertyCreated
+    from github_client.models.webhook_custom_property_deleted import WebhookCustomPropertyDeleted
+    from github_client.models.webhook_custom_property_deleted_definition import WebhookCustomPropertyDeletedDefinition
+    from github_client.models.webhook_custom_property_promoted_to_enterprise import WebhookCustomPropertyPromotedToEnterprise
+    from github_client.models.webhook_custom_property_updated import WebhookCustomPropertyUpdated
+    from github_client.models.webhook_custom_property_values_updated import WebhookCustomPropertyValuesUpdated
+    from github_client.models.webhook_delete import WebhookDelete
+    from github_client.models.webhook_dependabot_alert_auto_dismissed import WebhookDependabotAlertAutoDismissed
+    from github_client.models.webhook_dependabot_alert_auto_reopened import WebhookDependabotAlertAutoReopened
+    from github_client.models.webhook_dependabot_alert_created import WebhookDependabotAlertCreated
+    from github_client.models.webhook_dependabot_alert_dismissed import WebhookDependabotAlertDismissed
+    from github_client.models.webhook_dependabot_alert_fixed import WebhookDependabotAlertFixed
+    from github_client.models.webhook_dependabot_alert_reintroduced import WebhookDependabotAlertReintroduced
+    from github_client.models.webhook_dependabot_alert_reopened import WebhookDependabotAlertReopened
+    from github_client.models.webhook_deploy_key_created import WebhookDeployKeyCreated
+    from github_client.models.webhook_deploy_key_deleted import WebhookDeployKeyDeleted
+    from github_client.models.webhook_deployment_created import WebhookDeploymentCreated
+    from github_client.models.webhook_deployment_protection_rule_requested import WebhookDeploymentProtectionRuleRequested
+    from github_client.models.webhook_deployment_review_approved import WebhookDeploymentReviewApproved
+    from github_client.models.webhook_deployment_review_approved_workflow_job_runs_inner import WebhookDeploymentReviewApprovedWorkflowJobRunsInner
+    from github_client.models.webhook_deployment_review_rejected import WebhookDeploymentReviewRejected
+    from github_client.models.webhook_deployment_review_rejected_workflow_job_runs_inner import WebhookDeploymentReviewRejectedWorkflowJobRunsInner
+    from github_client.models.webhook_deployment_review_requested import WebhookDeploymentReviewRequested
+    from github_client.models.webhook_deployment_review_requested_reviewers_inner import WebhookDeploymentReviewRequestedReviewersInner
+    from github_client.models.webhook_deployment_review_requested_workflow_job_run import WebhookDeploymentReviewRequestedWorkflowJobRun
+    from github_client.models.webhook_deployment_status_created import WebhookDeploymentStatusCreated
+    from github_client.models.webhook_deployment_status_created_check_run import WebhookDeploymentStatusCreatedCheckRun
+    from github_client.models.webhook_deployment_status_created_deployment_status import WebhookDeploymentStatusCreatedDeploymentStatus
+    from github_client.models.webhook_discussion_answered import WebhookDiscussionAnswered
+    from github_client.models.webhook_discussion_category_changed import WebhookDiscussionCategoryChanged
+    from github_client.models.webhook_discussion_category_changed_changes import WebhookDiscussionCategoryChangedChanges
+    from github_client.models.webhook_discussion_category_changed_changes_category import WebhookDiscussionCategoryChangedChangesCategory
+    from github_client.models.webhook_discussion_closed import WebhookDiscussionClosed
+    from github_client.models.webhook_discussion_comment_created import WebhookDiscussionCommentCreated
+    from github_client.models.webhook_discussion_comment_deleted import WebhookDiscussionCommentDeleted
+    from github_client.models.webhook_discussion_comment_edited import WebhookDiscussionCommentEdited
+    from github_client.models.webhook_discussion_comment_edited_changes import WebhookDiscussionCommentEditedChanges
+    from github_client.models.webhook_discussion_comment_edited_changes_body import WebhookDiscussionCommentEditedChangesBody
+    from github_client.models.webhook_discussion_created import WebhookDiscussionCreated
+    from github_client.models.webhook_discussion_deleted import WebhookDiscussionDeleted
+    from github_client.models.webhook_discussion_edited import WebhookDiscussionEdited
+    from github_client.models.webhook_discussion_edited_changes import WebhookDiscussionEditedChanges
+    from github_client.models.webhook_discussion_labeled import WebhookDiscussionLabeled
+    from github_client.models.webhook_discussion_locked import WebhookDiscussionLocked
+    from github_client.models.webhook_discussion_pinned import WebhookDiscussionPinned
+    from github_client.models.webhook_discussion_reopened import WebhookDiscussionReopened
+    from github_client.models.webhook_discussion_transferred import WebhookDiscussionTransferred
+    from github_client.models.webhook_discussion_transferred_changes import WebhookDiscussionTransferredChanges
+    from github_client.models.webhook_discussion_unanswered import WebhookDiscussionUnanswered
+    from github_client.models.webhook_discussion_unlabeled import WebhookDiscussionUnlabeled
+    from github_client.models.webhook_discussion_unlocked import WebhookDiscussionUnlocked
+    from github_client.models.webhook_discussion_unpinned import WebhookDiscussionUnpinned
+    from github_client.models.webhook_fork import WebhookFork
+    from github_client.models.webhook_fork_forkee import WebhookForkForkee
+    from github_client.models.webhook_github_app_authorization_revoked import WebhookGithubAppAuthorizationRevoked
+    from github_client.models.webhook_gollum import WebhookGollum
+    from github_client.models.webhook_gollum_pages_inner import WebhookGollumPagesInner
+    from github_client.models.webhook_installation_created import WebhookInstallationCreated
+    from github_client.models.webhook_installation_deleted import WebhookInstallationDeleted
+    from github_client.models.webhook_installation_new_permissions_accepted import WebhookInstallationNewPermissionsAccepted
+    from github_client.models.webhook_installation_repositories_added import WebhookInstallationRepositoriesAdded
+    from github_client.models.webhook_installation_repositories_added_repositories_removed_inner import WebhookInstallationRepositoriesAddedRepositoriesRemovedInner
+    from github_client.models.webhook_installation_repositories_removed import WebhookInstallationRepositoriesRemoved
+    from github_client.models.webhook_installation_suspend import WebhookInstallationSuspend
+    from github_client.models.webhook_installation_target_renamed import WebhookInstallationTargetRenamed
+    from github_client.models.webhook_installation_target_renamed_account import WebhookInstallationTargetRenamedAccount
+    from github_client.models.webhook_installation_target_renamed_changes import WebhookInstallationTargetRenamedChanges
+    from github_client.models.webhook_installation_unsuspend import WebhookInstallationUnsuspend
+    from github_client.models.webhook_issue_comment_created import WebhookIssueCommentCreated
+    from github_client.models.webhook_issue_comment_created_issue import WebhookIssueCommentCreatedIssue
+    from github_client.models.webhook_issue_comment_created_issue_all_of_reactions import WebhookIssueCommentCreatedIssueAllOfReactions
+    from github_client.models.webhook_issue_comment_created_issue_all_of_user import WebhookIssueCommentCreatedIssueAllOfUser
+    from github_client.models.webhook_issue_comment_deleted import WebhookIssueCommentDeleted
+    from github_client.models.webhook_issue_comment_deleted_issue import WebhookIssueCommentDeletedIssue
+    from github_client.models.webhook_issue_comment_deleted_issue_all_of_user import WebhookIssueCommentDeletedIssueAllOfUser
+    from github_client.models.webhook_issue_comment_edited import WebhookIssueCommentEdited
+    from github_client.models.webhook_issue_comment_edited_issue import WebhookIssueCommentEditedIssue
+    from github_client.models.webhook_issue_dependencies_blocked_by_added import WebhookIssueDependenciesBlockedByAdded
+    from github_client.models.webhook_issue_dependencies_blocked_by_removed import WebhookIssueDependenciesBlockedByRemoved
+    from github_client.models.webhook_issue_dependencies_blocking_added import WebhookIssueDependenciesBlockingAdded
+    from github_client.models.webhook_issue_dependencies_blocking_removed import WebhookIssueDependenciesBlockingRemoved
+    from github_client.models.webhook_issues_assigned import WebhookIssuesAssigned
+    from github_client.models.webhook_issues_closed import WebhookIssuesClosed
+    from github_client.models.webhook_issues_closed_issue import WebhookIssuesClosedIssue
+    from github_client.models.webhook_issues_deleted import WebhookIssuesDeleted
+    from github_client.models.webhook_issues_demilestoned import WebhookIssuesDemilestoned
+    from github_client.models.webhook_issues_edited import WebhookIssuesEdited
+    from github_client.models.webhook_issues_edited_changes import WebhookIssuesEditedChanges
+    from github_client.models.webhook_issues_edited_changes_title import WebhookIssuesEditedChangesTitle
+    from github_client.models.webhook_issues_labeled import WebhookIssuesLabeled
+    from github_client.models.webhook_issues_locked import WebhookIssuesLocked
+    from github_client.models.webhook_issues_milestoned import WebhookIssuesMilestoned
+    from github_client.models.webhook_issues_opened import WebhookIssuesOpened
+    from github_client.models.webhook_issues_opened_changes import WebhookIssuesOpenedChanges
+    from github_client.models.webhook_issues_pinned import WebhookIssuesPinned
+    from github_client.models.webhook_issues_reopened import WebhookIssuesReopened
+    from github_client.models.webhook_issues_transferred import WebhookIssuesTransferred
+    from github_client.models.webhook_issues_transferred_changes import WebhookIssuesTransferredChanges
+    from github_client.models.webhook_issues_typed import WebhookIssuesTyped
+    from github_client.models.webhook_issues_unassigned import WebhookIssuesUnassigned
+    from github_client.models.webhook_issues_unlabeled import WebhookIssuesUnlabeled
+    from github_client.models.webhook_issues_unlocked import WebhookIssuesUnlocked
+    from github_client.models.webhook_issues_unpinned import WebhookIssuesUnpinned
+    from github_client.models.webhook_issues_untyped import WebhookIssuesUntyped
+    from github_client.models.webhook_label_created import WebhookLabelCreated
+    from github_client.models.webhook_label_deleted import WebhookLabelDeleted
+    from github_client.models.webhook_label_edited import WebhookLabelEdited
+    from github_client.models.webhook_label_edited_changes import WebhookLabelEditedChanges
+    from github_client.models.webhook_label_edited_changes_color import WebhookLabelEditedChangesColor
+    from github_client.models.webhook_label_edited_changes_description import WebhookLabelEditedChangesDescription
+    from github_client.models.webhook_label_edited_changes_name import WebhookLabelEditedChangesName
+    from github_client.models.webhook_marketplace_purchase_cancelled import WebhookMarketplacePurchaseCancelled
+    from github_client.models.webhook_marketplace_purchase_changed import WebhookMarketplacePurchaseChanged
+    from github_client.models.webhook_marketplace_purchase_pending_change import WebhookMarketplacePurchasePendingChange
+    from github_client.models.webhook_marketplace_purchase_pending_change_cancelled import WebhookMarketplacePurchasePendingChangeCancelled
+    from github_client.models.webhook_marketplace_purchase_purchased import WebhookMarketplacePurchasePurchased
+    from github_client.models.webhook_member_added import WebhookMemberAdded
+    from github_client.models.webhook_member_added_changes import WebhookMemberAddedChanges
+    from github_client.models.webhook_member_added_changes_permission import WebhookMemberAddedChangesPermission
+    from github_client.models.webhook_member_added_changes_role_name import WebhookMemberAddedChangesRoleName
+    from github_client.models.webhook_member_edited import WebhookMemberEdited
+    from github_client.models.webhook_member_edited_changes import WebhookMemberEditedChanges
+    from github_client.models.webhook_member_edited_changes_old_permission import WebhookMemberEditedChangesOldPermission
+    from github_client.models.webhook_member_edited_changes_permission import WebhookMemberEditedChangesPermission
+    from github_client.models.webhook_member_removed import WebhookMemberRemoved
+    from github_client.models.webhook_membership_added import WebhookMembershipAdded
+    from github_client.models.webhook_membership_removed import WebhookMembershipRemoved
+    from github_client.models.webhook_merge_group_checks_requested import WebhookMergeGroupChecksRequested
+    from github_client.models.webhook_merge_group_destroyed import WebhookMergeGroupDestroyed
+    from github_client.models.webhook_meta_deleted import WebhookMetaDeleted
+    from github_client.models.webhook_meta_deleted_hook import WebhookMetaDeletedHook
+    from github_client.models.webhook_meta_deleted_hook_config import WebhookMetaDeletedHookConfig
+    from github_client.models.webhook_milestone_closed import WebhookMilestoneClosed
+    from github_client.models.webhook_milestone_created import WebhookMilestoneCreated
+    from github_client.models.webhook_milestone_deleted import WebhookMilestoneDeleted
+    from github_client.models.webhook_milestone_edited import WebhookMilestoneEdited
+    from github_client.models.webhook_milestone_edited_changes import WebhookMilestoneEditedChanges
+    from github_client.models.webhook_milestone_edited_changes_due_on import WebhookMilestoneEditedChangesDueOn
+    from github_client.models.webhook_milestone_edited_changes_title import WebhookMilestoneEditedChangesTitle
+    from github_client.models.webhook_milestone_opened import WebhookMilestoneOpened
+    from github_client.models.webhook_org_block_blocked import WebhookOrgBlockBlocked
+    from github_client.models.webhook_org_block_unblocked import WebhookOrgBlockUnblocked
+    from github_client.models.webhook_organization_deleted import WebhookOrganizationDeleted
+    from github_client.models.webhook_organization_member_added import WebhookOrganizationMemberAdded
+    from github_client.models.webhook_organization_member_invited import WebhookOrganizationMemberInvited
+    from github_client.models.webhook_organization_member_invited_invitation import WebhookOrganizationMemberInvitedInvitation
+    from github_client.models.webhook_organization_member_removed import WebhookOrganizationMemberRemoved
+    from github_client.models.webhook_organization_renamed import WebhookOrganizationRenamed
+    from github_client.models.webhook_organization_renamed_changes import WebhookOrganizationRenamedChanges
+    from github_client.models.webhook_organization_renamed_changes_login import WebhookOrganizationRenamedChangesLogin
+    from github_client.models.webhook_package_published import WebhookPackagePublished
+    from github_client.models.webhook_package_published_package import WebhookPackagePublishedPackage
+    from github_client.models.webhook_package_published_package_package_version import WebhookPackagePublishedPackagePackageVersion
+    from github_client.models.webhook_package_published_package_package_version_body import WebhookPackagePublishedPackagePackageVersionBody
+    from github_client.models.webhook_package_published_package_package_version_container_metadata import WebhookPackagePublishedPackagePackageVersionContainerMetadata
+    from github_client.models.webhook_package_published_package_package_version_container_metadata_tag import WebhookPackagePublishedPackagePackageVersionContainerMetadataTag
+    from github_client.models.webhook_package_published_package_package_version_docker_metadata_inner import WebhookPackagePublishedPackagePackageVersionDockerMetadataInner
+    from github_client.models.webhook_package_published_package_package_version_npm_metadata import WebhookPackagePublishedPackagePackageVersionNpmMetadata
+    from github_client.models.webhook_package_published_package_package_version_nuget_metadata_inner import WebhookPackagePublishedPackagePackageVersionNugetMetadataInner
+    from github_client.models.webhook_package_published_package_package_version_nuget_metadata_inner_value import WebhookPackagePublishedPackagePackageVersionNugetMetadataInnerValue
+    from github_client.models.webhook_package_published_package_package_version_nuget_metadata_inner_value_one_of import WebhookPackagePublishedPackagePackageVersionNugetMetadataInnerValueOneOf
+    from github_client.models.webhook_package_published_package_package_version_package_files_inner import WebhookPackagePublishedPackagePackageVersionPackageFilesInner
+    from github_client.models.webhook_package_published_package_package_version_release import WebhookPackagePublishedPackagePackageVersionRelease
+    from github_client.models.webhook_package_published_package_registry import WebhookPackagePublishedPackageRegistry
+    from github_client.models.webhook_package_updated import WebhookPackageUpdated
+    from github_client.models.webhook_package_updated_package import WebhookPackageUpdatedPackage
+    from github_client.models.webhook_package_updated_package_package_version import WebhookPackageUpdatedPackagePackageVersion
+    from github_client.models.webhook_package_updated_package_package_version_package_files_inner import WebhookPackageUpdatedPackagePackageVersionPackageFilesInner
+    from github_client.models.webhook_package_updated_package_package_version_release import WebhookPackageUpdatedPackagePackageVersionRelease
+    from github_client.models.webhook_page_build import WebhookPageBuild
+    from github_client.models.webhook_page_build_build import WebhookPageBuildBuild
+    from github_client.models.webhook_personal_access_token_request_approved import WebhookPersonalAccessTokenRequestApproved
+    from github_client.models.webhook_personal_access_token_request_cancelled import WebhookPersonalAccessTokenRequestCancelled
+    from github_client.models.webhook_personal_access_token_request_created import WebhookPersonalAccessTokenRequestCreated
+    from github_client.models.webhook_personal_access_token_request_denied import WebhookPersonalAccessTokenRequestDenied
+    from github_client.models.webhook_ping import WebhookPing
+    from github_client.models.webhook_ping_form_encoded import WebhookPingFormEncoded
+    from github_client.models.webhook_project_card_converted import WebhookProjectCardConverted
+    from github_client.models.webhook_project_card_converted_changes import WebhookProjectCardConvertedChanges
+    from github_client.models.webhook_project_card_created import WebhookProjectCardCreated
+    from github_client.models.webhook_project_card_deleted import WebhookProjectCardDeleted
+    from github_client.models.webhook_project_card_edited import WebhookProjectCardEdited
+    from github_client.models.webhook_project_card_edited_changes import WebhookProjectCardEditedChanges
+    from github_client.models.webhook_project_card_edited_changes_note import WebhookProjectCardEditedChangesNote
+    from github_client.models.webhook_project_card_moved import WebhookProjectCardMoved
+    from github_client.models.webhook_project_card_moved_changes import WebhookProjectCardMovedChanges
+    from github_client.models.webhook_project_card_moved_changes_column_id import WebhookProjectCardMovedChangesColumnId
+    from github_client.models.webhook_project_card_moved_project_card import WebhookProjectCardMovedProjectCard
+    from github_client.models.webhook_project_card_moved_project_card_all_of_creator import WebhookProjectCardMovedProjectCardAllOfCreator
+    from github_client.models.webhook_project_closed import WebhookProjectClosed
+    from github_client.models.webhook_project_column_created import WebhookProjectColumnCreated
+    from github_client.models.webhook_project_column_deleted import WebhookProjectColumnDeleted
+    from github_client.models.webhook_project_column_edited import WebhookProjectColumnEdited
+    from github_client.models.webhook_project_column_edited_changes import WebhookProjectColumnEditedChanges
+    from github_client.models.webhook_project_column_moved import WebhookProjectColumnMoved
+    from github_client.models.webhook_project_created import WebhookProjectCreated
+    from github_client.models.webhook_project_deleted import WebhookProjectDeleted
+    from github_client.models.webhook_project_edited import WebhookProjectEdited
+    from github_client.models.webhook_project_edited_changes import WebhookProjectEditedChanges
+    from github_client.models.webhook_project_edited_changes_body import WebhookProjectEditedChangesBody
+    from github_client.models.webhook_project_edited_changes_name import WebhookProjectEditedChangesName
+    from github_client.models.webhook_project_reopened import WebhookProjectReopened
+    from github_client.models.webhook_projects_v2_item_archived import WebhookProjectsV2ItemArchived
+    from github_client.models.webhook_projects_v2_item_converted import WebhookProjectsV2ItemConverted
+    from github_client.models.webhook_projects_v2_item_converted_changes import WebhookProjectsV2ItemConvertedChanges
+    from github_client.models.webhook_projects_v2_item_converted_changes_content_type import WebhookProjectsV2ItemConvertedChangesContentType
+    from github_client.models.webhook_projects_v2_item_created import WebhookProjectsV2ItemCreated
+    from github_client.models.webhook_projects_v2_item_deleted import WebhookProjectsV2ItemDeleted
+    from github_client.models.webhook_projects_v2_item_edited import WebhookProjectsV2ItemEdited
+    from github_client.models.webhook_projects_v2_item_edited_changes import WebhookProjectsV2ItemEditedChanges
+    from github_client.models.webhook_projects_v2_item_edited_changes_one_of import WebhookProjectsV2ItemEditedChangesOneOf
+    from github_client.models.webhook_projects_v2_item_edited_changes_one_of1 import WebhookProjectsV2ItemEditedChangesOneOf1
+    from github_client.models.webhook_projects_v2_item_edited_changes_one_of_field_value import WebhookProjectsV2ItemEditedChangesOneOfFieldValue
+    from github_client.models.webhook_projects_v2_item_edited_changes_one_of_field_value_from import WebhookProjectsV2ItemEditedChangesOneOfFieldValueFrom
+    from github_client.models.webhook_projects_v2_item_reordered import WebhookProjectsV2ItemReordered
+    from github_client.models.webhook_projects_v2_item_reordered_changes import WebhookProjectsV2ItemReorderedChanges
+    from github_client.models.webhook_projects_v2_item_restored import WebhookProjectsV2ItemRestored
+    from github_client.models.webhook_projects_v2_project_closed import WebhookProjectsV2ProjectClosed
+    from github_client.models.webhook_projects_v2_project_created import WebhookProjectsV2ProjectCreated
+    from github_client.models.webhook_projects_v2_project_deleted import WebhookProjectsV2ProjectDeleted
+    from github_client.models.webhook_projects_v2_project_edited import WebhookProjectsV2ProjectEdited
+    from github_client.models.webhook_projects_v2_project_edited_changes import WebhookProjectsV2ProjectEditedChanges
+    from github_client.models.webhook_projects_v2_project_edited_changes_public import WebhookProjectsV2ProjectEditedChangesPublic
+    from github_client.models.webhook_projects_v2_project_edited_changes_title import WebhookProjectsV2ProjectEditedChangesTitle
+    from github_client.models.webhook_projects_v2_project_reopened import WebhookProjectsV2ProjectReopened
+    from github_client.models.webhook_projects_v2_status_update_created import WebhookProjectsV2StatusUpdateCreated
+    from github_client.models.webhook_projects_v2_status_update_deleted import WebhookProjectsV2StatusUpdateDeleted
+    from github_client.models.webhook_projects_v2_status_update_edited import WebhookProjectsV2StatusUpdateEdited
+    from github_client.models.webhook_projects_v2_status_update_edited_changes import WebhookProjectsV2StatusUpdateEditedChanges
+    from github_client.models.webhook_projects_v2_status_update_edited_changes_start_date import WebhookProjectsV2StatusUpdateEditedChangesStartDate
+    from github_client.models.webhook_projects_v2_status_update_edited_changes_status import WebhookProjectsV2StatusUpdateEditedChangesStatus
+    from github_client.models.webhook_public import WebhookPublic
+    from github_client.models.webhook_pull_request_assigned import WebhookPullRequestAssigned
+    from github_client.models.webhook_pull_request_auto_merge_disabled import WebhookPullRequestAutoMergeDisabled
+    from github_client.models.webhook_pull_request_auto_merge_enabled import WebhookPullRequestAutoMergeEnabled
+    from github_client.models.webhook_pull_request_closed import WebhookPullRequestClosed
+    from github_client.models.webhook_pull_request_converted_to_draft import WebhookPullRequestConvertedToDraft
+    from github_client.models.webhook_pull_request_demilestoned import WebhookPullRequestDemilestoned
+    from github_client.models.webhook_pull_request_dequeued import WebhookPullRequestDequeued
+    from github_client.models.webhook_pull_request_edited import WebhookPullRequestEdited
+    from github_client.models.webhook_pull_request_edited_changes import WebhookPullRequestEditedChanges
+    from github_client.models.webhook_pull_request_edited_changes_base import WebhookPullRequestEditedChangesBase
+    from github_client.models.webhook_pull_request_enqueued import WebhookPullRequestEnqueued
+    from github_client.models.webhook_pull_request_labeled import WebhookPullRequestLabeled
+    from github_client.models.webhook_pull_request_locked import WebhookPullRequestLocked
+    from github_client.models.webhook_pull_request_milestoned import WebhookPullRequestMilestoned
+    from github_client.models.webhook_pull_request_opened import WebhookPullRequestOpened
+    from github_client.models.webhook_pull_request_ready_for_review import WebhookPullRequestReadyForReview
+    from github_client.models.webhook_pull_request_reopened import WebhookPullRequestReopened
+    from github_client.models.webhook_pull_request_review_comment_created import WebhookPullRequestReviewCommentCreated
+    from github_client.models.webhook_pull_request_review_comment_created_pull_request import WebhookPullRequestReviewCommentCreatedPullRequest
+    from github_client.models.webhook_pull_request_review_comment_created_pull_request_head import WebhookPullRequestReviewCommentCreatedPullRequestHead
+    from github_client.models.webhook_pull_request_review_comment_deleted import WebhookPullRequestReviewCommentDeleted
+    from github_client.models.webhook_pull_request_review_comment_deleted_pull_request import WebhookPullRequestReviewCommentDeletedPullRequest
+    from github_client.models.webhook_pull_request_review_comment_deleted_pull_request_head import WebhookPullRequestReviewCommentDeletedPullRequestHead
+    from github_client.models.webhook_pull_request_review_comment_edited import WebhookPullRequestReviewCommentEdited
+    from github_client.models.webhook_pull_request_review_comment_edited_pull_request import WebhookPullRequestReviewCommentEditedPullRequest
+    from github_client.models.webhook_pull_request_review_dismissed import WebhookPullRequestReviewDismissed
+    from github_client.models.webhook_pull_request_review_dismissed_review import WebhookPullRequestReviewDismissedReview
+    from github_client.models.webhook_pull_request_review_edited import WebhookPullRequestReviewEdited
+    from github_client.models.webhook_pull_request_review_edited_changes import WebhookPullRequestReviewEditedChanges
+    from github_client.models.webhook_pull_request_review_request_removed import WebhookPullRequestReviewRequestRemoved
+    from github_client.models.webhook_pull_request_review_request_removed_one_of import WebhookPullRequestReviewRequestRemovedOneOf
+    from github_client.models.webhook_pull_request_review_request_removed_one_of1 import WebhookPullRequestReviewRequestRemovedOneOf1
+    from github_client.models.webhook_pull_request_review_requested import WebhookPullRequestReviewRequested
+    from github_client.models.webhook_pull_request_review_requested_one_of import WebhookPullRequestReviewRequestedOneOf
+    from github_client.models.webhook_pull_request_review_requested_one_of1 import WebhookPullRequestReviewRequestedOneOf1
+    from github_client.models.webhook_pull_request_review_submitted import WebhookPullRequestReviewSubmitted
+    from github_client.models.webhook_pull_request_review_thread_resolved import WebhookPullRequestReviewThreadResolved
+    from github_client.models.webhook_pull_request_review_thread_resolved_thread import WebhookPullRequestReviewThreadResolvedThread
+    from github_client.models.webhook_pull_request_review_thread_unresolved import WebhookPullRequestReviewThreadUnresolved
+    from github_client.models.webhook_pull_request_review_thread_unresolved_thread import WebhookPullRequestReviewThreadUnresolvedThread
+    from github_client.models.webhook_pull_request_synchronize import WebhookPullRequestSynchronize
+    from github_client.models.webhook_pull_request_unassigned import WebhookPullRequestUnassigned
+    from github_client.models.webhook_pull_request_unlabeled import WebhookPullRequestUnlabeled
+    from github_client.models.webhook_pull_request_unlocked import WebhookPullRequestUnlocked
+    from github_client.models.webhook_push import WebhookPush
+    from github_client.models.webhook_registry_package_published import WebhookRegistryPackagePublished
+    from github_client.models.webhook_registry_package_published_registry_package import WebhookRegistryPackagePublishedRegistryPackage
+    from github_client.models.webhook_registry_package_published_registry_package_owner import WebhookRegistryPackagePublishedRegistryPackageOwner
+    from github_client.models.webhook_registry_package_published_registry_package_package_version import WebhookRegistryPackagePublishedRegistryPackagePackageVersion
+    from github_client.models.webhook_registry_package_published_registry_package_package_version_container_metadata import WebhookRegistryPackagePublishedRegistryPackagePackageVersionContainerMetadata
+    from github_client.models.webhook_registry_package_published_registry_package_package_version_npm_metadata import WebhookRegistryPackagePublishedRegistryPackagePackageVersionNpmMetadata
+    from github_client.models.webhook_registry_package_published_registry_package_package_version_nuget_metadata_inner import WebhookRegistryPackagePublishedRegistryPackagePackageVersionNugetMetadataInner
+    from github_client.models.webhook_registry_package_published_registry_package_package_version_nuget_metadata_inner_id import WebhookRegistryPackagePublishedRegistryPackagePackageVersionNugetMetadataInnerId
+    from github_client.models.webhook_registry_package_published_registry_package_package_version_package_files_inner import WebhookRegistryPackagePublishedRegistryPackagePackageVersionPackageFilesInner
+    from github_client.models.webhook_registry_package_published_registry_package_package_version_release import WebhookRegistryPackagePublishedRegistryPackagePackageVersionRelease
+    from github_client.models.webhook_registry_package_published_registry_package_registry import WebhookRegistryPackagePublishedRegistryPackageRegistry
+    from github_client.models.webhook_registry_package_updated import WebhookRegistryPackageUpdated
+    from github_client.models.webhook_registry_package_updated_registry_package import WebhookRegistryPackageUpdatedRegistryPackage
+    from github_client.models.webhook_registry_package_updated_registry_package_package_version import WebhookRegistryPackageUpdatedRegistryPackagePackageVersion
+    from github_client.models.webhook_registry_package_updated_registry_package_package_version_docker_metadata_inner import WebhookRegistryPackageUpdatedRegistryPackagePackageVersionDockerMetadataInner
+    from github_client.models.webhook_registry_package_updated_registry_package_package_version_package_files_inner import WebhookRegistryPackageUpdatedRegistryPackagePackageVersionPackageFilesInner
+    from github_client.models.webhook_registry_package_updated_registry_package_package_version_release import WebhookRegistryPackageUpdatedRegistryPackagePackageVersionRelease
+    from github_client.models.webhook_release_created import WebhookReleaseCreated
+    from github_client.models.webhook_release_deleted import WebhookReleaseDeleted
+    from github_client.models.webhook_release_edited import WebhookReleaseEdited
+    from github_client.models.webhook_release_edited_changes import WebhookReleaseEditedChanges
+    from github_client.models.webhook_release_edited_changes_make_latest import WebhookReleaseEditedChangesMakeLatest
+    from github_client.models.webhook_release_edited_changes_tag_name import WebhookReleaseEditedChangesTagName
+    from github_client.models.webhook_release_prereleased import WebhookReleasePrereleased
+    from github_client.models.webhook_release_published import WebhookReleasePublished
+    from github_client.models.webhook_release_released import WebhookReleaseReleased
+    from github_client.models.webhook_release_unpublished import WebhookReleaseUnpublished
+    from github_client.models.webhook_repository_advisory_published import WebhookRepositoryAdvisoryPublished
+    from github_client.models.webhook_repository_advisory_reported import WebhookRepositoryAdvisoryReported
+    from github_client.models.webhook_repository_archived import WebhookRepositoryArchived
+    from github_client.models.webhook_repository_created import WebhookRepositoryCreated
+    from github_client.models.webhook_repository_deleted import WebhookRepositoryDeleted
+    from github_client.models.webhook_repository_dispatch_sample import WebhookRepositoryDispatchSample
+    from github_client.models.webhook_repository_edited import WebhookRepositoryEdited
+    from github_client.models.webhook_repository_edited_changes import WebhookRepositoryEditedChanges
+    from github_client.models.webhook_repository_edited_changes_topics import WebhookRepositoryEditedChangesTopics
+    from github_client.models.webhook_repository_import import WebhookRepositoryImport
+    from github_client.models.webhook_repository_privatized import WebhookRepositoryPrivatized
+    from github_client.models.webhook_repository_publicized import WebhookRepositoryPublicized
+    from github_client.models.webhook_repository_renamed import WebhookRepositoryRenamed
+    from github_client.models.webhook_repository_renamed_changes import WebhookRepositoryRenamedChanges
+    from github_client.models.webhook_repository_renamed_changes_repository import WebhookRepositoryRenamedChangesRepository
+    from github_client.models.webhook_repository_ruleset_created import WebhookRepositoryRulesetCreated
+    from github_client.models.webhook_repository_ruleset_deleted import WebhookRepositoryRulesetDeleted
+    from github_client.models.webhook_repository_ruleset_edited import WebhookRepositoryRulesetEdited
+    from github_client.models.webhook_repository_ruleset_edited_changes import WebhookRepositoryRulesetEditedChanges
+    from github_client.models.webhook_repository_ruleset_edited_changes_conditions import WebhookRepositoryRulesetEditedChangesConditions
+    from github_client.models.webhook_repository_ruleset_edited_changes_conditions_updated_inner import WebhookRepositoryRulesetEditedChangesConditionsUpdatedInner
+    from github_client.models.webhook_repository_ruleset_edited_changes_conditions_updated_inner_changes import WebhookRepositoryRulesetEditedChangesConditionsUpdatedInnerChanges
+    from github_client.models.webhook_repository_ruleset_edited_changes_conditions_updated_inner_changes_include import WebhookRepositoryRulesetEditedChangesConditionsUpdatedInnerChangesInclude
+    from github_client.models.webhook_repository_ruleset_edited_changes_rules import WebhookRepositoryRulesetEditedChangesRules
+    from github_client.models.webhook_repository_ruleset_edited_changes_rules_updated_inner import WebhookRepositoryRulesetEditedChangesRulesUpdatedInner
+    from github_client.models.webhook_repository_ruleset_edited_changes_rules_updated_inner_changes import WebhookRepositoryRulesetEditedChangesRulesUpdatedInnerChanges
+    from github_client.models.webhook_repository_transferred import WebhookRepositoryTransferred
+    from github_client.models.webhook_repository_transferred_changes import WebhookRepositoryTransferredChanges
+    from github_client.models.webhook_repository_transferred_changes_owner import WebhookRepositoryTransferredChangesOwner
+    from github_client.models.webhook_repository_transferred_changes_owner_from import WebhookRepositoryTransferredChangesOwnerFrom
+    from github_client.models.webhook_repository_unarchived import WebhookRepositoryUnarchived
+    from github_client.models.webhook_repository_vulnerability_alert_create import WebhookRepositoryVulnerabilityAlertCreate
+    from github_client.models.webhook_repository_vulnerability_alert_dismiss import WebhookRepositoryVulnerabilityAlertDismiss
+    from github_client.models.webhook_repository_vulnerability_alert_reopen import WebhookRepositoryVulnerabilityAlertReopen
+    from github_client.models.webhook_repository_vulnerability_alert_resolve import WebhookRepositoryVulnerabilityAlertResolve
+    from github_client.models.webhook_rubygems_metadata import WebhookRubygemsMetadata
+    from github_client.models.webhook_rubygems_metadata_version_info import WebhookRubygemsMetadataVersionInfo
+    from github_client.models.webhook_secret_scanning_alert_created import WebhookSecretScanningAlertCreated
+    from github_client.models.webhook_secret_scanning_alert_location_created import WebhookSecretScanningAlertLocationCreated
+    from github_client.models.webhook_secret_scanning_alert_location_created_form_encoded import WebhookSecretScanningAlertLocationCreatedFormEncoded
+    from github_client.models.webhook_secret_scanning_alert_publicly_leaked import WebhookSecretScanningAlertPubliclyLeaked
+    from github_client.models.webhook_secret_scanning_alert_reopened import WebhookSecretScanningAlertReopened
+    from github_client.models.webhook_secret_scanning_alert_resolved import WebhookSecretScanningAlertResolved
+    from github_client.models.webhook_secret_scanning_alert_validated import WebhookSecretScanningAlertValidated
+    from github_client.models.webhook_secret_scanning_scan_completed import WebhookSecretScanningScanCompleted
+    from github_client.models.webhook_security_advisory_published import WebhookSecurityAdvisoryPublished
+    from github_client.models.webhook_security_advisory_updated import WebhookSecurityAdvisoryUpdated
+    from github_client.models.webhook_security_advisory_withdrawn import WebhookSecurityAdvisoryWithdrawn
+    from github_client.models.webhook_security_advisory_withdrawn_security_advisory import WebhookSecurityAdvisoryWithdrawnSecurityAdvisory
+    from github_client.models.webhook_security_and_analysis import WebhookSecurityAndAnalysis
+    from github_client.models.webhook_security_and_analysis_changes import WebhookSecurityAndAnalysisChanges
+    from github_client.models.webhook_security_and_analysis_changes_from import WebhookSecurityAndAnalysisChangesFrom
+    from github_client.models.webhook_sponsorship_cancelled import WebhookSponsorshipCancelled
+    from github_client.models.webhook_sponsorship_created import WebhookSponsorshipCreated
+    from github_client.models.webhook_sponsorship_edited import WebhookSponsorshipEdited
+    from github_client.models.webhook_sponsorship_edited_changes import WebhookSponsorshipEditedChanges
+    from github_client.models.webhook_sponsorship_edited_changes_privacy_level import WebhookSponsorshipEditedChangesPrivacyLevel
+    from github_client.models.webhook_sponsorship_pending_cancellation import WebhookSponsorshipPendingCancellation
+    from github_client.models.webhook_sponsorship_pending_tier_change import WebhookSponsorshipPendingTierChange
+    from github_client.models.webhook_sponsorship_tier_changed import WebhookSponsorshipTierChanged
+    from github_client.models.webhook_star_created import WebhookStarCreated
+    from github_client.models.webhook_star_deleted import WebhookStarDeleted
+    from github_client.models.webhook_status import WebhookStatus
+    from github_client.models.webhook_status_branches_inner import WebhookStatusBranchesInner
+    from github_client.models.webhook_status_branches_inner_commit import WebhookStatusBranchesInnerCommit
+    from github_client.models.webhook_status_commit import WebhookStatusCommit
+    from github_client.models.webhook_status_commit_commit import WebhookStatusCommitCommit
+    from github_client.models.webhook_status_commit_commit_author import WebhookStatusCommitCommitAuthor
+    from github_client.models.webhook_status_commit_commit_verification import WebhookStatusCommitCommitVerification
+    from github_client.models.webhook_status_commit_parents_inner import WebhookStatusCommitParentsInner
+    from github_client.models.webhook_sub_issues_parent_issue_added import WebhookSubIssuesParentIssueAdded
+    from github_client.models.webhook_sub_issues_parent_issue_removed import WebhookSubIssuesParentIssueRemoved
+    from github_client.models.webhook_sub_issues_sub_issue_added import WebhookSubIssuesSubIssueAdded
+    from github_client.models.webhook_sub_issues_sub_issue_removed import WebhookSubIssuesSubIssueRemoved
+    from github_client.models.webhook_team_add import WebhookTeamAdd
+    from github_client.models.webhook_team_added_to_repository import WebhookTeamAddedToRepository
+    from github_client.models.webhook_team_created import WebhookTeamCreated
+    from github_client.models.webhook_team_deleted import WebhookTeamDeleted
+    from github_client.models.webhook_team_edited import WebhookTeamEdited
+    from github_client.models.webhook_team_edited_changes import WebhookTeamEditedChanges
+    from github_client.models.webhook_team_edited_changes_notification_setting import WebhookTeamEditedChangesNotificationSetting
+    from github_client.models.webhook_team_edited_changes_privacy import WebhookTeamEditedChangesPrivacy
+    from github_client.models.webhook_team_edited_changes_repository import WebhookTeamEditedChangesRepository
+    from github_client.models.webhook_team_edited_changes_repository_permissions import WebhookTeamEditedChangesRepositoryPermissions
+    from github_client.models.webhook_team_edited_changes_repository_permissions_from import WebhookTeamEditedChangesRepositoryPermissionsFrom
+    from github_client.models.webhook_team_removed_from_repository import WebhookTeamRemovedFromRepository
+    from github_client.models.webhook_watch_started import WebhookWatchStarted
+    from github_client.models.webhook_workflow_dispatch import WebhookWorkflowDispatch
+    from github_client.models.webhook_workflow_job_completed import WebhookWorkflowJobCompleted
+    from github_client.models.webhook_workflow_job_completed_workflow_job import WebhookWorkflowJobCompletedWorkflowJob
+    from github_client.models.webhook_workflow_job_in_progress import WebhookWorkflowJobInProgress
+    from github_client.models.webhook_workflow_job_in_progress_workflow_job import WebhookWorkflowJobInProgressWorkflowJob
+    from github_client.models.webhook_workflow_job_queued import WebhookWorkflowJobQueued
+    from github_client.models.webhook_workflow_job_queued_workflow_job import WebhookWorkflowJobQueuedWorkflowJob
+    from github_client.models.webhook_workflow_job_waiting import WebhookWorkflowJobWaiting
+    from github_client.models.webhook_workflow_job_waiting_workflow_job import WebhookWorkflowJobWaitingWorkflowJob
+    from github_client.models.webhook_workflow_run_completed import WebhookWorkflowRunCompleted
+    from github_client.models.webhook_workflow_run_in_progress import WebhookWorkflowRunInProgress
+    from github_client.models.webhook_workflow_run_requested import WebhookWorkflowRunRequested
+    from github_client.models.webhooks_alert import WebhooksAlert
+    from github_client.models.webhooks_answer import WebhooksAnswer
+    from github_client.models.webhooks_approver import WebhooksApprover
+    from github_client.models.webhooks_changes import WebhooksChanges
+    from github_client.models.webhooks_changes8 import WebhooksChanges8
+    from github_client.models.webhooks_changes8_tier import WebhooksChanges8Tier
+    from github_client.models.webhooks_changes_body import WebhooksChangesBody
+    from github_client.models.webhooks_comment import WebhooksComment
+    from github_client.models.webhooks_deploy_key import WebhooksDeployKey
+    from github_client.models.webhooks_issue import WebhooksIssue
+    from github_client.models.webhooks_issue2 import WebhooksIssue2
+    from github_client.models.webhooks_issue_comment import WebhooksIssueComment
+    from github_client.models.webhooks_issue_pull_request import WebhooksIssuePullRequest
+    from github_client.models.webhooks_label import WebhooksLabel
+    from github_client.models.webhooks_marketplace_purchase import WebhooksMarketplacePurchase
+    from github_client.models.webhooks_marketplace_purchase_account import WebhooksMarketplacePurchaseAccount
+    from github_client.models.webhooks_marketplace_purchase_plan import WebhooksMarketplacePurchasePlan
+    from github_client.models.webhooks_membership import WebhooksMembership
+    from github_client.models.webhooks_milestone import WebhooksMilestone
+    from github_client.models.webhooks_milestone3 import WebhooksMilestone3
+    from github_client.models.webhooks_previous_marketplace_purchase import WebhooksPreviousMarketplacePurchase
+    from github_client.models.webhooks_previous_marketplace_purchase_plan import WebhooksPreviousMarketplacePurchasePlan
+    from github_client.models.webhooks_project import WebhooksProject
+    from github_client.models.webhooks_project_card import WebhooksProjectCard
+    from github_client.models.webhooks_project_changes import WebhooksProjectChanges
+    from github_client.models.webhooks_project_changes_archived_at import WebhooksProjectChangesArchivedAt
+    from github_client.models.webhooks_project_column import WebhooksProjectColumn
+    from github_client.models.webhooks_pull_request5 import WebhooksPullRequest5
+    from github_client.models.webhooks_pull_request5_base import WebhooksPullRequest5Base
+    from github_client.models.webhooks_pull_request5_links import WebhooksPullRequest5Links
+    from github_client.models.webhooks_pull_request5_requested_reviewers_inner import WebhooksPullRequest5RequestedReviewersInner
+    from github_client.models.webhooks_release import WebhooksRelease
+    from github_client.models.webhooks_release1 import WebhooksRelease1
+    from github_client.models.webhooks_repositories_inner import WebhooksRepositoriesInner
+    from github_client.models.webhooks_repository_selection import WebhooksRepositorySelection
+    from github_client.models.webhooks_review import WebhooksReview
+    from github_client.models.webhooks_review_comment import WebhooksReviewComment
+    from github_client.models.webhooks_review_comment_links import WebhooksReviewCommentLinks
+    from github_client.models.webhooks_review_links import WebhooksReviewLinks
+    from github_client.models.webhooks_reviewers_inner import WebhooksReviewersInner
+    from github_client.models.webhooks_rule import WebhooksRule
+    from github_client.models.webhooks_security_advisory import WebhooksSecurityAdvisory
+    from github_client.models.webhooks_security_advisory_cvss import WebhooksSecurityAdvisoryCvss
+    from github_client.models.webhooks_security_advisory_cwes_inner import WebhooksSecurityAdvisoryCwesInner
+    from github_client.models.webhooks_security_advisory_identifiers_inner import WebhooksSecurityAdvisoryIdentifiersInner
+    from github_client.models.webhooks_security_advisory_references_inner import WebhooksSecurityAdvisoryReferencesInner
+    from github_client.models.webhooks_security_advisory_vulnerabilities_inner import WebhooksSecurityAdvisoryVulnerabilitiesInner
+    from github_client.models.webhooks_security_advisory_vulnerabilities_inner_first_patched_version import WebhooksSecurityAdvisoryVulnerabilitiesInnerFirstPatchedVersion
+    from github_client.models.webhooks_security_advisory_vulnerabilities_inner_package import WebhooksSecurityAdvisoryVulnerabilitiesInnerPackage
+    from github_client.models.webhooks_sponsorship import WebhooksSponsorship
+    from github_client.models.webhooks_sponsorship_maintainer import WebhooksSponsorshipMaintainer
+    from github_client.models.webhooks_team import WebhooksTeam
+    from github_client.models.webhooks_team1 import WebhooksTeam1
+    from github_client.models.webhooks_team_parent import WebhooksTeamParent
+    from github_client.models.webhooks_user import WebhooksUser
+    from github_client.models.webhooks_user_mannequin import WebhooksUserMannequin
+    from github_client.models.webhooks_workflow import WebhooksWorkflow
+    from github_client.models.webhooks_workflow_job_run import WebhooksWorkflowJobRun
+    from github_client.models.workflow import Workflow
+    from github_client.models.workflow_run import WorkflowRun
+    from github_client.models.workflow_run1 import WorkflowRun1
+    from github_client.models.workflow_run2 import WorkflowRun2
+    from github_client.models.workflow_run2_pull_requests_inner import WorkflowRun2PullRequestsInner
+    from github_client.models.workflow_run_pull_requests_inner import WorkflowRunPullRequestsInner
+    from github_client.models.workflow_run_usage import WorkflowRunUsage
+    from github_client.models.workflow_run_usage_billable import WorkflowRunUsageBillable
+    from github_client.models.workflow_run_usage_billable_ubuntu import WorkflowRunUsageBillableUBUNTU
+    from github_client.models.workflow_run_usage_billable_ubuntu_job_runs_inner import WorkflowRunUsageBillableUBUNTUJobRunsInner
+    from github_client.models.workflow_step import WorkflowStep
+    from github_client.models.workflow_step1 import WorkflowStep1
+    from github_client.models.workflow_step2 import WorkflowStep2
+    from github_client.models.workflow_step3 import WorkflowStep3
+    from github_client.models.workflow_step4 import WorkflowStep4
+    from github_client.models.workflow_usage import WorkflowUsage
+    from github_client.models.workflow_usage_billable import WorkflowUsageBillable
+    from github_client.models.workflow_usage_billable_ubuntu import WorkflowUsageBillableUBUNTU
+
+# Modelle werden erst beim ersten Zugriff importiert, z.B. wenn ApiClient einen Antworttyp auflöst
+_lazy_imports = {
+    "ActionsAddCustomLabelsToSelfHostedRunnerForOrgRequest": "github_client.models.actions_add_custom_labels_to_self_hosted_runner_for_org_request",
+    "ActionsArtifactAndLogRetention": "github_client.models.actions_artifact_and_log_retention",
+    "ActionsArtifactAndLogRetentionResponse": "github_client.models.actions_artifact_and_log_retention_response",
+    "ActionsBillingUsage": "github_client.models.actions_billing_usage",
+    "ActionsBillingUsageMinutesUsedBreakdown": "github_client.models.actions_billing_usage_minutes_used_breakdown",
+    "ActionsCacheList": "github_client.models.actions_cache_list",
+    "ActionsCacheListActionsCachesInner": "github_client.models.actions_cache_list_actions_caches_inner",
+    "ActionsCacheUsageByRepository": "github_client.models.actions_cache_usage_by_repository",
+    "ActionsCacheUsageOrgEnterprise": "github_client.models.actions_cache_usage_org_enterprise",
+    "ActionsCreateHostedRunnerForOrgRequest": "github_client.models.actions_create_hosted_runner_for_org_request",
+    "ActionsCreateHostedRunnerForOrgRequestImage": "github_client.models.actions_create_hosted_runner_for_org_request_image",
+    "ActionsCreateOrUpdateEnvironmentSecretRequest": "github_client.models.actions_create_or_update_environment_secret_request",
+    "ActionsCreateOrUpdateOrgSecretRequest": "github_client.models.actions_create_or_update_org_secret_request",
+    "ActionsCreateOrUpdateRepoSecretRequest": "github_client.models.actions_create_or_update_repo_secret_request",
+    "ActionsCreateOrgVariableRequest": "github_client.models.actions_create_org_variable_request",
+    "ActionsCreateRepoVariableRequest": "github_client.models.actions_create_repo_variable_request",
+    "ActionsCreateSelfHostedRunnerGroupForOrgRequest": "github_client.models.actions_create_self_hosted_runner_group_for_org_request",
+    "ActionsCreateWorkflowDispatchRequest": "github_client.models.actions_create_workflow_dispatch_request",
+    "ActionsDefaultWorkflowPermissions": "github_client.models.actions_default_workflow_permissions",
+    "ActionsForkPrContributorApproval": "github_client.models.actions_fork_pr_contributor_approval",
+    "ActionsForkPrWorkflowsPrivateRepos": "github_client.models.actions_fork_pr_workflows_private_repos",
+    "ActionsForkPrWorkflowsPrivateReposRequest": "github_client.models.actions_fork_pr_workflows_private_repos_request",
+    "ActionsGenerateRunnerJitconfigForOrg201Response": "github_client.models.actions_generate_runner_jitconfig_for_org201_response",
+    "ActionsGenerateRunnerJitconfigForOrgRequest": "github_client.models.actions_generate_runner_jitconfig_for_org_request",
+    "ActionsGetActionsCacheUsageByRepoForOrg200Response": "github_client.models.actions_get_actions_cache_usage_by_repo_for_org200_response",
+    "ActionsGetDefaultWorkflowPermissions": "github_client.models.actions_get_default_workflow_permissions",
+    "ActionsGetHostedRunnersGithubOwnedImagesForOrg200Response": "github_client.models.actions_get_hosted_runners_github_owned_images_for_org200_response",
+    "ActionsGetHostedRunnersMachineSpecsForOrg200Response": "github_client.models.actions_get_hosted_runners_machine_specs_for_org200_response",
+    "ActionsGetHostedRunnersPlatformsForOrg200Response": "github_client.models.actions_get_hosted_runners_platforms_for_org200_response",
+    "ActionsGetWorkflowWorkflowIdParameter": "github_client.models.actions_get_workflow_workflow_id_parameter",
+    "ActionsHostedRunner": "github_client.models.actions_hosted_runner",
+    "ActionsHostedRunnerCuratedImage": "github_client.models.actions_hosted_runner_curated_image",
+    "ActionsHostedRunnerCustomImage": "github_client.models.actions_hosted_runner_custom_image",
+    "ActionsHostedRunnerCustomImageVersion": "github_client.models.actions_hosted_runner_custom_image_version",
+    "ActionsHostedRunnerLimits": "github_client.models.actions_hosted_runner_limits",
+    "ActionsHostedRunnerMachineSpec": "github_client.models.actions_hosted_runner_machine_spec",
+    "ActionsListArtifactsForRepo200Response": "github_client.models.actions_list_artifacts_for_repo200_response",
+    "ActionsListCustomImageVersionsForOrg200Response": "github_client.models.actions_list_custom_image_versions_for_org200_response",
+    "ActionsListCustomImagesForOrg200Response": "github_client.models.actions_list_custom_images_for_org200_response",
+    "ActionsListGithubHostedRunnersInGroupForOrg200Response": "github_client.models.actions_list_github_hosted_runners_in_group_for_org200_response",
+    "ActionsListHostedRunnersForOrg200Response": "github_client.models.actions_list_hosted_runners_for_org200_response",
+    "ActionsListJobsForWorkflowRunAttempt200Response": "github_client.models.actions_list_jobs_for_workflow_run_attempt200_response",
+    "ActionsListLabelsForSelfHostedRunnerForOrg200Response": "github_client.models.actions_list_labels_for_self_hosted_runner_for_org200_response",
+    "ActionsListOrgSecrets200Response": "github_client.models.actions_list_org_secrets200_response",
+    "ActionsListOrgVariables200Response": "github_client.models.actions_list_org_variables200_response",
+    "ActionsListRepoAccessToSelfHostedRunnerGroupInOrg200Response": "github_client.models.actions_list_repo_access_to_self_hosted_runner_group_in_org200_response",
+    "ActionsListRepoOrganizationSecrets200Response": "github_client.models.actions_list_repo_organization_secrets200_response",
+    "ActionsListRepoOrganizationVariables200Response": "github_client.models.actions_list_repo_organization_variables200_response",
+    "ActionsListRepoWorkflows200Response": "github_client.models.actions_list_repo_workflows200_response",
+    "ActionsListSelectedReposForOrgSecret200Response": "github_client.models.actions_list_selected_repos_for_org_secret200_response",
+    "ActionsListSelectedRepositoriesEnabledGithubActionsOrganization200Response": "github_client.models.actions_list_selected_repositories_enabled_github_actions_organization200_response",
+    "ActionsListSelectedRepositoriesSelfHostedRunnersOrganization200Response": "github_client.models.actions_list_selected_repositories_self_hosted_runners_organization200_response",
+    "ActionsListSelfHostedRunnerGroupsForOrg200Response": "github_client.models.actions_list_self_hosted_runner_groups_for_org200_response",
+    "ActionsListSelfHostedRunnersForOrg200Response": "github_client.models.actions_list_self_hosted_runners_for_org200_response",
+    "ActionsListSelfHostedRunnersInGroupForOrg200Response": "github_client.models.actions_list_self_hosted_runners_in_group_for_org200_response",
+    "ActionsListWorkflowRunsForRepo200Response": "github_client.models.actions_list_workflow_runs_for_repo200_response",
+    "ActionsOIDCSubjectCustomizationForARepository": "github_client.models.actions_oidc_subject_customization_for_a_repository",
+    "ActionsOrganizationPermissions": "github_client.models.actions_organization_permissions",
+    "ActionsPublicKey": "github_client.models.actions_public_key",
+    "ActionsReRunJobForWorkflowRunRequest": "github_client.models.actions_re_run_job_for_workflow_run_request",
+    "ActionsRepositoryPermissions": "github_client.models.actions_repository_permissions",
+    "ActionsReviewCustomGatesForRunRequest": "github_client.models.actions_review_custom_gates_for_run_request",
+    "ActionsReviewPendingDeploymentsForRunRequest": "github_client.models.actions_review_pending_deployments_for_run_request",
+    "ActionsSecret": "github_client.models.actions_secret",
+    "ActionsSetCustomLabelsForSelfHostedRunnerForOrgRequest": "github_client.models.actions_set_custom_labels_for_self_hosted_runner_for_org_request",
+    "ActionsSetDefaultWorkflowPermissions": "github_client.models.actions_set_default_workflow_permissions",
+    "ActionsSetGithubActionsPermissionsOrganizationRequest": "github_client.models.actions_set_github_actions_permissions_organization_request",
+    "ActionsSetGithubActionsPermissionsRepositoryRequest": "github_client.models.actions_set_github_actions_permissions_repository_request",
+    "ActionsSetRepoAccessToSelfHostedRunnerGroupInOrgRequest": "github_client.models.actions_set_repo_access_to_self_hosted_runner_group_in_org_request",
+    "ActionsSetSelectedReposForOrgSecretRequest": "github_client.models.actions_set_selected_repos_for_org_secret_request",
+    "ActionsSetSelectedReposForOrgVariableRequest": "github_client.models.actions_set_selected_repos_for_org_variable_request",
+    "ActionsSetSelectedRepositoriesEnabledGithubActionsOrganizationRequest": "github_client.models.actions_set_selected_repositories_enabled_github_actions_organization_request",
+    "ActionsSetSelectedRepositoriesSelfHostedRunnersOrganizationRequest": "github_client.models.actions_set_selected_repositories_self_hosted_runners_organization_request",
+    "ActionsSetSelfHostedRunnersInGroupForOrgRequest": "github_client.models.actions_set_self_hosted_runners_in_group_for_org_request",
+    "ActionsSetSelfHostedRunnersPermissionsOrganizationRequest": "github_client.models.actions_set_self_hosted_runners_permissions_organization_request",
+    "ActionsUpdateHostedRunnerForOrgRequest": "github_client.models.actions_update_hosted_runner_for_org_request",
+    "ActionsUpdateOrgVariableRequest": "github_client.models.actions_update_org_variable_request",
+    "ActionsUpdateRepoVariableRequest": "github_client.models.actions_update_repo_variable_request",
+    "ActionsUpdateSelfHostedRunnerGroupForOrgRequest": "github_client.models.actions_update_self_hosted_runner_group_for_org_request",
+    "ActionsVariable": "github_client.models.actions_variable",
+    "ActionsWorkflowAccessToRepository": "github_client.models.actions_workflow_access_to_repository",
+    "Activity": "github_client.models.activity",
+    "ActivityListPublicEvents503Response": "github_client.models.activity_list_public_events503_response",
+    "ActivityListReposStarredByUser200Response": "github_client.models.activity_list_repos_starred_by_user200_response",
+    "ActivityListStargazersForRepo200Response": "github_client.models.activity_list_stargazers_for_repo200_response",
+    "ActivityMarkNotificationsAsRead202Response": "github_client.models.activity_mark_notifications_as_read202_response",
+    "ActivityMarkNotificationsAsReadRequest": "github_client.models.activity_mark_notifications_as_read_request",
+    "ActivityMarkRepoNotificationsAsRead202Response": "github_client.models.activity_mark_repo_notifications_as_read202_response",
+    "ActivityMarkRepoNotificationsAsReadRequest": "github_client.models.activity_mark_repo_notifications_as_read_request",
+    "ActivitySetRepoSubscriptionRequest": "github_client.models.activity_set_repo_subscription_request",
+    "ActivitySetThreadSubscriptionRequest": "github_client.models.activity_set_thread_subscription_request",
+    "Actor": "github_client.models.actor",
+    "AddedToProjectIssueEvent": "github_client.models.added_to_project_issue_event",
+    "AddedToProjectIssueEventProjectCard": "github_client.models.added_to_project_issue_event_project_card",
+    "AlertInstance": "github_client.models.alert_instance",
+    "AlertInstanceLocation": "github_client.models.alert_instance_location",
+    "AllowedActions": "github_client.models.allowed_actions",
+    "ApiInsightsRouteStatsInner": "github_client.models.api_insights_route_stats_inner",
+    "ApiInsightsSubjectStatsInner": "github_client.models.api_insights_subject_stats_inner",
+    "ApiInsightsSummaryStats": "github_client.models.api_insights_summary_stats",
+    "ApiInsightsTimeStatsInner": "github_client.models.api_insights_time_stats_inner",
+    "ApiInsightsUserStatsInner": "github_client.models.api_insights_user_stats_inner",
+    "ApiOverview": "github_client.models.api_overview",
+    "ApiOverviewDomains": "github_client.models.api_overview_domains",
+    "ApiOverviewDomainsActionsInbound": "github_client.models.api_overview_domains_actions_inbound",
+    "ApiOverviewDomainsArtifactAttestations": "github_client.models.api_overview_domains_artifact_attestations",
+    "ApiOverviewSshKeyFingerprints": "github_client.models.api_overview_ssh_key_fingerprints",
+    "App": "github_client.models.app",
+    "App1": "github_client.models.app1",
+    "App10": "github_client.models.app10",
+    "App11": "github_client.models.app11",
+    "App12": "github_client.models.app12",
+    "App13": "github_client.models.app13",
+    "App14": "github_client.models.app14",
+    "App15": "github_client.models.app15",
+    "App16": "github_client.models.app16",
+    "App1Permissions": "github_client.models.app1_permissions",
+    "App2": "github_client.models.app2",
+    "App2Permissions": "github_client.models.app2_permissions",
+    "App3": "github_client.models.app3",
+    "App3Permissions": "github_client.models.app3_permissions",
+    "App4": "github_client.models.app4",
+    "App5": "github_client.models.app5",
+    "App6": "github_client.models.app6",
+    "App7": "github_client.models.app7",
+    "App8": "github_client.models.app8",
+    "App9": "github_client.models.app9",
+    "AppPermissions": "github_client.models.app_permissions",
+    "AppsCheckTokenRequest": "github_client.models.apps_check_token_request",
+    "AppsCreateFromManifest201Response": "github_client.models.apps_create_from_manifest201_response",
+    "AppsCreateInstallationAccessTokenRequest": "github_client.models.apps_create_installation_access_token_request",
+    "AppsDeleteAuthorizationRequest": "github_client.models.apps_delete_authorization_request",
+    "AppsListInstallationReposForAuthenticatedUser200Response": "github_client.models.apps_list_installation_repos_for_authenticated_user200_response",
+    "AppsListReposAccessibleToInstallation200Response": "github_client.models.apps_list_repos_accessible_to_installation200_response",
+    "AppsScopeTokenRequest": "github_client.models.apps_scope_token_request",
+    "AppsUpdateWebhookConfigForAppRequest": "github_client.models.apps_update_webhook_config_for_app_request",
+    "Artifact": "github_client.models.artifact",
+    "ArtifactWorkflowRun": "github_client.models.artifact_workflow_run",
+    "AssignedIssueEvent": "github_client.models.assigned_issue_event",
+    "AuthenticationToken": "github_client.models.authentication_token",
+    "AuthorAssociation": "github_client.models.author_association",
+    "Authorization": "github_client.models.authorization",
+    "AuthorizationApp": "github_client.models.authorization_app",
+    "AutoMerge": "github_client.models.auto_merge",
+    "Autolink": "github_client.models.autolink",
+    "BaseGist": "github_client.models.base_gist",
+    "BaseGistFilesValue": "github_client.models.base_gist_files_value",
+    "BasicError": "github_client.models.basic_error",
+    "BillingPremiumRequestUsageReportOrg": "github_client.models.billing_premium_request_usage_report_org",
+    "BillingPremiumRequestUsageReportOrgTimePeriod": "github_client.models.billing_premium_request_usage_report_org_time_period",
+    "BillingPremiumRequestUsageReportOrgUsageItemsInner": "github_client.models.billing_premium_request_usage_report_org_usage_items_inner",
+    "BillingPremiumRequestUsageReportUser": "github_client.models.billing_premium_request_usage_report_user",
+    "BillingUpdateBudgetOrg200Response": "github_client.models.billing_update_budget_org200_response",
+    "BillingUpdateBudgetOrg200ResponseBudget": "github_client.models.billing_update_budget_org200_response_budget",
+    "BillingUpdateBudgetOrg200ResponseBudgetBudgetAlerting": "github_client.models.billing_update_budget_org200_response_budget_budget_alerting",
+    "BillingUpdateBudgetOrgRequest": "github_client.models.billing_update_budget_org_request",
+    "BillingUpdateBudgetOrgRequestBudgetAlerting": "github_client.models.billing_update_budget_org_request_budget_alerting",
+    "BillingUsageReport": "github_client.models.billing_usage_report",
+    "BillingUsageReportUsageItemsInner": "github_client.models.billing_usage_report_usage_items_inner",
+    "BillingUsageReportUser": "github_client.models.billing_usage_report_user",
+    "BillingUsageReportUserUsageItemsInner": "github_client.models.billing_usage_report_user_usage_items_inner",
+    "BillingUsageSummaryReportOrg": "github_client.models.billing_usage_summary_report_org",
+    "BillingUsageSummaryReportOrgUsageItemsInner": "github_client.models.billing_usage_summary_report_org_usage_items_inner",
+    "BillingUsageSummaryReportUser": "github_client.models.billing_usage_summary_report_user",
+    "Blob": "github_client.models.blob",
+    "BranchProtection": "github_client.models.branch_protection",
+    "BranchProtectionAllowForkSyncing": "github_client.models.branch_protection_allow_fork_syncing",
+    "BranchProtectionLockBranch": "github_client.models.branch_protection_lock_branch",
+    "BranchProtectionRequiredLinearHistory": "github_client.models.branch_protection_required_linear_history",
+    "BranchProtectionRequiredSignatures": "github_client.models.branch_protection_required_signatures",
+    "BranchRestrictionPolicy": "github_client.models.branch_restriction_policy",
+    "BranchRestrictionPolicyAppsInner": "github_client.models.branch_restriction_policy_apps_inner",
+    "BranchRestrictionPolicyAppsInnerOwner": "github_client.models.branch_restriction_policy_apps_inner_owner",
+    "BranchRestrictionPolicyAppsInnerPermissions": "github_client.models.branch_restriction_policy_apps_inner_permissions",
+    "BranchRestrictionPolicyUsersInner": "github_client.models.branch_restriction_policy_users_inner",
+    "BranchShort": "github_client.models.branch_short",
+    "BranchShortCommit": "github_client.models.branch_short_commit",
+    "BranchWithProtection": "github_client.models.branch_with_protection",
+    "BranchWithProtectionLinks": "github_client.models.branch_with_protection_links",
+    "Budget": "github_client.models.budget",
+    "BudgetBudgetAlerting": "github_client.models.budget_budget_alerting",
+    "CampaignAlertType": "github_client.models.campaign_alert_type",
+    "CampaignState": "github_client.models.campaign_state",
+    "CampaignSummary": "github_client.models.campaign_summary",
+    "CampaignSummaryAlertStats": "github_client.models.campaign_summary_alert_stats",
+    "CampaignsCreateCampaignRequest": "github_client.models.campaigns_create_campaign_request",
+    "CampaignsCreateCampaignRequestCodeScanningAlertsInner": "github_client.models.campaigns_create_campaign_request_code_scanning_alerts_inner",
+    "CampaignsUpdateCampaignRequest": "github_client.models.campaigns_update_campaign_request",
+    "CheckAnnotation": "github_client.models.check_annotation",
+    "CheckAutomatedSecurityFixes": "github_client.models.check_automated_security_fixes",
+    "CheckImmutableReleases": "github_client.models.check_immutable_releases",
+    "CheckRun": "github_client.models.check_run",
+    "CheckRunCheckSuite": "github_client.models.check_run_check_suite",
+    "CheckRunOutput": "github_client.models.check_run_output",
+    "CheckRunPullRequest": "github_client.models.check_run_pull_request",
+    "CheckRunPullRequestBase": "github_client.models.check_run_pull_request_base",
+    "CheckRunWithSimpleCheckSuite": "github_client.models.check_run_with_simple_check_suite",
+    "CheckRunWithSimpleCheckSuiteOutput": "github_client.models.check_run_with_simple_check_suite_output",
+    "CheckSuite": "github_client.models.check_suite",
+    "CheckSuitePreference": "github_client.models.check_suite_preference",
+    "CheckSuitePreferencePreferences": "github_client.models.check_suite_preference_preferences",
+    "CheckSuitePreferencePreferencesAutoTriggerChecksInner": "github_client.models.check_suite_preference_preferences_auto_trigger_checks_inner",
+    "ChecksCreateRequest": "github_client.models.checks_create_request",
+    "ChecksCreateRequestActionsInner": "github_client.models.checks_create_request_actions_inner",
+    "ChecksCreateRequestOneOf": "github_client.models.checks_create_request_one_of",
+    "ChecksCreateRequestOneOf1": "github_client.models.checks_create_request_one_of1",
+    "ChecksCreateRequestOutput": "github_client.models.checks_create_request_output",
+    "ChecksCreateRequestOutputAnnotationsInner": "github_client.models.checks_create_request_output_annotations_inner",
+    "ChecksCreateRequestOutputImagesInner": "github_client.models.checks_create_request_output_images_inner",
+    "ChecksCreateSuiteRequest": "github_client.models.checks_create_suite_request",
+    "ChecksListForSuite200Response": "github_client.models.checks_list_for_suite200_response",
+    "ChecksListSuitesForRef200Response": "github_client.models.checks_list_suites_for_ref200_response",
+    "ChecksSetSuitesPreferencesRequest": "github_client.models.checks_set_suites_preferences_request",
+    "ChecksSetSuitesPreferencesRequestAutoTriggerChecksInner": "github_client.models.checks_set_suites_preferences_request_auto_trigger_checks_inner",
+    "ChecksUpdateRequest": "github_client.models.checks_update_request",
+    "ChecksUpdateRequestAnyOf": "github_client.models.checks_update_request_any_of",
+    "ChecksUpdateRequestOutput": "github_client.models.checks_update_request_output",
+    "Classroom": "github_client.models.classroom",
+    "ClassroomAcceptedAssignment": "github_client.models.classroom_accepted_assignment",
+    "ClassroomAssignment": "github_client.models.classroom_assignment",
+    "ClassroomAssignmentGrade": "github_client.models.classroom_assignment_grade",
+    "CloneTraffic": "github_client.models.clone_traffic",
+    "CodeOfConduct": "github_client.models.code_of_conduct",
+    "CodeOfConductSimple": "github_client.models.code_of_conduct_simple",
+    "CodeScanningAlert": "github_client.models.code_scanning_alert",
+    "CodeScanningAlertClassification": "github_client.models.code_scanning_alert_classification",
+    "CodeScanningAlertDismissedReason": "github_client.models.code_scanning_alert_dismissed_reason",
+    "CodeScanningAlertInstance": "github_client.models.code_scanning_alert_instance",
+    "CodeScanningAlertInstanceMessage": "github_client.models.code_scanning_alert_instance_message",
+    "CodeScanningAlertItems": "github_client.models.code_scanning_alert_items",
+    "CodeScanningAlertLocation": "github_client.models.code_scanning_alert_location",
+    "CodeScanningAlertRule": "github_client.models.code_scanning_alert_rule",
+    "CodeScanningAlertRuleSummary": "github_client.models.code_scanning_alert_rule_summary",
+    "CodeScanningAlertSetState": "github_client.models.code_scanning_alert_set_state",
+    "CodeScanningAlertSeverity": "github_client.models.code_scanning_alert_severity",
+    "CodeScanningAlertState": "github_client.models.code_scanning_alert_state",
+    "CodeScanningAlertStateQuery": "github_client.models.code_scanning_alert_state_query",
+    "CodeScanningAnalysis": "github_client.models.code_scanning_analysis",
+    "CodeScanningAnalysisDeletion": "github_client.models.code_scanning_analysis_deletion",
+    "CodeScanningAnalysisTool": "github_client.models.code_scanning_analysis_tool",
+    "CodeScanningAutofix": "github_client.models.code_scanning_autofix",
+    "CodeScanningAutofixCommits": "github_client.models.code_scanning_autofix_commits",
+    "CodeScanningAutofixCommitsResponse": "github_client.models.code_scanning_autofix_commits_response",
+    "CodeScanningAutofixStatus": "github_client.models.code_scanning_autofix_status",
+    "CodeScanningCodeqlDatabase": "github_client.models.code_scanning_codeql_database",
+    "CodeScanningCreateVariantAnalysisRequest": "github_client.models.code_scanning_create_variant_analysis_request",
+    "CodeScanningDefaultSetup": "github_client.models.code_scanning_default_setup",
+    "CodeScanningDefaultSetupOptions": "github_client.models.code_scanning_default_setup_options",
+    "CodeScanningDefaultSetupUpdate": "github_client.models.code_scanning_default_setup_update",
+    "CodeScanningDefaultSetupUpdateResponse": "github_client.models.code_scanning_default_setup_update_response",
+    "CodeScanningOptions": "github_client.models.code_scanning_options",
+    "CodeScanningOrganizationAlertItems": "github_client.models.code_scanning_organization_alert_items",
+    "CodeScanningSarifsReceipt": "github_client.models.code_scanning_sarifs_receipt",
+    "CodeScanningSarifsStatus": "github_client.models.code_scanning_sarifs_status",
+    "CodeScanningUpdateAlertRequest": "github_client.models.code_scanning_update_alert_request",
+    "CodeScanningUploadSarifRequest": "github_client.models.code_scanning_upload_sarif_request",
+    "CodeScanningVariantAnalysis": "github_client.models.code_scanning_variant_analysis",
+    "CodeScanningVariantAnalysisLanguage": "github_client.models.code_scanning_variant_analysis_language",
+    "CodeScanningVariantAnalysisRepoTask": "github_client.models.code_scanning_variant_analysis_repo_task",
+    "CodeScanningVariantAnalysisRepository": "github_client.models.code_scanning_variant_analysis_repository",
+    "CodeScanningVariantAnalysisScannedRepositoriesInner": "github_client.models.code_scanning_variant_analysis_scanned_repositories_inner",
+    "CodeScanningVariantAnalysisSkippedRepoGroup": "github_client.models.code_scanning_variant_analysis_skipped_repo_group",
+    "CodeScanningVariantAnalysisSkippedRepositories": "github_client.models.code_scanning_variant_analysis_skipped_repositories",
+    "CodeScanningVariantAnalysisSkippedRepositoriesNotFoundRepos": "github_client.models.code_scanning_variant_analysis_skipped_repositories_not_found_repos",
+    "CodeScanningVariantAnalysisStatus": "github_client.models.code_scanning_variant_analysis_status",
+    "CodeSearchResultItem": "github_client.models.code_search_result_item",
+    "CodeSecurityAttachConfigurationRequest": "github_client.models.code_security_attach_configuration_request",
+    "CodeSecurityAttachEnterpriseConfigurationRequest": "github_client.models.code_security_attach_enterprise_configuration_request",
+    "CodeSecurityConfiguration": "github_client.models.code_security_configuration",
+    "CodeSecurityConfigurationCodeScanningDefaultSetupOptions": "github_client.models.code_security_configuration_code_scanning_default_setup_options",
+    "CodeSecurityConfigurationCodeScanningOptions": "github_client.models.code_security_configuration_code_scanning_options",
+    "CodeSecurityConfigurationForRepository": "github_client.models.code_security_configuration_for_repository",
+    "CodeSecurityConfigurationRepositories": "github_client.models.code_security_configuration_repositories",
+    "CodeSecurityCreateConfigurationForEnterpriseRequest": "github_client.models.code_security_create_configuration_for_enterprise_request",
+    "CodeSecurityCreateConfigurationForEnterpriseRequestDependencyGraphAutosubmitActionOptions": "github_client.models.code_security_create_configuration_for_enterprise_request_dependency_graph_autosubmit_action_options",
+    "CodeSecurityCreateConfigurationRequest": "github_client.models.code_security_create_configuration_request",
+    "CodeSecurityCreateConfigurationRequestSecretScanningDelegatedBypassOptions": "github_client.models.code_security_create_configuration_request_secret_scanning_delegated_bypass_options",
+    "CodeSecurityCreateConfigurationRequestSecretScanningDelegatedBypassOptionsReviewersInner": "github_client.models.code_security_create_configuration_request_secret_scanning_delegated_bypass_options_reviewers_inner",
+    "CodeSecurityDefaultConfigurationsInner": "github_client.models.code_security_default_configurations_inner",
+    "CodeSecurityDetachConfigurationRequest": "github_client.models.code_security_detach_configuration_request",
+    "CodeSecuritySetConfigurationAsDefaultForEnterprise200Response": "github_client.models.code_security_set_configuration_as_default_for_enterprise200_response",
+    "CodeSecuritySetConfigurationAsDefaultForEnterpriseRequest": "github_client.models.code_security_set_configuration_as_default_for_enterprise_request",
+    "CodeSecurityUpdateConfigurationRequest": "github_client.models.code_security_update_configuration_request",
+    "CodeSecurityUpdateEnterpriseConfigurationRequest": "github_client.models.code_security_update_enterprise_configuration_request",
+    "CodeSecurityUpdateEnterpriseConfigurationRequestDependencyGraphAutosubmitActionOptions": "github_client.models.code_security_update_enterprise_configuration_request_dependency_graph_autosubmit_action_options",
+    "CodeownersErrors": "github_client.models.codeowners_errors",
+    "CodeownersErrorsErrorsInner": "github_client.models.codeowners_errors_errors_inner",
+    "Codespace": "github_client.models.codespace",
+    "CodespaceExportDetails": "github_client.models.codespace_export_details",
+    "CodespaceGitStatus": "github_client.models.codespace_git_status",
+    "CodespaceMachine": "github_client.models.codespace_machine",
+    "CodespaceRuntimeConstraints": "github_client.models.codespace_runtime_constraints",
+    "CodespaceWithFullRepository": "github_client.models.codespace_with_full_repository",
+    "CodespacesCreateForAuthenticatedUserRequest": "github_client.models.codespaces_create_for_authenticated_user_request",
+    "CodespacesCreateForAuthenticatedUserRequestOneOf": "github_client.models.codespaces_create_for_authenticated_user_request_one_of",
+    "CodespacesCreateForAuthenticatedUserRequestOneOf1": "github_client.models.codespaces_create_for_authenticated_user_request_one_of1",
+    "CodespacesCreateForAuthenticatedUserRequestOneOf1PullRequest": "github_client.models.codespaces_create_for_authenticated_user_request_one_of1_pull_request",
+    "CodespacesCreateOrUpdateOrgSecretRequest": "github_client.models.codespaces_create_or_update_org_secret_request",
+    "CodespacesCreateOrUpdateRepoSecretRequest": "github_client.models.codespaces_create_or_update_repo_secret_request",
+    "CodespacesCreateOrUpdateSecretForAuthenticatedUserRequest": "github_client.models.codespaces_create_or_update_secret_for_authenticated_user_request",
+    "CodespacesCreateWithPrForAuthenticatedUserRequest": "github_client.models.codespaces_create_with_pr_for_authenticated_user_request",
+    "CodespacesCreateWithRepoForAuthenticatedUserRequest": "github_client.models.codespaces_create_with_repo_for_authenticated_user_request",
+    "CodespacesDeleteCodespacesAccessUsersRequest": "github_client.models.codespaces_delete_codespaces_access_users_request",
+    "CodespacesListDevcontainersInRepositoryForAuthenticatedUser200Response": "github_client.models.codespaces_list_devcontainers_in_repository_for_authenticated_user200_response",
+    "CodespacesListDevcontainersInRepositoryForAuthenticatedUser200ResponseDevcontainersInner": "github_client.models.codespaces_list_devcontainers_in_repository_for_authenticated_user200_response_devcontainers_inner",
+    "CodespacesListInOrganization200Response": "github_client.models.codespaces_list_in_organization200_response",
+    "CodespacesListOrgSecrets200Response": "github_client.models.codespaces_list_org_secrets200_response",
+    "CodespacesListRepoSecrets200Response": "github_client.models.codespaces_list_repo_secrets200_response",
+    "CodespacesListSecretsForAuthenticatedUser200Response": "github_client.models.codespaces_list_secrets_for_authenticated_user200_response",
+    "CodespacesOrgSecret": "github_client.models.codespaces_org_secret",
+    "CodespacesPermissionsCheckForDevcontainer": "github_client.models.codespaces_permissions_check_for_devcontainer",
+    "CodespacesPreFlightWithRepoForAuthenticatedUser200Response": "github_client.models.codespaces_pre_flight_with_repo_for_authenticated_user200_response",
+    "CodespacesPreFlightWithRepoForAuthenticatedUser200ResponseDefaults": "github_client.models.codespaces_pre_flight_with_repo_for_authenticated_user200_response_defaults",
+    "CodespacesPublicKey": "github_client.models.codespaces_public_key",
+    "CodespacesPublishForAuthenticatedUserRequest": "github_client.models.codespaces_publish_for_authenticated_user_request",
+    "CodespacesRepoMachinesForAuthenticatedUser200Response": "github_client.models.codespaces_repo_machines_for_authenticated_user200_response",
+    "CodespacesSecret": "github_client.models.codespaces_secret",
+    "CodespacesSetCodespacesAccessRequest": "github_client.models.codespaces_set_codespaces_access_request",
+    "CodespacesSetCodespacesAccessUsersRequest": "github_client.models.codespaces_set_codespaces_access_users_request",
+    "CodespacesSetRepositoriesForSecretForAuthenticatedUserRequest": "github_client.models.codespaces_set_repositories_for_secret_for_authenticated_user_request",
+    "CodespacesSetSelectedReposForOrgSecretRequest": "github_client.models.codespaces_set_selected_repos_for_org_secret_request",
+    "CodespacesUpdateForAuthenticatedUserRequest": "github_client.models.codespaces_update_for_authenticated_user_request",
+    "CodespacesUserPublicKey": "github_client.models.codespaces_user_public_key",
+    "Collaborator": "github_client.models.collaborator",
+    "CollaboratorPermissions": "github_client.models.collaborator_permissions",
+    "CombinedBillingUsage": "github_client.models.combined_billing_usage",
+    "CombinedCommitStatus": "github_client.models.combined_commit_status",
+    "Commit": "github_client.models.commit",
+    "Commit1": "github_client.models.commit1",
+    "CommitActivity": "github_client.models.commit_activity",
+    "CommitAuthor": "github_client.models.commit_author",
+    "CommitComment": "github_client.models.commit_comment",
+    "CommitCommit": "github_client.models.commit_commit",
+    "CommitCommitTree": "github_client.models.commit_commit_tree",
+    "CommitComparison": "github_client.models.commit_comparison",
+    "CommitParentsInner": "github_client.models.commit_parents_inner",
+    "CommitSearchResultItem": "github_client.models.commit_search_result_item",
+    "CommitSearchResultItemCommit": "github_client.models.commit_search_result_item_commit",
+    "CommitSearchResultItemCommitAuthor": "github_client.models.commit_search_result_item_commit_author",
+    "CommitStats": "github_client.models.commit_stats",
+    "Committer": "github_client.models.committer",
+    "Committer1": "github_client.models.committer1",
+    "CommunityProfile": "github_client.models.community_profile",
+    "CommunityProfileFiles": "github_client.models.community_profile_files",
+    "ContainerMetadata": "github_client.models.container_metadata",
+    "ContentDirectoryInner": "github_client.models.content_directory_inner",
+    "ContentFile": "github_client.models.content_file",
+    "ContentSubmodule": "github_client.models.content_submodule",
+    "ContentSymlink": "github_client.models.content_symlink",
+    "ContentTraffic": "github_client.models.content_traffic",
+    "ContentTree": "github_client.models.content_tree",
+    "ContentTreeEntriesInner": "github_client.models.content_tree_entries_inner",
+    "ContentTreeEntriesInnerLinks": "github_client.models.content_tree_entries_inner_links",
+    "Contributor": "github_client.models.contributor",
+    "ContributorActivity": "github_client.models.contributor_activity",
+    "ContributorActivityWeeksInner": "github_client.models.contributor_activity_weeks_inner",
+    "ConvertedNoteToIssueIssueEvent": "github_client.models.converted_note_to_issue_issue_event",
+    "CopilotAddCopilotSeatsForTeams201Response": "github_client.models.copilot_add_copilot_seats_for_teams201_response",
+    "CopilotAddCopilotSeatsForTeamsRequest": "github_client.models.copilot_add_copilot_seats_for_teams_request",
+    "CopilotAddCopilotSeatsForUsers201Response": "github_client.models.copilot_add_copilot_seats_for_users201_response",
+    "CopilotAddCopilotSeatsForUsersRequest": "github_client.models.copilot_add_copilot_seats_for_users_request",
+    "CopilotCancelCopilotSeatAssignmentForTeams200Response": "github_client.models.copilot_cancel_copilot_seat_assignment_for_teams200_response",
+    "CopilotCancelCopilotSeatAssignmentForTeamsRequest": "github_client.models.copilot_cancel_copilot_seat_assignment_for_teams_request",
+    "CopilotCancelCopilotSeatAssignmentForUsers200Response": "github_client.models.copilot_cancel_copilot_seat_assignment_for_users200_response",
+    "CopilotCancelCopilotSeatAssignmentForUsersRequest": "github_client.models.copilot_cancel_copilot_seat_assignment_for_users_request",
+    "CopilotDotcomChat": "github_client.models.copilot_dotcom_chat",
+    "CopilotDotcomChatModelsInner": "github_client.models.copilot_dotcom_chat_models_inner",
+    "CopilotDotcomPullRequests": "github_client.models.copilot_dotcom_pull_requests",
+    "CopilotDotcomPullRequestsRepositoriesInner": "github_client.models.copilot_dotcom_pull_requests_repositories_inner",
+    "CopilotDotcomPullRequestsRepositoriesInnerModelsInner": "github_client.models.copilot_dotcom_pull_requests_repositories_inner_models_inner",
+    "CopilotIdeChat": "github_client.models.copilot_ide_chat",
+    "CopilotIdeChatEditorsInner": "github_client.models.copilot_ide_chat_editors_inner",
+    "CopilotIdeChatEditorsInnerModelsInner": "github_client.models.copilot_ide_chat_editors_inner_models_inner",
+    "CopilotIdeCodeCompletions": "github_client.models.copilot_ide_code_completions",
+    "CopilotIdeCodeCompletionsEditorsInner": "github_client.models.copilot_ide_code_completions_editors_inner",
+    "CopilotIdeCodeCompletionsEditorsInnerModelsInner": "github_client.models.copilot_ide_code_completions_editors_inner_models_inner",
+    "CopilotIdeCodeCompletionsEditorsInnerModelsInnerLanguagesInner": "github_client.models.copilot_ide_code_completions_editors_inner_models_inner_languages_inner",
+    "CopilotIdeCodeCompletionsLanguagesInner": "github_client.models.copilot_ide_code_completions_languages_inner",
+    "CopilotListCopilotSeats200Response": "github_client.models.copilot_list_copilot_seats200_response",
+    "CopilotOrganizationDetails": "github_client.models.copilot_organization_details",
+    "CopilotOrganizationSeatBreakdown": "github_client.models.copilot_organization_seat_breakdown",
+    "CopilotSeatDetails": "github_client.models.copilot_seat_details",
+    "CopilotSeatDetailsAssigningTeam": "github_client.models.copilot_seat_details_assigning_team",
+    "CopilotUsageMetricsDay": "github_client.models.copilot_usage_metrics_day",
+    "CredentialsRevokeRequest": "github_client.models.credentials_revoke_request",
+    "CustomDeploymentRuleApp": "github_client.models.custom_deployment_rule_app",
+    "CustomProperty": "github_client.models.custom_property",
+    "CustomPropertyDefaultValue": "github_client.models.custom_property_default_value",
+    "CustomPropertySetPayload": "github_client.models.custom_property_set_payload",
+    "CustomPropertyValue": "github_client.models.custom_property_value",
+    "CustomPropertyValueValue": "github_client.models.custom_property_value_value",
+    "CvssSeverities": "github_client.models.cvss_severities",
+    "CvssSeveritiesCvssV3": "github_client.models.cvss_severities_cvss_v3",
+    "CvssSeveritiesCvssV4": "github_client.models.cvss_severities_cvss_v4",
+    "DeleteBudget": "github_client.models.delete_budget",
+    "DemilestonedIssueEvent": "github_client.models.demilestoned_issue_event",
+    "DependabotAlert": "github_client.models.dependabot_alert",
+    "DependabotAlertPackage": "github_client.models.dependabot_alert_package",
+    "DependabotAlertSecurityAdvisory": "github_client.models.dependabot_alert_security_advisory",
+    "DependabotAlertSecurityAdvisoryCvss": "github_client.models.dependabot_alert_security_advisory_cvss",
+    "DependabotAlertSecurityAdvisoryCwesInner": "github_client.models.dependabot_alert_security_advisory_cwes_inner",
+    "DependabotAlertSecurityAdvisoryIdentifiersInner": "github_client.models.dependabot_alert_security_advisory_identifiers_inner",
+    "DependabotAlertSecurityAdvisoryReferencesInner": "github_client.models.dependabot_alert_security_advisory_references_inner",
+    "DependabotAlertSecurityVulnerability": "github_client.models.dependabot_alert_security_vulnerability",
+    "DependabotAlertSecurityVulnerabilityFirstPatchedVersion": "github_client.models.dependabot_alert_security_vulnerability_first_patched_version",
+    "DependabotAlertWithRepository": "github_client.models.dependabot_alert_with_repository",
+    "DependabotAlertWithRepositoryDependency": "github_client.models.dependabot_alert_with_repository_dependency",
+    "DependabotCreateOrUpdateOrgSecretRequest": "github_client.models.dependabot_create_or_update_org_secret_request",
+    "DependabotCreateOrUpdateOrgSecretRequestSelectedRepositoryIdsInner": "github_client.models.dependabot_create_or_update_org_secret_request_selected_repository_ids_inner",
+    "DependabotCreateOrUpdateRepoSecretRequest": "github_client.models.dependabot_create_or_update_repo_secret_request",
+    "DependabotListAlertsForEnterpriseHasParameter": "github_client.models.dependabot_list_alerts_for_enterprise_has_parameter",
+    "DependabotListAlertsForOrgHasParameter": "github_client.models.dependabot_list_alerts_for_org_has_parameter",
+    "DependabotListOrgSecrets200Response": "github_client.models.dependabot_list_org_secrets200_response",
+    "DependabotListRepoSecrets200Response": "github_client.models.dependabot_list_repo_secrets200_response",
+    "DependabotPublicKey": "github_client.models.dependabot_public_key",
+    "DependabotRepositoryAccessDetails": "github_client.models.dependabot_repository_access_details",
+    "DependabotSecret": "github_client.models.dependabot_secret",
+    "DependabotSetRepositoryAccessDefaultLevelRequest": "github_client.models.dependabot_set_repository_access_default_level_request",
+    "DependabotSetSelectedReposForOrgSecretRequest": "github_client.models.dependabot_set_selected_repos_for_org_secret_request",
+    "DependabotUpdateAlertRequest": "github_client.models.dependabot_update_alert_request",
+    "DependabotUpdateRepositoryAccessForOrgRequest": "github_client.models.dependabot_update_repository_access_for_org_request",
+    "Dependency": "github_client.models.dependency",
+    "DependencyGraphCreateRepositorySnapshot201Response": "github_client.models.dependency_graph_create_repository_snapshot201_response",
+    "DependencyGraphDiffInner": "github_client.models.dependency_graph_diff_inner",
+    "DependencyGraphDiffInnerVulnerabilitiesInner": "github_client.models.dependency_graph_diff_inner_vulnerabilities_inner",
+    "DependencyGraphSpdxSbom": "github_client.models.dependency_graph_spdx_sbom",
+    "DependencyGraphSpdxSbomSbom": "github_client.models.dependency_graph_spdx_sbom_sbom",
+    "DependencyGraphSpdxSbomSbomCreationInfo": "github_client.models.dependency_graph_spdx_sbom_sbom_creation_info",
+    "DependencyGraphSpdxSbomSbomPackagesInner": "github_client.models.dependency_graph_spdx_sbom_sbom_packages_inner",
+    "DependencyGraphSpdxSbomSbomPackagesInnerExternalRefsInner": "github_client.models.dependency_graph_spdx_sbom_sbom_packages_inner_external_refs_inner",
+    "DependencyGraphSpdxSbomSbomRelationshipsInner": "github_client.models.dependency_graph_spdx_sbom_sbom_relationships_inner",
+    "DeployKey": "github_client.models.deploy_key",
+    "Deployment": "github_client.models.deployment",
+    "Deployment1": "github_client.models.deployment1",
+    "Deployment1Payload": "github_client.models.deployment1_payload",
+    "DeploymentBranchPolicy": "github_client.models.deployment_branch_policy",
+    "DeploymentBranchPolicyNamePattern": "github_client.models.deployment_branch_policy_name_pattern",
+    "DeploymentBranchPolicyNamePatternWithType": "github_client.models.deployment_branch_policy_name_pattern_with_type",
+    "DeploymentBranchPolicySettings": "github_client.models.deployment_branch_policy_settings",
+    "DeploymentPayload": "github_client.models.deployment_payload",
+    "DeploymentProtectionRule": "github_client.models.deployment_protection_rule",
+    "DeploymentReviewerType": "github_client.models.deployment_reviewer_type",
+    "DeploymentSimple": "github_client.models.deployment_simple",
+    "DeploymentStatus": "github_client.models.deployment_status",
+    "DeploymentWorkflowRun": "github_client.models.deployment_workflow_run",
+    "DeploymentWorkflowRun1": "github_client.models.deployment_workflow_run1",
+    "DeploymentWorkflowRun1HeadRepository": "github_client.models.deployment_workflow_run1_head_repository",
+    "DeploymentWorkflowRun2": "github_client.models.deployment_workflow_run2",
+    "DeploymentWorkflowRun3": "github_client.models.deployment_workflow_run3",
+    "DeploymentWorkflowRun4": "github_client.models.deployment_workflow_run4",
+    "DeploymentWorkflowRunHeadRepository": "github_client.models.deployment_workflow_run_head_repository",
+    "DeploymentWorkflowRunHeadRepositoryOwner": "github_client.models.deployment_workflow_run_head_repository_owner",
+    "DeploymentWorkflowRunReferencedWorkflowsInner": "github_client.models.deployment_workflow_run_referenced_workflows_inner",
+    "DiffEntry": "github_client.models.diff_entry",
+    "Discussion": "github_client.models.discussion",
+    "DiscussionCategory": "github_client.models.discussion_category",
+    "DockerMetadata": "github_client.models.docker_metadata",
+    "Email": "github_client.models.email",
+    "EnabledRepositories": "github_client.models.enabled_repositories",
+    "Enterprise": "github_client.models.enterprise",
+    "EnterpriseTeam": "github_client.models.enterprise_team",
+    "EnterpriseTeamMembershipsBulkAddRequest": "github_client.models.enterprise_team_memberships_bulk_add_request",
+    "EnterpriseTeamMembershipsBulkRemoveRequest": "github_client.models.enterprise_team_memberships_bulk_remove_request",
+    "EnterpriseTeamOrganizationsBulkAddRequest": "github_client.models.enterprise_team_organizations_bulk_add_request",
+    "EnterpriseTeamOrganizationsBulkRemoveRequest": "github_client.models.enterprise_team_organizations_bulk_remove_request",
+    "EnterpriseTeamsCreateRequest": "github_client.models.enterprise_teams_create_request",
+    "EnterpriseTeamsUpdateRequest": "github_client.models.enterprise_teams_update_request",
+    "EnterpriseWebhooks": "github_client.models.enterprise_webhooks",
+    "Environment": "github_client.models.environment",
+    "EnvironmentApprovals": "github_client.models.environment_approvals",
+    "EnvironmentApprovalsEnvironmentsInner": "github_client.models.environment_approvals_environments_inner",
+    "EnvironmentProtectionRulesInner": "github_client.models.environment_protection_rules_inner",
+    "EnvironmentProtectionRulesInnerAnyOf": "github_client.models.environment_protection_rules_inner_any_of",
+    "EnvironmentProtectionRulesInnerAnyOf1": "github_client.models.environment_protection_rules_inner_any_of1",
+    "EnvironmentProtectionRulesInnerAnyOf2": "github_client.models.environment_protection_rules_inner_any_of2",
+    "Event": "github_client.models.event",
+    "EventPayload": "github_client.models.event_payload",
+    "EventPayloadPagesInner": "github_client.models.event_payload_pages_inner",
+    "EventRepo": "github_client.models.event_repo",
+    "Feed": "github_client.models.feed",
+    "FeedLinks": "github_client.models.feed_links",
+    "FileCommit": "github_client.models.file_commit",
+    "FileCommitCommit": "github_client.models.file_commit_commit",
+    "FileCommitCommitAuthor": "github_client.models.file_commit_commit_author",
+    "FileCommitCommitParentsInner": "github_client.models.file_commit_commit_parents_inner",
+    "FileCommitCommitTree": "github_client.models.file_commit_commit_tree",
+    "FileCommitCommitVerification": "github_client.models.file_commit_commit_verification",
+    "FileCommitContent": "github_client.models.file_commit_content",
+    "FileCommitContentLinks": "github_client.models.file_commit_content_links",
+    "FullRepository": "github_client.models.full_repository",
+    "FullRepositoryPermissions": "github_client.models.full_repository_permissions",
+    "GetAllBudgets": "github_client.models.get_all_budgets",
+    "GetBudget": "github_client.models.get_budget",
+    "GetBudgetBudgetAlerting": "github_client.models.get_budget_budget_alerting",
+    "Gist": "github_client.models.gist",
+    "GistComment": "github_client.models.gist_comment",
+    "GistCommit": "github_client.models.gist_commit",
+    "GistFilesValue": "github_client.models.gist_files_value",
+    "GistHistory": "github_client.models.gist_history",
+    "GistHistoryChangeStatus": "github_client.models.gist_history_change_status",
+    "GistSimple": "github_client.models.gist_simple",
+    "GistSimpleFilesValue": "github_client.models.gist_simple_files_value",
+    "GistSimpleForksInner": "github_client.models.gist_simple_forks_inner",
+    "GistsCreateCommentRequest": "github_client.models.gists_create_comment_request",
+    "GistsCreateRequest": "github_client.models.gists_create_request",
+    "GistsCreateRequestFilesValue": "github_client.models.gists_create_request_files_value",
+    "GistsCreateRequestPublic": "github_client.models.gists_create_request_public",
+    "GistsGet403Response": "github_client.models.gists_get403_response",
+    "GistsGet403ResponseBlock": "github_client.models.gists_get403_response_block",
+    "GistsUpdateRequest": "github_client.models.gists_update_request",
+    "GistsUpdateRequestFilesValue": "github_client.models.gists_update_request_files_value",
+    "GitCommit": "github_client.models.git_commit",
+    "GitCommitAuthor": "github_client.models.git_commit_author",
+    "GitCommitParentsInner": "github_client.models.git_commit_parents_inner",
+    "GitCommitTree": "github_client.models.git_commit_tree",
+    "GitCommitVerification": "github_client.models.git_commit_verification",
+    "GitCreateBlob422Response": "github_client.models.git_create_blob422_response",
+    "GitCreateBlobRequest": "github_client.models.git_create_blob_request",
+    "GitCreateCommitRequest": "github_client.models.git_create_commit_request",
+    "GitCreateCommitRequestAuthor": "github_client.models.git_create_commit_request_author",
+    "GitCreateCommitRequestCommitter": "github_client.models.git_create_commit_request_committer",
+    "GitCreateRefRequest": "github_client.models.git_create_ref_request",
+    "GitCreateTagRequest": "github_client.models.git_create_tag_request",
+    "GitCreateTagRequestTagger": "github_client.models.git_create_tag_request_tagger",
+    "GitCreateTreeRequest": "github_client.models.git_create_tree_request",
+    "GitCreateTreeRequestTreeInner": "github_client.models.git_create_tree_request_tree_inner",
+    "GitRef": "github_client.models.git_ref",
+    "GitRefObject": "github_client.models.git_ref_object",
+    "GitTag": "github_client.models.git_tag",
+    "GitTagObject": "github_client.models.git_tag_object",
+    "GitTagTagger": "github_client.models.git_tag_tagger",
+    "GitTree": "github_client.models.git_tree",
+    "GitTreeTreeInner": "github_client.models.git_tree_tree_inner",
+    "GitUpdateRefRequest": "github_client.models.git_update_ref_request",
+    "GitignoreTemplate": "github_client.models.gitignore_template",
+    "GlobalAdvisory": "github_client.models.global_advisory",
+    "GlobalAdvisoryCreditsInner": "github_client.models.global_advisory_credits_inner",
+    "GlobalAdvisoryCvss": "github_client.models.global_advisory_cvss",
+    "GlobalAdvisoryCwesInner": "github_client.models.global_advisory_cwes_inner",
+    "GlobalAdvisoryIdentifiersInner": "github_client.models.global_advisory_identifiers_inner",
+    "GpgKey": "github_client.models.gpg_key",
+    "GpgKeyEmailsInner": "github_client.models.gpg_key_emails_inner",
+    "GpgKeySubkeysInner": "github_client.models.gpg_key_subkeys_inner",
+    "Hook": "github_client.models.hook",
+    "HookDelivery": "github_client.models.hook_delivery",
+    "HookDeliveryItem": "github_client.models.hook_delivery_item",
+    "HookDeliveryRequest": "github_client.models.hook_delivery_request",
+    "HookDeliveryResponse": "github_client.models.hook_delivery_response",
+    "HookResponse": "github_client.models.hook_response",
+    "HostedComputeCreateNetworkConfigurationForOrgRequest": "github_client.models.hosted_compute_create_network_configuration_for_org_request",
+    "HostedComputeListNetworkConfigurationsForOrg200Response": "github_client.models.hosted_compute_list_network_configurations_for_org200_response",
+    "HostedComputeUpdateNetworkConfigurationForOrgRequest": "github_client.models.hosted_compute_update_network_configuration_for_org_request",
+    "Hovercard": "github_client.models.hovercard",
+    "HovercardContextsInner": "github_client.models.hovercard_contexts_inner",
+    "ImmutableReleasesOrganizationSettings": "github_client.models.immutable_releases_organization_settings",
+    "ImportProjectChoicesInner": "github_client.models.import_project_choices_inner",
+    "Installation": "github_client.models.installation",
+    "InstallationAccount": "github_client.models.installation_account",
+    "InstallationToken": "github_client.models.installation_token",
+    "Integration": "github_client.models.integration",
+    "IntegrationInstallationRequest": "github_client.models.integration_installation_request",
+    "IntegrationInstallationRequestAccount": "github_client.models.integration_installation_request_account",
+    "IntegrationOwner": "github_client.models.integration_owner",
+    "IntegrationPermissions": "github_client.models.integration_permissions",
+    "InteractionExpiry": "github_client.models.interaction_expiry",
+    "InteractionGroup": "github_client.models.interaction_group",
+    "InteractionLimit": "github_client.models.interaction_limit",
+    "InteractionLimitResponse": "github_client.models.interaction_limit_response",
+    "InteractionsGetRestrictionsForOrg200Response": "github_client.models.interactions_get_restrictions_for_org200_response",
+    "Issue": "github_client.models.issue",
+    "Issue1": "github_client.models.issue1",
+    "Issue10": "github_client.models.issue10",
+    "Issue2": "github_client.models.issue2",
+    "Issue3": "github_client.models.issue3",
+    "Issue4": "github_client.models.issue4",
+    "Issue5": "github_client.models.issue5",
+    "Issue6": "github_client.models.issue6",
+    "Issue7": "github_client.models.issue7",
+    "Issue8": "github_client.models.issue8",
+    "Issue9": "github_client.models.issue9",
+    "IssueComment": "github_client.models.issue_comment",
+    "IssueDependenciesSummary": "github_client.models.issue_dependencies_summary",
+    "IssueEvent": "github_client.models.issue_event",
+    "IssueEventDismissedReview": "github_client.models.issue_event_dismissed_review",
+    "IssueEventForIssue": "github_client.models.issue_event_for_issue",
+    "IssueEventLabel": "github_client.models.issue_event_label",
+    "IssueEventMilestone": "github_client.models.issue_event_milestone",
+    "IssueEventProjectCard": "github_client.models.issue_event_project_card",
+    "IssueEventRename": "github_client.models.issue_event_rename",
+    "IssueFieldValue": "github_client.models.issue_field_value",
+    "IssueFieldValueSingleSelectOption": "github_client.models.issue_field_value_single_select_option",
+    "IssueFieldValueValue": "github_client.models.issue_field_value_value",
+    "IssueLabelsInner": "github_client.models.issue_labels_inner",
+    "IssueLabelsInnerOneOf": "github_client.models.issue_labels_inner_one_of",
+    "IssuePullRequest": "github_client.models.issue_pull_request",
+    "IssueSearchResultItem": "github_client.models.issue_search_result_item",
+    "IssueSearchResultItemLabelsInner": "github_client.models.issue_search_result_item_labels_inner",
+    "IssueType": "github_client.models.issue_type",
+    "IssuesAddAssigneesRequest": "github_client.models.issues_add_assignees_request",
+    "IssuesAddBlockedByDependencyRequest": "github_client.models.issues_add_blocked_by_dependency_request",
+    "IssuesAddLabelsRequest": "github_client.models.issues_add_labels_request",
+    "IssuesAddLabelsRequestOneOf": "github_client.models.issues_add_labels_request_one_of",
+    "IssuesAddSubIssueRequest": "github_client.models.issues_add_sub_issue_request",
+    "IssuesCreateLabelRequest": "github_client.models.issues_create_label_request",
+    "IssuesCreateMilestoneRequest": "github_client.models.issues_create_milestone_request",
+    "IssuesCreateRequest": "github_client.models.issues_create_request",
+    "IssuesCreateRequestLabelsInner": "github_client.models.issues_create_request_labels_inner",
+    "IssuesCreateRequestLabelsInnerOneOf": "github_client.models.issues_create_request_labels_inner_one_of",
+    "IssuesCreateRequestMilestone": "github_client.models.issues_create_request_milestone",
+    "IssuesCreateRequestTitle": "github_client.models.issues_create_request_title",
+    "IssuesLockRequest": "github_client.models.issues_lock_request",
+    "IssuesRemoveAssigneesRequest": "github_client.models.issues_remove_assignees_request",
+    "IssuesRemoveSubIssueRequest": "github_client.models.issues_remove_sub_issue_request",
+    "IssuesReprioritizeSubIssueRequest": "github_client.models.issues_reprioritize_sub_issue_request",
+    "IssuesSetLabelsRequest": "github_client.models.issues_set_labels_request",
+    "IssuesSetLabelsRequestOneOf": "github_client.models.issues_set_labels_request_one_of",
+    "IssuesSetLabelsRequestOneOf1": "github_client.models.issues_set_labels_request_one_of1",
+    "IssuesSetLabelsRequestOneOf1LabelsInner": "github_client.models.issues_set_labels_request_one_of1_labels_inner",
+    "IssuesUpdateCommentRequest": "github_client.models.issues_update_comment_request",
+    "IssuesUpdateLabelRequest": "github_client.models.issues_update_label_request",
+    "IssuesUpdateMilestoneRequest": "github_client.models.issues_update_milestone_request",
+    "IssuesUpdateRequest": "github_client.models.issues_update_request",
+    "IssuesUpdateRequestMilestone": "github_client.models.issues_update_request_milestone",
+    "IssuesUpdateRequestTitle": "github_client.models.issues_update_request_title",
+    "Job": "github_client.models.job",
+    "JobStepsInner": "github_client.models.job_steps_inner",
+    "Key": "github_client.models.key",
+    "KeySimple": "github_client.models.key_simple",
+    "Label": "github_client.models.label",
+    "Label1": "github_client.models.label1",
+    "LabelSearchResultItem": "github_client.models.label_search_result_item",
+    "LabeledIssueEvent": "github_client.models.labeled_issue_event",
+    "LabeledIssueEventLabel": "github_client.models.labeled_issue_event_label",
+    "License": "github_client.models.license",
+    "LicenseContent": "github_client.models.license_content",
+    "LicenseSimple": "github_client.models.license_simple",
+    "Link": "github_client.models.link",
+    "LinkWithType": "github_client.models.link_with_type",
+    "LockedIssueEvent": "github_client.models.locked_issue_event",
+    "Manifest": "github_client.models.manifest",
+    "ManifestFile": "github_client.models.manifest_file",
+    "MarkdownRenderRequest": "github_client.models.markdown_render_request",
+    "MarketplaceAccount": "github_client.models.marketplace_account",
+    "MarketplaceListingPlan": "github_client.models.marketplace_listing_plan",
+    "MarketplacePurchase": "github_client.models.marketplace_purchase",
+    "MarketplacePurchase1": "github_client.models.marketplace_purchase1",
+    "MarketplacePurchase2": "github_client.models.marketplace_purchase2",
+    "MarketplacePurchaseMarketplacePendingChange": "github_client.models.marketplace_purchase_marketplace_pending_change",
+    "MarketplacePurchaseMarketplacePurchase": "github_client.models.marketplace_purchase_marketplace_purchase",
+    "MergeGroup": "github_client.models.merge_group",
+    "MergedUpstream": "github_client.models.merged_upstream",
+    "MetadataValue": "github_client.models.metadata_value",
+    "Migration": "github_client.models.migration",
+    "MigrationsMapCommitAuthorRequest": "github_client.models.migrations_map_commit_author_request",
+    "MigrationsSetLfsPreferenceRequest": "github_client.models.migrations_set_lfs_preference_request",
+    "MigrationsStartForAuthenticatedUserRequest": "github_client.models.migrations_start_for_authenticated_user_request",
+    "MigrationsStartForOrgRequest": "github_client.models.migrations_start_for_org_request",
+    "MigrationsStartImportRequest": "github_client.models.migrations_start_import_request",
+    "MigrationsUpdateImportRequest": "github_client.models.migrations_update_import_request",
+    "Milestone": "github_client.models.milestone",
+    "Milestone1": "github_client.models.milestone1",
+    "MilestonedIssueEvent": "github_client.models.milestoned_issue_event",
+    "MilestonedIssueEventMilestone": "github_client.models.milestoned_issue_event_milestone",
+    "MinimalRepository": "github_client.models.minimal_repository",
+    "MinimalRepositoryLicense": "github_client.models.minimal_repository_license",
+    "MinimalRepositoryPermissions": "github_client.models.minimal_repository_permissions",
+    "ModelImport": "github_client.models.model_import",
+    "MovedColumnInProjectIssueEvent": "github_client.models.moved_column_in_project_issue_event",
+    "NetworkConfiguration": "github_client.models.network_configuration",
+    "NetworkSettings": "github_client.models.network_settings",
+    "NullableActionsHostedRunnerPoolImage": "github_client.models.nullable_actions_hosted_runner_pool_image",
+    "NullableCodeOfConductSimple": "github_client.models.nullable_code_of_conduct_simple",
+    "NullableCodespaceMachine": "github_client.models.nullable_codespace_machine",
+    "NullableCollaborator": "github_client.models.nullable_collaborator",
+    "NullableCommunityHealthFile": "github_client.models.nullable_community_health_file",
+    "NullableGitUser": "github_client.models.nullable_git_user",
+    "NullableIntegration": "github_client.models.nullable_integration",
+    "NullableIssue": "github_client.models.nullable_issue",
+    "NullableLicenseSimple": "github_client.models.nullable_license_simple",
+    "NullableMilestone": "github_client.models.nullable_milestone",
+    "NullableMinimalRepository": "github_client.models.nullable_minimal_repository",
+    "NullableOrganizationSimple": "github_client.models.nullable_organization_simple",
+    "NullableProjectsV2StatusUpdate": "github_client.models.nullable_projects_v2_status_update",
+    "NullableRepository": "github_client.models.nullable_repository",
+    "NullableRepositoryWebhooks": "github_client.models.nullable_repository_webhooks",
+    "NullableScopedInstallation": "github_client.models.nullable_scoped_installation",
+    "NullableSecretScanningFirstDetectedLocation": "github_client.models.nullable_secret_scanning_first_detected_location",
+    "NullableSimpleCommit": "github_client.models.nullable_simple_commit",
+    "NullableSimpleCommitAuthor": "github_client.models.nullable_simple_commit_author",
+    "NullableSimpleCommitCommitter": "github_client.models.nullable_simple_commit_committer",
+    "NullableSimpleRepository": "github_client.models.nullable_simple_repository",
+    "NullableSimpleUser": "github_client.models.nullable_simple_user",
+    "NullableTeamSimple": "github_client.models.nullable_team_simple",
+    "OidcCustomSub": "github_client.models.oidc_custom_sub",
+    "OidcCustomSubRepo": "github_client.models.oidc_custom_sub_repo",
+    "OrgHook": "github_client.models.org_hook",
+    "OrgHookConfig": "github_client.models.org_hook_config",
+    "OrgMembership": "github_client.models.org_membership",
+    "OrgMembershipPermissions": "github_client.models.org_membership_permissions",
+    "OrgPrivateRegistryConfiguration": "github_client.models.org_private_registry_configuration",
+    "OrgPrivateRegistryConfigurationWithSelectedRepositories": "github_client.models.org_private_registry_configuration_with_selected_repositories",
+    "OrgRepoCustomPropertyValues": "github_client.models.org_repo_custom_property_values",
+    "OrgRules": "github_client.models.org_rules",
+    "OrgRulesetConditions": "github_client.models.org_ruleset_conditions",
+    "Organization": "github_client.models.organization",
+    "OrganizationActionsSecret": "github_client.models.organization_actions_secret",
+    "OrganizationActionsVariable": "github_client.models.organization_actions_variable",
+    "OrganizationCreateIssueType": "github_client.models.organization_create_issue_type",
+    "OrganizationDependabotSecret": "github_client.models.organization_dependabot_secret",
+    "OrganizationFull": "github_client.models.organization_full",
+    "OrganizationFullPlan": "github_client.models.organization_full_plan",
+    "OrganizationInvitation": "github_client.models.organization_invitation",
+    "OrganizationProgrammaticAccessGrant": "github_client.models.organization_programmatic_access_grant",
+    "OrganizationProgrammaticAccessGrantRequest": "github_client.models.organization_programmatic_access_grant_request",
+    "OrganizationProgrammaticAccessGrantRequestPermissions": "github_client.models.organization_programmatic_access_grant_request_permissions",
+    "OrganizationRole": "github_client.models.organization_role",
+    "OrganizationSecretScanningAlert": "github_client.models.organization_secret_scanning_alert",
+    "OrganizationSimple": "github_client.models.organization_simple",
+    "OrganizationSimpleWebhooks": "github_client.models.organization_simple_webhooks",
+    "OrganizationUpdateIssueType": "github_client.models.organization_update_issue_type",
+    "OrgsConvertMemberToOutsideCollaboratorRequest": "github_client.models.orgs_convert_member_to_outside_collaborator_request",
+    "OrgsCreateArtifactStorageRecord200Response": "github_client.models.orgs_create_artifact_storage_record200_response",
+    "OrgsCreateArtifactStorageRecord200ResponseStorageRecordsInner": "github_client.models.orgs_create_artifact_storage_record200_response_storage_records_inner",
+    "OrgsCreateArtifactStorageRecordRequest": "github_client.models.orgs_create_artifact_storage_record_request",
+    "OrgsCreateInvitationRequest": "github_client.models.orgs_create_invitation_request",
+    "OrgsCreateWebhookRequest": "github_client.models.orgs_create_webhook_request",
+    "OrgsCreateWebhookRequestConfig": "github_client.models.orgs_create_webhook_request_config",
+    "OrgsCustomPropertiesForOrgsCreateOrUpdateOrganizationValuesRequest": "github_client.models.orgs_custom_properties_for_orgs_create_or_update_organization_values_request",
+    "OrgsCustomPropertiesForReposCreateOrUpdateOrganizationDefinitionsRequest": "github_client.models.orgs_custom_properties_for_repos_create_or_update_organization_definitions_request",
+    "OrgsCustomPropertiesForReposCreateOrUpdateOrganizationValuesRequest": "github_client.models.orgs_custom_properties_for_repos_create_or_update_organization_values_request",
+    "OrgsDeleteAttestationsBulkRequest": "github_client.models.orgs_delete_attestations_bulk_request",
+    "OrgsDeleteAttestationsBulkRequestOneOf": "github_client.models.orgs_delete_attestations_bulk_request_one_of",
+    "OrgsDeleteAttestationsBulkRequestOneOf1": "github_client.models.orgs_delete_attestations_bulk_request_one_of1",
+    "OrgsEnableOrDisableSecurityProductOnAllOrgReposRequest": "github_client.models.orgs_enable_or_disable_security_product_on_all_org_repos_request",
+    "OrgsListAppInstallations200Response": "github_client.models.orgs_list_app_installations200_response",
+    "OrgsListArtifactStorageRecords200Response": "github_client.models.orgs_list_artifact_storage_records200_response",
+    "OrgsListArtifactStorageRecords200ResponseStorageRecordsInner": "github_client.models.orgs_list_artifact_storage_records200_response_storage_records_inner",
+    "OrgsListAttestationRepositories200ResponseInner": "github_client.models.orgs_list_attestation_repositories200_response_inner",
+    "OrgsListAttestations200Response": "github_client.models.orgs_list_attestations200_response",
+    "OrgsListAttestations200ResponseAttestationsInner": "github_client.models.orgs_list_attestations200_response_attestations_inner",
+    "OrgsListAttestations200ResponseAttestationsInnerBundle": "github_client.models.orgs_list_attestations200_response_attestations_inner_bundle",
+    "OrgsListAttestationsBulk200Response": "github_client.models.orgs_list_attestations_bulk200_response",
+    "OrgsListAttestationsBulk200ResponseAttestationsSubjectDigestsValueInner": "github_client.models.orgs_list_attestations_bulk200_response_attestations_subject_digests_value_inner",
+    "OrgsListAttestationsBulk200ResponseAttestationsSubjectDigestsValueInnerBundle": "github_client.models.orgs_list_attestations_bulk200_response_attestations_subject_digests_value_inner_bundle",
+    "OrgsListAttestationsBulk200ResponsePageInfo": "github_client.models.orgs_list_attestations_bulk200_response_page_info",
+    "OrgsListAttestationsBulkRequest": "github_client.models.orgs_list_attestations_bulk_request",
+    "OrgsListOrgRoles200Response": "github_client.models.orgs_list_org_roles200_response",
+    "OrgsRemoveOutsideCollaborator422Response": "github_client.models.orgs_remove_outside_collaborator422_response",
+    "OrgsReviewPatGrantRequestRequest": "github_client.models.orgs_review_pat_grant_request_request",
+    "OrgsReviewPatGrantRequestsInBulkRequest": "github_client.models.orgs_review_pat_grant_requests_in_bulk_request",
+    "OrgsSetImmutableReleasesSettingsRepositoriesRequest": "github_client.models.orgs_set_immutable_releases_settings_repositories_request",
+    "OrgsSetImmutableReleasesSettingsRequest": "github_client.models.orgs_set_immutable_releases_settings_request",
+    "OrgsSetMembershipForUserRequest": "github_client.models.orgs_set_membership_for_user_request",
+    "OrgsUpdate422Response": "github_client.models.orgs_update422_response",
+    "OrgsUpdateMembershipForAuthenticatedUserRequest": "github_client.models.orgs_update_membership_for_authenticated_user_request",
+    "OrgsUpdatePatAccessRequest": "github_client.models.orgs_update_pat_access_request",
+    "OrgsUpdatePatAccessesRequest": "github_client.models.orgs_update_pat_accesses_request",
+    "OrgsUpdateRequest": "github_client.models.orgs_update_request",
+    "OrgsUpdateWebhookRequest": "github_client.models.orgs_update_webhook_request",
+    "OrgsUpdateWebhookRequestConfig": "github_client.models.orgs_update_webhook_request_config",
+    "Package": "github_client.models.package",
+    "PackageVersion": "github_client.models.package_version",
+    "PackageVersionMetadata": "github_client.models.package_version_metadata",
+    "PackagesBillingUsage": "github_client.models.packages_billing_usage",
+    "Page": "github_client.models.page",
+    "PageBuild": "github_client.models.page_build",
+    "PageBuildError": "github_client.models.page_build_error",
+    "PageBuildStatus": "github_client.models.page_build_status",
+    "PageDeployment": "github_client.models.page_deployment",
+    "PageDeploymentId": "github_client.models.page_deployment_id",
+    "PagesDeploymentStatus": "github_client.models.pages_deployment_status",
+    "PagesHealthCheck": "github_client.models.pages_health_check",
+    "PagesHealthCheckAltDomain": "github_client.models.pages_health_check_alt_domain",
+    "PagesHealthCheckDomain": "github_client.models.pages_health_check_domain",
+    "PagesHttpsCertificate": "github_client.models.pages_https_certificate",
+    "PagesSourceHash": "github_client.models.pages_source_hash",
+    "ParticipationStats": "github_client.models.participation_stats",
+    "PendingDeployment": "github_client.models.pending_deployment",
+    "PendingDeploymentEnvironment": "github_client.models.pending_deployment_environment",
+    "PendingDeploymentReviewersInner": "github_client.models.pending_deployment_reviewers_inner",
+    "PendingDeploymentReviewersInnerReviewer": "github_client.models.pending_deployment_reviewers_inner_reviewer",
+    "PersonalAccessTokenRequest": "github_client.models.personal_access_token_request",
+    "PersonalAccessTokenRequestPermissionsAdded": "github_client.models.personal_access_token_request_permissions_added",
+    "PersonalAccessTokenRequestPermissionsResult": "github_client.models.personal_access_token_request_permissions_result",
+    "PersonalAccessTokenRequestPermissionsUpgraded": "github_client.models.personal_access_token_request_permissions_upgraded",
+    "PorterAuthor": "github_client.models.porter_author",
+    "PorterLargeFile": "github_client.models.porter_large_file",
+    "PrivateRegistriesCreateOrgPrivateRegistryRequest": "github_client.models.private_registries_create_org_private_registry_request",
+    "PrivateRegistriesGetOrgPublicKey200Response": "github_client.models.private_registries_get_org_public_key200_response",
+    "PrivateRegistriesListOrgPrivateRegistries200Response": "github_client.models.private_registries_list_org_private_registries200_response",
+    "PrivateRegistriesUpdateOrgPrivateRegistryRequest": "github_client.models.private_registries_update_org_private_registry_request",
+    "PrivateUser": "github_client.models.private_user",
+    "PrivateVulnerabilityReportCreate": "github_client.models.private_vulnerability_report_create",
+    "ProjectCard": "github_client.models.project_card",
+    "ProjectCollaboratorPermission": "github_client.models.project_collaborator_permission",
+    "ProjectColumn": "github_client.models.project_column",
+    "ProjectsAddItemForOrgRequest": "github_client.models.projects_add_item_for_org_request",
+    "ProjectsClassicAddCollaboratorRequest": "github_client.models.projects_classic_add_collaborator_request",
+    "ProjectsClassicMoveColumnRequest": "github_client.models.projects_classic_move_column_request",
+    "ProjectsClassicUpdateColumnRequest": "github_client.models.projects_classic_update_column_request",
+    "ProjectsCreateDraftItemForOrgRequest": "github_client.models.projects_create_draft_item_for_org_request",
+    "ProjectsListItemsForOrgFieldsParameter": "github_client.models.projects_list_items_for_org_fields_parameter",
+    "ProjectsUpdateItemForOrgRequest": "github_client.models.projects_update_item_for_org_request",
+    "ProjectsUpdateItemForOrgRequestFieldsInner": "github_client.models.projects_update_item_for_org_request_fields_inner",
+    "ProjectsUpdateItemForOrgRequestFieldsInnerValue": "github_client.models.projects_update_item_for_org_request_fields_inner_value",
+    "ProjectsV2": "github_client.models.projects_v2",
+    "ProjectsV2DraftIssue": "github_client.models.projects_v2_draft_issue",
+    "ProjectsV2Field": "github_client.models.projects_v2_field",
+    "ProjectsV2FieldConfiguration": "github_client.models.projects_v2_field_configuration",
+    "ProjectsV2Item": "github_client.models.projects_v2_item",
+    "ProjectsV2ItemContentType": "github_client.models.projects_v2_item_content_type",
+    "ProjectsV2ItemSimple": "github_client.models.projects_v2_item_simple",
+    "ProjectsV2ItemSimpleContent": "github_client.models.projects_v2_item_simple_content",
+    "ProjectsV2ItemWithContent": "github_client.models.projects_v2_item_with_content",
+    "ProjectsV2IterationSetting": "github_client.models.projects_v2_iteration_setting",
+    "ProjectsV2IterationSettings": "github_client.models.projects_v2_iteration_settings",
+    "ProjectsV2IterationSettingsTitle": "github_client.models.projects_v2_iteration_settings_title",
+    "ProjectsV2SingleSelectOption": "github_client.models.projects_v2_single_select_option",
+    "ProjectsV2SingleSelectOptions": "github_client.models.projects_v2_single_select_options",
+    "ProjectsV2SingleSelectOptionsDescription": "github_client.models.projects_v2_single_select_options_description",
+    "ProjectsV2SingleSelectOptionsName": "github_client.models.projects_v2_single_select_options_name",
+    "ProjectsV2StatusUpdate": "github_client.models.projects_v2_status_update",
+    "ProtectedBranch": "github_client.models.protected_branch",
+    "ProtectedBranchAdminEnforced": "github_client.models.protected_branch_admin_enforced",
+    "ProtectedBranchAllowForkSyncing": "github_client.models.protected_branch_allow_fork_syncing",
+    "ProtectedBranchEnforceAdmins": "github_client.models.protected_branch_enforce_admins",
+    "ProtectedBranchLockBranch": "github_client.models.protected_branch_lock_branch",
+    "ProtectedBranchPullRequestReview": "github_client.models.protected_branch_pull_request_review",
+    "ProtectedBranchPullRequestReviewBypassPullRequestAllowances": "github_client.models.protected_branch_pull_request_review_bypass_pull_request_allowances",
+    "ProtectedBranchPullRequestReviewDismissalRestrictions": "github_client.models.protected_branch_pull_request_review_dismissal_restrictions",
+    "ProtectedBranchRequiredConversationResolution": "github_client.models.protected_branch_required_conversation_resolution",
+    "ProtectedBranchRequiredLinearHistory": "github_client.models.protected_branch_required_linear_history",
+    "ProtectedBranchRequiredPullRequestReviews": "github_client.models.protected_branch_required_pull_request_reviews",
+    "ProtectedBranchRequiredPullRequestReviewsBypassPullRequestAllowances": "github_client.models.protected_branch_required_pull_request_reviews_bypass_pull_request_allowances",
+    "ProtectedBranchRequiredPullRequestReviewsDismissalRestrictions": "github_client.models.protected_branch_required_pull_request_reviews_dismissal_restrictions",
+    "ProtectedBranchRequiredStatusCheck": "github_client.models.protected_branch_required_status_check",
+    "ProtectedBranchRequiredStatusCheckChecksInner": "github_client.models.protected_branch_required_status_check_checks_inner",
+    "PublicIp": "github_client.models.public_ip",
+    "PublicUser": "github_client.models.public_user",
+    "PublicUserPlan": "github_client.models.public_user_plan",
+    "PullRequest": "github_client.models.pull_request",
+    "PullRequest1": "github_client.models.pull_request1",
+    "PullRequest10": "github_client.models.pull_request10",
+    "PullRequest10Head": "github_client.models.pull_request10_head",
+    "PullRequest11": "github_client.models.pull_request11",
+    "PullRequest11Base": "github_client.models.pull_request11_base",
+    "PullRequest12": "github_client.models.pull_request12",
+    "PullRequest12Head": "github_client.models.pull_request12_head",
+    "PullRequest13": "github_client.models.pull_request13",
+    "PullRequest1Base": "github_client.models.pull_request1_base",
+    "PullRequest2": "github_client.models.pull_request2",
+    "PullRequest2Head": "github_client.models.pull_request2_head",
+    "PullRequest3": "github_client.models.pull_request3",
+    "PullRequest3RequestedReviewersInner": "github_client.models.pull_request3_requested_reviewers_inner",
+    "PullRequest4": "github_client.models.pull_request4",
+    "PullRequest5": "github_client.models.pull_request5",
+    "PullRequest6": "github_client.models.pull_request6",
+    "PullRequest6Base": "github_client.models.pull_request6_base",
+    "PullRequest6RequestedReviewersInner": "github_client.models.pull_request6_requested_reviewers_inner",
+    "PullRequest7": "github_client.models.pull_request7",
+    "PullRequest8": "github_client.models.pull_request8",
+    "PullRequest9": "github_client.models.pull_request9",
+    "PullRequestAutoMerge": "github_client.models.pull_request_auto_merge",
+    "PullRequestAutoMerge1": "github_client.models.pull_request_auto_merge1",
+    "PullRequestBase": "github_client.models.pull_request_base",
+    "PullRequestHead": "github_client.models.pull_request_head",
+    "PullRequestLabelsInner": "github_client.models.pull_request_labels_inner",
+    "PullRequestMergeResult": "github_client.models.pull_request_merge_result",
+    "PullRequestMinimal": "github_client.models.pull_request_minimal",
+    "PullRequestMinimalHead": "github_client.models.pull_request_minimal_head",
+    "PullRequestMinimalHeadRepo": "github_client.models.pull_request_minimal_head_repo",
+    "PullRequestRequestedReviewersInner": "github_client.models.pull_request_requested_reviewers_inner",
+    "PullRequestReview": "github_client.models.pull_request_review",
+    "PullRequestReviewComment": "github_client.models.pull_request_review_comment",
+    "PullRequestReviewComment1": "github_client.models.pull_request_review_comment1",
+    "PullRequestReviewComment2": "github_client.models.pull_request_review_comment2",
+    "PullRequestReviewCommentLinks": "github_client.models.pull_request_review_comment_links",
+    "PullRequestReviewCommentLinksHtml": "github_client.models.pull_request_review_comment_links_html",
+    "PullRequestReviewCommentLinksPullRequest": "github_client.models.pull_request_review_comment_links_pull_request",
+    "PullRequestReviewCommentLinksSelf": "github_client.models.pull_request_review_comment_links_self",
+    "PullRequestReviewRequest": "github_client.models.pull_request_review_request",
+    "PullRequestSimple": "github_client.models.pull_request_simple",
+    "PullRequestSimpleHead": "github_client.models.pull_request_simple_head",
+    "PullRequestSimpleLabelsInner": "github_client.models.pull_request_simple_labels_inner",
+    "PullRequestSimpleLinks": "github_client.models.pull_request_simple_links",
+    "PullRequestWebhook": "github_client.models.pull_request_webhook",
+    "PullsCreateReplyForReviewCommentRequest": "github_client.models.pulls_create_reply_for_review_comment_request",
+    "PullsCreateRequest": "github_client.models.pulls_create_request",
+    "PullsCreateReviewCommentRequest": "github_client.models.pulls_create_review_comment_request",
+    "PullsCreateReviewRequest": "github_client.models.pulls_create_review_request",
+    "PullsCreateReviewRequestCommentsInner": "github_client.models.pulls_create_review_request_comments_inner",
+    "PullsDismissReviewRequest": "github_client.models.pulls_dismiss_review_request",
+    "PullsMergeRequest": "github_client.models.pulls_merge_request",
+    "PullsRemoveRequestedReviewersRequest": "github_client.models.pulls_remove_requested_reviewers_request",
+    "PullsRequestReviewersRequest": "github_client.models.pulls_request_reviewers_request",
+    "PullsSubmitReviewRequest": "github_client.models.pulls_submit_review_request",
+    "PullsUpdateBranchRequest": "github_client.models.pulls_update_branch_request",
+    "PullsUpdateRequest": "github_client.models.pulls_update_request",
+    "PullsUpdateReviewCommentRequest": "github_client.models.pulls_update_review_comment_request",
+    "PullsUpdateReviewRequest": "github_client.models.pulls_update_review_request",
+    "RateLimit": "github_client.models.rate_limit",
+    "RateLimitOverview": "github_client.models.rate_limit_overview",
+    "RateLimitOverviewResources": "github_client.models.rate_limit_overview_resources",
+    "Reaction": "github_client.models.reaction",
+    "ReactionRollup": "github_client.models.reaction_rollup",
+    "Reactions": "github_client.models.reactions",
+    "ReactionsCreateForCommitCommentRequest": "github_client.models.reactions_create_for_commit_comment_request",
+    "ReactionsCreateForIssueCommentRequest": "github_client.models.reactions_create_for_issue_comment_request",
+    "ReactionsCreateForIssueRequest": "github_client.models.reactions_create_for_issue_request",
+    "ReactionsCreateForPullRequestReviewCommentRequest": "github_client.models.reactions_create_for_pull_request_review_comment_request",
+    "ReactionsCreateForReleaseRequest": "github_client.models.reactions_create_for_release_request",
+    "ReactionsCreateForTeamDiscussionCommentInOrgRequest": "github_client.models.reactions_create_for_team_discussion_comment_in_org_request",
+    "ReactionsCreateForTeamDiscussionInOrgRequest": "github_client.models.reactions_create_for_team_discussion_in_org_request",
+    "ReferencedWorkflow": "github_client.models.referenced_workflow",
+    "ReferrerTraffic": "github_client.models.referrer_traffic",
+    "Release": "github_client.models.release",
+    "ReleaseAsset": "github_client.models.release_asset",
+    "ReleaseAsset1": "github_client.models.release_asset1",
+    "ReleaseNotesContent": "github_client.models.release_notes_content",
+    "RemovedFromProjectIssueEvent": "github_client.models.removed_from_project_issue_event",
+    "RenamedIssueEvent": "github_client.models.renamed_issue_event",
+    "RenamedIssueEventRename": "github_client.models.renamed_issue_event_rename",
+    "RepoCodespacesSecret": "github_client.models.repo_codespaces_secret",
+    "RepoRef": "github_client.models.repo_ref",
+    "RepoSearchResultItem": "github_client.models.repo_search_result_item",
+    "ReposAddCollaboratorRequest": "github_client.models.repos_add_collaborator_request",
+    "ReposAddTeamAccessRestrictionsRequest": "github_client.models.repos_add_team_access_restrictions_request",
+    "ReposAddTeamAccessRestrictionsRequestOneOf": "github_client.models.repos_add_team_access_restrictions_request_one_of",
+    "ReposCheckPrivateVulnerabilityReporting200Response": "github_client.models.repos_check_private_vulnerability_reporting200_response",
+    "ReposCreateAttestation201Response": "github_client.models.repos_create_attestation201_response",
+    "ReposCreateAttestationRequest": "github_client.models.repos_create_attestation_request",
+    "ReposCreateAutolinkRequest": "github_client.models.repos_create_autolink_request",
+    "ReposCreateCommitCommentRequest": "github_client.models.repos_create_commit_comment_request",
+    "ReposCreateCommitStatusRequest": "github_client.models.repos_create_commit_status_request",
+    "ReposCreateDeployKeyRequest": "github_client.models.repos_create_deploy_key_request",
+    "ReposCreateDeploymentProtectionRuleRequest": "github_client.models.repos_create_deployment_protection_rule_request",
+    "ReposCreateDeploymentRequest": "github_client.models.repos_create_deployment_request",
+    "ReposCreateDeploymentRequestPayload": "github_client.models.repos_create_deployment_request_payload",
+    "ReposCreateDeploymentStatusRequest": "github_client.models.repos_create_deployment_status_request",
+    "ReposCreateDispatchEventRequest": "github_client.models.repos_create_dispatch_event_request",
+    "ReposCreateForAuthenticatedUserRequest": "github_client.models.repos_create_for_authenticated_user_request",
+    "ReposCreateForkRequest": "github_client.models.repos_create_fork_request",
+    "ReposCreateInOrgRequest": "github_client.models.repos_create_in_org_request",
+    "ReposCreateOrUpdateEnvironmentRequest": "github_client.models.repos_create_or_update_environment_request",
+    "ReposCreateOrUpdateEnvironmentRequestReviewersInner": "github_client.models.repos_create_or_update_environment_request_reviewers_inner",
+    "ReposCreateOrUpdateFileContents409Response": "github_client.models.repos_create_or_update_file_contents409_response",
+    "ReposCreateOrUpdateFileContentsRequest": "github_client.models.repos_create_or_update_file_contents_request",
+    "ReposCreateOrUpdateFileContentsRequestAuthor": "github_client.models.repos_create_or_update_file_contents_request_author",
+    "ReposCreateOrUpdateFileContentsRequestCommitter": "github_client.models.repos_create_or_update_file_contents_request_committer",
+    "ReposCreateOrgRulesetRequest": "github_client.models.repos_create_org_ruleset_request",
+    "ReposCreatePagesDeploymentRequest": "github_client.models.repos_create_pages_deployment_request",
+    "ReposCreatePagesSiteRequest": "github_client.models.repos_create_pages_site_request",
+    "ReposCreatePagesSiteRequestSource": "github_client.models.repos_create_pages_site_request_source",
+    "ReposCreateReleaseRequest": "github_client.models.repos_create_release_request",
+    "ReposCreateRepoRulesetRequest": "github_client.models.repos_create_repo_ruleset_request",
+    "ReposCreateTagProtectionRequest": "github_client.models.repos_create_tag_protection_request",
+    "ReposCreateUsingTemplateRequest": "github_client.models.repos_create_using_template_request",
+    "ReposCreateWebhookRequest": "github_client.models.repos_create_webhook_request",
+    "ReposCreateWebhookRequestConfig": "github_client.models.repos_create_webhook_request_config",
+    "ReposCustomPropertiesForReposCreateOrUpdateRepositoryValuesRequest": "github_client.models.repos_custom_properties_for_repos_create_or_update_repository_values_request",
+    "ReposDeleteFileRequest": "github_client.models.repos_delete_file_request",
+    "ReposDeleteFileRequestAuthor": "github_client.models.repos_delete_file_request_author",
+    "ReposDeleteFileRequestCommitter": "github_client.models.repos_delete_file_request_committer",
+    "ReposGenerateReleaseNotesRequest": "github_client.models.repos_generate_release_notes_request",
+    "ReposGetAllDeploymentProtectionRules200Response": "github_client.models.repos_get_all_deployment_protection_rules200_response",
+    "ReposGetAllEnvironments200Response": "github_client.models.repos_get_all_environments200_response",
+    "ReposGetContent200Response": "github_client.models.repos_get_content200_response",
+    "ReposListCustomDeploymentRuleIntegrations200Response": "github_client.models.repos_list_custom_deployment_rule_integrations200_response",
+    "ReposListDeploymentBranchPolicies200Response": "github_client.models.repos_list_deployment_branch_policies200_response",
+    "ReposMergeRequest": "github_client.models.repos_merge_request",
+    "ReposMergeUpstreamRequest": "github_client.models.repos_merge_upstream_request",
+    "ReposRenameBranchRequest": "github_client.models.repos_rename_branch_request",
+    "ReposReplaceAllTopicsRequest": "github_client.models.repos_replace_all_topics_request",
+    "ReposSetAppAccessRestrictionsRequest": "github_client.models.repos_set_app_access_restrictions_request",
+    "ReposSetStatusCheckContextsRequest": "github_client.models.repos_set_status_check_contexts_request",
+    "ReposSetStatusCheckContextsRequestOneOf": "github_client.models.repos_set_status_check_contexts_request_one_of",
+    "ReposSetTeamAccessRestrictionsRequest": "github_client.models.repos_set_team_access_restrictions_request",
+    "ReposSetTeamAccessRestrictionsRequestOneOf": "github_client.models.repos_set_team_access_restrictions_request_one_of",
+    "ReposSetUserAccessRestrictionsRequest": "github_client.models.repos_set_user_access_restrictions_request",
+    "ReposTransferRequest": "github_client.models.repos_transfer_request",
+    "ReposUpdateBranchProtectionRequest": "github_client.models.repos_update_branch_protection_request",
+    "ReposUpdateBranchProtectionRequestRequiredPullRequestReviews": "github_client.models.repos_update_branch_protection_request_required_pull_request_reviews",
+    "ReposUpdateBranchProtectionRequestRequiredPullRequestReviewsBypassPullRequestAllowances": "github_client.models.repos_update_branch_protection_request_required_pull_request_reviews_bypass_pull_request_allowances",
+    "ReposUpdateBranchProtectionRequestRequiredPullRequestReviewsDismissalRestrictions": "github_client.models.repos_update_branch_protection_request_required_pull_request_reviews_dismissal_restrictions",
+    "ReposUpdateBranchProtectionRequestRequiredStatusChecks": "github_client.models.repos_update_branch_protection_request_required_status_checks",
+    "ReposUpdateBranchProtectionRequestRequiredStatusChecksChecksInner": "github_client.models.repos_update_branch_protection_request_required_status_checks_checks_inner",
+    "ReposUpdateBranchProtectionRequestRestrictions": "github_client.models.repos_update_branch_protection_request_restrictions",
+    "ReposUpdateCommitCommentRequest": "github_client.models.repos_update_commit_comment_request",
+    "ReposUpdateInformationAboutPagesSiteRequest": "github_client.models.repos_update_information_about_pages_site_request",
+    "ReposUpdateInformationAboutPagesSiteRequestSource": "github_client.models.repos_update_information_about_pages_site_request_source",
+    "ReposUpdateInformationAboutPagesSiteRequestSourceAnyOf": "github_client.models.repos_update_information_about_pages_site_request_source_any_of",
+    "ReposUpdateInvitationRequest": "github_client.models.repos_update_invitation_request",
+    "ReposUpdateOrgRulesetRequest": "github_client.models.repos_update_org_ruleset_request",
+    "ReposUpdatePullRequestReviewProtectionRequest": "github_client.models.repos_update_pull_request_review_protection_request",
+    "ReposUpdateReleaseAssetRequest": "github_client.models.repos_update_release_asset_request",
+    "ReposUpdateReleaseRequest": "github_client.models.repos_update_release_request",
+    "ReposUpdateRepoRulesetRequest": "github_client.models.repos_update_repo_ruleset_request",
+    "ReposUpdateRequest": "github_client.models.repos_update_request",
+    "ReposUpdateRequestSecurityAndAnalysis": "github_client.models.repos_update_request_security_and_analysis",
+    "ReposUpdateRequestSecurityAndAnalysisAdvancedSecurity": "github_client.models.repos_update_request_security_and_analysis_advanced_security",
+    "ReposUpdateRequestSecurityAndAnalysisCodeSecurity": "github_client.models.repos_update_request_security_and_analysis_code_security",
+    "ReposUpdateRequestSecurityAndAnalysisSecretScanning": "github_client.models.repos_update_request_security_and_analysis_secret_scanning",
+    "ReposUpdateRequestSecurityAndAnalysisSecretScanningAiDetection": "github_client.models.repos_update_request_security_and_analysis_secret_scanning_ai_detection",
+    "ReposUpdateRequestSecurityAndAnalysisSecretScanningNonProviderPatterns": "github_client.models.repos_update_request_security_and_analysis_secret_scanning_non_provider_patterns",
+    "ReposUpdateRequestSecurityAndAnalysisSecretScanningPushProtection": "github_client.models.repos_update_request_security_and_analysis_secret_scanning_push_protection",
+    "ReposUpdateStatusCheckProtectionRequest": "github_client.models.repos_update_status_check_protection_request",
+    "ReposUpdateWebhookConfigForRepoRequest": "github_client.models.repos_update_webhook_config_for_repo_request",
+    "ReposUpdateWebhookRequest": "github_client.models.repos_update_webhook_request",
+    "Repository": "github_client.models.repository",
+    "Repository1": "github_client.models.repository1",
+    "Repository10": "github_client.models.repository10",
+    "Repository11": "github_client.models.repository11",
+    "Repository12": "github_client.models.repository12",
+    "Repository13": "github_client.models.repository13",
+    "Repository14": "github_client.models.repository14",
+    "Repository15": "github_client.models.repository15",
+    "Repository2": "github_client.models.repository2",
+    "Repository3": "github_client.models.repository3",
+    "Repository4": "github_client.models.repository4",
+    "Repository5": "github_client.models.repository5",
+    "Repository6": "github_client.models.repository6",
+    "Repository7": "github_client.models.repository7",
+    "Repository8": "github_client.models.repository8",
+    "Repository9": "github_client.models.repository9",
+    "RepositoryAdvisory": "github_client.models.repository_advisory",
+    "RepositoryAdvisoryCreate": "github_client.models.repository_advisory_create",
+    "RepositoryAdvisoryCreateCreditsInner": "github_client.models.repository_advisory_create_credits_inner",
+    "RepositoryAdvisoryCreateVulnerabilitiesInner": "github_client.models.repository_advisory_create_vulnerabilities_inner",
+    "RepositoryAdvisoryCreateVulnerabilitiesInnerPackage": "github_client.models.repository_advisory_create_vulnerabilities_inner_package",
+    "RepositoryAdvisoryCredit": "github_client.models.repository_advisory_credit",
+    "RepositoryAdvisoryCreditsInner": "github_client.models.repository_advisory_credits_inner",
+    "RepositoryAdvisorySubmission": "github_client.models.repository_advisory_submission",
+    "RepositoryAdvisoryUpdate": "github_client.models.repository_advisory_update",
+    "RepositoryAdvisoryVulnerability": "github_client.models.repository_advisory_vulnerability",
+    "RepositoryCodeSearchIndexStatus": "github_client.models.repository_code_search_index_status",
+    "RepositoryCollaboratorPermission": "github_client.models.repository_collaborator_permission",
+    "RepositoryCreatedAt": "github_client.models.repository_created_at",
+    "RepositoryIdAndRefName": "github_client.models.repository_id_and_ref_name",
+    "RepositoryInvitation": "github_client.models.repository_invitation",
+    "RepositoryLite": "github_client.models.repository_lite",
+    "RepositoryLite1": "github_client.models.repository_lite1",
+    "RepositoryLite2": "github_client.models.repository_lite2",
+    "RepositoryNameAndRefName": "github_client.models.repository_name_and_ref_name",
+    "RepositoryPermissions": "github_client.models.repository_permissions",
+    "RepositoryPropertyAndRefName": "github_client.models.repository_property_and_ref_name",
+    "RepositoryPushedAt": "github_client.models.repository_pushed_at",
+    "RepositoryRule": "github_client.models.repository_rule",
+    "RepositoryRuleBranchNamePattern": "github_client.models.repository_rule_branch_name_pattern",
+    "RepositoryRuleCodeScanning": "github_client.models.repository_rule_code_scanning",
+    "RepositoryRuleCodeScanningParameters": "github_client.models.repository_rule_code_scanning_parameters",
+    "RepositoryRuleCommitAuthorEmailPattern": "github_client.models.repository_rule_commit_author_email_pattern",
+    "RepositoryRuleCommitMessagePattern": "github_client.models.repository_rule_commit_message_pattern",
+    "RepositoryRuleCommitMessagePatternParameters": "github_client.models.repository_rule_commit_message_pattern_parameters",
+    "RepositoryRuleCommitterEmailPattern": "github_client.models.repository_rule_committer_email_pattern",
+    "RepositoryRuleCopilotCodeReview": "github_client.models.repository_rule_copilot_code_review",
+    "RepositoryRuleCopilotCodeReviewParameters": "github_client.models.repository_rule_copilot_code_review_parameters",
+    "RepositoryRuleCreation": "github_client.models.repository_rule_creation",
+    "RepositoryRuleDeletion": "github_client.models.repository_rule_deletion",
+    "RepositoryRuleDetailed": "github_client.models.repository_rule_detailed",
+    "RepositoryRuleDetailedOneOf": "github_client.models.repository_rule_detailed_one_of",
+    "RepositoryRuleDetailedOneOf1": "github_client.models.repository_rule_detailed_one_of1",
+    "RepositoryRuleDetailedOneOf10": "github_client.models.repository_rule_detailed_one_of10",
+    "RepositoryRuleDetailedOneOf11": "github_client.models.repository_rule_detailed_one_of11",
+    "RepositoryRuleDetailedOneOf12": "github_client.models.repository_rule_detailed_one_of12",
+    "RepositoryRuleDetailedOneOf13": "github_client.models.repository_rule_detailed_one_of13",
+    "RepositoryRuleDetailedOneOf14": "github_client.models.repository_rule_detailed_one_of14",
+    "RepositoryRuleDetailedOneOf15": "github_client.models.repository_rule_detailed_one_of15",
+    "RepositoryRuleDetailedOneOf16": "github_client.models.repository_rule_detailed_one_of16",
+    "RepositoryRuleDetailedOneOf17": "github_client.models.repository_rule_detailed_one_of17",
+    "RepositoryRuleDetailedOneOf18": "github_client.models.repository_rule_detailed_one_of18",
+    "RepositoryRuleDetailedOneOf19": "github_client.models.repository_rule_detailed_one_of19",
+    "RepositoryRuleDetailedOneOf2": "github_client.models.repository_rule_detailed_one_of2",
+    "RepositoryRuleDetailedOneOf20": "github_client.models.repository_rule_detailed_one_of20",
+    "RepositoryRuleDetailedOneOf21": "github_client.models.repository_rule_detailed_one_of21",
+    "RepositoryRuleDetailedOneOf3": "github_client.models.repository_rule_detailed_one_of3",
+    "RepositoryRuleDetailedOneOf4": "github_client.models.repository_rule_detailed_one_of4",
+    "RepositoryRuleDetailedOneOf5": "github_client.models.repository_rule_detailed_one_of5",
+    "RepositoryRuleDetailedOneOf6": "github_client.models.repository_rule_detailed_one_of6",
+    "RepositoryRuleDetailedOneOf7": "github_client.models.repository_rule_detailed_one_of7",
+    "RepositoryRuleDetailedOneOf8": "github_client.models.repository_rule_detailed_one_of8",
+    "RepositoryRuleDetailedOneOf9": "github_client.models.repository_rule_detailed_one_of9",
+    "RepositoryRuleEnforcement": "github_client.models.repository_rule_enforcement",
+    "RepositoryRuleFileExtensionRestriction": "github_client.models.repository_rule_file_extension_restriction",
+    "RepositoryRuleFileExtensionRestrictionParameters": "github_client.models.repository_rule_file_extension_restriction_parameters",
+    "RepositoryRuleFilePathRestriction": "github_client.models.repository_rule_file_path_restriction",
+    "RepositoryRuleFilePathRestrictionParameters": "github_client.models.repository_rule_file_path_restriction_parameters",
+    "RepositoryRuleMaxFilePathLength": "github_client.models.repository_rule_max_file_path_length",
+    "RepositoryRuleMaxFilePathLengthParameters": "github_client.models.repository_rule_max_file_path_length_parameters",
+    "RepositoryRuleMaxFileSize": "github_client.models.repository_rule_max_file_size",
+    "RepositoryRuleMaxFileSizeParameters": "github_client.models.repository_rule_max_file_size_parameters",
+    "RepositoryRuleMergeQueue": "github_client.models.repository_rule_merge_queue",
+    "RepositoryRuleMergeQueueParameters": "github_client.models.repository_rule_merge_queue_parameters",
+    "RepositoryRuleNonFastForward": "github_client.models.repository_rule_non_fast_forward",
+    "RepositoryRuleParamsCodeScanningTool": "github_client.models.repository_rule_params_code_scanning_tool",
+    "RepositoryRuleParamsRequiredReviewerConfiguration": "github_client.models.repository_rule_params_required_reviewer_configuration",
+    "RepositoryRuleParamsRestrictedCommits": "github_client.models.repository_rule_params_restricted_commits",
+    "RepositoryRuleParamsReviewer": "github_client.models.repository_rule_params_reviewer",
+    "RepositoryRuleParamsStatusCheckConfiguration": "github_client.models.repository_rule_params_status_check_configuration",
+    "RepositoryRuleParamsWorkflowFileReference": "github_client.models.repository_rule_params_workflow_file_reference",
+    "RepositoryRulePullRequest": "github_client.models.repository_rule_pull_request",
+    "RepositoryRulePullRequestParameters": "github_client.models.repository_rule_pull_request_parameters",
+    "RepositoryRuleRequiredDeployments": "github_client.models.repository_rule_required_deployments",
+    "RepositoryRuleRequiredDeploymentsParameters": "github_client.models.repository_rule_required_deployments_parameters",
+    "RepositoryRuleRequiredLinearHistory": "github_client.models.repository_rule_required_linear_history",
+    "RepositoryRuleRequiredSignatures": "github_client.models.repository_rule_required_signatures",
+    "RepositoryRuleRequiredStatusChecks": "github_client.models.repository_rule_required_status_checks",
+    "RepositoryRuleRequiredStatusChecksParameters": "github_client.models.repository_rule_required_status_checks_parameters",
+    "RepositoryRuleRulesetInfo": "github_client.models.repository_rule_ruleset_info",
+    "RepositoryRuleTagNamePattern": "github_client.models.repository_rule_tag_name_pattern",
+    "RepositoryRuleUpdate": "github_client.models.repository_rule_update",
+    "RepositoryRuleUpdateParameters": "github_client.models.repository_rule_update_parameters",
+    "RepositoryRuleViolationError": "github_client.models.repository_rule_violation_error",
+    "RepositoryRuleViolationErrorMetadata": "github_client.models.repository_rule_violation_error_metadata",
+    "RepositoryRuleViolationErrorMetadataSecretScanning": "github_client.models.repository_rule_violation_error_metadata_secret_scanning",
+    "RepositoryRuleViolationErrorMetadataSecretScanningBypassPlaceholdersInner": "github_client.models.repository_rule_violation_error_metadata_secret_scanning_bypass_placeholders_inner",
+    "RepositoryRuleWorkflows": "github_client.models.repository_rule_workflows",
+    "RepositoryRuleWorkflowsParameters": "github_client.models.repository_rule_workflows_parameters",
+    "RepositoryRuleset": "github_client.models.repository_ruleset",
+    "RepositoryRulesetBypassActor": "github_client.models.repository_ruleset_bypass_actor",
+    "RepositoryRulesetConditions": "github_client.models.repository_ruleset_conditions",
+    "RepositoryRulesetConditionsRefName": "github_client.models.repository_ruleset_conditions_ref_name",
+    "RepositoryRulesetConditionsRepositoryIdTarget": "github_client.models.repository_ruleset_conditions_repository_id_target",
+    "RepositoryRulesetConditionsRepositoryIdTargetRepositoryId": "github_client.models.repository_ruleset_conditions_repository_id_target_repository_id",
+    "RepositoryRulesetConditionsRepositoryNameTarget": "github_client.models.repository_ruleset_conditions_repository_name_target",
+    "RepositoryRulesetConditionsRepositoryNameTargetRepositoryName": "github_client.models.repository_ruleset_conditions_repository_name_target_repository_name",
+    "RepositoryRulesetConditionsRepositoryPropertySpec": "github_client.models.repository_ruleset_conditions_repository_property_spec",
+    "RepositoryRulesetConditionsRepositoryPropertyTarget": "github_client.models.repository_ruleset_conditions_repository_property_target",
+    "RepositoryRulesetConditionsRepositoryPropertyTargetRepositoryProperty": "github_client.models.repository_ruleset_conditions_repository_property_target_repository_property",
+    "RepositoryRulesetLinks": "github_client.models.repository_ruleset_links",
+    "RepositoryRulesetLinksHtml": "github_client.models.repository_ruleset_links_html",
+    "RepositoryRulesetLinksSelf": "github_client.models.repository_ruleset_links_self",
+    "RepositorySubscription": "github_client.models.repository_subscription",
+    "RepositoryVulnerabilityAlertAlert": "github_client.models.repository_vulnerability_alert_alert",
+    "RepositoryVulnerabilityAlertAlert1": "github_client.models.repository_vulnerability_alert_alert1",
+    "RepositoryWebhooks": "github_client.models.repository_webhooks",
+    "RepositoryWebhooksTemplateRepository": "github_client.models.repository_webhooks_template_repository",
+    "RepositoryWebhooksTemplateRepositoryOwner": "github_client.models.repository_webhooks_template_repository_owner",
+    "ReviewComment": "github_client.models.review_comment",
+    "ReviewCommentLinks": "github_client.models.review_comment_links",
+    "ReviewCustomGatesCommentRequired": "github_client.models.review_custom_gates_comment_required",
+    "ReviewCustomGatesStateRequired": "github_client.models.review_custom_gates_state_required",
+    "ReviewDismissedIssueEvent": "github_client.models.review_dismissed_issue_event",
+    "ReviewDismissedIssueEventDismissedReview": "github_client.models.review_dismissed_issue_event_dismissed_review",
+    "ReviewRequestRemovedIssueEvent": "github_client.models.review_request_removed_issue_event",
+    "ReviewRequestedIssueEvent": "github_client.models.review_requested_issue_event",
+    "Root": "github_client.models.root",
+    "RuleSuite": "github_client.models.rule_suite",
+    "RuleSuiteRuleEvaluationsInner": "github_client.models.rule_suite_rule_evaluations_inner",
+    "RuleSuiteRuleEvaluationsInnerRuleSource": "github_client.models.rule_suite_rule_evaluations_inner_rule_source",
+    "RuleSuitesInner": "github_client.models.rule_suites_inner",
+    "RulesetVersion": "github_client.models.ruleset_version",
+    "RulesetVersionActor": "github_client.models.ruleset_version_actor",
+    "RulesetVersionWithState": "github_client.models.ruleset_version_with_state",
+    "Runner": "github_client.models.runner",
+    "RunnerApplication": "github_client.models.runner_application",
+    "RunnerGroupsOrg": "github_client.models.runner_groups_org",
+    "RunnerLabel": "github_client.models.runner_label",
+    "ScimError": "github_client.models.scim_error",
+    "SearchCode200Response": "github_client.models.search_code200_response",
+    "SearchCommits200Response": "github_client.models.search_commits200_response",
+    "SearchIssuesAndPullRequests200Response": "github_client.models.search_issues_and_pull_requests200_response",
+    "SearchLabels200Response": "github_client.models.search_labels200_response",
+    "SearchRepos200Response": "github_client.models.search_repos200_response",
+    "SearchResultTextMatchesInner": "github_client.models.search_result_text_matches_inner",
+    "SearchResultTextMatchesInnerMatchesInner": "github_client.models.search_result_text_matches_inner_matches_inner",
+    "SearchTopics200Response": "github_client.models.search_topics200_response",
+    "SearchUsers200Response": "github_client.models.search_users200_response",
+    "SecretScanningAlert": "github_client.models.secret_scanning_alert",
+    "SecretScanningAlertResolution": "github_client.models.secret_scanning_alert_resolution",
+    "SecretScanningAlertResolutionWebhook": "github_client.models.secret_scanning_alert_resolution_webhook",
+    "SecretScanningAlertState": "github_client.models.secret_scanning_alert_state",
+    "SecretScanningAlertWebhook": "github_client.models.secret_scanning_alert_webhook",
+    "SecretScanningCreatePushProtectionBypassRequest": "github_client.models.secret_scanning_create_push_protection_bypass_request",
+    "SecretScanningLocation": "github_client.models.secret_scanning_location",
+    "SecretScanningLocationCommit": "github_client.models.secret_scanning_location_commit",
+    "SecretScanningLocationDetails": "github_client.models.secret_scanning_location_details",
+    "SecretScanningLocationDiscussionBody": "github_client.models.secret_scanning_location_discussion_body",
+    "SecretScanningLocationDiscussionComment": "github_client.models.secret_scanning_location_discussion_comment",
+    "SecretScanningLocationDiscussionTitle": "github_client.models.secret_scanning_location_discussion_title",
+    "SecretScanningLocationIssueBody": "github_client.models.secret_scanning_location_issue_body",
+    "SecretScanningLocationIssueComment": "github_client.models.secret_scanning_location_issue_comment",
+    "SecretScanningLocationIssueTitle": "github_client.models.secret_scanning_location_issue_title",
+    "SecretScanningLocationPullRequestBody": "github_client.models.secret_scanning_location_pull_request_body",
+    "SecretScanningLocationPullRequestComment": "github_client.models.secret_scanning_location_pull_request_comment",
+    "SecretScanningLocationPullRequestReview": "github_client.models.secret_scanning_location_pull_request_review",
+    "SecretScanningLocationPullRequestReviewComment": "github_client.models.secret_scanning_location_pull_request_review_comment",
+    "SecretScanningLocationPullRequestTitle": "github_client.models.secret_scanning_location_pull_request_title",
+    "SecretScanningLocationWikiCommit": "github_client.models.secret_scanning_location_wiki_commit",
+    "SecretScanningPatternConfiguration": "github_client.models.secret_scanning_pattern_configuration",
+    "SecretScanningPatternOverride": "github_client.models.secret_scanning_pattern_override",
+    "SecretScanningPushProtectionBypass": "github_client.models.secret_scanning_push_protection_bypass",
+    "SecretScanningPushProtectionBypassReason": "github_client.models.secret_scanning_push_protection_bypass_reason",
+    "SecretScanningScan": "github_client.models.secret_scanning_scan",
+    "SecretScanningScanHistory": "github_client.models.secret_scanning_scan_history",
+    "SecretScanningScanHistoryCustomPatternBackfillScansInner": "github_client.models.secret_scanning_scan_history_custom_pattern_backfill_scans_inner",
+    "SecretScanningUpdateAlertRequest": "github_client.models.secret_scanning_update_alert_request",
+    "SecretScanningUpdateOrgPatternConfigs200Response": "github_client.models.secret_scanning_update_org_pattern_configs200_response",
+    "SecretScanningUpdateOrgPatternConfigsRequest": "github_client.models.secret_scanning_update_org_pattern_configs_request",
+    "SecretScanningUpdateOrgPatternConfigsRequestCustomPatternSettingsInner": "github_client.models.secret_scanning_update_org_pattern_configs_request_custom_pattern_settings_inner",
+    "SecretScanningUpdateOrgPatternConfigsRequestProviderPatternSettingsInner": "github_client.models.secret_scanning_update_org_pattern_configs_request_provider_pattern_settings_inner",
+    "SecurityAdvisoriesListGlobalAdvisoriesAffectsParameter": "github_client.models.security_advisories_list_global_advisories_affects_parameter",
+    "SecurityAdvisoriesListGlobalAdvisoriesCwesParameter": "github_client.models.security_advisories_list_global_advisories_cwes_parameter",
+    "SecurityAdvisoryCreditTypes": "github_client.models.security_advisory_credit_types",
+    "SecurityAdvisoryEcosystems": "github_client.models.security_advisory_ecosystems",
+    "SecurityAdvisoryEpss": "github_client.models.security_advisory_epss",
+    "SecurityAndAnalysis": "github_client.models.security_and_analysis",
+    "SecurityAndAnalysisAdvancedSecurity": "github_client.models.security_and_analysis_advanced_security",
+    "SecurityAndAnalysisCodeSecurity": "github_client.models.security_and_analysis_code_security",
+    "SecurityAndAnalysisDependabotSecurityUpdates": "github_client.models.security_and_analysis_dependabot_security_updates",
+    "SelectedActions": "github_client.models.selected_actions",
+    "SelfHostedRunnersSettings": "github_client.models.self_hosted_runners_settings",
+    "ShortBlob": "github_client.models.short_blob",
+    "ShortBranch": "github_client.models.short_branch",
+    "ShortBranchCommit": "github_client.models.short_branch_commit",
+    "SimpleCheckSuite": "github_client.models.simple_check_suite",
+    "SimpleClassroom": "github_client.models.simple_classroom",
+    "SimpleClassroomAssignment": "github_client.models.simple_classroom_assignment",
+    "SimpleClassroomOrganization": "github_client.models.simple_classroom_organization",
+    "SimpleClassroomRepository": "github_client.models.simple_classroom_repository",
+    "SimpleClassroomUser": "github_client.models.simple_classroom_user",
+    "SimpleCommit": "github_client.models.simple_commit",
+    "SimpleCommitStatus": "github_client.models.simple_commit_status",
+    "SimpleInstallation": "github_client.models.simple_installation",
+    "SimplePullRequest": "github_client.models.simple_pull_request",
+    "SimplePullRequest1": "github_client.models.simple_pull_request1",
+    "SimplePullRequest1Base": "github_client.models.simple_pull_request1_base",
+    "SimplePullRequest1Head": "github_client.models.simple_pull_request1_head",
+    "SimplePullRequest2": "github_client.models.simple_pull_request2",
+    "SimplePullRequest3": "github_client.models.simple_pull_request3",
+    "SimplePullRequest3Base": "github_client.models.simple_pull_request3_base",
+    "SimplePullRequest3Head": "github_client.models.simple_pull_request3_head",
+    "SimplePullRequest4": "github_client.models.simple_pull_request4",
+    "SimpleRepository": "github_client.models.simple_repository",
+    "SimpleUser": "github_client.models.simple_user",
+    "Snapshot": "github_client.models.snapshot",
+    "SnapshotDetector": "github_client.models.snapshot_detector",
+    "SnapshotJob": "github_client.models.snapshot_job",
+    "SocialAccount": "github_client.models.social_account",
+    "SponsorshipTier": "github_client.models.sponsorship_tier",
+    "SshSigningKey": "github_client.models.ssh_signing_key",
+    "Stargazer": "github_client.models.stargazer",
+    "StarredRepository": "github_client.models.starred_repository",
+    "StateChangeIssueEvent": "github_client.models.state_change_issue_event",
+    "StaticPublicIPLimitsForGitHubHostedHostedRunners": "github_client.models.static_public_ip_limits_for_git_hub_hosted_hosted_runners",
+    "Status": "github_client.models.status",
+    "StatusCheckPolicy": "github_client.models.status_check_policy",
+    "StatusCheckPolicyChecksInner": "github_client.models.status_check_policy_checks_inner",
+    "SubIssuesSummary": "github_client.models.sub_issues_summary",
+    "Tag": "github_client.models.tag",
+    "TagProtection": "github_client.models.tag_protection",
+    "Team": "github_client.models.team",
+    "Team1": "github_client.models.team1",
+    "TeamDiscussion": "github_client.models.team_discussion",
+    "TeamDiscussionComment": "github_client.models.team_discussion_comment",
+    "TeamFull": "github_client.models.team_full",
+    "TeamMembership": "github_client.models.team_membership",
+    "TeamOrganization": "github_client.models.team_organization",
+    "TeamParent": "github_client.models.team_parent",
+    "TeamPermissions": "github_client.models.team_permissions",
+    "TeamProject": "github_client.models.team_project",
+    "TeamProjectPermissions": "github_client.models.team_project_permissions",
+    "TeamRepository": "github_client.models.team_repository",
+    "TeamRoleAssignment": "github_client.models.team_role_assignment",
+    "TeamSimple": "github_client.models.team_simple",
+    "TeamsAddOrUpdateMembershipForUserInOrgRequest": "github_client.models.teams_add_or_update_membership_for_user_in_org_request",
+    "TeamsAddOrUpdateProjectPermissionsInOrgRequest": "github_client.models.teams_add_or_update_project_permissions_in_org_request",
+    "TeamsAddOrUpdateProjectPermissionsLegacyRequest": "github_client.models.teams_add_or_update_project_permissions_legacy_request",
+    "TeamsAddOrUpdateRepoPermissionsInOrgRequest": "github_client.models.teams_add_or_update_repo_permissions_in_org_request",
+    "TeamsAddOrUpdateRepoPermissionsLegacyRequest": "github_client.models.teams_add_or_update_repo_permissions_legacy_request",
+    "TeamsCreateDiscussionCommentInOrgRequest": "github_client.models.teams_create_discussion_comment_in_org_request",
+    "TeamsCreateDiscussionInOrgRequest": "github_client.models.teams_create_discussion_in_org_request",
+    "TeamsCreateRequest": "github_client.models.teams_create_request",
+    "TeamsUpdateDiscussionInOrgRequest": "github_client.models.teams_update_discussion_in_org_request",
+    "TeamsUpdateInOrgRequest": "github_client.models.teams_update_in_org_request",
+    "TeamsUpdateLegacyRequest": "github_client.models.teams_update_legacy_request",
+    "Thread": "github_client.models.thread",
+    "ThreadSubject": "github_client.models.thread_subject",
+    "ThreadSubscription": "github_client.models.thread_subscription",
+    "TimelineAssignedIssueEvent": "github_client.models.timeline_assigned_issue_event",
+    "TimelineCommentEvent": "github_client.models.timeline_comment_event",
+    "TimelineCommitCommentedEvent": "github_client.models.timeline_commit_commented_event",
+    "TimelineCommittedEvent": "github_client.models.timeline_committed_event",
+    "TimelineCrossReferencedEvent": "github_client.models.timeline_cross_referenced_event",
+    "TimelineCrossReferencedEventSource": "github_client.models.timeline_cross_referenced_event_source",
+    "TimelineIssueEvents": "github_client.models.timeline_issue_events",
+    "TimelineLineCommentedEvent": "github_client.models.timeline_line_commented_event",
+    "TimelineReviewedEvent": "github_client.models.timeline_reviewed_event",
+    "TimelineReviewedEventLinks": "github_client.models.timeline_reviewed_event_links",
+    "TimelineReviewedEventLinksHtml": "github_client.models.timeline_reviewed_event_links_html",
+    "TimelineUnassignedIssueEvent": "github_client.models.timeline_unassigned_issue_event",
+    "Topic": "github_client.models.topic",
+    "TopicSearchResultItem": "github_client.models.topic_search_result_item",
+    "TopicSearchResultItemRelatedInner": "github_client.models.topic_search_result_item_related_inner",
+    "TopicSearchResultItemRelatedInnerTopicRelation": "github_client.models.topic_search_result_item_related_inner_topic_relation",
+    "Traffic": "github_client.models.traffic",
+    "UnassignedIssueEvent": "github_client.models.unassigned_issue_event",
+    "UnlabeledIssueEvent": "github_client.models.unlabeled_issue_event",
+    "User": "github_client.models.user",
+    "User1": "github_client.models.user1",
+    "User2": "github_client.models.user2",
+    "User3": "github_client.models.user3",
+    "User4": "github_client.models.user4",
+    "User5": "github_client.models.user5",
+    "User6": "github_client.models.user6",
+    "User7": "github_client.models.user7",
+    "User8": "github_client.models.user8",
+    "UserMarketplacePurchase": "github_client.models.user_marketplace_purchase",
+    "UserRoleAssignment": "github_client.models.user_role_assignment",
+    "UserSearchResultItem": "github_client.models.user_search_result_item",
+    "UsersAddEmailForAuthenticatedUserRequest": "github_client.models.users_add_email_for_authenticated_user_request",
+    "UsersAddEmailForAuthenticatedUserRequestOneOf": "github_client.models.users_add_email_for_authenticated_user_request_one_of",
+    "UsersAddSocialAccountForAuthenticatedUserRequest": "github_client.models.users_add_social_account_for_authenticated_user_request",
+    "UsersCreateGpgKeyForAuthenticatedUserRequest": "github_client.models.users_create_gpg_key_for_authenticated_user_request",
+    "UsersCreatePublicSshKeyForAuthenticatedUserRequest": "github_client.models.users_create_public_ssh_key_for_authenticated_user_request",
+    "UsersCreateSshSigningKeyForAuthenticatedUserRequest": "github_client.models.users_create_ssh_signing_key_for_authenticated_user_request",
+    "UsersDeleteEmailForAuthenticatedUserRequest": "github_client.models.users_delete_email_for_authenticated_user_request",
+    "UsersDeleteEmailForAuthenticatedUserRequestOneOf": "github_client.models.users_delete_email_for_authenticated_user_request_one_of",
+    "UsersDeleteSocialAccountForAuthenticatedUserRequest": "github_client.models.users_delete_social_account_for_authenticated_user_request",
+    "UsersGetAuthenticated200Response": "github_client.models.users_get_authenticated200_response",
+    "UsersSetPrimaryEmailVisibilityForAuthenticatedUserRequest": "github_client.models.users_set_primary_email_visibility_for_authenticated_user_request",
+    "UsersUpdateAuthenticatedRequest": "github_client.models.users_update_authenticated_request",
+    "ValidationError": "github_client.models.validation_error",
+    "ValidationErrorErrorsInner": "github_client.models.validation_error_errors_inner",
+    "ValidationErrorErrorsInnerValue": "github_client.models.validation_error_errors_inner_value",
+    "ValidationErrorSimple": "github_client.models.validation_error_simple",
+    "Verification": "github_client.models.verification",
+    "ViewTraffic": "github_client.models.view_traffic",
+    "Vulnerability": "github_client.models.vulnerability",
+    "VulnerabilityPackage": "github_client.models.vulnerability_package",
+    "Webhook": "github_client.models.webhook",
+    "WebhookBranchProtectionConfigurationDisabled": "github_client.models.webhook_branch_protection_configuration_disabled",
+    "WebhookBranchProtectionConfigurationEnabled": "github_client.models.webhook_branch_protection_configuration_enabled",
+    "WebhookBranchProtectionRuleCreated": "github_client.models.webhook_branch_protection_rule_created",
+    "WebhookBranchProtectionRuleDeleted": "github_client.models.webhook_branch_protection_rule_deleted",
+    "WebhookBranchProtectionRuleEdited": "github_client.models.webhook_branch_protection_rule_edited",
+    "WebhookBranchProtectionRuleEditedChanges": "github_client.models.webhook_branch_protection_rule_edited_changes",
+    "WebhookBranchProtectionRuleEditedChangesAdminEnforced": "github_client.models.webhook_branch_protection_rule_edited_changes_admin_enforced",
+    "WebhookBranchProtectionRuleEditedChangesAuthorizedActorNames": "github_client.models.webhook_branch_protection_rule_edited_changes_authorized_actor_names",
+    "WebhookBranchProtectionRuleEditedChangesLinearHistoryRequirementEnforcementLevel": "github_client.models.webhook_branch_protection_rule_edited_changes_linear_history_requirement_enforcement_level",
+    "WebhookCheckRunCompleted": "github_client.models.webhook_check_run_completed",
+    "WebhookCheckRunCompletedFormEncoded": "github_client.models.webhook_check_run_completed_form_encoded",
+    "WebhookCheckRunCreated": "github_client.models.webhook_check_run_created",
+    "WebhookCheckRunCreatedFormEncoded": "github_client.models.webhook_check_run_created_form_encoded",
+    "WebhookCheckRunRequestedAction": "github_client.models.webhook_check_run_requested_action",
+    "WebhookCheckRunRequestedActionFormEncoded": "github_client.models.webhook_check_run_requested_action_form_encoded",
+    "WebhookCheckRunRequestedActionRequestedAction": "github_client.models.webhook_check_run_requested_action_requested_action",
+    "WebhookCheckRunRerequested": "github_client.models.webhook_check_run_rerequested",
+    "WebhookCheckRunRerequestedFormEncoded": "github_client.models.webhook_check_run_rerequested_form_encoded",
+    "WebhookCheckSuiteCompleted": "github_client.models.webhook_check_suite_completed",
+    "WebhookCheckSuiteCompletedCheckSuite": "github_client.models.webhook_check_suite_completed_check_suite",
+    "WebhookCheckSuiteRequested": "github_client.models.webhook_check_suite_requested",
+    "WebhookCheckSuiteRequestedCheckSuite": "github_client.models.webhook_check_suite_requested_check_suite",
+    "WebhookCheckSuiteRerequested": "github_client.models.webhook_check_suite_rerequested",
+    "WebhookCheckSuiteRerequestedCheckSuite": "github_client.models.webhook_check_suite_rerequested_check_suite",
+    "WebhookCodeScanningAlertAppearedInBranch": "github_client.models.webhook_code_scanning_alert_appeared_in_branch",
+    "WebhookCodeScanningAlertAppearedInBranchAlert": "github_client.models.webhook_code_scanning_alert_appeared_in_branch_alert",
+    "WebhookCodeScanningAlertAppearedInBranchAlertRule": "github_client.models.webhook_code_scanning_alert_appeared_in_branch_alert_rule",
+    "WebhookCodeScanningAlertAppearedInBranchAlertTool": "github_client.models.webhook_code_scanning_alert_appeared_in_branch_alert_tool",
+    "WebhookCodeScanningAlertClosedByUser": "github_client.models.webhook_code_scanning_alert_closed_by_user",
+    "WebhookCodeScanningAlertClosedByUserAlert": "github_client.models.webhook_code_scanning_alert_closed_by_user_alert",
+    "WebhookCodeScanningAlertClosedByUserAlertRule": "github_client.models.webhook_code_scanning_alert_closed_by_user_alert_rule",
+    "WebhookCodeScanningAlertClosedByUserAlertTool": "github_client.models.webhook_code_scanning_alert_closed_by_user_alert_tool",
+    "WebhookCodeScanningAlertCreated": "github_client.models.webhook_code_scanning_alert_created",
+    "WebhookCodeScanningAlertCreatedAlert": "github_client.models.webhook_code_scanning_alert_created_alert",
+    "WebhookCodeScanningAlertCreatedAlertTool": "github_client.models.webhook_code_scanning_alert_created_alert_tool",
+    "WebhookCodeScanningAlertFixed": "github_client.models.webhook_code_scanning_alert_fixed",
+    "WebhookCodeScanningAlertFixedAlert": "github_client.models.webhook_code_scanning_alert_fixed_alert",
+    "WebhookCodeScanningAlertReopened": "github_client.models.webhook_code_scanning_alert_reopened",
+    "WebhookCodeScanningAlertReopenedAlert": "github_client.models.webhook_code_scanning_alert_reopened_alert",
+    "WebhookCodeScanningAlertReopenedByUser": "github_client.models.webhook_code_scanning_alert_reopened_by_user",
+    "WebhookCodeScanningAlertReopenedByUserAlert": "github_client.models.webhook_code_scanning_alert_reopened_by_user_alert",
+    "WebhookCommitCommentCreated": "github_client.models.webhook_commit_comment_created",
+    "WebhookCommitCommentCreatedComment": "github_client.models.webhook_commit_comment_created_comment",
+    "WebhookConfig": "github_client.models.webhook_config",
+    "WebhookConfigInsecureSsl": "github_client.models.webhook_config_insecure_ssl",
+    "WebhookCreate": "github_client.models.webhook_create",
+    "WebhookCustomPropertyCreated": "github_client.models.webhook_custom_property_created",
+    "WebhookCustomPropertyDeleted": "github_client.models.webhook_custom_property_deleted",
+    "WebhookCustomPropertyDeletedDefinition": "github_client.models.webhook_custom_property_deleted_definition",
+    "WebhookCustomPropertyPromotedToEnterprise": "github_client.models.webhook_custom_property_promoted_to_enterprise",
+    "WebhookCustomPropertyUpdated": "github_client.models.webhook_custom_property_updated",
+    "WebhookCustomPropertyValuesUpdated": "github_client.models.webhook_custom_property_values_updated",
+    "WebhookDelete": "github_client.models.webhook_delete",
+    "WebhookDependabotAlertAutoDismissed": "github_client.models.webhook_dependabot_alert_auto_dismissed",
+    "WebhookDependabotAlertAutoReopened": "github_client.models.webhook_dependabot_alert_auto_reopened",
+    "WebhookDependabotAlertCreated": "github_client.models.webhook_dependabot_alert_created",
+    "WebhookDependabotAlertDismissed": "github_client.models.webhook_dependabot_alert_dismissed",
+    "WebhookDependabotAlertFixed": "github_client.models.webhook_dependabot_alert_fixed",
+    "WebhookDependabotAlertReintroduced": "github_client.models.webhook_dependabot_alert_reintroduced",
+    "WebhookDependabotAlertReopened": "github_client.models.webhook_dependabot_alert_reopened",
+    "WebhookDeployKeyCreated": "github_client.models.webhook_deploy_key_created",
+    "WebhookDeployKeyDeleted": "github_client.models.webhook_deploy_key_deleted",
+    "WebhookDeploymentCreated": "github_client.models.webhook_deployment_created",
+    "WebhookDeploymentProtectionRuleRequested": "github_client.models.webhook_deployment_protection_rule_requested",
+    "WebhookDeploymentReviewApproved": "github_client.models.webhook_deployment_review_approved",
+    "WebhookDeploymentReviewApprovedWorkflowJobRunsInner": "github_client.models.webhook_deployment_review_approved_workflow_job_runs_inner",
+    "WebhookDeploymentReviewRejected": "github_client.models.webhook_deployment_review_rejected",
+    "WebhookDeploymentReviewRejectedWorkflowJobRunsInner": "github_client.models.webhook_deployment_review_rejected_workflow_job_runs_inner",
+    "WebhookDeploymentReviewRequested": "github_client.models.webhook_deployment_review_requested",
+    "WebhookDeploymentReviewRequestedReviewersInner": "github_client.models.webhook_deployment_review_requested_reviewers_inner",
+    "WebhookDeploymentReviewRequestedWorkflowJobRun": "github_client.models.webhook_deployment_review_requested_workflow_job_run",
+    "WebhookDeploymentStatusCreated": "github_client.models.webhook_deployment_status_created",
+    "WebhookDeploymentStatusCreatedCheckRun": "github_client.models.webhook_deployment_status_created_check_run",
+    "WebhookDeploymentStatusCreatedDeploymentStatus": "github_client.models.webhook_deployment_status_created_deployment_status",
+    "WebhookDiscussionAnswered": "github_client.models.webhook_discussion_answered",
+    "WebhookDiscussionCategoryChanged": "github_client.models.webhook_discussion_category_changed",
+    "WebhookDiscussionCategoryChangedChanges": "github_client.models.webhook_discussion_category_changed_changes",
+    "WebhookDiscussionCategoryChangedChangesCategory": "github_client.models.webhook_discussion_category_changed_changes_category",
+    "WebhookDiscussionClosed": "github_client.models.webhook_discussion_closed",
+    "WebhookDiscussionCommentCreated": "github_client.models.webhook_discussion_comment_created",
+    "WebhookDiscussionCommentDeleted": "github_client.models.webhook_discussion_comment_deleted",
+    "WebhookDiscussionCommentEdited": "github_client.models.webhook_discussion_comment_edited",
+    "WebhookDiscussionCommentEditedChanges": "github_client.models.webhook_discussion_comment_edited_changes",
+    "WebhookDiscussionCommentEditedChangesBody": "github_client.models.webhook_discussion_comment_edited_changes_body",
+    "WebhookDiscussionCreated": "github_client.models.webhook_discussion_created",
+    "WebhookDiscussionDeleted": "github_client.models.webhook_discussion_deleted",
+    "WebhookDiscussionEdited": "github_client.models.webhook_discussion_edited",
+    "WebhookDiscussionEditedChanges": "github_client.models.webhook_discussion_edited_changes",
+    "WebhookDiscussionLabeled": "github_client.models.webhook_discussion_labeled",
+    "WebhookDiscussionLocked": "github_client.models.webhook_discussion_locked",
+    "WebhookDiscussionPinned": "github_client.models.webhook_discussion_pinned",
+    "WebhookDiscussionReopened": "github_client.models.webhook_discussion_reopened",
+    "WebhookDiscussionTransferred": "github_client.models.webhook_discussion_transferred",
+    "WebhookDiscussionTransferredChanges": "github_client.models.webhook_discussion_transferred_changes",
+    "WebhookDiscussionUnanswered": "github_client.models.webhook_discussion_unanswered",
+    "WebhookDiscussionUnlabeled": "github_client.models.webhook_discussion_unlabeled",
+    "WebhookDiscussionUnlocked": "github_client.models.webhook_discussion_unlocked",
+    "WebhookDiscussionUnpinned": "github_client.models.webhook_discussion_unpinned",
+    "WebhookFork": "github_client.models.webhook_fork",
+    "WebhookForkForkee": "github_client.models.webhook_fork_forkee",
+    "WebhookGithubAppAuthorizationRevoked": "github_client.models.webhook_github_app_authorization_revoked",
+    "WebhookGollum": "github_client.models.webhook_gollum",
+    "WebhookGollumPagesInner": "github_client.models.webhook_gollum_pages_inner",
+    "WebhookInstallationCreated": "github_client.models.webhook_installation_created",
+    "WebhookInstallationDeleted": "github_client.models.webhook_installation_deleted",
+    "WebhookInstallationNewPermissionsAccepted": "github_client.models.webhook_installation_new_permissions_accepted",
+    "WebhookInstallationRepositoriesAdded": "github_client.models.webhook_installation_repositories_added",
+    "WebhookInstallationRepositoriesAddedRepositoriesRemovedInner": "github_client.models.webhook_installation_repositories_added_repositories_removed_inner",
+    "WebhookInstallationRepositoriesRemoved": "github_client.models.webhook_installation_repositories_removed",
+    "WebhookInstallationSuspend": "github_client.models.webhook_installation_suspend",
+    "WebhookInstallationTargetRenamed": "github_client.models.webhook_installation_target_renamed",
+    "WebhookInstallationTargetRenamedAccount": "github_client.models.webhook_installation_target_renamed_account",
+    "WebhookInstallationTargetRenamedChanges": "github_client.models.webhook_installation_target_renamed_changes",
+    "WebhookInstallationUnsuspend": "github_client.models.webhook_installation_unsuspend",
+    "WebhookIssueCommentCreated": "github_client.models.webhook_issue_comment_created",
+    "WebhookIssueCommentCreatedIssue": "github_client.models.webhook_issue_comment_created_issue",
+    "WebhookIssueCommentCreatedIssueAllOfReactions": "github_client.models.webhook_issue_comment_created_issue_all_of_reactions",
+    "WebhookIssueCommentCreatedIssueAllOfUser": "github_client.models.webhook_issue_comment_created_issue_all_of_user",
+    "WebhookIssueCommentDeleted": "github_client.models.webhook_issue_comment_deleted",
+    "WebhookIssueCommentDeletedIssue": "github_client.models.webhook_issue_comment_deleted_issue",
+    "WebhookIssueCommentDeletedIssueAllOfUser": "github_client.models.webhook_issue_comment_deleted_issue_all_of_user",
+    "WebhookIssueCommentEdited": "github_client.models.webhook_issue_comment_edited",
+    "WebhookIssueCommentEditedIssue": "github_client.models.webhook_issue_comment_edited_issue",
+    "WebhookIssueDependenciesBlockedByAdded": "github_client.models.webhook_issue_dependencies_blocked_by_added",
+    "WebhookIssueDependenciesBlockedByRemoved": "github_client.models.webhook_issue_dependencies_blocked_by_removed",
+    "WebhookIssueDependenciesBlockingAdded": "github_client.models.webhook_issue_dependencies_blocking_added",
+    "WebhookIssueDependenciesBlockingRemoved": "github_client.models.webhook_issue_dependencies_blocking_removed",
+    "WebhookIssuesAssigned": "github_client.models.webhook_issues_assigned",
+    "WebhookIssuesClosed": "github_client.models.webhook_issues_closed",
+    "WebhookIssuesClosedIssue": "github_client.models.webhook_issues_closed_issue",
+    "WebhookIssuesDeleted": "github_client.models.webhook_issues_deleted",
+    "WebhookIssuesDemilestoned": "github_client.models.webhook_issues_demilestoned",
+    "WebhookIssuesEdited": "github_client.models.webhook_issues_edited",
+    "WebhookIssuesEditedChanges": "github_client.models.webhook_issues_edited_changes",
+    "WebhookIssuesEditedChangesTitle": "github_client.models.webhook_issues_edited_changes_title",
+    "WebhookIssuesLabeled": "github_client.models.webhook_issues_labeled",
+    "WebhookIssuesLocked": "github_client.models.webhook_issues_locked",
+    "WebhookIssuesMilestoned": "github_client.models.webhook_issues_milestoned",
+    "WebhookIssuesOpened": "github_client.models.webhook_issues_opened",
+    "WebhookIssuesOpenedChanges": "github_client.models.webhook_issues_opened_changes",
+    "WebhookIssuesPinned": "github_client.models.webhook_issues_pinned",
+    "WebhookIssuesReopened": "github_client.models.webhook_issues_reopened",
+    "WebhookIssuesTransferred": "github_client.models.webhook_issues_transferred",
+    "WebhookIssuesTransferredChanges": "github_client.models.webhook_issues_transferred_changes",
+    "WebhookIssuesTyped": "github_client.models.webhook_issues_typed",
+    "WebhookIssuesUnassigned": "github_client.models.webhook_issues_unassigned",
+    "WebhookIssuesUnlabeled": "github_client.models.webhook_issues_unlabeled",
+    "WebhookIssuesUnlocked": "github_client.models.webhook_issues_unlocked",
+    "WebhookIssuesUnpinned": "github_client.models.webhook_issues_unpinned",
+    "WebhookIssuesUntyped": "github_client.models.webhook_issues_untyped",
+    "WebhookLabelCreated": "github_client.models.webhook_label_created",
+    "WebhookLabelDeleted": "github_client.models.webhook_label_deleted",
+    "WebhookLabelEdited": "github_client.models.webhook_label_edited",
+    "WebhookLabelEditedChanges": "github_client.models.webhook_label_edited_changes",
+    "WebhookLabelEditedChangesColor": "github_client.models.webhook_label_edited_changes_color",
+    "WebhookLabelEditedChangesDescription": "github_client.models.webhook_label_edited_changes_description",
+    "WebhookLabelEditedChangesName": "github_client.models.webhook_label_edited_changes_name",
+    "WebhookMarketplacePurchaseCancelled": "github_client.models.webhook_marketplace_purchase_cancelled",
+    "WebhookMarketplacePurchaseChanged": "github_client.models.webhook_marketplace_purchase_changed",
+    "WebhookMarketplacePurchasePendingChange": "github_client.models.webhook_marketplace_purchase_pending_change",
+    "WebhookMarketplacePurchasePendingChangeCancelled": "github_client.models.webhook_marketplace_purchase_pending_change_cancelled",
+    "WebhookMarketplacePurchasePurchased": "github_client.models.webhook_marketplace_purchase_purchased",
+    "WebhookMemberAdded": "github_client.models.webhook_member_added",
+    "WebhookMemberAddedChanges": "github_client.models.webhook_member_added_changes",
+    "WebhookMemberAddedChangesPermission": "github_client.models.webhook_member_added_changes_permission",
+    "WebhookMemberAddedChangesRoleName": "github_client.models.webhook_member_added_changes_role_name",
+    "WebhookMemberEdited": "github_client.models.webhook_member_edited",
+    "WebhookMemberEditedChanges": "github_client.models.webhook_member_edited_changes",
+    "WebhookMemberEditedChangesOldPermission": "github_client.models.webhook_member_edited_changes_old_permission",
+    "WebhookMemberEditedChangesPermission": "github_client.models.webhook_member_edited_changes_permission",
+    "WebhookMemberRemoved": "github_client.models.webhook_member_removed",
+    "WebhookMembershipAdded": "github_client.models.webhook_membership_added",
+    "WebhookMembershipRemoved": "github_client.models.webhook_membership_removed",
+    "WebhookMergeGroupChecksRequested": "github_client.models.webhook_merge_group_checks_requested",
+    "WebhookMergeGroupDestroyed": "github_client.models.webhook_merge_group_destroyed",
+    "WebhookMetaDeleted": "github_client.models.webhook_meta_deleted",
+    "WebhookMetaDeletedHook": "github_client.models.webhook_meta_deleted_hook",
+    "WebhookMetaDeletedHookConfig": "github_client.models.webhook_meta_deleted_hook_config",
+    "WebhookMilestoneClosed": "github_client.models.webhook_milestone_closed",
+    "WebhookMilestoneCreated": "github_client.models.webhook_milestone_created",
+    "WebhookMilestoneDeleted": "github_client.models.webhook_milestone_deleted",
+    "WebhookMilestoneEdited": "github_client.models.webhook_milestone_edited",
+    "WebhookMilestoneEditedChanges": "github_client.models.webhook_milestone_edited_changes",
+    "WebhookMilestoneEditedChangesDueOn": "github_client.models.webhook_milestone_edited_changes_due_on",
+    "WebhookMilestoneEditedChangesTitle": "github_client.models.webhook_milestone_edited_changes_title",
+    "WebhookMilestoneOpened": "github_client.models.webhook_milestone_opened",
+    "WebhookOrgBlockBlocked": "github_client.models.webhook_org_block_blocked",
+    "WebhookOrgBlockUnblocked": "github_client.models.webhook_org_block_unblocked",
+    "WebhookOrganizationDeleted": "github_client.models.webhook_organization_deleted",
+    "WebhookOrganizationMemberAdded": "github_client.models.webhook_organization_member_added",
+    "WebhookOrganizationMemberInvited": "github_client.models.webhook_organization_member_invited",
+    "WebhookOrganizationMemberInvitedInvitation": "github_client.models.webhook_organization_member_invited_invitation",
+    "WebhookOrganizationMemberRemoved": "github_client.models.webhook_organization_member_removed",
+    "WebhookOrganizationRenamed": "github_client.models.webhook_organization_renamed",
+    "WebhookOrganizationRenamedChanges": "github_client.models.webhook_organization_renamed_changes",
+    "WebhookOrganizationRenamedChangesLogin": "github_client.models.webhook_organization_renamed_changes_login",
+    "WebhookPackagePublished": "github_client.models.webhook_package_published",
+    "WebhookPackagePublishedPackage": "github_client.models.webhook_package_published_package",
+    "WebhookPackagePublishedPackagePackageVersion": "github_client.models.webhook_package_published_package_package_version",
+    "WebhookPackagePublishedPackagePackageVersionBody": "github_client.models.webhook_package_published_package_package_version_body",
+    "WebhookPackagePublishedPackagePackageVersionContainerMetadata": "github_client.models.webhook_package_published_package_package_version_container_metadata",
+    "WebhookPackagePublishedPackagePackageVersionContainerMetadataTag": "github_client.models.webhook_package_published_package_package_version_container_metadata_tag",
+    "WebhookPackagePublishedPackagePackageVersionDockerMetadataInner": "github_client.models.webhook_package_published_package_package_version_docker_metadata_inner",
+    "WebhookPackagePublishedPackagePackageVersionNpmMetadata": "github_client.models.webhook_package_published_package_package_version_npm_metadata",
+    "WebhookPackagePublishedPackagePackageVersionNugetMetadataInner": "github_client.models.webhook_package_published_package_package_version_nuget_metadata_inner",
+    "WebhookPackagePublishedPackagePackageVersionNugetMetadataInnerValue": "github_client.models.webhook_package_published_package_package_version_nuget_metadata_inner_value",
+    "WebhookPackagePublishedPackagePackageVersionNugetMetadataInnerValueOneOf": "github_client.models.webhook_package_published_package_package_version_nuget_metadata_inner_value_one_of",
+    "WebhookPackagePublishedPackagePackageVersionPackageFilesInner": "github_client.models.webhook_package_published_package_package_version_package_files_inner",
+    "WebhookPackagePublishedPackagePackageVersionRelease": "github_client.models.webhook_package_published_package_package_version_release",
+    "WebhookPackagePublishedPackageRegistry": "github_client.models.webhook_package_published_package_registry",
+    "WebhookPackageUpdated": "github_client.models.webhook_package_updated",
+    "WebhookPackageUpdatedPackage": "github_client.models.webhook_package_updated_package",
+    "WebhookPackageUpdatedPackagePackageVersion": "github_client.models.webhook_package_updated_package_package_version",
+    "WebhookPackageUpdatedPackagePackageVersionPackageFilesInner": "github_client.models.webhook_package_updated_package_package_version_package_files_inner",
+    "WebhookPackageUpdatedPackagePackageVersionRelease": "github_client.models.webhook_package_updated_package_package_version_release",
+    "WebhookPageBuild": "github_client.models.webhook_page_build",
+    "WebhookPageBuildBuild": "github_client.models.webhook_page_build_build",
+    "WebhookPersonalAccessTokenRequestApproved": "github_client.models.webhook_personal_access_token_request_approved",
+    "WebhookPersonalAccessTokenRequestCancelled": "github_client.models.webhook_personal_access_token_request_cancelled",
+    "WebhookPersonalAccessTokenRequestCreated": "github_client.models.webhook_personal_access_token_request_created",
+    "WebhookPersonalAccessTokenRequestDenied": "github_client.models.webhook_personal_access_token_request_denied",
+    "WebhookPing": "github_client.models.webhook_ping",
+    "WebhookPingFormEncoded": "github_client.models.webhook_ping_form_encoded",
+    "WebhookProjectCardConverted": "github_client.models.webhook_project_card_converted",
+    "WebhookProjectCardConvertedChanges": "github_client.models.webhook_project_card_converted_changes",
+    "WebhookProjectCardCreated": "github_client.models.webhook_project_card_created",
+    "WebhookProjectCardDeleted": "github_client.models.webhook_project_card_deleted",
+    "WebhookProjectCardEdited": "github_client.models.webhook_project_card_edited",
+    "WebhookProjectCardEditedChanges": "github_client.models.webhook_project_card_edited_changes",
+    "WebhookProjectCardEditedChangesNote": "github_client.models.webhook_project_card_edited_changes_note",
+    "WebhookProjectCardMoved": "github_client.models.webhook_project_card_moved",
+    "WebhookProjectCardMovedChanges": "github_client.models.webhook_project_card_moved_changes",
+    "WebhookProjectCardMovedChangesColumnId": "github_client.models.webhook_project_card_moved_changes_column_id",
+    "WebhookProjectCardMovedProjectCard": "github_client.models.webhook_project_card_moved_project_card",
+    "WebhookProjectCardMovedProjectCardAllOfCreator": "github_client.models.webhook_project_card_moved_project_card_all_of_creator",
+    "WebhookProjectClosed": "github_client.models.webhook_project_closed",
+    "WebhookProjectColumnCreated": "github_client.models.webhook_project_column_created",
+    "WebhookProjectColumnDeleted": "github_client.models.webhook_project_column_deleted",
+    "WebhookProjectColumnEdited": "github_client.models.webhook_project_column_edited",
+    "WebhookProjectColumnEditedChanges": "github_client.models.webhook_project_column_edited_changes",
+    "WebhookProjectColumnMoved": "github_client.models.webhook_project_column_moved",
+    "WebhookProjectCreated": "github_client.models.webhook_project_created",
+    "WebhookProjectDeleted": "github_client.models.webhook_project_deleted",
+    "WebhookProjectEdited": "github_client.models.webhook_project_edited",
+    "WebhookProjectEditedChanges": "github_client.models.webhook_project_edited_changes",
+    "WebhookProjectEditedChangesBody": "github_client.models.webhook_project_edited_changes_body",
+    "WebhookProjectEditedChangesName": "github_client.models.webhook_project_edited_changes_name",
+    "WebhookProjectReopened": "github_client.models.webhook_project_reopened",
+    "WebhookProjectsV2ItemArchived": "github_client.models.webhook_projects_v2_item_archived",
+    "WebhookProjectsV2ItemConverted": "github_client.models.webhook_projects_v2_item_converted",
+    "WebhookProjectsV2ItemConvertedChanges": "github_client.models.webhook_projects_v2_item_converted_changes",
+    "WebhookProjectsV2ItemConvertedChangesContentType": "github_client.models.webhook_projects_v2_item_converted_changes_content_type",
+    "WebhookProjectsV2ItemCreated": "github_client.models.webhook_projects_v2_item_created",
+    "WebhookProjectsV2ItemDeleted": "github_client.models.webhook_projects_v2_item_deleted",
+    "WebhookProjectsV2ItemEdited": "github_client.models.webhook_projects_v2_item_edited",
+    "WebhookProjectsV2ItemEditedChanges": "github_client.models.webhook_projects_v2_item_edited_changes",
+    "WebhookProjectsV2ItemEditedChangesOneOf": "github_client.models.webhook_projects_v2_item_edited_changes_one_of",
+    "WebhookProjectsV2ItemEditedChangesOneOf1": "github_client.models.webhook_projects_v2_item_edited_changes_one_of1",
+    "WebhookProjectsV2ItemEditedChangesOneOfFieldValue": "github_client.models.webhook_projects_v2_item_edited_changes_one_of_field_value",
+    "WebhookProjectsV2ItemEditedChangesOneOfFieldValueFrom": "github_client.models.webhook_projects_v2_item_edited_changes_one_of_field_value_from",
+    "WebhookProjectsV2ItemReordered": "github_client.models.webhook_projects_v2_item_reordered",
+    "WebhookProjectsV2ItemReorderedChanges": "github_client.models.webhook_projects_v2_item_reordered_changes",
+    "WebhookProjectsV2ItemRestored": "github_client.models.webhook_projects_v2_item_restored",
+    "WebhookProjectsV2ProjectClosed": "github_client.models.webhook_projects_v2_project_closed",
+    "WebhookProjectsV2ProjectCreated": "github_client.models.webhook_projects_v2_project_created",
+    "WebhookProjectsV2ProjectDeleted": "github_client.models.webhook_projects_v2_project_deleted",
+    "WebhookProjectsV2ProjectEdited": "github_client.models.webhook_projects_v2_project_edited",
+    "WebhookProjectsV2ProjectEditedChanges": "github_client.models.webhook_projects_v2_project_edited_changes",
+    "WebhookProjectsV2ProjectEditedChangesPublic": "github_client.models.webhook_projects_v2_project_edited_changes_public",
+    "WebhookProjectsV2ProjectEditedChangesTitle": "github_client.models.webhook_projects_v2_project_edited_changes_title",
+    "WebhookProjectsV2ProjectReopened": "github_client.models.webhook_projects_v2_project_reopened",
+    "WebhookProjectsV2StatusUpdateCreated": "github_client.models.webhook_projects_v2_status_update_created",
+    "WebhookProjectsV2StatusUpdateDeleted": "github_client.models.webhook_projects_v2_status_update_deleted",
+    "WebhookProjectsV2StatusUpdateEdited": "github_client.models.webhook_projects_v2_status_update_edited",
+    "WebhookProjectsV2StatusUpdateEditedChanges": "github_client.models.webhook_projects_v2_status_update_edited_changes",
+    "WebhookProjectsV2StatusUpdateEditedChangesStartDate": "github_client.models.webhook_projects_v2_status_update_edited_changes_start_date",
+    "WebhookProjectsV2StatusUpdateEditedChangesStatus": "github_client.models.webhook_projects_v2_status_update_edited_changes_status",
+    "WebhookPublic": "github_client.models.webhook_public",
+    "WebhookPullRequestAssigned": "github_client.models.webhook_pull_request_assigned",
+    "WebhookPullRequestAutoMergeDisabled": "github_client.models.webhook_pull_request_auto_merge_disabled",
+    "WebhookPullRequestAutoMergeEnabled": "github_client.models.webhook_pull_request_auto_merge_enabled",
+    "WebhookPullRequestClosed": "github_client.models.webhook_pull_request_closed",
+    "WebhookPullRequestConvertedToDraft": "github_client.models.webhook_pull_request_converted_to_draft",
+    "WebhookPullRequestDemilestoned": "github_client.models.webhook_pull_request_demilestoned",
+    "WebhookPullRequestDequeued": "github_client.models.webhook_pull_request_dequeued",
+    "WebhookPullRequestEdited": "github_client.models.webhook_pull_request_edited",
+    "WebhookPullRequestEditedChanges": "github_client.models.webhook_pull_request_edited_changes",
+    "WebhookPullRequestEditedChangesBase": "github_client.models.webhook_pull_request_edited_changes_base",
+    "WebhookPullRequestEnqueued": "github_client.models.webhook_pull_request_enqueued",
+    "WebhookPullRequestLabeled": "github_client.models.webhook_pull_request_labeled",
+    "WebhookPullRequestLocked": "github_client.models.webhook_pull_request_locked",
+    "WebhookPullRequestMilestoned": "github_client.models.webhook_pull_request_milestoned",
+    "WebhookPullRequestOpened": "github_client.models.webhook_pull_request_opened",
+    "WebhookPullRequestReadyForReview": "github_client.models.webhook_pull_request_ready_for_review",
+    "WebhookPullRequestReopened": "github_client.models.webhook_pull_request_reopened",
+    "WebhookPullRequestReviewCommentCreated": "github_client.models.webhook_pull_request_review_comment_created",
+    "WebhookPullRequestReviewCommentCreatedPullRequest": "github_client.models.webhook_pull_request_review_comment_created_pull_request",
+    "WebhookPullRequestReviewCommentCreatedPullRequestHead": "github_client.models.webhook_pull_request_review_comment_created_pull_request_head",
+    "WebhookPullRequestReviewCommentDeleted": "github_client.models.webhook_pull_request_review_comment_deleted",
+    "WebhookPullRequestReviewCommentDeletedPullRequest": "github_client.models.webhook_pull_request_review_comment_deleted_pull_request",
+    "WebhookPullRequestReviewCommentDeletedPullRequestHead": "github_client.models.webhook_pull_request_review_comment_deleted_pull_request_head",
+    "WebhookPullRequestReviewCommentEdited": "github_client.models.webhook_pull_request_review_comment_edited",
+    "WebhookPullRequestReviewCommentEditedPullRequest": "github_client.models.webhook_pull_request_review_comment_edited_pull_request",
+    "WebhookPullRequestReviewDismissed": "github_client.models.webhook_pull_request_review_dismissed",
+    "WebhookPullRequestReviewDismissedReview": "github_client.models.webhook_pull_request_review_dismissed_review",
+    "WebhookPullRequestReviewEdited": "github_client.models.webhook_pull_request_review_edited",
+    "WebhookPullRequestReviewEditedChanges": "github_client.models.webhook_pull_request_review_edited_changes",
+    "WebhookPullRequestReviewRequestRemoved": "github_client.models.webhook_pull_request_review_request_removed",
+    "WebhookPullRequestReviewRequestRemovedOneOf": "github_client.models.webhook_pull_request_review_request_removed_one_of",
+    "WebhookPullRequestReviewRequestRemovedOneOf1": "github_client.models.webhook_pull_request_review_request_removed_one_of1",
+    "WebhookPullRequestReviewRequested": "github_client.models.webhook_pull_request_review_requested",
+    "WebhookPullRequestReviewRequestedOneOf": "github_client.models.webhook_pull_request_review_requested_one_of",
+    "WebhookPullRequestReviewRequestedOneOf1": "github_client.models.webhook_pull_request_review_requested_one_of1",
+    "WebhookPullRequestReviewSubmitted": "github_client.models.webhook_pull_request_review_submitted",
+    "WebhookPullRequestReviewThreadResolved": "github_client.models.webhook_pull_request_review_thread_resolved",
+    "WebhookPullRequestReviewThreadResolvedThread": "github_client.models.webhook_pull_request_review_thread_resolved_thread",
+    "WebhookPullRequestReviewThreadUnresolved": "github_client.models.webhook_pull_request_review_thread_unresolved",
+    "WebhookPullRequestReviewThreadUnresolvedThread": "github_client.models.webhook_pull_request_review_thread_unresolved_thread",
+    "WebhookPullRequestSynchronize": "github_client.models.webhook_pull_request_synchronize",
+    "WebhookPullRequestUnassigned": "github_client.models.webhook_pull_request_unassigned",
+    "WebhookPullRequestUnlabeled": "github_client.models.webhook_pull_request_unlabeled",
+    "WebhookPullRequestUnlocked": "github_client.models.webhook_pull_request_unlocked",
+    "WebhookPush": "github_client.models.webhook_push",
+    "WebhookRegistryPackagePublished": "github_client.models.webhook_registry_package_published",
+    "WebhookRegistryPackagePublishedRegistryPackage": "github_client.models.webhook_registry_package_published_registry_package",
+    "WebhookRegistryPackagePublishedRegistryPackageOwner": "github_client.models.webhook_registry_package_published_registry_package_owner",
+    "WebhookRegistryPackagePublishedRegistryPackagePackageVersion": "github_client.models.webhook_registry_package_published_registry_package_package_version",
+    "WebhookRegistryPackagePublishedRegistryPackagePackageVersionContainerMetadata": "github_client.models.webhook_registry_package_published_registry_package_package_version_container_metadata",
+    "WebhookRegistryPackagePublishedRegistryPackagePackageVersionNpmMetadata": "github_client.models.webhook_registry_package_published_registry_package_package_version_npm_metadata",
+    "WebhookRegistryPackagePublishedRegistryPackagePackageVersionNugetMetadataInner": "github_client.models.webhook_registry_package_published_registry_package_package_version_nuget_metadata_inner",
+    "WebhookRegistryPackagePublishedRegistryPackagePackageVersionNugetMetadataInnerId": "github_client.models.webhook_registry_package_published_registry_package_package_version_nuget_metadata_inner_id",
+    "WebhookRegistryPackagePublishedRegistryPackagePackageVersionPackageFilesInner": "github_client.models.webhook_registry_package_published_registry_package_package_version_package_files_inner",
+    "WebhookRegistryPackagePublishedRegistryPackagePackageVersionRelease": "github_client.models.webhook_registry_package_published_registry_package_package_version_release",
+    "WebhookRegistryPackagePublishedRegistryPackageRegistry": "github_client.models.webhook_registry_package_published_registry_package_registry",
+    "WebhookRegistryPackageUpdated": "github_client.models.webhook_registry_package_updated",
+    "WebhookRegistryPackageUpdatedRegistryPackage": "github_client.models.webhook_registry_package_updated_registry_package",
+    "WebhookRegistryPackageUpdatedRegistryPackagePackageVersion": "github_client.models.webhook_registry_package_updated_registry_package_package_version",
+    "WebhookRegistryPackageUpdatedRegistryPackagePackageVersionDockerMetadataInner": "github_client.models.webhook_registry_package_updated_registry_package_package_version_docker_metadata_inner",
+    "WebhookRegistryPackageUpdatedRegistryPackagePackageVersionPackageFilesInner": "github_client.models.webhook_registry_package_updated_registry_package_package_version_package_files_inner",
+    "WebhookRegistryPackageUpdatedRegistryPackagePackageVersionRelease": "github_client.models.webhook_registry_package_updated_registry_package_package_version_release",
+    "WebhookReleaseCreated": "github_client.models.webhook_release_created",
+    "WebhookReleaseDeleted": "github_client.models.webhook_release_deleted",
+    "WebhookReleaseEdited": "github_client.models.webhook_release_edited",
+    "WebhookReleaseEditedChanges": "github_client.models.webhook_release_edited_changes",
+    "WebhookReleaseEditedChangesMakeLatest": "github_client.models.webhook_release_edited_changes_make_latest",
+    "WebhookReleaseEditedChangesTagName": "github_client.models.webhook_release_edited_changes_tag_name",
+    "WebhookReleasePrereleased": "github_client.models.webhook_release_prereleased",
+    "WebhookReleasePublished": "github_client.models.webhook_release_published",
+    "WebhookReleaseReleased": "github_client.models.webhook_release_released",
+    "WebhookReleaseUnpublished": "github_client.models.webhook_release_unpublished",
+    "WebhookRepositoryAdvisoryPublished": "github_client.models.webhook_repository_advisory_published",
+    "WebhookRepositoryAdvisoryReported": "github_client.models.webhook_repository_advisory_reported",
+    "WebhookRepositoryArchived": "github_client.models.webhook_repository_archived",
+    "WebhookRepositoryCreated": "github_client.models.webhook_repository_created",
+    "WebhookRepositoryDeleted": "github_client.models.webhook_repository_deleted",
+    "WebhookRepositoryDispatchSample": "github_client.models.webhook_repository_dispatch_sample",
+    "WebhookRepositoryEdited": "github_client.models.webhook_repository_edited",
+    "WebhookRepositoryEditedChanges": "github_client.models.webhook_repository_edited_changes",
+    "WebhookRepositoryEditedChangesTopics": "github_client.models.webhook_repository_edited_changes_topics",
+    "WebhookRepositoryImport": "github_client.models.webhook_repository_import",
+    "WebhookRepositoryPrivatized": "github_client.models.webhook_repository_privatized",
+    "WebhookRepositoryPublicized": "github_client.models.webhook_repository_publicized",
+    "WebhookRepositoryRenamed": "github_client.models.webhook_repository_renamed",
+    "WebhookRepositoryRenamedChanges": "github_client.models.webhook_repository_renamed_changes",
+    "WebhookRepositoryRenamedChangesRepository": "github_client.models.webhook_repository_renamed_changes_repository",
+    "WebhookRepositoryRulesetCreated": "github_client.models.webhook_repository_ruleset_created",
+    "WebhookRepositoryRulesetDeleted": "github_client.models.webhook_repository_ruleset_deleted",
+    "WebhookRepositoryRulesetEdited": "github_client.models.webhook_repository_ruleset_edited",
+    "WebhookRepositoryRulesetEditedChanges": "github_client.models.webhook_repository_ruleset_edited_changes",
+    "WebhookRepositoryRulesetEditedChangesConditions": "github_client.models.webhook_repository_ruleset_edited_changes_conditions",
+    "WebhookRepositoryRulesetEditedChangesConditionsUpdatedInner": "github_client.models.webhook_repository_ruleset_edited_changes_conditions_updated_inner",
+    "WebhookRepositoryRulesetEditedChangesConditionsUpdatedInnerChanges": "github_client.models.webhook_repository_ruleset_edited_changes_conditions_updated_inner_changes",
+    "WebhookRepositoryRulesetEditedChangesConditionsUpdatedInnerChangesInclude": "github_client.models.webhook_repository_ruleset_edited_changes_conditions_updated_inner_changes_include",
+    "WebhookRepositoryRulesetEditedChangesRules": "github_client.models.webhook_repository_ruleset_edited_changes_rules",
+    "WebhookRepositoryRulesetEditedChangesRulesUpdatedInner": "github_client.models.webhook_repository_ruleset_edited_changes_rules_updated_inner",
+    "WebhookRepositoryRulesetEditedChangesRulesUpdatedInnerChanges": "github_client.models.webhook_repository_ruleset_edited_changes_rules_updated_inner_changes",
+    "WebhookRepositoryTransferred": "github_client.models.webhook_repository_transferred",
+    "WebhookRepositoryTransferredChanges": "github_client.models.webhook_repository_transferred_changes",
+    "WebhookRepositoryTransferredChangesOwner": "github_client.models.webhook_repository_transferred_changes_owner",
+    "WebhookRepositoryTransferredChangesOwnerFrom": "github_client.models.webhook_repository_transferred_changes_owner_from",
+    "WebhookRepositoryUnarchived": "github_client.models.webhook_repository_unarchived",
+    "WebhookRepositoryVulnerabilityAlertCreate": "github_client.models.webhook_repository_vulnerability_alert_create",
+    "WebhookRepositoryVulnerabilityAlertDismiss": "github_client.models.webhook_repository_vulnerability_alert_dismiss",
+    "WebhookRepositoryVulnerabilityAlertReopen": "github_client.models.webhook_repository_vulnerability_alert_reopen",
+    "WebhookRepositoryVulnerabilityAlertResolve": "github_client.models.webhook_repository_vulnerability_alert_resolve",
+    "WebhookRubygemsMetadata": "github_client.models.webhook_rubygems_metadata",
+    "WebhookRubygemsMetadataVersionInfo": "github_client.models.webhook_rubygems_metadata_version_info",
+    "WebhookSecretScanningAlertCreated": "github_client.models.webhook_secret_scanning_alert_created",
+    "WebhookSecretScanningAlertLocationCreated": "github_client.models.webhook_secret_scanning_alert_location_created",
+    "WebhookSecretScanningAlertLocationCreatedFormEncoded": "github_client.models.webhook_secret_scanning_alert_location_created_form_encoded",
+    "WebhookSecretScanningAlertPubliclyLeaked": "github_client.models.webhook_secret_scanning_alert_publicly_leaked",
+    "WebhookSecretScanningAlertReopened": "github_client.models.webhook_secret_scanning_alert_reopened",
+    "WebhookSecretScanningAlertResolved": "github_client.models.webhook_secret_scanning_alert_resolved",
+    "WebhookSecretScanningAlertValidated": "github_client.models.webhook_secret_scanning_alert_validated",
+    "WebhookSecretScanningScanCompleted": "github_client.models.webhook_secret_scanning_scan_completed",
+    "WebhookSecurityAdvisoryPublished": "github_client.models.webhook_security_advisory_published",
+    "WebhookSecurityAdvisoryUpdated": "github_client.models.webhook_security_advisory_updated",
+    "WebhookSecurityAdvisoryWithdrawn": "github_client.models.webhook_security_advisory_withdrawn",
+    "WebhookSecurityAdvisoryWithdrawnSecurityAdvisory": "github_client.models.webhook_security_advisory_withdrawn_security_advisory",
+    "WebhookSecurityAndAnalysis": "github_client.models.webhook_security_and_analysis",
+    "WebhookSecurityAndAnalysisChanges": "github_client.models.webhook_security_and_analysis_changes",
+    "WebhookSecurityAndAnalysisChangesFrom": "github_client.models.webhook_security_and_analysis_changes_from",
+    "WebhookSponsorshipCancelled": "github_client.models.webhook_sponsorship_cancelled",
+    "WebhookSponsorshipCreated": "github_client.models.webhook_sponsorship_created",
+    "WebhookSponsorshipEdited": "github_client.models.webhook_sponsorship_edited",
+    "WebhookSponsorshipEditedChanges": "github_client.models.webhook_sponsorship_edited_changes",
+    "WebhookSponsorshipEditedChangesPrivacyLevel": "github_client.models.webhook_sponsorship_edited_changes_privacy_level",
+    "WebhookSponsorshipPendingCancellation": "github_client.models.webhook_sponsorship_pending_cancellation",
+    "WebhookSponsorshipPendingTierChange": "github_client.models.webhook_sponsorship_pending_tier_change",
+    "WebhookSponsorshipTierChanged": "github_client.models.webhook_sponsorship_tier_changed",
+    "WebhookStarCreated": "github_client.models.webhook_star_created",
+    "WebhookStarDeleted": "github_client.models.webhook_star_deleted",
+    "WebhookStatus": "github_client.models.webhook_status",
+    "WebhookStatusBranchesInner": "github_client.models.webhook_status_branches_inner",
+    "WebhookStatusBranchesInnerCommit": "github_client.models.webhook_status_branches_inner_commit",
+    "WebhookStatusCommit": "github_client.models.webhook_status_commit",
+    "WebhookStatusCommitCommit": "github_client.models.webhook_status_commit_commit",
+    "WebhookStatusCommitCommitAuthor": "github_client.models.webhook_status_commit_commit_author",
+    "WebhookStatusCommitCommitVerification": "github_client.models.webhook_status_commit_commit_verification",
+    "WebhookStatusCommitParentsInner": "github_client.models.webhook_status_commit_parents_inner",
+    "WebhookSubIssuesParentIssueAdded": "github_client.models.webhook_sub_issues_parent_issue_added",
+    "WebhookSubIssuesParentIssueRemoved": "github_client.models.webhook_sub_issues_parent_issue_removed",
+    "WebhookSubIssuesSubIssueAdded": "github_client.models.webhook_sub_issues_sub_issue_added",
+    "WebhookSubIssuesSubIssueRemoved": "github_client.models.webhook_sub_issues_sub_issue_removed",
+    "WebhookTeamAdd": "github_client.models.webhook_team_add",
+    "WebhookTeamAddedToRepository": "github_client.models.webhook_team_added_to_repository",
+    "WebhookTeamCreated": "github_client.models.webhook_team_created",
+    "WebhookTeamDeleted": "github_client.models.webhook_team_deleted",
+    "WebhookTeamEdited": "github_client.models.webhook_team_edited",
+    "WebhookTeamEditedChanges": "github_client.models.webhook_team_edited_changes",
+    "WebhookTeamEditedChangesNotificationSetting": "github_client.models.webhook_team_edited_changes_notification_setting",
+    "WebhookTeamEditedChangesPrivacy": "github_client.models.webhook_team_edited_changes_privacy",
+    "WebhookTeamEditedChangesRepository": "github_client.models.webhook_team_edited_changes_repository",
+    "WebhookTeamEditedChangesRepositoryPermissions": "github_client.models.webhook_team_edited_changes_repository_permissions",
+    "WebhookTeamEditedChangesRepositoryPermissionsFrom": "github_client.models.webhook_team_edited_changes_repository_permissions_from",
+    "WebhookTeamRemovedFromRepository": "github_client.models.webhook_team_removed_from_repository",
+    "WebhookWatchStarted": "github_client.models.webhook_watch_started",
+    "WebhookWorkflowDispatch": "github_client.models.webhook_workflow_dispatch",
+    "WebhookWorkflowJobCompleted": "github_client.models.webhook_workflow_job_completed",
+    "WebhookWorkflowJobCompletedWorkflowJob": "github_client.models.webhook_workflow_job_completed_workflow_job",
+    "WebhookWorkflowJobInProgress": "github_client.models.webhook_workflow_job_in_progress",
+    "WebhookWorkflowJobInProgressWorkflowJob": "github_client.models.webhook_workflow_job_in_progress_workflow_job",
+    "WebhookWorkflowJobQueued": "github_client.models.webhook_workflow_job_queued",
+    "WebhookWorkflowJobQueuedWorkflowJob": "github_client.models.webhook_workflow_job_queued_workflow_job",
+    "WebhookWorkflowJobWaiting": "github_client.models.webhook_workflow_job_waiting",
+    "WebhookWorkflowJobWaitingWorkflowJob": "github_client.models.webhook_workflow_job_waiting_workflow_job",
+    "WebhookWorkflowRunCompleted": "github_client.models.webhook_workflow_run_completed",
+    "WebhookWorkflowRunInProgress": "github_client.models.webhook_workflow_run_in_progress",
+    "WebhookWorkflowRunRequested": "github_client.models.webhook_workflow_run_requested",
+    "WebhooksAlert": "github_client.models.webhooks_alert",
+    "WebhooksAnswer": "github_client.models.webhooks_answer",
+    "WebhooksApprover": "github_client.models.webhooks_approver",
+    "WebhooksChanges": "github_client.models.webhooks_changes",
+    "WebhooksChanges8": "github_client.models.webhooks_changes8",
+    "WebhooksChanges8Tier": "github_client.models.webhooks_changes8_tier",
+    "WebhooksChangesBody": "github_client.models.webhooks_changes_body",
+    "WebhooksComment": "github_client.models.webhooks_comment",
+    "WebhooksDeployKey": "github_client.models.webhooks_deploy_key",
+    "WebhooksIssue": "github_client.models.webhooks_issue",
+    "WebhooksIssue2": "github_client.models.webhooks_issue2",
+    "WebhooksIssueComment": "github_client.models.webhooks_issue_comment",
+    "WebhooksIssuePullRequest": "github_client.models.webhooks_issue_pull_request",
+    "WebhooksLabel": "github_client.models.webhooks_label",
+    "WebhooksMarketplacePurchase": "github_client.models.webhooks_marketplace_purchase",
+    "WebhooksMarketplacePurchaseAccount": "github_client.models.webhooks_marketplace_purchase_account",
+    "WebhooksMarketplacePurchasePlan": "github_client.models.webhooks_marketplace_purchase_plan",
+    "WebhooksMembership": "github_client.models.webhooks_membership",
+    "WebhooksMilestone": "github_client.models.webhooks_milestone",
+    "WebhooksMilestone3": "github_client.models.webhooks_milestone3",
+    "WebhooksPreviousMarketplacePurchase": "github_client.models.webhooks_previous_marketplace_purchase",
+    "WebhooksPreviousMarketplacePurchasePlan": "github_client.models.webhooks_previous_marketplace_purchase_plan",
+    "WebhooksProject": "github_client.models.webhooks_project",
+    "WebhooksProjectCard": "github_client.models.webhooks_project_card",
+    "WebhooksProjectChanges": "github_client.models.webhooks_project_changes",
+    "WebhooksProjectChangesArchivedAt": "github_client.models.webhooks_project_changes_archived_at",
+    "WebhooksProjectColumn": "github_client.models.webhooks_project_column",
+    "WebhooksPullRequest5": "github_client.models.webhooks_pull_request5",
+    "WebhooksPullRequest5Base": "github_client.models.webhooks_pull_request5_base",
+    "WebhooksPullRequest5Links": "github_client.models.webhooks_pull_request5_links",
+    "WebhooksPullRequest5RequestedReviewersInner": "github_client.models.webhooks_pull_request5_requested_reviewers_inner",
+    "WebhooksRelease": "github_client.models.webhooks_release",
+    "WebhooksRelease1": "github_client.models.webhooks_release1",
+    "WebhooksRepositoriesInner": "github_client.models.webhooks_repositories_inner",
+    "WebhooksRepositorySelection": "github_client.models.webhooks_repository_selection",
+    "WebhooksReview": "github_client.models.webhooks_review",
+    "WebhooksReviewComment": "github_client.models.webhooks_review_comment",
+    "WebhooksReviewCommentLinks": "github_client.models.webhooks_review_comment_links",
+    "WebhooksReviewLinks": "github_client.models.webhooks_review_links",
+    "WebhooksReviewersInner": "github_client.models.webhooks_reviewers_inner",
+    "WebhooksRule": "github_client.models.webhooks_rule",
+    "WebhooksSecurityAdvisory": "github_client.models.webhooks_security_advisory",
+    "WebhooksSecurityAdvisoryCvss": "github_client.models.webhooks_security_advisory_cvss",
+    "WebhooksSecurityAdvisoryCwesInner": "github_client.models.webhooks_security_advisory_cwes_inner",
+    "WebhooksSecurityAdvisoryIdentifiersInner": "github_client.models.webhooks_security_advisory_identifiers_inner",
+    "WebhooksSecurityAdvisoryReferencesInner": "github_client.models.webhooks_security_advisory_references_inner",
+    "WebhooksSecurityAdvisoryVulnerabilitiesInner": "github_client.models.webhooks_security_advisory_vulnerabilities_inner",
+    "WebhooksSecurityAdvisoryVulnerabilitiesInnerFirstPatchedVersion": "github_client.models.webhooks_security_advisory_vulnerabilities_inner_first_patched_version",
+    "WebhooksSecurityAdvisoryVulnerabilitiesInnerPackage": "github_client.models.webhooks_security_advisory_vulnerabilities_inner_package",
+    "WebhooksSponsorship": "github_client.models.webhooks_sponsorship",
+    "WebhooksSponsorshipMaintainer": "github_client.models.webhooks_sponsorship_maintainer",
+    "WebhooksTeam": "github_client.models.webhooks_team",
+    "WebhooksTeam1": "github_client.models.webhooks_team1",
+    "WebhooksTeamParent": "github_client.models.webhooks_team_parent",
+    "WebhooksUser": "github_client.models.webhooks_user",
+    "WebhooksUserMannequin": "github_client.models.webhooks_user_mannequin",
+    "WebhooksWorkflow": "github_client.models.webhooks_workflow",
+    "WebhooksWorkflowJobRun": "github_client.models.webhooks_workflow_job_run",
+    "Workflow": "github_client.models.workflow",
+    "WorkflowRun": "github_client.models.workflow_run",
+    "WorkflowRun1": "github_client.models.workflow_run1",
+    "WorkflowRun2": "github_client.models.workflow_run2",
+    "WorkflowRun2PullRequestsInner": "github_client.models.workflow_run2_pull_requests_inner",
+    "WorkflowRunPullRequestsInner": "github_client.models.workflow_run_pull_requests_inner",
+    "WorkflowRunUsage": "github_client.models.workflow_run_usage",
+    "WorkflowRunUsageBillable": "github_client.models.workflow_run_usage_billable",
+    "WorkflowRunUsageBillableUBUNTU": "github_client.models.workflow_run_usage_billable_ubuntu",
+    "WorkflowRunUsageBillableUBUNTUJobRunsInner": "github_client.models.workflow_run_usage_billable_ubuntu_job_runs_inner",
+    "WorkflowStep": "github_client.models.workflow_step",
+    "WorkflowStep1": "github_client.models.workflow_step1",
+    "WorkflowStep2": "github_client.models.workflow_step2",
+    "WorkflowStep3": "github_client.models.workflow_step3",
+    "WorkflowStep4": "github_client.models.workflow_step4",
+    "WorkflowUsage": "github_client.models.workflow_usage",
+    "WorkflowUsageBillable": "github_client.models.workflow_usage_billable",
+    "WorkflowUsageBillableUBUNTU": "github_client.models.workflow_usage_billable_ubuntu",
+}
+
+
+def __getattr__(name: str):
+    # Das Modul wird erst beim ersten Zugriff importiert und das Ergebnis im Paket zwischengespeichert
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        # Untermodule (z.B. models.issue) bleiben wie bisher als Attribut erreichbar
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
@@ -13,6 +13,9 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import importlib
+from typing import TYPE_CHECKING
+
 
 __version__ = "1.0.0"
 
@@ -46,13 +49,14 @@ __all__ = [
 ]
 
 # import apis into sdk package
-from invman_client.api.business_partners_api import BusinessPartnersApi as BusinessPartnersApi
-from invman_client.api.contact_persons_api import ContactPersonsApi as ContactPersonsApi
-from invman_client.api.files_api import FilesApi as FilesApi
-from invman_client.api.invoice_positions_api import InvoicePositionsApi as InvoicePositionsApi
-from invman_client.api.invoice_templates_api import InvoiceTemplatesApi as InvoiceTemplatesApi
-from invman_client.api.invoices_api import InvoicesApi as InvoicesApi
-from invman_client.api.sales_taxes_api import SalesTaxesApi as SalesTaxesApi
+if TYPE_CHECKING:
+    from invman_client.api.business_partners_api import BusinessPartnersApi as BusinessPartnersApi
+    from invman_client.api.contact_persons_api import ContactPersonsApi as ContactPersonsApi
+    from invman_client.api.files_api import FilesApi as FilesApi
+    from invman_client.api.invoice_positions_api import InvoicePositionsApi as InvoicePositionsApi
+    from invman_client.api.invoice_templates_api import InvoiceTemplatesApi as InvoiceTemplatesApi
+    from invman_client.api.invoices_api import InvoicesApi as InvoicesApi
+    from invman_client.api.sales_taxes_api import SalesTaxesApi as SalesTaxesApi
 
 # import ApiClient
 from invman_client.api_response import ApiResponse as ApiResponse
@@ -66,13 +70,53 @@ from invman_client.exceptions import ApiAttributeError as ApiAttributeError
 from invman_client.exceptions import ApiException as ApiException
 
 # import models into sdk package
-from invman_client.models.address import Address as Address
-from invman_client.models.business_partner import BusinessPartner as BusinessPartner
-from invman_client.models.contact_person import ContactPerson as ContactPerson
-from invman_client.models.download_file import DownloadFile as DownloadFile
-from invman_client.models.error import Error as Error
-from invman_client.models.invoice import Invoice as Invoice
-from invman_client.models.invoice_position import InvoicePosition as InvoicePosition
-from invman_client.models.invoice_template import InvoiceTemplate as InvoiceTemplate
-from invman_client.models.sales_tax import SalesTax as SalesTax
+if TYPE_CHECKING:
+    from invman_client.models.address import Address as Address
+    from invman_client.models.business_partner import BusinessPartner as BusinessPartner
+    from invman_client.models.contact_person import ContactPerson as ContactPerson
+    from invman_client.models.download_file import DownloadFile as DownloadFile
+    from invman_client.models.error import Error as Error
+    from invman_client.models.invoice import Invoice as Invoice
+    from invman_client.models.invoice_position import InvoicePosition as InvoicePosition
+    from invman_client.models.invoice_template import InvoiceTemplate as InvoiceTemplate
+    from invman_client.models.sales_tax import SalesTax as SalesTax
+
+# APIs und Modelle werden erst beim ersten Zugriff importiert, statt beim Start alle Modelle zu laden
+_lazy_imports = {
+    "BusinessPartnersApi": "invman_client.api.business_partners_api",
+    "ContactPersonsApi": "invman_client.api.contact_persons_api",
+    "FilesApi": "invman_client.api.files_api",
+    "InvoicePositionsApi": "invman_client.api.invoice_positions_api",
+    "InvoiceTemplatesApi": "invman_client.api.invoice_templates_api",
+    "InvoicesApi": "invman_client.api.invoices_api",
+    "SalesTaxesApi": "invman_client.api.sales_taxes_api",
+    "Address": "invman_client.models.address",
+    "BusinessPartner": "invman_client.models.business_partner",
+    "ContactPerson": "invman_client.models.contact_person",
+    "DownloadFile": "invman_client.models.download_file",
+    "Error": "invman_client.models.error",
+    "Invoice": "invman_client.models.invoice",
+    "InvoicePosition": "invman_client.models.invoice_position",
+    "InvoiceTemplate": "invman_client.models.invoice_template",
+    "SalesTax": "invman_client.models.sales_tax",
+}
+
+
+def __getattr__(name: str):
+    # Das Modul wird erst beim ersten Zugriff importiert und das Ergebnis im Paket zwischengespeichert
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        # Untermodule (z.B. models.issue) bleiben wie bisher als Attribut erreichbar
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
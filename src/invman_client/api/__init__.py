@@ -1,11 +1,45 @@
 # flake8: noqa
 
+import importlib
+from typing import TYPE_CHECKING
+
 # import apis into api package
-from invman_client.api.business_partners_api import BusinessPartnersApi
-from invman_client.api.contact_persons_api import ContactPersonsApi
-from invman_client.api.files_api import FilesApi
-from invman_client.api.invoice_positions_api import InvoicePositionsApi
-from invman_client.api.invoice_templates_api import InvoiceTemplatesApi
-from invman_client.api.invoices_api import InvoicesApi
-from invman_client.api.sales_taxes_api import SalesTaxesApi
+if TYPE_CHECKING:
+    from invman_client.api.business_partners_api import BusinessPartnersApi
+    from invman_client.api.contact_persons_api import ContactPersonsApi
+    from invman_client.api.files_api import FilesApi
+    from invman_client.api.invoice_positions_api import InvoicePositionsApi
+    from invman_client.api.invoice_templates_api import InvoiceTemplatesApi
+    from invman_client.api.invoices_api import InvoicesApi
+    from invman_client.api.sales_taxes_api import SalesTaxesApi
+
+# APIs werden erst beim ersten Zugriff importiert
+_lazy_imports = {
+    "BusinessPartnersApi": "invman_client.api.business_partners_api",
+    "ContactPersonsApi": "invman_client.api.contact_persons_api",
+    "FilesApi": "invman_client.api.files_api",
+    "InvoicePositionsApi": "invman_client.api.invoice_positions_api",
+    "InvoiceTemplatesApi": "invman_client.api.invoice_templates_api",
+    "InvoicesApi": "invman_client.api.invoices_api",
+    "SalesTaxesApi": "invman_client.api.sales_taxes_api",
+}
+
+
+def __getattr__(name: str):
+    # Das Modul wird erst beim ersten Zugriff importiert und das Ergebnis im Paket zwischengespeichert
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        # Untermodule (z.B. models.issue) bleiben wie bisher als Attribut erreichbar
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -22,7 +22,7 @@ from typing_extensions import Annotated
 from invman_client.models.business_partner import BusinessPartner
 from invman_client.models.contact_person import ContactPerson
 
-from invman_client.api_client import ApiClient, RequestSerialized
+from invman_client.api_client import ApiClient, RequestSerialized, validate_call
 from invman_client.api_response import ApiResponse
 from invman_client.rest import RESTResponseType
 
@@ -12,7 +12,7 @@
 """  # noqa: E501
 
 import warnings
-from pydantic import validate_call, Field, StrictFloat, StrictStr, StrictInt
+from pydantic import Field, StrictFloat, StrictStr, StrictInt
 from typing import Any, Dict, List, Optional, Tuple, Union
 from typing_extensions import Annotated
 
@@ -21,7 +21,7 @@ from typing import Optional, Tuple, Union
 from typing_extensions import Annotated
 from invman_client.models.download_file import DownloadFile
 
-from invman_client.api_client import ApiClient, RequestSerialized
+from invman_client.api_client import ApiClient, RequestSerialized, validate_call
 from invman_client.api_response import ApiResponse
 from invman_client.rest import RESTResponseType
 
@@ -12,14 +12,50 @@
     Do not edit the class manually.
 """  # noqa: E501
 
+import importlib
+from typing import TYPE_CHECKING
+
 # import models into model package
-from invman_client.models.address import Address
-from invman_client.models.business_partner import BusinessPartner
-from invman_client.models.contact_person import ContactPerson
-from invman_client.models.download_file import DownloadFile
-from invman_client.models.error import Error
-from invman_client.models.invoice import Invoice
-from invman_client.models.invoice_position import InvoicePosition
-from invman_client.models.invoice_template import InvoiceTemplate
-from invman_client.models.sales_tax import SalesTax
+if TYPE_CHECKING:
+    from invman_client.models.address import Address
+    from invman_client.models.business_partner import BusinessPartner
+    from invman_client.models.contact_person import ContactPerson
+    from invman_client.models.download_file import DownloadFile
+    from invman_client.models.error import Error
+    from invman_client.models.invoice import Invoice
+    from invman_client.models.invoice_position import InvoicePosition
+    from invman_client.models.invoice_template import InvoiceTemplate
+    from invman_client.models.sales_tax import SalesTax
+
+# Modelle werden erst beim ersten Zugriff importiert, z.B. wenn ApiClient einen Antworttyp auflöst
+_lazy_imports = {
+    "Address": "invman_client.models.address",
+    "BusinessPartner": "invman_client.models.business_partner",
+    "ContactPerson": "invman_client.models.contact_person",
+    "DownloadFile": "invman_client.models.download_file",
+    "Error": "invman_client.models.error",
+    "Invoice": "invman_client.models.invoice",
+    "InvoicePosition": "invman_client.models.invoice_position",
+    "InvoiceTemplate": "invman_client.models.invoice_template",
+    "SalesTax": "invman_client.models.sales_tax",
+}
+
+
+def __getattr__(name: str):
+    # Das Modul wird erst beim ersten Zugriff importiert und das Ergebnis im Paket zwischengespeichert
+    module_name = _lazy_imports.get(name)
+    if module_name is None:
+        # Untermodule (z.B. models.issue) bleiben wie bisher als Attribut erreichbar
+        try:
+            return importlib.import_module(f"{__name__}.{name}")
+        except ModuleNotFoundError as e:
+            if e.name != f"{__name__}.{name}":
+                raise
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
 
+def __dir__():
+    return sorted(set(globals()) | set(_lazy_imports))
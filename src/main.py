@@ -1,9 +1,22 @@
+import os
+
+import anyio
+
 from server import mcp
+from src.tool_registry import register_tool_modules
+from src.upstream_clients import shutdown
+
+# Aktivierte Integrationen (github, discord, eve, invman), z.B. TOOL_MODULES=github,invman
+register_tool_modules(mcp, os.environ.get("TOOL_MODULES", "invman").split(","))
+
+
+async def serve():
+    try:
+        await mcp.run_streamable_http_async()
+    finally:
+        # Die Sessions schließen nur die Clients, der gemeinsame Transport lebt so lange wie der Prozess
+        await shutdown()
 
-# import stage1b.github_tools
-# import stage1b.discord_tools
-# import stage1b.eve_tools
-import stage1b.invman_tools
 
 if __name__ == "__main__":
-    mcp.run(transport="streamable-http")
+    anyio.run(serve)
@@ -0,0 +1,596 @@
+import ast
+import datetime
+import decimal
+import functools
+import importlib
+import inspect
+import re
+import textwrap
+import typing
+import uuid
+from enum import Enum
+from typing import Callable, Dict, List, Optional, Tuple
+
+import pydantic
+from pydantic import SecretStr
+
+from src.passthrough import RawJson, passthrough_active, projection_fields
+
+JSON_MIME_PATTERN = r'^application/(json|[\w!#$&.+\-^_]+\+json)\s*(;|$)'
+
+# Wie ApiClient.PRIMITIVE_TYPES der generierten Pakete
+PRIMITIVE_TYPES = (float, bool, bytes, str, int)
+
+# Klasse je generiertem Modell für den schnellen Weg, siehe _json_model
+_json_models: Dict[type, object] = {}
+_BUILDING = object()
+
+# Codec je generiertem Paket, siehe ModelCodec.for_client
+_codecs: Dict[str, "ModelCodec"] = {}
+
+
+def _from_dict_validator(model_class):
+    """Deserialisiert den Wert über das from_dict des Modells, wie es das from_dict des umgebenden Modells tut"""
+    def validate(value):
+        return None if value is None else model_class.from_dict(value)
+    return pydantic.AfterValidator(validate)
+
+
+def _default_validator(default):
+    """Ersetzt null durch den Defaultwert, wie from_dict"""
+    return pydantic.BeforeValidator(lambda value: default if value is None else value)
+
+
+def _json_annotation(annotation):
+    """Annotation, in der jedes Modell durch seine Klasse für den schnellen Weg ersetzt ist"""
+    if isinstance(annotation, (str, typing.ForwardRef)):
+        raise TypeError(f"Unresolved reference {annotation!r}")
+    if isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+        fields = annotation.model_fields
+        if "actual_instance" in fields or "additional_properties" in fields:
+            # oneOf/anyOf-Wrapper und Modelle mit additional_properties bringen ihre eigene Logik in from_dict mit
+            return typing.Annotated[typing.Any, _from_dict_validator(annotation)]
+        return _json_model(annotation)
+    origin = typing.get_origin(annotation)
+    if origin is None or origin is typing.Literal:
+        return annotation
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        inner = _json_annotation(args[0])
+        return annotation if inner is args[0] else typing.Annotated[(inner, *annotation.__metadata__)]
+    json_args = tuple(_json_annotation(arg) for arg in args)
+    if all(json_arg is arg for json_arg, arg in zip(json_args, args)):
+        return annotation
+    return typing.Union[json_args] if origin is typing.Union else origin[json_args]
+
+
+def _restore_model(model_class: type, state: dict):
+    model = model_class.__new__(model_class)
+    model.__setstate__(state)
+    return model
+
+
+def _reduce_to_base(model):
+    """Pickelt eine Instanz der Unterklasse aus _json_model als Instanz des generierten Modells.
+
+    Die Unterklasse trägt Name und Modul des Modells, ist darunter aber nicht importierbar. Für den Empfänger
+    (z.B. den Prozess-Pool von sanitize_output) sind beide gleich, die Felder sind dieselben.
+    """
+    return _restore_model, (type(model).__bases__[0], model.__getstate__())
+
+
+def _json_model(model_class: type) -> type:
+    """Klasse, mit der pydantic das Modell direkt aus JSON so validiert wie from_dict.
+
+    Ist from_dict nur model_validate mit denselben Feldern, ist das model_class selbst. Sonst wird einmal eine
+    gleichnamige Unterklasse gebaut, in der oneOf/anyOf-Wrapper über ihr from_dict deserialisiert werden, null
+    durch den Defaultwert ersetzt wird und fehlende nullable Pflichtfelder None sind. Gepickelt werden ihre
+    Instanzen als model_class.
+    """
+    json_model = _json_models.get(model_class)
+    if json_model is _BUILDING:
+        # Rekursive Modelle bleiben beim Weg über from_dict
+        raise TypeError(f"{model_class.__name__} is recursive")
+    if json_model is None:
+        _json_models[model_class] = _BUILDING
+        try:
+            overrides = {}
+            for name, field in model_class.model_fields.items():
+                annotation = _json_annotation(field.annotation)
+                default = field.default
+                if not field.is_required() and default is not None:
+                    annotation = typing.Annotated[annotation, _default_validator(default)]
+                elif field.is_required() and type(None) in typing.get_args(field.annotation):
+                    default = None
+                if annotation is not field.annotation or default is not field.default:
+                    if field.metadata:
+                        annotation = typing.Annotated[(annotation, *field.metadata)]
+                    overrides[name] = (annotation, pydantic.Field(default, alias=field.alias))
+            json_model = model_class
+            if overrides:
+                json_model = pydantic.create_model(model_class.__name__, __base__=model_class,
+                                                   __module__=model_class.__module__, **overrides)
+                json_model.__reduce__ = _reduce_to_base
+        finally:
+            del _json_models[model_class]
+        _json_models[model_class] = json_model
+    return json_model
+
+
+def _projection_tree(fields: Tuple[str, ...]) -> dict:
+    """Felder wie ("title", "user.login") als Baum {"title": None, "user": {"login": None}}, None = das ganze Feld"""
+    tree = {}
+    for path in fields:
+        *parents, leaf = path.split(".")
+        node = tree
+        for name in parents:
+            child = node.setdefault(name, {})
+            if child is None:
+                # Das ganze Feld ist schon gewählt
+                break
+            node = child
+        else:
+            node[leaf] = None
+    return tree
+
+
+def _projected_annotation(annotation, tree: dict):
+    """Annotation, in der jedes Modell durch seine Projektion auf tree ersetzt ist"""
+    if isinstance(annotation, type) and issubclass(annotation, pydantic.BaseModel):
+        return _projected_model(annotation, tree)
+    origin = typing.get_origin(annotation)
+    if origin is None or origin is typing.Literal:
+        return annotation
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        inner = _projected_annotation(args[0], tree)
+        return annotation if inner is args[0] else typing.Annotated[(inner, *annotation.__metadata__)]
+    projected_args = tuple(_projected_annotation(arg, tree) for arg in args)
+    if all(projected_arg is arg for projected_arg, arg in zip(projected_args, args)):
+        return annotation
+    return typing.Union[projected_args] if origin is typing.Union else origin[projected_args]
+
+
+def _projected_model(model_class: type, tree: dict) -> type:
+    """Gleichnamiges Modell nur mit den Feldern aus tree, gebaut aus der Klasse für den schnellen Weg.
+
+    Die Felder stehen in der Reihenfolge des Modells. Die Validatoren der Klasse (Enums, Patterns) übernimmt
+    es nicht, die Projektion ist nur für die Ausgabe gedacht.
+    """
+    fields = model_class.model_fields
+    unknown = [name for name in tree if name not in fields]
+    if unknown:
+        raise ValueError(f"{model_class.__name__} has no field {', '.join(map(repr, unknown))}")
+    definitions = {}
+    for name, field in fields.items():
+        if name not in tree:
+            continue
+        subtree = tree[name]
+        annotation = field.annotation
+        if subtree is not None:
+            annotation = _projected_annotation(annotation, subtree)
+            if annotation is field.annotation:
+                raise ValueError(f"Field {name!r} of {model_class.__name__} has no fields to select")
+        if field.metadata:
+            annotation = typing.Annotated[(annotation, *field.metadata)]
+        definitions[name] = (annotation, pydantic.Field(field.default, alias=field.alias))
+    return pydantic.create_model(model_class.__name__, __config__=model_class.model_config,
+                                 __module__=model_class.__module__, **definitions)
+
+
+class _SerializationPlan(typing.NamedTuple):
+    """Wie serialize ein Modell serialisiert, siehe _serialization_plan"""
+    # Felder, die model_dump(mode="json") auslässt: die in to_dict ausgeschlossenen, die aus overrides und die aus python
+    exclude: Optional[frozenset]
+    # (Feld, Key, leere Werte schreiben) mit Modellen, die to_dict anders als model_dump serialisiert, z.B. oneOf-Wrapper
+    overrides: Tuple[Tuple[str, str, bool], ...]
+    # (Feld, Key) der nullable Felder, die to_dict als null schreibt, wenn sie explizit auf None gesetzt sind
+    nullable: Tuple[Tuple[str, str], ...]
+    # Felder, die wie in to_dict über model_dump im Python-Modus laufen, z.B. datetime ("+00:00" statt "Z") oder Any
+    python: Optional[frozenset]
+
+
+# Plan je Modellklasse, None = Weg über to_dict
+_serialization_plans: Dict[type, Optional[_SerializationPlan]] = {}
+
+# Die Anweisungen, die der Generator in to_dict schreibt. Ein Plan entsteht nur, wenn to_dict genau daraus besteht.
+_TO_DICT_DUMP = """
+_dict = self.model_dump(
+    by_alias=True,
+    exclude=excluded_fields,
+    exclude_none=True,
+)
+"""
+_TO_DICT_STATEMENTS = {
+    "model": """
+if self.{name}:
+    _dict[{key!r}] = self.{name}.to_dict()
+""",
+    "list": """
+_items = []
+if self.{name}:
+    for _item_{name} in self.{name}:
+        if _item_{name}:
+            _items.append(_item_{name}.to_dict())
+    _dict[{key!r}] = _items
+""",
+    "dict": """
+_field_dict = {{}}
+if self.{name}:
+    for _key_{name} in self.{name}:
+        if self.{name}[_key_{name}]:
+            _field_dict[_key_{name}] = self.{name}[_key_{name}].to_dict()
+    _dict[{key!r}] = _field_dict
+""",
+    "nullable": """
+if self.{name} is None and "{name}" in self.model_fields_set:
+    _dict[{key!r}] = None
+""",
+}
+
+# Typen, die model_dump(mode="json") genauso schreibt wie sanitize_for_serialization
+_JSON_TYPES = (str, int, float, bool, type(None), Enum, uuid.UUID, decimal.Decimal)
+
+
+def _statements(source: str) -> List[str]:
+    return [ast.dump(statement) for statement in ast.parse(textwrap.dedent(source)).body]
+
+
+def _to_dict_statements(model_class: type) -> Optional[Dict[str, List[Tuple[str, str]]]]:
+    """(Art, Feld) je Anweisung des generierten to_dict, None, wenn to_dict nicht genau dem Muster des Generators folgt"""
+    function = ast.parse(textwrap.dedent(inspect.getsource(model_class.to_dict))).body[0]
+    body = function.body
+    if not isinstance(function, ast.FunctionDef) or function.name != "to_dict":
+        return None
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant):
+        body = body[1:]
+    # excluded_fields: Set[str] = set([...]) mit Feldnamen als Strings
+    if len(body) < 3 or not isinstance(body[0], ast.AnnAssign) or ast.unparse(body[0].target) != "excluded_fields" \
+            or ast.unparse(body[0].annotation) != "Set[str]":
+        return None
+    value = body[0].value
+    if not (isinstance(value, ast.Call) and ast.unparse(value.func) == "set" and len(value.args) == 1 and not value.keywords
+            and isinstance(value.args[0], ast.List)
+            and all(isinstance(item, ast.Constant) and isinstance(item.value, str) for item in value.args[0].elts)):
+        return None
+    statements = {"excluded": [(item.value, item.value) for item in value.args[0].elts]}
+    if [ast.dump(body[1])] != _statements(_TO_DICT_DUMP) or ast.dump(body[-1]) != ast.dump(ast.parse("return _dict").body[0]):
+        return None
+    fields = model_class.model_fields
+    position, end = 2, len(body) - 1
+    while position < end:
+        # Das Feld steht als erstes self.<Feld> in der Anweisung, die Vorlage dazu muss dann genau passen
+        names = [node.attr for statement in body[position:position + 2] for node in ast.walk(statement)
+                 if isinstance(node, ast.Attribute) and isinstance(node.value, ast.Name) and node.value.id == "self"
+                 and node.attr in fields]
+        if not names:
+            return None
+        name = names[0]
+        key = fields[name].alias or name
+        for kind, template in _TO_DICT_STATEMENTS.items():
+            expected = _statements(template.format(name=name, key=key))
+            if [ast.dump(statement) for statement in body[position:position + len(expected)]] == expected:
+                statements.setdefault(kind, []).append((name, key))
+                position += len(expected)
+                break
+        else:
+            return None
+    return statements
+
+
+def _annotation_types(annotation) -> set:
+    """Alle Typen in einer Annotation, z.B. {RichEmbed, NoneType} aus Optional[List[RichEmbed]]"""
+    origin = typing.get_origin(annotation)
+    if origin is None:
+        return {annotation}
+    args = typing.get_args(annotation)
+    if origin is typing.Literal:
+        return {type(arg) for arg in args}
+    if origin is typing.Annotated:
+        return _annotation_types(args[0])
+    types = set()
+    for arg in args:
+        types |= _annotation_types(arg)
+    return types
+
+
+def _container(annotation):
+    """list, dict oder None für das, was ein Feld ohne Optional und Annotated enthält"""
+    origin = typing.get_origin(annotation)
+    if origin is typing.Annotated:
+        return _container(typing.get_args(annotation)[0])
+    if origin is typing.Union:
+        containers = {_container(arg) for arg in typing.get_args(annotation) if arg is not type(None)}
+        return containers.pop() if len(containers) == 1 else object
+    return origin if origin in (list, dict) else None
+
+
+def _optional_items(annotation) -> bool:
+    """Ob Listen oder Dicts in der Annotation None-Einträge zulassen, die to_dict auslassen würde"""
+    origin = typing.get_origin(annotation)
+    if origin is None or origin is typing.Literal:
+        return False
+    args = typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return _optional_items(args[0])
+    if origin in (list, dict) and args:
+        item = args[-1]
+        while typing.get_origin(item) is typing.Annotated:
+            item = typing.get_args(item)[0]
+        if typing.get_origin(item) is typing.Union and type(None) in typing.get_args(item):
+            return True
+    return any(_optional_items(arg) for arg in args)
+
+
+def _serialization_plan(model_class: type) -> Optional[_SerializationPlan]:
+    """Plan, mit dem ein Modell über ein model_dump(mode="json") genauso serialisiert wird wie über to_dict.
+
+    Welche Felder to_dict ausschließt, als null schreibt oder über to_dict der Untermodelle serialisiert, steht nur in
+    seinem Quelltext. Der wird einmal je Klasse geparst und Anweisung für Anweisung mit den Vorlagen des Generators
+    verglichen, weicht to_dict davon ab, gibt es keinen Plan. Felder mit Modellen, die selbst einen Plan mit
+    Abweichungen oder gar keinen haben, serialisiert serialize einzeln. None für oneOf/anyOf-Wrapper, Modelle mit
+    additional_properties und alles Unerwartete.
+    """
+    try:
+        return _serialization_plans[model_class]
+    except KeyError:
+        pass
+    # Bis der Plan steht, gelten rekursive Verweise auf die Klasse als Felder für overrides
+    _serialization_plans[model_class] = None
+    plan = None
+    try:
+        plan = _build_serialization_plan(model_class)
+    except Exception:
+        plan = None
+    _serialization_plans[model_class] = plan
+    return plan
+
+
+def _build_serialization_plan(model_class: type) -> Optional[_SerializationPlan]:
+    fields = model_class.model_fields
+    if "actual_instance" in fields or "additional_properties" in fields:
+        return None
+    statements = _to_dict_statements(model_class)
+    if statements is None:
+        return None
+    exclude = {name for name, _ in statements["excluded"]}
+    kinds = {name: kind for kind in ("model", "list", "dict") for name, _ in statements.get(kind, [])}
+    overrides, python = [], set()
+    for name, field in fields.items():
+        types = _annotation_types(field.annotation)
+        if any(not isinstance(t, type) for t in types):
+            # ForwardRefs sind nicht auflösbar
+            return None
+        models = [t for t in types if issubclass(t, pydantic.BaseModel)]
+        if name in kinds:
+            if not models or {"model": None, "list": list, "dict": dict}[kinds[name]] is not _container(field.annotation) \
+                    or _optional_items(field.annotation):
+                return None
+            plans = [_serialization_plan(model) for model in models]
+            if name in exclude:
+                # Ausgeschlossene Felder (readOnly) schreibt to_dict über den Override trotzdem, aber nur wenn nicht leer
+                overrides.append((name, field.alias or name, False))
+            elif any(plan is None or plan.exclude or plan.nullable for plan in plans) or len(models) < len(types - {type(None)}):
+                overrides.append((name, field.alias or name, True))
+        elif name not in exclude and (models or any(not issubclass(t, _JSON_TYPES) or issubclass(t, datetime.datetime) for t in types)):
+            # Ohne eigene Anweisung in to_dict bleibt es beim model_dump im Python-Modus, ebenso für datetime,
+            # SecretStr, bytes oder Any, die model_dump(mode="json") anders schreiben würde
+            python.add(name)
+    exclude |= {name for name, _, _ in overrides} | python
+    return _SerializationPlan(frozenset(exclude) or None, tuple(overrides), tuple(statements.get("nullable", [])),
+                              frozenset(python) or None)
+
+
+def _deserialize_primitive(data, klass):
+    """Wie ApiClient.__deserialize_primitive"""
+    try:
+        return klass(data)
+    except UnicodeEncodeError:
+        return str(data)
+    except TypeError:
+        return data
+
+
+def serialize(obj):
+    """Wie ApiClient.sanitize_for_serialization, mit der Funktion aus _serializer für die Klasse von obj"""
+    return _serializer(type(obj))(obj)
+
+
+@functools.lru_cache(maxsize=512)
+def _serializer(cls: type) -> Callable:
+    """Wählt einmal je Klasse die Funktion obj -> JSON-Wert, statt für jedes Objekt die isinstance-Kette zu durchlaufen.
+
+    Generierte Modelle mit Plan (siehe _serialization_plan) serialisiert ein model_dump(mode="json") samt
+    Unterobjekten, ohne den Umweg über to_dict und ein zweites Durchlaufen des Ergebnisses.
+    """
+    if cls is type(None):
+        return lambda obj: None
+    elif issubclass(cls, Enum):
+        return lambda obj: obj.value
+    elif issubclass(cls, SecretStr):
+        return lambda obj: obj.get_secret_value()
+    elif issubclass(cls, PRIMITIVE_TYPES):
+        return lambda obj: obj
+    elif issubclass(cls, uuid.UUID):
+        return lambda obj: str(obj)
+    elif issubclass(cls, list):
+        return lambda obj: [serialize(sub_obj) for sub_obj in obj]
+    elif issubclass(cls, tuple):
+        return lambda obj: tuple(serialize(sub_obj) for sub_obj in obj)
+    elif issubclass(cls, (datetime.datetime, datetime.date)):
+        return lambda obj: obj.isoformat()
+    elif issubclass(cls, decimal.Decimal):
+        return lambda obj: str(obj)
+    elif issubclass(cls, dict):
+        return lambda obj: {key: serialize(val) for key, val in obj.items()}
+
+    if issubclass(cls, pydantic.BaseModel) and "actual_instance" in cls.model_fields:
+        # oneOf/anyOf-Wrapper: to_dict liefert nur die Serialisierung des Inhalts
+        return lambda obj: serialize(obj.actual_instance)
+
+    plan = _serialization_plan(cls) if issubclass(cls, pydantic.BaseModel) else None
+    if plan is not None:
+        exclude, overrides, nullable, python = plan
+
+        def serialize_model(obj):
+            obj_dict = obj.model_dump(mode="json", by_alias=True, exclude=exclude, exclude_none=True)
+            if python is not None:
+                for key, value in obj.model_dump(by_alias=True, include=python, exclude_none=True).items():
+                    obj_dict[key] = serialize(value)
+            values = obj.__dict__
+            for name, key, keep_empty in overrides:
+                value = values[name]
+                if value or (keep_empty and value is not None):
+                    obj_dict[key] = serialize(value)
+            for name, key in nullable:
+                if values[name] is None and name in obj.model_fields_set:
+                    obj_dict[key] = None
+            return obj_dict
+        return serialize_model
+
+    def serialize_object(obj):
+        # Wie im generierten Code: to_dict des Modells, sonst __dict__
+        if hasattr(obj, 'to_dict') and callable(getattr(obj, 'to_dict')):
+            obj_dict = obj.to_dict()
+        else:
+            obj_dict = obj.__dict__
+        if isinstance(obj_dict, list):
+            # Wrapper, die erst durch to_dict zur Liste werden
+            return serialize(obj_dict)
+        return {key: serialize(val) for key, val in obj_dict.items()}
+    return serialize_object
+
+
+class ModelCodec:
+    """Schnellere Wege für Antwort- und Request-Bodies eines generierten Pakets, eingehängt über Configuration.codec.
+
+    - decode: JSON-Bytes einer Antwort direkt mit pydantic validieren statt json.loads und from_dict,
+      mit passthrough als RawJson und mit projection nur die gewählten Felder
+    - deserialize: Typnamen wie "List[Issue]" einmal übersetzen statt für jedes Element
+    - serialize: Funktion je Klasse statt isinstance-Kette und to_dict
+
+    Die Ergebnisse sind dieselben wie über den generierten Code, wo ein schneller Weg nicht passt, geht es dorthin zurück.
+    """
+
+    def __init__(self, models, native_types: Dict[str, type]):
+        # models: das models-Paket, dessen __getattr__ nur das Modul des angefragten Modells importiert
+        self.models = models
+        self.native_types = native_types
+        # Antworttypen, die direkt aus den JSON-Bytes validiert werden, samt TypeAdapter (None = Weg über from_dict)
+        self._json_adapters: Dict[str, Optional[pydantic.TypeAdapter]] = {}
+        self._projected_adapter = functools.lru_cache(maxsize=128)(self._build_projected_adapter)
+        self._deserializer = functools.lru_cache(maxsize=512)(self._compile_deserializer)
+
+    @classmethod
+    def for_client(cls, api_client_class: type) -> "ModelCodec":
+        """Codec für das Paket von api_client_class, einer je Paket, damit die gebauten Adapter erhalten bleiben"""
+        package = api_client_class.__module__.rpartition(".")[0]
+        codec = _codecs.get(package)
+        if codec is None:
+            codec = _codecs[package] = cls(importlib.import_module(f"{package}.models"), api_client_class.NATIVE_TYPES_MAPPING)
+        return codec
+
+    def decode(self, data: bytes, response_type: str, content_type: Optional[str], encoding: str):
+        """Body einer erfolgreichen Antwort ohne Umweg über str, NotImplemented wenn es beim generierten Weg bleibt"""
+        if not data or encoding.lower() not in ("utf-8", "utf8") or \
+                (content_type is not None and not re.match(JSON_MIME_PATTERN, content_type, re.IGNORECASE)):
+            return NotImplemented
+        fields = projection_fields()
+        if fields is None and passthrough_active():
+            # Passthrough: die Bytes gehen unverändert an den Aufrufer, ohne Modelle zu bauen
+            return RawJson(data, response_type)
+        # Mit Projektion nur die gewählten Felder, die übrigen werden nie zu Python-Objekten
+        adapter = self._projected_adapter(response_type, fields) if fields else None
+        if adapter is None:
+            adapter = self._json_adapter(response_type)
+        if adapter is None:
+            return NotImplemented
+        try:
+            return adapter.validate_json(data)
+        except pydantic.ValidationError:
+            # z.B. null als Listeneintrag, das der generierte Weg als None durchlässt
+            return NotImplemented
+
+    def deserialize(self, data, klass: str, deserialize_class: Callable):
+        """data (nicht None) zum Typnamen klass; deserialize_class(data, Klasse) ist der generierte Weg für eine Klasse"""
+        return self._deserializer(klass)(data, deserialize_class)
+
+    serialize = staticmethod(serialize)
+
+    def _resolve(self, klass: str) -> type:
+        if klass in self.native_types:
+            return self.native_types[klass]
+        return getattr(self.models, klass)
+
+    def _json_type(self, klass: str):
+        """Typ für pydantic zu einem Antworttyp wie "List[Issue]", None wenn darin kein Modell steckt"""
+        if klass.startswith('List['):
+            inner = self._json_type(klass[5:-1])
+            return None if inner is None else List[inner]
+        if klass.startswith('Dict['):
+            m = re.match(r'Dict\[([^,]*), (.*)]', klass)
+            inner = self._json_type(m.group(2)) if m else None
+            return None if inner is None else Dict[str, inner]
+        if klass in self.native_types:
+            return None
+        return _json_annotation(self._resolve(klass))
+
+    def _json_adapter(self, klass: str) -> Optional[pydantic.TypeAdapter]:
+        """TypeAdapter, der eine Antwort dieses Typs direkt aus den JSON-Bytes validiert, einmal je Typ gebaut"""
+        try:
+            return self._json_adapters[klass]
+        except KeyError:
+            pass
+        adapter = None
+        try:
+            json_type = self._json_type(klass)
+            if json_type is not None:
+                adapter = pydantic.TypeAdapter(json_type)
+        except Exception:
+            # z.B. rekursive Modelle oder nicht auflösbare Referenzen, dann bleibt es beim Weg über from_dict
+            adapter = None
+        self._json_adapters[klass] = adapter
+        return adapter
+
+    def _build_projected_adapter(self, klass: str, fields: Tuple[str, ...]) -> Optional[pydantic.TypeAdapter]:
+        """TypeAdapter, der von einer Antwort dieses Typs nur die Felder fields validiert, None wenn er sich nicht bauen lässt
+
+        Felder, die es im Antworttyp nicht gibt, ergeben einen ValueError.
+        """
+        tree = _projection_tree(fields)
+        try:
+            json_type = self._json_type(klass)
+            if json_type is not None:
+                return pydantic.TypeAdapter(_projected_annotation(json_type, tree))
+        except ValueError:
+            raise
+        except Exception:
+            # wie bei _json_adapter, die Antwort kommt dann vollständig
+            return None
+        raise ValueError(f"{klass} has no fields to select")
+
+    def _compile_deserializer(self, klass: str) -> Callable:
+        """Übersetzt einen Typnamen wie "List[Issue]" einmal in eine Funktion (data, deserialize_class) -> Objekt.
+
+        Regex, Typtabellen und die Auflösung der Modellklasse fallen so nur einmal je Typname an statt für
+        jedes Element einer Liste. data ist nie None, None-Einträge in Listen und Dicts bleiben None.
+        """
+        if klass.startswith('List['):
+            m = re.match(r'List\[(.*)]', klass)
+            assert m is not None, "Malformed List type definition"
+            item = self._deserializer(m.group(1))
+            return lambda data, leaf: [None if sub_data is None else item(sub_data, leaf) for sub_data in data]
+
+        if klass.startswith('Dict['):
+            m = re.match(r'Dict\[([^,]*), (.*)]', klass)
+            assert m is not None, "Malformed Dict type definition"
+            value = self._deserializer(m.group(2))
+            return lambda data, leaf: {k: None if v is None else value(v, leaf) for k, v in data.items()}
+
+        target = self._resolve(klass)
+        if target in PRIMITIVE_TYPES:
+            return lambda data, leaf: _deserialize_primitive(data, target)
+        if isinstance(target, type) and issubclass(target, pydantic.BaseModel):
+            # wie ApiClient.__deserialize_model
+            return lambda data, leaf: target.from_dict(data)
+        return lambda data, leaf: leaf(data, target)
@@ -0,0 +1,62 @@
+import contextvars
+from contextlib import contextmanager
+from typing import Any, NamedTuple, Optional, Sequence, Tuple
+
+import pydantic_core
+
+_active: contextvars.ContextVar[bool] = contextvars.ContextVar("passthrough", default=False)
+_fields: contextvars.ContextVar[Optional[Tuple[str, ...]]] = contextvars.ContextVar("projection", default=None)
+
+# Steht in den Feldern einer Projektion, liefert sie alle Felder, z.B. fields=["*"] im Tool
+ALL_FIELDS = "*"
+
+
+class RawJson(NamedTuple):
+    """JSON-Body einer erfolgreichen Antwort, unverändert so, wie ihn der Upstream geschickt hat"""
+    data: bytes
+    # Antworttyp aus der API-Methode, z.B. "List[Issue]"
+    response_type: str
+
+    def load(self) -> Any:
+        return pydantic_core.from_json(self.data)
+
+
+@contextmanager
+def passthrough():
+    """
+    Im Block liefern die generierten API-Methoden bei JSON-Antworten mit Status 2xx RawJson statt Modellen
+    Gedacht für Tools, die das Ergebnis nur an den MCP-Client weiterreichen: Validierung und Modelle entfallen,
+    sanitize_output bereinigt dann direkt das geparste JSON. Fehlerstatus kommen weiter als ApiException.
+    Ist zugleich eine Projektion aktiv, gilt diese, die Methoden liefern dann projizierte Modelle.
+    """
+    token = _active.set(True)
+    try:
+        yield
+    finally:
+        _active.reset(token)
+
+
+def passthrough_active() -> bool:
+    return _active.get()
+
+
+@contextmanager
+def projection(fields: Optional[Sequence[str]]):
+    """
+    Im Block liefern die generierten API-Methoden bei JSON-Antworten mit Status 2xx nur die genannten Felder
+    Verschachtelte Felder mit Punkt, z.B. "user.login", bei Listen für jedes Element ("labels.name").
+    Die Antwort wird mit Modellen validiert, die nur diese Felder haben, alle anderen werden beim Parsen
+    übersprungen und nie zu Python-Objekten. Ohne Felder oder mit ALL_FIELDS bleibt die Antwort vollständig.
+    Unbekannte Felder ergeben einen ValueError aus der API-Methode.
+    Reihenfolge und Wiederholungen der Felder zählen nicht, jede Auswahl baut ihre Modelle nur einmal.
+    """
+    selected = None if not fields or ALL_FIELDS in fields else tuple(sorted(set(fields)))
+    token = _fields.set(selected)
+    try:
+        yield
+    finally:
+        _fields.reset(token)
+
+
+def projection_fields() -> Optional[Tuple[str, ...]]:
+    return _fields.get()
@@ -0,0 +1,167 @@
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from typing import Callable, Optional, Tuple, TypeVar
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+T = TypeVar("T")
+
+# Bekommt die gespeicherte TAT (oder None) und liefert die neue TAT (None = nicht schreiben) und ein Ergebnis
+Schedule = Callable[[Optional[float]], Tuple[Optional[float], T]]
+
+
+class InMemoryBackend:
+    """
+    Zustand des RateLimiters im eigenen Prozess
+    Ein Key lebt höchstens so lange, bis sein Kontingent wieder voll ist (TTL = TAT). Zusätzlich
+    begrenzt max_keys den Speicher auch bei sehr vielen gleichzeitig aktiven Keys (z.B. pro Session).
+    """
+
+    def __init__(self, max_keys: int = 1_000_000):
+        # Keys in der Reihenfolge ihres letzten erlaubten Aufrufs
+        self.tats: OrderedDict[str, float] = OrderedDict()
+        self.max_keys = max_keys
+
+    def update(self, key: str, now: float, schedule: Schedule) -> T:
+        self._evict_idle(now)
+        new_tat, result = schedule(self.tats.get(key))
+        if new_tat is not None:
+            self.tats[key] = new_tat
+            self.tats.move_to_end(key)
+            if len(self.tats) > self.max_keys:
+                # Der am längsten ungenutzte Key wird verdrängt, sein Kontingent beginnt neu
+                self.tats.popitem(last=False)
+        return result
+
+    def _evict_idle(self, now: float):
+        # Ein Key, dessen TAT in der Vergangenheit liegt, hat wieder sein volles Kontingent
+        # und kann ohne Verhaltensänderung vergessen werden. Es wird nur von vorne geprüft,
+        # dadurch bleibt der Aufwand amortisiert O(1). Abgelaufene Keys hinter einem noch
+        # gesperrten werden spätestens nach dem längsten Zeitfenster mit entfernt.
+        while self.tats:
+            key, tat = next(iter(self.tats.items()))
+            if tat > now:
+                break
+            del self.tats[key]
+
+
+class SharedMemoryBackend:
+    """
+    Zustand des RateLimiters in einer per mmap geteilten Datei, damit alle Server-Prozesse
+    auf einem Rechner ein gemeinsames Budget durchsetzen.
+    Die Datei ist eine Hashtabelle fester Größe mit Slots aus (Key-Hash, TAT). Ein Key kann nur
+    in den probe_length Slots ab seinem Heimat-Slot liegen, gesperrt wird nur dieser Bereich
+    (fcntl/msvcrt Byte-Range-Lock). Abgelaufene Slots gelten als frei und werden wiederverwendet.
+    Die Zeitstempel müssen prozessübergreifend vergleichbar sein (time.monotonic bzw. loop.time()).
+    Das gilt nur innerhalb eines Systemstarts: Im Kopf der Datei steht die Kennung des Starts, der sie
+    geschrieben hat. Passt sie beim Öffnen nicht (z.B. nach einem Neustart), wird die Tabelle geleert,
+    sonst würden alte TATs als Wartezeiten von Tagen gelten.
+    """
+
+    header = struct.Struct("<8s16s8x")
+    slot = struct.Struct("<Qd")
+    magic = b"GCRATAT1"
+
+    def __init__(self, path: str, slots: int = 65536, probe_length: int = 8):
+        self.slots = slots
+        self.probe_length = probe_length
+        size = self.header.size + (slots + probe_length) * self.slot.size
+
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        if os.fstat(self.fd).st_size < size:
+            os.ftruncate(self.fd, size)
+        self.map = mmap.mmap(self.fd, size)
+        # fcntl-Locks gelten pro Prozess, Threads im selben Prozess werden hier serialisiert
+        self.thread_lock = threading.Lock()
+        self._check_boot(size)
+
+    def _check_boot(self, size: int):
+        boot_id = _boot_id()
+        _lock_range(self.fd, 0, size)
+        try:
+            magic, stored_boot_id = self.header.unpack_from(self.map, 0)
+            if magic != self.magic or stored_boot_id != boot_id:
+                # Neue Datei, altes Format oder TATs aus einem früheren Systemstart
+                self.map[self.header.size:size] = bytes(size - self.header.size)
+                self.header.pack_into(self.map, 0, self.magic, boot_id)
+        finally:
+            _unlock_range(self.fd, 0, size)
+
+    def close(self):
+        self.map.close()
+        os.close(self.fd)
+
+    def update(self, key: str, now: float, schedule: Schedule) -> T:
+        key_hash = _hash_key(key)
+        home = key_hash % self.slots
+        offset = self.header.size + home * self.slot.size
+        length = self.probe_length * self.slot.size
+
+        with self.thread_lock:
+            _lock_range(self.fd, offset, length)
+            try:
+                index, tat = self._find(key_hash, home, now)
+                new_tat, result = schedule(tat)
+                if new_tat is not None:
+                    self.slot.pack_into(self.map, self.header.size + index * self.slot.size, key_hash, new_tat)
+                return result
+            finally:
+                _unlock_range(self.fd, offset, length)
+
+    def _find(self, key_hash: int, home: int, now: float) -> Tuple[int, Optional[float]]:
+        free = None
+        oldest = home
+        oldest_tat = None
+        for index in range(home, home + self.probe_length):
+            stored_hash, tat = self.slot.unpack_from(self.map, self.header.size + index * self.slot.size)
+            if stored_hash == key_hash:
+                return index, tat if tat > now else None
+            if free is None and (stored_hash == 0 or tat <= now):
+                free = index
+            if oldest_tat is None or tat < oldest_tat:
+                oldest, oldest_tat = index, tat
+        # Ist kein Slot frei, wird der Key verdrängt, dessen Budget am ehesten wieder voll ist
+        return (oldest if free is None else free), None
+
+
+def _boot_id() -> bytes:
+    # Kennung des Systemstarts, seit dem time.monotonic zählt
+    try:
+        with open("/proc/sys/kernel/random/boot_id") as f:
+            return uuid.UUID(f.read().strip()).bytes
+    except (OSError, ValueError):
+        # Ohne boot_id (z.B. Windows, macOS) der Startzeitpunkt, auf Minuten gerundet gegen Schwankungen der Uhr.
+        # Wird er in einem anderen Prozess anders gerundet, beginnen die Budgets einmal neu
+        boot_minute = round((time.time() - time.monotonic()) / 60)
+        return boot_minute.to_bytes(16, "little", signed=True)
+
+
+def _hash_key(key: str) -> int:
+    # Stabiler Hash über Prozessgrenzen hinweg (hash() ist pro Prozess randomisiert), 0 markiert freie Slots
+    return int.from_bytes(hashlib.blake2b(key.encode(), digest_size=8).digest(), "little") or 1
+
+
+def _lock_range(fd: int, offset: int, length: int):
+    if fcntl is not None:
+        fcntl.lockf(fd, fcntl.LOCK_EX, length, offset)
+    else:
+        os.lseek(fd, offset, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, length)
+
+
+def _unlock_range(fd: int, offset: int, length: int):
+    if fcntl is not None:
+        fcntl.lockf(fd, fcntl.LOCK_UN, length, offset)
+    else:
+        os.lseek(fd, offset, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, length)
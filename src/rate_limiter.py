@@ -1,55 +1,247 @@
 import asyncio
+import inspect
 import logging
+import math
+import os
 from functools import wraps
-from time import time
-from collections import defaultdict
-from typing import Dict, Tuple
+from time import monotonic
+from typing import Any, Callable, Dict, NamedTuple, Optional, Sequence, Tuple, Union
+
+from mcp.server.lowlevel.server import request_ctx
+
+from src.rate_limit_backends import InMemoryBackend, SharedMemoryBackend
 
 logger = logging.getLogger(__name__)
 print(__name__)
 
 
 class RateLimiter:
-    def __init__(self):
-        self.calls: Dict[str, list] = defaultdict(list)
+    """
+    Rate Limiter nach dem Generic Cell Rate Algorithm (GCRA)
+    Pro Key wird nur die "theoretical arrival time" (TAT) gespeichert, damit kostet
+    jeder Aufruf O(1) Zeit und Speicher, unabhängig von max_calls.
+    Wo die TATs liegen, bestimmt das Backend (eigener Prozess oder geteilter Speicher).
+    """
+
+    def __init__(self, backend=None):
+        self.backend = backend if backend is not None else InMemoryBackend()
+
+    def is_allowed(self, key: str, max_calls: int, time_window: float) -> Tuple[bool, float]:
+        return self.reserve(key, max_calls, time_window, max_wait=0)
+
+    def reserve(self, key: str, max_calls: int, time_window: float, max_wait: float = math.inf, now: Optional[float] = None) -> Tuple[bool, float]:
+        """
+        Reserviert den nächsten freien Slot für key
+        Liefert die Wartezeit bis zum Slot ab now. Wäre sie größer als max_wait, wird nichts reserviert
+        und die Wartezeit dient als Retry-After.
+        """
+        if now is None:
+            now = monotonic()
+        # Abstand zwischen zwei Aufrufen im Dauerbetrieb, Bursts bis max_calls sind erlaubt
+        interval = time_window / max_calls
+
+        def schedule(tat: Optional[float]):
+            new_tat = (now if tat is None else max(tat, now)) + interval
+            # Auf Nanosekunden gerundet, damit Rundungsfehler keinen Slot des Bursts kosten
+            wait_time = max(round(new_tat - time_window - now, 9), 0)
+            if wait_time > max_wait:
+                return None, (False, wait_time)
+            # Slots werden in Ankunftsreihenfolge vergeben, Wartende bilden so eine FIFO-Queue
+            return new_tat, (True, wait_time)
+
+        return self.backend.update(key, now, schedule)
+
+    def reserve_all(self, budgets: Sequence[Tuple[str, int, float]], max_wait: float = math.inf, now: Optional[float] = None) -> Tuple[bool, float, str]:
+        """
+        Reserviert einen gemeinsamen Slot in mehreren Kontingenten (key, max_calls, time_window),
+        z.B. global → Upstream → Mandant → Tool. Der Slot richtet sich nach dem knappsten Kontingent,
+        dessen Key zusätzlich zurückkommt (ohne Wartezeit der des letzten Kontingents).
+        """
+        limiting = budgets[-1][0]
+        if len(budgets) == 1:
+            return (*self.reserve(*budgets[0], max_wait=max_wait, now=now), limiting)
+        if now is None:
+            now = monotonic()
+
+        # Erst den frühesten Zeitpunkt bestimmen, zu dem alle Kontingente den Aufruf zulassen ...
+        slot = now
+        for key, max_calls, time_window in budgets:
+            earliest = self.backend.update(key, now, _earliest(slot, max_calls, time_window, commit=False))
+            if earliest > slot:
+                slot, limiting = earliest, key
+        if slot - now > max_wait:
+            return False, slot - now, limiting
+
+        # ... dann in allen Kontingenten genau diesen Slot belegen
+        for key, max_calls, time_window in budgets:
+            earliest = self.backend.update(key, now, _earliest(slot, max_calls, time_window, commit=True))
+            # Nur bei gleichzeitigen Zugriffen anderer Prozesse kann sich der Slot noch verschieben
+            if earliest > slot:
+                slot, limiting = earliest, key
+        return True, slot - now, limiting
+
+    def release(self, budgets: Sequence[Tuple[str, int, float]], now: Optional[float] = None):
+        """
+        Gibt einen reservierten, aber nicht genutzten Slot in allen Kontingenten zurück,
+        z.B. wenn ein Wartender abgebrochen wird. Die Slots der übrigen Wartenden bleiben, wie sie sind.
+        """
+        if now is None:
+            now = monotonic()
+        for key, max_calls, time_window in budgets:
+            interval = time_window / max_calls
+            # Eine TAT in der Vergangenheit bedeutet schon das volle Kontingent, weiter zurück geht es nicht
+            self.backend.update(key, now, lambda tat: (None if tat is None else max(tat - interval, now), None))
+
+
+def _earliest(slot: float, max_calls: int, time_window: float, commit: bool):
+    interval = time_window / max_calls
+
+    def schedule(tat: Optional[float]):
+        new_tat = (slot if tat is None else max(tat, slot)) + interval
+        earliest = slot + max(round(new_tat - time_window - slot, 9), 0)
+        return (new_tat if commit else None), earliest
+
+    return schedule
+
+
+# Bekommt die dekorierte Funktion und ihre Argumente und liefert den Key eines Kontingents
+KeyFunc = Callable[[Callable, tuple, Dict[str, Any]], str]
+
+
+def tool_key(func, args, kwargs) -> str:
+    return func.__name__
+
+
+def session_key(func, args, kwargs) -> str:
+    """MCP-Session des laufenden Requests (mcp-session-id bei streamable-http)"""
+    try:
+        context = request_ctx.get()
+    except LookupError:
+        return "no-session"
+    request = context.request
+    session_id = request.headers.get("mcp-session-id") if request is not None else None
+    return session_id or f"session-{id(context.session)}"
+
+
+def client_key(func, args, kwargs) -> str:
+    """Vom MCP-Client gemeldete Identität"""
+    try:
+        context = request_ctx.get()
+    except LookupError:
+        return "anonymous"
+    client_id = getattr(context.meta, "client_id", None) if context.meta else None
+    if client_id:
+        return client_id
+    params = context.session.client_params
+    return params.clientInfo.name if params is not None else "anonymous"
+
+
+def argument_key(*names: str) -> KeyFunc:
+    """Key aus ausgewählten Tool-Argumenten, z.B. argument_key("owner", "repo") oder argument_key("guild_id")"""
+    signatures = {}
+
+    def key(func, args, kwargs) -> str:
+        if args:
+            signature = signatures.get(func) or signatures.setdefault(func, inspect.signature(func))
+            kwargs = signature.bind_partial(*args, **kwargs).arguments
+        return "/".join(str(kwargs.get(name)) for name in names)
+
+    return key
+
+
+def scoped(*parts: Union[str, KeyFunc]) -> KeyFunc:
+    """Setzt einen Key aus festen Namen und Key-Funktionen zusammen, z.B. scoped("github", session_key, tool_key)"""
+
+    def key(func, args, kwargs) -> str:
+        return ":".join(part if isinstance(part, str) else part(func, args, kwargs) for part in parts)
+
+    return key
+
+
+# Jede MCP-Session hat ihr eigenes Kontingent je Tool
+session_tool_key = scoped(session_key, tool_key)
+
+
+class Budget(NamedTuple):
+    """Ein Kontingent in der Hierarchie global → Upstream → Mandant → Tool"""
+    max_calls: int
+    time_window: float
+    key: KeyFunc
+
+
+def upstream_tool_budget(upstream: str, max_calls: int = 3, time_window: float = 60) -> Budget:
+    """
+    Kontingent je Tool über alle Sessions eines Upstreams, als parents zu session_tool_key
+    Mit den Standardwerten von rate_limit bleibt es bei so vielen Upstream-Aufrufen wie mit einem Kontingent je Tool,
+    egal wie viele Sessions gleichzeitig offen sind.
+    """
+    return Budget(max_calls, time_window, scoped(upstream, tool_key))
+
+
+class RateLimitExceeded(Exception):
+    def __init__(self, key: str, retry_after: float):
+        super().__init__(f"Rate limit exceeded for {key}, retry after {retry_after:.1f}s")
+        self.key = key
+        self.retry_after = retry_after
 
-    def is_allowed(self, key: str, max_calls: int, time_window: int) -> Tuple[bool, float]:
-        now = time()
-        # Entferne alte Aufrufe außerhalb des Zeitfensters
-        self.calls[key] = [call_time for call_time in self.calls[key]
-                           if now - call_time < time_window]
 
-        if len(self.calls[key]) < max_calls:
-            self.calls[key].append(now)
-            return True, 0
-        # Berechne Wartezeit bis zum nächsten verfügbaren Slot
-        oldest_call = min(self.calls[key])
-        wait_time = time_window - (now - oldest_call)
-        return False, wait_time
+# Mehrere Server-Prozesse auf einem Rechner teilen sich über diese Datei ein gemeinsames Budget
+state_file = os.environ.get("RATE_LIMIT_STATE_FILE")
+rate_limiter = RateLimiter(SharedMemoryBackend(state_file) if state_file else None)
 
 
-rate_limiter = RateLimiter()
+async def _sleep_until(loop: asyncio.AbstractEventLoop, deadline: float):
+    # Absoluter Zeitpunkt statt asyncio.sleep, damit Verzögerungen zwischen Reservierung und
+    # Timer (z.B. GC-Pausen) die FIFO-Reihenfolge der Slots nicht vertauschen
+    future = loop.create_future()
+    handle = loop.call_at(deadline, lambda: future.done() or future.set_result(None))
+    try:
+        await future
+    finally:
+        handle.cancel()
 
 
-def rate_limit(max_calls: int = 3, time_window: int = 60):
+def rate_limit(max_calls: int = 3, time_window: int = 60, max_queue: Optional[int] = None, reject: bool = False, key: KeyFunc = tool_key, parents: Sequence[Budget] = ()):
     """
     Rate Limiting Decorator
     max_calls: Maximale Anzahl Aufrufe
     time_window: Zeitfenster in Sekunden
+    max_queue: Maximale Anzahl wartender Aufrufe, darüber wird RateLimitExceeded geworfen
+    reject: Aufrufe über dem Limit sofort mit RateLimitExceeded (inkl. retry_after) abweisen statt zu warten
+    key: Bestimmt, wer sich das Kontingent teilt (Standard: alle Aufrufe desselben Tools)
+    parents: Übergeordnete Kontingente (global → Upstream → Mandant), die zusätzlich eingehalten werden
     """
+    budgets = [*parents, Budget(max_calls, time_window, key)]
+    if reject:
+        max_wait = 0
+    elif max_queue is None:
+        max_wait = math.inf
+    else:
+        max_wait = max_queue * time_window / max_calls
 
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            key = f"{func.__name__}"
-            allowed, wait_time = rate_limiter.is_allowed(key, max_calls, time_window)
+            keys = [(budget.key(func, args, kwargs), budget.max_calls, budget.time_window) for budget in budgets]
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            # key ist das Kontingent, das den Aufruf bremst, z.B. das eines Upstreams statt der Session
+            reserved, wait_time, key = rate_limiter.reserve_all(keys, max_wait, now)
 
-            if not allowed:
+            if wait_time > 0:
                 logger.warning(f"Rate limit exceeded for {key}")
-                await asyncio.sleep(wait_time)
+                if not reserved:
+                    raise RateLimitExceeded(key, wait_time)
+                # Der Slot ist reserviert, nach dem Warten muss nicht erneut geprüft werden
+                try:
+                    await _sleep_until(loop, now + wait_time)
+                except asyncio.CancelledError:
+                    # Wer abgebrochen wird, nutzt seinen Slot nicht mehr, er geht an die Aufrufe danach
+                    rate_limiter.release(keys, loop.time())
+                    raise
 
             return await func(*args, **kwargs)
 
         return wrapper
 
-    return decorator
\ No newline at end of file
+    return decorator
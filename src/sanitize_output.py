@@ -1,49 +1,104 @@
+import asyncio
+import ast
+import inspect
+import multiprocessing
+import pickle
 import re
-from functools import wraps
-from typing import Any
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from enum import Enum
+from functools import lru_cache, wraps
+from typing import Annotated, Any, NamedTuple, Tuple, Union, get_args, get_origin
+from types import NoneType, UnionType
+from uuid import UUID
+
+import pydantic_core
+from mcp.server.fastmcp.utilities.types import Audio, Image
+from mcp.types import CallToolResult, ContentBlock, TextContent
+from pydantic import BaseModel
+
+from src.passthrough import RawJson
 
 SECRET_KEYWORDS = [
     "password", "passwd", "pwd", "secret", "token", "apikey", "api_key", "api-key", "accessToken", "access_token", "access-token", "authorization"
 ]
 
+# Die Muster werden einmal beim Import kompiliert und nicht bei jedem String neu gebaut
+_keywords_pattern = '|'.join(map(re.escape, SECRET_KEYWORDS))
+
+# Die beiden Muster bleiben getrennt und laufen nacheinander: das zweite sieht die Ausgabe des ersten. Eine einzige
+# Alternation liefert z.B. für '"password": token=x' ein anderes Ergebnis ('"password": ****' statt
+# '"password": **** ****'), bei Zufallseingaben aus Schlüsselwörtern und Trennzeichen in etwa 0,3 % der Fälle.
+# Schneller wäre sie kaum (Text mit Secrets 272 statt 284 µs, ohne Secrets gleich, weil die Vorprüfung greift).
+
+# key: "value" or key = value  (unquoted key)
+_SECRET_ASSIGNMENT = re.compile(rf'(\b(?:{_keywords_pattern})\b)\s*[:=]\s*(".*?"|\'.*?\'|[^\s,;]+)', re.IGNORECASE)
+
+# quoted or unquoted JSON-like key: "value"
+# group(1) = optional surrounding quote char (or empty), group(2) = key
+_SECRET_JSON_PAIR = re.compile(rf'(["\']?)(\b(?:{_keywords_pattern})\b)\1\s*:\s*(".*?"|\'.*?\'|[^\s,;]+)', re.IGNORECASE)
+
+# Kleingeschrieben für die Vorprüfung per Teilstring-Suche, die ohne Regex auskommt.
+# Schlüsselwörter, die ein anderes enthalten (z.B. "access_token"), muss die Vorprüfung nicht suchen
+_LOWER_KEYWORDS = tuple({kw.lower() for kw in SECRET_KEYWORDS})
+_LOWER_KEYWORDS = tuple(kw for kw in _LOWER_KEYWORDS if not any(other != kw and other in kw for other in _LOWER_KEYWORDS))
+
+# Bytefolgen, ohne die in einem JSON-Dokument weder ein String noch ein Key etwas zu bereinigen hat.
+# \u-Escapes könnten Anführungszeichen oder Schlüsselwörter verstecken, Nicht-ASCII prüft _raw_json_is_clean vorab
+_RAW_JSON_TRIGGERS = (b'\\"', b"'", b"`", b"..", b"\\u") + tuple(kw.encode() for kw in _LOWER_KEYWORDS)
+
+# Ein Durchlauf ersetzt beliebig lange Ketten wie "/../../", so oft wie die frühere Schleife
+_SLASH_TRAVERSAL = re.compile(r'/(?:\.\./)+')
+_BACKSLASH_TRAVERSAL = re.compile(r'\\(?:\.\.\\)+')
+
+
+def _contains_secret_keyword(s: str) -> bool:
+    # Obermenge der Regex-Treffer: ohne Schlüsselwort kann keines der Muster greifen.
+    # Nicht-ASCII wird immer geprüft, weil IGNORECASE z.B. "ſ" als "s" behandelt, lower() aber nicht
+    if not s.isascii():
+        return True
+    lower = s.lower()
+    return any(kw in lower for kw in _LOWER_KEYWORDS)
+
+
+def _raw_json_is_clean(data: bytes) -> bool:
+    # Ein Durchlauf über die Bytes statt über jeden einzelnen Wert, z.B. bei ESI-Seiten mit nur Zahlen und Zeitstempeln
+    if not data.isascii():
+        return False
+    lower = data.lower()
+    return not any(trigger in lower for trigger in _RAW_JSON_TRIGGERS)
+
+
 def _mask_secrets_in_str(s: str) -> str:
     # Maskiert "key: value" oder "key = value" sowie quoted "key": "value"
-    keywords_pattern = '|'.join(map(re.escape, SECRET_KEYWORDS))
-
-    # key: "value" or key = value  (unquoted key)
-    pattern1 = rf'(\b(?:{keywords_pattern})\b)\s*[:=]\s*(".*?"|\'.*?\'|[^\s,;]+)'
-    s = re.sub(
-        pattern1,
-        lambda m: f"{m.group(1)}: ****",
-        s,
-        flags=re.IGNORECASE
-    )
-
-    # quoted or unquoted JSON-like key: "value"
-    # group(1) = optional surrounding quote char (or empty), group(2) = key
-    pattern2 = rf'(["\']?)(\b(?:{keywords_pattern})\b)\1\s*:\s*(".*?"|\'.*?\'|[^\s,;]+)'
-    s = re.sub(
-        pattern2,
-        lambda m: f'{m.group(1)}{m.group(2)}{m.group(1)}: ****',
-        s,
-        flags=re.IGNORECASE
-    )
-
+    if not _contains_secret_keyword(s):
+        return s
+    s = _SECRET_ASSIGNMENT.sub(lambda m: f"{m.group(1)}: ****", s)
+    s = _SECRET_JSON_PAIR.sub(lambda m: f'{m.group(1)}{m.group(2)}{m.group(1)}: ****', s)
     return s
 
 def _escape_quotation_marks_and_ticks(s: str) -> str:
-    s = s.replace('"', '\\"')
-    s = s.replace("'", "\\'")
-    s = s.replace("`", "\\`")
+    # Die Prüfung per "in" ist deutlich billiger als ein replace, das eine Kopie anlegt
+    if '"' in s:
+        s = s.replace('"', '\\"')
+    if "'" in s:
+        s = s.replace("'", "\\'")
+    if "`" in s:
+        s = s.replace("`", "\\`")
     return s
 
 def _remove_path_traversal(s: str) -> str:
     # Entfernt Pfad-Traversal in einfachen Fällen
-    while "/../" in s:
-        s = s.replace("/../", "/")
-    while "\\..\\" in s:
-        s = s.replace("\\..\\", "\\")
+    if ".." not in s:
+        return s
+    if "/../" in s:
+        s = _SLASH_TRAVERSAL.sub("/", s)
+    if "\\..\\" in s:
+        s = _BACKSLASH_TRAVERSAL.sub(lambda m: "\\", s)
 
+    # Durch das Entfernen können neue "../" entstehen (z.B. "....//"), daher weiterhin als Schleife
     while "../" in s:
         s = s.replace("../", "")
 
@@ -56,24 +111,180 @@ def _remove_path_traversal(s: str) -> str:
     # s = re.sub(r'\\(?:(\.\.)(\\|$))+', lambda m: '\\', s)
     return s
 
+@lru_cache(maxsize=4096)
+def _is_secret_key(k: str) -> bool:
+    # Dieselben Feldnamen kommen in jedem Element einer Liste vor, das Ergebnis wird daher zwischengespeichert
+    lower = k.lower()
+    return any(kw in lower for kw in SECRET_KEYWORDS)
+
+def _sanitize_str(value: str) -> str:
+    value_redacted = _mask_secrets_in_str(value)
+    value_escaped = _escape_quotation_marks_and_ticks(value_redacted)
+    value_stripped = _remove_path_traversal(value_escaped)
+    return value_stripped
+
+# Typen, deren Werte weder Secrets noch Anführungszeichen oder Pfade enthalten können
+_SAFE_TYPES = (int, float, bool, bytes, NoneType, date, datetime, time, timedelta, Decimal, UUID)
+
+# Werte aus geparstem JSON (z.B. passthrough), die ohne Funktionsaufruf unverändert bleiben
+_JSON_SCALARS = frozenset((int, float, bool, NoneType))
+
+# Art eines Modell-Felds für den Sanitizing-Plan
+_TEXT = 1
+_NESTED = 2
+
+
+class _FieldPlan(NamedTuple):
+    name: str
+    # Feldname oder Alias sieht nach Secret aus
+    secret: bool
+    kind: int
+
+
+def _leaf_types(annotation) -> set:
+    # Löst Optional/Union/Annotated auf, Container und Modelle bleiben als Ganzes stehen
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _leaf_types(get_args(annotation)[0])
+    if origin is Union or origin is UnionType:
+        return set().union(*(_leaf_types(arg) for arg in get_args(annotation)))
+    return {annotation}
+
+
+def _field_kind(annotation) -> int:
+    """0 = Feld überspringen, _TEXT = String, _NESTED = Modell, Container oder unbekannter Typ"""
+    kind = 0
+    for leaf in _leaf_types(annotation):
+        origin = get_origin(leaf)
+        if origin in (list, tuple, dict):
+            # Container nur dann, wenn ihre Elemente etwas zu bereinigen haben (z.B. nicht List[int]).
+            # Dict-Keys werden mit geprüft, weil Secret-Namen als Key den Wert maskieren.
+            if any(_field_kind(arg) for arg in get_args(leaf) if arg is not Ellipsis):
+                return _NESTED
+            continue
+        if not isinstance(leaf, type):
+            return _NESTED
+        if issubclass(leaf, str):
+            kind = _TEXT
+        elif issubclass(leaf, Enum) or issubclass(leaf, _SAFE_TYPES):
+            continue
+        else:
+            return _NESTED
+    return kind
+
+
+# Vom OpenAPI Generator erzeugte Validatoren für Enum- und Pattern-Felder
+_ENUM_VALIDATOR = re.compile(r'value not in set\(\[(.*)\]\)')
+_PATTERN_VALIDATOR = re.compile(r're\.match\(r"(.*)", value\)')
+
+# Patterns der generierten Clients, deren Werte das Sanitizing unverändert lässt: nur Ziffern, Hex oder feste
+# Wörter, daraus lassen sich weder Anführungszeichen, ".." noch ein Schlüsselwort bilden. Bewusst eine feste Liste,
+# ein neues Pattern wird erst nach Prüfung aufgenommen und bis dahin bereinigt
+_SAFE_PATTERNS = frozenset({
+    r"^(0|[1-9][0-9]*)$",
+    r"^[0-9a-fA-F]+$",
+    r"^#(([0-9a-fA-F]{2}){3}|([0-9a-fA-F]){3})$",
+    r"^sha256:[a-f0-9]{64}$",
+    r"^(?:first|last|after:\d+)$",
+})
+
+
+def _validated_safe_fields(model_class: type) -> set:
+    """Felder, deren generierte Validatoren nur Werte zulassen, die das Sanitizing unverändert lässt"""
+    safe = set()
+    decorators = getattr(model_class, "__pydantic_decorators__", None)
+    for validator in (decorators.field_validators.values() if decorators else ()):
+        if validator.info.mode != "after":
+            continue
+        try:
+            is_safe = _validator_is_safe(validator.func)
+        except Exception:
+            # Im Zweifel wird das Feld bereinigt
+            is_safe = False
+        if is_safe:
+            safe.update(validator.info.fields)
+    return safe
+
+
+def _validator_is_safe(func) -> bool:
+    """Ob der Validator genau eine der Formen des Generators hat und nur harmlose Werte zulässt"""
+    source = inspect.getsource(func)
+    enum_matches = _ENUM_VALIDATOR.findall(source)
+    pattern_matches = _PATTERN_VALIDATOR.findall(source)
+    if len(enum_matches) + len(pattern_matches) != 1:
+        return False
+    if enum_matches:
+        values = ast.literal_eval(f"[{enum_matches[0]}]")
+        return all(isinstance(value, str) and _sanitize_str(value) == value for value in values)
+    return pattern_matches[0] in _SAFE_PATTERNS
+
+
+# Begrenzt, damit der Cache keine Modellklassen festhält, die sonst schon freigegeben wären (z.B. aus Projektionen)
+@lru_cache(maxsize=1024)
+def _model_plan(model_class: type) -> Tuple[_FieldPlan, ...]:
+    """
+    Sanitizing-Plan einer Modellklasse, wird einmal pro Klasse aus ihren Feldern berechnet
+    Felder, die nur Zahlen, Datumswerte o.ä. enthalten können, kommen im Plan gar nicht vor,
+    ebenso Strings, die laut Schema nur harmlose Enum-Werte oder Patterns (z.B. IDs) zulassen.
+    """
+    plan = []
+    safe_fields = _validated_safe_fields(model_class)
+    for name, field in model_class.model_fields.items():
+        kind = _field_kind(field.annotation)
+        if kind:
+            secret = _is_secret_key(name) or (field.alias is not None and _is_secret_key(field.alias))
+            if kind == _TEXT and name in safe_fields and not secret:
+                continue
+            plan.append(_FieldPlan(name, secret, kind))
+    return tuple(plan)
+
+
+def _sanitize_model(model: BaseModel) -> BaseModel:
+    # Liefert eine Kopie mit bereinigten Feldern, ohne Änderungen das Modell selbst
+    values = model.__dict__
+    changes = {}
+    for name, secret, kind in _model_plan(type(model)):
+        value = values.get(name)
+        if value is None:
+            continue
+        if secret and not isinstance(value, (dict, list, tuple, BaseModel)):
+            sanitized = "****"
+        elif kind == _TEXT and isinstance(value, str):
+            sanitized = _sanitize_str(value)
+        else:
+            sanitized = _sanitize_value(value)
+        if sanitized is not value:
+            changes[name] = sanitized
+    if model.__pydantic_extra__:
+        changes.update(_sanitize_value(model.__pydantic_extra__))
+    return model.model_copy(update=changes) if changes else model
+
 def _sanitize_value(value: Any) -> Any:
     # Direkter Wert
     if isinstance(value, str):
-        value_redacted = _mask_secrets_in_str(value)
-        value_escaped = _escape_quotation_marks_and_ticks(value_redacted)
-        value_stripped = _remove_path_traversal(value_escaped)
-        return value_stripped
+        return _sanitize_str(value)
+
+    # Generierte Modelle anhand ihres Plans bereinigen
+    if isinstance(value, BaseModel):
+        return _sanitize_model(value)
 
     # Dictionary rekursiv bereinigen
     if isinstance(value, dict):
         out = {}
         for k, val in value.items():
-            out[k] = "****" if any(kw in k.lower() for kw in SECRET_KEYWORDS) and not isinstance(val, (dict, list, tuple)) else _sanitize_value(val)
+            if _is_secret_key(k) and not isinstance(val, (dict, list, tuple)):
+                out[k] = "****"
+            elif type(val) in _JSON_SCALARS:
+                out[k] = val
+            elif type(val) is str:
+                out[k] = _sanitize_str(val)
+            else:
+                out[k] = _sanitize_value(val)
         return out
 
     # Liste bereinigen
     if isinstance(value, list):
-        return [_sanitize_value(x) for x in value]
+        return [x if type(x) in _JSON_SCALARS else _sanitize_value(x) for x in value]
 
     # Tupel bereinigen
     if isinstance(value, tuple):
@@ -81,13 +292,109 @@ def _sanitize_value(value: Any) -> Any:
 
     return value
 
-def sanitize_output():
+def _sanitize_to_content(result: Any, sanitize: bool = True) -> Any:
+    """
+    Bereinigt das Ergebnis Element für Element und serialisiert jedes Element sofort als TextContent
+    Entspricht der Umwandlung in FastMCP (Listen werden zu je einem TextContent pro Element), nur dass
+    nie eine bereinigte Kopie des ganzen Ergebnisses entsteht, sondern höchstens die eines Elements.
+    sanitize=False serialisiert nur, für Ergebnisse, die nachweislich nichts zu bereinigen haben.
+    """
+    if isinstance(result, (list, tuple)):
+        content = []
+        for item in result:
+            item = _sanitize_to_content(item, sanitize)
+            if isinstance(item, list):
+                content.extend(item)
+            elif item is not None:
+                content.append(item)
+        return content
+
+    sanitized = _sanitize_value(result) if sanitize else result
+    # Fehler, Bilder und fertige Content-Blöcke wandelt FastMCP selbst um
+    if sanitized is None or isinstance(sanitized, (CallToolResult, Image, Audio)) or isinstance(sanitized, ContentBlock):
+        return sanitized
+    if not isinstance(sanitized, str):
+        sanitized = pydantic_core.to_json(sanitized, fallback=str, indent=2).decode()
+    return TextContent(type="text", text=sanitized)
+
+# Ab so vielen Elementen wird nicht mehr auf dem Event-Loop bereinigt, damit andere Requests nicht warten müssen
+THREAD_THRESHOLD = 200
+# Ab so vielen Elementen in Teilstücken auf mehreren Prozessen, ein Thread hält wegen des GIL den Loop weiter auf
+PROCESS_THRESHOLD = 5000
+CHUNK_SIZE = 1000
+
+_process_pool = None
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    global _process_pool
+    if _process_pool is None:
+        # Kein fork: Der Server hat Threads (Event-Loop, Executor), ein geforkter Worker kann deren Locks
+        # gesperrt erben. Der Forkserver hat dieses Modul samt pydantic schon importiert, die Worker starten
+        # daraus schnell; Modelle importieren sie beim Entpicklen einzeln (siehe models.__getattr__)
+        if "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+            context.set_forkserver_preload([__name__])
+        else:
+            context = multiprocessing.get_context("spawn")
+        _process_pool = ProcessPoolExecutor(mp_context=context)
+    return _process_pool
+
+
+def _reset_process_pool():
+    global _process_pool
+    _process_pool = None
+
+
+def _sanitize_result(result: Any, stream: bool) -> Any:
+    return _sanitize_to_content(result) if stream else _sanitize_value(result)
+
+
+async def _sanitize_offloaded(result: Any, stream: bool) -> Any:
+    """Bereinigt große Listen-Ergebnisse abseits des Event-Loops"""
+    loop = asyncio.get_running_loop()
+    if len(result) < PROCESS_THRESHOLD:
+        return await loop.run_in_executor(None, _sanitize_result, result, stream)
+
+    chunks = [result[i:i + CHUNK_SIZE] for i in range(0, len(result), CHUNK_SIZE)]
+    pool = _get_process_pool()
+    try:
+        # Ohne fork startet submit die Worker über den Forkserver und wartet darauf, das geschieht im Thread
+        futures = await loop.run_in_executor(None, lambda: [pool.submit(_sanitize_result, chunk, stream) for chunk in chunks])
+        parts = await asyncio.gather(*map(asyncio.wrap_future, futures))
+    except BrokenProcessPool:
+        # Ein abgestürzter Worker soll das Tool nicht scheitern lassen, der Pool wird beim nächsten Mal neu gestartet
+        _reset_process_pool()
+        return await loop.run_in_executor(None, _sanitize_result, result, stream)
+    except pickle.PicklingError:
+        # Ergebnisse, die sich nicht an die Worker schicken lassen (z.B. dynamisch gebaute Modellklassen), im Thread
+        return await loop.run_in_executor(None, _sanitize_result, result, stream)
+
+    sanitized = [item for part in parts for item in part]
+    return tuple(sanitized) if isinstance(result, tuple) and not stream else sanitized
+
+
+def sanitize_output(stream: bool = False):
+    """
+    stream: Große Listen-Ergebnisse direkt beim Bereinigen serialisieren. Der Spitzenspeicher
+            wächst dann nur um ein Element statt um eine bereinigte Kopie des ganzen Ergebnisses.
+    Listen ab THREAD_THRESHOLD Elementen werden in einem Thread, ab PROCESS_THRESHOLD auf einem Prozess-Pool bereinigt.
+    Liefert die Funktion RawJson (siehe passthrough), wird das geparste JSON bereinigt.
+    """
 
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
             result = await func(*args, **kwargs)
-            return _sanitize_value(result)
+            if isinstance(result, RawJson):
+                # Passthrough: bereinigt wird das geparste JSON, ohne Modelle dazwischen
+                clean = _raw_json_is_clean(result.data)
+                result = result.load()
+                if clean:
+                    return _sanitize_to_content(result, sanitize=False) if stream else result
+            if isinstance(result, (list, tuple)) and len(result) >= THREAD_THRESHOLD:
+                return await _sanitize_offloaded(result, stream)
+            return _sanitize_result(result, stream)
 
         return wrapper
     return decorator
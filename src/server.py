@@ -1,3 +1,7 @@
 from mcp.server import FastMCP
 
-mcp = FastMCP(port=3000)
\ No newline at end of file
+from src.tool_schema_cache import use_schema_cache
+from src.upstream_clients import lifespan
+
+mcp = FastMCP(port=3000, lifespan=lifespan)
+use_schema_cache(mcp)
@@ -0,0 +1,140 @@
+import asyncio
+import importlib.util
+import logging
+import os
+import ssl
+import threading
+from contextlib import nullcontext
+from time import monotonic
+from typing import Dict, Mapping, Tuple
+from urllib.parse import urlsplit
+
+import httpx
+
+from src import ssl_contexts
+
+logger = logging.getLogger(__name__)
+
+
+class HostMetrics:
+    """Zähler eines Hosts über alle Clients, die den Transport teilen"""
+
+    def __init__(self):
+        self.requests = 0
+        self.errors = 0
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.seconds = 0.0
+        self.statuses: Dict[int, int] = {}
+
+    def as_dict(self) -> Dict[str, object]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "in_flight": self.in_flight,
+            "peak_in_flight": self.peak_in_flight,
+            "seconds": self.seconds,
+            "statuses": dict(self.statuses),
+        }
+
+
+class SharedTransport:
+    """
+    Gemeinsame Verbindungspools für alle generierten Clients, eingehängt über Configuration.transport
+    Clients mit denselben Pool-, TLS- und Proxy-Einstellungen (http2, connection_pool_maxsize, Keep-Alive,
+    SSL-Kontext, proxy, ...) teilen sich einen Pool, für abweichende Einstellungen entsteht ein eigener. So gilt
+    jede Einstellung der Configuration auch am Transport. Ohne Configuration.ssl_context bekommt ein Client den
+    geteilten Kontext aus ssl_contexts. Dazu kommen Limits pro Host (max_connections_per_host des Clients) und
+    Metriken pro Host über alle Clients. Header, Auth, Timeouts und Rate Limiter bleiben beim jeweiligen Client.
+    """
+
+    def __init__(self):
+        self._pools: Dict[tuple, httpx.AsyncClient] = {}
+        self._pool_lock = threading.Lock()
+        self._host_slots: Dict[Tuple[str, int], asyncio.Semaphore] = {}
+        self._metrics: Dict[str, HostMetrics] = {}
+
+    def ssl_context(self, configuration) -> ssl.SSLContext:
+        """SSL-Kontext für einen Client ohne Configuration.ssl_context"""
+        return ssl_contexts.for_configuration(configuration)
+
+    def get_pool_manager(self, client) -> httpx.AsyncClient:
+        """Pool für die Einstellungen eines RESTClientObject, beim ersten Client mit diesen Einstellungen angelegt"""
+        limits = client.limits
+        key = (client.http2, limits.max_connections, limits.max_keepalive_connections, limits.keepalive_expiry,
+               client.ssl_context, client.proxy, tuple(sorted((client.proxy_headers or {}).items())))
+        pool_manager = self._pools.get(key)
+        if pool_manager is None:
+            with self._pool_lock:
+                pool_manager = self._pools.get(key)
+                if pool_manager is None:
+                    pool_manager = self._pools[key] = self._create_pool_manager(client)
+        return pool_manager
+
+    def _create_pool_manager(self, client) -> httpx.AsyncClient:
+        http2 = client.http2
+        if http2 and importlib.util.find_spec("h2") is None:
+            logger.warning("HTTP/2 requires the h2 package (pip install httpx[http2]), using HTTP/1.1")
+            http2 = False
+        proxy = httpx.Proxy(url=client.proxy, headers=client.proxy_headers) if client.proxy else None
+        return httpx.AsyncClient(limits=client.limits, timeout=client.timeout, http2=http2, proxy=proxy, verify=client.ssl_context,
+                                 trust_env=True)
+
+    async def send(self, client, url: str, args: dict) -> httpx.Response:
+        """Schickt einen Request von RESTClientObject.request über den Pool für die Einstellungen des Clients"""
+        pool_manager = self.get_pool_manager(client)
+        host = urlsplit(url).netloc
+        metrics = self._metrics.get(host) or self._metrics.setdefault(host, HostMetrics())
+        slots = nullcontext()
+        limit = client.max_connections_per_host
+        if limit is not None:
+            # Clients mit demselben Limit für einen Host teilen es sich
+            slots = self._host_slots.get((host, limit)) or self._host_slots.setdefault((host, limit), asyncio.Semaphore(limit))
+
+        async with slots:
+            metrics.requests += 1
+            metrics.in_flight += 1
+            metrics.peak_in_flight = max(metrics.peak_in_flight, metrics.in_flight)
+            start = monotonic()
+            try:
+                response = await pool_manager.request(**args)
+            except Exception:
+                metrics.errors += 1
+                raise
+            finally:
+                metrics.in_flight -= 1
+                metrics.seconds += monotonic() - start
+        metrics.statuses[response.status_code] = metrics.statuses.get(response.status_code, 0) + 1
+        return response
+
+    def metrics(self) -> Dict[str, Dict[str, object]]:
+        return {host: metrics.as_dict() for host, metrics in self._metrics.items()}
+
+    async def close(self):
+        with self._pool_lock:
+            pool_managers, self._pools = list(self._pools.values()), {}
+        for pool_manager in pool_managers:
+            await pool_manager.aclose()
+
+
+# Pool-Einstellungen der Tool-Clients aus der Umgebung: Variable → (Attribut der Configuration, Typ)
+ENVIRONMENT = {
+    "UPSTREAM_HTTP2": ("http2", lambda value: value.lower() in ("1", "true", "yes")),
+    "UPSTREAM_MAX_CONNECTIONS": ("connection_pool_maxsize", int),
+    "UPSTREAM_MAX_KEEPALIVE_CONNECTIONS": ("max_keepalive_connections", int),
+    "UPSTREAM_KEEPALIVE_EXPIRY": ("keepalive_expiry", float),
+    "UPSTREAM_MAX_CONNECTIONS_PER_HOST": ("max_connections_per_host", int),
+    "UPSTREAM_TIMEOUT": ("timeout", float),
+}
+
+
+def configure_from_environment(configuration, environ: Mapping[str, str] = os.environ):
+    """Übernimmt die gesetzten UPSTREAM_*-Variablen (siehe ENVIRONMENT) in eine Configuration der generierten Clients"""
+    for variable, (attribute, convert) in ENVIRONMENT.items():
+        value = environ.get(variable)
+        if value:
+            setattr(configuration, attribute, convert(value))
+
+
+# Der Transport, den sich die Clients der Tool-Module teilen
+shared_transport = SharedTransport()
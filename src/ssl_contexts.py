@@ -0,0 +1,55 @@
+import importlib.util
+import ssl
+import threading
+from typing import Dict, Optional, Tuple, Union
+
+# (cafile, cadata, cert_file, key_file, verify_ssl, http2)
+Key = Tuple[Optional[str], Optional[Union[str, bytes]], Optional[str], Optional[str], bool, bool]
+
+_contexts: Dict[Key, ssl.SSLContext] = {}
+_lock = threading.Lock()
+
+
+def ssl_context(cafile: Optional[str] = None, cadata: Optional[Union[str, bytes]] = None, cert_file: Optional[str] = None,
+                key_file: Optional[str] = None, verify_ssl: bool = True, http2: bool = False) -> ssl.SSLContext:
+    """
+    SSL-Kontext für diese TLS-Einstellungen, einmal pro Prozess angelegt
+    Ohne cafile und cadata lädt ssl.create_default_context das ganze CA-Bundle des Systems, das kostet je Kontext
+    einige zehn Millisekunden und mehrere MB. Alle generierten Clients mit denselben Einstellungen teilen sich
+    daher einen Kontext, der danach nicht mehr verändert werden darf. Geänderte Dateien liest erst clear() neu ein.
+    Einzige Ausnahme: httpcore setzt bei jedem Verbindungsaufbau die ALPN-Protokolle des Kontexts passend zu http2.
+    Deshalb gibt es je http2 einen eigenen Kontext, auf dem die Protokolle schon so gesetzt sind.
+    """
+    key = (cafile, cadata, cert_file, key_file, verify_ssl, http2)
+    context = _contexts.get(key)
+    if context is None:
+        with _lock:
+            context = _contexts.get(key)
+            if context is None:
+                context = _contexts[key] = _create(*key)
+    return context
+
+
+def for_configuration(configuration) -> ssl.SSLContext:
+    """Geteilter Kontext für die TLS-Einstellungen einer Configuration der generierten Clients, für configuration.ssl_context"""
+    # Ohne das h2-Paket fällt der Client auf HTTP/1.1 zurück, dazu muss der Kontext passen
+    http2 = configuration.http2 and importlib.util.find_spec("h2") is not None
+    return ssl_context(cafile=configuration.ssl_ca_cert, cadata=configuration.ca_cert_data, cert_file=configuration.cert_file,
+                       key_file=configuration.key_file, verify_ssl=configuration.verify_ssl, http2=http2)
+
+
+def _create(cafile, cadata, cert_file, key_file, verify_ssl, http2) -> ssl.SSLContext:
+    context = ssl.create_default_context(cafile=cafile, cadata=cadata)
+    # Wie httpcore beim Verbindungsaufbau, damit dessen set_alpn_protocols nichts mehr ändert
+    context.set_alpn_protocols(["http/1.1", "h2"] if http2 else ["http/1.1"])
+    if cert_file:
+        context.load_cert_chain(cert_file, keyfile=key_file)
+    if not verify_ssl:
+        context.check_hostname = False
+        context.verify_mode = ssl.CERT_NONE
+    return context
+
+
+def clear():
+    with _lock:
+        _contexts.clear()
@@ -1,34 +1,56 @@
 import os
+from functools import partial
 from typing import Annotated, Optional
 
 from mcp.types import ToolExecution, CallToolResult, TextContent
 from pydantic import Field
 from server import mcp
 
+from src import ssl_contexts
 from src.discord_client.api.default_api import DefaultApi
 from src.discord_client.api_client import ApiClient
 from src.discord_client.configuration import Configuration
 from src.discord_client.models import CreateThreadRequest, CreateForumThreadRequest, \
     CreateTextThreadWithoutMessageRequest
-from src.rate_limiter import rate_limit
+from src.model_codec import ModelCodec
+from src.passthrough import passthrough
+from src.rate_limiter import rate_limit, session_tool_key, upstream_tool_budget
 from src.sanitize_output import sanitize_output
+from src.shared_transport import configure_from_environment, shared_transport
+from src.upstream_clients import UpstreamClient
+from src.upstream_rate_limiter import DiscordRateLimiter
 
-bot_token = os.environ.get("DISCORD_BOT")
-if not bot_token:
-    raise ValueError("DISCORD_BOT environment variable is required but not set")
 
-config = Configuration(
-    host = "https://discord.com/api/v10",
-    api_key={"BotToken": "Bot " + bot_token}
-)
-api_client = ApiClient(configuration=config)
-api = DefaultApi(api_client=api_client)
+def create_api_client(rate_limiter: DiscordRateLimiter) -> ApiClient:
+    bot_token = os.environ.get("DISCORD_BOT")
+    if not bot_token:
+        raise ValueError("DISCORD_BOT environment variable is required but not set")
+
+    config = Configuration(
+        host = "https://discord.com/api/v10",
+        api_key={"BotToken": "Bot " + bot_token}
+    )
+    config.rate_limiter = rate_limiter
+    config.transport = shared_transport
+    configure_from_environment(config)
+    config.ssl_context = ssl_contexts.for_configuration(config)
+    config.codec = ModelCodec.for_client(ApiClient)
+    return ApiClient(configuration=config)
+
+
+# Außerhalb des Clients, damit die gelernten Budgets ein Neuanlegen des Clients (siehe lifespan) überdauern
+discord_limiter = DiscordRateLimiter()
+discord = UpstreamClient("discord", partial(create_api_client, discord_limiter))
+api = discord.api(DefaultApi)
+
+# Je Session ein eigenes Kontingent, alle Sessions zusammen nicht mehr Aufrufe als vorher je Tool
+discord_budget = upstream_tool_budget("discord")
 
 snowflake_pattern = "^(0|[1-9][0-9]*)$"
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[discord_budget])
+@sanitize_output(stream=True)
 async def list_my_guilds(before: Annotated[Optional[str], Field(pattern=snowflake_pattern)] = None, after: Annotated[Optional[str], Field(pattern=snowflake_pattern)] = None, limit: Annotated[Optional[int], Field(gt=0,le=200)] = None, with_counts: Optional[bool] = None):
     try:
         guilds = await api.list_my_guilds(before=before, after=after, limit=limit, with_counts=with_counts)
@@ -36,9 +58,9 @@ async def list_my_guilds(before: Annotated[Optional[str], Field(pattern=snowflak
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[discord_budget])
+@sanitize_output(stream=True)
 async def list_guild_channels(guild_id: Annotated[str, Field(pattern=snowflake_pattern)]):
     try:
         channels = await api.list_guild_channels(guild_id=guild_id)
@@ -47,19 +69,20 @@ async def list_guild_channels(guild_id: Annotated[str, Field(pattern=snowflake_p
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[discord_budget])
+@sanitize_output(stream=True)
 async def list_messages(channel_id: Annotated[str, Field(pattern=snowflake_pattern)], around: Annotated[Optional[str], Field(pattern=snowflake_pattern)] = None, before: Annotated[Optional[str], Field(pattern=snowflake_pattern)] = None, after: Annotated[Optional[str], Field(pattern=snowflake_pattern)] = None, limit: Annotated[Optional[int], Field(gt=0,le=100)] = None):
     try:
-        messages = await api.list_messages(channel_id=channel_id, around=around, before=before, after=after, limit=limit)
+        with passthrough():
+            messages = await api.list_messages(channel_id=channel_id, around=around, before=before, after=after, limit=limit)
         return messages
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[discord_budget])
+@sanitize_output()
 async def create_thread(channel_id: Annotated[str, Field(pattern=snowflake_pattern)], thread: CreateForumThreadRequest | CreateTextThreadWithoutMessageRequest):
     try:
         thread = await api.create_thread(channel_id=channel_id, create_thread_request={"actual_instance": thread})
@@ -67,9 +90,9 @@ async def create_thread(channel_id: Annotated[str, Field(pattern=snowflake_patte
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[discord_budget])
+@sanitize_output(stream=True)
 async def list_guild_invites(guild_id: Annotated[str, Field(pattern=snowflake_pattern)]):
     try:
         invites = await api.list_guild_invites(guild_id=guild_id)
@@ -1,22 +1,41 @@
 from datetime import date
 from enum import Enum
+from functools import partial
 from typing import Annotated, Optional
 
 from mcp.types import CallToolResult, TextContent
 from pydantic import Field
 
 from server import mcp
+from src import ssl_contexts
 from src.eve_client.api.universe_api import UniverseApi
 from src.eve_client.api_client import ApiClient
 from src.eve_client.configuration import Configuration
-from src.rate_limiter import rate_limit
+from src.model_codec import ModelCodec
+from src.passthrough import passthrough
+from src.rate_limiter import rate_limit, session_tool_key, upstream_tool_budget
 from src.sanitize_output import sanitize_output
+from src.shared_transport import configure_from_environment, shared_transport
+from src.upstream_clients import UpstreamClient
+from src.upstream_rate_limiter import EsiRateLimiter
 
-config = Configuration(
-    host = "https://esi.evetech.net"
-)
-api_client = ApiClient(configuration=config)
-api = UniverseApi(api_client=api_client)
+
+def create_api_client(rate_limiter: EsiRateLimiter) -> ApiClient:
+    config = Configuration(
+        host = "https://esi.evetech.net"
+    )
+    config.rate_limiter = rate_limiter
+    config.transport = shared_transport
+    configure_from_environment(config)
+    config.ssl_context = ssl_contexts.for_configuration(config)
+    config.codec = ModelCodec.for_client(ApiClient)
+    return ApiClient(configuration=config)
+
+
+# Außerhalb des Clients, damit die gelernten Budgets ein Neuanlegen des Clients (siehe lifespan) überdauern
+esi_limiter = EsiRateLimiter()
+eve = UpstreamClient("eve", partial(create_api_client, esi_limiter))
+api = eve.api(UniverseApi)
 
 class CompatibilityDate(Enum):
     DATE_2025_11_06 = "2025-11-06"
@@ -32,46 +51,54 @@ class AcceptLanguage(Enum):
     ES = "es"
 
 
-@rate_limit()
-@sanitize_output()
+# Je Session ein eigenes Kontingent, alle Sessions zusammen nicht mehr Aufrufe als vorher je Tool
+eve_budget = upstream_tool_budget("eve")
+
+
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[eve_budget])
+@sanitize_output()
 async def get_universe_categories_category_id(category_id: Annotated[int, Field(description="An Eve item category ID")], x_compatibility_date: Annotated[CompatibilityDate, Field(description="The compatibility date for the request.", )], accept_language: Annotated[AcceptLanguage, Field(description="The language to use for the response.")] = AcceptLanguage.EN, if_none_match: Annotated[Optional[str], Field(description="The ETag of the previous request. A 304 will be returned if this matches the current ETag.")] = None, x_tenant: Annotated[str, Field(description="The tenant ID for the request.")] = "tranquility"):
     """Get information of an item category. This route expires daily at 11:05"""
     try:
-        categories = await api.get_universe_categories_category_id(category_id=category_id, x_compatibility_date=x_compatibility_date.value, accept_language=accept_language.value, if_none_match=if_none_match, x_tenant=x_tenant)
+        with passthrough():
+            categories = await api.get_universe_categories_category_id(category_id=category_id, x_compatibility_date=x_compatibility_date.value, accept_language=accept_language.value, if_none_match=if_none_match, x_tenant=x_tenant)
         return categories
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[eve_budget])
+@sanitize_output()
 async def get_universe_groups_group_id(group_id: Annotated[int, Field(description="An Eve item group ID")], x_compatibility_date: Annotated[CompatibilityDate, Field(description="The compatibility date for the request.")], accept_language: Annotated[AcceptLanguage, Field(description="The language to use for the response.")] = AcceptLanguage.EN, if_none_match: Annotated[Optional[str], Field(description="The ETag of the previous request. A 304 will be returned if this matches the current ETag.")] = None, x_tenant: Annotated[str, Field(description="The tenant ID for the request.")] = "tranquility"):
     """Get information on an item group. This route expires daily at 11:05"""
     try:
-        groups = await api.get_universe_groups_group_id(group_id=group_id, x_compatibility_date=x_compatibility_date.value, accept_language=accept_language.value, if_none_match=if_none_match, x_tenant=x_tenant)
+        with passthrough():
+            groups = await api.get_universe_groups_group_id(group_id=group_id, x_compatibility_date=x_compatibility_date.value, accept_language=accept_language.value, if_none_match=if_none_match, x_tenant=x_tenant)
         return groups
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[eve_budget])
+@sanitize_output()
 async def post_universe_ids(ids: Annotated[list[str], Field(description="")], x_compatibility_date: Annotated[CompatibilityDate, Field(description="The compatibility date for the request.")], accept_language: Annotated[AcceptLanguage, Field(description="The language to use for the response.")] = AcceptLanguage.EN, if_none_match: Annotated[Optional[str], Field(description="The ETag of the previous request. A 304 will be returned if this matches the current ETag.")] = None, x_tenant: Annotated[str, Field(description="The tenant ID for the request.")] = "tranquility"):
     """Resolve a set of names to IDs in the following categories: agents, alliances, characters, constellations, corporations factions, inventory_types, regions, stations, and systems. Only exact matches will be returned. All names searched for are cached for 12 hours"""
     try:
-        names = await api.post_universe_ids(request_body=ids, x_compatibility_date=x_compatibility_date.value, accept_language=accept_language.value, if_none_match=if_none_match, x_tenant=x_tenant)
+        with passthrough():
+            names = await api.post_universe_ids(request_body=ids, x_compatibility_date=x_compatibility_date.value, accept_language=accept_language.value, if_none_match=if_none_match, x_tenant=x_tenant)
         return names
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[eve_budget])
+@sanitize_output()
 async def get_universe_types_type_id(type_id: Annotated[int, Field(description="An Eve item type ID")], x_compatibility_date: Annotated[CompatibilityDate, Field(description="The compatibility date for the request.")], accept_language: Annotated[AcceptLanguage, Field(description="The language to use for the response.")] = AcceptLanguage.EN, if_none_match: Annotated[Optional[str], Field(description="The ETag of the previous request. A 304 will be returned if this matches the current ETag.")] = None, x_tenant: Annotated[str, Field(description="The tenant ID for the request.")] = "tranquility"):
     """Get information on a type. This route expires daily at 11:05"""
     try:
-        types = await api.get_universe_types_type_id(type_id=type_id, x_compatibility_date=x_compatibility_date.value, accept_language=accept_language.value, if_none_match=if_none_match, x_tenant=x_tenant)
+        with passthrough():
+            types = await api.get_universe_types_type_id(type_id=type_id, x_compatibility_date=x_compatibility_date.value, accept_language=accept_language.value, if_none_match=if_none_match, x_tenant=x_tenant)
         return types
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
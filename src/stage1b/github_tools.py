@@ -1,36 +1,71 @@
 import os
 from datetime import date
 from enum import Enum
+from functools import partial
 from typing import Annotated, Optional, List
 
 from mcp.types import TextContent, CallToolResult
 from pydantic import Field, BaseModel
 
 from server import mcp
+from src import ssl_contexts
 from src.github_client.api.activity_api import ActivityApi
 from src.github_client.api.issues_api import IssuesApi
 from src.github_client.api.repos_api import ReposApi
 from src.github_client.api_client import ApiClient
 from src.github_client.configuration import Configuration
 from src.github_client.models import issues_create_request
-from src.rate_limiter import rate_limit
+from src.model_codec import ModelCodec
+from src.passthrough import ALL_FIELDS, passthrough, projection
+from src.rate_limiter import rate_limit, session_tool_key, upstream_tool_budget
 from src.sanitize_output import sanitize_output
+from src.shared_transport import configure_from_environment, shared_transport
+from src.upstream_clients import UpstreamClient
+from src.upstream_rate_limiter import GitHubRateLimiter
+
+
+def create_api_client(rate_limiter: GitHubRateLimiter) -> ApiClient:
+    pat = os.environ.get("GITHUB_PAT")
+    if not pat:
+        raise ValueError("GITHUB_PAT environment variable is required but not set")
+
+    config = Configuration(
+        host = "https://api.github.com"
+    )
+    config.rate_limiter = rate_limiter
+    config.transport = shared_transport
+    configure_from_environment(config)
+    config.ssl_context = ssl_contexts.for_configuration(config)
+    config.codec = ModelCodec.for_client(ApiClient)
+    return ApiClient(
+        configuration=config,
+        header_name="Authorization",
+        header_value=f"Bearer {pat}"
+    )
+
+
+# Außerhalb des Clients, damit die gelernten Budgets ein Neuanlegen des Clients (siehe lifespan) überdauern
+github_limiter = GitHubRateLimiter()
+github = UpstreamClient("github", partial(create_api_client, github_limiter))
+reposApi = github.api(ReposApi)
+issuesApi = github.api(IssuesApi)
+activityApi = github.api(ActivityApi)
+
+# Felder, die die Tools liefern, wenn der Client keine angibt (siehe projection)
+ISSUE_FIELDS = ["number", "title", "state", "state_reason", "user.login", "labels.name", "assignees.login", "comments",
+                "created_at", "updated_at", "closed_at", "html_url", "pull_request.html_url", "body"]
+REPOSITORY_FIELDS = ["full_name", "description", "html_url", "language", "topics", "stargazers_count", "forks_count",
+                     "open_issues_count", "archived", "updated_at"]
+
+
+def fields_description(default: List[str]) -> str:
+    return (f"Fields to return for each item, nested fields separated by a dot (e.g. `user.login`). "
+            f"`{ALL_FIELDS}` returns all fields. Default: {', '.join(default)}")
+
+
+# Je Session ein eigenes Kontingent, alle Sessions zusammen nicht mehr Aufrufe als vorher je Tool
+github_budget = upstream_tool_budget("github")
 
-pat = os.environ.get("GITHUB_PAT")
-if not pat:
-    raise ValueError("GITHUB_PAT environment variable is required but not set")
-
-config = Configuration(
-    host = "https://api.github.com"
-)
-api_client = ApiClient(
-    configuration=config,
-    header_name="Authorization",
-    header_value=f"Bearer {pat}"
-)
-reposApi = ReposApi(api_client=api_client)
-issuesApi = IssuesApi(api_client=api_client)
-activityApi = ActivityApi(api_client=api_client)
 
 class Sort(Enum):
     CREATED = "created"
@@ -93,10 +128,10 @@ class Milestone(BaseModel):
     due_on: Annotated[str | None, Field(examples=["2012-10-09T23:39:01Z"])]
 
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
-async def issues_list_for_repo(owner: Annotated[str, Field(description="The account owner of the repository. The name is not case sensitive.")], repo: Annotated[str, Field(description="The name of the repository without the `.git` extension. The name is not case sensitive.")], milestone: Annotated[Optional[Milestone], Field(description="A collection of related issues and pull requests.")] = None, state: Annotated[Optional[State], Field(description="")] = None, assignee: Annotated[Optional[str], Field(description="Can be the name of a user. Pass in `none` for issues with no assigned user, and `*` for issues assigned to any user.")] = None, issue_type: Annotated[Optional[str], Field(description="Can be the name of an issue type. If the string `*` is passed, issues with any type are accepted. If the string `none` is passed, issues without type are returned.")] = None, creator: Annotated[Optional[str], Field(description="The user that created the issue.")] = None, mentioned: Annotated[Optional[str], Field(description="A user that's mentioned in the issue.")] = None, labels: Annotated[Optional[str], Field(description="A list of comma separated label names. Example: `bug,ui,@high`")] = None, sort: Annotated[Optional[Sort], Field(description="The property to sort the results by.")] = Sort.CREATED, since: Annotated[Optional[str], Field(description="Only show results that were last updated after the given time. This is a timestamp in [ISO 8601](https://en.wikipedia.org/wiki/ISO_8601) format: `YYYY-MM-DDTHH:MM:SSZ`.")] = None, direction: Annotated[Optional[Direction], Field(description="The direction to sort the results by.")] = Direction.DESC, per_page: Annotated[Optional[int], Field(description="The number of results per page (max 100). For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 30, page: Annotated[Optional[int], Field(description="The page number of the results to fetch. For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 1):
+@rate_limit(key=session_tool_key, parents=[github_budget])
+@sanitize_output(stream=True)
+async def issues_list_for_repo(owner: Annotated[str, Field(description="The account owner of the repository. The name is not case sensitive.")], repo: Annotated[str, Field(description="The name of the repository without the `.git` extension. The name is not case sensitive.")], milestone: Annotated[Optional[Milestone], Field(description="A collection of related issues and pull requests.")] = None, state: Annotated[Optional[State], Field(description="")] = None, assignee: Annotated[Optional[str], Field(description="Can be the name of a user. Pass in `none` for issues with no assigned user, and `*` for issues assigned to any user.")] = None, issue_type: Annotated[Optional[str], Field(description="Can be the name of an issue type. If the string `*` is passed, issues with any type are accepted. If the string `none` is passed, issues without type are returned.")] = None, creator: Annotated[Optional[str], Field(description="The user that created the issue.")] = None, mentioned: Annotated[Optional[str], Field(description="A user that's mentioned in the issue.")] = None, labels: Annotated[Optional[str], Field(description="A list of comma separated label names. Example: `bug,ui,@high`")] = None, sort: Annotated[Optional[Sort], Field(description="The property to sort the results by.")] = Sort.CREATED, since: Annotated[Optional[str], Field(description="Only show results that were last updated after the given time. This is a timestamp in [ISO 8601](https://en.wikipedia.org/wiki/ISO_8601) format: `YYYY-MM-DDTHH:MM:SSZ`.")] = None, direction: Annotated[Optional[Direction], Field(description="The direction to sort the results by.")] = Direction.DESC, per_page: Annotated[Optional[int], Field(description="The number of results per page (max 100). For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 30, page: Annotated[Optional[int], Field(description="The page number of the results to fetch. For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 1, fields: Annotated[Optional[List[str]], Field(description=fields_description(ISSUE_FIELDS))] = None):
     """
     List issues in a repository. Only open issues will be listed.
 
@@ -111,7 +146,9 @@ async def issues_list_for_repo(owner: Annotated[str, Field(description="The acco
         - **`application/vnd.github.full+json`**: Returns raw, text, and HTML representations. Response will include `body`, `body_text`, and `body_html`.
     """
     try:
-        issues = await issuesApi.issues_list_for_repo(owner=owner, repo=repo, milestone=milestone, state=state.value, assignee=assignee, type=issue_type, creator=creator, mentioned=mentioned, labels=labels, sort=sort.value, direction=direction.value, since=since, per_page=per_page, page=page)
+        # Die Issues gehen nur an den Client weiter, daher ohne Modelle (siehe passthrough), außer für die Projektion
+        with passthrough(), projection(ISSUE_FIELDS if fields is None else fields):
+            issues = await issuesApi.issues_list_for_repo(owner=owner, repo=repo, milestone=milestone, state=state.value, assignee=assignee, type=issue_type, creator=creator, mentioned=mentioned, labels=labels, sort=sort.value, direction=direction.value, since=since, per_page=per_page, page=page)
         return issues
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
@@ -134,9 +171,9 @@ class CreateIssueRequest(BaseModel):
     issue_type: Annotated[Optional[str], Field(description="The name of the issue type to associate with this issue. _NOTE: Only users with push access can set the type for new issues. The type is silently dropped otherwise._")] = None
 
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[github_budget])
+@sanitize_output()
 async def issues_create(owner: Annotated[str, Field(description="The account owner of the repository. The name is not case sensitive.")], repo: Annotated[str, Field(description="The name of the repository without the `.git` extension. The name is not case sensitive.")], issue: CreateIssueRequest):
     """
     Any user with pull access to a repository can create an issue. If [issues are disabled in the repository](https://docs.github.com/articles/disabling-issues/), the API returns a `410 Gone` status.
@@ -165,9 +202,9 @@ async def issues_create(owner: Annotated[str, Field(description="The account own
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[github_budget])
+@sanitize_output(stream=True)
 async def issues_list_labels_for_repo(owner: Annotated[str, Field(description="The account owner of the repository. The name is not case sensitive.")], repo: Annotated[str, Field(description="The name of the repository without the `.git` extension. The name is not case sensitive.")], per_page: Annotated[Optional[int], Field(description="The number of results per page (max 100). For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 30, page: Annotated[Optional[int], Field(description="The page number of the results to fetch. For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 1):
     """Lists all labels for a repository."""
     try:
@@ -176,9 +213,9 @@ async def issues_list_labels_for_repo(owner: Annotated[str, Field(description="T
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[github_budget])
+@sanitize_output(stream=True)
 async def repos_list_branches(owner: Annotated[str, Field(description="The account owner of the repository. The name is not case sensitive.")], repo: Annotated[str, Field(description="The name of the repository without the `.git` extension. The name is not case sensitive.")], protected: Annotated[Optional[bool], Field(description="Setting to `true` returns only branches protected by branch protections or rulesets. When set to `false`, only unprotected branches are returned. Omitting this parameter returns all branches.")], per_page: Annotated[Optional[int], Field(description="The number of results per page (max 100). For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 30, page: Annotated[Optional[int], Field(description="The page number of the results to fetch. For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 1):
     # Hier gibt es keine Beschrebung
     try:
@@ -187,9 +224,9 @@ async def repos_list_branches(owner: Annotated[str, Field(description="The accou
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[github_budget])
+@sanitize_output()
 async def repos_get_branch_protection(owner: Annotated[str, Field(description="The account owner of the repository. The name is not case sensitive.")], repo: Annotated[str, Field(description="The name of the repository without the `.git` extension. The name is not case sensitive.")], branch: Annotated[str, Field(description="The name of the branch. Cannot contain wildcard characters. To use wildcard characters in branch names, use [the GraphQL API](https://docs.github.com/graphql).")]):
     """
     Protected branches are available in public repositories with GitHub
@@ -204,10 +241,10 @@ async def repos_get_branch_protection(owner: Annotated[str, Field(description="T
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
-async def activity_list_repos_starred_by_authenticated_user(sort: Annotated[Optional[Sort], Field(description="The property to sort the results by.")] = Sort.CREATED, direction: Annotated[Optional[Direction], Field(description="The direction to sort the results by.")] = Direction.DESC, per_page: Annotated[Optional[int], Field(description="The number of results per page (max 100). For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 30, page: Annotated[Optional[int], Field(description="The page number of the results to fetch. For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 1):
+@rate_limit(key=session_tool_key, parents=[github_budget])
+@sanitize_output(stream=True)
+async def activity_list_repos_starred_by_authenticated_user(sort: Annotated[Optional[Sort], Field(description="The property to sort the results by.")] = Sort.CREATED, direction: Annotated[Optional[Direction], Field(description="The direction to sort the results by.")] = Direction.DESC, per_page: Annotated[Optional[int], Field(description="The number of results per page (max 100). For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 30, page: Annotated[Optional[int], Field(description="The page number of the results to fetch. For more information,see '[Using pagination in the REST API](https://docs.github.com/rest/using-the-rest-api/using-pagination-in-the-rest-api).'")] = 1, fields: Annotated[Optional[List[str]], Field(description=fields_description(REPOSITORY_FIELDS))] = None):
     """
     Lists repositories the authenticated user has starred.
 
@@ -216,7 +253,8 @@ async def activity_list_repos_starred_by_authenticated_user(sort: Annotated[Opti
         - **`application/vnd.github.star+json`**: Includes a timestamp of when the star was created.
     """
     try:
-        repos = await activityApi.activity_list_repos_starred_by_authenticated_user(sort=sort.value, direction=direction.value, per_page=per_page, page=page)
+        with projection(REPOSITORY_FIELDS if fields is None else fields):
+            repos = await activityApi.activity_list_repos_starred_by_authenticated_user(sort=sort.value, direction=direction.value, per_page=per_page, page=page)
         return repos
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
\ No newline at end of file
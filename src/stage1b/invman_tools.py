@@ -6,6 +6,7 @@ from mcp.types import CallToolResult, TextContent
 from pydantic import Field, BaseModel
 from server import mcp
 
+from src import ssl_contexts
 from src.invman_client.api.business_partners_api import BusinessPartnersApi
 from src.invman_client.api.files_api import FilesApi
 from src.invman_client.api.invoice_positions_api import InvoicePositionsApi
@@ -14,19 +15,36 @@ from src.invman_client.api.invoices_api import InvoicesApi
 from src.invman_client.api.sales_taxes_api import SalesTaxesApi
 from src.invman_client.api_client import ApiClient
 from src.invman_client.configuration import Configuration
-from src.rate_limiter import rate_limit
+from src.model_codec import ModelCodec
+from src.passthrough import passthrough
+from src.rate_limiter import rate_limit, session_tool_key, upstream_tool_budget
 from src.sanitize_output import sanitize_output
+from src.shared_transport import configure_from_environment, shared_transport
+from src.upstream_clients import UpstreamClient
 
-config = Configuration(
-    host = "http://localhost:8080/invoice-manager-server"
-)
-api_client = ApiClient(configuration=config)
-business_partner_api = BusinessPartnersApi(api_client=api_client)
-files_Api = FilesApi(api_client=api_client)
-invoice_positions_api = InvoicePositionsApi(api_client=api_client)
-invoice_template_api = InvoiceTemplatesApi(api_client=api_client)
-invoices_api = InvoicesApi(api_client=api_client)
-sales_taxes_api = SalesTaxesApi(api_client=api_client)
+
+def create_api_client() -> ApiClient:
+    config = Configuration(
+        host = "http://localhost:8080/invoice-manager-server"
+    )
+    config.transport = shared_transport
+    configure_from_environment(config)
+    config.ssl_context = ssl_contexts.for_configuration(config)
+    config.codec = ModelCodec.for_client(ApiClient)
+    return ApiClient(configuration=config)
+
+
+invman = UpstreamClient("invman", create_api_client)
+business_partner_api = invman.api(BusinessPartnersApi)
+files_Api = invman.api(FilesApi)
+invoice_positions_api = invman.api(InvoicePositionsApi)
+invoice_template_api = invman.api(InvoiceTemplatesApi)
+invoices_api = invman.api(InvoicesApi)
+sales_taxes_api = invman.api(SalesTaxesApi)
+
+
+# Je Session ein eigenes Kontingent, alle Sessions zusammen nicht mehr Aufrufe als vorher je Tool
+invman_budget = upstream_tool_budget("invman")
 
 
 class Invoice(BaseModel):
@@ -47,20 +65,21 @@ class Invoice(BaseModel):
     file: Optional[int] = None
 
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[invman_budget])
+@sanitize_output(stream=True)
 async def get_all_invoices(paid: Annotated[Optional[bool], Field(description="Filter invoices by paid status")] = None, customer_number: Annotated[Optional[int], Field(description="Filter invoices by customer number")] = None, receiver_id: Annotated[Optional[int], Field(description="Filter invoices by receiver")] = None, order_number: Annotated[Optional[str], Field(description="Filter invoices by order number")] = None):
     """Get a list of all invoices with optional filters for paid status, customer number, receiver id, and order number."""
     try:
-        invoices = await invoices_api.get_all_invoices(paid=paid, customer_number=customer_number, receiver_id=receiver_id, order_number=order_number)
+        with passthrough():
+            invoices = await invoices_api.get_all_invoices(paid=paid, customer_number=customer_number, receiver_id=receiver_id, order_number=order_number)
         return invoices
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[invman_budget])
+@sanitize_output()
 async def create_invoice(invoice: Invoice):
     """Create a new invoice based on the provided invoice data."""
     invoice_data = {
@@ -85,9 +104,9 @@ async def create_invoice(invoice: Invoice):
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[invman_budget])
+@sanitize_output(stream=True)
 async def get_all_sales_taxes():
     """Get a list of all sales taxes."""
     try:
@@ -96,9 +115,9 @@ async def get_all_sales_taxes():
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[invman_budget])
+@sanitize_output(stream=True)
 async def get_all_business_partners(name: Annotated[Optional[str], Field(description="Filter business partners by name")] = None):
     """Get a list of all business partners with optional filter by name."""
     try:
@@ -107,9 +126,9 @@ async def get_all_business_partners(name: Annotated[Optional[str], Field(descrip
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[invman_budget])
+@sanitize_output(stream=True)
 async def get_all_invoice_templates():
     """Get a list of all invoice templates."""
     try:
@@ -134,9 +153,9 @@ class InvoicePosition(BaseModel):
     invoice: int
 
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[invman_budget])
+@sanitize_output()
 async def create_position(position: InvoicePosition):
     """Create a new invoice position based on the provided Invoice Position object."""
     position_data = {
@@ -152,9 +171,9 @@ async def create_position(position: InvoicePosition):
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[invman_budget])
+@sanitize_output()
 async def update_invoice_by_id(id: Annotated[int, Field(description="The id of the invoice")], invoice: Invoice):
     """Update the details of an existing invoice using its unique identifier."""
     try:
@@ -163,9 +182,9 @@ async def update_invoice_by_id(id: Annotated[int, Field(description="The id of t
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[invman_budget])
+@sanitize_output()
 async def get_invoice_pdf_by_id(id: Annotated[int, Field(description="The id of the invoice")]):
     """Generate a pdf file for the invoice with the given id and returns its unique identifier."""
     try:
@@ -174,9 +193,9 @@ async def get_invoice_pdf_by_id(id: Annotated[int, Field(description="The id of
     except Exception as e:
         return CallToolResult(content=[TextContent(type="text", text=str(e))], isError=True)
 
-@rate_limit()
-@sanitize_output()
 @mcp.tool()
+@rate_limit(key=session_tool_key, parents=[invman_budget])
+@sanitize_output()
 async def download_file_by_id(id: Annotated[int, Field(description="The id of the file")]):
     """Download a file by its unique identifier."""
     try:
@@ -0,0 +1,399 @@
+import json
+import os
+import subprocess
+import sys
+import asyncio
+import decimal
+import typing
+import unittest
+import uuid
+from datetime import date, datetime, timezone
+from enum import Enum
+
+import httpx
+from pydantic import BaseModel, SecretStr, ValidationError
+
+from eve_client.api.universe_api import UniverseApi
+from eve_client.api_client import ApiClient
+from eve_client.configuration import Configuration
+from eve_client.rest import RESTClientObject, RESTResponse
+from eve_client.exceptions import NotFoundException
+from github_client.api_client import ApiClient as GitHubApiClient
+from github_client.configuration import Configuration as GitHubConfiguration
+from github_client.models import DependabotAlertSecurityAdvisory
+from src import discord_client
+from src.discord_client.api_client import ApiClient as DiscordApiClient
+from src.discord_client.configuration import Configuration as DiscordConfiguration
+from src.discord_client.models import BaseCreateMessageCreateRequestComponentsInner, CreateForumThreadRequest, CreateThreadRequest, \
+    TextDisplayComponentForMessageRequest
+
+from src.model_codec import ModelCodec, _serialization_plan
+from src.passthrough import ALL_FIELDS, RawJson, passthrough, projection
+
+# Läuft in einem frischen Interpreter, damit keine bereits importierten Modelle das Ergebnis verfälschen
+DESERIALIZE = """
+import json, sys
+import httpx
+from eve_client.api_client import ApiClient
+from eve_client.rest import RESTResponse
+
+item = {"type_id": 587, "group_id": 25, "name": "Rifter", "description": "Frigate", "published": True,
+        "dogma_effects": [{"effect_id": 11, "is_default": False}]}
+response = RESTResponse(httpx.Response(200, json=[item]))
+response.data = response.response.content
+types = ApiClient().response_deserialize(response, {"200": "List[UniverseTypesTypeIdGet]"}).data
+models = sorted(name for name in sys.modules if name.startswith("eve_client.models."))
+print(json.dumps({"name": types[0].name, "effect": types[0].dogma_effects[0].effect_id, "models": models}))
+"""
+
+DEFAULT_API = """
+import json, sys
+from src.discord_client.api.default_api import DefaultApi
+from src.discord_client.api_client import ApiClient
+
+api = DefaultApi(ApiClient())
+methods = [api.list_messages, api.list_messages_with_http_info, api.list_messages_without_preload_content]
+try:
+    api.no_such_operation
+    missing = False
+except AttributeError:
+    missing = True
+apis = sorted(name for name in sys.modules if name.startswith("src.discord_client.api."))
+print(json.dumps({"methods": [method.__name__ for method in methods], "missing": missing, "apis": apis}))
+"""
+
+
+def run(code: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(["src", "."]))
+    output = subprocess.run([sys.executable, "-W", "ignore", "-c", code], env=env, stdout=subprocess.PIPE, text=True, check=True).stdout
+    return json.loads(output)
+
+
+def github_issue() -> dict:
+    repo = "https://api.github.com/repos/octocat/Hello-World"
+    return {"url": f"{repo}/issues/1", "repository_url": repo, "labels_url": repo, "comments_url": repo, "events_url": repo,
+            "html_url": repo, "id": 1, "node_id": "I_1", "number": 1, "title": "Bug", "user": {"login": "octocat", "id": 1},
+            "assignees": [], "milestone": None, "comments": 0, "created_at": "2011-04-22T13:33:48Z",
+            "updated_at": "2011-04-22T13:33:48Z", "author_association": "OWNER", "active_lock_reason": None, "body": None,
+            "reactions": {"url": repo, "total_count": 1, "+1": 1, "-1": 0, "laugh": 0, "hooray": 0, "confused": 0,
+                          "heart": 0, "rocket": 0, "eyes": 0},
+            "issue_field_values": [{"issue_field_id": 1, "node_id": "IFV_1", "data_type": "number", "value": 3}]}
+
+
+def codec_client(client_class=ApiClient, configuration_class=Configuration):
+    """Client mit ModelCodec, wie ihn die Tools bauen"""
+    config = configuration_class()
+    config.codec = ModelCodec.for_client(client_class)
+    return client_class(config)
+
+
+def sample_value(annotation, depth: int, filled: bool):
+    """Beispielwert für eine Annotation; optionale Felder nur bei filled und nicht zu tief, sonst None"""
+    origin, args = typing.get_origin(annotation), typing.get_args(annotation)
+    if origin is typing.Annotated:
+        return sample_value(args[0], depth, filled)
+    if origin is typing.Union:
+        options = [arg for arg in args if arg is not type(None)]
+        if len(options) < len(args) and (not filled or depth > 3):
+            return None
+        return sample_value(options[0], depth, filled)
+    if origin is typing.Literal:
+        return args[0]
+    if origin is list:
+        return [sample_value(args[0], depth + 1, filled)]
+    if origin is dict:
+        return {"key": sample_value(args[1], depth + 1, filled)}
+    if annotation in (typing.Any, object):
+        return {"any": [1, None]}
+    for kind, value in ((Enum, None), (bool, True), (int, 7), (float, 1.5), (str, "text"), (bytes, b"raw"),
+                        (datetime, datetime(2025, 8, 26, 12, 30, tzinfo=timezone.utc)), (date, date(2025, 8, 26)),
+                        (decimal.Decimal, decimal.Decimal("1.50")), (uuid.UUID, uuid.UUID(int=1))):
+        if issubclass(annotation, kind):
+            return next(iter(annotation)) if kind is Enum else value
+    return sample_model(annotation, depth + 1, filled)
+
+
+def sample_model(model_class: type, depth: int = 0, filled: bool = True) -> BaseModel:
+    """Instanz eines generierten Modells ohne Validierung, mit allen oder nur den Pflichtfeldern"""
+    fields = model_class.model_fields
+    if "actual_instance" in fields:
+        options = [field for name, field in fields.items() if name.startswith(("oneof_schema_", "anyof_schema_"))]
+        return model_class.model_construct(actual_instance=sample_value(options[0].annotation, depth, filled))
+    return model_class.model_construct(**{name: sample_value(field.annotation, depth, filled) if field.is_required() or filled and depth <= 3 else None
+                                          for name, field in fields.items()})
+
+
+class TestApiClient(unittest.TestCase):
+    def test_deserialize_imports_only_used_models(self):
+        result = run(DESERIALIZE)
+
+        self.assertEqual((result["name"], result["effect"]), ("Rifter", 11))
+        # Das Modell selbst und die Modelle seiner Felder, nicht die über 300 Modelle des Pakets
+        self.assertIn("eve_client.models.universe_types_type_id_get", result["models"])
+        self.assertLess(len(result["models"]), 5)
+
+    def test_default_api_loads_only_used_resources(self):
+        result = run(DEFAULT_API)
+
+        self.assertEqual(result["methods"], ["list_messages", "list_messages_with_http_info", "list_messages_without_preload_content"])
+        self.assertTrue(result["missing"])
+        self.assertEqual(result["apis"], ["src.discord_client.api.channels_api", "src.discord_client.api.default_api"])
+
+
+class TestDeserializer(unittest.TestCase):
+    def test_type_names_are_compiled_once(self):
+        client = codec_client()
+        deserializer = client.configuration.codec._deserializer
+        deserializer.cache_clear()
+
+        data = client.deserialize('{"a": [1, null, 2], "b": null}', "Dict[str, List[int]]", "application/json")
+        self.assertEqual(data, {"a": [1, None, 2], "b": None})
+        self.assertEqual(client.deserialize('["2025-08-26"]', "List[date]", "application/json"), [date(2025, 8, 26)])
+        client.deserialize('{"a": [3]}', "Dict[str, List[int]]", "application/json")
+
+        # Dict[...], List[int], int, List[date], date; der zweite Aufruf braucht nur noch den Cache
+        self.assertEqual(deserializer.cache_info().misses, 5)
+
+
+class TestSerializer(unittest.TestCase):
+    def test_models_serialize_like_to_dict(self):
+        # Wie FastMCP die Tool-Argumente validiert
+        request = CreateForumThreadRequest.model_validate({
+            "name": "Release notes", "auto_archive_duration": None, "applied_tags": ["1"],
+            "message": {"content": None, "flags": 4, "embeds": [{"title": "v1", "fields": [{"name": "a", "value": "b"}]}],
+                        "attachments": [{"id": "1", "description": None}], "poll": {"question": {"text": "?"}, "answers": [{"poll_media": {"text": "yes"}}]}}})
+        request.message.components = [BaseCreateMessageCreateRequestComponentsInner(actual_instance=TextDisplayComponentForMessageRequest(type=10, content="hi"))]
+
+        body = codec_client(DiscordApiClient, DiscordConfiguration).sanitize_for_serialization(CreateThreadRequest(actual_instance=request))
+
+        self.assertEqual(body, request.to_dict())
+        # Explizit auf None gesetzte nullable Felder gehen als null, die übrigen None-Felder fehlen
+        self.assertIsNone(body["auto_archive_duration"])
+        self.assertNotIn("rate_limit_per_user", body)
+        self.assertEqual(body["message"]["components"], [{"type": 10, "content": "hi"}])
+
+    def test_every_model_serializes_like_to_dict(self):
+        client, plain = codec_client(DiscordApiClient, DiscordConfiguration), DiscordApiClient()
+        compared = planned = 0
+        for name in discord_client.models._lazy_imports:
+            model_class = getattr(discord_client.models, name)
+            if not issubclass(model_class, BaseModel):
+                continue
+            planned += _serialization_plan(model_class) is not None
+            for filled in (True, False):
+                with self.subTest(model=name, filled=filled):
+                    obj = sample_model(model_class, filled=filled)
+                    try:
+                        expected = plain.sanitize_for_serialization(obj)
+                    except (AttributeError, TypeError):
+                        # to_dict selbst scheitert an den Beispielwerten, z.B. ein Wrapper ohne Inhalt
+                        continue
+                    self.assertEqual(client.sanitize_for_serialization(obj), expected)
+                    compared += 1
+
+        self.assertGreater(compared, 800)
+        self.assertGreater(planned, 400)
+
+    def test_read_only_fields_with_models(self):
+        # to_dict schließt readOnly-Felder aus, schreibt sie über den Override der Untermodelle aber wieder hinein
+        advisory = sample_model(DependabotAlertSecurityAdvisory)
+        advisory.cwes = []
+
+        body = codec_client(GitHubApiClient, GitHubConfiguration).sanitize_for_serialization(advisory)
+
+        self.assertEqual(body, GitHubApiClient().sanitize_for_serialization(advisory))
+        self.assertIn("identifiers", body)
+        self.assertNotIn("cwes", body)
+        self.assertNotIn("summary", body)
+
+    def test_unexpected_to_dict_falls_back(self):
+        class Thread(CreateForumThreadRequest):
+            def to_dict(self):
+                _dict = super().to_dict()
+                _dict["name"] = _dict["name"].upper()
+                return _dict
+
+        thread = Thread.model_validate({"name": "Release notes", "message": {"content": "hi"}})
+
+        self.assertIsNone(_serialization_plan(Thread))
+        self.assertEqual(codec_client(DiscordApiClient, DiscordConfiguration).sanitize_for_serialization(thread)["name"], "RELEASE NOTES")
+
+    def test_plain_values(self):
+        client = codec_client()
+        value = {"date": date(2025, 8, 26), "amount": decimal.Decimal("1.50"), "ids": (1, None), "secret": SecretStr("s")}
+
+        self.assertEqual(client.sanitize_for_serialization(value), {"date": "2025-08-26", "amount": "1.50", "ids": (1, None), "secret": "s"})
+
+
+class TestJsonFastPath(unittest.TestCase):
+    def deserialize(self, client, payload, response_type: str, content_type: str = "application/json"):
+        """Ergebnis über response_deserialize und über den bisherigen Weg mit from_dict"""
+        data = json.dumps(payload).encode()
+        response = RESTResponse(httpx.Response(200, content=data, headers={"content-type": content_type}))
+        response.data = data
+        fast = client.response_deserialize(response, {"200": response_type}).data
+        return fast, client.deserialize(data.decode(), response_type, content_type)
+
+    def test_defaults_replace_null_like_from_dict(self):
+        payload = {"labels": [{"color": None, "label_id": 1, "name": "Inbox"}], "total_unread_count": 3}
+
+        fast, expected = self.deserialize(codec_client(), payload, "CharactersCharacterIdMailLabelsGet")
+
+        self.assertEqual(fast.labels[0].color, "#ffffff")
+        self.assertEqual(fast.model_dump(), expected.model_dump())
+
+    def test_wrappers_and_missing_nullable_fields(self):
+        issue = github_issue()
+        # closed_at fehlt, from_dict setzt es auf None
+
+        fast, expected = self.deserialize(codec_client(GitHubApiClient, GitHubConfiguration), [issue], "List[Issue]")
+
+        self.assertEqual(fast[0].issue_field_values[0].value.actual_instance, 3)
+        self.assertIsNone(fast[0].closed_at)
+        self.assertEqual([item.model_dump() for item in fast], [item.model_dump() for item in expected])
+
+    def test_falls_back_to_from_dict(self):
+        order = {"duration": 90, "is_buy_order": False, "issued": "2025-11-01T12:30:00Z", "location_id": 60003760, "min_volume": 1,
+                 "order_id": 1, "price": 4.99, "range": "region", "system_id": 30000142, "type_id": 34, "volume_remain": 1, "volume_total": 1}
+
+        # Einträge mit null lässt pydantic nicht zu, from_dict schon
+        fast, expected = self.deserialize(codec_client(), [None, order], "List[MarketsRegionIdOrdersGetInner]")
+        self.assertIsNone(fast[0])
+        self.assertEqual(fast[1].model_dump(), expected[1].model_dump())
+
+        # Andere Kodierungen als UTF-8 gehen nicht an validate_json
+        fast, expected = self.deserialize(codec_client(), [order], "List[MarketsRegionIdOrdersGetInner]", "application/json; charset=latin-1")
+        self.assertEqual(fast[0].order_id, 1)
+
+
+class TestPassthrough(unittest.TestCase):
+    def response(self, status: int, payload) -> RESTResponse:
+        response = RESTResponse(httpx.Response(status, json=payload))
+        response.data = response.response.content
+        return response
+
+    def test_json_bytes_are_passed_through(self):
+        types_map = {"200": "List[int]"}
+        response = self.response(200, [587, 588])
+
+        with passthrough():
+            data = codec_client().response_deserialize(response, types_map).data
+        self.assertEqual(data, RawJson(response.data, "List[int]"))
+        self.assertEqual(data.load(), [587, 588])
+        # Außerhalb des Blocks wie bisher
+        self.assertEqual(codec_client().response_deserialize(response, types_map).data, [587, 588])
+
+        # Ohne Codec in der Configuration bleibt es beim generierten Weg
+        with passthrough():
+            self.assertEqual(ApiClient().response_deserialize(response, types_map).data, [587, 588])
+
+        # Fehlerstatus bleiben Exceptions
+        with passthrough(), self.assertRaises(NotFoundException):
+            codec_client().response_deserialize(self.response(404, {"error": "Type not found!"}), types_map)
+
+
+class TestProjection(unittest.TestCase):
+    def deserialize(self, fields):
+        data = json.dumps([github_issue()]).encode()
+        response = RESTResponse(httpx.Response(200, content=data, headers={"content-type": "application/json"}))
+        response.data = data
+        # Die Projektion hat Vorrang vor passthrough
+        with passthrough(), projection(fields):
+            return codec_client(GitHubApiClient, GitHubConfiguration).response_deserialize(response, {"200": "List[Issue]"}).data
+
+    def test_only_selected_fields_are_built(self):
+        issues = self.deserialize(["title", "user.login", "user", "reactions.total_count", "assignees.login", "created_at"])
+
+        self.assertEqual(issues[0].model_dump(mode="json", exclude_none=True), {"title": "Bug", "user": {"login": "octocat", "id": 1}, "assignees": [],
+                                                              "reactions": {"total_count": 1}, "created_at": "2011-04-22T13:33:48Z"})
+        self.assertEqual(type(issues[0]).__name__, "Issue")
+        # Alle Felder: keine Projektion, es bleibt beim Passthrough
+        self.assertIsInstance(self.deserialize([ALL_FIELDS]), RawJson)
+
+    def test_selection_is_normalized(self):
+        codec = ModelCodec.for_client(GitHubApiClient)
+        codec._projected_adapter.cache_clear()
+
+        for fields in (["user.login", "title"], ["title", "user.login"], ["title", "user.login", "title"]):
+            issues = self.deserialize(fields)
+            self.assertEqual(issues[0].model_dump(mode="json"), {"title": "Bug", "user": {"login": "octocat"}})
+        # Dieselbe Auswahl baut ihre Modelle nur einmal
+        self.assertEqual(codec._projected_adapter.cache_info().currsize, 1)
+
+    def test_unknown_fields_raise(self):
+        for fields in (["titel"], ["title.length"], ["user.name.first"]):
+            with self.subTest(fields=fields), self.assertRaises(ValueError):
+                self.deserialize(fields)
+
+
+class TestValidateCall(unittest.IsolatedAsyncioTestCase):
+    def api(self, client_side_validation: bool = True) -> UniverseApi:
+        item = {"type_id": 587, "group_id": 25, "name": "Rifter", "description": "Frigate", "published": True}
+        self.requests = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(200, json=item)
+
+        config = Configuration()
+        config.client_side_validation = client_side_validation
+        api_client = ApiClient(config)
+        api_client.rest_client.pool_manager = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        return UniverseApi(api_client)
+
+    async def test_arguments_are_validated_on_call(self):
+        api = self.api()
+
+        with self.assertRaises(ValidationError):
+            await api.get_universe_types_type_id(type_id="587", x_compatibility_date=date(2025, 8, 26))
+        # Wie bei pydantic.validate_call werden Argumente konvertiert, wo es der Typ erlaubt
+        result = await api.get_universe_types_type_id(type_id=587, x_compatibility_date="2025-08-26")
+        self.assertEqual(result.name, "Rifter")
+        self.assertEqual(len(self.requests), 1)
+        self.assertEqual(self.requests[0].headers["X-Compatibility-Date"], "2025-08-26")
+
+    async def test_client_side_validation_can_be_disabled(self):
+        api = self.api(client_side_validation=False)
+
+        result = await api.get_universe_types_type_id(type_id="587", x_compatibility_date=date(2025, 8, 26))
+        self.assertEqual(result.name, "Rifter")
+        self.assertTrue(self.requests[0].url.path.endswith("/universe/types/587"))
+
+
+class TestRestClient(unittest.IsolatedAsyncioTestCase):
+    async def test_pool_options_from_configuration(self):
+        config = Configuration()
+        config.max_keepalive_connections, config.keepalive_expiry = 10, 30.0
+        config.read_timeout = 20.0
+        rest_client = RESTClientObject(config)
+
+        self.assertEqual((rest_client.limits.max_connections, rest_client.limits.max_keepalive_connections, rest_client.limits.keepalive_expiry), (100, 10, 30.0))
+        self.assertEqual(rest_client.timeout, httpx.Timeout(300, read=20.0))
+
+    async def test_requests_per_host_are_capped(self):
+        config = Configuration()
+        config.max_connections_per_host = 2
+        rest_client = RESTClientObject(config)
+        running = []
+        peak = 0
+        timeouts = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal peak
+            running.append(request)
+            peak = max(peak, len(running))
+            timeouts.append(request.extensions["timeout"])
+            await asyncio.sleep(0.01)
+            running.remove(request)
+            return httpx.Response(200, json={})
+
+        rest_client.pool_manager = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        await asyncio.gather(*(rest_client.request("GET", "https://esi.evetech.net/status") for _ in range(8)),
+                             rest_client.request("GET", "https://example.com/", _request_timeout=(1.0, 2.0)))
+
+        self.assertEqual(peak, 3)
+        self.assertIn({"connect": 1.0, "read": 2.0, "write": 300, "pool": 300}, timeouts)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,64 @@
+import multiprocessing
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from src import rate_limit_backends
+from src.rate_limit_backends import SharedMemoryBackend
+from src.rate_limiter import RateLimiter
+
+
+def take_budget(path: str, calls: int) -> int:
+    limiter = RateLimiter(SharedMemoryBackend(path))
+    return sum(limiter.is_allowed("shared_tool", 20, 60)[0] for _ in range(calls))
+
+
+class TestSharedMemoryBackend(unittest.TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "rate_limit.state")
+
+    def test_budget_is_shared_between_processes(self):
+        with multiprocessing.get_context("spawn").Pool(4) as pool:
+            allowed = pool.starmap(take_budget, [(self.path, 15)] * 4)
+
+        self.assertEqual(sum(allowed), 20)
+
+    def test_expired_slots_are_reused(self):
+        backend = SharedMemoryBackend(self.path, slots=1, probe_length=2)
+        self.addCleanup(backend.close)
+        limiter = RateLimiter(backend)
+
+        for key in ("a", "b"):
+            self.assertTrue(limiter.reserve(key, 1, 1, max_wait=0, now=100)[0])
+        self.assertFalse(limiter.reserve("b", 1, 1, max_wait=0, now=100)[0])
+
+        # Nach Ablauf der TATs sind die Slots wieder frei
+        for key in ("c", "d"):
+            self.assertTrue(limiter.reserve(key, 1, 1, max_wait=0, now=102)[0])
+        self.assertFalse(limiter.reserve("d", 1, 1, max_wait=0, now=102)[0])
+
+    def test_tats_from_previous_boot_are_dropped(self):
+        backend = SharedMemoryBackend(self.path)
+        limiter = RateLimiter(backend)
+        # Nach 30 Tagen Laufzeit eine Reservierung weit in der Zukunft
+        self.assertTrue(limiter.reserve("tool", 1, 60, max_wait=120, now=2_592_000)[0])
+        self.assertEqual(limiter.reserve("tool", 1, 60, max_wait=120, now=2_592_000), (True, 60))
+        backend.close()
+
+        # Im selben Systemstart bleibt das Budget erhalten
+        backend = SharedMemoryBackend(self.path)
+        self.assertFalse(RateLimiter(backend).reserve("tool", 1, 60, max_wait=0, now=2_592_000)[0])
+        backend.close()
+
+        # Nach einem Neustart beginnt monotonic wieder bei 0, die alten TATs gelten nicht mehr
+        with mock.patch.object(rate_limit_backends, "_boot_id", return_value=bytes(16)):
+            backend = SharedMemoryBackend(self.path)
+        self.addCleanup(backend.close)
+        self.assertEqual(RateLimiter(backend).reserve("tool", 1, 60, max_wait=120, now=100), (True, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,8 +1,14 @@
 import asyncio
 import logging
+import time
 import unittest
 
-from src.rate_limiter import rate_limit
+from mcp.server.lowlevel.server import request_ctx
+from mcp.shared.context import RequestContext
+
+from src.rate_limit_backends import InMemoryBackend
+from src.rate_limiter import rate_limit, RateLimiter, RateLimitExceeded, Budget, argument_key, scoped, session_key, session_tool_key, tool_key, \
+    upstream_tool_budget
 
 
 class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
@@ -45,6 +51,198 @@ class TestRateLimiter(unittest.IsolatedAsyncioTestCase):
         finally:
             logger.removeHandler(handler)
 
+    def test_burst_and_wait_time(self):
+        limiter = RateLimiter()
+        for _ in range(3):
+            allowed, wait_time = limiter.is_allowed("key", 3, 6)
+            self.assertTrue(allowed)
+            self.assertEqual(wait_time, 0)
+
+        allowed, wait_time = limiter.is_allowed("key", 3, 6)
+        self.assertFalse(allowed)
+        self.assertAlmostEqual(wait_time, 2, delta=0.1)
+
+    def test_idle_keys_are_evicted(self):
+        limiter = RateLimiter()
+        limiter.is_allowed("old", 10, 0.01)
+        time.sleep(0.02)
+        limiter.is_allowed("new", 10, 60)
+
+        self.assertNotIn("old", limiter.backend.tats)
+        self.assertIn("new", limiter.backend.tats)
+
+    async def test_concurrent_calls_keep_rate(self):
+        max_calls, time_window, calls = 50, 0.1, 1000
+        interval = time_window / max_calls
+        finished = []
+
+        @rate_limit(max_calls, time_window)
+        async def concurrent_function(index):
+            finished.append((index, time.monotonic()))
+
+        logging.getLogger('src.rate_limiter').disabled = True
+        try:
+            start = time.monotonic()
+            await asyncio.gather(*[concurrent_function(i) for i in range(calls)])
+        finally:
+            logging.getLogger('src.rate_limiter').disabled = False
+
+        # FIFO: Aufrufe werden in Ankunftsreihenfolge freigegeben
+        self.assertEqual([index for index, _ in finished], list(range(calls)))
+        # Kein Aufruf vor seinem Slot: nach dem Burst von max_calls höchstens max_calls / time_window
+        for i, (_, t) in enumerate(finished):
+            self.assertGreaterEqual(t - start, (i - max_calls + 1) * interval - 1e-3)
+        expected = (calls - max_calls) * interval
+        self.assertAlmostEqual(finished[-1][1] - finished[0][1], expected, delta=expected * 0.1)
+
+    async def test_reject_with_retry_after(self):
+        @rate_limit(2, 10, reject=True)
+        async def rejecting_function():
+            return 1
+
+        self.assertEqual(await rejecting_function(), 1)
+        self.assertEqual(await rejecting_function(), 1)
+        with self.assertLogs('src.rate_limiter', level='WARNING'):
+            with self.assertRaises(RateLimitExceeded) as error:
+                await rejecting_function()
+        self.assertAlmostEqual(error.exception.retry_after, 5, delta=0.1)
+
+    async def test_max_queue(self):
+        @rate_limit(1, 10, max_queue=1)
+        async def queued_function():
+            return 1
+
+        self.assertEqual(await queued_function(), 1)
+        waiting = asyncio.ensure_future(queued_function())
+        await asyncio.sleep(0)
+        with self.assertLogs('src.rate_limiter', level='WARNING'):
+            with self.assertRaises(RateLimitExceeded):
+                await queued_function()
+        waiting.cancel()
+
+    async def test_cancelled_waiter_releases_slot(self):
+        @rate_limit(1, 10, max_queue=1)
+        async def cancelled_function():
+            return 1
+
+        self.assertEqual(await cancelled_function(), 1)
+        with self.assertLogs('src.rate_limiter', level='WARNING'):
+            waiting = asyncio.ensure_future(cancelled_function())
+            await asyncio.sleep(0)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+
+        # Ohne Rückgabe läge der nächste freie Slot 20 s entfernt und damit über max_queue
+        with self.assertLogs('src.rate_limiter', level='WARNING'):
+            waiting = asyncio.ensure_future(cancelled_function())
+            await asyncio.sleep(0)
+        self.assertFalse(waiting.done())
+        waiting.cancel()
+
+    async def test_session_keys_do_not_starve_each_other(self):
+        @rate_limit(1, 10, reject=True, key=scoped(session_key, tool_key))
+        async def session_function():
+            return 1
+
+        async def call_in_session(session):
+            token = request_ctx.set(RequestContext(request_id=1, meta=None, session=session, lifespan_context=None))
+            try:
+                return await session_function()
+            finally:
+                request_ctx.reset(token)
+
+        noisy, quiet = object(), object()
+        self.assertEqual(await call_in_session(noisy), 1)
+        with self.assertLogs('src.rate_limiter', level='WARNING'):
+            with self.assertRaises(RateLimitExceeded):
+                await call_in_session(noisy)
+        self.assertEqual(await call_in_session(quiet), 1)
+
+    async def test_argument_key(self):
+        @rate_limit(1, 10, reject=True, key=scoped(tool_key, argument_key("owner", "repo")))
+        async def repo_function(owner, repo):
+            return owner
+
+        self.assertEqual(await repo_function("octocat", "hello"), "octocat")
+        self.assertEqual(await repo_function(owner="other", repo="hello"), "other")
+        with self.assertLogs('src.rate_limiter', level='WARNING'):
+            with self.assertRaises(RateLimitExceeded) as error:
+                await repo_function("octocat", repo="hello")
+        self.assertEqual(error.exception.key, "repo_function:octocat/hello")
+
+    async def test_parent_budget_is_shared(self):
+        upstream = Budget(2, 10, scoped("upstream"))
+
+        @rate_limit(5, 10, reject=True, parents=[upstream])
+        async def first_tool():
+            return 1
+
+        @rate_limit(5, 10, reject=True, parents=[upstream])
+        async def second_tool():
+            return 2
+
+        self.assertEqual(await first_tool(), 1)
+        self.assertEqual(await second_tool(), 2)
+        with self.assertLogs('src.rate_limiter', level='WARNING'):
+            with self.assertRaises(RateLimitExceeded):
+                await first_tool()
+
+    async def test_sessions_do_not_multiply_upstream_calls(self):
+        # Wie die Tools: je Session 3 Aufrufe pro Minute, über alle Sessions nicht mehr als mit einem Kontingent je Tool
+        @rate_limit(key=session_tool_key, reject=True, parents=[upstream_tool_budget("test-upstream")])
+        async def upstream_tool():
+            return 1
+
+        async def call_in_session(session):
+            token = request_ctx.set(RequestContext(request_id=1, meta=None, session=session, lifespan_context=None))
+            try:
+                return await upstream_tool()
+            finally:
+                request_ctx.reset(token)
+
+        sessions = [object() for _ in range(5)]
+        calls = 0
+        with self.assertLogs('src.rate_limiter', level='WARNING'):
+            for session in sessions * 3:
+                try:
+                    calls += await call_in_session(session)
+                except RateLimitExceeded as error:
+                    # Abgewiesen hat das Kontingent des Upstreams, nicht das der Session
+                    self.assertEqual(error.key, "test-upstream:upstream_tool")
+        self.assertEqual(calls, 3)
+
+    async def test_exceeded_reports_rejecting_budget(self):
+        @rate_limit(max_calls=1, key=session_tool_key, reject=True, parents=[upstream_tool_budget("test-upstream", max_calls=2)])
+        async def other_tool():
+            return 1
+
+        async def call_in_session(session):
+            token = request_ctx.set(RequestContext(request_id=1, meta=None, session=session, lifespan_context=None))
+            try:
+                return await other_tool()
+            finally:
+                request_ctx.reset(token)
+
+        first, second = object(), object()
+        await call_in_session(first)
+        with self.assertLogs('src.rate_limiter', level='WARNING'):
+            with self.assertRaises(RateLimitExceeded) as session_limit:
+                await call_in_session(first)
+            await call_in_session(second)
+            with self.assertRaises(RateLimitExceeded) as upstream_limit:
+                await call_in_session(object())
+        self.assertEqual(session_limit.exception.key, f"session-{id(first)}:other_tool")
+        self.assertEqual(upstream_limit.exception.key, "test-upstream:other_tool")
+
+    def test_max_keys_bounds_memory(self):
+        limiter = RateLimiter(InMemoryBackend(max_keys=100))
+        for i in range(1000):
+            limiter.is_allowed(f"session-{i}", 1, 60)
+
+        self.assertEqual(len(limiter.backend.tats), 100)
+        self.assertIn("session-999", limiter.backend.tats)
+
 
 if __name__ == '__main__':
     unittest.main()
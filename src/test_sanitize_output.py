@@ -1,6 +1,74 @@
+import inspect
+import json
+import pickle
+import re
 import unittest
+from datetime import date
+from typing import List, Optional
 
-from src.sanitize_output import sanitize_output
+from mcp.server.fastmcp.utilities.func_metadata import _convert_to_content
+from mcp.types import CallToolResult, TextContent
+import httpx
+from pydantic import BaseModel, ConfigDict, Field, StrictInt, StrictStr, create_model, field_validator
+
+from github_client.api_client import ApiClient as GitHubApiClient
+from github_client.configuration import Configuration as GitHubConfiguration
+from github_client.models.issue import Issue as GitHubIssue
+from github_client.models.label import Label as GitHubLabel
+from github_client.rest import RESTResponse
+
+import src.sanitize_output as sanitize_module
+from src.discord_client.models.basic_message_response import BasicMessageResponse
+from src.model_codec import ModelCodec
+from src.passthrough import RawJson
+from src.sanitize_output import _model_plan, _validated_safe_fields, sanitize_output
+
+
+class Label(BaseModel):
+    name: StrictStr
+    color: Optional[StrictStr] = None
+
+
+class Issue(BaseModel):
+    id: StrictInt
+    title: StrictStr
+    body: Optional[StrictStr] = None
+    access_token: Optional[StrictStr] = Field(default=None, alias="accessToken")
+    created: date
+    labels: Optional[List[Label]] = None
+    model_config = ConfigDict(populate_by_name=True, extra="allow")
+
+
+class Message(BaseModel):
+    id: StrictStr
+    state: StrictStr
+    content: StrictStr
+    token: Optional[StrictStr] = None
+
+    # Validatoren wie vom OpenAPI Generator erzeugt
+    @field_validator('id')
+    def id_validate_regular_expression(cls, value):
+        """Validates the regular expression"""
+        if not re.match(r"^(0|[1-9][0-9]*)$", value):
+            raise ValueError(r"must validate the regular expression /^(0|[1-9][0-9]*)$/")
+        return value
+
+    @field_validator('state')
+    def state_validate_enum(cls, value):
+        """Validates the enum"""
+        if value not in set(['open', 'closed']):
+            raise ValueError("must be one of enum values ('open', 'closed')")
+        return value
+
+    @field_validator('token')
+    def token_validate_regular_expression(cls, value):
+        """Validates the regular expression"""
+        if value is None:
+            return value
+
+        if not re.match(r"^[0-9a-f]+$", value):
+            raise ValueError(r"must validate the regular expression /^[0-9a-f]+$/")
+        return value
 
 
 class TestSanitizeOutput(unittest.IsolatedAsyncioTestCase):
@@ -45,6 +113,190 @@ class TestSanitizeOutput(unittest.IsolatedAsyncioTestCase):
                 'He said, "Hello!" and left.'
             ]
 
+    async def test_sanitize_edge_cases(self):
+        @sanitize_output()
+        async def dummy_function():
+            return [
+                "a/../../b",
+                "....//x",
+                "C:\\dir\\..\\..\\x",
+                "url: https://github.com/octocat",
+                "TOKEN=abc; next",
+                '{"api_key": "xyz"}',
+                '"password": token=x',
+            ]
+
+        result = await dummy_function()
+        self.assertEqual(result, [
+            "a/b",
+            "x",
+            "C:\\dir\\x",
+            "url: https://github.com/octocat",
+            "TOKEN: ****; next",
+            '{\\"api_key\\": ****}',
+            # Das zweite Muster läuft über die Ausgabe des ersten, wie vor dem Vorkompilieren
+            '\\"password\\": **** ****',
+        ])
+
+    async def test_sanitize_model(self):
+        issue = Issue(id=1, title='Fix "it"', body="see ../../etc/passwd", accessToken="ghp_123", created=date(2024, 1, 2),
+                      labels=[Label(name="bug's"), Label(name="ok")], secret="abc")
+
+        @sanitize_output()
+        async def dummy_function():
+            return [issue]
+
+        result = (await dummy_function())[0]
+        self.assertIsInstance(result, Issue)
+        self.assertEqual(result.title, 'Fix \\"it\\"')
+        self.assertEqual(result.body, "see etc/passwd")
+        self.assertEqual(result.access_token, "****")
+        self.assertEqual(result.created, date(2024, 1, 2))
+        self.assertEqual(result.labels[0].name, "bug\\'s")
+        self.assertEqual(result.model_extra, {"secret": "****"})
+        # Unveränderte Modelle werden nicht kopiert, das Original bleibt unverändert
+        self.assertIs(result.labels[1], issue.labels[1])
+        self.assertEqual(issue.access_token, "ghp_123")
+
+    async def test_model_plan_skips_validated_fields(self):
+        # IDs und Enum-Werte können nichts enthalten, was das Sanitizing ändern würde, Secrets werden trotzdem maskiert
+        self.assertEqual([field.name for field in _model_plan(Message)], ["content", "token"])
+
+        @sanitize_output()
+        async def dummy_function():
+            return Message(id="1191354485679857837", state="open", content="it's done", token="abc123")
+
+        result = await dummy_function()
+        self.assertEqual((result.id, result.state, result.content, result.token), ("1191354485679857837", "open", "it\\'s done", "****"))
+
+    async def test_safe_fields_of_generated_models(self):
+        # Festgehalten für echte Modelle: Enums mit harmlosen Werten und Snowflake-IDs
+        self.assertEqual(_validated_safe_fields(GitHubIssue), {"active_lock_reason", "author_association", "state"})
+        self.assertEqual(_validated_safe_fields(BasicMessageResponse), {"application_id", "channel_id", "id", "webhook_id"})
+
+    async def test_unknown_validators_are_sanitized(self):
+        # Ohne Quelltext (hier per exec) oder mit einem Pattern außerhalb der Liste gilt kein Feld als sicher
+        namespace = {}
+        exec(inspect.getsource(Message), {**globals(), "__name__": "generated"}, namespace)
+        self.assertEqual(_validated_safe_fields(namespace["Message"]), set())
+        self.assertNotIn("token", _validated_safe_fields(Message))
+
+    async def test_stream_matches_fastmcp_conversion(self):
+        results = [
+            [Issue(id=1, title='Fix "it"', created=date(2024, 1, 2)), {"token": "abc", "path": "../x"}, None, ["nested", 3]],
+            "password: 12345",
+            {"api_key": "ABC123XYZ"},
+            CallToolResult(content=[TextContent(type="text", text="secret=abc")], isError=True),
+        ]
+        for result in results:
+            @sanitize_output(stream=True)
+            async def streamed():
+                return result
+
+            @sanitize_output()
+            async def copied():
+                return result
+
+            self.assertEqual(_convert_to_content(await streamed()), _convert_to_content(await copied()))
+
+    async def test_raw_json_is_parsed_and_sanitized(self):
+        raw = RawJson(b'[{"title": "Fix \\"it\\"", "token": "abc", "labels": [{"name": "../x"}]}, {"id": 2}]', "List[Issue]")
+
+        @sanitize_output(stream=True)
+        async def streamed():
+            return raw
+
+        content = await streamed()
+        self.assertEqual(len(content), 2)
+        self.assertEqual(json.loads(content[0].text), {"title": 'Fix \\"it\\"', "token": "****", "labels": [{"name": "x"}]})
+        self.assertEqual(json.loads(content[1].text), {"id": 2})
+
+    async def test_clean_raw_json_gives_same_content(self):
+        documents = [b'[{"id": 1, "issued": "2025-11-01T12:30:00Z", "range": "region"}, 2]', b'[{"note": "x\\u0022 ..\\u002f"}]',
+                     b'[{"Access-Token": 1}]', '[{"name": "Straße/../x"}]'.encode()]
+        for data in documents:
+            @sanitize_output(stream=True)
+            async def streamed():
+                return RawJson(data, "List[object]")
+
+            expected = sanitize_module._sanitize_to_content(json.loads(data))
+            self.assertEqual(await streamed(), expected)
+        self.assertTrue(sanitize_module._raw_json_is_clean(documents[0]))
+        self.assertFalse(any(sanitize_module._raw_json_is_clean(data) for data in documents[1:]))
+
+    async def test_large_results_are_offloaded(self):
+        items = [{"token": "abc", "path": f"../{i}", "text": "it's"} for i in range(30)]
+        expected = [{"token": "****", "path": f"{i}", "text": "it\\'s"} for i in range(30)]
+        thresholds = sanitize_module.THREAD_THRESHOLD, sanitize_module.PROCESS_THRESHOLD, sanitize_module.CHUNK_SIZE
+
+        @sanitize_output()
+        async def dummy_function():
+            return items
+
+        try:
+            # Thread
+            sanitize_module.THREAD_THRESHOLD, sanitize_module.PROCESS_THRESHOLD = 10, 100
+            self.assertEqual(await dummy_function(), expected)
+
+            # Prozess-Pool in Teilstücken, die Reihenfolge bleibt erhalten
+            sanitize_module.PROCESS_THRESHOLD, sanitize_module.CHUNK_SIZE = 20, 7
+            self.assertEqual(await dummy_function(), expected)
+            # Kein fork aus dem Server mit seinen Threads
+            self.assertNotEqual(sanitize_module._process_pool._mp_context.get_start_method(), "fork")
+        finally:
+            sanitize_module.THREAD_THRESHOLD, sanitize_module.PROCESS_THRESHOLD, sanitize_module.CHUNK_SIZE = thresholds
+            if sanitize_module._process_pool is not None:
+                sanitize_module._process_pool.shutdown()
+                sanitize_module._reset_process_pool()
+
+    async def test_deserialized_models_go_to_process_pool(self):
+        # Modelle wie aus dem schnellen Weg von response_deserialize, dort als Unterklasse des generierten Modells
+        labels = [{"id": i, "node_id": f"L_{i}", "url": "https://api.github.com/labels/1", "name": f"it's {i}",
+                   "description": None, "color": "f29513", "default": False} for i in range(6000)]
+        config = GitHubConfiguration()
+        config.codec = ModelCodec.for_client(GitHubApiClient)
+        response = RESTResponse(httpx.Response(200, json=labels))
+        response.data = response.response.content
+        models = GitHubApiClient(config).response_deserialize(response, {"200": "List[Label]"}).data
+        self.assertIsNot(type(models[0]), GitHubLabel)
+        # Gepickelt kommen sie als das generierte Modell an
+        copy = pickle.loads(pickle.dumps(models[0]))
+        self.assertIs(type(copy), GitHubLabel)
+        self.assertEqual(copy.model_dump(), models[0].model_dump())
+
+        @sanitize_output(stream=True)
+        async def streamed():
+            return models
+
+        try:
+            content = await streamed()
+            self.assertIsNotNone(sanitize_module._process_pool)
+        finally:
+            if sanitize_module._process_pool is not None:
+                sanitize_module._process_pool.shutdown()
+                sanitize_module._reset_process_pool()
+        self.assertEqual(len(content), 6000)
+        self.assertEqual(json.loads(content[5999].text)["name"], "it\\'s 5999")
+
+    async def test_unpicklable_results_fall_back_to_thread(self):
+        # Gleichnamig mit Label aus diesem Modul, aber nicht dieselbe Klasse
+        unpicklable = create_model("Label", __module__=__name__, name=(str, ...))
+        items = [unpicklable(name=f"../{i}") for i in range(30)]
+        thresholds = sanitize_module.THREAD_THRESHOLD, sanitize_module.PROCESS_THRESHOLD, sanitize_module.CHUNK_SIZE
+
+        @sanitize_output(stream=True)
+        async def streamed():
+            return items
+
+        try:
+            sanitize_module.THREAD_THRESHOLD, sanitize_module.PROCESS_THRESHOLD, sanitize_module.CHUNK_SIZE = 10, 20, 7
+            content = await streamed()
+        finally:
+            sanitize_module.THREAD_THRESHOLD, sanitize_module.PROCESS_THRESHOLD, sanitize_module.CHUNK_SIZE = thresholds
+            if sanitize_module._process_pool is not None:
+                sanitize_module._process_pool.shutdown()
+                sanitize_module._reset_process_pool()
+        self.assertEqual([json.loads(block.text) for block in content], [{"name": f"{i}"} for i in range(30)])
 
 
 if __name__ == '__main__':
@@ -0,0 +1,125 @@
+import asyncio
+import ssl
+import unittest
+
+import httpx
+
+from eve_client.configuration import Configuration as EveConfiguration
+from eve_client.rest import RESTClientObject as EveRESTClient
+from invman_client.configuration import Configuration as InvmanConfiguration
+from invman_client.rest import RESTClientObject as InvmanRESTClient
+
+from src.shared_transport import SharedTransport, configure_from_environment
+
+
+class TestSharedTransport(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.hosts = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            self.hosts.append(request.url.host)
+            return httpx.Response(404 if request.url.path == "/missing" else 200, json={})
+
+        self.transport = SharedTransport()
+        # Jeder Pool des Transports wie sonst, nur ohne Netzwerk
+        self.pools = []
+        create_pool_manager = self.transport._create_pool_manager
+
+        def mocked_pool_manager(client):
+            self.pools.append(create_pool_manager(client))
+            return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        self.transport._create_pool_manager = mocked_pool_manager
+        eve_config, invman_config = EveConfiguration(), InvmanConfiguration()
+        eve_config.transport = invman_config.transport = self.transport
+        self.eve = EveRESTClient(eve_config)
+        self.invman = InvmanRESTClient(invman_config)
+
+    async def asyncTearDown(self):
+        await self.transport.close()
+
+    async def test_clients_share_one_pool(self):
+        await self.eve.request("GET", "https://esi.evetech.net/latest/status/")
+        await self.invman.request("GET", "http://localhost:8080/missing")
+
+        self.assertEqual(self.hosts, ["esi.evetech.net", "localhost"])
+        self.assertIs(self.eve.get_pool_manager(), self.invman.get_pool_manager())
+        self.assertEqual(len(self.pools), 1)
+        # Ohne eigenen Pool braucht ein Client auch keinen eigenen SSL-Kontext
+        self.assertIsNone(self.eve.pool_manager)
+        self.assertIs(self.eve.ssl_context, self.invman.ssl_context)
+
+    async def test_different_settings_get_own_pool(self):
+        configuration = EveConfiguration()
+        configuration.transport = self.transport
+        configuration.verify_ssl = False
+        unverified = EveRESTClient(configuration)
+
+        self.assertIsNot(unverified.get_pool_manager(), self.eve.get_pool_manager())
+        self.assertIs(unverified.get_pool_manager(), EveRESTClient(configuration).get_pool_manager())
+        # Die TLS-Einstellungen des Clients gelten auch am gemeinsamen Transport
+        self.assertEqual(self.pools[0]._transport._pool._ssl_context.verify_mode, ssl.CERT_NONE)
+
+    async def test_options_from_environment(self):
+        in_flight = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            in_flight.append(request)
+            await asyncio.sleep(0.01)
+            return httpx.Response(200, json={})
+
+        transport = SharedTransport()
+        created = []
+        transport._create_pool_manager = lambda client: created.append(client) or httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        configuration = EveConfiguration()
+        configuration.transport = transport
+        configure_from_environment(configuration, {"UPSTREAM_HTTP2": "1", "UPSTREAM_MAX_CONNECTIONS_PER_HOST": "1",
+                                                   "UPSTREAM_KEEPALIVE_EXPIRY": "30"})
+        client = EveRESTClient(configuration)
+
+        await asyncio.gather(*[client.request("GET", "https://esi.evetech.net/latest/status/") for _ in range(3)])
+
+        self.assertTrue(created[0].http2)
+        self.assertEqual(created[0].limits.keepalive_expiry, 30)
+        self.assertEqual(transport.metrics()["esi.evetech.net"]["peak_in_flight"], 1)
+        await transport.close()
+
+    async def test_proxy_gets_own_pool(self):
+        proxied_config = EveConfiguration()
+        proxied_config.transport = self.transport
+        proxied_config.proxy = "http://proxy.local:3128"
+        proxied_config.proxy_headers = {"Proxy-Authorization": "Basic dXNlcjpwYXNz"}
+        proxied = EveRESTClient(proxied_config)
+
+        pool = proxied.get_pool_manager()
+        self.assertIsNot(pool, self.eve.get_pool_manager())
+        self.assertIs(pool, EveRESTClient(proxied_config).get_pool_manager())
+        proxy = self.pools[0]._mounts[next(iter(self.pools[0]._mounts))]._pool._proxy_url
+        self.assertEqual((proxy.host, proxy.port), (b"proxy.local", 3128))
+
+        await self.transport.close()
+        self.assertTrue(pool.is_closed)
+
+    async def test_metrics_per_host(self):
+        for _ in range(3):
+            await self.eve.request("GET", "https://esi.evetech.net/latest/status/")
+        await self.invman.request("GET", "http://localhost:8080/missing")
+
+        metrics = self.transport.metrics()
+        self.assertEqual(metrics["esi.evetech.net"]["requests"], 3)
+        self.assertEqual(metrics["esi.evetech.net"]["statuses"], {200: 3})
+        self.assertEqual(metrics["localhost:8080"]["statuses"], {404: 1})
+        self.assertEqual(metrics["localhost:8080"]["in_flight"], 0)
+
+    async def test_client_close_keeps_shared_pool(self):
+        pool = self.transport.get_pool_manager(self.eve)
+        await self.eve.close()
+
+        self.assertFalse(pool.is_closed)
+        await self.invman.request("GET", "http://localhost:8080/invoices")
+        await self.transport.close()
+        self.assertTrue(pool.is_closed)
+        self.assertIsNot(self.transport.get_pool_manager(self.invman), pool)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,65 @@
+import ssl
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from eve_client.configuration import Configuration as EveConfiguration
+from eve_client.rest import RESTClientObject as EveRESTClient
+from invman_client.configuration import Configuration as InvmanConfiguration
+from invman_client.rest import RESTClientObject as InvmanRESTClient
+
+from src import ssl_contexts
+
+
+class TestSslContexts(unittest.TestCase):
+    def setUp(self):
+        ssl_contexts.clear()
+
+    def test_clients_share_context(self):
+        eve_configuration, invman_configuration = EveConfiguration(), InvmanConfiguration()
+        eve_configuration.ssl_context = ssl_contexts.for_configuration(eve_configuration)
+        invman_configuration.ssl_context = ssl_contexts.for_configuration(invman_configuration)
+        eve = EveRESTClient(eve_configuration)
+        invman = InvmanRESTClient(invman_configuration)
+
+        self.assertIs(eve.ssl_context, invman.ssl_context)
+        self.assertEqual(eve.ssl_context.verify_mode, ssl.CERT_REQUIRED)
+
+    def test_settings_are_part_of_key(self):
+        configuration = EveConfiguration()
+        configuration.verify_ssl = False
+        configuration.ssl_context = ssl_contexts.for_configuration(configuration)
+        unverified = EveRESTClient(configuration).ssl_context
+
+        self.assertIsNot(unverified, ssl_contexts.for_configuration(EveConfiguration()))
+        self.assertFalse(unverified.check_hostname)
+        self.assertEqual(unverified.verify_mode, ssl.CERT_NONE)
+
+    def test_clients_without_context_build_their_own(self):
+        configuration = EveConfiguration()
+        configuration.verify_ssl = False
+        client = EveRESTClient(configuration)
+
+        self.assertIsNot(client.ssl_context, EveRESTClient(configuration).ssl_context)
+        self.assertEqual(client.ssl_context.verify_mode, ssl.CERT_NONE)
+        self.assertFalse(ssl_contexts._contexts)
+
+    def test_context_per_alpn(self):
+        # httpcore setzt die ALPN-Protokolle bei jedem Verbindungsaufbau, HTTP/1.1 und HTTP/2 dürfen sich keinen Kontext teilen
+        self.assertIsNot(ssl_contexts.ssl_context(http2=True), ssl_contexts.ssl_context())
+        self.assertIs(ssl_contexts.ssl_context(http2=True), ssl_contexts.ssl_context(http2=True))
+
+    def test_one_context_for_concurrent_first_use(self):
+        with ThreadPoolExecutor(8) as executor:
+            contexts = list(executor.map(lambda _: ssl_contexts.ssl_context(), range(8)))
+
+        self.assertEqual(len({id(context) for context in contexts}), 1)
+
+    def test_clear(self):
+        context = ssl_contexts.ssl_context()
+        ssl_contexts.clear()
+
+        self.assertIsNot(ssl_contexts.ssl_context(), context)
+
+
+if __name__ == '__main__':
+    unittest.main()
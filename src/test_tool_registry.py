@@ -0,0 +1,100 @@
+import os
+import sys
+import tempfile
+import threading
+import unittest
+
+import src.tool_schema_cache as cache_module
+from server import mcp
+from src.tool_registry import register_tool_modules
+from src.tool_schema_cache import DeferredTool
+
+# Ein Tool-Modul wie die in stage1b, nur ohne generierten Client
+SAMPLE_TOOLS = '''
+import threading
+from typing import Annotated
+
+from pydantic import Field
+
+import registry_sample_client
+from server import mcp
+
+loaded_in = threading.current_thread()
+
+
+@mcp.tool()
+async def shout(text: Annotated[str, Field(description="Text to shout")]) -> str:
+    """Shout a text"""
+    return text.upper()
+'''
+
+# Steht für den generierten Client, dessen Import lange dauert
+SAMPLE_CLIENT = '''
+import threading
+
+loaded_in = threading.current_thread()
+'''
+
+
+class TestToolRegistry(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        with open(os.path.join(self.directory.name, "registry_sample_tools.py"), "w") as file:
+            file.write(SAMPLE_TOOLS)
+        with open(os.path.join(self.directory.name, "registry_sample_client.py"), "w") as file:
+            file.write(SAMPLE_CLIENT)
+        sys.path.insert(0, self.directory.name)
+        self.cache_dir = cache_module.cache_dir
+        cache_module.cache_dir = os.path.join(self.directory.name, "cache")
+        self.tools = dict(mcp._tool_manager._tools)
+        self.modules = {"sample": "registry_sample_tools"}
+
+    def tearDown(self):
+        mcp._tool_manager._tools.clear()
+        mcp._tool_manager._tools.update(self.tools)
+        sys.modules.pop("registry_sample_tools", None)
+        sys.modules.pop("registry_sample_client", None)
+        sys.path.remove(self.directory.name)
+        cache_module.cache_dir = self.cache_dir
+        self.directory.cleanup()
+
+    def restart(self):
+        # Wie ein neuer Serverprozess: Modul und Tools sind weg, der Cache bleibt
+        sys.modules.pop("registry_sample_tools", None)
+        sys.modules.pop("registry_sample_client", None)
+        mcp._tool_manager._tools.clear()
+
+    async def test_known_modules_are_loaded_on_first_call(self):
+        register_tool_modules(mcp, ["sample"], modules=self.modules)
+        expected = await mcp.list_tools()
+        self.restart()
+
+        register_tool_modules(mcp, ["sample"], modules=self.modules)
+        self.assertNotIn("registry_sample_tools", sys.modules)
+        self.assertEqual(await mcp.list_tools(), expected)
+
+        result = await mcp.call_tool("shout", {"text": "hello"})
+        self.assertIn("registry_sample_tools", sys.modules)
+        self.assertEqual(result[1], {"result": "HELLO"})
+        self.assertNotIsInstance(mcp._tool_manager.get_tool("shout"), DeferredTool)
+        # Nur der Client wird im Thread importiert, die Tools registriert der Event Loop
+        self.assertIsNot(sys.modules["registry_sample_client"].loaded_in, threading.current_thread())
+        self.assertIs(sys.modules["registry_sample_tools"].loaded_in, threading.current_thread())
+
+    async def test_changed_module_is_imported_at_startup(self):
+        register_tool_modules(mcp, ["sample"], modules=self.modules)
+        self.restart()
+        with open(os.path.join(self.directory.name, "registry_sample_tools.py"), "a") as file:
+            file.write("\n# geändert\n")
+
+        register_tool_modules(mcp, ["sample"], modules=self.modules)
+        self.assertIn("registry_sample_tools", sys.modules)
+        self.assertNotIsInstance(mcp._tool_manager.get_tool("shout"), DeferredTool)
+
+    def test_unknown_module(self):
+        with self.assertRaises(ValueError):
+            register_tool_modules(mcp, ["sample", "unknown"], modules=self.modules)
+
+
+if __name__ == '__main__':
+    unittest.main()
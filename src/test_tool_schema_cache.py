@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from typing import Annotated, List, Optional
+
+from mcp.server import FastMCP
+from pydantic import BaseModel, Field
+
+import src.tool_schema_cache as cache_module
+from src.tool_schema_cache import _LazyFuncMetadata, use_schema_cache
+
+
+class Label(BaseModel):
+    name: str
+    color: Optional[str] = None
+
+
+class Issue(BaseModel):
+    title: str
+    labels: List[Label]
+
+
+async def create_issue(title: Annotated[str, Field(description="Title of the issue")], labels: Optional[List[Label]] = None) -> Issue:
+    """Create an issue"""
+    return Issue(title=title, labels=labels or [])
+
+
+class TestToolSchemaCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache_dir = cache_module.cache_dir
+        cache_module.cache_dir = self.directory.name
+
+    def tearDown(self):
+        cache_module.cache_dir = self.cache_dir
+        self.directory.cleanup()
+
+    def server(self, cached: bool = True, **settings) -> FastMCP:
+        server = FastMCP()
+        if cached:
+            use_schema_cache(server)
+        server.tool(**settings)(create_issue)
+        return server
+
+    async def test_cached_schemas_match_fastmcp(self):
+        expected = await self.server(cached=False).list_tools()
+        built = self.server()
+        loaded = self.server()
+
+        self.assertEqual(await built.list_tools(), expected)
+        self.assertEqual(await loaded.list_tools(), expected)
+        # Das Argumentmodell wird erst beim ersten Aufruf gebaut
+        self.assertIsInstance(loaded._tool_manager.get_tool("create_issue").fn_metadata, _LazyFuncMetadata)
+        self.assertEqual(await loaded.call_tool("create_issue", {"title": "Bug", "labels": [{"name": "bug"}]}),
+                         await built.call_tool("create_issue", {"title": "Bug", "labels": [{"name": "bug"}]}))
+
+    async def test_changed_settings_rebuild_schema(self):
+        self.server()
+        server = self.server(description="Open a new issue")
+
+        tool = server._tool_manager.get_tool("create_issue")
+        self.assertNotIsInstance(tool.fn_metadata, _LazyFuncMetadata)
+        self.assertEqual((await server.list_tools())[0].description, "Open a new issue")
+
+
+if __name__ == '__main__':
+    unittest.main()
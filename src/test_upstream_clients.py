@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from eve_client.api.universe_api import UniverseApi
+from eve_client.api_client import ApiClient
+from eve_client.configuration import Configuration
+
+import src.upstream_clients as clients_module
+from src.shared_transport import shared_transport
+from src.upstream_clients import UpstreamClient, lifespan, shutdown
+
+
+class TestUpstreamClients(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.created = []
+        self.upstreams = dict(clients_module.upstreams)
+
+    async def asyncTearDown(self):
+        for name in ("test", "other"):
+            if name in clients_module.upstreams:
+                await clients_module.upstreams[name].close()
+        clients_module.upstreams.clear()
+        clients_module.upstreams.update(self.upstreams)
+
+    def factory(self) -> ApiClient:
+        # Langsam genug, dass gleichzeitige erste Zugriffe sich überschneiden
+        time.sleep(0.05)
+        client = ApiClient(Configuration())
+        self.created.append(client)
+        return client
+
+    async def test_one_client_for_concurrent_first_use(self):
+        upstream = UpstreamClient("test", self.factory)
+
+        with ThreadPoolExecutor(8) as executor:
+            clients = list(executor.map(lambda _: upstream.client, range(8)))
+
+        self.assertEqual(len(self.created), 1)
+        self.assertTrue(all(client is self.created[0] for client in clients))
+
+    async def test_one_pool_for_concurrent_first_requests(self):
+        rest_client = ApiClient(Configuration()).rest_client
+        create_pool_manager = rest_client._create_pool_manager
+        pools = []
+
+        def slow_create_pool_manager():
+            time.sleep(0.05)
+            pools.append(create_pool_manager())
+            return pools[-1]
+
+        rest_client._create_pool_manager = slow_create_pool_manager
+        threads = [threading.Thread(target=rest_client.get_pool_manager) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(len(pools), 1)
+        await rest_client.close()
+        self.assertIsNone(rest_client.pool_manager)
+
+    async def test_lifespan_closes_clients_after_last_session(self):
+        upstream = UpstreamClient("test", self.factory)
+        api = upstream.api(UniverseApi)
+        clients_module.warm_upstreams, warm_upstreams = ["test"], clients_module.warm_upstreams
+
+        try:
+            async with lifespan(None):
+                # Der Client wurde mit der ersten Session angelegt
+                self.assertEqual(len(self.created), 1)
+                pool = self.created[0].rest_client.pool_manager
+                async with lifespan(None):
+                    pass
+                self.assertFalse(pool.is_closed)
+                self.assertIs(api.api_client, self.created[0])
+        finally:
+            clients_module.warm_upstreams = warm_upstreams
+
+        self.assertTrue(pool.is_closed)
+        # Nach dem Schließen entsteht beim nächsten Zugriff ein neuer Client
+        self.assertIs(api.api_client, upstream.client)
+        self.assertEqual(len(self.created), 2)
+
+    async def test_new_session_waits_for_closing(self):
+        def slow_factory() -> ApiClient:
+            client = self.factory()
+            close = client.close
+
+            async def slow_close():
+                await asyncio.sleep(0.05)
+                await close()
+            client.close = slow_close
+            return client
+
+        UpstreamClient("test", slow_factory)
+        other = UpstreamClient("other", self.factory)
+        clients_module.warm_upstreams, warm_upstreams = ["test", "other"], clients_module.warm_upstreams
+
+        try:
+            first = lifespan(None)
+            await first.__aenter__()
+            # Die letzte Session endet, close_all hängt im langsamen close des ersten Upstreams
+            closing = asyncio.create_task(first.__aexit__(None, None, None))
+            await asyncio.sleep(0.01)
+            async with lifespan(None):
+                # Die neue Session beginnt erst danach und wärmt neue Clients, die offen bleiben
+                self.assertTrue(closing.done())
+                self.assertFalse(other.client.rest_client.pool_manager.is_closed)
+        finally:
+            clients_module.warm_upstreams = warm_upstreams
+
+    async def test_shared_transport_outlives_sessions(self):
+        configuration = Configuration()
+        configuration.transport = shared_transport
+        upstream = UpstreamClient("test", lambda: ApiClient(configuration))
+        async with lifespan(None):
+            pool = upstream.client.rest_client.get_pool_manager()
+
+        self.assertFalse(pool.is_closed)
+        self.assertIs(upstream.client.rest_client.get_pool_manager(), pool)
+        await shutdown()
+        self.assertTrue(pool.is_closed)
+
+
+if __name__ == '__main__':
+    unittest.main()
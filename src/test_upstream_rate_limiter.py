@@ -0,0 +1,126 @@
+import asyncio
+import unittest
+from time import monotonic, time
+
+from src.invman_client.configuration import Configuration
+from src.invman_client.rest import RESTClientObject
+from src.upstream_rate_limiter import GitHubRateLimiter, DiscordRateLimiter, EsiRateLimiter
+
+
+class StubServer:
+    """Lokaler HTTP-Server, der ein festes Fenster-Limit durchsetzt und es in Headern meldet"""
+
+    def __init__(self, style: str, limit: int, window: float):
+        self.style = style
+        self.limit = limit
+        self.window = window
+        self.window_end = 0.0
+        self.used = 0
+        self.statuses = []
+        self.server = None
+
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self.handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        self.server.close()
+        await self.server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def handle(self, reader, writer):
+        try:
+            while await reader.readline():
+                while (await reader.readline()) not in (b"\r\n", b""):
+                    pass
+                status, headers = self.respond()
+                self.statuses.append(status)
+                head = f"HTTP/1.1 {status} X\r\nContent-Length: 2\r\nContent-Type: application/json\r\n"
+                head += "".join(f"{name}: {value}\r\n" for name, value in headers.items())
+                writer.write(head.encode() + b"\r\n{}")
+                await writer.drain()
+        finally:
+            writer.close()
+
+    def respond(self):
+        now = monotonic()
+        if now >= self.window_end:
+            self.window_end = now + self.window
+            self.used = 0
+        self.used += 1
+        reset_after = self.window_end - now
+        remaining = max(self.limit - self.used, 0)
+        status = 429 if self.used > self.limit else 200
+
+        if self.style == "github":
+            headers = {"X-RateLimit-Limit": self.limit, "X-RateLimit-Remaining": remaining, "X-RateLimit-Reset": time() + reset_after, "X-RateLimit-Resource": "core"}
+        elif self.style == "discord":
+            headers = {"X-RateLimit-Limit": self.limit, "X-RateLimit-Remaining": remaining, "X-RateLimit-Reset-After": reset_after, "X-RateLimit-Bucket": "abcd"}
+        else:
+            headers = {"X-Ratelimit-Group": "universe", "X-Ratelimit-Limit": f"{self.limit * 2}/1s", "X-Ratelimit-Remaining": remaining * 2, "X-ESI-Error-Limit-Remain": 100, "X-ESI-Error-Limit-Reset": 60}
+        if status == 429:
+            headers["Retry-After"] = reset_after
+        return status, headers
+
+
+class TestUpstreamRateLimiter(unittest.IsolatedAsyncioTestCase):
+    async def burst(self, server: StubServer, rate_limiter, path: str, calls: int):
+        config = Configuration(host=server.url)
+        config.rate_limiter = rate_limiter
+        client = RESTClientObject(config)
+        try:
+            responses = await asyncio.gather(*[
+                client.request("GET", server.url + path, headers={"Authorization": "Bearer abc"})
+                for _ in range(calls)
+            ])
+        finally:
+            await client.close()
+        return [response.status for response in responses]
+
+    async def test_cancelled_acquire_releases_global_bucket(self):
+        limiter = DiscordRateLimiter()
+        headers = {"Authorization": "Bot abc"}
+        url = "https://discord.com/api/v10/channels/123456789/messages"
+        permit = await limiter.acquire("GET", url, headers)
+        global_bucket = limiter.buckets[permit[1][0]]
+
+        # Der Bucket der Route ist noch unbekannt und belegt, die zweite Anfrage wartet dort nach dem globalen Bucket
+        with self.assertRaises(TimeoutError):
+            await asyncio.wait_for(limiter.acquire("GET", url, headers), 0.05)
+
+        self.assertEqual((global_bucket.in_flight, global_bucket.remaining), (1, 49))
+        await limiter.update(permit, None)
+        self.assertEqual(global_bucket.in_flight, 0)
+
+    async def test_github_budget_is_used_without_429(self):
+        async with StubServer("github", limit=5, window=0.3) as server:
+            start = monotonic()
+            statuses = await self.burst(server, GitHubRateLimiter(), "/repos/octocat/hello/issues", 20)
+
+            self.assertEqual(statuses, [200] * 20)
+            self.assertNotIn(429, server.statuses)
+            # Vier volle Fenster werden gebraucht, aber nicht wesentlich mehr
+            self.assertGreater(monotonic() - start, 0.9)
+            self.assertLess(monotonic() - start, 3)
+
+    async def test_discord_bucket_per_major_parameter(self):
+        async with StubServer("discord", limit=4, window=0.3) as server:
+            statuses = await self.burst(server, DiscordRateLimiter(), "/api/v10/channels/1191354485679857837/messages", 12)
+
+            self.assertEqual(statuses, [200] * 12)
+            self.assertNotIn(429, server.statuses)
+
+    async def test_esi_group_budget(self):
+        async with StubServer("esi", limit=3, window=1) as server:
+            statuses = await self.burst(server, EsiRateLimiter(), "/universe/types/587", 6)
+
+            self.assertEqual(statuses, [200] * 6)
+            self.assertNotIn(429, server.statuses)
+
+
+if __name__ == '__main__':
+    unittest.main()
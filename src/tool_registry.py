@@ -0,0 +1,130 @@
+import ast
+import asyncio
+import importlib
+import importlib.util
+import inspect
+import json
+import os
+import sys
+import tempfile
+from typing import Any, Dict, Iterable, List, Optional
+
+from mcp.server import FastMCP
+from mcp.server.fastmcp.tools import ToolManager
+from mcp.server.fastmcp.utilities.logging import get_logger
+
+import src.tool_schema_cache as schema_cache
+from src.tool_schema_cache import DeferredTool, files_changed, source_hashes
+
+logger = get_logger(__name__)
+
+# Integrationen, die sich über register_tool_modules (in main.py über TOOL_MODULES) aktivieren lassen
+TOOL_MODULES = {
+    "github": "stage1b.github_tools",
+    "discord": "stage1b.discord_tools",
+    "eve": "stage1b.eve_tools",
+    "invman": "stage1b.invman_tools",
+}
+
+
+class ToolGroup:
+    """
+    Die Tools eines Tool-Moduls
+    Nach dem ersten Import merkt sich die Gruppe Namen und Schemas der Tools. Bei späteren Starts werden
+    die Tools daraus angeboten und das Modul (samt generiertem Client, ApiClient und Secrets) erst beim
+    ersten Aufruf eines seiner Tools importiert.
+    """
+
+    def __init__(self, server: FastMCP, module: str):
+        self.server = server
+        self.module = module
+        self.lock = asyncio.Lock()
+
+    @property
+    def manifest_path(self) -> str:
+        return os.path.join(schema_cache.cache_dir, "modules", f"{self.module}.json")
+
+    def register(self, lazy: bool = True):
+        manifest = self._read_manifest() if lazy and self.module not in sys.modules else None
+        if manifest is None:
+            self.import_module()
+            return
+        tools = self.server._tool_manager._tools
+        for entry in manifest["tools"]:
+            tools.setdefault(entry["name"], DeferredTool.from_entry(entry, self.load))
+
+    def import_module(self):
+        importlib.import_module(self.module)
+        self._write_manifest()
+
+    async def load(self) -> ToolManager:
+        async with self.lock:
+            if self.module not in sys.modules:
+                # Der Import dauert mit den generierten Clients Sekunden, der Event Loop bedient solange andere Sessions.
+                # Im Thread laufen nur die Imports des Moduls, @mcp.tool() ändert die Tools des Servers erst danach
+                # im Event Loop, sonst könnte list_tools gerade darüber iterieren.
+                await asyncio.to_thread(_import_dependencies, self.module)
+                importlib.import_module(self.module)
+        return self.server._tool_manager
+
+    def _read_manifest(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.manifest_path, encoding="utf-8") as file:
+                manifest = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if manifest.get("versions") != schema_cache._versions or files_changed(manifest["hashes"]):
+            return None
+        return manifest
+
+    def _write_manifest(self):
+        tools = [tool for tool in self.server._tool_manager.list_tools()
+                 if not isinstance(tool, DeferredTool) and inspect.unwrap(tool.fn).__module__ == self.module]
+        hashes = {}
+        for tool in tools:
+            hashes.update(source_hashes(tool.fn))
+        manifest = {"versions": schema_cache._versions, "hashes": hashes, "tools": [DeferredTool.entry(tool) for tool in tools]}
+        try:
+            os.makedirs(os.path.dirname(self.manifest_path), exist_ok=True)
+            fd, path = tempfile.mkstemp(dir=os.path.dirname(self.manifest_path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                json.dump(manifest, file)
+            os.replace(path, self.manifest_path)
+        except OSError as e:
+            logger.warning(f"Could not cache tools of module {self.module}: {e}")
+
+
+def _import_dependencies(module: str):
+    """Importiert die Module, die module auf oberster Ebene importiert (z.B. den generierten Client), aber nicht module selbst"""
+    spec = importlib.util.find_spec(module)
+    if spec is None or spec.origin is None or not spec.origin.endswith(".py"):
+        return
+    with open(spec.origin, encoding="utf-8") as file:
+        tree = ast.parse(file.read(), spec.origin)
+    for node in tree.body:
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom) and node.level == 0 and node.module:
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            importlib.import_module(name)
+
+
+def register_tool_modules(server: FastMCP, names: Iterable[str], lazy: bool = True, modules: Dict[str, str] = TOOL_MODULES) -> List[ToolGroup]:
+    """
+    Registriert die Tools der genannten Integrationen (z.B. ["github", "invman"]) am Server
+    lazy: Tool-Module erst beim ersten Aufruf importieren, sofern ihre Tools von einem früheren Start bekannt sind
+    """
+    groups = []
+    for name in names:
+        name = name.strip()
+        if not name:
+            continue
+        if name not in modules:
+            raise ValueError(f"Unknown tool module {name!r}, available: {', '.join(modules)}")
+        group = ToolGroup(server, modules[name])
+        group.register(lazy)
+        groups.append(group)
+    return groups
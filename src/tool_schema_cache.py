@@ -0,0 +1,235 @@
+import hashlib
+import inspect
+import json
+import os
+import sys
+import tempfile
+import typing
+from functools import lru_cache
+from importlib.metadata import version
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from mcp.server import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from mcp.server.fastmcp.tools import Tool, ToolManager
+from mcp.server.fastmcp.utilities.context_injection import find_context_parameter
+from mcp.server.fastmcp.utilities.func_metadata import func_metadata
+from mcp.server.fastmcp.utilities.logging import get_logger
+from mcp.shared.tool_name_validation import validate_and_warn_tool_name
+from mcp.types import Icon, ToolAnnotations
+from pydantic import BaseModel, Field
+
+logger = get_logger(__name__)
+
+# Ohne TOOL_SCHEMA_CACHE liegen die Schemas neben dem Bytecode, wie dieser werden sie nicht eingecheckt
+cache_dir = os.environ.get("TOOL_SCHEMA_CACHE") or os.path.join(os.path.dirname(__file__), "__pycache__", "tool_schemas")
+
+# Ändern sich FastMCP oder pydantic, können die Schemas anders aussehen
+_versions = f"mcp {version('mcp')}, pydantic {version('pydantic')}"
+
+
+class _LazyFuncMetadata:
+    """Steht für das FuncMetadata eines Tools, das Argumentmodell wird erst beim ersten Aufruf gebaut"""
+
+    def __init__(self, fn: Callable, skip_names: list, structured_output: Optional[bool]):
+        self._metadata = None
+        self._arguments = fn, skip_names, structured_output
+
+    def __getattr__(self, name: str):
+        if self._metadata is None:
+            fn, skip_names, structured_output = self._arguments
+            self._metadata = func_metadata(fn, skip_names=skip_names, structured_output=structured_output)
+        return getattr(self._metadata, name)
+
+
+def _file_hash(path: str) -> str:
+    stat = os.stat(path)
+    return _content_hash(path, stat.st_mtime_ns, stat.st_size)
+
+
+@lru_cache(maxsize=4096)
+def _content_hash(path: str, mtime: int, size: int) -> str:
+    # mtime und Größe sind Teil des Cache-Keys, damit Änderungen zur Laufzeit erkannt werden
+    with open(path, "rb") as file:
+        return hashlib.blake2b(file.read(), digest_size=16).hexdigest()
+
+
+def _collect_modules(annotation: Any, modules: Set[str], seen: Set[int]):
+    # Module aller Typen, die im Schema landen, auch die der Felder verschachtelter Modelle
+    if id(annotation) in seen:
+        return
+    seen.add(id(annotation))
+    for arg in typing.get_args(annotation):
+        _collect_modules(arg, modules, seen)
+    if isinstance(annotation, type):
+        modules.add(annotation.__module__)
+        if issubclass(annotation, BaseModel):
+            for field in annotation.model_fields.values():
+                _collect_modules(field.annotation, modules, seen)
+
+
+def source_files(fn: Callable) -> Dict[str, str]:
+    """Quelltexte (Modul → Datei), aus denen das Schema des Tools entsteht"""
+    modules = {inspect.unwrap(fn).__module__}
+    seen = set()
+    signature = inspect.signature(fn)
+    for parameter in signature.parameters.values():
+        _collect_modules(parameter.annotation, modules, seen)
+    _collect_modules(signature.return_annotation, modules, seen)
+    files = {name: getattr(sys.modules.get(name), "__file__", None) for name in modules}
+    return {name: path for name, path in files.items() if path}
+
+
+def source_hashes(fn: Callable) -> Dict[str, str]:
+    return {path: _file_hash(path) for path in source_files(fn).values()}
+
+
+def files_changed(hashes: Dict[str, str]) -> bool:
+    """Prüft, ob sich eine der Dateien aus source_hashes geändert hat, ohne ein Modul zu importieren"""
+    try:
+        return any(_file_hash(path) != digest for path, digest in hashes.items())
+    except OSError:
+        return True
+
+
+def _source_key(fn: Callable, settings: Dict[str, Any]) -> str:
+    """Hash über die Quelltexte der Module, aus denen das Schema des Tools entsteht"""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(json.dumps([_versions, settings], sort_keys=True, default=str).encode())
+    for name, path in sorted(source_files(fn).items()):
+        digest.update(f"{name}:{_file_hash(path)}".encode())
+    return digest.hexdigest()
+
+
+def _load(name: str, key: str) -> Optional[Dict[str, Any]]:
+    try:
+        with open(os.path.join(cache_dir, f"{name}.json"), encoding="utf-8") as file:
+            entry = json.load(file)
+    except (OSError, ValueError):
+        return None
+    return entry if entry.get("key") == key else None
+
+
+def _store(name: str, entry: Dict[str, Any]):
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Erst vollständig schreiben, dann umbenennen, damit parallel startende Prozesse keine halben Dateien lesen
+        fd, path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as file:
+            json.dump(entry, file)
+        os.replace(path, os.path.join(cache_dir, f"{name}.json"))
+    except OSError as e:
+        logger.warning(f"Could not cache schema of tool {name}: {e}")
+
+
+def cached_tool(fn: Callable, name: Optional[str] = None, title: Optional[str] = None, description: Optional[str] = None,
+                annotations=None, icons=None, meta=None, structured_output: Optional[bool] = None) -> Tool:
+    """
+    Wie Tool.from_function, aber Eingabe- und Ausgabeschema kommen aus dem Cache, solange sich die
+    Quelltexte des Tools und der darin verwendeten Typen nicht geändert haben.
+    """
+    func_name = name or fn.__name__
+    context_kwarg = find_context_parameter(fn)
+    settings = {"name": func_name, "title": title, "description": description, "structured_output": structured_output, "context_kwarg": context_kwarg}
+    key = _source_key(fn, settings)
+
+    entry = _load(func_name, key)
+    if entry is None:
+        tool = Tool.from_function(fn, name=name, title=title, description=description, context_kwarg=context_kwarg,
+                                  annotations=annotations, icons=icons, meta=meta, structured_output=structured_output)
+        _store(func_name, {"key": key, "parameters": tool.parameters, "output_schema": tool.output_schema})
+        return tool
+
+    validate_and_warn_tool_name(func_name)
+    skip_names = [context_kwarg] if context_kwarg is not None else []
+    tool = Tool.model_construct(
+        fn=fn,
+        name=func_name,
+        title=title,
+        description=description or fn.__doc__ or "",
+        parameters=entry["parameters"],
+        fn_metadata=_LazyFuncMetadata(fn, skip_names, structured_output),
+        is_async=inspect.iscoroutinefunction(fn),
+        context_kwarg=context_kwarg,
+        annotations=annotations,
+        icons=icons,
+        meta=meta,
+    )
+    # Tool.output_schema ist eine cached_property, der Wert aus dem Cache wird direkt hinterlegt
+    tool.__dict__["output_schema"] = entry["output_schema"]
+    return tool
+
+
+class DeferredTool(Tool):
+    """
+    Platzhalter für ein Tool, dessen Modul noch nicht importiert ist. Angeboten wird es mit den gespeicherten
+    Schemas, beim ersten Aufruf lädt load das Modul, das dabei das echte Tool registriert und den Platzhalter ersetzt.
+    """
+    load: Callable[[], Awaitable[ToolManager]] = Field(exclude=True)
+
+    @classmethod
+    def from_entry(cls, entry: Dict[str, Any], load: Callable[[], Awaitable[ToolManager]]) -> "DeferredTool":
+        tool = cls.model_construct(
+            fn=load,
+            name=entry["name"],
+            title=entry["title"],
+            description=entry["description"],
+            parameters=entry["parameters"],
+            fn_metadata=None,
+            is_async=True,
+            context_kwarg=None,
+            annotations=ToolAnnotations.model_validate(entry["annotations"]) if entry["annotations"] is not None else None,
+            icons=[Icon.model_validate(icon) for icon in entry["icons"]] if entry["icons"] is not None else None,
+            meta=entry["meta"],
+            load=load,
+        )
+        tool.__dict__["output_schema"] = entry["output_schema"]
+        return tool
+
+    @staticmethod
+    def entry(tool: Tool) -> Dict[str, Any]:
+        """Was from_entry braucht, um das Tool ohne sein Modul anzubieten"""
+        return {
+            "name": tool.name,
+            "title": tool.title,
+            "description": tool.description,
+            "parameters": tool.parameters,
+            "output_schema": tool.output_schema,
+            "annotations": tool.annotations.model_dump(mode="json") if tool.annotations is not None else None,
+            "icons": [icon.model_dump(mode="json") for icon in tool.icons] if tool.icons is not None else None,
+            "meta": tool.meta,
+        }
+
+    async def run(self, arguments: Dict[str, Any], context=None, convert_result: bool = False) -> Any:
+        try:
+            manager = await self.load()
+        except Exception as e:
+            raise ToolError(f"Error loading tool {self.name}: {e}") from e
+        tool = manager.get_tool(self.name)
+        if tool is None or isinstance(tool, DeferredTool):
+            raise ToolError(f"Tool {self.name} was not registered by its module")
+        return await tool.run(arguments, context=context, convert_result=convert_result)
+
+
+class CachedToolManager(ToolManager):
+    """ToolManager, der Tools über cached_tool anlegt"""
+
+    def add_tool(self, fn: Callable, name: Optional[str] = None, title: Optional[str] = None, description: Optional[str] = None,
+                 annotations=None, icons=None, meta=None, structured_output: Optional[bool] = None) -> Tool:
+        tool = cached_tool(fn, name=name, title=title, description=description, annotations=annotations, icons=icons, meta=meta,
+                           structured_output=structured_output)
+        existing = self._tools.get(tool.name)
+        # Ein Platzhalter wird durch das echte Tool ersetzt, sobald dessen Modul geladen ist
+        if existing and not isinstance(existing, DeferredTool):
+            if self.warn_on_duplicate_tools:
+                logger.warning(f"Tool already exists: {tool.name}")
+            return existing
+        self._tools[tool.name] = tool
+        return tool
+
+
+def use_schema_cache(server: FastMCP):
+    """Lässt den Server seine Tools mit gecachten Schemas registrieren, bereits registrierte Tools bleiben erhalten"""
+    manager = CachedToolManager(warn_on_duplicate_tools=server._tool_manager.warn_on_duplicate_tools)
+    manager._tools.update(server._tool_manager._tools)
+    server._tool_manager = manager
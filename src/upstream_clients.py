@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import os
+import threading
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Generic, Optional, Type, TypeVar
+
+from src.shared_transport import shared_transport
+
+logger = logging.getLogger(__name__)
+
+C = TypeVar("C")
+A = TypeVar("A")
+
+# Alle Upstreams des Prozesses, damit der Server sie beim Beenden schließen kann
+upstreams: Dict[str, "UpstreamClient"] = {}
+
+# Upstreams, deren Client und Verbindungspool schon beim Start der ersten Session angelegt werden, z.B. "github,discord"
+warm_upstreams = [name.strip() for name in os.environ.get("WARM_UPSTREAMS", "").split(",") if name.strip()]
+
+
+class UpstreamClient(Generic[C]):
+    """
+    Der ApiClient eines Upstreams, angelegt erst beim ersten Zugriff
+    factory baut Configuration und ApiClient und liest dabei auch die Secrets. Kommen die ersten Aufrufe
+    gleichzeitig (auch aus mehreren Threads), wird trotzdem genau ein Client mit einem Verbindungspool angelegt.
+    """
+
+    def __init__(self, name: str, factory: Callable[[], C]):
+        self.name = name
+        self.factory = factory
+        self._client: Optional[C] = None
+        self._lock = threading.Lock()
+        upstreams[name] = self
+
+    @property
+    def client(self) -> C:
+        client = self._client
+        if client is None:
+            with self._lock:
+                if self._client is None:
+                    self._client = self.factory()
+                client = self._client
+        return client
+
+    def api(self, api_class: Type[A]) -> A:
+        """API-Objekt (z.B. IssuesApi), das sich erst beim ersten Aufruf an den Client bindet"""
+        return LazyApi(self, api_class)
+
+    def warm(self):
+        self.client.rest_client.get_pool_manager()
+
+    async def close(self):
+        with self._lock:
+            client, self._client = self._client, None
+        if client is not None:
+            await client.close()
+
+
+class LazyApi:
+    """Reicht Aufrufe an das API-Objekt des aktuellen Clients weiter, nach close() an das des neuen Clients"""
+
+    def __init__(self, upstream: UpstreamClient, api_class: Type[Any]):
+        self._upstream = upstream
+        self._api_class = api_class
+        self._api = None
+
+    def __getattr__(self, name: str):
+        client = self._upstream.client
+        api = self._api
+        if api is None or api.api_client is not client:
+            api = self._api = self._api_class(api_client=client)
+        return getattr(api, name)
+
+
+async def close_all():
+    # Die Clients schließen nur eigene Pools, der gemeinsame Transport bleibt bis shutdown offen
+    for upstream in list(upstreams.values()):
+        try:
+            await upstream.close()
+        except Exception:
+            logger.exception(f"Could not close client of {upstream.name}")
+
+
+async def shutdown():
+    """Beim Beenden des Prozesses: alle Clients und den gemeinsamen Transport schließen"""
+    await close_all()
+    await shared_transport.close()
+
+
+_sessions = 0
+# Serialisiert Start und Ende der Sessions, damit eine neue Session nicht während close_all beginnt
+_sessions_lock = asyncio.Lock()
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """
+    Lifespan für FastMCP
+    FastMCP betritt den Lifespan pro Session (bei stdio einmal pro Prozess). Die Clients werden mit der
+    ersten Session angelegt, sofern in WARM_UPSTREAMS genannt, und mit dem Ende der letzten geschlossen.
+    Danach entstehen sie beim nächsten Zugriff neu. Der gemeinsame Transport bleibt offen, ihn schließt
+    erst shutdown beim Beenden des Prozesses.
+    """
+    global _sessions
+    async with _sessions_lock:
+        if _sessions == 0:
+            for name in warm_upstreams:
+                if name in upstreams:
+                    upstreams[name].warm()
+        _sessions += 1
+    try:
+        yield {}
+    finally:
+        async with _sessions_lock:
+            _sessions -= 1
+            if _sessions == 0:
+                await close_all()
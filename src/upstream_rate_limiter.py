@@ -0,0 +1,356 @@
+import asyncio
+import hashlib
+import logging
+import re
+from time import monotonic, time
+from typing import Dict, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+logger = logging.getLogger(__name__)
+
+
+class Observation(NamedTuple):
+    """Vom Upstream gemeldeter Stand eines Buckets"""
+    # None steht für den Bucket der Route selbst
+    name: Optional[str]
+    limit: Optional[int]
+    remaining: Optional[int]
+    reset_after: Optional[float]
+    # False für Buckets, die nicht nur zu dieser Route gehören (globale Limits, Fehlerbudget)
+    route_bucket: bool = True
+
+
+class Bucket:
+    """
+    Kontingent eines Upstreams, so wie es der Upstream selbst in seinen Response-Headern meldet
+    remaining ist None, solange noch keine Antwort für den Bucket gesehen wurde.
+    """
+
+    def __init__(self, cost: int = 1):
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        self.in_flight = 0
+        self.cost = cost
+        self.condition = asyncio.Condition()
+
+    def refill(self, now: float):
+        # Nach dem Reset steht wieder das volle Kontingent zur Verfügung
+        if self.reset_at is not None and self.reset_at <= now:
+            self.remaining = self.limit
+            self.reset_at = None
+
+    def can_take(self) -> bool:
+        if self.remaining is not None and self.remaining >= max(self.cost, 1):
+            return True
+        # Unbekannter Bucket oder Reset: nur eine Anfrage gleichzeitig, bis der Upstream Header liefert
+        return self.reset_at is None and self.in_flight == 0
+
+
+class UpstreamRateLimiter:
+    """
+    Rate Limiter, der die Limits eines Upstreams aus dessen Response-Headern lernt
+    Wird als Configuration.rate_limiter in die generierten Clients gehängt. RESTClientObject.request
+    ruft vor jeder Anfrage acquire() und nach jeder Antwort update() auf.
+    """
+
+    # Sicherheitsabstand auf Resets, um Uhrabweichungen zum Upstream abzufangen
+    reset_margin = 0.05
+
+    def __init__(self):
+        self.buckets: Dict[str, Bucket] = {}
+        # Route -> vom Upstream gemeldeter Bucket
+        self.routes: Dict[str, str] = {}
+
+    async def acquire(self, method: str, url: str, headers: Dict[str, str]) -> Tuple[str, List[str]]:
+        """
+        Wartet, bis alle Buckets der Anfrage Kontingent haben
+        Das Ergebnis wird nach der Antwort an update() zurückgegeben.
+        """
+        route = self.route_key(method, url, headers)
+        keys = self.global_keys(method, url, headers)
+        taken = []
+        try:
+            for key in keys:
+                await self._take(key)
+                taken.append(key)
+
+            # Während des Wartens kann der Upstream die Route einem anderen Bucket zugeordnet haben
+            key = self.routes.get(route, route)
+            while not await self._take(key, route):
+                key = self.routes.get(route, route)
+        except BaseException:
+            # Abgebrochen oder Timeout beim Warten auf einen späteren Bucket: die Anfrage wird nie gesendet,
+            # die schon genommenen Buckets bekommen ihr Kontingent zurück
+            await self._release(taken)
+            raise
+        return route, keys + [key]
+
+    async def update(self, permit: Tuple[str, List[str]], response):
+        route, keys = permit
+        for key in keys:
+            bucket = self.buckets[key]
+            async with bucket.condition:
+                bucket.in_flight = max(bucket.in_flight - 1, 0)
+                bucket.condition.notify_all()
+
+        if response is None:
+            return
+
+        for observation in self.parse_headers(route, response):
+            if observation.name is None:
+                key = self.routes.get(route, route)
+            else:
+                key = self._bucket_key(route, observation.name)
+                if observation.route_bucket:
+                    self.routes[route] = key
+            await self._learn(key, observation.limit, observation.remaining, observation.reset_after)
+
+    def route_key(self, method: str, url: str, headers: Dict[str, str]) -> str:
+        return f"{method} {urlsplit(url).path}"
+
+    def global_keys(self, method: str, url: str, headers: Dict[str, str]) -> List[str]:
+        return []
+
+    def parse_headers(self, route: str, response) -> List[Observation]:
+        """
+        Liefert den gemeldeten Stand je betroffenem Bucket
+        """
+        retry_after = _float_header(response.headers, "Retry-After")
+        if response.status_code == 429 and retry_after is not None:
+            return [Observation(None, None, 0, retry_after)]
+        return []
+
+    def _bucket_key(self, route: str, name: str) -> str:
+        return name
+
+    def _bucket(self, key: str) -> Bucket:
+        bucket = self.buckets.get(key)
+        if bucket is None:
+            bucket = self.buckets[key] = Bucket()
+        return bucket
+
+    async def _take(self, key: str, route: Optional[str] = None) -> bool:
+        bucket = self._bucket(key)
+        async with bucket.condition:
+            while True:
+                if route is not None and self.routes.get(route, route) != key:
+                    return False
+                now = monotonic()
+                bucket.refill(now)
+                if bucket.can_take():
+                    break
+                # Ohne bekannten Reset weckt erst die Antwort der laufenden Anfrage
+                timeout = None
+                if bucket.reset_at is not None:
+                    timeout = bucket.reset_at - now
+                    logger.info(f"Upstream budget for {key} exhausted, waiting {timeout:.2f}s")
+                try:
+                    await asyncio.wait_for(bucket.condition.wait(), timeout)
+                except TimeoutError:
+                    pass
+            bucket.in_flight += 1
+            if bucket.remaining is not None:
+                bucket.remaining -= bucket.cost
+            return True
+
+    async def _release(self, keys: List[str]):
+        buckets = [self.buckets[key] for key in keys]
+        # Erst ohne await zurückbuchen, damit ein erneuter Abbruch nichts mehr verliert
+        for bucket in buckets:
+            bucket.in_flight = max(bucket.in_flight - 1, 0)
+            if bucket.remaining is not None:
+                bucket.remaining += bucket.cost
+                if bucket.limit is not None:
+                    bucket.remaining = min(bucket.remaining, bucket.limit)
+        await asyncio.shield(_notify_all(buckets))
+
+    async def _learn(self, key: str, limit: Optional[int], remaining: Optional[int], reset_after: Optional[float]):
+        bucket = self._bucket(key)
+        async with bucket.condition:
+            if limit is not None:
+                bucket.limit = limit
+            elif bucket.limit is None:
+                bucket.limit = remaining
+            if remaining is not None:
+                # Noch laufende Anfragen sind im Wert des Upstreams eventuell nicht enthalten
+                bucket.remaining = max(remaining - bucket.in_flight * bucket.cost, 0)
+            if reset_after is not None:
+                bucket.reset_at = monotonic() + reset_after + self.reset_margin
+            bucket.condition.notify_all()
+
+
+async def _notify_all(buckets: List[Bucket]):
+    # Wartende auf diese Buckets prüfen can_take neu
+    for bucket in buckets:
+        async with bucket.condition:
+            bucket.condition.notify_all()
+
+
+class GitHubRateLimiter(UpstreamRateLimiter):
+    """
+    GitHub meldet X-RateLimit-Limit/-Remaining/-Reset je Token und Ressource (core, search, graphql, ...)
+    """
+
+    def route_key(self, method: str, url: str, headers: Dict[str, str]) -> str:
+        path = urlsplit(url).path
+        if path.startswith("/search/code"):
+            resource = "code_search"
+        elif path.startswith("/search/"):
+            resource = "search"
+        elif path.startswith("/graphql"):
+            resource = "graphql"
+        else:
+            resource = "core"
+        return f"{_token_id(headers)}:{resource}"
+
+    def parse_headers(self, route: str, response) -> List[Observation]:
+        result = super().parse_headers(route, response)
+        response_headers = response.headers
+        remaining = _int_header(response_headers, "X-RateLimit-Remaining")
+        reset = _float_header(response_headers, "X-RateLimit-Reset")
+        if remaining is not None:
+            resource = response_headers.get("X-RateLimit-Resource")
+            name = None if resource is None else f"{route.split(':')[0]}:{resource}"
+            reset_after = None if reset is None else max(reset - time(), 0)
+            result.append(Observation(name, _int_header(response_headers, "X-RateLimit-Limit"), remaining, reset_after))
+        return result
+
+
+class DiscordRateLimiter(UpstreamRateLimiter):
+    """
+    Discord meldet je Route einen X-RateLimit-Bucket, der zusammen mit den Major-Parametern
+    (channel_id, guild_id, webhook_id/-token) das Kontingent bestimmt. Zusätzlich gibt es ein
+    globales Limit je Bot-Token.
+    """
+
+    major_parameters = re.compile(r"/(channels|guilds|webhooks)/(\d+)(?:/([^/]+))?")
+    snowflake = re.compile(r"/\d{5,}")
+
+    def __init__(self, global_limit: int = 50):
+        super().__init__()
+        self.global_limit = global_limit
+
+    def route_key(self, method: str, url: str, headers: Dict[str, str]) -> str:
+        path = urlsplit(url).path
+        path = re.sub(r"^/api/v\d+", "", path)
+        major = self._major(path)
+        return f"{_token_id(headers)}:{method} {self.snowflake.sub('/{id}', path)}:{major}"
+
+    def global_keys(self, method: str, url: str, headers: Dict[str, str]) -> List[str]:
+        key = f"{_token_id(headers)}:global"
+        if key not in self.buckets:
+            # Das globale Limit ist dokumentiert und muss nicht erst gelernt werden
+            bucket = self.buckets[key] = Bucket()
+            bucket.limit = bucket.remaining = self.global_limit
+        bucket = self.buckets[key]
+        if bucket.reset_at is None:
+            bucket.reset_at = monotonic() + 1
+        return [key]
+
+    def parse_headers(self, route: str, response) -> List[Observation]:
+        response_headers = response.headers
+        retry_after = _float_header(response_headers, "Retry-After")
+        if response.status_code == 429 and response_headers.get("X-RateLimit-Global", "").lower() == "true":
+            return [Observation(f"{route.split(':')[0]}:global", None, 0, retry_after, route_bucket=False)]
+
+        result = super().parse_headers(route, response)
+        bucket = response_headers.get("X-RateLimit-Bucket")
+        remaining = _int_header(response_headers, "X-RateLimit-Remaining")
+        if bucket is not None and remaining is not None:
+            result.append(Observation(bucket, _int_header(response_headers, "X-RateLimit-Limit"), remaining, _float_header(response_headers, "X-RateLimit-Reset-After")))
+        return result
+
+    def _bucket_key(self, route: str, name: str) -> str:
+        if name.endswith(":global"):
+            return name
+        token, _, major = route.split(":", 2)
+        return f"{token}:{name}:{major}"
+
+    def _major(self, path: str) -> str:
+        match = self.major_parameters.search(path)
+        if match is None:
+            return ""
+        if match.group(1) == "webhooks" and match.group(3):
+            return f"{match.group(2)}/{match.group(3)}"
+        return match.group(2)
+
+
+class EsiRateLimiter(UpstreamRateLimiter):
+    """
+    ESI begrenzt Fehler global über X-ESI-Error-Limit-Remain/-Reset und Anfragen je
+    Rate-Limit-Gruppe über X-Ratelimit-Group/-Limit ("150/15m")/-Remaining.
+    Eine erfolgreiche Anfrage kostet in einer Gruppe zwei Token.
+    """
+
+    error_budget_key = "esi:errors"
+    ids = re.compile(r"/\d+")
+    window_units = {"s": 1, "m": 60, "h": 3600}
+
+    def __init__(self, error_floor: int = 10):
+        super().__init__()
+        # So viele Fehler werden als Reserve nie ausgeschöpft
+        self.error_floor = error_floor
+        errors = self.buckets[self.error_budget_key] = Bucket(cost=0)
+        errors.limit = errors.remaining = 1
+
+    def route_key(self, method: str, url: str, headers: Dict[str, str]) -> str:
+        return f"{_token_id(headers)}:{method} {self.ids.sub('/{id}', urlsplit(url).path)}"
+
+    def global_keys(self, method: str, url: str, headers: Dict[str, str]) -> List[str]:
+        return [self.error_budget_key]
+
+    def parse_headers(self, route: str, response) -> List[Observation]:
+        result = super().parse_headers(route, response)
+        response_headers = response.headers
+
+        error_remain = _int_header(response_headers, "X-ESI-Error-Limit-Remain")
+        if error_remain is not None:
+            errors = max(error_remain - self.error_floor, 0)
+            result.append(Observation(self.error_budget_key, 1, errors, _float_header(response_headers, "X-ESI-Error-Limit-Reset"), route_bucket=False))
+
+        group = response_headers.get("X-Ratelimit-Group")
+        remaining = _int_header(response_headers, "X-Ratelimit-Remaining")
+        if group is not None and remaining is not None:
+            limit, window = self._parse_limit(response_headers.get("X-Ratelimit-Limit", ""))
+            # Das Fenster gleitet, nach einer vollen Fensterlänge sind alle Token zurück
+            result.append(Observation(group, limit, remaining, window))
+        return result
+
+    def _bucket_key(self, route: str, name: str) -> str:
+        if name == self.error_budget_key:
+            return name
+        key = f"{route.split(':')[0]}:{name}"
+        if key not in self.buckets:
+            self.buckets[key] = Bucket(cost=2)
+        return key
+
+    def _parse_limit(self, value: str) -> Tuple[Optional[int], Optional[float]]:
+        match = re.fullmatch(r"\s*(\d+)/(\d+)([smh])\s*", value)
+        if match is None:
+            return None, None
+        return int(match.group(1)), int(match.group(2)) * self.window_units[match.group(3)]
+
+
+def _token_id(headers: Dict[str, str]) -> str:
+    # Tokens nur als Hash im Speicher halten
+    authorization = (headers or {}).get("Authorization")
+    if not authorization:
+        return "anonymous"
+    return hashlib.blake2b(authorization.encode(), digest_size=8).hexdigest()
+
+
+def _int_header(headers, name: str) -> Optional[int]:
+    value = headers.get(name)
+    try:
+        return None if value is None else int(float(value))
+    except ValueError:
+        return None
+
+
+def _float_header(headers, name: str) -> Optional[float]:
+    value = headers.get(name)
+    try:
+        return None if value is None else float(value)
+    except ValueError:
+        return None